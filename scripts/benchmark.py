@@ -0,0 +1,790 @@
+"""Benchmark import time, memory use and lookup latency of the package.
+
+Every benchmark runs in this process or in a fresh interpreter, and its result is
+written as JSON. Pass ``--baseline`` with the JSON results of a previous run to
+compare against them: a benchmark that is slower or uses more memory than its
+baseline value by more than the threshold fails the run.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import os
+import platform
+import random
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+from contextlib import suppress
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Mapping, NamedTuple, Tuple
+from uuid import UUID
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+PACKAGE = "bluetooth_numbers"
+TABLE_MODULES = ("_characteristics", "_companies", "_descriptors", "_ouis", "_services")
+DEFAULT_REPEAT = 5
+DEFAULT_THRESHOLD = 0.2
+
+# Runs in a fresh interpreter: prints the import time and the growth of the peak
+# RSS in bytes (or null if the platform doesn't offer it) as JSON.
+IMPORT_SCRIPT = """
+import json, sys, time
+try:
+    import resource
+except ImportError:
+    resource = None
+
+def peak_rss():
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss if sys.platform == "darwin" else rss * 1024
+
+before = peak_rss()
+start = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - start
+after = peak_rss()
+print(json.dumps([elapsed, None if before is None else after - before]))
+"""
+
+# Runs in a fresh interpreter: forks workers that use the lazily built indexes and
+# the reverse lookup, optionally after warming up, and prints the private memory of
+# each worker in bytes as JSON.
+PREFORK_SCRIPT = """
+import gc, json, os
+import bluetooth_numbers
+from bluetooth_numbers.prefork import warmup
+from bluetooth_numbers.reverse_lookup import ReverseLookup
+
+def private_memory():
+    with open("/proc/self/smaps_rollup") as smaps:
+        return sum(
+            int(line.split()[1]) * 1024
+            for line in smaps
+            if line.startswith(("Private_Clean:", "Private_Dirty:"))
+        )
+
+def work(reverse_lookup):
+    reverse_lookup = reverse_lookup or ReverseLookup()
+    bluetooth_numbers.oui[0x582D34]
+    bluetooth_numbers.oui.by_name("apple, inc.", ignore_case=True)
+    bluetooth_numbers.company.by_name("Apple, Inc.")
+    bluetooth_numbers.service.family(0x6E400001_B5A3_F393_E0A9_E50E24DCCA9E)
+    reverse_lookup.lookup("heart rate")
+    gc.collect()
+
+shared = warmup() if {warmup} else None
+children = []
+for _ in range({workers}):
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read)
+        work(shared)
+        os.write(write, str(private_memory()).encode())
+        os._exit(0)
+    os.close(write)
+    children.append((pid, read))
+
+sizes = []
+for pid, read in children:
+    with os.fdopen(read) as pipe:
+        sizes.append(int(pipe.read()))
+    os.waitpid(pid, 0)
+print(json.dumps(sizes))
+"""
+PREFORK_WORKERS = 4
+
+_logger = logging.getLogger(__name__)
+
+
+class Result(NamedTuple):
+    """Result of a benchmark.
+
+    Attributes:
+        value (float): The measured value. Lower is better, except for a rate.
+        unit (str): The unit of the value: "s", "bytes" or a rate such as "ads/s".
+    """
+
+    value: float
+    unit: str
+
+    @property
+    def is_rate(self) -> bool:
+        """bool: Whether the value is a rate, for which higher is better."""
+        return self.unit.endswith("/s")
+
+
+Results = Dict[str, Result]
+Benchmark = Callable[[int], Iterator[Tuple[str, Result]]]
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(function: Benchmark) -> Benchmark:
+    """Register a benchmark.
+
+    A benchmark is called with the number of repetitions and yields the name and
+    result of each of its measurements.
+
+    Args:
+        function (Benchmark): The benchmark to register.
+
+    Returns:
+        Benchmark: The same benchmark.
+    """
+    BENCHMARKS[function.__name__] = function
+    return function
+
+
+def run_python(script: str, *options: str) -> subprocess.CompletedProcess[str]:
+    """Run a Python script in a fresh interpreter that imports from the source tree.
+
+    Args:
+        script (str): The Python code to run.
+        *options (str): Extra command line options for the interpreter.
+
+    Returns:
+        subprocess.CompletedProcess[str]: The finished process, with its output.
+    """
+    return subprocess.run(
+        [sys.executable, *options, "-c", script],  # noqa: S603
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONPATH": SRC_DIR},
+        text=True,
+    )
+
+
+def time_call(function: Callable[[], object], repeat: int) -> float:
+    """Measure the time of one call of a function.
+
+    Args:
+        function (Callable[[], object]): The function to call.
+        repeat (int): Number of times the measurement is repeated.
+
+    Returns:
+        float: The lowest time of a call in seconds.
+    """
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+@benchmark
+def cold_import(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the time and memory needed to import the package.
+
+    Args:
+        repeat (int): Number of fresh interpreters to import the package in.
+
+    Yields:
+        tuple[str, Result]: The import time and the growth of the peak RSS.
+    """
+    times = []
+    memory = []
+    for _ in range(repeat):
+        output = run_python(IMPORT_SCRIPT.format(module=PACKAGE)).stdout
+        elapsed, rss = json.loads(output)
+        times.append(elapsed)
+        if rss is not None:
+            memory.append(rss)
+
+    yield "import", Result(statistics.median(times), "s")
+    if memory:
+        yield "import.rss", Result(statistics.median(memory), "bytes")
+
+
+@benchmark
+def table_import(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the time needed to import each module with a table.
+
+    The package imports all tables, so the modules can't be imported on their own.
+    Instead this uses the self time of each module reported by ``-X importtime``.
+
+    Args:
+        repeat (int): Number of fresh interpreters to import the package in.
+
+    Yields:
+        tuple[str, Result]: The import time of each module with a table.
+    """
+    times: dict[str, list[float]] = {module: [] for module in TABLE_MODULES}
+    for _ in range(repeat):
+        output = run_python(f"import {PACKAGE}", "-X", "importtime").stderr
+        for line in output.splitlines():
+            # Each line has the self time and cumulative time in microseconds and
+            # the module name, separated by "|"
+            fields = line.split("|")
+            module = fields[-1].strip().rpartition(".")[2]
+            if len(fields) == 3 and module in times:  # noqa: PLR2004
+                times[module].append(int(fields[0].rpartition(":")[2]) / 1e6)
+
+    for module, module_times in times.items():
+        yield f"import.{module}", Result(statistics.median(module_times), "s")
+
+
+@benchmark
+def reverse_lookup(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the time needed to create a reverse lookup.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The time needed to create a reverse lookup and to look
+        up terms with a small and a large result.
+    """
+    from bluetooth_numbers.reverse_lookup import ReverseLookup
+
+    yield "reverse_lookup.create", Result(time_call(ReverseLookup, repeat), "s")
+    lookup = ReverseLookup()
+    yield (
+        "reverse_lookup.lookup",
+        Result(
+            time_call(lambda: lookup.lookup("heart rate"), repeat),
+            "s",
+        ),
+    )
+    # A large result: every OUI vendor with "inc." in its name
+    yield (
+        "reverse_lookup.lookup.large",
+        Result(
+            time_call(lambda: lookup.lookup("inc.", uuid_types=["oui"]), repeat),
+            "s",
+        ),
+    )
+
+
+@benchmark
+def by_name(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure finding the keys of a name, compared with a scan of the table.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The time needed to find the keys of a name with the
+        indexes, with a scan, and to build the indexes.
+    """
+    from bluetooth_numbers import oui
+
+    def build() -> None:
+        oui.__dict__.pop("_indexes", None)
+        oui.by_name("")
+        oui.by_name("", ignore_case=True)
+
+    yield "by_name.build.oui", Result(time_call(build, repeat), "s")
+    for ignore_case in (False, True):
+        latency = time_call(
+            partial(oui.by_name, "apple, inc.", ignore_case=ignore_case),
+            repeat,
+        )
+        suffix = ".ignore_case" if ignore_case else ""
+        yield f"by_name.oui{suffix}", Result(latency, "s")
+
+    def scan() -> None:
+        name = "apple, inc."
+        [key for key, value in oui.items() if value.casefold() == name]
+
+    yield "by_name.oui.scan", Result(time_call(scan, repeat), "s")
+
+
+@benchmark
+def lookup(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the latency of a successful and a failed lookup in each table.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The time of a hit and a miss in each table.
+    """
+    from bluetooth_numbers import characteristic, company, descriptor, oui, service
+    from bluetooth_numbers.exceptions import BluetoothNumbersError
+
+    # Table, keys that are found with the name of their format, and a missing key
+    tables: dict[str, tuple[Mapping[Any, str], dict[str, object], object]] = {
+        "company": (company, {"int": 0x0499}, 0xFFFE),
+        "oui": (
+            oui,
+            {"str": "58:2D:34", "unformatted": "582d34", "int": 0x582D34},
+            "AB:CD:EF",
+        ),
+        "service": (
+            service,
+            {
+                "int": 0x180F,
+                "uuid": UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"),
+                "uuid.int": 0x6E400001_B5A3_F393_E0A9_E50E24DCCA9E,
+                "uuid.bytes": bytes.fromhex("9ECADC240EE5A9E093F3A3B50100406E"),
+                "str": "6e400001-b5a3-f393-e0a9-e50e24dcca9e",
+                "str.uuid16": "180F",
+            },
+            0xFFFE,
+        ),
+        "characteristic": (characteristic, {"int": 0x2A37}, 0xFFFE),
+        "descriptor": (descriptor, {"int": 0x2901}, 0xFFFE),
+    }
+
+    def miss(table: Mapping[Any, str], key: object) -> None:
+        with suppress(BluetoothNumbersError):
+            table[key]
+
+    for name, (table, hits, missing) in tables.items():
+        for key_format, key in hits.items():
+            latency = time_call(partial(table.__getitem__, key), repeat)
+            yield f"lookup.{name}.hit.{key_format}", Result(latency, "s")
+        latency = time_call(partial(miss, table, missing), repeat)
+        yield f"lookup.{name}.miss", Result(latency, "s")
+
+
+@benchmark
+def resolvers(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the resolvers for each format of the keys, compared with lookups.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The time of a hit and a miss with the resolver for each
+        format of the keys, and with ``__getitem__`` for comparison.
+    """
+    from bluetooth_numbers import company, oui, service
+    from bluetooth_numbers.exceptions import BluetoothNumbersError
+    from bluetooth_numbers.resolvers import (
+        make_company_resolver,
+        make_oui_resolver,
+        make_uuid_resolver,
+    )
+
+    # Table, resolver, format, a key that is found and a missing key
+    cases: list[tuple[str, Mapping[Any, str], Callable[[Any], Any], object, object]]
+    cases = [
+        ("company.int", company, make_company_resolver(), 0x0499, 0xFFFE),
+        (
+            "oui.str",
+            oui,
+            make_oui_resolver(formats=["normalized"]),
+            "58:2D:34",
+            "AB:CD:EF",
+        ),
+        (
+            "oui.unformatted",
+            oui,
+            make_oui_resolver(formats=["str"]),
+            "582d34",
+            "abcdef",
+        ),
+        ("oui.int", oui, make_oui_resolver(formats=["int"]), 0x582D34, 0xABCDEF),
+        ("service.int", service, make_uuid_resolver(formats=["int"]), 0x180F, 0xFFFE),
+        (
+            "service.uuid",
+            service,
+            make_uuid_resolver(formats=["uuid"]),
+            UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"),
+            UUID(int=1),
+        ),
+        (
+            "service.str",
+            service,
+            make_uuid_resolver(formats=["str"]),
+            "6e400001-b5a3-f393-e0a9-e50e24dcca9e",
+            "00000001-0000-0000-0000-000000000000",
+        ),
+    ]
+
+    def miss(table: Mapping[Any, str], key: object) -> None:
+        with suppress(BluetoothNumbersError):
+            table[key]
+
+    for name, table, resolve, hit, missing in cases:
+        for kind, key in (("hit", hit), ("miss", missing)):
+            latency = time_call(partial(resolve, key), repeat)
+            yield f"resolver.{name}.{kind}", Result(latency, "s")
+            if kind == "hit":
+                latency = time_call(partial(table.__getitem__, key), repeat)
+            else:
+                latency = time_call(partial(miss, table, key), repeat)
+            yield f"resolver.{name}.{kind}.getitem", Result(latency, "s")
+
+
+# The regular expressions the OUI functions used before, to compare with
+OUI_RE = re.compile(r"^([0-9A-F]{2})[-:]*([0-9A-F]{2})[-:]*([0-9A-F]{2})$")
+NORMALIZED_OUI_RE = re.compile(r"^[0-9A-F]{2}:[0-9A-F]{2}:[0-9A-F]{2}$")
+# Number of distinct OUIs a scanner sees
+SCANNED_OUIS = 2000
+
+
+def normalize_oui_regex(oui: str) -> str:
+    """Normalize an OUI with a regular expression, as the package did before.
+
+    Args:
+        oui (str): The OUI to normalize.
+
+    Raises:
+        WrongOUIFormatError: If `oui` doesn't have the right format.
+
+    Returns:
+        str: `oui` as a normalized OUI.
+    """
+    oui_parts = OUI_RE.match(oui.upper())
+    if oui_parts:
+        return oui_parts.group(1) + ":" + oui_parts.group(2) + ":" + oui_parts.group(3)
+
+    from bluetooth_numbers.exceptions import WrongOUIFormatError
+
+    raise WrongOUIFormatError(oui)
+
+
+@benchmark
+def oui_normalization(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure normalizing OUIs, compared with regular expressions.
+
+    The lookups simulate a scanner that sees the same OUIs over and over, in the
+    lowercase format with dashes.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The time of normalizing an OUI with each
+        implementation, and the throughput of lookups of unnormalized OUIs.
+    """
+    from bluetooth_numbers import oui
+    from bluetooth_numbers.dicts import OUIDict
+    from bluetooth_numbers.exceptions import UnknownOUIError
+    from bluetooth_numbers.utils import normalize_oui
+
+    class RegexOUIDict(OUIDict):
+        """OUIDict that looks up unnormalized OUIs as the package did before."""
+
+        def __missing__(self, key: str | int) -> str:
+            """Look up an unnormalized OUI with regular expressions."""
+            if isinstance(key, int):
+                return super().__missing__(key)
+            if NORMALIZED_OUI_RE.match(key):
+                raise UnknownOUIError(key)
+            return self[normalize_oui_regex(key)]
+
+    for key_format, key in (("dashes", "58-2d-34"), ("plain", "582d34")):
+        latency = time_call(partial(normalize_oui, key), repeat)
+        yield f"oui.normalize.{key_format}", Result(latency, "s")
+        latency = time_call(partial(normalize_oui_regex, key), repeat)
+        yield f"oui.normalize.{key_format}.regex", Result(latency, "s")
+
+    scanned = random.Random(0).sample(list(oui), SCANNED_OUIS)
+    keys = [key.lower().replace(":", "-") for key in scanned] * 10
+    latency = time_call(partial(oui.lookup_many, keys), repeat)
+    yield "oui.lookup_many.unnormalized", Result(len(keys) / latency, "keys/s")
+
+    # Both paths look up the keys with lookup_many() and __missing__()
+    regex_table = RegexOUIDict(oui)
+    latency = time_call(partial(regex_table.lookup_many, keys), repeat)
+    yield "oui.lookup_many.unnormalized.regex", Result(len(keys) / latency, "keys/s")
+
+
+@benchmark
+def shared(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure sharing the OUI table with workers, compared with pickling it.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The time a worker needs to get the table by unpickling
+        it and by attaching to shared memory, and the latency of lookups in the
+        shared table.
+    """
+    import pickle
+
+    from bluetooth_numbers import oui
+    from bluetooth_numbers.dicts import OUIDict
+    from bluetooth_numbers.shared import attach, share
+
+    # A copy, because the built-in table is pickled as a reference
+    pickled = pickle.dumps(OUIDict(oui))
+    yield (
+        "shared.unpickle.oui",
+        Result(
+            time_call(partial(pickle.loads, pickled), repeat),
+            "s",
+        ),
+    )
+    with share(oui) as shared_oui:
+        name = shared_oui.name
+        assert name is not None  # noqa: S101
+
+        def attach_and_close() -> None:
+            attach(name).close()
+
+        yield "shared.attach.oui", Result(time_call(attach_and_close, repeat), "s")
+        for key_format, key in (("str", "58:2D:34"), ("unformatted", "582d34")):
+            latency = time_call(partial(shared_oui.__getitem__, key), repeat)
+            yield f"shared.lookup.oui.{key_format}", Result(latency, "s")
+
+
+@benchmark
+def pickling(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure pickling and copying the built-in and a changed OUI table.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The size of the pickled tables, the time to pickle and
+        unpickle them, and the time to deep-copy the changed table.
+    """
+    import copy
+    import pickle
+
+    from bluetooth_numbers import oui
+    from bluetooth_numbers.dicts import OUIDict
+
+    changed_oui = OUIDict(oui)
+    changed_oui["00:00:01"] = "Foo"
+    for kind, table in (("builtin", oui), ("changed", changed_oui)):
+        pickled = pickle.dumps(table)
+        yield f"pickle.size.oui.{kind}", Result(len(pickled), "bytes")
+        yield (
+            f"pickle.dumps.oui.{kind}",
+            Result(time_call(partial(pickle.dumps, table), repeat), "s"),
+        )
+        yield (
+            f"pickle.loads.oui.{kind}",
+            Result(time_call(partial(pickle.loads, pickled), repeat), "s"),
+        )
+    yield (
+        "pickle.deepcopy.oui.changed",
+        Result(time_call(partial(copy.deepcopy, changed_oui), repeat), "s"),
+    )
+
+
+@benchmark
+def prefork(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the private memory of forked workers, with and without warming up.
+
+    The private memory of a worker is the memory it doesn't share with the master
+    and the other workers, from ``/proc/self/smaps_rollup``, so this only runs on
+    Linux.
+
+    Args:
+        repeat (int): Number of fresh interpreters to fork the workers in.
+
+    Yields:
+        tuple[str, Result]: The median private memory of a worker, with and
+        without calling :func:`bluetooth_numbers.prefork.warmup` before the fork.
+    """
+    if not Path("/proc/self/smaps_rollup").exists():
+        return
+    for warmup in (False, True):
+        sizes = []
+        for _ in range(repeat):
+            script = PREFORK_SCRIPT.format(warmup=warmup, workers=PREFORK_WORKERS)
+            sizes.extend(json.loads(run_python(script).stdout))
+        suffix = ".warmup" if warmup else ""
+        yield (
+            f"prefork.worker_private{suffix}",
+            Result(
+                statistics.median(sizes),
+                "bytes",
+            ),
+        )
+
+
+# Advertising data of an iBeacon, an Eddystone-UID beacon, a device with the Nordic
+# UART Service and a RuuviTag
+ADVERTISEMENTS = (
+    "0201061AFF4C000215E2C56DB5DFFB48D2B060D0F5A71096E000010002C5",
+    "0201060303AAFE1516AAFE00E8EDD5B1C5A8A1BC98D80B0000000000000000",
+    "0201061107 9ECADC240EE5A9E093F3A3B50100406E 0509 55415254",
+    "0201061BFF99040512FC5394C37C0004FFE40408AC5C5D7E06C6D2CA1CE8D3",
+)
+
+
+@benchmark
+def advertising(repeat: int) -> Iterator[tuple[str, Result]]:
+    """Measure the throughput of parsing advertising data.
+
+    Args:
+        repeat (int): Number of times the measurement is repeated.
+
+    Yields:
+        tuple[str, Result]: The number of parsed advertisements per second.
+    """
+    from bluetooth_numbers.advertising import parse_advertising_data
+
+    advertisements = [bytes.fromhex(data.replace(" ", "")) for data in ADVERTISEMENTS]
+
+    def parse() -> None:
+        for data in advertisements:
+            for _ in parse_advertising_data(data):
+                pass
+
+    latency = time_call(parse, repeat) / len(advertisements)
+    yield "advertising.parse", Result(1 / latency, "ads/s")
+
+
+def run(names: list[str] | None, repeat: int) -> Results:
+    """Run the benchmarks.
+
+    Args:
+        names (list[str] | None): Names of the benchmarks to run, or None or an
+            empty list to run all of them.
+        repeat (int): Number of times each measurement is repeated.
+
+    Returns:
+        Results: The result of each measurement by name.
+    """
+    results: Results = {}
+    for function in (BENCHMARKS[name] for name in names or BENCHMARKS):
+        for name, result in function(repeat):
+            _logger.info("%s: %.6g %s", name, result.value, result.unit)
+            results[name] = result
+    return results
+
+
+def compare(results: Results, baseline: Results, threshold: float) -> list[str]:
+    """Compare results with a baseline.
+
+    Args:
+        results (Results): The results of this run.
+        baseline (Results): The results of an earlier run.
+        threshold (float): The relative regression of a value compared to its
+            baseline value that is tolerated, for instance 0.2 for 20%.
+
+    Returns:
+        list[str]: A description of each result that is worse than its baseline
+        value by more than the threshold.
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline or min(baseline[name].value, result.value) <= 0:
+            continue
+        change = result.value / baseline[name].value - 1
+        if result.is_rate:
+            # A rate that drops by a factor is as bad as a time that rises by it
+            change = baseline[name].value / result.value - 1
+        if change > threshold:
+            regressions.append(
+                f"{name}: {result.value:.6g} {result.unit}, "
+                f"{change:.0%} worse than baseline {baseline[name].value:.6g}",
+            )
+    return regressions
+
+
+def dump_results(results: Results, path: Path) -> None:
+    """Write results as JSON, with the versions of Python and the platform.
+
+    Args:
+        results (Results): The results to write.
+        path (Path): The path of the JSON file.
+    """
+    document = {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "results": {name: result._asdict() for name, result in results.items()},
+    }
+    with path.open("w") as results_file:
+        json.dump(document, results_file, indent=2, sort_keys=True)
+        results_file.write("\n")
+
+
+def load_results(path: Path) -> Results:
+    """Read results from a JSON file written by :func:`dump_results`.
+
+    Args:
+        path (Path): The path of the JSON file.
+
+    Returns:
+        Results: The results in the file.
+    """
+    with path.open() as results_file:
+        document = json.load(results_file)
+    return {name: Result(**result) for name, result in document["results"].items()}
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="benchmark",
+        help=f"benchmarks to run: {', '.join(BENCHMARKS)} (default: all)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="write the results as JSON to this file",
+    )
+    parser.add_argument(
+        "-b",
+        "--baseline",
+        type=Path,
+        help="compare the results with the JSON results of an earlier run",
+    )
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help="tolerated relative increase over the baseline "
+        f"(default: {DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"number of repetitions of each measurement (default: {DEFAULT_REPEAT})",
+    )
+    parsed_args = parser.parse_args(args)
+    unknown = set(parsed_args.benchmarks) - BENCHMARKS.keys()
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+    return parsed_args
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the benchmarks and compare them with a baseline.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        int: The exit status: 1 if a result exceeds its baseline, 0 otherwise.
+    """
+    parsed_args = parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.path.insert(0, SRC_DIR)
+
+    results = run(parsed_args.benchmarks, parsed_args.repeat)
+    if parsed_args.output:
+        dump_results(results, parsed_args.output)
+
+    if parsed_args.baseline:
+        baseline = load_results(parsed_args.baseline)
+        regressions = compare(results, baseline, parsed_args.threshold)
+        for regression in regressions:
+            _logger.error("Regression in %s", regression)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
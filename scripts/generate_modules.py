@@ -1,14 +1,32 @@
 # ruff: noqa: RUF001
-"""Generate Python modules for Bluetooth numbers."""
+"""Generate Python modules for Bluetooth numbers.
+
+A module is only generated again if one of its inputs (the data files, the template
+or this script) changed since the previous run. The digests of the inputs are kept in
+a manifest file. Run this script with ``--force`` to generate all modules anyway.
+
+With ``--sqlite`` or ``--parquet``, the tables of the generated modules are exported
+to an SQLite database or Parquet files too.
+"""
 from __future__ import annotations
 
+import argparse
+import hashlib
+import importlib
 import json
+import logging
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable
 
 import yaml
 from jinja2 import Environment, FileSystemLoader
 
+if TYPE_CHECKING:
+    from types import ModuleType
+
 DATA_DIR = "data"
 BLUETOOTH_SIG_UUIDS_DIR = f"{DATA_DIR}/bluetooth-sig-public/assigned_numbers/uuids"
 BLUETOOTH_NUMBERS_DIR = f"{DATA_DIR}/bluetooth-numbers-database/v1"
@@ -17,10 +35,21 @@ CODE_DIR = "src/bluetooth_numbers"
 UUID_TEMPLATE = "uuids.py.jinja"
 CIC_TEMPLATE = "companies.py.jinja"
 OUI_TEMPLATE = "ouis.py.jinja"
+INDEX_TEMPLATE = "indexes.py.jinja"
+TERM_TEMPLATE = "terms.py.jinja"
 OUI_RE = re.compile(r"^([0-9A-F]{2}-[0-9A-F]{2}-[0-9A-F]{2})\s*\(hex\)\s+(.*)\s*$")
+MANIFEST_FILE = ".generate_modules.json"
+HASH_CHUNK_SIZE = 1 << 20
+TEMPLATE_BUFFER_SIZE = 64
+UUID16_MASK = 0xFFFF << 96
+UINT32_LIMIT = 1 << 32
+
+_logger = logging.getLogger(__name__)
 
 file_loader = FileSystemLoader(TEMPLATE_DIR)
 env = Environment(loader=file_loader, autoescape=False)  # noqa: S701
+# A JSON string is a valid Python string literal, with double quotes
+env.filters["literal"] = lambda s: json.dumps(s, ensure_ascii=False)
 
 
 def replace_ambiguous_characters(s: str) -> str:
@@ -79,8 +108,7 @@ def generate_uuid_dictionaries(kind: str) -> tuple[dict[int, str], dict[str, str
     uuid128_dict = {}
 
     with (Path(BLUETOOTH_NUMBERS_DIR) / f"{kind}_uuids.json").open() as json_file:
-        json_data = json.loads(json_file.read())
-        for number in json_data:
+        for number in json.load(json_file):
             name = number["name"]
             uuid = number["uuid"]
             if len(uuid) == 4:  # noqa: PLR2004
@@ -103,11 +131,14 @@ def generate_uuid_module(
         uuid16_dict (dict[int, str]): Dict with 16-bit UUIDs as keys.
         uuid128_dict (dict[str, str]): Dict with 128-bit UUIDs as keys.
     """
-    template = env.get_template(UUID_TEMPLATE)
+    stream = env.get_template(UUID_TEMPLATE).stream(
+        uuids16=uuid16_dict,
+        uuids128=uuid128_dict,
+        uuid_dict=kind,
+    )
     with (Path(CODE_DIR) / f"_{kind}s.py").open("w") as python_file:
-        python_file.write(
-            template.render(uuids16=uuid16_dict, uuids128=uuid128_dict, uuid_dict=kind),
-        )
+        stream.enable_buffering(TEMPLATE_BUFFER_SIZE)
+        python_file.writelines(stream)
 
 
 def generate_cic_dictionary() -> dict[str, str]:
@@ -119,8 +150,7 @@ def generate_cic_dictionary() -> dict[str, str]:
     cic_dict = {}
 
     with (Path(BLUETOOTH_NUMBERS_DIR) / "company_ids.json").open() as json_file:
-        json_data = json.loads(json_file.read())
-        for number in json_data:
+        for number in json.load(json_file):
             code = f"{number['code']:#06x}"
             name = number["name"].replace('"', '\\"')
             cic_dict[code] = name
@@ -135,9 +165,10 @@ def generate_cic_module(cic_dict: dict[str, str]) -> None:
         cic_dict (dict[str, str]): The dict with CICs to generate a Python
           module for.
     """
-    template = env.get_template(CIC_TEMPLATE)
+    stream = env.get_template(CIC_TEMPLATE).stream(cics=cic_dict)
     with (Path(CODE_DIR) / "_companies.py").open("w") as python_file:
-        python_file.write(template.render(cics=cic_dict))
+        stream.enable_buffering(TEMPLATE_BUFFER_SIZE)
+        python_file.writelines(stream)
 
 
 def generate_oui_dictionary() -> dict[str, str]:
@@ -165,13 +196,24 @@ def generate_oui_module(oui_dict: dict[str, str]) -> None:
         oui_dict (dict[str, str]): The dict with OUIs to generate a Python
           module for.
     """
-    template = env.get_template(OUI_TEMPLATE)
+    # Give every vendor an ID, so its name is only stored once
+    vendors: dict[str, int] = {}
+    vendor_ids = {
+        prefix: vendors.setdefault(name, len(vendors))
+        for prefix, name in oui_dict.items()
+    }
+
+    stream = env.get_template(OUI_TEMPLATE).stream(
+        vendors=list(vendors),
+        ouis=vendor_ids,
+    )
     with (Path(CODE_DIR) / "_ouis.py").open("w") as python_file:
-        python_file.write(template.render(ouis=oui_dict))
+        stream.enable_buffering(TEMPLATE_BUFFER_SIZE)
+        python_file.writelines(stream)
 
 
-if __name__ == "__main__":
-    # Generate module for service UUIDs
+def generate_services() -> None:
+    """Generate Python module for service UUIDs."""
     service_uuid16, service_uuid128 = generate_uuid_dictionaries("service")
     member_service_uuid16 = generate_uuid16_dictionary("member")
     sdo_service_uuid16 = generate_uuid16_dictionary("sdo")
@@ -189,7 +231,9 @@ if __name__ == "__main__":
     service_uuid16.update(sdo_service_uuid16)
     generate_uuid_module("service", service_uuid16, service_uuid128)
 
-    # Generate module for characteristic UUIDs
+
+def generate_characteristics() -> None:
+    """Generate Python module for characteristic UUIDs."""
     characteristic_uuid16, characteristic_uuid128 = generate_uuid_dictionaries(
         "characteristic",
     )
@@ -199,14 +243,286 @@ if __name__ == "__main__":
         characteristic_uuid128,
     )
 
-    # Generate module for descriptor UUIDs
+
+def generate_descriptors() -> None:
+    """Generate Python module for descriptor UUIDs."""
     descriptor_uuid16, descriptor_uuid128 = generate_uuid_dictionaries("descriptor")
     generate_uuid_module("descriptor", descriptor_uuid16, descriptor_uuid128)
 
-    # Generate module for Company ID Codes
-    cics = generate_cic_dictionary()
-    generate_cic_module(cics)
 
-    # Generate module for OUIs
-    ouis = generate_oui_dictionary()
-    generate_oui_module(ouis)
+def generate_companies() -> None:
+    """Generate Python module for Company ID Codes."""
+    generate_cic_module(generate_cic_dictionary())
+
+
+def generate_ouis() -> None:
+    """Generate Python module for OUIs."""
+    generate_oui_module(generate_oui_dictionary())
+
+
+def import_package() -> ModuleType:
+    """Import the package with the generated modules from the source directory.
+
+    Returns:
+        ModuleType: The bluetooth_numbers package.
+    """
+    sys.path.insert(0, str(Path(CODE_DIR).parent))
+    return importlib.import_module("bluetooth_numbers")
+
+
+def generate_indexes() -> None:
+    """Generate Python module with precomputed indexes of the generated modules."""
+    package = import_package()
+
+    ouis = {
+        int(prefix.replace(":", ""), 16): package.oui.vendor_id(prefix)
+        for prefix in package.oui
+    }
+
+    families: dict[str, dict[int, list[int]]] = {}
+    for kind in ("characteristic", "descriptor", "service"):
+        families[kind] = {}
+        for uuid in getattr(package, kind):
+            # 128-bit UUIDs are stored as integers, like the 16-bit UUIDs
+            if uuid >= UINT32_LIMIT:
+                families[kind].setdefault(uuid & ~UUID16_MASK, []).append(uuid)
+
+    # Hash the items themselves, because the content hash of a built-in table is
+    # read from the previous _indexes.py
+    dicts = importlib.import_module("bluetooth_numbers.dicts")
+    content_hashes = {
+        name: dicts._content_hash(dict.items(getattr(package, name)))  # noqa: SLF001
+        for name in package.__all__
+    }
+
+    stream = env.get_template(INDEX_TEMPLATE).stream(
+        ouis=ouis,
+        families=families,
+        content_hashes=content_hashes,
+    )
+    with (Path(CODE_DIR) / "_indexes.py").open("w") as python_file:
+        stream.enable_buffering(TEMPLATE_BUFFER_SIZE)
+        python_file.writelines(stream)
+
+
+def generate_terms() -> None:
+    """Generate Python module with a precomputed index for reverse lookups."""
+    package = import_package()
+    reverse_lookup = importlib.import_module("bluetooth_numbers.reverse_lookup")
+
+    descriptions = [
+        description
+        for uuid_type in reverse_lookup.UUID_TYPE_DEFAULT
+        for description in getattr(package, uuid_type).values()
+    ]
+
+    stream = env.get_template(TERM_TEMPLATE).stream(
+        terms=reverse_lookup.index_terms(descriptions),
+    )
+    with (Path(CODE_DIR) / "_terms.py").open("w") as python_file:
+        stream.enable_buffering(TEMPLATE_BUFFER_SIZE)
+        python_file.writelines(stream)
+
+
+# Generated modules with the function that generates them and the files they're
+# generated from.
+MODULES: dict[str, tuple[Callable[[], None], tuple[str, ...]]] = {
+    "_services.py": (
+        generate_services,
+        (
+            f"{BLUETOOTH_NUMBERS_DIR}/service_uuids.json",
+            f"{BLUETOOTH_SIG_UUIDS_DIR}/member_uuids.yaml",
+            f"{BLUETOOTH_SIG_UUIDS_DIR}/sdo_uuids.yaml",
+            f"{TEMPLATE_DIR}/{UUID_TEMPLATE}",
+        ),
+    ),
+    "_characteristics.py": (
+        generate_characteristics,
+        (
+            f"{BLUETOOTH_NUMBERS_DIR}/characteristic_uuids.json",
+            f"{TEMPLATE_DIR}/{UUID_TEMPLATE}",
+        ),
+    ),
+    "_descriptors.py": (
+        generate_descriptors,
+        (
+            f"{BLUETOOTH_NUMBERS_DIR}/descriptor_uuids.json",
+            f"{TEMPLATE_DIR}/{UUID_TEMPLATE}",
+        ),
+    ),
+    "_companies.py": (
+        generate_companies,
+        (
+            f"{BLUETOOTH_NUMBERS_DIR}/company_ids.json",
+            f"{TEMPLATE_DIR}/{CIC_TEMPLATE}",
+        ),
+    ),
+    "_ouis.py": (
+        generate_ouis,
+        (f"{DATA_DIR}/oui.txt", f"{TEMPLATE_DIR}/{OUI_TEMPLATE}"),
+    ),
+}
+
+# Generated modules with indexes, which are generated from the modules above.
+INDEX_MODULES: dict[str, tuple[Callable[[], None], tuple[str, ...]]] = {
+    "_indexes.py": (
+        generate_indexes,
+        (
+            *(f"{CODE_DIR}/{module}" for module in MODULES),
+            *(
+                path
+                for _, inputs in MODULES.values()
+                for path in inputs
+                if path.startswith(f"{DATA_DIR}/")
+            ),
+            f"{CODE_DIR}/dicts.py",
+            f"{TEMPLATE_DIR}/{INDEX_TEMPLATE}",
+        ),
+    ),
+    "_terms.py": (
+        generate_terms,
+        (
+            *(f"{CODE_DIR}/{module}" for module in MODULES),
+            f"{CODE_DIR}/reverse_lookup.py",
+            f"{TEMPLATE_DIR}/{TERM_TEMPLATE}",
+        ),
+    ),
+}
+
+
+def file_digest(path: Path) -> str:
+    """Calculate the SHA-256 digest of a file in chunks.
+
+    Args:
+        path (Path): The file to calculate the digest for.
+
+    Returns:
+        str: The hexadecimal SHA-256 digest of the file's contents.
+    """
+    digest = hashlib.sha256()
+    with path.open("rb") as binary_file:
+        for chunk in iter(lambda: binary_file.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def input_digests(module: str) -> dict[str, str]:
+    """Calculate the digests of all inputs of a generated module.
+
+    This script is an input of every module too, so changes in how modules are
+    generated are picked up.
+
+    Args:
+        module (str): File name of the generated module.
+
+    Returns:
+        dict[str, str]: A dict with the input files as keys and their digest as values.
+    """
+    _, inputs = {**MODULES, **INDEX_MODULES}[module]
+    return {path: file_digest(Path(path)) for path in (*inputs, __file__)}
+
+
+def generate_module(module: str) -> str:
+    """Generate one Python module.
+
+    This is run in a worker process.
+
+    Args:
+        module (str): File name of the generated module.
+
+    Returns:
+        str: File name of the generated module.
+    """
+    generate, _ = {**MODULES, **INDEX_MODULES}[module]
+    generate()
+    return module
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "-f",
+        "--force",
+        action="store_true",
+        help="generate all modules, even if their inputs didn't change",
+    )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=None,
+        help="number of worker processes (default: number of CPUs)",
+    )
+    parser.add_argument(
+        "--sqlite",
+        type=Path,
+        help="export the tables to this SQLite database",
+    )
+    parser.add_argument(
+        "--parquet",
+        type=Path,
+        help="export the tables to Parquet files in this directory",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> None:
+    """Generate the modules whose inputs changed since the previous run.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+    """
+    parsed_args = parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    manifest_path = Path(MANIFEST_FILE)
+    manifest: dict[str, dict[str, str]] = {}
+    if manifest_path.exists() and not parsed_args.force:
+        with manifest_path.open() as manifest_file:
+            manifest = json.load(manifest_file)
+
+    with ProcessPoolExecutor(max_workers=parsed_args.jobs) as executor:
+        # The modules with indexes are generated from the other generated modules, so
+        # they're only checked after the latter are up to date.
+        for modules in (MODULES, INDEX_MODULES):
+            digests = {module: input_digests(module) for module in modules}
+            outdated = [
+                module
+                for module, module_digests in digests.items()
+                if manifest.get(module) != module_digests
+                or not (Path(CODE_DIR) / module).exists()
+            ]
+            for module in modules:
+                if module in outdated:
+                    continue
+                _logger.info("Skipping %s: inputs unchanged", module)
+
+            for module in executor.map(generate_module, outdated):
+                _logger.info("Generated %s", module)
+                # Only record a module's digests once it's generated, so an
+                # interrupted run doesn't skip it the next time.
+                manifest[module] = digests[module]
+                with manifest_path.open("w") as manifest_file:
+                    json.dump(manifest, manifest_file, indent=2, sort_keys=True)
+
+    if parsed_args.sqlite or parsed_args.parquet:
+        import_package()
+        export = importlib.import_module("bluetooth_numbers.export")
+        if parsed_args.sqlite:
+            export.export_sqlite(parsed_args.sqlite)
+            _logger.info("Exported %s", parsed_args.sqlite)
+        if parsed_args.parquet:
+            export.export_parquet(parsed_args.parquet)
+            _logger.info("Exported %s", parsed_args.parquet)
+
+
+if __name__ == "__main__":
+    main()
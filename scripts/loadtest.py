@@ -0,0 +1,283 @@
+"""Load test the lookup server with concurrent batched requests.
+
+Start the server first, e.g. with ``python -m bluetooth_numbers.server --unix
+/tmp/bluetooth-numbers.sock``, and then run this script with the same socket or HTTP
+address. Every client keeps one connection open and sends a request with a batch
+of random keys as soon as it got the response to its previous request. The script
+reports the throughput in requests and keys per second and the latency percentiles
+of the requests.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import statistics
+import sys
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+SRC_DIR = str(Path(__file__).resolve().parent.parent / "src")
+TABLES = ("company", "oui", "service", "characteristic", "descriptor")
+DEFAULT_CLIENTS = 16
+DEFAULT_BATCH = 100
+DEFAULT_DURATION = 5.0
+
+# Sends a request line and returns the response line
+Exchange = Callable[[bytes], Awaitable[bytes]]
+
+_logger = logging.getLogger(__name__)
+
+
+def format_key(key: Any) -> str:  # noqa: ANN401
+    """Format a key of a dictionary of the package for a request.
+
+    Args:
+        key (Any): The key.
+
+    Returns:
+        str: The key in the format of the ``bluetooth-numbers`` command.
+    """
+    if isinstance(key, int):
+        return f"0x{key:04X}"
+    return str(key)
+
+
+def sample_keys(table: str, size: int) -> list[str]:
+    """Return random keys of a dictionary of the package.
+
+    Args:
+        table (str): The name of the dictionary.
+        size (int): The number of keys.
+
+    Returns:
+        list[str]: The keys, of which some are repeated if the dictionary has fewer
+        than `size` keys.
+    """
+    import bluetooth_numbers
+
+    keys = [format_key(key) for key in getattr(bluetooth_numbers, table)]
+    return random.choices(keys, k=size)  # noqa: S311
+
+
+async def connect_unix(path: Path) -> tuple[Exchange, asyncio.StreamWriter]:
+    """Connect to the server over a Unix domain socket.
+
+    Args:
+        path (Path): The path of the socket.
+
+    Returns:
+        tuple[Exchange, asyncio.StreamWriter]: The function to exchange a request
+        and a response, and the writer of the connection.
+    """
+    reader, writer = await asyncio.open_unix_connection(path, limit=2**24)
+
+    async def exchange(request: bytes) -> bytes:
+        writer.write(request)
+        await writer.drain()
+        return await reader.readline()
+
+    return exchange, writer
+
+
+async def connect_http(host: str, port: int) -> tuple[Exchange, asyncio.StreamWriter]:
+    """Connect to the server over HTTP.
+
+    Args:
+        host (str): The host of the server.
+        port (int): The port of the server.
+
+    Returns:
+        tuple[Exchange, asyncio.StreamWriter]: The function to exchange a request
+        and a response, and the writer of the connection.
+    """
+    reader, writer = await asyncio.open_connection(host, port, limit=2**24)
+
+    async def exchange(request: bytes) -> bytes:
+        writer.write(
+            f"POST / HTTP/1.1\r\nHost: {host}\r\n"
+            "Content-Type: application/x-ndjson\r\n"
+            f"Content-Length: {len(request)}\r\n\r\n".encode("latin-1")
+            + request,
+        )
+        await writer.drain()
+        length = 0
+        await reader.readline()
+        while True:
+            header = await reader.readline()
+            if not header.strip():
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        return await reader.readexactly(length)
+
+    return exchange, writer
+
+
+async def client(
+    connect: Callable[[], Awaitable[tuple[Exchange, asyncio.StreamWriter]]],
+    requests: list[bytes],
+    deadline: float,
+) -> list[float]:
+    """Send requests over one connection until the deadline.
+
+    Args:
+        connect (Callable): The function to connect to the server.
+        requests (list[bytes]): The request lines to send in turn.
+        deadline (float): The :func:`time.perf_counter` value to stop at.
+
+    Returns:
+        list[float]: The latency of each request in seconds.
+    """
+    exchange, writer = await connect()
+    latencies: list[float] = []
+    try:
+        while perf_counter() < deadline:
+            request = requests[len(latencies) % len(requests)]
+            start = perf_counter()
+            response = await exchange(request)
+            latencies.append(perf_counter() - start)
+            if b'"error"' in response:
+                msg = f"Error response: {response!r}"
+                raise RuntimeError(msg)
+    finally:
+        writer.close()
+    return latencies
+
+
+async def load_test(
+    connect: Callable[[], Awaitable[tuple[Exchange, asyncio.StreamWriter]]],
+    requests: list[bytes],
+    clients: int,
+    duration: float,
+) -> list[float]:
+    """Run concurrent clients against the server.
+
+    Args:
+        connect (Callable): The function to connect to the server.
+        requests (list[bytes]): The request lines to send.
+        clients (int): The number of concurrent clients.
+        duration (float): The duration of the test in seconds.
+
+    Returns:
+        list[float]: The latency of each request of all clients in seconds.
+    """
+    deadline = perf_counter() + duration
+    results = await asyncio.gather(
+        *(client(connect, requests, deadline) for _ in range(clients)),
+    )
+    return [latency for latencies in results for latency in latencies]
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument(
+        "-u",
+        "--unix",
+        type=Path,
+        help="path of the Unix domain socket of the server",
+    )
+    address.add_argument(
+        "--http",
+        metavar="[HOST:]PORT",
+        help="HTTP address of the server (default host: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "-t",
+        "--table",
+        choices=TABLES,
+        default="company",
+        help="table to look up keys in (default: company)",
+    )
+    parser.add_argument(
+        "-c",
+        "--clients",
+        type=int,
+        default=DEFAULT_CLIENTS,
+        help=f"number of concurrent clients (default: {DEFAULT_CLIENTS})",
+    )
+    parser.add_argument(
+        "-b",
+        "--batch",
+        type=int,
+        default=DEFAULT_BATCH,
+        help=f"number of keys per request (default: {DEFAULT_BATCH})",
+    )
+    parser.add_argument(
+        "-d",
+        "--duration",
+        type=float,
+        default=DEFAULT_DURATION,
+        help=f"duration of the test in seconds (default: {DEFAULT_DURATION})",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> int:
+    """Run the load test and report its results.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        int: The exit status: 1 if no request completed, 0 otherwise.
+    """
+    parsed_args = parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    sys.path.insert(0, SRC_DIR)
+
+    keys = sample_keys(parsed_args.table, 100 * parsed_args.batch)
+    requests = [
+        json.dumps(
+            {
+                "table": parsed_args.table,
+                "keys": keys[start : start + parsed_args.batch],
+            },
+        ).encode()
+        + b"\n"
+        for start in range(0, len(keys), parsed_args.batch)
+    ]
+
+    connect: Callable[[], Awaitable[tuple[Exchange, asyncio.StreamWriter]]]
+    if parsed_args.unix:
+        unix = parsed_args.unix
+        connect = lambda: connect_unix(unix)  # noqa: E731
+    else:
+        host, _, port = parsed_args.http.rpartition(":")
+        connect = lambda: connect_http(host or "127.0.0.1", int(port))  # noqa: E731
+
+    latencies = asyncio.run(
+        load_test(connect, requests, parsed_args.clients, parsed_args.duration),
+    )
+    if not latencies:
+        _logger.error("No request completed")
+        return 1
+
+    percentiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else []
+    _logger.info("requests: %d", len(latencies))
+    _logger.info("requests/s: %.0f", len(latencies) / parsed_args.duration)
+    _logger.info(
+        "keys/s: %.0f",
+        len(latencies) * parsed_args.batch / parsed_args.duration,
+    )
+    _logger.info("p50 latency: %.3f ms", statistics.median(latencies) * 1000)
+    if percentiles:
+        _logger.info("p99 latency: %.3f ms", percentiles[98] * 1000)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,8 +9,6 @@ Usage:
 >>> characteristic[UUID("6E400002-B5A3-F393-E0A9-E50E24DCCA9E")]
 'UART RX Characteristic'
 """
-from uuid import UUID
-
 from bluetooth_numbers.dicts import UUIDDict
 
 characteristic = UUIDDict(
@@ -448,215 +446,183 @@ characteristic = UUIDDict(
         0x2ADC: "Mesh Provisioning Data Out",
         0x2ADD: "Mesh Proxy Data In",
         0x2ADE: "Mesh Proxy Data Out",
-        UUID("00001524-1212-EFDE-1523-785FEABCD123"): "Blinky Button State",
-        UUID("00001525-1212-EFDE-1523-785FEABCD123"): "Blinky LED State",
-        UUID("00001531-1212-EFDE-1523-785FEABCD123"): "Legacy DFU Control Point",
-        UUID("00001532-1212-EFDE-1523-785FEABCD123"): "Legacy DFU Packet",
-        UUID("00001534-1212-EFDE-1523-785FEABCD123"): "Legacy DFU Version",
-        UUID("8EC90001-F315-4F60-9FB8-838830DAEA50"): "DFU Control Point",
-        UUID("8EC90002-F315-4F60-9FB8-838830DAEA50"): "DFU Packet",
-        UUID("8EC90003-F315-4F60-9FB8-838830DAEA50"): "Buttonless DFU Without Bonds",
-        UUID("8EC90004-F315-4F60-9FB8-838830DAEA50"): "Buttonless DFU With Bonds",
-        UUID("8E400001-F315-4F60-9FB8-838830DAEA50"): "Experimental Buttonless DFU",
-        UUID("DA2E7828-FBCE-4E01-AE9E-261174997C48"): "SMP Characteristic",
-        UUID("932C32BD-0002-47A2-835A-A8D455B859DD"): "Philips Hue Light On/Off Toggle",
-        UUID(
-            "932C32BD-0003-47A2-835A-A8D455B859DD",
-        ): "Philips Hue Light Brightness Level",
-        UUID("932C32BD-0005-47A2-835A-A8D455B859DD"): "Philips Hue Light Color",
-        UUID("EF680101-9B35-4933-9B10-52FFA9740042"): "Thingy Device Name",
-        UUID("EF680102-9B35-4933-9B10-52FFA9740042"): "Thingy Advertising Parameters",
-        UUID("EF680104-9B35-4933-9B10-52FFA9740042"): "Thingy Connection Parameters",
-        UUID("EF680105-9B35-4933-9B10-52FFA9740042"): "Thingy Eddystone URL",
-        UUID("EF680106-9B35-4933-9B10-52FFA9740042"): "Thingy Cloud Token",
-        UUID("EF680107-9B35-4933-9B10-52FFA9740042"): "Thingy FW Version",
-        UUID("EF680108-9B35-4933-9B10-52FFA9740042"): "Thingy MTU Request",
-        UUID("EF680201-9B35-4933-9B10-52FFA9740042"): "Thingy Temperature",
-        UUID("EF680202-9B35-4933-9B10-52FFA9740042"): "Thingy Pressure",
-        UUID("EF680203-9B35-4933-9B10-52FFA9740042"): "Thingy Humidity",
-        UUID("EF680204-9B35-4933-9B10-52FFA9740042"): "Thingy Air Quality",
-        UUID("EF680205-9B35-4933-9B10-52FFA9740042"): "Thingy Color",
-        UUID("EF680206-9B35-4933-9B10-52FFA9740042"): "Thingy Configuration",
-        UUID("EF680301-9B35-4933-9B10-52FFA9740042"): "Thingy LED State",
-        UUID("EF680302-9B35-4933-9B10-52FFA9740042"): "Thingy Button State",
-        UUID("EF680303-9B35-4933-9B10-52FFA9740042"): "Thingy EXT Pin",
-        UUID("EF680401-9B35-4933-9B10-52FFA9740042"): "Thingy Motion Config",
-        UUID("EF680402-9B35-4933-9B10-52FFA9740042"): "Thingy Tap",
-        UUID("EF680403-9B35-4933-9B10-52FFA9740042"): "Thingy Orientation",
-        UUID("EF680404-9B35-4933-9B10-52FFA9740042"): "Thingy Quaternion",
-        UUID("EF680405-9B35-4933-9B10-52FFA9740042"): "Thingy Pedometer",
-        UUID("EF680406-9B35-4933-9B10-52FFA9740042"): "Thingy Raw Data",
-        UUID("EF680407-9B35-4933-9B10-52FFA9740042"): "Thingy Euler",
-        UUID("EF680408-9B35-4933-9B10-52FFA9740042"): "Thingy Rotation Matrix",
-        UUID("EF680409-9B35-4933-9B10-52FFA9740042"): "Thingy Heading",
-        UUID("EF68040A-9B35-4933-9B10-52FFA9740042"): "Thingy Gravity Vector",
-        UUID("EF680501-9B35-4933-9B10-52FFA9740042"): "Thingy Sound Config",
-        UUID("EF680502-9B35-4933-9B10-52FFA9740042"): "Thingy Speaker Data",
-        UUID("EF680503-9B35-4933-9B10-52FFA9740042"): "Thingy Speaker Status",
-        UUID("EF680504-9B35-4933-9B10-52FFA9740042"): "Thingy Microphone",
-        UUID("6E400002-B5A3-F393-E0A9-E50E24DCCA9E"): "UART RX Characteristic",
-        UUID("6E400003-B5A3-F393-E0A9-E50E24DCCA9E"): "UART TX Characteristic",
-        UUID("57A70001-9350-11ED-A1EB-0242AC120002"): "Status Characteristic",
-        UUID(
-            "E2A00002-EC31-4EC3-A97A-1C34D87E9878",
-        ): "Edge Impulse Remote Management RX Characteristic",
-        UUID(
-            "E2A00003-EC31-4EC3-A97A-1C34D87E9878",
-        ): "Edge Impulse Remote Management TX Characteristic",
-        UUID("A3C87501-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Capabilities",
-        UUID("A3C87502-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Active Slot",
-        UUID("A3C87503-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Advertising Interval",
-        UUID("A3C87504-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Radio Tx Power",
-        UUID(
-            "A3C87505-8ED3-4BDF-8A39-A01BEBEDE295",
-        ): "Eddystone (Advanced) Advertised Tx Power",
-        UUID("A3C87506-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Lock State",
-        UUID("A3C87507-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Unlock",
-        UUID("A3C87508-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Public ECDH Key",
-        UUID("A3C87509-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone EID Identity Key",
-        UUID("A3C8750A-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone ADV Slot Data",
-        UUID(
-            "A3C8750B-8ED3-4BDF-8A39-A01BEBEDE295",
-        ): "Eddystone Advanced Factory Reset",
-        UUID(
-            "A3C8750C-8ED3-4BDF-8A39-A01BEBEDE295",
-        ): "Eddystone (Advanced) Remain Connectable",
-        UUID("FE2C1233-8366-4814-8EB0-01DE32100BEA"): "Fast Pair Model ID",
-        UUID("FE2C1234-8366-4814-8EB0-01DE32100BEA"): "Fast Pair Key-based Pairing",
-        UUID("FE2C1235-8366-4814-8EB0-01DE32100BEA"): "Fast Pair Passkey",
-        UUID("FE2C1236-8366-4814-8EB0-01DE32100BEA"): "Fast Pair Account Key",
-        UUID("FE2C1237-8366-4814-8EB0-01DE32100BEA"): "Fast Pair Data",
-        UUID("9FBF120D-6301-42D9-8C58-25E699A21DBD"): "Apple Notification Source",
-        UUID("69D1D8F3-45E1-49A8-9821-9BBDFDAAD9D9"): "Apple Control Point",
-        UUID("22EAC6E9-24D6-4BB5-BE44-B36ACE7C7BFB"): "Apple Data Source",
-        UUID("9B3C81D8-57B1-4A8A-B8DF-0E56F7CA51C2"): "Apple Remote Command",
-        UUID("2F7CABCE-808D-411F-9A0C-BB92BA96C102"): "Apple Entity Update",
-        UUID("C6B2F38C-23AB-46D8-A6AB-A3A870BBD5D7"): "Apple Entity Attribute",
-        UUID("7DFC6001-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6002-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6003-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6004-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6005-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6101-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6102-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6103-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6104-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6105-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6106-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6107-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6108-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6201-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6202-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC6203-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC8003-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7004-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7005-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7006-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7007-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7008-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7009-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC700A-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC700B-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC700C-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7103-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7104-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7105-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7106-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7107-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7108-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC7109-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC710B-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC710C-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC710D-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC8004-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("7DFC9001-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Characteristic",
-        UUID("E95DCA4B-251D-470A-A062-FA1922DFA9A8"): "micro:bit Accelerometer Data",
-        UUID("E95DFB24-251D-470A-A062-FA1922DFA9A8"): "micro:bit Accelerometer Period",
-        UUID("E95DFB11-251D-470A-A062-FA1922DFA9A8"): "micro:bit Magnetometer Data",
-        UUID("E95D386C-251D-470A-A062-FA1922DFA9A8"): "micro:bit Magnetometer Period",
-        UUID("E95D9715-251D-470A-A062-FA1922DFA9A8"): "micro:bit Magnetometer Bearing",
-        UUID("E95DDA90-251D-470A-A062-FA1922DFA9A8"): "micro:bit Button A State",
-        UUID("E95DDA91-251D-470A-A062-FA1922DFA9A8"): "micro:bit Button B State",
-        UUID("E95D8D00-251D-470A-A062-FA1922DFA9A8"): "micro:bit Pin Data",
-        UUID("E95D5899-251D-470A-A062-FA1922DFA9A8"): "micro:bit Pin AD Configuration",
-        UUID("E95DB9FE-251D-470A-A062-FA1922DFA9A8"): "micro:bit Pin I/O Configuration",
-        UUID("E95DD822-251D-470A-A062-FA1922DFA9A8"): "micro:bit PWM Control",
-        UUID("E95D7B77-251D-470A-A062-FA1922DFA9A8"): "micro:bit LED Matrix State",
-        UUID("E95D93EE-251D-470A-A062-FA1922DFA9A8"): "micro:bit LED Text",
-        UUID("E95D0D2D-251D-470A-A062-FA1922DFA9A8"): "micro:bit Scrolling Delay",
-        UUID("E95DB84C-251D-470A-A062-FA1922DFA9A8"): "micro:bit Requirements",
-        UUID("E95D9775-251D-470A-A062-FA1922DFA9A8"): "micro:bit Event",
-        UUID("E95D23C4-251D-470A-A062-FA1922DFA9A8"): "micro:bit Client Requirements",
-        UUID("E95D5404-251D-470A-A062-FA1922DFA9A8"): "micro:bit Client Event",
-        UUID("E95D93B1-251D-470A-A062-FA1922DFA9A8"): "micro:bit DFU Control",
-        UUID("E95D9250-251D-470A-A062-FA1922DFA9A8"): "micro:bit Temperature",
-        UUID("E95D1B25-251D-470A-A062-FA1922DFA9A8"): "micro:bit Temperature Period",
-        UUID(
-            "00001624-1212-EFDE-1623-785FEABCD123",
-        ): "LEGO® Wireless Protocol v3 Hub Characteristic",
-        UUID(
-            "00001626-1212-EFDE-1623-785FEABCD123",
-        ): "LEGO® Wireless Protocol v3 Bootloader Characteristic",
-        UUID(
-            "ADAF0001-C332-42A8-93BD-25E905756CB8",
-        ): "Adafruit Sensor Measurement Period",
-        UUID("ADAF0002-C332-42A8-93BD-25E905756CB8"): "Adafruit Sensor Service Version",
-        UUID("ADAF0101-C332-42A8-93BD-25E905756CB8"): "Adafruit Temperature",
-        UUID("ADAF0201-C332-42A8-93BD-25E905756CB8"): "Adafruit Acceleration",
-        UUID("ADAF0301-C332-42A8-93BD-25E905756CB8"): "Adafruit Light Level",
-        UUID("ADAF0401-C332-42A8-93BD-25E905756CB8"): "Adafruit Gyro",
-        UUID("ADAF0501-C332-42A8-93BD-25E905756CB8"): "Adafruit Magnetic",
-        UUID("ADAF0601-C332-42A8-93BD-25E905756CB8"): "Adafruit Pressed",
-        UUID("ADAF0701-C332-42A8-93BD-25E905756CB8"): "Adafruit Humidity",
-        UUID("ADAF0801-C332-42A8-93BD-25E905756CB8"): "Adafruit Pressure",
-        UUID("ADAF0901-C332-42A8-93BD-25E905756CB8"): "Adafruit Pixel Pin",
-        UUID("ADAF0902-C332-42A8-93BD-25E905756CB8"): "Adafruit Pixel Pin Type",
-        UUID("ADAF0903-C332-42A8-93BD-25E905756CB8"): "Adafruit Pixel Data",
-        UUID("ADAF0904-C332-42A8-93BD-25E905756CB8"): "Adafruit Pixel Buffer Size",
-        UUID("ADAF0A01-C332-42A8-93BD-25E905756CB8"): "Adafruit Color",
-        UUID("ADAF0B01-C332-42A8-93BD-25E905756CB8"): "Adafruit Sound Samples",
-        UUID("ADAF0B02-C332-42A8-93BD-25E905756CB8"): "Adafruit Number of Channels",
-        UUID("ADAF0C01-C332-42A8-93BD-25E905756CB8"): "Adafruit Tone",
-        UUID("ADAF0D01-C332-42A8-93BD-25E905756CB8"): "Adafruit Quaternions",
-        UUID("ADAF0D02-C332-42A8-93BD-25E905756CB8"): "Adafruit Calibration In",
-        UUID("ADAF0D03-C332-42A8-93BD-25E905756CB8"): "Adafruit Calibration Out",
-        UUID("ADAF0E01-C332-42A8-93BD-25E905756CB8"): "Adafruit Proximity",
-        UUID("ADAF0100-4669-6C65-5472-616E73666572"): "Adafruit Version",
-        UUID("ADAF0200-4669-6C65-5472-616E73666572"): "Adafruit Raw TX/RX",
-        UUID(
-            "F000FFC1-0451-4000-B000-000000000000",
-        ): "Texas Instruments Image Identify",
-        UUID("F000FFC2-0451-4000-B000-000000000000"): "Texas Instruments Image Block",
-        UUID("F000FFC5-0451-4000-B000-000000000000"): "Texas Instruments OAD Control",
-        UUID("D083B2BD-BE16-4600-B397-61512CA2F5AD"): "Helium Hotspot Onboarding Key",
-        UUID("0A852C59-50D3-4492-BFD3-22FE58A24F01"): "Helium Hotspot Public Key",
-        UUID("D7515033-7E7B-45BE-803F-C8737B171A29"): "Helium Hotspot WiFi Services",
-        UUID("B833D34F-D871-422C-BF9E-8E6EC117D57E"): "Helium Hotspot Diagnostics",
-        UUID("9C4314F2-8A0C-45FD-A58D-D4A7E64C3A57"): "Helium Hotspot WiFi MAC Address",
-        UUID("180EFDEF-7579-4B4A-B2DF-72733B7FA2FE"): "Helium Hotspot Lights",
-        UUID("7731DE63-BC6A-4100-8AB1-89B2356B038B"): "Helium Hotspot WiFi SSID",
-        UUID("D435F5DE-01A4-4E7D-84BA-DFD347F60275"): "Helium Hotspot Assert Location",
-        UUID("DF3B16CA-C985-4DA2-A6D2-9B9B9ABDB858"): "Helium Hotspot Add Gateway",
-        UUID("398168AA-0111-4EC0-B1FA-171671270608"): "Helium Hotspot WiFi Connect",
-        UUID("E5866BD6-0288-4476-98CA-EF7DA6B4D289"): "Helium Hotspot Ethernet Online",
-        UUID("8CC6E0B3-98C5-40CC-B1D8-692940E6994B"): "Helium Hotspot WiFi Remove",
-        UUID(
-            "E125BDA4-6FB8-11EA-BC55-0242AC130003",
-        ): "Helium Hotspot WiFi Configured Services",
-        UUID(
-            "54220001-F6A5-4007-A371-722F4EBD8436",
-        ): "MDS Supported Features Characteristic",
-        UUID(
-            "54220002-F6A5-4007-A371-722F4EBD8436",
-        ): "MDS Device Identifier Characteristic",
-        UUID(
-            "54220003-F6A5-4007-A371-722F4EBD8436",
-        ): "MDS Device Data URI Characteristic",
-        UUID(
-            "54220004-F6A5-4007-A371-722F4EBD8436",
-        ): "MDS Device Authorization Characteristic",
-        UUID(
-            "54220005-F6A5-4007-A371-722F4EBD8436",
-        ): "MDS Device Data Export Characteristic",
+        0x00001524_1212_EFDE_1523_785FEABCD123: "Blinky Button State",
+        0x00001525_1212_EFDE_1523_785FEABCD123: "Blinky LED State",
+        0x00001531_1212_EFDE_1523_785FEABCD123: "Legacy DFU Control Point",
+        0x00001532_1212_EFDE_1523_785FEABCD123: "Legacy DFU Packet",
+        0x00001534_1212_EFDE_1523_785FEABCD123: "Legacy DFU Version",
+        0x8EC90001_F315_4F60_9FB8_838830DAEA50: "DFU Control Point",
+        0x8EC90002_F315_4F60_9FB8_838830DAEA50: "DFU Packet",
+        0x8EC90003_F315_4F60_9FB8_838830DAEA50: "Buttonless DFU Without Bonds",
+        0x8EC90004_F315_4F60_9FB8_838830DAEA50: "Buttonless DFU With Bonds",
+        0x8E400001_F315_4F60_9FB8_838830DAEA50: "Experimental Buttonless DFU",
+        0xDA2E7828_FBCE_4E01_AE9E_261174997C48: "SMP Characteristic",
+        0x932C32BD_0002_47A2_835A_A8D455B859DD: "Philips Hue Light On/Off Toggle",
+        0x932C32BD_0003_47A2_835A_A8D455B859DD: "Philips Hue Light Brightness Level",
+        0x932C32BD_0005_47A2_835A_A8D455B859DD: "Philips Hue Light Color",
+        0xEF680101_9B35_4933_9B10_52FFA9740042: "Thingy Device Name",
+        0xEF680102_9B35_4933_9B10_52FFA9740042: "Thingy Advertising Parameters",
+        0xEF680104_9B35_4933_9B10_52FFA9740042: "Thingy Connection Parameters",
+        0xEF680105_9B35_4933_9B10_52FFA9740042: "Thingy Eddystone URL",
+        0xEF680106_9B35_4933_9B10_52FFA9740042: "Thingy Cloud Token",
+        0xEF680107_9B35_4933_9B10_52FFA9740042: "Thingy FW Version",
+        0xEF680108_9B35_4933_9B10_52FFA9740042: "Thingy MTU Request",
+        0xEF680201_9B35_4933_9B10_52FFA9740042: "Thingy Temperature",
+        0xEF680202_9B35_4933_9B10_52FFA9740042: "Thingy Pressure",
+        0xEF680203_9B35_4933_9B10_52FFA9740042: "Thingy Humidity",
+        0xEF680204_9B35_4933_9B10_52FFA9740042: "Thingy Air Quality",
+        0xEF680205_9B35_4933_9B10_52FFA9740042: "Thingy Color",
+        0xEF680206_9B35_4933_9B10_52FFA9740042: "Thingy Configuration",
+        0xEF680301_9B35_4933_9B10_52FFA9740042: "Thingy LED State",
+        0xEF680302_9B35_4933_9B10_52FFA9740042: "Thingy Button State",
+        0xEF680303_9B35_4933_9B10_52FFA9740042: "Thingy EXT Pin",
+        0xEF680401_9B35_4933_9B10_52FFA9740042: "Thingy Motion Config",
+        0xEF680402_9B35_4933_9B10_52FFA9740042: "Thingy Tap",
+        0xEF680403_9B35_4933_9B10_52FFA9740042: "Thingy Orientation",
+        0xEF680404_9B35_4933_9B10_52FFA9740042: "Thingy Quaternion",
+        0xEF680405_9B35_4933_9B10_52FFA9740042: "Thingy Pedometer",
+        0xEF680406_9B35_4933_9B10_52FFA9740042: "Thingy Raw Data",
+        0xEF680407_9B35_4933_9B10_52FFA9740042: "Thingy Euler",
+        0xEF680408_9B35_4933_9B10_52FFA9740042: "Thingy Rotation Matrix",
+        0xEF680409_9B35_4933_9B10_52FFA9740042: "Thingy Heading",
+        0xEF68040A_9B35_4933_9B10_52FFA9740042: "Thingy Gravity Vector",
+        0xEF680501_9B35_4933_9B10_52FFA9740042: "Thingy Sound Config",
+        0xEF680502_9B35_4933_9B10_52FFA9740042: "Thingy Speaker Data",
+        0xEF680503_9B35_4933_9B10_52FFA9740042: "Thingy Speaker Status",
+        0xEF680504_9B35_4933_9B10_52FFA9740042: "Thingy Microphone",
+        0x6E400002_B5A3_F393_E0A9_E50E24DCCA9E: "UART RX Characteristic",
+        0x6E400003_B5A3_F393_E0A9_E50E24DCCA9E: "UART TX Characteristic",
+        0x57A70001_9350_11ED_A1EB_0242AC120002: "Status Characteristic",
+        0xE2A00002_EC31_4EC3_A97A_1C34D87E9878: "Edge Impulse Remote Management RX Characteristic",
+        0xE2A00003_EC31_4EC3_A97A_1C34D87E9878: "Edge Impulse Remote Management TX Characteristic",
+        0xA3C87501_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Capabilities",
+        0xA3C87502_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Active Slot",
+        0xA3C87503_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Advertising Interval",
+        0xA3C87504_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Radio Tx Power",
+        0xA3C87505_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone (Advanced) Advertised Tx Power",
+        0xA3C87506_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Lock State",
+        0xA3C87507_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Unlock",
+        0xA3C87508_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Public ECDH Key",
+        0xA3C87509_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone EID Identity Key",
+        0xA3C8750A_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone ADV Slot Data",
+        0xA3C8750B_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Advanced Factory Reset",
+        0xA3C8750C_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone (Advanced) Remain Connectable",
+        0xFE2C1233_8366_4814_8EB0_01DE32100BEA: "Fast Pair Model ID",
+        0xFE2C1234_8366_4814_8EB0_01DE32100BEA: "Fast Pair Key-based Pairing",
+        0xFE2C1235_8366_4814_8EB0_01DE32100BEA: "Fast Pair Passkey",
+        0xFE2C1236_8366_4814_8EB0_01DE32100BEA: "Fast Pair Account Key",
+        0xFE2C1237_8366_4814_8EB0_01DE32100BEA: "Fast Pair Data",
+        0x9FBF120D_6301_42D9_8C58_25E699A21DBD: "Apple Notification Source",
+        0x69D1D8F3_45E1_49A8_9821_9BBDFDAAD9D9: "Apple Control Point",
+        0x22EAC6E9_24D6_4BB5_BE44_B36ACE7C7BFB: "Apple Data Source",
+        0x9B3C81D8_57B1_4A8A_B8DF_0E56F7CA51C2: "Apple Remote Command",
+        0x2F7CABCE_808D_411F_9A0C_BB92BA96C102: "Apple Entity Update",
+        0xC6B2F38C_23AB_46D8_A6AB_A3A870BBD5D7: "Apple Entity Attribute",
+        0x7DFC6001_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6002_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6003_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6004_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6005_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6101_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6102_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6103_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6104_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6105_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6106_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6107_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6108_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6201_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6202_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC6203_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC8003_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7004_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7005_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7006_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7007_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7008_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7009_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC700A_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC700B_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC700C_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7103_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7104_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7105_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7106_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7107_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7108_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC7109_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC710B_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC710C_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC710D_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC8004_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0x7DFC9001_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Characteristic",
+        0xE95DCA4B_251D_470A_A062_FA1922DFA9A8: "micro:bit Accelerometer Data",
+        0xE95DFB24_251D_470A_A062_FA1922DFA9A8: "micro:bit Accelerometer Period",
+        0xE95DFB11_251D_470A_A062_FA1922DFA9A8: "micro:bit Magnetometer Data",
+        0xE95D386C_251D_470A_A062_FA1922DFA9A8: "micro:bit Magnetometer Period",
+        0xE95D9715_251D_470A_A062_FA1922DFA9A8: "micro:bit Magnetometer Bearing",
+        0xE95DDA90_251D_470A_A062_FA1922DFA9A8: "micro:bit Button A State",
+        0xE95DDA91_251D_470A_A062_FA1922DFA9A8: "micro:bit Button B State",
+        0xE95D8D00_251D_470A_A062_FA1922DFA9A8: "micro:bit Pin Data",
+        0xE95D5899_251D_470A_A062_FA1922DFA9A8: "micro:bit Pin AD Configuration",
+        0xE95DB9FE_251D_470A_A062_FA1922DFA9A8: "micro:bit Pin I/O Configuration",
+        0xE95DD822_251D_470A_A062_FA1922DFA9A8: "micro:bit PWM Control",
+        0xE95D7B77_251D_470A_A062_FA1922DFA9A8: "micro:bit LED Matrix State",
+        0xE95D93EE_251D_470A_A062_FA1922DFA9A8: "micro:bit LED Text",
+        0xE95D0D2D_251D_470A_A062_FA1922DFA9A8: "micro:bit Scrolling Delay",
+        0xE95DB84C_251D_470A_A062_FA1922DFA9A8: "micro:bit Requirements",
+        0xE95D9775_251D_470A_A062_FA1922DFA9A8: "micro:bit Event",
+        0xE95D23C4_251D_470A_A062_FA1922DFA9A8: "micro:bit Client Requirements",
+        0xE95D5404_251D_470A_A062_FA1922DFA9A8: "micro:bit Client Event",
+        0xE95D93B1_251D_470A_A062_FA1922DFA9A8: "micro:bit DFU Control",
+        0xE95D9250_251D_470A_A062_FA1922DFA9A8: "micro:bit Temperature",
+        0xE95D1B25_251D_470A_A062_FA1922DFA9A8: "micro:bit Temperature Period",
+        0x00001624_1212_EFDE_1623_785FEABCD123: "LEGO® Wireless Protocol v3 Hub Characteristic",
+        0x00001626_1212_EFDE_1623_785FEABCD123: "LEGO® Wireless Protocol v3 Bootloader Characteristic",
+        0xADAF0001_C332_42A8_93BD_25E905756CB8: "Adafruit Sensor Measurement Period",
+        0xADAF0002_C332_42A8_93BD_25E905756CB8: "Adafruit Sensor Service Version",
+        0xADAF0101_C332_42A8_93BD_25E905756CB8: "Adafruit Temperature",
+        0xADAF0201_C332_42A8_93BD_25E905756CB8: "Adafruit Acceleration",
+        0xADAF0301_C332_42A8_93BD_25E905756CB8: "Adafruit Light Level",
+        0xADAF0401_C332_42A8_93BD_25E905756CB8: "Adafruit Gyro",
+        0xADAF0501_C332_42A8_93BD_25E905756CB8: "Adafruit Magnetic",
+        0xADAF0601_C332_42A8_93BD_25E905756CB8: "Adafruit Pressed",
+        0xADAF0701_C332_42A8_93BD_25E905756CB8: "Adafruit Humidity",
+        0xADAF0801_C332_42A8_93BD_25E905756CB8: "Adafruit Pressure",
+        0xADAF0901_C332_42A8_93BD_25E905756CB8: "Adafruit Pixel Pin",
+        0xADAF0902_C332_42A8_93BD_25E905756CB8: "Adafruit Pixel Pin Type",
+        0xADAF0903_C332_42A8_93BD_25E905756CB8: "Adafruit Pixel Data",
+        0xADAF0904_C332_42A8_93BD_25E905756CB8: "Adafruit Pixel Buffer Size",
+        0xADAF0A01_C332_42A8_93BD_25E905756CB8: "Adafruit Color",
+        0xADAF0B01_C332_42A8_93BD_25E905756CB8: "Adafruit Sound Samples",
+        0xADAF0B02_C332_42A8_93BD_25E905756CB8: "Adafruit Number of Channels",
+        0xADAF0C01_C332_42A8_93BD_25E905756CB8: "Adafruit Tone",
+        0xADAF0D01_C332_42A8_93BD_25E905756CB8: "Adafruit Quaternions",
+        0xADAF0D02_C332_42A8_93BD_25E905756CB8: "Adafruit Calibration In",
+        0xADAF0D03_C332_42A8_93BD_25E905756CB8: "Adafruit Calibration Out",
+        0xADAF0E01_C332_42A8_93BD_25E905756CB8: "Adafruit Proximity",
+        0xADAF0100_4669_6C65_5472_616E73666572: "Adafruit Version",
+        0xADAF0200_4669_6C65_5472_616E73666572: "Adafruit Raw TX/RX",
+        0xF000FFC1_0451_4000_B000_000000000000: "Texas Instruments Image Identify",
+        0xF000FFC2_0451_4000_B000_000000000000: "Texas Instruments Image Block",
+        0xF000FFC5_0451_4000_B000_000000000000: "Texas Instruments OAD Control",
+        0xD083B2BD_BE16_4600_B397_61512CA2F5AD: "Helium Hotspot Onboarding Key",
+        0x0A852C59_50D3_4492_BFD3_22FE58A24F01: "Helium Hotspot Public Key",
+        0xD7515033_7E7B_45BE_803F_C8737B171A29: "Helium Hotspot WiFi Services",
+        0xB833D34F_D871_422C_BF9E_8E6EC117D57E: "Helium Hotspot Diagnostics",
+        0x9C4314F2_8A0C_45FD_A58D_D4A7E64C3A57: "Helium Hotspot WiFi MAC Address",
+        0x180EFDEF_7579_4B4A_B2DF_72733B7FA2FE: "Helium Hotspot Lights",
+        0x7731DE63_BC6A_4100_8AB1_89B2356B038B: "Helium Hotspot WiFi SSID",
+        0xD435F5DE_01A4_4E7D_84BA_DFD347F60275: "Helium Hotspot Assert Location",
+        0xDF3B16CA_C985_4DA2_A6D2_9B9B9ABDB858: "Helium Hotspot Add Gateway",
+        0x398168AA_0111_4EC0_B1FA_171671270608: "Helium Hotspot WiFi Connect",
+        0xE5866BD6_0288_4476_98CA_EF7DA6B4D289: "Helium Hotspot Ethernet Online",
+        0x8CC6E0B3_98C5_40CC_B1D8_692940E6994B: "Helium Hotspot WiFi Remove",
+        0xE125BDA4_6FB8_11EA_BC55_0242AC130003: "Helium Hotspot WiFi Configured Services",
+        0x54220001_F6A5_4007_A371_722F4EBD8436: "MDS Supported Features Characteristic",
+        0x54220002_F6A5_4007_A371_722F4EBD8436: "MDS Device Identifier Characteristic",
+        0x54220003_F6A5_4007_A371_722F4EBD8436: "MDS Device Data URI Characteristic",
+        0x54220004_F6A5_4007_A371_722F4EBD8436: "MDS Device Authorization Characteristic",
+        0x54220005_F6A5_4007_A371_722F4EBD8436: "MDS Device Data Export Characteristic",
     },
 )
@@ -0,0 +1,36053 @@
+"""Module with precomputed indexes of the Bluetooth numbers.
+
+This module is generated together with the modules with the numbers. It's only imported
+when one of its indexes is needed.
+"""
+# fmt: off
+from __future__ import annotations
+
+OUIS: dict[int, int] = {  # OUIs as 24-bit unsigned integers and their vendor ID
+    0x286FB9: 0,
+    0x08EA44: 1,
+    0xF4EAB5: 1,
+    0xB87CF2: 1,
+    0xE0A129: 1,
+    0xA8C647: 1,
+    0xA473AB: 1,
+    0x0C9B78: 1,
+    0xA4C7F6: 1,
+    0xB42D56: 1,
+    0x887E25: 1,
+    0x001977: 1,
+    0x38E2CA: 2,
+    0xB05B99: 3,
+    0xE80AB9: 4,
+    0x78465F: 5,
+    0x9075DE: 6,
+    0x80BA16: 7,
+    0x10E992: 8,
+    0x78F276: 9,
+    0x20F83B: 10,
+    0xF01B24: 11,
+    0xB84C87: 12,
+    0xE4F14C: 13,
+    0x10061C: 14,
+    0xE00630: 15,
+    0x04D168: 16,
+    0x644C69: 17,
+    0xDCD160: 18,
+    0x644ED7: 19,
+    0x9CE330: 20,
+    0x04A959: 21,
+    0x0CB983: 22,
+    0x2CB301: 22,
+    0x000E72: 23,
+    0xE0C2B7: 24,
+    0xC88BE8: 24,
+    0xE4C767: 25,
+    0x902D77: 26,
+    0x6CFBED: 27,
+    0xE4F27C: 28,
+    0xDC7CF7: 29,
+    0x906C4B: 30,
+    0xD48AFC: 14,
+    0xE465B8: 14,
+    0xE001C7: 31,
+    0xB4DF91: 20,
+    0x98EE8C: 11,
+    0xFC500C: 32,
+    0x50E478: 33,
+    0x90C710: 11,
+    0x48D475: 34,
+    0x601AC7: 35,
+    0x48DA35: 12,
+    0xA881FE: 36,
+    0x649A08: 37,
+    0x50F222: 38,
+    0x307A57: 39,
+    0xCCEB5E: 40,
+    0x60C78D: 28,
+    0xDC5193: 11,
+    0x7478A6: 41,
+    0x001982: 42,
+    0x50FE0C: 43,
+    0xBCFD0C: 44,
+    0x1865C7: 45,
+    0x0C01C8: 46,
+    0xF42E48: 11,
+    0xACD75B: 3,
+    0xB4C2E0: 47,
+    0x040986: 48,
+    0x481BA4: 4,
+    0xF0EE7A: 49,
+    0x203AEB: 11,
+    0x5876B3: 50,
+    0xE87072: 51,
+    0xD8DAF1: 15,
+    0x54443B: 15,
+    0x5C7075: 15,
+    0xCC03FA: 52,
+    0x48F7C0: 52,
+    0x480033: 52,
+    0x14987D: 52,
+    0x58238C: 52,
+    0x80B234: 52,
+    0x8417EF: 52,
+    0xA456CC: 52,
+    0x70037E: 52,
+    0x441C12: 52,
+    0x5C7695: 52,
+    0xAC4CA5: 52,
+    0x00CB7A: 52,
+    0xF8D2AC: 52,
+    0xCCF3C8: 52,
+    0x40F3B0: 53,
+    0x149CEF: 53,
+    0x80C41B: 53,
+    0x3468B5: 53,
+    0x58AD12: 49,
+    0x60FDA6: 49,
+    0x80A997: 49,
+    0x348C5E: 49,
+    0xD0B2C4: 52,
+    0x80C6AB: 52,
+    0x383FB3: 52,
+    0x641236: 52,
+    0x0C75D2: 54,
+    0xD87766: 55,
+    0xB8A75E: 56,
+    0x8C53E6: 57,
+    0x345E08: 58,
+    0x708185: 21,
+    0x50D33B: 59,
+    0x84C8A0: 31,
+    0xC0E911: 60,
+    0x8C3B4A: 61,
+    0xA88B28: 62,
+    0x08F01E: 63,
+    0x18A5FF: 48,
+    0x8C1AF3: 64,
+    0xF4B6C6: 65,
+    0x6C03B5: 4,
+    0x58C41E: 12,
+    0xA89162: 66,
+    0x709883: 67,
+    0xF43A7B: 11,
+    0x689E29: 11,
+    0xC87023: 68,
+    0xE44097: 69,
+    0xDCB4CA: 69,
+    0x8CD54A: 70,
+    0xA002A5: 25,
+    0xACC048: 71,
+    0x408432: 72,
+    0x88B5FF: 73,
+    0x44D5C1: 38,
+    0x943BB1: 74,
+    0x44F034: 74,
+    0x888F10: 75,
+    0xC4799F: 76,
+    0x842859: 77,
+    0x5016F4: 78,
+    0x3C08CD: 28,
+    0x68505D: 79,
+    0x7C6A8A: 80,
+    0x90ECE3: 81,
+    0x887B2C: 11,
+    0x60DBEF: 82,
+    0x0016F6: 83,
+    0x40B7FC: 84,
+    0x682C4F: 85,
+    0x68DDB7: 86,
+    0x14D864: 86,
+    0xB851A9: 81,
+    0xD077CE: 87,
+    0xECAFF9: 88,
+    0xFC59C0: 89,
+    0x641B2F: 90,
+    0x9C73B1: 90,
+    0x388A06: 90,
+    0xB0D888: 91,
+    0x28EC22: 63,
+    0x40D4F6: 22,
+    0x7C3180: 92,
+    0x905607: 33,
+    0x483133: 93,
+    0xB8AB61: 20,
+    0x40ED00: 94,
+    0x782DAD: 15,
+    0xD06158: 15,
+    0x244BF1: 15,
+    0x60152B: 95,
+    0x44D77E: 96,
+    0x908855: 4,
+    0x687161: 4,
+    0x883F37: 97,
+    0x0080B8: 98,
+    0x2873F6: 77,
+    0xC4EBFF: 11,
+    0x4893DC: 99,
+    0x5CE688: 100,
+    0x5C2886: 101,
+    0xD4BAFA: 69,
+    0x4CEC0F: 4,
+    0x843E1D: 31,
+    0xE0CB1D: 77,
+    0xFC84A7: 102,
+    0x3CCB4D: 103,
+    0x601B52: 104,
+    0x24A42C: 105,
+    0x702F86: 106,
+    0xC08F20: 107,
+    0x08FF24: 107,
+    0x90B67A: 107,
+    0x249AC8: 107,
+    0xA8881F: 108,
+    0x005079: 13,
+    0x28C01B: 107,
+    0xE028B1: 107,
+    0x303180: 107,
+    0x201582: 49,
+    0x40921A: 49,
+    0x10E2C9: 49,
+    0x0436B8: 109,
+    0xD0431E: 110,
+    0xF0A0B1: 15,
+    0x404F42: 15,
+    0x3086F1: 5,
+    0x00C04F: 110,
+    0x00B0D0: 110,
+    0x0019B9: 110,
+    0x001AA0: 110,
+    0x002564: 110,
+    0xA4BADB: 110,
+    0x38A851: 111,
+    0x00CB00: 13,
+    0x1100AA: 13,
+    0x9C93E4: 13,
+    0x782BCB: 110,
+    0x14FEB5: 110,
+    0x180373: 110,
+    0x74867A: 110,
+    0x204747: 110,
+    0x000BDB: 110,
+    0x00123F: 110,
+    0xA41F72: 110,
+    0x001C23: 110,
+    0x847BEB: 110,
+    0x989096: 110,
+    0x801844: 110,
+    0x9840BB: 110,
+    0xD481D7: 110,
+    0xF80DA9: 112,
+    0x54BF64: 110,
+    0xCCC5E5: 110,
+    0x4CD98F: 110,
+    0xDCF401: 110,
+    0x6C2B59: 110,
+    0xC8F750: 110,
+    0x98E743: 110,
+    0x185A58: 110,
+    0xD08E79: 110,
+    0xB44506: 110,
+    0x485A0D: 28,
+    0xE0D848: 110,
+    0x04BF1B: 110,
+    0x581031: 113,
+    0xAC919B: 57,
+    0xE03C1C: 12,
+    0x000993: 114,
+    0xEC41CA: 115,
+    0x148477: 21,
+    0x14962D: 21,
+    0xC4A64E: 116,
+    0x7066B9: 117,
+    0xC4A1AE: 117,
+    0x486F33: 118,
+    0x442063: 119,
+    0x086195: 120,
+    0x24BBC9: 37,
+    0x0000BC: 120,
+    0xFCD749: 77,
+    0xA87116: 121,
+    0xE8EBDD: 122,
+    0x548C81: 54,
+    0x244845: 54,
+    0x0050CA: 123,
+    0x74EE8D: 124,
+    0xD858C6: 125,
+    0x2CC6A0: 126,
+    0xECC89C: 54,
+    0x8CE748: 54,
+    0x2428FD: 54,
+    0xACB92F: 54,
+    0xD4E853: 54,
+    0x240F9B: 54,
+    0xC06DED: 54,
+    0x2432AE: 54,
+    0xE0BAAD: 54,
+    0xE0CA3C: 54,
+    0xDC07F8: 54,
+    0x64DB8B: 54,
+    0x94E1AC: 54,
+    0x5803FB: 54,
+    0x4447CC: 54,
+    0x98DF82: 54,
+    0xC056E3: 54,
+    0xBCAD28: 54,
+    0x88B6BD: 127,
+    0x2C9682: 128,
+    0xBC49B2: 129,
+    0x9497AE: 69,
+    0x0CBD75: 69,
+    0xAC9073: 15,
+    0x000351: 130,
+    0xF09FC2: 131,
+    0x802AA8: 131,
+    0xFC1D3A: 15,
+    0xE4BEFB: 15,
+    0x58F8D7: 15,
+    0x788A20: 131,
+    0x7483C2: 131,
+    0xE063DA: 131,
+    0x245A4C: 131,
+    0x602232: 131,
+    0xE43883: 131,
+    0x788CB5: 94,
+    0x84B59C: 28,
+    0x5C4527: 28,
+    0xEC3EF7: 28,
+    0x002159: 28,
+    0x00239C: 28,
+    0x50C58D: 28,
+    0x28C0DA: 28,
+    0x288A1C: 28,
+    0xB8EA98: 40,
+    0x10C4CA: 132,
+    0xAC800A: 133,
+    0x40A677: 28,
+    0xD818D3: 28,
+    0xF04B3A: 28,
+    0xC042D0: 28,
+    0x001BC0: 28,
+    0x44ECCE: 28,
+    0xCCE194: 28,
+    0xE45D37: 28,
+    0x94F7AD: 28,
+    0x784F9B: 28,
+    0x88D98F: 28,
+    0x78507C: 28,
+    0xF07CC7: 28,
+    0x000585: 28,
+    0x889009: 28,
+    0x00CC34: 28,
+    0xE030F9: 28,
+    0x204E71: 28,
+    0xD404FF: 28,
+    0x84C1C1: 28,
+    0x4C734F: 28,
+    0xD45A3F: 28,
+    0x04698F: 28,
+    0x58C935: 134,
+    0x7CE2CA: 28,
+    0xA4A528: 135,
+    0xE878EE: 21,
+    0xECA7AD: 136,
+    0x00302B: 137,
+    0xF0748D: 138,
+    0x48814E: 139,
+    0x7C4D8F: 19,
+    0x9CCBF7: 140,
+    0x74D558: 69,
+    0xF46412: 141,
+    0x3CF9F0: 11,
+    0x6877DA: 11,
+    0x8858BE: 142,
+    0x44DBD2: 143,
+    0xE0DCA0: 144,
+    0x1C3B62: 145,
+    0x5C64F1: 4,
+    0x9CDBAF: 15,
+    0x0C2E57: 15,
+    0xE8D775: 15,
+    0x64EC65: 146,
+    0xF42462: 147,
+    0xF4A17F: 148,
+    0x48BCE1: 90,
+    0xB838EF: 149,
+    0x084218: 150,
+    0xD85B22: 151,
+    0xD0D003: 90,
+    0x5C76D5: 81,
+    0x8C7A00: 81,
+    0xA4FC14: 49,
+    0xA81AF1: 49,
+    0x705846: 152,
+    0x0891A3: 77,
+    0x0CD923: 153,
+    0x84398F: 41,
+    0xB4EDD5: 116,
+    0x2CD1C6: 102,
+    0xB85CEE: 154,
+    0xCC08FA: 49,
+    0x909B6F: 49,
+    0x7473B4: 49,
+    0xF83C80: 155,
+    0xD83ADD: 156,
+    0x70F8AE: 157,
+    0x000F2A: 158,
+    0xBC64D9: 69,
+    0x301F48: 11,
+    0x7CC74A: 5,
+    0x38FC34: 117,
+    0x3CF692: 117,
+    0x940EE7: 15,
+    0xA8B271: 15,
+    0x6405E4: 159,
+    0xDCAC6F: 160,
+    0xF41532: 161,
+    0x2CAB33: 53,
+    0x28B5E8: 53,
+    0x08C3B3: 162,
+    0x204569: 163,
+    0xD46352: 164,
+    0xD821DA: 165,
+    0x08F1B3: 20,
+    0xBCE8FA: 69,
+    0x505A65: 43,
+    0xC4A559: 12,
+    0x6C0C9A: 77,
+    0xCC00F1: 3,
+    0x308216: 49,
+    0x8CD0B2: 166,
+    0xC4A052: 78,
+    0x84900A: 48,
+    0x787689: 63,
+    0x8076C2: 167,
+    0xF04A3D: 168,
+    0x941FA2: 169,
+    0xB49DFD: 170,
+    0xF41A9C: 40,
+    0x001AEB: 171,
+    0xDC0682: 172,
+    0x44D267: 173,
+    0xB0BC7A: 174,
+    0x487706: 175,
+    0x0CCC47: 12,
+    0x5C3E06: 4,
+    0xC828E5: 4,
+    0xB0FC88: 3,
+    0x34873D: 116,
+    0xC44137: 116,
+    0x6CD199: 146,
+    0xD040BE: 176,
+    0x10D680: 177,
+    0x784946: 178,
+    0x003E73: 179,
+    0x0CFC18: 15,
+    0xF44DAD: 180,
+    0x80AB4D: 181,
+    0x4CBA7D: 182,
+    0x500238: 0,
+    0xACAD4B: 11,
+    0xA8169D: 31,
+    0xF0221D: 12,
+    0x9C5440: 183,
+    0x5026EF: 102,
+    0x444988: 25,
+    0xFC9189: 135,
+    0x1C1A1B: 184,
+    0x8038D4: 185,
+    0x7C296F: 49,
+    0x40EDCF: 49,
+    0x74057C: 186,
+    0x8C986B: 49,
+    0x1C8682: 49,
+    0x8054E3: 49,
+    0x102E00: 25,
+    0x203A43: 25,
+    0x3C3B99: 163,
+    0xFC3357: 187,
+    0x9CDE4D: 188,
+    0xF8F0C5: 189,
+    0xF8DE73: 15,
+    0xEC1A02: 15,
+    0x902778: 190,
+    0x68418F: 191,
+    0xBC9EBB: 35,
+    0xD009C8: 4,
+    0xD03957: 192,
+    0x48E729: 14,
+    0xE8BAE2: 193,
+    0x5CA06C: 194,
+    0xA83B76: 195,
+    0x40E11C: 196,
+    0x44643C: 4,
+    0x24161B: 4,
+    0xA8400B: 114,
+    0x20318D: 197,
+    0x3CB07E: 198,
+    0xC04E8A: 15,
+    0x08569B: 199,
+    0x081AFD: 117,
+    0xC0BFAC: 117,
+    0x44272E: 117,
+    0x106650: 200,
+    0xA80C03: 201,
+    0x90DAF9: 202,
+    0xF8009D: 203,
+    0x201642: 157,
+    0x8C946A: 21,
+    0xFC1165: 204,
+    0xCC8DB5: 37,
+    0xACEE64: 37,
+    0x0012F3: 205,
+    0x547068: 206,
+    0xC84052: 207,
+    0x68EE4B: 208,
+    0x48C35A: 209,
+    0xC461C7: 157,
+    0xACCB36: 5,
+    0x60706C: 210,
+    0xC82ADD: 210,
+    0x240935: 90,
+    0xB4DB91: 211,
+    0xC48372: 12,
+    0xC0A5E8: 25,
+    0x906584: 25,
+    0x28C5D2: 25,
+    0xE48C73: 194,
+    0x2CB6C8: 212,
+    0xD834D1: 213,
+    0x842289: 90,
+    0x84AAA4: 214,
+    0x883C93: 215,
+    0xFCDF00: 167,
+    0xE8BFDB: 216,
+    0x287E80: 31,
+    0x0C9F71: 217,
+    0x1C8B76: 218,
+    0x745889: 219,
+    0xE8FF98: 117,
+    0x241551: 117,
+    0x58957E: 117,
+    0x2C9452: 15,
+    0x6001B1: 15,
+    0xB8144D: 49,
+    0xEC28D3: 49,
+    0x5CBBEE: 11,
+    0x086518: 49,
+    0x2C57CE: 49,
+    0x80398C: 90,
+    0x980D6F: 90,
+    0x1C90FF: 220,
+    0x10823D: 138,
+    0x982044: 21,
+    0xD8A0E8: 11,
+    0x80563C: 221,
+    0xA044F3: 222,
+    0xF42B7D: 223,
+    0x8C5219: 224,
+    0x2C9E00: 141,
+    0xDC6AE7: 40,
+    0x7CA449: 40,
+    0xD0066A: 225,
+    0x883CC5: 12,
+    0xC404D8: 226,
+    0xAC965B: 227,
+    0x089115: 77,
+    0x74D423: 77,
+    0xE04735: 228,
+    0x909877: 229,
+    0xECA138: 77,
+    0xE0EF02: 230,
+    0x4CA3A7: 231,
+    0xB067B5: 49,
+    0x5C5284: 49,
+    0xC0956D: 49,
+    0x3C39C8: 49,
+    0xA8ABB5: 49,
+    0x5864C4: 49,
+    0x40A53B: 81,
+    0x74803F: 232,
+    0x900A62: 233,
+    0x505FB5: 234,
+    0x88DE7C: 234,
+    0x045747: 235,
+    0x5C60BA: 19,
+    0xBCF88B: 11,
+    0x68539D: 38,
+    0x0443FD: 135,
+    0xA4897E: 236,
+    0xBCD767: 237,
+    0xEC1D9E: 116,
+    0x081A1E: 73,
+    0x80646F: 14,
+    0x3CA7AE: 11,
+    0xAC3184: 117,
+    0x503F50: 117,
+    0x2C691D: 12,
+    0xCC29BD: 11,
+    0x385CFB: 238,
+    0xC43D1A: 25,
+    0x04E8B9: 25,
+    0xE02E0B: 25,
+    0xE8CC8C: 239,
+    0xE46564: 240,
+    0x3CE064: 53,
+    0xE0928F: 53,
+    0xCC037B: 53,
+    0x581CF8: 25,
+    0xAC198E: 25,
+    0xC85EA9: 25,
+    0xC8BF4C: 166,
+    0x7CDE78: 21,
+    0xB8FBAF: 241,
+    0x348518: 14,
+    0xE051D8: 242,
+    0x549A11: 12,
+    0xECE6A2: 5,
+    0xAC84C6: 86,
+    0x1C0ED3: 135,
+    0x380A4F: 243,
+    0xA0CDF3: 102,
+    0xAC5AF0: 244,
+    0xECA62F: 15,
+    0x0CBEF1: 117,
+    0xAC936A: 117,
+    0x38A44B: 117,
+    0x801970: 90,
+    0x5C53C3: 50,
+    0xB48A0A: 14,
+    0xC83A1B: 245,
+    0xE0F728: 77,
+    0x242934: 210,
+    0x3822F4: 117,
+    0x8002F4: 12,
+    0x149BF3: 69,
+    0x10071D: 5,
+    0xC8C13C: 246,
+    0xB850D8: 166,
+    0xF4B3B1: 238,
+    0xC09F51: 165,
+    0x10B232: 247,
+    0x8470D7: 63,
+    0x581DD8: 3,
+    0x30D587: 90,
+    0x14F592: 248,
+    0x4C09FA: 249,
+    0x242CFE: 250,
+    0xA042D1: 117,
+    0x58879F: 117,
+    0x9C1FCA: 251,
+    0x2CDC78: 252,
+    0x68A7B4: 22,
+    0x803C20: 15,
+    0xA4DD58: 15,
+    0xE8D87E: 77,
+    0x78034F: 81,
+    0x9C57BC: 63,
+    0x0015A6: 253,
+    0xA8A237: 48,
+    0xF8AB82: 40,
+    0xEC30B3: 40,
+    0x08E63B: 11,
+    0x88C174: 11,
+    0xC89E61: 254,
+    0x902CFB: 255,
+    0x1CAF4A: 90,
+    0xC8120B: 90,
+    0x6C1524: 12,
+    0xC08D51: 77,
+    0x44B4B2: 77,
+    0xACCCFC: 77,
+    0xE8DC6C: 4,
+    0xB03F64: 49,
+    0x2C8217: 49,
+    0x142D4D: 49,
+    0xEC42CC: 49,
+    0xB8211C: 49,
+    0x28BE43: 146,
+    0x2CFC8B: 69,
+    0x002604: 256,
+    0xF8AD24: 194,
+    0xA8C98A: 21,
+    0xE0276C: 257,
+    0xDC8E95: 238,
+    0x90935A: 258,
+    0xAC8FA9: 181,
+    0x000AD0: 259,
+    0x7CEF40: 260,
+    0xC0E01C: 261,
+    0xAC51AB: 15,
+    0x48CDD3: 15,
+    0xCC6618: 262,
+    0x44291E: 263,
+    0x24EBED: 15,
+    0x2874F5: 181,
+    0xA04466: 264,
+    0x446D7F: 77,
+    0x2406F2: 135,
+    0x6818D9: 265,
+    0x1C61B4: 94,
+    0x9CA2F4: 94,
+    0x18BC57: 149,
+    0xD8E2DF: 157,
+    0x388F30: 90,
+    0x6C0F61: 266,
+    0xC0C170: 37,
+    0x504289: 11,
+    0x84C692: 53,
+    0x6CB2FD: 53,
+    0x302BDC: 267,
+    0x90F7B2: 21,
+    0x1C47F6: 268,
+    0x000CD6: 269,
+    0x6C9308: 12,
+    0xE8EBD3: 270,
+    0xE881AB: 271,
+    0xD4BD4F: 272,
+    0x5CC9C0: 232,
+    0x8C1553: 273,
+    0x6CB158: 86,
+    0xB0A4F0: 15,
+    0x04E31A: 3,
+    0x7C6A60: 29,
+    0xB4695F: 274,
+    0x24753A: 69,
+    0xC85895: 78,
+    0x6C999D: 77,
+    0xC0060C: 15,
+    0x2C3341: 275,
+    0xAC567B: 276,
+    0x34D737: 277,
+    0xA8537D: 179,
+    0x303422: 63,
+    0xE4DADF: 278,
+    0x7C35F8: 250,
+    0xB05C16: 5,
+    0x08E021: 22,
+    0x9CC12D: 167,
+    0x7426FF: 11,
+    0xC42728: 11,
+    0x8CC7C3: 279,
+    0xE8D322: 4,
+    0xA0B4BF: 280,
+    0x7CC95E: 281,
+    0xD0EDFF: 282,
+    0x988FE0: 12,
+    0xF8A91F: 283,
+    0xC07982: 162,
+    0x080076: 284,
+    0x7CCCFC: 116,
+    0xDC8084: 49,
+    0x4CBAD7: 285,
+    0x34B883: 4,
+    0x80657C: 49,
+    0x2CFDB4: 286,
+    0x38C804: 31,
+    0xE007C2: 287,
+    0x18D793: 12,
+    0x102C8D: 167,
+    0xD8B673: 53,
+    0xB4F267: 288,
+    0xB0DD74: 289,
+    0xC0FBC1: 163,
+    0x9850A3: 290,
+    0xB48C9D: 43,
+    0x50B3B4: 291,
+    0x94E686: 14,
+    0xF828C9: 15,
+    0xFC1193: 15,
+    0xDC3643: 12,
+    0x50874D: 69,
+    0xA41752: 292,
+    0x00620B: 293,
+    0x40FE95: 21,
+    0x2CDD5F: 73,
+    0xA05394: 294,
+    0x04EEE8: 12,
+    0x9CB8B4: 295,
+    0x84B4DB: 238,
+    0x1C70C9: 296,
+    0x3CF7D1: 297,
+    0xDCCCE6: 90,
+    0xF065AE: 90,
+    0x5089D1: 117,
+    0xBCD074: 49,
+    0x0C1EF7: 298,
+    0xE85177: 247,
+    0x388A21: 299,
+    0xA45FB9: 300,
+    0x345D9E: 3,
+    0x000F32: 301,
+    0x18C23C: 302,
+    0x0475F9: 278,
+    0xE06D18: 303,
+    0x8CF8C5: 25,
+    0xA05950: 25,
+    0xD4354A: 304,
+    0x40E99B: 305,
+    0x90FFD6: 22,
+    0xCCA3BD: 163,
+    0xBCAF87: 306,
+    0xC02B31: 307,
+    0x58CF79: 14,
+    0x786299: 308,
+    0xCC5B31: 35,
+    0xC0280B: 22,
+    0x9CEA97: 22,
+    0xC89BAD: 22,
+    0xB4D286: 191,
+    0x08F80D: 12,
+    0x4CC449: 309,
+    0xBC455B: 90,
+    0xD42C46: 310,
+    0x1091A8: 14,
+    0x78047A: 311,
+    0xB03CDC: 25,
+    0x208097: 312,
+    0x7C1689: 3,
+    0x5C83CD: 313,
+    0x10E8A7: 57,
+    0x8415D3: 15,
+    0xD49400: 15,
+    0x384B24: 314,
+    0xF0AE66: 315,
+    0x3CA916: 117,
+    0xD46C6D: 258,
+    0xA0E7AE: 258,
+    0x806A00: 4,
+    0xA06C65: 53,
+    0x448502: 37,
+    0xF4A454: 12,
+    0x58FCC6: 316,
+    0xC41C07: 90,
+    0x4011C3: 90,
+    0xC47D9F: 90,
+    0xA4EF15: 263,
+    0x1C4586: 35,
+    0x185B00: 81,
+    0xA861DF: 29,
+    0x305A99: 135,
+    0x604DE1: 15,
+    0x704E6B: 15,
+    0x603D29: 15,
+    0x10A51D: 25,
+    0x589B4A: 317,
+    0x507C6F: 25,
+    0x98DD60: 49,
+    0xC04442: 49,
+    0xD468AA: 49,
+    0xF8C3CC: 49,
+    0x54C480: 15,
+    0xD866EE: 318,
+    0xF4573E: 5,
+    0x70C6DD: 21,
+    0x3C9EC7: 319,
+    0x088E90: 25,
+    0x282A87: 163,
+    0xA8B57C: 58,
+    0x2426BA: 320,
+    0xF06C73: 81,
+    0x9C756E: 321,
+    0xE8F9D4: 15,
+    0xB0C787: 15,
+    0x0C4F9B: 15,
+    0x482FD7: 15,
+    0x7C214A: 25,
+    0x508492: 25,
+    0x9880BB: 12,
+    0xB812DA: 322,
+    0xA0D7F3: 90,
+    0x7890A2: 11,
+    0xACBCD9: 4,
+    0xD8B053: 40,
+    0x6CF784: 40,
+    0x546CEB: 25,
+    0x009337: 25,
+    0x58CE2A: 25,
+    0x042B58: 323,
+    0xB43D08: 324,
+    0x7089F5: 325,
+    0x9431CB: 146,
+    0xB8208E: 326,
+    0x847B57: 25,
+    0x4006D5: 4,
+    0xC4CA2B: 89,
+    0x607DDD: 327,
+    0xAC5E14: 15,
+    0x20DF73: 15,
+    0x48128F: 15,
+    0x64CBE9: 285,
+    0x24D81E: 328,
+    0x90380C: 14,
+    0xBC2228: 329,
+    0x40CA63: 330,
+    0x40B0A1: 331,
+    0x103C59: 11,
+    0xD48A3B: 332,
+    0x6CDDEF: 333,
+    0x10B7A8: 334,
+    0x089BF1: 63,
+    0x78444A: 335,
+    0xD0F121: 336,
+    0x9C5636: 117,
+    0x947F1D: 337,
+    0xD0F520: 338,
+    0x70B64F: 339,
+    0xB89470: 218,
+    0xE4293D: 340,
+    0x70B9BB: 341,
+    0xB4205B: 69,
+    0xA4C69A: 90,
+    0x8CB87E: 25,
+    0x701AB8: 25,
+    0x5CDF89: 272,
+    0xB88C29: 167,
+    0x5444A3: 90,
+    0xD03F27: 342,
+    0x50297B: 29,
+    0x3003C8: 195,
+    0x089E84: 15,
+    0x1082D7: 194,
+    0x785EE8: 12,
+    0x9C40CD: 343,
+    0xD8BE1F: 49,
+    0x98502E: 49,
+    0x580AD4: 49,
+    0xA477F3: 49,
+    0xCCBCE3: 15,
+    0x088EDC: 49,
+    0xA84A28: 49,
+    0xBC6AD1: 40,
+    0x0845D1: 4,
+    0x18E215: 81,
+    0xEC1C5D: 344,
+    0x8427B6: 275,
+    0x807EB4: 37,
+    0x2CB8ED: 345,
+    0x500A52: 346,
+    0x54A9D4: 347,
+    0x000062: 348,
+    0xC8C9A3: 14,
+    0xE43BC9: 349,
+    0xE89526: 350,
+    0x104121: 351,
+    0xD49390: 352,
+    0xBC062D: 353,
+    0x3C93F4: 15,
+    0x6433B5: 12,
+    0x504B9E: 117,
+    0x047AAE: 117,
+    0x409CA6: 354,
+    0x8C4B14: 14,
+    0xD88083: 195,
+    0xFC4265: 250,
+    0x187758: 355,
+    0x44D454: 3,
+    0x6887C6: 4,
+    0x80248F: 4,
+    0x4C50F1: 69,
+    0xB4E454: 77,
+    0x0C43F9: 77,
+    0xD494FB: 356,
+    0x44A92C: 12,
+    0x84AC16: 49,
+    0x2CBC87: 49,
+    0x5078B0: 117,
+    0xE4072B: 117,
+    0x2446E4: 15,
+    0x50E7A0: 232,
+    0x90E868: 43,
+    0x68F0D0: 357,
+    0xFCA89B: 53,
+    0x98F07B: 53,
+    0xCC896C: 358,
+    0xA4FF95: 81,
+    0xD47350: 359,
+    0x70DA17: 360,
+    0x3861A5: 361,
+    0x78D3ED: 362,
+    0x8C1ED9: 363,
+    0x34B472: 14,
+    0xF80C58: 278,
+    0x50411C: 295,
+    0xF42679: 25,
+    0xB03795: 244,
+    0x3C7AF0: 163,
+    0x48F3F3: 154,
+    0x081C6E: 40,
+    0x508140: 19,
+    0xFC58DF: 364,
+    0x981082: 365,
+    0x38A659: 3,
+    0x781305: 12,
+    0x34243E: 11,
+    0x98ED7E: 63,
+    0x34FE9E: 366,
+    0x38453B: 272,
+    0x6450D6: 367,
+    0xF44637: 25,
+    0x0C718C: 274,
+    0x24085D: 368,
+    0xA848FA: 14,
+    0x505D7A: 11,
+    0xC41234: 49,
+    0x3CA6F6: 49,
+    0x681BEF: 15,
+    0xE4DC5F: 369,
+    0x4CAB4F: 49,
+    0x9C583C: 49,
+    0x000901: 370,
+    0xF463E7: 371,
+    0x88AEDD: 372,
+    0x7806C9: 117,
+    0xE8A6CA: 117,
+    0xCCFA66: 117,
+    0x68966A: 373,
+    0xA0E70B: 25,
+    0x04EEEE: 374,
+    0x1C3CD4: 15,
+    0xF4E451: 15,
+    0x482218: 375,
+    0xF88EA1: 87,
+    0x2C4881: 146,
+    0xE40CFD: 69,
+    0x58D697: 69,
+    0x30A176: 5,
+    0x48E7DA: 43,
+    0x047153: 165,
+    0x40C48C: 376,
+    0x5437BB: 278,
+    0x60F8F2: 377,
+    0xAC74B1: 25,
+    0xF46077: 53,
+    0xC03C04: 3,
+    0xA4D73C: 378,
+    0x000808: 379,
+    0x6C108B: 380,
+    0x4C7167: 381,
+    0x7C8530: 81,
+    0x24A799: 117,
+    0x7C3E74: 117,
+    0x148919: 382,
+    0x58FD5D: 383,
+    0x185207: 135,
+    0xE0C63C: 135,
+    0xF8BAE6: 81,
+    0xBCECA0: 384,
+    0xA45590: 40,
+    0x08010F: 135,
+    0xC0CC42: 135,
+    0x806559: 38,
+    0xD047C1: 385,
+    0x308E7A: 73,
+    0xB8A377: 4,
+    0xE44E2D: 4,
+    0x984265: 3,
+    0xDC215C: 25,
+    0xC42360: 25,
+    0x78D9E9: 386,
+    0x103D1C: 25,
+    0x3887D5: 25,
+    0x1CD107: 194,
+    0x9C1C37: 263,
+    0x2C0823: 387,
+    0xA8934A: 388,
+    0xC87B23: 389,
+    0x00047D: 390,
+    0x8C19B5: 48,
+    0x34AB95: 14,
+    0xC491CF: 391,
+    0xD89AC1: 81,
+    0xF0B11D: 81,
+    0x7CD9F4: 299,
+    0xA4D795: 392,
+    0x84AB26: 393,
+    0x58356B: 231,
+    0xF89753: 117,
+    0x5894AE: 117,
+    0xB03ACE: 117,
+    0xF84CDA: 15,
+    0xBCFF4D: 14,
+    0xA4056E: 393,
+    0xFC4EA4: 49,
+    0xF4BEEC: 49,
+    0x54E61B: 49,
+    0xCC68B6: 94,
+    0x14DD9C: 146,
+    0x64644A: 166,
+    0xE89E0C: 394,
+    0x64808B: 395,
+    0xFC13F0: 47,
+    0x20896F: 5,
+    0xF4FBB8: 15,
+    0xA070B7: 15,
+    0x78B554: 117,
+    0x689E6A: 117,
+    0x282B96: 117,
+    0xA439B6: 396,
+    0x0004AD: 397,
+    0xC45BBE: 14,
+    0x002618: 398,
+    0xCC3331: 53,
+    0xFC9C98: 399,
+    0x1C6EE6: 400,
+    0x08F606: 11,
+    0xB814DB: 373,
+    0x1CD1E0: 4,
+    0xE8FD35: 117,
+    0xECC5D2: 117,
+    0x4044FD: 194,
+    0x646EE0: 25,
+    0x0456E5: 25,
+    0x884604: 40,
+    0x841EA3: 3,
+    0x8C2A8E: 401,
+    0x80071B: 402,
+    0x24456B: 117,
+    0x483871: 117,
+    0x44BDDE: 403,
+    0xB4608C: 5,
+    0xF40223: 207,
+    0x6479F0: 25,
+    0x081086: 404,
+    0x78653B: 405,
+    0xE0E656: 406,
+    0x4CF202: 40,
+    0xA877E5: 407,
+    0x10A4DA: 15,
+    0xFC584A: 408,
+    0x84D608: 409,
+    0x346893: 410,
+    0x9023B4: 21,
+    0x882A5E: 21,
+    0x246968: 86,
+    0xFCA9DC: 232,
+    0x3C7AAA: 242,
+    0x84FD27: 238,
+    0x28D3EA: 117,
+    0xA8F266: 117,
+    0xCC9C3E: 20,
+    0x84267A: 411,
+    0x6C4760: 412,
+    0x183219: 38,
+    0x0020C1: 413,
+    0x4829E4: 414,
+    0x3C9BC6: 117,
+    0x0036BE: 415,
+    0xA45E5A: 416,
+    0x7C5079: 25,
+    0x8038FB: 25,
+    0x501FC6: 49,
+    0xCC69FA: 49,
+    0x10CEE9: 49,
+    0x5C56A4: 417,
+    0x642656: 418,
+    0xAC8247: 25,
+    0xF0258E: 15,
+    0x9C746F: 15,
+    0xAC74C4: 419,
+    0x540910: 49,
+    0x9CFC28: 49,
+    0xB485E1: 49,
+    0x0C19F8: 49,
+    0x08B4B1: 210,
+    0x382028: 15,
+    0xE47727: 15,
+    0x105107: 25,
+    0x749AC0: 420,
+    0x34587C: 421,
+    0xA03B01: 422,
+    0x145E69: 69,
+    0xC4E287: 15,
+    0x54F607: 117,
+    0xA0A3F0: 329,
+    0xE8A0CD: 35,
+    0x9C823F: 117,
+    0xE06C4E: 423,
+    0x50558D: 275,
+    0x64E003: 31,
+    0x34F716: 86,
+    0x846569: 21,
+    0x281B04: 424,
+    0x7C5259: 425,
+    0xF4B301: 25,
+    0xE8D2FF: 3,
+    0x0C96CD: 426,
+    0x18CE94: 90,
+    0x783716: 90,
+    0x5C6F69: 293,
+    0xD012CB: 427,
+    0x78CF2F: 15,
+    0xA83B5C: 15,
+    0x045FB9: 4,
+    0x102FA3: 428,
+    0x04495D: 117,
+    0xF0FEE7: 117,
+    0xE8F408: 25,
+    0x58B0FE: 429,
+    0x90C792: 258,
+    0xDCCD74: 430,
+    0x748B29: 431,
+    0x484C29: 15,
+    0xC4D438: 15,
+    0x54211D: 117,
+    0x143FA6: 432,
+    0x44D453: 3,
+    0xDCA120: 81,
+    0x50523B: 81,
+    0x2406AA: 69,
+    0x8CAE49: 12,
+    0x20FF36: 433,
+    0x24649F: 117,
+    0x0C1773: 117,
+    0xE81E92: 117,
+    0x888E68: 117,
+    0x807484: 434,
+    0x88238C: 5,
+    0xA8CC6F: 145,
+    0xA4CCB9: 194,
+    0x6CB881: 11,
+    0x989AB9: 11,
+    0x008A55: 117,
+    0x64A28A: 117,
+    0xAC471B: 117,
+    0x003192: 94,
+    0x0865F0: 435,
+    0x14AB02: 15,
+    0xB04530: 319,
+    0x6CA0B4: 319,
+    0xEC0DE4: 77,
+    0xB456E3: 49,
+    0x843095: 113,
+    0x3C6105: 14,
+    0x4C20B8: 49,
+    0x1488E6: 49,
+    0x7895EB: 163,
+    0xB0BBE5: 3,
+    0x1C9F4E: 436,
+    0xA468BC: 437,
+    0x8CFDDE: 3,
+    0x48D890: 438,
+    0xB0C53C: 4,
+    0xECCE13: 4,
+    0xC418E9: 90,
+    0x1CE57F: 90,
+    0x085531: 439,
+    0xBC5BD5: 258,
+    0x241145: 40,
+    0x00042B: 440,
+    0xD44F67: 15,
+    0xF8B95A: 285,
+    0x781F11: 441,
+    0x107100: 117,
+    0x607EA4: 442,
+    0xB4FF98: 15,
+    0x0838E6: 443,
+    0xE8C2DD: 444,
+    0xC41C9C: 445,
+    0x98F181: 21,
+    0x8C55BB: 446,
+    0x7C8FDE: 317,
+    0x90808F: 117,
+    0x184516: 53,
+    0xD02EAB: 53,
+    0x847127: 238,
+    0xF0F7E7: 15,
+    0x849DC2: 447,
+    0x40A9CF: 77,
+    0x5895D8: 12,
+    0xF80DAC: 19,
+    0x8850F6: 286,
+    0x0405DD: 448,
+    0x3897A4: 449,
+    0xE433AE: 69,
+    0x387A3C: 5,
+    0x8CCE4E: 14,
+    0x40B5C1: 4,
+    0xE44791: 450,
+    0xF013C1: 451,
+    0x8454DF: 117,
+    0xE884A5: 25,
+    0x00C035: 452,
+    0x1C501E: 16,
+    0xFC66CF: 49,
+    0xAC1D06: 49,
+    0x44A8FC: 49,
+    0xF81093: 49,
+    0xDCE994: 195,
+    0x409505: 453,
+    0x5CD89E: 117,
+    0xB82D28: 295,
+    0xA4134E: 391,
+    0xB85F98: 77,
+    0xD8F883: 25,
+    0xB436D1: 232,
+    0x101965: 21,
+    0x94FF61: 29,
+    0xDC774C: 4,
+    0x204441: 454,
+    0xFC4482: 25,
+    0xA085FC: 157,
+    0x14A9D0: 455,
+    0x000A49: 455,
+    0x0094A1: 455,
+    0x80F1F1: 456,
+    0x006151: 15,
+    0xBC76C5: 15,
+    0x5C0272: 238,
+    0x000430: 457,
+    0x0446CF: 458,
+    0xB88035: 459,
+    0x9012A1: 460,
+    0x64B623: 461,
+    0x000EFF: 462,
+    0x702C09: 35,
+    0xE4D373: 15,
+    0xC0BC9A: 15,
+    0xE81B69: 463,
+    0x6852D6: 464,
+    0xFC1999: 40,
+    0xCC874A: 81,
+    0xA45129: 465,
+    0xB4C26A: 466,
+    0x78F8B8: 467,
+    0x6CE5F7: 21,
+    0xB8DD71: 11,
+    0xF4E578: 468,
+    0x0854BB: 407,
+    0x3C9C0F: 25,
+    0x1C5D80: 469,
+    0x3CB15B: 470,
+    0x5865E6: 471,
+    0x08FBEA: 295,
+    0x60EB5A: 472,
+    0x5C443E: 473,
+    0xF88200: 474,
+    0x0050F1: 475,
+    0x801605: 104,
+    0xA802DB: 11,
+    0x74F7F6: 184,
+    0x241AE6: 117,
+    0xC45444: 476,
+    0x001B24: 476,
+    0x00C09F: 476,
+    0xC80AA9: 476,
+    0x60EB69: 476,
+    0xB42330: 477,
+    0x000895: 478,
+    0x00269E: 476,
+    0xA022DE: 146,
+    0xFC73FB: 15,
+    0x60B76E: 210,
+    0x00927D: 479,
+    0x441622: 157,
+    0x044562: 480,
+    0x94AEF0: 4,
+    0xDCD9AE: 0,
+    0xC4366C: 285,
+    0x1C08C1: 285,
+    0xBCA993: 204,
+    0xA497B1: 388,
+    0x44E6B0: 275,
+    0x747A90: 102,
+    0x58B623: 166,
+    0x14007D: 11,
+    0x24E9CA: 117,
+    0xD440D0: 481,
+    0x98B8BC: 90,
+    0x703AA6: 21,
+    0x8CCEFD: 482,
+    0x50FB19: 483,
+    0x9408C7: 117,
+    0xC8CA63: 117,
+    0x9437F7: 117,
+    0x184E16: 90,
+    0xC03D03: 90,
+    0x10746F: 484,
+    0xD0C637: 25,
+    0xD49234: 485,
+    0x386893: 25,
+    0x903FEA: 15,
+    0x20AB48: 15,
+    0xCCD73C: 15,
+    0x94E70B: 25,
+    0x046C59: 25,
+    0xD4ABCD: 31,
+    0xA0CAA5: 486,
+    0xE8854B: 49,
+    0xE00EE4: 317,
+    0x58FDB1: 244,
+    0x34EAE7: 487,
+    0xCC9ECA: 145,
+    0x28EC95: 49,
+    0xE02B96: 49,
+    0x184593: 278,
+    0xF86C03: 488,
+    0x105DDC: 117,
+    0xDC7385: 117,
+    0x5455D5: 117,
+    0xF041C6: 489,
+    0xC49886: 186,
+    0xE43A65: 490,
+    0x54219D: 90,
+    0x3C306F: 15,
+    0x80E1BF: 15,
+    0x482CD0: 15,
+    0xD8714D: 53,
+    0x0CEC80: 53,
+    0x70039F: 14,
+    0x709F2D: 11,
+    0x5C0FFB: 491,
+    0xE82A44: 192,
+    0x48E1E9: 492,
+    0x08B055: 234,
+    0xA0DE0F: 117,
+    0xF487C5: 117,
+    0x882B94: 493,
+    0x7CEF61: 494,
+    0x400589: 495,
+    0x64A965: 496,
+    0x3CF652: 11,
+    0xA80577: 497,
+    0x404028: 498,
+    0x7458F3: 77,
+    0x08AA55: 78,
+    0x001354: 499,
+    0xC09BF4: 12,
+    0x30B237: 167,
+    0x68E209: 15,
+    0xF4308B: 40,
+    0xDC6B12: 500,
+    0xAC4A56: 4,
+    0xB0B5C3: 69,
+    0x282373: 501,
+    0xD0ABD5: 25,
+    0xD4C1C8: 11,
+    0x88D274: 11,
+    0xBC5A56: 4,
+    0x704A0E: 295,
+    0xBC0F9A: 329,
+    0x4CCE2D: 502,
+    0x0C35FE: 5,
+    0x8C83DF: 81,
+    0x30B9B0: 503,
+    0xD4DACD: 319,
+    0xF4B78D: 15,
+    0xA416E7: 15,
+    0xB40931: 15,
+    0x94E7EA: 15,
+    0x94E4BA: 117,
+    0x347146: 117,
+    0x2CC546: 117,
+    0x0C839A: 117,
+    0xE0E0FC: 117,
+    0xAC4B1E: 504,
+    0x6869CA: 505,
+    0xB0E4D5: 210,
+    0x88C397: 166,
+    0xF0F6C1: 506,
+    0xE0D4E8: 25,
+    0x305075: 27,
+    0x90EC77: 507,
+    0xB440A4: 49,
+    0x48B8A3: 49,
+    0xF4DBE3: 49,
+    0xBC428C: 159,
+    0x04BDBF: 90,
+    0xBC7ABF: 90,
+    0x60684E: 90,
+    0x8020FD: 90,
+    0xB4CE40: 90,
+    0xD45EEC: 508,
+    0x4C4576: 509,
+    0x74C929: 510,
+    0x94CC04: 12,
+    0x9CC9EB: 511,
+    0x5CB29E: 512,
+    0x347839: 11,
+    0xD84DB9: 513,
+    0xA04F85: 514,
+    0x2C1A01: 15,
+    0x24169D: 4,
+    0xF419E2: 515,
+    0x64F2FB: 516,
+    0xD807B6: 86,
+    0x646E97: 86,
+    0x6C0D34: 81,
+    0x00233D: 517,
+    0x6C1632: 15,
+    0x30809B: 21,
+    0x7422BB: 117,
+    0x4C6371: 40,
+    0x5CBAEF: 388,
+    0x000ADB: 518,
+    0x30AB6A: 305,
+    0x8C6078: 519,
+    0xF80DF0: 11,
+    0x9CE91C: 11,
+    0x749BE8: 520,
+    0x00DD25: 521,
+    0x0445A1: 522,
+    0x8020E1: 523,
+    0x8C97EA: 524,
+    0xFC8E6E: 525,
+    0x788B2A: 526,
+    0xAC64CF: 438,
+    0x3CFAD3: 12,
+    0x5C17CF: 71,
+    0x102959: 49,
+    0xF06728: 69,
+    0xE02AE6: 5,
+    0x14F6D8: 25,
+    0x3CDA6D: 527,
+    0xA4FA76: 21,
+    0x9CE176: 4,
+    0xB41A1D: 90,
+    0xE47684: 49,
+    0xF05CD5: 49,
+    0x70EA5A: 49,
+    0x4CE176: 4,
+    0x1434F6: 528,
+    0x18AFA1: 529,
+    0x54CE69: 530,
+    0x6CAEF6: 63,
+    0xC014B8: 81,
+    0xD028BA: 531,
+    0xA428B7: 532,
+    0x9492D2: 533,
+    0xE4A8DF: 384,
+    0x702F35: 15,
+    0x8C53C3: 166,
+    0xD83BBF: 25,
+    0x000DBB: 534,
+    0x0CEE99: 77,
+    0xFCF5C4: 14,
+    0xE826B6: 535,
+    0x00763D: 536,
+    0x48B02D: 537,
+    0x588E81: 238,
+    0x902B34: 538,
+    0x94DE80: 538,
+    0x74D435: 538,
+    0x408D5C: 538,
+    0x6CC63B: 278,
+    0x3093BC: 3,
+    0xF4FEFB: 90,
+    0x3C410E: 4,
+    0x207454: 146,
+    0xB8C9B5: 69,
+    0x984914: 57,
+    0xF86FDE: 539,
+    0x0045E2: 540,
+    0x043F72: 270,
+    0x1C4D66: 77,
+    0x646624: 3,
+    0xB0F530: 520,
+    0x001FF6: 541,
+    0x006967: 12,
+    0x001EB8: 542,
+    0x0CE4A0: 117,
+    0xBC1AE4: 117,
+    0x740AE1: 117,
+    0xB4A898: 117,
+    0x502CC6: 543,
+    0x0027E3: 4,
+    0x089C86: 0,
+    0xF05136: 274,
+    0x105932: 58,
+    0x7817BE: 15,
+    0x90AFD1: 544,
+    0xE04007: 117,
+    0x90FD73: 11,
+    0x88ACC0: 112,
+    0x1C1E38: 545,
+    0x90812A: 49,
+    0xB87BC5: 49,
+    0x4070F5: 49,
+    0xB035B5: 49,
+    0x800C67: 49,
+    0xF072EA: 210,
+    0xEC9C32: 33,
+    0x4CADA8: 546,
+    0x981BB5: 547,
+    0xD42DC5: 548,
+    0xB887C6: 549,
+    0xFC1CA1: 81,
+    0x6CD2BA: 11,
+    0x1C1ADF: 157,
+    0xD4F547: 210,
+    0x34CB1A: 550,
+    0xF0B107: 228,
+    0xE8D03C: 286,
+    0x70CE8C: 90,
+    0x783A6C: 231,
+    0xC4E0DE: 551,
+    0x901A4F: 38,
+    0x0004C9: 552,
+    0xC43A35: 438,
+    0x04D16E: 12,
+    0xD88ADC: 117,
+    0xCC6A10: 553,
+    0xC84F0E: 554,
+    0x10E953: 117,
+    0x303ABA: 555,
+    0x7C48B2: 556,
+    0x040E3C: 19,
+    0x6C1C71: 510,
+    0x0C2FB0: 90,
+    0xF03F95: 15,
+    0x185644: 15,
+    0x9C69D1: 15,
+    0x78C881: 141,
+    0x7048F7: 35,
+    0x18E1CA: 557,
+    0xCCEF03: 558,
+    0xECBEDD: 3,
+    0x88571D: 330,
+    0xB04FC3: 559,
+    0x309176: 560,
+    0xB40216: 4,
+    0x54A493: 12,
+    0x8CC84B: 388,
+    0x749EA5: 373,
+    0xD44F68: 561,
+    0x340F66: 562,
+    0x002272: 563,
+    0x00D0EF: 564,
+    0xD89790: 565,
+    0x405582: 81,
+    0xA4E31B: 81,
+    0xB8A58D: 566,
+    0x50CEE3: 567,
+    0xF497C2: 568,
+    0x30FBB8: 15,
+    0xF4BD9E: 4,
+    0x5885E9: 531,
+    0xA44519: 40,
+    0x8446FE: 15,
+    0xD82918: 15,
+    0x4C1D96: 25,
+    0xBC2392: 569,
+    0x94E6F7: 25,
+    0x086083: 11,
+    0xE01954: 11,
+    0x7CF31B: 514,
+    0x10327E: 117,
+    0xC419D1: 570,
+    0x64B21D: 571,
+    0xC42996: 572,
+    0xB065F1: 573,
+    0x901234: 574,
+    0x542A1B: 506,
+    0x38C4E8: 575,
+    0x34DD7E: 576,
+    0xCCCD64: 577,
+    0x24DFA7: 51,
+    0x5C925E: 578,
+    0x084FA9: 4,
+    0x084FF9: 4,
+    0x980637: 12,
+    0x8CB84A: 305,
+    0x98E8FA: 35,
+    0xF8084F: 3,
+    0x1802AE: 146,
+    0x0C20D3: 146,
+    0x68DBF5: 77,
+    0x2446C8: 78,
+    0x5098B8: 21,
+    0x44D791: 15,
+    0xB84DEE: 579,
+    0xD46BA6: 15,
+    0xCC0577: 15,
+    0x98BA39: 580,
+    0xE4CC9D: 554,
+    0xA8D0E3: 581,
+    0x308BB2: 4,
+    0xA89352: 582,
+    0xE0EB62: 583,
+    0x6CE8C6: 121,
+    0x1C4176: 29,
+    0x48216C: 275,
+    0x8CBE24: 584,
+    0x94DC4E: 585,
+    0x54DED0: 586,
+    0x08B3AF: 146,
+    0x30862D: 587,
+    0xE86F38: 388,
+    0x08688D: 21,
+    0x401920: 588,
+    0x608B0E: 49,
+    0x1442FC: 53,
+    0xAC5D5C: 438,
+    0xA4AE11: 589,
+    0x2C1E4F: 590,
+    0x009052: 591,
+    0x1871D5: 592,
+    0xACB1EE: 593,
+    0xF8ADCB: 145,
+    0xD03745: 86,
+    0x603A7C: 86,
+    0x000178: 594,
+    0x001A83: 595,
+    0x50E085: 25,
+    0x6C5E3B: 4,
+    0x58C876: 596,
+    0xD462EA: 15,
+    0x54BAD6: 15,
+    0x0CB771: 258,
+    0x24166D: 15,
+    0x940B19: 15,
+    0x70C7F2: 15,
+    0xDCA632: 156,
+    0x88F56E: 15,
+    0xC8C2FA: 15,
+    0x88B362: 0,
+    0x0847D0: 0,
+    0xCC9093: 597,
+    0xBC97E1: 293,
+    0x28D1B7: 574,
+    0x3894ED: 511,
+    0x700433: 598,
+    0xCC64A6: 15,
+    0x148430: 599,
+    0xB8A44F: 600,
+    0x0024EB: 601,
+    0xD81399: 31,
+    0x54E019: 602,
+    0xF0A968: 603,
+    0x50AF4D: 11,
+    0xC8EAF8: 11,
+    0x848BCD: 12,
+    0x08EDED: 510,
+    0x383B26: 604,
+    0x30317D: 605,
+    0x5CFAFB: 606,
+    0x9C7BEF: 607,
+    0x88299C: 90,
+    0x7C8956: 90,
+    0x742EDB: 608,
+    0x201742: 244,
+    0xCC8826: 285,
+    0xEC5B73: 609,
+    0xD09C7A: 40,
+    0x1C697A: 372,
+    0x4C1744: 77,
+    0xB03055: 275,
+    0x14C03E: 258,
+    0xC089AB: 258,
+    0xD44DA4: 102,
+    0xDC7196: 25,
+    0x6882F2: 610,
+    0x905C34: 611,
+    0xD46A35: 4,
+    0xF8E5CF: 612,
+    0xC82C2B: 12,
+    0x8020DA: 3,
+    0xD420B0: 179,
+    0x0022AF: 613,
+    0xA091A2: 614,
+    0x0080B5: 615,
+    0x00A0B0: 616,
+    0x9C497F: 554,
+    0xC4E39F: 69,
+    0x2479F3: 69,
+    0x80A235: 87,
+    0x402343: 388,
+    0x0021B7: 617,
+    0xC8C64A: 618,
+    0x30EA26: 619,
+    0x18F18E: 620,
+    0xF89A78: 15,
+    0x88F872: 15,
+    0xEC5623: 15,
+    0x5486BC: 4,
+    0xB808CF: 25,
+    0x68847E: 621,
+    0x003085: 4,
+    0x6092F5: 258,
+    0x605F8D: 63,
+    0xC4B36A: 4,
+    0x70F754: 295,
+    0x6C8BD3: 4,
+    0x68974B: 622,
+    0x34E1D1: 12,
+    0x14B457: 238,
+    0xDC962C: 623,
+    0x50EC50: 166,
+    0x6063F9: 624,
+    0xAC8FF8: 81,
+    0x6003A6: 625,
+    0x44B295: 33,
+    0x9424E1: 215,
+    0x108286: 626,
+    0x6061DF: 627,
+    0x7057BF: 21,
+    0x089798: 384,
+    0x18022D: 15,
+    0xD8BC59: 628,
+    0x8C79F5: 90,
+    0x246F28: 14,
+    0x00122A: 629,
+    0x000422: 630,
+    0x80DA13: 63,
+    0x48F8DB: 15,
+    0xC08ACD: 257,
+    0xD81EDD: 69,
+    0xD43FCB: 258,
+    0xB0518E: 631,
+    0x681729: 25,
+    0x2852E0: 632,
+    0x7C6166: 77,
+    0x989BCB: 427,
+    0xACF6F7: 514,
+    0x58CB52: 210,
+    0xF8CA59: 633,
+    0x88B291: 49,
+    0xC42AD0: 49,
+    0xCCD281: 49,
+    0xF84D33: 5,
+    0x107717: 407,
+    0xA86D5F: 212,
+    0x48E6C0: 634,
+    0x383C9C: 635,
+    0xC02E25: 69,
+    0x200DB0: 636,
+    0x100C6B: 511,
+    0x58ECED: 554,
+    0xC4F0EC: 5,
+    0xD88DC8: 637,
+    0xE80FC8: 638,
+    0xC8AACC: 13,
+    0x002167: 639,
+    0x04EE03: 53,
+    0x4C2498: 53,
+    0x7CD95C: 210,
+    0x1C2E1B: 640,
+    0x907A58: 641,
+    0xE009BF: 642,
+    0xB00073: 57,
+    0x001BF7: 643,
+    0x846991: 81,
+    0x00131E: 644,
+    0x783607: 645,
+    0x1C24EB: 646,
+    0x001013: 647,
+    0xA8E2C1: 53,
+    0x909A77: 53,
+    0x00EEAB: 4,
+    0x54A703: 86,
+    0x58C6F0: 69,
+    0x84A06E: 3,
+    0x884A18: 648,
+    0xA43EA0: 649,
+    0x64C2DE: 514,
+    0x8C444F: 132,
+    0x006762: 5,
+    0x2CC407: 650,
+    0x0007CB: 524,
+    0x149FB6: 651,
+    0x00115A: 652,
+    0x40DF02: 653,
+    0xDC31D1: 146,
+    0xD43B04: 25,
+    0xB4ED19: 654,
+    0x84139F: 11,
+    0x2C2BF9: 285,
+    0x900218: 319,
+    0x144E2A: 655,
+    0x7495EC: 159,
+    0xAC5AEE: 29,
+    0xF051EA: 656,
+    0x5033F0: 657,
+    0x4CE19E: 231,
+    0x441AFA: 21,
+    0x04072E: 658,
+    0xFC2BB2: 659,
+    0xE09F2A: 660,
+    0x70BC10: 157,
+    0x9C69B4: 12,
+    0x0006F7: 159,
+    0x000704: 159,
+    0x0006F5: 159,
+    0x34C731: 159,
+    0x64D4BD: 159,
+    0x0498F3: 159,
+    0x500084: 661,
+    0x44B433: 662,
+    0x00214F: 159,
+    0x247D4D: 53,
+    0xDC21B9: 663,
+    0x6CDFFB: 12,
+    0x203233: 664,
+    0xE498BB: 84,
+    0x705E55: 531,
+    0xB0D568: 448,
+    0xF00EBF: 665,
+    0x04EA56: 25,
+    0x60A11E: 666,
+    0xC45BF7: 667,
+    0x8CDF9D: 485,
+    0x703509: 4,
+    0x5C415A: 668,
+    0xA8B456: 4,
+    0xA49426: 669,
+    0x2CA9F0: 69,
+    0x549B72: 228,
+    0x9454DF: 670,
+    0x780ED1: 671,
+    0xF82F08: 672,
+    0xA047D7: 673,
+    0x6899CD: 4,
+    0x1040F3: 49,
+    0x4428A3: 674,
+    0x10C595: 675,
+    0x6829DC: 676,
+    0xF80DF1: 677,
+    0x7CBC84: 12,
+    0x44E66E: 49,
+    0xC0E862: 49,
+    0xF40616: 49,
+    0x586B14: 49,
+    0xBCB863: 49,
+    0x0CFE5D: 12,
+    0x3C8D20: 210,
+    0x601D91: 78,
+    0xD4C94B: 78,
+    0xAC1585: 678,
+    0xAC5093: 679,
+    0x9CC8FC: 258,
+    0x70BBE9: 40,
+    0x00D02D: 680,
+    0x2C1CF6: 681,
+    0xB07E11: 53,
+    0x08351B: 682,
+    0x806940: 683,
+    0x64F81C: 684,
+    0x10C753: 247,
+    0xF4951B: 685,
+    0x6C3845: 5,
+    0x00B1E3: 4,
+    0xA41194: 675,
+    0x2C6104: 686,
+    0xBC9325: 687,
+    0x0C1C19: 688,
+    0xE013B5: 146,
+    0xE0795E: 689,
+    0x8C85E6: 690,
+    0x90E710: 21,
+    0x302952: 691,
+    0x049226: 398,
+    0xE8ADA6: 3,
+    0xD0B60A: 692,
+    0xA4FC77: 693,
+    0x50A0A4: 81,
+    0x1098C3: 102,
+    0x84326F: 694,
+    0xC89C13: 695,
+    0xE4B2FB: 49,
+    0x2CCA0C: 696,
+    0x440049: 77,
+    0x1838AE: 697,
+    0x04CF8C: 698,
+    0x0C7512: 699,
+    0x0C4101: 700,
+    0x00B771: 4,
+    0x807D14: 15,
+    0x20283E: 15,
+    0xF83880: 49,
+    0x4C569D: 49,
+    0x38539C: 49,
+    0x402619: 49,
+    0x6CE85C: 49,
+    0xB0AE25: 701,
+    0x049162: 72,
+    0x983B8F: 25,
+    0x54278D: 702,
+    0xB0BE76: 86,
+    0xD003DF: 90,
+    0x6CC374: 53,
+    0x684749: 53,
+    0xF8D9B8: 703,
+    0x7C696B: 704,
+    0x5CD20B: 705,
+    0x4C1265: 258,
+    0x00500C: 706,
+    0x485F99: 707,
+    0x88F7BF: 146,
+    0xD87D7F: 3,
+    0xECC40D: 35,
+    0x50579C: 378,
+    0x8834FE: 708,
+    0x2C79D7: 3,
+    0x00B4F5: 709,
+    0x4C1B86: 48,
+    0x58B568: 710,
+    0xC423A2: 711,
+    0xB4CB57: 69,
+    0xFC039F: 90,
+    0x00073A: 712,
+    0x00266C: 713,
+    0x008CFA: 713,
+    0x846A66: 714,
+    0x5CFB7C: 286,
+    0x10A24E: 715,
+    0x88108F: 15,
+    0xF4631F: 15,
+    0xA49B4F: 15,
+    0x00051A: 716,
+    0x08004E: 716,
+    0x00301E: 716,
+    0x005004: 717,
+    0x000103: 717,
+    0x02C08C: 717,
+    0x18D717: 69,
+    0x80B624: 718,
+    0xDCF505: 43,
+    0xCCF0FD: 596,
+    0x8489EC: 12,
+    0x1C1BB5: 25,
+    0x0057C1: 514,
+    0x7C240C: 191,
+    0x00203D: 719,
+    0x004084: 720,
+    0xD4741B: 721,
+    0xA0950C: 275,
+    0x2C15E1: 722,
+    0xA4D990: 90,
+    0xDCF719: 4,
+    0x30D16B: 192,
+    0x006087: 723,
+    0x98AE71: 724,
+    0xAC6E1A: 725,
+    0x30D32D: 726,
+    0x0080EB: 727,
+    0x0002EB: 728,
+    0x342EB6: 15,
+    0xAC9232: 15,
+    0xDC8B28: 25,
+    0xB869F4: 439,
+    0x000FB0: 729,
+    0x00023F: 729,
+    0x001555: 730,
+    0xBCF2AF: 726,
+    0xE0AF4F: 731,
+    0x68A8E1: 353,
+    0x283A4D: 707,
+    0xB87C6F: 702,
+    0x305DA6: 732,
+    0xBC30D9: 48,
+    0x0479B7: 53,
+    0xC0D0FF: 275,
+    0x88DF9E: 21,
+    0x2C7CE4: 733,
+    0x24D76B: 734,
+    0xC4FEE2: 735,
+    0x144802: 736,
+    0xFC4AE9: 737,
+    0x40313C: 698,
+    0xFC4596: 384,
+    0xA0E534: 738,
+    0x1C7508: 384,
+    0x001B38: 384,
+    0x00235A: 384,
+    0x444B5D: 739,
+    0x8CA048: 740,
+    0x24D3F2: 11,
+    0xD469A5: 741,
+    0xE01283: 742,
+    0xE8C57A: 743,
+    0xA0CF5B: 4,
+    0x002421: 744,
+    0x0060D1: 745,
+    0x0C8C24: 664,
+    0x805E4F: 438,
+    0x8C6D77: 15,
+    0x8C8126: 746,
+    0xD47C44: 12,
+    0x302432: 25,
+    0x24F57E: 747,
+    0x84C9C6: 725,
+    0x780CF0: 4,
+    0x7054B4: 229,
+    0x20A60C: 40,
+    0x505967: 748,
+    0x000680: 749,
+    0x88B66B: 750,
+    0x488AD2: 751,
+    0xDCE838: 752,
+    0xA8D498: 753,
+    0x60D02C: 272,
+    0xD058FC: 319,
+    0x3856B5: 754,
+    0x14579F: 15,
+    0xB44326: 15,
+    0x3C576C: 90,
+    0x841766: 755,
+    0x2C4D79: 755,
+    0x04AB18: 449,
+    0xD0C5D8: 756,
+    0x000C42: 439,
+    0x0026BD: 757,
+    0x7C96D2: 758,
+    0x78D294: 511,
+    0x709FA9: 231,
+    0x0C01DB: 444,
+    0x08C5E1: 305,
+    0x1866C7: 759,
+    0x5CB3F6: 760,
+    0x2C4835: 12,
+    0x482AE3: 761,
+    0xB0EB57: 15,
+    0x1869DA: 29,
+    0xFCA6CD: 5,
+    0x44C874: 29,
+    0x74C14F: 15,
+    0xA85B6C: 762,
+    0xC8B1EE: 763,
+    0x00CBB4: 764,
+    0x4CC00A: 146,
+    0x9CE82B: 146,
+    0x7079B3: 4,
+    0x149B2F: 765,
+    0x48DD9D: 163,
+    0xA075EA: 766,
+    0xF04CD5: 475,
+    0x00FCBA: 4,
+    0xF85C4D: 81,
+    0x2C584F: 258,
+    0x3835FB: 3,
+    0x0001AE: 767,
+    0x00E009: 768,
+    0xE4EA83: 725,
+    0x74EC42: 5,
+    0xD4FC13: 5,
+    0xA0B045: 769,
+    0xECAF97: 770,
+    0xE0BAB4: 771,
+    0x807D3A: 14,
+    0x9C7F57: 772,
+    0xB4E01D: 773,
+    0x1C0042: 774,
+    0x68CAE4: 4,
+    0x781D4A: 11,
+    0x001027: 775,
+    0x589B0B: 776,
+    0xD8160A: 777,
+    0x10C07C: 778,
+    0xE4B021: 90,
+    0x4434A7: 258,
+    0x3CE1A1: 61,
+    0xF898EF: 15,
+    0x58F987: 15,
+    0xA8F5AC: 15,
+    0x58BAD4: 15,
+    0xBC2643: 779,
+    0x04E229: 780,
+    0x701D08: 781,
+    0x7412BB: 5,
+    0x00BE3B: 15,
+    0x7CA177: 15,
+    0x242E02: 15,
+    0x78B6EC: 782,
+    0x8035C1: 40,
+    0x9CE895: 21,
+    0x00583F: 783,
+    0x903D68: 784,
+    0x1094BB: 49,
+    0x08DFCB: 785,
+    0xA4933F: 15,
+    0x34E894: 86,
+    0x28AC9E: 4,
+    0xF86FC1: 49,
+    0x28FF3C: 49,
+    0xF099B6: 49,
+    0x88E9FE: 49,
+    0x38892C: 49,
+    0x348B75: 786,
+    0x749EAF: 49,
+    0x94BF2D: 49,
+    0x2047DA: 40,
+    0x58B3FC: 787,
+    0x2429FE: 338,
+    0x7C49EB: 698,
+    0xC43306: 29,
+    0x984562: 788,
+    0x68D482: 725,
+    0x10E7C6: 607,
+    0x202D23: 789,
+    0x90834B: 790,
+    0x18502A: 791,
+    0xA433D7: 128,
+    0xA8367A: 792,
+    0xB0ACD2: 11,
+    0x200F70: 793,
+    0x007147: 77,
+    0x00BE75: 4,
+    0x6CE4DA: 404,
+    0xE4C483: 69,
+    0x001FBA: 794,
+    0xDCA333: 574,
+    0x1831BF: 398,
+    0xC048E6: 90,
+    0x882E5A: 795,
+    0x788C54: 796,
+    0xF00FEC: 15,
+    0xAC075F: 15,
+    0xB8AF67: 607,
+    0xC098DA: 275,
+    0xC8FAE1: 797,
+    0x10A4B9: 154,
+    0x80CE62: 607,
+    0x801F12: 72,
+    0x506CBE: 798,
+    0x247E12: 4,
+    0x501CB0: 4,
+    0x04C241: 81,
+    0x78257A: 799,
+    0x8CF710: 800,
+    0x307BAC: 21,
+    0x3C479B: 801,
+    0x606BFF: 35,
+    0x785DC8: 244,
+    0x0C5415: 25,
+    0x3C0461: 258,
+    0xE8C1B8: 802,
+    0xD8D775: 3,
+    0xB4A8B9: 4,
+    0x50DCE7: 77,
+    0x649829: 554,
+    0x081DC4: 803,
+    0x785364: 804,
+    0x883D24: 210,
+    0x04AC44: 805,
+    0xF4DCA5: 806,
+    0xD460E3: 463,
+    0x40CBC0: 49,
+    0xE8330D: 807,
+    0x38E60A: 40,
+    0x08AED6: 90,
+    0xCC4D38: 808,
+    0x005D73: 4,
+    0x606D3C: 809,
+    0x002790: 4,
+    0x5C5F67: 25,
+    0x803A59: 810,
+    0x588D64: 811,
+    0x34BA38: 812,
+    0x9829A6: 384,
+    0xDCBFE9: 78,
+    0xCC6EA4: 90,
+    0xA816D0: 90,
+    0xA46CF1: 90,
+    0xC4618B: 49,
+    0x08E689: 49,
+    0xDC56E7: 49,
+    0x4064A4: 813,
+    0xD45DDF: 814,
+    0xF065C2: 815,
+    0x70B7E2: 816,
+    0xA09D86: 817,
+    0x00C0FF: 818,
+    0x88D171: 819,
+    0xA825EB: 820,
+    0x34E380: 821,
+    0x5C5819: 822,
+    0xB8CA04: 805,
+    0xC4C563: 231,
+    0xF8B568: 12,
+    0x2C6B7D: 53,
+    0x6CB2AE: 4,
+    0x80B708: 823,
+    0xB0982B: 3,
+    0x34FA9F: 272,
+    0xA09DC1: 242,
+    0x2C4205: 824,
+    0x6C7660: 825,
+    0x002102: 826,
+    0xF41E5E: 827,
+    0x505800: 828,
+    0x0CEAC9: 258,
+    0xC8D12A: 829,
+    0xBCF292: 830,
+    0x0450DA: 831,
+    0xE820E2: 132,
+    0x1890D8: 3,
+    0x88835D: 438,
+    0xF81D0F: 520,
+    0x0005A7: 832,
+    0x0026A8: 833,
+    0x2031EB: 834,
+    0xF8C96C: 5,
+    0x844823: 835,
+    0x08BC20: 836,
+    0x942A3F: 837,
+    0x785C28: 838,
+    0xEC9F0D: 12,
+    0xE078A3: 839,
+    0x10A4BE: 664,
+    0x947BBE: 840,
+    0xECC06A: 841,
+    0x944996: 842,
+    0x68A682: 574,
+    0x0CB2B7: 53,
+    0x587A62: 53,
+    0x547A52: 843,
+    0x3408BC: 49,
+    0x1C36BB: 49,
+    0x3C2EFF: 49,
+    0x8C5BF0: 258,
+    0x088466: 844,
+    0x309FFB: 845,
+    0xF06E0B: 157,
+    0x346FED: 846,
+    0x24F677: 49,
+    0xB0CA68: 49,
+    0xC83C85: 49,
+    0x5433CB: 49,
+    0x00E025: 847,
+    0x001530: 848,
+    0x78870D: 849,
+    0xA88200: 850,
+    0x3820A8: 851,
+    0x705896: 852,
+    0x00B69F: 853,
+    0x9CE063: 90,
+    0xD03169: 90,
+    0x842C80: 854,
+    0x3CC079: 855,
+    0x000589: 856,
+    0x3CA616: 146,
+    0x98C5DB: 228,
+    0xBC0543: 857,
+    0x149F3C: 90,
+    0xFCEEE6: 858,
+    0x84E327: 859,
+    0x0021B8: 860,
+    0x0C9160: 31,
+    0xD8ED1C: 861,
+    0xD83134: 58,
+    0xA0648F: 234,
+    0xC850E9: 212,
+    0xF46E24: 862,
+    0x888279: 863,
+    0x10F163: 864,
+    0x88DA1A: 865,
+    0x98EF9B: 373,
+    0x14CF8D: 373,
+    0x104400: 15,
+    0xB0E17E: 15,
+    0xE4A7C5: 15,
+    0xA0FE61: 866,
+    0x5C2BF5: 866,
+    0x2C279E: 12,
+    0xB430C0: 867,
+    0xE81DA8: 272,
+    0x5C8D2D: 868,
+    0x68C63A: 14,
+    0x408BF6: 869,
+    0x00006B: 870,
+    0x74373B: 871,
+    0x7C6456: 90,
+    0x90FD9F: 238,
+    0xF03D03: 231,
+    0xDCF090: 872,
+    0xCC5A53: 4,
+    0x00C0EE: 873,
+    0x245FDF: 825,
+    0x646E69: 192,
+    0x706BB9: 4,
+    0x006088: 874,
+    0x084ACF: 69,
+    0x9C63ED: 11,
+    0x74F661: 875,
+    0x8C5F48: 876,
+    0x947EB9: 877,
+    0xD4389C: 133,
+    0x001BD3: 878,
+    0xCC7EE7: 878,
+    0x20C6EB: 878,
+    0x64B5C6: 35,
+    0x001987: 879,
+    0xBCC342: 880,
+    0x2CB21A: 722,
+    0x00289F: 881,
+    0xAC1F74: 49,
+    0xA85C2C: 49,
+    0x00DB70: 49,
+    0xB8634D: 49,
+    0xA4E975: 49,
+    0x3035AD: 49,
+    0x844167: 49,
+    0x9800C6: 49,
+    0xFCE557: 882,
+    0x48C58D: 883,
+    0x24C42F: 884,
+    0xE470B8: 25,
+    0x9C305B: 885,
+    0xD4D2E5: 886,
+    0x0050B5: 887,
+    0x001439: 888,
+    0x00869C: 95,
+    0x104E89: 466,
+    0xD8C497: 476,
+    0xC84029: 5,
+    0xF86EEE: 15,
+    0x84802D: 4,
+    0x00188D: 889,
+    0x0015AB: 890,
+    0x5876C5: 891,
+    0x94D9B3: 86,
+    0x00A0AC: 892,
+    0x741C27: 163,
+    0x2830AC: 893,
+    0x78D800: 12,
+    0x0835B2: 894,
+    0x4C49E3: 40,
+    0x002609: 895,
+    0x28F537: 12,
+    0x7802B1: 4,
+    0xF83441: 25,
+    0x44EA4B: 896,
+    0xC4CB6B: 897,
+    0x54666C: 574,
+    0xA89675: 78,
+    0xB4C170: 898,
+    0x28D436: 899,
+    0xD4B27A: 258,
+    0x389AF6: 90,
+    0xE0AA96: 90,
+    0x507705: 90,
+    0x245880: 900,
+    0x188090: 4,
+    0xB40F3B: 901,
+    0xA8B2DA: 621,
+    0x786256: 15,
+    0xB05508: 15,
+    0x70DF2F: 4,
+    0x3894E0: 902,
+    0xB875C0: 903,
+    0x001C71: 904,
+    0xB090D4: 905,
+    0x8C9F3B: 906,
+    0x001F41: 272,
+    0x842096: 787,
+    0xC4108A: 272,
+    0xF0B052: 272,
+    0xAC6706: 272,
+    0x044FAA: 272,
+    0x589396: 272,
+    0x0014B8: 907,
+    0xACED5C: 25,
+    0x001A93: 908,
+    0x94F665: 272,
+    0x10CDB6: 909,
+    0x9061AE: 25,
+    0x50184C: 910,
+    0x00EC0A: 40,
+    0xC81FEA: 470,
+    0x34F64B: 25,
+    0xA4F3E7: 554,
+    0xE43A6E: 911,
+    0x6CF9D2: 912,
+    0xF46BEF: 3,
+    0x08306B: 95,
+    0x60271C: 913,
+    0x0018AE: 914,
+    0x8891DD: 915,
+    0xF4B7B3: 146,
+    0x30B62D: 916,
+    0x6C60EB: 917,
+    0x74DADA: 329,
+    0xD8F1F0: 918,
+    0x9097F3: 90,
+    0x7C1C68: 90,
+    0xC087EB: 90,
+    0xC8D7B0: 90,
+    0xFCA667: 77,
+    0x447BBB: 574,
+    0x1C4593: 53,
+    0x90EC50: 919,
+    0x2C41A1: 389,
+    0x4C38D8: 258,
+    0x9C7BD2: 920,
+    0xD0F88C: 443,
+    0x2CB115: 554,
+    0xDCC8F5: 921,
+    0x88D7F6: 398,
+    0x10D07A: 800,
+    0xC4ABB2: 146,
+    0x44B412: 922,
+    0x0CB912: 923,
+    0x3CA308: 53,
+    0x00E18C: 25,
+    0x881544: 20,
+    0x002449: 924,
+    0x04714B: 12,
+    0x847933: 925,
+    0x6045CB: 398,
+    0xF43E61: 725,
+    0xB4417A: 725,
+    0xD4503F: 69,
+    0x388C50: 244,
+    0xDC0856: 215,
+    0xE442A6: 25,
+    0x3C678C: 15,
+    0x28A6DB: 15,
+    0x14A0F8: 15,
+    0x98AAFC: 12,
+    0x1CDA27: 146,
+    0x90F305: 132,
+    0x4C8120: 278,
+    0x00118B: 215,
+    0x00E0B1: 215,
+    0x00E0DA: 215,
+    0x4095BD: 926,
+    0xE8C1D7: 927,
+    0xC8F86D: 817,
+    0xF8BE0D: 928,
+    0x00143F: 929,
+    0xF8FF0B: 930,
+    0x144FD7: 12,
+    0xB85510: 578,
+    0x70F087: 49,
+    0x00D318: 931,
+    0xD055B2: 554,
+    0x7C6BF7: 932,
+    0x245BA7: 49,
+    0x6091F3: 146,
+    0x28395E: 90,
+    0x38295A: 69,
+    0x88E628: 933,
+    0x000C46: 934,
+    0x001F72: 935,
+    0x002365: 936,
+    0x40FA7F: 937,
+    0xCC82EB: 825,
+    0xD4CF37: 938,
+    0x409F38: 43,
+    0x049573: 11,
+    0xF0D7AA: 78,
+    0x3096FB: 90,
+    0x4827EA: 90,
+    0x000631: 218,
+    0xBC2F3D: 146,
+    0x7C787E: 90,
+    0xD47DFC: 231,
+    0xB816DB: 939,
+    0xE05163: 48,
+    0x54E3F6: 940,
+    0x40B034: 607,
+    0x3034D2: 941,
+    0x504061: 81,
+    0x00108E: 942,
+    0x641A22: 943,
+    0x8CF5A3: 305,
+    0xF42B48: 944,
+    0x2C7E81: 258,
+    0xD47AE2: 90,
+    0x3CBD3E: 508,
+    0x40B4CD: 77,
+    0x407D0F: 15,
+    0x68CC6E: 15,
+    0x50F14A: 53,
+    0x04DEF2: 945,
+    0xA084CB: 946,
+    0x78C1A7: 11,
+    0x4C7872: 947,
+    0xD8E0E1: 90,
+    0x00A0C8: 262,
+    0xD8C771: 15,
+    0xD4B169: 948,
+    0xE44790: 69,
+    0x8CC8F4: 12,
+    0xF483E1: 949,
+    0x083E5D: 3,
+    0x540384: 950,
+    0x6854FD: 77,
+    0x70918F: 951,
+    0x0003BC: 952,
+    0x7C1015: 953,
+    0xCCB8A8: 800,
+    0x34049E: 12,
+    0x94FB29: 6,
+    0x74614B: 954,
+    0x98D293: 210,
+    0x6C19C0: 49,
+    0xE02A82: 61,
+    0xB0F963: 955,
+    0xD490E0: 956,
+    0xE02202: 258,
+    0xD825B0: 957,
+    0xF49651: 958,
+    0x446246: 959,
+    0x38454C: 960,
+    0xB0702D: 49,
+    0x00204F: 961,
+    0x8CE117: 11,
+    0x688AF0: 11,
+    0xC0210D: 787,
+    0x4CE2F1: 962,
+    0x00DBDF: 25,
+    0xA84041: 963,
+    0x1077B0: 5,
+    0x80D4A5: 15,
+    0x04B0E7: 15,
+    0x446A2E: 15,
+    0xA06FAA: 285,
+    0x94A04E: 964,
+    0xFC10C6: 278,
+    0xF01DBC: 157,
+    0xB0EE7B: 58,
+    0xAC587B: 965,
+    0xB47447: 966,
+    0x0026AB: 378,
+    0x1062EB: 329,
+    0x000894: 967,
+    0x504B5B: 968,
+    0xC8662C: 969,
+    0x8096CA: 885,
+    0x186571: 970,
+    0x2C6FC9: 885,
+    0x000B4F: 971,
+    0x60C798: 971,
+    0xD058A8: 11,
+    0xD071C4: 11,
+    0xB4B384: 972,
+    0xF83F51: 90,
+    0x50D753: 973,
+    0x34D270: 77,
+    0x0CC47A: 974,
+    0xA0CC2B: 102,
+    0x00C003: 975,
+    0x00234A: 13,
+    0x7828CA: 506,
+    0x6CA7FA: 976,
+    0x8C7EB3: 977,
+    0xE0D9E3: 978,
+    0x805EC0: 143,
+    0x0023D2: 979,
+    0x00271C: 426,
+    0x1C40E8: 980,
+    0x2C402B: 981,
+    0x5C6B4F: 982,
+    0x404E36: 983,
+    0x50795B: 984,
+    0x0016D9: 985,
+    0x5001D9: 15,
+    0x2C9924: 258,
+    0xA8E705: 5,
+    0x60A4D0: 90,
+    0x886B0F: 986,
+    0xAC84C9: 3,
+    0x9C62AB: 987,
+    0x188B15: 988,
+    0x4CE173: 12,
+    0x0CD86C: 989,
+    0xDC0B34: 514,
+    0x049790: 990,
+    0x28EED3: 991,
+    0x24C44A: 11,
+    0x98541B: 25,
+    0x007B18: 992,
+    0x144D67: 578,
+    0x0060D6: 993,
+    0x008701: 90,
+    0x5C9960: 90,
+    0x245CBF: 994,
+    0xB0958E: 86,
+    0xC025E9: 86,
+    0x2C3361: 49,
+    0xC8F946: 995,
+    0x00137E: 996,
+    0xD814D6: 997,
+    0x6CEFC6: 998,
+    0x101DC0: 90,
+    0x487B6B: 15,
+    0x883FD3: 15,
+    0x5CA933: 999,
+    0xC8028F: 1000,
+    0x000B14: 1001,
+    0xA46011: 971,
+    0x240D65: 1002,
+    0x78471D: 90,
+    0xA07591: 90,
+    0x0CDFA4: 90,
+    0x68EBAE: 90,
+    0x444E1A: 90,
+    0x002341: 1003,
+    0x407C7D: 81,
+    0x24590B: 1004,
+    0x143365: 1005,
+    0x6CDEA9: 20,
+    0xA8469D: 20,
+    0xD8EC5E: 1006,
+    0xE89F80: 1006,
+    0x0050CB: 1007,
+    0xB072BF: 102,
+    0x701DC4: 1008,
+    0x58EF68: 1006,
+    0xCC03D9: 20,
+    0x0C8DDB: 20,
+    0x5C8613: 1009,
+    0xCC7314: 1010,
+    0xB8EE65: 192,
+    0x985BB0: 1011,
+    0x0011FF: 1012,
+    0x001B94: 1013,
+    0xBC8556: 885,
+    0x342387: 885,
+    0x64DAA0: 1014,
+    0x14B837: 574,
+    0xE47CF9: 90,
+    0x4844F7: 90,
+    0x001377: 90,
+    0x002454: 90,
+    0xE81132: 90,
+    0x50B7C3: 90,
+    0x1C5A3E: 90,
+    0xA02195: 90,
+    0xB07870: 1015,
+    0x5CA39D: 1016,
+    0x90187C: 1016,
+    0x50CCF8: 1016,
+    0x002637: 1016,
+    0x002119: 1016,
+    0xF4D9FB: 90,
+    0x3C6200: 90,
+    0x9439E5: 885,
+    0x642737: 885,
+    0xA41731: 885,
+    0xE006E6: 885,
+    0xF0F002: 885,
+    0xC0CB38: 885,
+    0xF07BCB: 885,
+    0xC417FE: 885,
+    0x00223B: 1017,
+    0xC0F8DA: 885,
+    0x0017D5: 90,
+    0x001E7D: 90,
+    0x001DF6: 90,
+    0x001D25: 90,
+    0xE4C1F1: 1018,
+    0x240AC4: 14,
+    0xF06BCA: 90,
+    0xAC3613: 90,
+    0xBC8CCD: 305,
+    0xD022BE: 305,
+    0xEC9BF3: 305,
+    0x343111: 90,
+    0x08FD0E: 90,
+    0x041BBA: 90,
+    0x889B39: 90,
+    0xE432CB: 90,
+    0x10D542: 90,
+    0xA0821F: 90,
+    0xF409D8: 305,
+    0x18D276: 15,
+    0xC06599: 90,
+    0xBC79AD: 90,
+    0x4C3C16: 90,
+    0x0073E0: 90,
+    0xF0E77E: 90,
+    0xF008F1: 90,
+    0x58C38B: 90,
+    0x002611: 1019,
+    0x005218: 1020,
+    0x00E3B2: 90,
+    0x301966: 90,
+    0x94350A: 90,
+    0xF0038C: 43,
+    0xA81B6A: 53,
+    0x985DAD: 53,
+    0xD43639: 53,
+    0xBC282C: 1021,
+    0xA40DBC: 1022,
+    0xB0F893: 447,
+    0x001E81: 1023,
+    0x641269: 258,
+    0x0002C9: 270,
+    0x7CA97D: 1024,
+    0xA8A648: 906,
+    0x84EF18: 25,
+    0xC411E0: 1025,
+    0x343DC4: 310,
+    0x005094: 258,
+    0xE0B7B1: 258,
+    0xD82522: 258,
+    0x28C87A: 258,
+    0x7C0623: 1026,
+    0x00126C: 1027,
+    0x0080C7: 1028,
+    0x000138: 1029,
+    0x00166D: 1030,
+    0x3C9157: 1030,
+    0x0000D8: 1031,
+    0x14825B: 685,
+    0xAC6175: 15,
+    0x244427: 15,
+    0x48FD8E: 15,
+    0x28AC67: 1032,
+    0x080051: 1033,
+    0x001F46: 1034,
+    0x003093: 1035,
+    0x00034B: 1034,
+    0x000E40: 1034,
+    0x001C9C: 1034,
+    0x001B25: 1034,
+    0x0019E1: 1034,
+    0x28BE03: 274,
+    0x903AE6: 1036,
+    0xA098ED: 1037,
+    0x000EF4: 1038,
+    0x00167A: 1039,
+    0x002561: 1040,
+    0x008058: 1041,
+    0x00157D: 1042,
+    0x4849C7: 90,
+    0x10E878: 81,
+    0xFCB0C4: 1043,
+    0xA89DD2: 1043,
+    0x00E00F: 788,
+    0x00140D: 1034,
+    0x849866: 90,
+    0x1880F5: 817,
+    0x001D42: 1034,
+    0xA42940: 574,
+    0xE4A387: 1044,
+    0x10F96F: 514,
+    0xC4438F: 514,
+    0xA09169: 514,
+    0x286C07: 698,
+    0x002280: 1045,
+    0x404AD4: 1046,
+    0x9893CC: 1047,
+    0x3CCD93: 1047,
+    0x2021A5: 514,
+    0x6CD68A: 514,
+    0x002483: 514,
+    0x001FE3: 514,
+    0x2C54CF: 514,
+    0x485929: 514,
+    0x58A2B5: 514,
+    0x000F62: 1048,
+    0xF485C6: 1049,
+    0x0019AB: 1050,
+    0x4C334E: 1051,
+    0xCC79CF: 787,
+    0x001925: 1052,
+    0x9476B7: 90,
+    0xB8D812: 12,
+    0x1C21D1: 12,
+    0x7C70BC: 12,
+    0xE81863: 12,
+    0x2CD141: 12,
+    0x3C39E7: 12,
+    0xBC6641: 12,
+    0x80E4DA: 12,
+    0x885D90: 12,
+    0xC88ED1: 12,
+    0xB01F81: 12,
+    0x88124E: 1053,
+    0x001B32: 1054,
+    0x0017CA: 1055,
+    0xF0421C: 25,
+    0x001CD8: 1056,
+    0x283638: 12,
+    0xC8755B: 1057,
+    0x4C6641: 305,
+    0xA854B2: 57,
+    0xE09579: 1058,
+    0xA0ADA1: 1059,
+    0xE0ACF1: 4,
+    0x00015B: 1060,
+    0xBCC00F: 5,
+    0x9CA5C0: 146,
+    0x3044A1: 1061,
+    0x00A0A8: 1062,
+    0x70F395: 61,
+    0x90A4DE: 57,
+    0x70E284: 1063,
+    0x0015B7: 1064,
+    0xE89D87: 1064,
+    0x001428: 1065,
+    0x006B9E: 1066,
+    0x5CA86A: 15,
+    0x00C0AB: 1067,
+    0x001D7E: 1068,
+    0xE4FB8F: 1069,
+    0x3876CA: 1070,
+    0xF40A4A: 1071,
+    0x0023F8: 112,
+    0x0019CB: 112,
+    0x10BD55: 1072,
+    0xB40418: 1073,
+    0x90CF7D: 906,
+    0xC449BB: 155,
+    0xFC2D5E: 11,
+    0x2C094D: 1074,
+    0xAC3743: 983,
+    0xF85A00: 1075,
+    0xB8BBAF: 90,
+    0x60C5AD: 90,
+    0x442C05: 800,
+    0x6038E0: 1006,
+    0x8C897A: 1076,
+    0x002550: 1077,
+    0xFC55DC: 1078,
+    0x042758: 15,
+    0x9CE374: 15,
+    0x8CD2E9: 1079,
+    0x50AB3E: 1080,
+    0x24F094: 49,
+    0x086D41: 49,
+    0xECADB8: 49,
+    0x9801A7: 49,
+    0x002552: 1081,
+    0xF4911E: 1082,
+    0x7C738B: 1083,
+    0xB4D5BD: 25,
+    0x98AA3C: 1084,
+    0xDC3752: 1085,
+    0x6879ED: 224,
+    0x608D17: 1086,
+    0x002382: 1087,
+    0xF845AD: 1088,
+    0x000FE2: 955,
+    0x6CE983: 1089,
+    0x28E31F: 40,
+    0xDCD916: 15,
+    0x00022E: 1090,
+    0x0060B0: 607,
+    0xF80F84: 1091,
+    0x44A42D: 274,
+    0x80F62E: 955,
+    0x70F96D: 955,
+    0x083FBC: 11,
+    0x00C0F0: 1092,
+    0x0018D7: 1093,
+    0x001F09: 1094,
+    0xAC620D: 1095,
+    0x1C7370: 1096,
+    0x30E37A: 25,
+    0xBC6A44: 1097,
+    0xF0EE58: 1098,
+    0x4CA003: 1099,
+    0x08000D: 1100,
+    0xB8AEED: 1101,
+    0x0000C9: 1102,
+    0x0040AA: 1103,
+    0x7050AF: 319,
+    0xF4EF9E: 1104,
+    0x1C740D: 112,
+    0x603ECA: 1105,
+    0x9C741A: 15,
+    0xE4A8B6: 15,
+    0x244C07: 15,
+    0x746FF7: 57,
+    0x000DB0: 1106,
+    0x30F6B9: 1107,
+    0xD0B0CD: 1108,
+    0x00020E: 1109,
+    0x200A5E: 1110,
+    0x001F1F: 1111,
+    0xB0E2E5: 5,
+    0x00C164: 4,
+    0xCCB11A: 90,
+    0x703C03: 1112,
+    0x40476A: 1113,
+    0x001FA7: 141,
+    0x9046A2: 1114,
+    0x6479A7: 1115,
+    0x1C5F2B: 329,
+    0xCCD3E2: 1116,
+    0xE4FAED: 90,
+    0x288335: 90,
+    0xDCCF96: 90,
+    0xAC44F2: 1117,
+    0x1CEA1B: 81,
+    0xD4612E: 15,
+    0x54511B: 15,
+    0x68536C: 1118,
+    0xDC2DCB: 1119,
+    0x2C9662: 1120,
+    0x84683E: 25,
+    0x743E2B: 272,
+    0xE0C767: 49,
+    0x80ED2C: 49,
+    0xCCB3AB: 1121,
+    0xE4B318: 25,
+    0xE0CDFD: 1122,
+    0xF03404: 274,
+    0x80D160: 554,
+    0x047E4A: 1123,
+    0x0080E5: 1124,
+    0x9C5C8E: 398,
+    0x30785C: 1125,
+    0x60ACC8: 1126,
+    0xC88722: 1127,
+    0x70661B: 1128,
+    0xB07FB9: 511,
+    0x3C591E: 1129,
+    0x002682: 182,
+    0x0009E1: 182,
+    0x14C126: 882,
+    0x600194: 14,
+    0xD8F710: 1130,
+    0x84BA3B: 1131,
+    0xA87E33: 889,
+    0x002403: 889,
+    0x002404: 889,
+    0x8CA2FD: 1132,
+    0x001B33: 889,
+    0x00194F: 889,
+    0x00BD3A: 882,
+    0x80501B: 882,
+    0xA04E04: 882,
+    0xAC61EA: 49,
+    0x38B54D: 49,
+    0x1C5CF2: 49,
+    0x001262: 889,
+    0x0014A7: 889,
+    0x0015A0: 889,
+    0x0016BC: 889,
+    0x00174B: 889,
+    0x0019B7: 889,
+    0x0017B0: 889,
+    0x0015DE: 889,
+    0x0002EE: 889,
+    0x002669: 889,
+    0x002109: 889,
+    0x002108: 889,
+    0xA4C7DE: 820,
+    0x0019C7: 820,
+    0x70D931: 820,
+    0xC43655: 1133,
+    0xE0B9E5: 1134,
+    0x0270B3: 1135,
+    0x000136: 540,
+    0x0030DA: 829,
+    0x64680C: 829,
+    0x3872C0: 829,
+    0xA80600: 90,
+    0x0060BB: 1136,
+    0xD8B8F6: 1137,
+    0x008077: 1138,
+    0xC4576E: 90,
+    0x508569: 90,
+    0x029D8E: 1139,
+    0x00402A: 1140,
+    0xA0B4A5: 90,
+    0xE4F8EF: 90,
+    0x24F5AA: 90,
+    0x988389: 90,
+    0x84A466: 90,
+    0xF05A09: 90,
+    0x503275: 90,
+    0x08FC88: 90,
+    0xF8D0BD: 90,
+    0x78595E: 90,
+    0x0C1420: 90,
+    0x94B10A: 90,
+    0x3CBBFD: 90,
+    0xA48431: 90,
+    0x140C76: 524,
+    0xD04D2C: 1141,
+    0xB0A737: 1141,
+    0x001BE9: 1142,
+    0xDC64B8: 1143,
+    0x44EE02: 1144,
+    0x5856E8: 258,
+    0xF80BBE: 258,
+    0x001333: 1145,
+    0x58671A: 1146,
+    0x002675: 1147,
+    0x0024FE: 857,
+    0xC02506: 857,
+    0x405D82: 511,
+    0xDCEF09: 511,
+    0xDC446D: 1148,
+    0x745AAA: 15,
+    0x04FE8D: 15,
+    0xA8D3F7: 1149,
+    0x000D92: 1150,
+    0x002163: 234,
+    0xDC4517: 258,
+    0xC8AA21: 258,
+    0xF87B7A: 258,
+    0x4C60DE: 511,
+    0xC43DC7: 511,
+    0x489D24: 1151,
+    0x08BD43: 511,
+    0x0015CE: 258,
+    0x0015A2: 258,
+    0x0015A3: 258,
+    0x0015A4: 258,
+    0x0000CA: 258,
+    0x001FE4: 133,
+    0x002345: 133,
+    0x6C0E0D: 133,
+    0x6C23B9: 133,
+    0x707E43: 258,
+    0x00152F: 258,
+    0x0017EE: 258,
+    0x00111A: 258,
+    0x000F9F: 258,
+    0x002642: 258,
+    0x0024A1: 258,
+    0x002210: 258,
+    0x0022B4: 258,
+    0x002395: 258,
+    0x001A80: 133,
+    0x0012EE: 133,
+    0x001620: 133,
+    0x001963: 133,
+    0x0004BD: 258,
+    0x00E06F: 258,
+    0x8096B1: 258,
+    0x0023AF: 258,
+    0x001FC4: 258,
+    0x001CFB: 258,
+    0x00149A: 258,
+    0x0014E8: 258,
+    0x0019C0: 258,
+    0x3017C8: 133,
+    0x205476: 133,
+    0x703C39: 1152,
+    0x9097D5: 14,
+    0xACD074: 14,
+    0x38E3C5: 278,
+    0x8841FC: 1153,
+    0x98743D: 1154,
+    0xA0F459: 438,
+    0x586356: 438,
+    0x0025D3: 43,
+    0xA04FD4: 1155,
+    0x8CB864: 1156,
+    0x5CE2F4: 1156,
+    0xB8616F: 1157,
+    0x0012CF: 1157,
+    0x0030F1: 1157,
+    0x705A0F: 607,
+    0x4495FA: 1158,
+    0x74C246: 77,
+    0x000FA3: 1159,
+    0x001D6A: 1159,
+    0x0000F4: 1160,
+    0x001577: 1160,
+    0x1C4BD6: 43,
+    0x08A95A: 43,
+    0x94DBC9: 43,
+    0x240A64: 43,
+    0x40E230: 43,
+    0x80D21D: 43,
+    0x709E29: 141,
+    0xA4DB30: 192,
+    0x40F02F: 192,
+    0x0030D3: 1161,
+    0x00A02F: 1155,
+    0xD4D184: 1155,
+    0xD00ED9: 278,
+    0x541473: 1162,
+    0x0CCC26: 1163,
+    0x001F3B: 25,
+    0x00215D: 25,
+    0x00216A: 25,
+    0x001676: 25,
+    0x0016EA: 25,
+    0x90E2BA: 25,
+    0x0026C7: 25,
+    0x0026C6: 25,
+    0x88532E: 25,
+    0xE09467: 25,
+    0x08D40C: 25,
+    0x6C8814: 25,
+    0x7CCCB8: 25,
+    0xF40669: 25,
+    0x001DE1: 25,
+    0xE09D31: 25,
+    0x8086F2: 25,
+    0x303A64: 25,
+    0xACFDCE: 25,
+    0x74C99A: 228,
+    0x5CC213: 1164,
+    0x28101B: 1165,
+    0x001495: 1166,
+    0xC46699: 146,
+    0xC8F230: 69,
+    0x8C0EE3: 69,
+    0x982CBE: 1166,
+    0x640F28: 1166,
+    0x884AEA: 53,
+    0x001B77: 25,
+    0x001CC0: 25,
+    0x104A7D: 25,
+    0x001556: 3,
+    0xC0D044: 3,
+    0xA01B29: 3,
+    0x74E14A: 12,
+    0x0CEFAF: 12,
+    0xF80278: 12,
+    0xA0BB3E: 12,
+    0xB07994: 78,
+    0xA470D6: 78,
+    0xC8CD72: 3,
+    0x0022A4: 1166,
+    0xB499BA: 607,
+    0x0C47C9: 77,
+    0x0050BA: 1167,
+    0x00179A: 1167,
+    0x001CF0: 1167,
+    0x001E58: 1167,
+    0x0022B0: 1167,
+    0x002401: 1167,
+    0x1CAFF7: 329,
+    0x14D64D: 329,
+    0x9094E4: 329,
+    0x0030C5: 1168,
+    0x348AAE: 3,
+    0xF82C18: 1166,
+    0x18017D: 1169,
+    0x944452: 1006,
+    0x0014BF: 1068,
+    0xBC0DA5: 53,
+    0xCC8CE3: 53,
+    0xE0D7BA: 53,
+    0x7C03D8: 3,
+    0xC0AC54: 3,
+    0x2C3996: 3,
+    0xF08261: 3,
+    0xD08CB5: 53,
+    0x00182F: 53,
+    0x0017EA: 53,
+    0x0021BA: 53,
+    0x1CE2CC: 53,
+    0x985945: 53,
+    0xD494A1: 53,
+    0xB0B448: 53,
+    0x287CDB: 1170,
+    0xCCB255: 329,
+    0x28107B: 329,
+    0xFC7516: 329,
+    0x84C9B2: 329,
+    0xC8D3A3: 329,
+    0x3CBB73: 1171,
+    0x047863: 447,
+    0x806AB0: 423,
+    0x48AD08: 15,
+    0x3C5AB4: 210,
+    0xF4F5E8: 210,
+    0x94EB2C: 210,
+    0x4CFB45: 15,
+    0x009ACD: 15,
+    0x70B3D5: 12,
+    0x28ED6A: 49,
+    0x409F87: 1172,
+    0x0CF9C0: 319,
+    0x4CFF12: 1173,
+    0x0CC731: 1174,
+    0xAC9A22: 1175,
+    0x8461A0: 258,
+    0x5C8FE0: 258,
+    0xBCCAB5: 258,
+    0xD039B3: 258,
+    0x000FCC: 258,
+    0x38F23E: 1176,
+    0xACB313: 258,
+    0x0CF893: 258,
+    0x3CDFA9: 258,
+    0x0015D1: 258,
+    0x001DD0: 258,
+    0x001DD3: 258,
+    0x000740: 310,
+    0x0024A5: 310,
+    0xCCE1D5: 310,
+    0xE4F89C: 25,
+    0x2C4138: 607,
+    0x441EA1: 607,
+    0x78E7D1: 607,
+    0x001CC4: 607,
+    0x001E0B: 607,
+    0x6CA100: 25,
+    0xA402B9: 25,
+    0xDC5360: 25,
+    0x000CF1: 1177,
+    0x0012F0: 25,
+    0x5CB901: 607,
+    0xDC4A3E: 607,
+    0x9CB654: 607,
+    0x6C3BE5: 607,
+    0xA0B3CC: 607,
+    0xECB1D7: 607,
+    0x784859: 607,
+    0x3464A9: 607,
+    0x3863BB: 607,
+    0x002264: 607,
+    0x0025B3: 607,
+    0x643150: 607,
+    0x58DC6D: 1178,
+    0x902155: 983,
+    0xD8B377: 983,
+    0xB0F1A3: 1179,
+    0x7CB15D: 15,
+    0x88CF98: 15,
+    0x140467: 1180,
+    0x8030DC: 53,
+    0xB05ADA: 607,
+    0x001083: 607,
+    0xA4D18C: 49,
+    0x241EEB: 49,
+    0xCC25EF: 49,
+    0x942CB3: 132,
+    0x002719: 86,
+    0x40169F: 86,
+    0xF4EC38: 86,
+    0xA4D578: 53,
+    0x246081: 1181,
+    0x00265E: 885,
+    0x00242C: 885,
+    0x808917: 86,
+    0xA09347: 69,
+    0xE8BBA8: 69,
+    0xB0AA36: 69,
+    0x784B87: 102,
+    0xE4CE02: 1182,
+    0x9CD24B: 11,
+    0xC87B5B: 11,
+    0x0019C6: 11,
+    0x001DD9: 885,
+    0x00197D: 885,
+    0x90F652: 86,
+    0x14CF92: 86,
+    0x20DCE6: 86,
+    0x14CC20: 86,
+    0xC03E0F: 319,
+    0x7C4CA5: 319,
+    0xCC4E24: 1183,
+    0x00E052: 1183,
+    0x0014A4: 885,
+    0x78DD08: 885,
+    0x9CD21E: 885,
+    0xF80D43: 885,
+    0x00010F: 1183,
+    0x080088: 1183,
+    0x84742A: 11,
+    0x38F889: 15,
+    0xD07AB5: 15,
+    0x904E2B: 15,
+    0x2008ED: 15,
+    0x40F308: 102,
+    0x0007D8: 520,
+    0xB43052: 15,
+    0x80D09B: 15,
+    0x1C8E5C: 15,
+    0x002568: 15,
+    0x781DBA: 15,
+    0x00259E: 15,
+    0x3475C7: 470,
+    0xB0ADAA: 470,
+    0xFC48EF: 15,
+    0x707BE8: 15,
+    0x4C1FCC: 15,
+    0xD4B110: 15,
+    0xE468A3: 15,
+    0x8853D4: 15,
+    0x04C06F: 15,
+    0x202BC1: 15,
+    0x54A51B: 15,
+    0x006B8E: 1184,
+    0xD46AA8: 15,
+    0xB8BC1B: 15,
+    0x582AF7: 15,
+    0x0034FE: 15,
+    0xC85195: 15,
+    0x40CBA8: 15,
+    0xD46E5C: 15,
+    0x4C8BEF: 15,
+    0xB4475E: 470,
+    0xBCADAB: 470,
+    0xFCA841: 470,
+    0x24D921: 470,
+    0x848371: 470,
+    0x001B4F: 470,
+    0x3400A3: 15,
+    0x00E08F: 4,
+    0x001868: 1185,
+    0x887556: 4,
+    0xFC9947: 4,
+    0x6C2056: 4,
+    0xACF2C5: 4,
+    0x0003DD: 1186,
+    0x005053: 4,
+    0x005050: 4,
+    0x00906D: 4,
+    0x0090AB: 4,
+    0x005054: 4,
+    0x00500B: 4,
+    0x2401C7: 4,
+    0x6886A7: 4,
+    0x08CC68: 4,
+    0x247189: 53,
+    0x987BF3: 53,
+    0xA0F6FD: 53,
+    0xD0B5C2: 53,
+    0x78A504: 53,
+    0x6CECEB: 53,
+    0x5006AB: 4,
+    0x00E0A3: 4,
+    0x00902B: 4,
+    0x3C0E23: 4,
+    0x00E018: 398,
+    0x000C6E: 398,
+    0x000EA6: 398,
+    0x001D60: 398,
+    0x0015F2: 398,
+    0x90E6BA: 398,
+    0x0C2724: 4,
+    0x6C416A: 4,
+    0xECE1A9: 4,
+    0x1CE85D: 4,
+    0xA89D21: 4,
+    0x689CE2: 4,
+    0xC067AF: 4,
+    0xC0255C: 4,
+    0xF44E05: 4,
+    0x881DFC: 4,
+    0xA0F849: 4,
+    0x6CFA89: 4,
+    0xF46D04: 398,
+    0x745E1C: 1187,
+    0x001011: 4,
+    0x00000C: 4,
+    0x046273: 4,
+    0x28CFE9: 49,
+    0x002608: 49,
+    0x0026B0: 49,
+    0x0026BB: 49,
+    0xD49A20: 49,
+    0xF81EDF: 49,
+    0xD8B190: 4,
+    0x80E86F: 4,
+    0xAC7E8A: 4,
+    0x185933: 1185,
+    0x445829: 1185,
+    0x602AD0: 1185,
+    0x001451: 49,
+    0x001E52: 49,
+    0x0021E9: 49,
+    0xCC08E0: 49,
+    0xF0B479: 49,
+    0x00A040: 49,
+    0x003065: 49,
+    0x0023BE: 1185,
+    0x3CD0F8: 49,
+    0x680927: 49,
+    0x6CC26B: 49,
+    0x44D884: 49,
+    0x64200C: 49,
+    0x40B395: 49,
+    0x44FB42: 49,
+    0xE88D28: 49,
+    0x949426: 49,
+    0x207D74: 49,
+    0xF4F15A: 49,
+    0xC86F1D: 49,
+    0xB065BD: 49,
+    0x8C2DAA: 49,
+    0x848506: 49,
+    0x98FE94: 49,
+    0xD8004D: 49,
+    0x1093E9: 49,
+    0x442A60: 49,
+    0xC82A14: 49,
+    0x3C0754: 49,
+    0xC8334B: 49,
+    0x64E682: 49,
+    0x9C207B: 49,
+    0xA4B197: 49,
+    0xA4D1D2: 49,
+    0x28CFDA: 49,
+    0x542696: 49,
+    0x64A3CB: 49,
+    0x30F7C5: 49,
+    0x3090AB: 49,
+    0x045453: 49,
+    0xF4F951: 49,
+    0xC06394: 49,
+    0x18AF8F: 49,
+    0xC8B5B7: 49,
+    0x90B21F: 49,
+    0xB8E856: 49,
+    0x2078F0: 49,
+    0xE0ACCB: 49,
+    0xA0999B: 49,
+    0x24240E: 49,
+    0x903C92: 49,
+    0xAC87A3: 49,
+    0xD8BB2C: 49,
+    0xD04F7E: 49,
+    0x9CF387: 49,
+    0xB418D1: 49,
+    0xF0DBF8: 49,
+    0x48746E: 49,
+    0x34363B: 49,
+    0xD0A637: 49,
+    0x789F70: 49,
+    0xA85B78: 49,
+    0xFCE998: 49,
+    0x0CBC9F: 49,
+    0xD89695: 49,
+    0x1499E2: 49,
+    0xA88E24: 49,
+    0x68AE20: 49,
+    0x54AE27: 49,
+    0xC8F650: 49,
+    0x50D59C: 1188,
+    0x6C4A39: 1189,
+    0x847D50: 1190,
+    0xD81D72: 49,
+    0x341298: 49,
+    0x70E72C: 49,
+    0x70ECE4: 49,
+    0xE034E4: 1191,
+    0x34C9F0: 1192,
+    0x681401: 885,
+    0x50A9DE: 1193,
+    0x3052CB: 192,
+    0x049645: 1194,
+    0x1CCDE5: 1195,
+    0xAC1FD7: 1196,
+    0x88C242: 1197,
+    0xDC82F6: 1198,
+    0x68A828: 15,
+    0xCC20E8: 49,
+    0x6C9354: 1199,
+    0xDCDC07: 1200,
+    0x3891D5: 955,
+    0xBC9C31: 15,
+    0x70480F: 49,
+    0x3CB72B: 1201,
+    0x382187: 1202,
+    0x78D6B2: 1064,
+    0x8CE2DA: 1203,
+    0x489A42: 1204,
+    0x20D160: 13,
+    0xE8DED6: 1205,
+    0x381C23: 1206,
+    0xD88B4C: 1207,
+    0x48BF74: 1208,
+    0x384C90: 258,
+    0xF0B0E7: 49,
+    0x649A12: 1209,
+    0xE4C2D1: 15,
+    0x0469F8: 49,
+    0xAC8995: 43,
+    0x3029BE: 1210,
+    0x48B620: 1211,
+    0x20C3A4: 1212,
+    0xD4F4BE: 95,
+    0xD888CE: 1213,
+    0x845B12: 15,
+    0x205531: 90,
+    0x307CB2: 1214,
+    0x847973: 788,
+    0xE8B4C8: 90,
+    0xD087E2: 90,
+    0xF05B7B: 90,
+    0xB047BF: 90,
+    0x7C0BC6: 90,
+    0x906FA9: 1215,
+    0x60FD56: 1216,
+    0x7CFE90: 270,
+    0x0C756C: 1217,
+    0x10868C: 258,
+    0x44FDA3: 1218,
+    0xD47BB0: 234,
+    0xF0224E: 1219,
+    0xC8F9C8: 1220,
+    0xA8A795: 885,
+    0x9870E8: 1221,
+    0x44656A: 1222,
+    0xC412F5: 329,
+    0x68EDA4: 1223,
+    0x2CC5D3: 272,
+    0x80C5E6: 157,
+    0x10DF8B: 1224,
+    0x606DC7: 885,
+    0xCC5FBF: 1225,
+    0xE02CB2: 1226,
+    0x78EB39: 1227,
+    0x5440AD: 90,
+    0xFCE1FB: 1228,
+    0xE89120: 78,
+    0xD4F9A1: 15,
+    0x145A83: 1229,
+    0xFC8F90: 90,
+    0x54CD10: 879,
+    0xA424DD: 1230,
+    0x804E81: 90,
+    0x48066A: 1231,
+    0x74042B: 1226,
+    0xD05C7A: 1232,
+    0x64167F: 1233,
+    0xC09A71: 1234,
+    0x340B40: 1235,
+    0x144146: 1236,
+    0xBC5C4C: 449,
+    0x887033: 1237,
+    0xDC56E6: 1238,
+    0x900A39: 1239,
+    0xBCF811: 1240,
+    0xE861BE: 1241,
+    0x5870C6: 1242,
+    0x402814: 1243,
+    0xF87AEF: 1244,
+    0x2028BC: 1245,
+    0x40A5EF: 636,
+    0xB856BD: 1246,
+    0xC4924C: 1247,
+    0x749CE3: 1248,
+    0xCC9635: 1249,
+    0x241C04: 1250,
+    0x4480EB: 78,
+    0x50502A: 1251,
+    0x94F19E: 1252,
+    0xD45556: 1253,
+    0xDC60A1: 1254,
+    0x4CA515: 1255,
+    0x7C3CB6: 1256,
+    0x1C7D22: 1257,
+    0x749637: 1258,
+    0x88E603: 1259,
+    0x84C3E8: 1260,
+    0x2CAD13: 1261,
+    0xC48E8F: 885,
+    0x54369B: 1262,
+    0x4062B6: 1263,
+    0x60128B: 1131,
+    0x78ACBF: 1264,
+    0x40D28A: 1265,
+    0x9CD35B: 90,
+    0xA89FBA: 90,
+    0xB88EC6: 1266,
+    0xBCD165: 1185,
+    0x28E476: 1267,
+    0x74A34A: 1268,
+    0x20C06D: 1269,
+    0x08A5C8: 276,
+    0xD05BA8: 11,
+    0xA86405: 1270,
+    0xE4BAD9: 1271,
+    0x10C67E: 1272,
+    0x6828F6: 1273,
+    0x10A659: 1274,
+    0x58856E: 1275,
+    0x4886E8: 157,
+    0xA0A3E2: 659,
+    0x74547D: 1185,
+    0x8C9109: 1276,
+    0x54098D: 1277,
+    0x50F43C: 1278,
+    0xE887A3: 1279,
+    0xD8CB8A: 1280,
+    0xF88479: 1281,
+    0x2C2997: 157,
+    0x00E6E8: 1282,
+    0x70FC8C: 1283,
+    0x2C3796: 1284,
+    0x587FB7: 1285,
+    0xEC59E7: 157,
+    0xC035C5: 1286,
+    0x908C09: 1287,
+    0xDC2F03: 1288,
+    0x380E7B: 1289,
+    0x08EB29: 1290,
+    0x409B0D: 1291,
+    0x4C2C83: 1292,
+    0xD46132: 1293,
+    0x54A050: 398,
+    0x849681: 1294,
+    0x2CA30E: 1295,
+    0x8486F3: 1296,
+    0x6050C1: 1297,
+    0x2C1A31: 1298,
+    0x2012D5: 1299,
+    0x8C5D60: 1300,
+    0x6099D1: 1301,
+    0xB04515: 1302,
+    0xBC6B4D: 81,
+    0xC8D019: 1303,
+    0x902181: 1304,
+    0x58108C: 1305,
+    0x4C7403: 1306,
+    0x1C5216: 1307,
+    0x14488B: 1308,
+    0x80F8EB: 1309,
+    0xD437D7: 11,
+    0x2C010B: 1310,
+    0x784561: 540,
+    0x94CE31: 1311,
+    0x6C6EFE: 1312,
+    0x3808FD: 1313,
+    0x20ED74: 1314,
+    0x6C0273: 1315,
+    0xA056B2: 174,
+    0x44666E: 1316,
+    0x5CB6CC: 1317,
+    0x5C1515: 1318,
+    0x244F1D: 1319,
+    0x94AEE3: 1320,
+    0x04DEDB: 1321,
+    0x1C4840: 1322,
+    0x54DF00: 1323,
+    0x34C5D0: 1324,
+    0x10C37B: 398,
+    0xB40B44: 1325,
+    0x90B686: 102,
+    0xECD9D1: 1326,
+    0x2829CC: 1327,
+    0x3431C4: 857,
+    0x184A6F: 817,
+    0xE85D6B: 1328,
+    0x50FEF2: 1329,
+    0x705B2E: 1330,
+    0xB40AC6: 1331,
+    0xD059E4: 90,
+    0x14A364: 90,
+    0x481A84: 1332,
+    0xDC663A: 1333,
+    0x08DF1F: 389,
+    0x4826E8: 1334,
+    0x581F67: 1335,
+    0xA012DB: 1336,
+    0x488244: 1337,
+    0xC83168: 1338,
+    0xD05AF1: 1339,
+    0x40B3CD: 1340,
+    0x30918F: 1134,
+    0x5CF4AB: 112,
+    0x08B2A3: 1341,
+    0xFCE186: 1342,
+    0x54EF92: 1343,
+    0x0C2026: 1344,
+    0x202564: 814,
+    0xC8D590: 1345,
+    0xA0DA92: 1346,
+    0x54C80F: 86,
+    0xE4D332: 86,
+    0x70305D: 1347,
+    0xD4CFF9: 1348,
+    0x24336C: 13,
+    0xECE512: 1349,
+    0x7CFF62: 1350,
+    0x283B96: 1351,
+    0x648D9E: 1352,
+    0x949F3F: 1353,
+    0x78FEE2: 1354,
+    0xCC95D7: 1066,
+    0xFC09F6: 1355,
+    0xBCF61C: 1356,
+    0x086DF2: 1357,
+    0x687848: 1358,
+    0x48D0CF: 638,
+    0xDCC793: 882,
+    0x444891: 1359,
+    0xFC923B: 882,
+    0xE03F49: 398,
+    0x28656B: 1360,
+    0xCC9F35: 1361,
+    0xF03FF8: 1362,
+    0x5C254C: 1363,
+    0xD42F23: 1364,
+    0x98C0EB: 1365,
+    0xD09C30: 1366,
+    0xECF72B: 1367,
+    0x4CF45B: 1368,
+    0xB06971: 1369,
+    0xC09D26: 1370,
+    0x442938: 1371,
+    0x9C3EAA: 1372,
+    0xF8F005: 1373,
+    0x1CFCBB: 1374,
+    0xB0C554: 329,
+    0xC4E984: 86,
+    0x48EE86: 1375,
+    0x888914: 1376,
+    0xF0321A: 1377,
+    0x24050F: 1378,
+    0xAC2DA3: 1379,
+    0x14C089: 1380,
+    0xF4B6E5: 1381,
+    0xA881F1: 1382,
+    0xD069D0: 1383,
+    0x889CA6: 1384,
+    0x90837A: 1385,
+    0xA43A69: 1386,
+    0xB0D7C5: 1387,
+    0x9C44A6: 1388,
+    0xFC07A0: 1389,
+    0x1CEEE8: 1390,
+    0xFC1349: 1391,
+    0x848433: 1392,
+    0x44C306: 1393,
+    0x602103: 1394,
+    0x60FFDD: 1395,
+    0x88A73C: 1396,
+    0x88D962: 1397,
+    0x9031CD: 1398,
+    0xE48184: 81,
+    0xE056F4: 1399,
+    0x84569C: 1400,
+    0x78AE0C: 1401,
+    0x84A783: 1402,
+    0x80BAE6: 1403,
+    0xF8A2B4: 1404,
+    0xB024F3: 1405,
+    0x0C54A5: 814,
+    0x8C4DB9: 1406,
+    0x4CD9C4: 1407,
+    0x2C5A05: 882,
+    0xD481CA: 1408,
+    0xD858D7: 1409,
+    0x7C6AB3: 1410,
+    0x181BEB: 659,
+    0x78CA5E: 1411,
+    0xB4827B: 1412,
+    0xDC5E36: 1413,
+    0x50E0C7: 1414,
+    0xDCAD9E: 1415,
+    0xB8DF6B: 1416,
+    0x9C8888: 1417,
+    0x041A04: 1418,
+    0x18C8E7: 1419,
+    0xA03B1B: 1420,
+    0x7CCD3C: 1421,
+    0x448A5B: 1422,
+    0x0CCB8D: 1423,
+    0x6C4B7F: 1424,
+    0x688AB5: 1425,
+    0x2493CA: 1426,
+    0x10B26B: 1427,
+    0x4CF02E: 1428,
+    0xDCCEBC: 1429,
+    0x68764F: 133,
+    0x38DBBB: 1430,
+    0x9843DA: 1431,
+    0x08CA45: 1432,
+    0x3CCA87: 1433,
+    0x908C44: 1434,
+    0x34A5E1: 1435,
+    0x6C8366: 1436,
+    0x78D99F: 1437,
+    0x142BD2: 1438,
+    0x9CA10A: 1439,
+    0x88789C: 1440,
+    0x8079AE: 1441,
+    0x7CBD06: 1442,
+    0x94BA56: 1443,
+    0x740EDB: 1444,
+    0xA4895B: 1445,
+    0xD09D0A: 1446,
+    0xEC219F: 1447,
+    0xA8CCC5: 1448,
+    0x988E4A: 1449,
+    0x50B888: 1450,
+    0x54BEF7: 814,
+    0x907990: 1451,
+    0xEC2AF0: 1452,
+    0xF854AF: 1109,
+    0xF0F5AE: 1453,
+    0xF83D4E: 1454,
+    0x7CE56B: 1455,
+    0xD44C9C: 1456,
+    0x20CEC4: 1457,
+    0xCC4703: 1458,
+    0xDC1792: 1459,
+    0x442AFF: 1460,
+    0x7C8306: 1461,
+    0x140D4F: 1462,
+    0xFC3FAB: 1463,
+    0x58468F: 1464,
+    0x985D46: 1465,
+    0xF89FB8: 1466,
+    0x540536: 1467,
+    0x6C90B1: 1468,
+    0xE0FAEC: 1469,
+    0x446755: 1470,
+    0x5422F8: 11,
+    0x486E73: 1471,
+    0xCC7B35: 11,
+    0x04D437: 1472,
+    0xCCF407: 1473,
+    0x088E4F: 1474,
+    0xACCA8E: 1475,
+    0x6405BE: 1476,
+    0xE8BB3D: 1477,
+    0x28A241: 1478,
+    0x30786B: 1479,
+    0x20DF3F: 1436,
+    0x4CD637: 1480,
+    0x9436E0: 1481,
+    0x34A68C: 1482,
+    0x949FB4: 1483,
+    0x509871: 1484,
+    0x048C03: 1485,
+    0x88462A: 1486,
+    0xC80258: 1487,
+    0xF42012: 1488,
+    0x98B039: 81,
+    0xB830A8: 1489,
+    0x406826: 1490,
+    0xF82BC8: 1491,
+    0x60C397: 1166,
+    0xFC6018: 1492,
+    0x0CF019: 1493,
+    0x28285D: 112,
+    0x646EEA: 1494,
+    0xD0737F: 1495,
+    0x58E02C: 1496,
+    0x78B3CE: 1497,
+    0xF8516D: 1498,
+    0x444A65: 1499,
+    0x744BE9: 1500,
+    0xE8CE06: 1501,
+    0xC8F386: 1502,
+    0x2C72C3: 1503,
+    0x2C69BA: 1504,
+    0xD4BF7F: 1505,
+    0xC8DDC9: 1506,
+    0x6C8686: 1507,
+    0xD4AC4E: 1508,
+    0xA4FCCE: 1509,
+    0xE07F88: 1510,
+    0x1C7CC7: 1511,
+    0x341B22: 1512,
+    0x842F75: 1513,
+    0xCC3C3F: 1514,
+    0x341A4C: 1515,
+    0x88142B: 1516,
+    0x70C6AC: 1517,
+    0x0488E2: 1518,
+    0x40560C: 1519,
+    0xA0861D: 1520,
+    0x508D6F: 1521,
+    0x308999: 1522,
+    0xA47ACF: 1523,
+    0xBC261D: 1524,
+    0x204C6D: 1525,
+    0x9C9726: 1134,
+    0x7C0507: 814,
+    0x880905: 1526,
+    0xF4B381: 1527,
+    0x74F102: 1528,
+    0xF0F260: 1529,
+    0x282CB2: 86,
+    0x64E599: 1530,
+    0x40C4D6: 1531,
+    0xA8294C: 1532,
+    0x30D46A: 1533,
+    0xE8DE27: 86,
+    0xC89346: 1534,
+    0x94ACCA: 1535,
+    0x908260: 1536,
+    0xD4EE07: 1537,
+    0xFCAD0F: 1538,
+    0x984C04: 1539,
+    0xACDBDA: 1540,
+    0xA4E991: 1541,
+    0x3C86A8: 1542,
+    0x84F493: 1543,
+    0xBCD177: 86,
+    0x7CD762: 1544,
+    0x901D27: 11,
+    0xF05DC8: 1545,
+    0xCC5D57: 1546,
+    0x081DFB: 1547,
+    0xC44EAC: 1548,
+    0x044CEF: 1549,
+    0x4C804F: 1550,
+    0x64C667: 1146,
+    0x103DEA: 1551,
+    0xD42751: 1552,
+    0x68A40E: 1553,
+    0xF4C6D7: 1554,
+    0x4CCA53: 1555,
+    0x90FF79: 1556,
+    0xD4CA6E: 205,
+    0xB01408: 1557,
+    0x9C3178: 1558,
+    0x983F9F: 1559,
+    0xB838CA: 1560,
+    0xB0C95B: 1561,
+    0x38B5BD: 1562,
+    0x5C43D2: 1563,
+    0xD809C3: 1564,
+    0x2CE871: 1565,
+    0xF87B62: 1566,
+    0x40270B: 1567,
+    0xE4EEFD: 1568,
+    0x105CBF: 1569,
+    0x20918A: 1570,
+    0xA80180: 1571,
+    0x0C5521: 1572,
+    0x7898FD: 1573,
+    0xD063B4: 1574,
+    0x2C441B: 1575,
+    0xE4E409: 1576,
+    0x68B8D9: 1577,
+    0x90CC24: 1578,
+    0xC88A83: 1579,
+    0x8CC5E1: 1580,
+    0x64A341: 1581,
+    0x74FE48: 1582,
+    0x80B95C: 1583,
+    0xA01917: 1584,
+    0x24F2DD: 1585,
+    0xA46E79: 1586,
+    0xB877C3: 1587,
+    0x004D32: 1588,
+    0xFCA9B0: 1589,
+    0x9C8D1A: 1590,
+    0x480362: 1591,
+    0x18673F: 1592,
+    0x7C0A50: 1593,
+    0x40F2E9: 1594,
+    0x744D79: 1595,
+    0x5011EB: 1596,
+    0x54DF63: 1597,
+    0xD493A0: 1598,
+    0x08EBED: 1599,
+    0xEC4993: 1600,
+    0xB0ACFA: 621,
+    0x8CE081: 11,
+    0x3C83B5: 1601,
+    0x28A192: 1602,
+    0x9C541C: 1603,
+    0x8C3330: 1604,
+    0x087BAA: 1605,
+    0xC44567: 1606,
+    0xE45614: 1607,
+    0xA44E2D: 1608,
+    0x0CCDFB: 1609,
+    0x9C0473: 1610,
+    0xB01203: 1611,
+    0x9886B1: 1612,
+    0x7093F8: 1613,
+    0x28B3AB: 1614,
+    0xC4E7BE: 1615,
+    0x58874C: 1616,
+    0x2891D0: 1617,
+    0xC0BD42: 1618,
+    0x2074CF: 1619,
+    0xFC52CE: 1620,
+    0x5C4A26: 1621,
+    0xD8D27C: 1622,
+    0xE0F5CA: 1623,
+    0xA8EF26: 1624,
+    0x60F2EF: 1625,
+    0xC03F2A: 1626,
+    0x381C4A: 634,
+    0x48F8B3: 1068,
+    0xB4DFFA: 1627,
+    0x681CA2: 1628,
+    0x604616: 1629,
+    0x749975: 1630,
+    0xD8C691: 1631,
+    0xE43FA2: 1632,
+    0xF4B72A: 1633,
+    0xDC9FA4: 882,
+    0x44C39B: 1634,
+    0x6C40C6: 1635,
+    0x1048B1: 1636,
+    0x106FEF: 1637,
+    0x2C625A: 1638,
+    0x20DC93: 1639,
+    0x4423AA: 1640,
+    0x7CFE28: 1641,
+    0xE8102E: 1642,
+    0x0C565C: 1643,
+    0x8C6AE4: 1644,
+    0x64517E: 1645,
+    0xD43D7E: 1646,
+    0xACD9D6: 1647,
+    0x48282F: 11,
+    0x88DC96: 1648,
+    0x20443A: 1649,
+    0xECA29B: 1650,
+    0xC4BA99: 1651,
+    0x04CE14: 1652,
+    0x543968: 1653,
+    0x440CFD: 1654,
+    0x8CD3A2: 1655,
+    0x14358B: 1656,
+    0x00F403: 1657,
+    0x547398: 1658,
+    0xC4393A: 1659,
+    0xE8D483: 1660,
+    0x1C8464: 1661,
+    0xEC9327: 1662,
+    0xA0EF84: 1663,
+    0xE0A30F: 1664,
+    0x5C2479: 1665,
+    0xD82DE1: 1666,
+    0xD0D212: 1667,
+    0x80D18B: 1668,
+    0x4088E0: 1669,
+    0xE85484: 1670,
+    0x74AE76: 1671,
+    0x709A0B: 1672,
+    0x346E8A: 1673,
+    0x64F242: 1674,
+    0x60F281: 1675,
+    0x0CC0C0: 1676,
+    0x08379C: 1677,
+    0xD80DE3: 1678,
+    0x60CBFB: 1679,
+    0x7C160D: 1680,
+    0xA497BB: 1681,
+    0x4C5427: 1682,
+    0xEC1A59: 1006,
+    0x881036: 1683,
+    0x68B6FC: 520,
+    0x942197: 1684,
+    0xA0C3DE: 1685,
+    0xD0699E: 1686,
+    0xB0D2F5: 1687,
+    0xB0435D: 1688,
+    0x0808EA: 1689,
+    0xA4934C: 4,
+    0xF0FDA0: 1690,
+    0xB45570: 1691,
+    0x5057A8: 4,
+    0x00DEFB: 4,
+    0x3CA315: 1692,
+    0x100D2F: 1693,
+    0x3C98BF: 1694,
+    0xD0AEEC: 1159,
+    0xE477D4: 1695,
+    0x38E08E: 1696,
+    0x10A932: 1697,
+    0x34FC6F: 1698,
+    0xC0B357: 1699,
+    0xA81758: 1700,
+    0xE81324: 1701,
+    0x142DF5: 1702,
+    0xF83094: 1703,
+    0xC495A2: 1704,
+    0x8C6878: 1705,
+    0x202598: 1706,
+    0x38F8B7: 1707,
+    0xA04CC1: 1708,
+    0x34A7BA: 1709,
+    0xF8D462: 1710,
+    0xA0DC04: 1711,
+    0x40605A: 1712,
+    0x5453ED: 133,
+    0xF473CA: 1713,
+    0xF8F7FF: 1714,
+    0xE4C806: 1715,
+    0xE0F9BE: 1716,
+    0x08B4CF: 1717,
+    0x7C94B2: 1718,
+    0x442B03: 4,
+    0xB88F14: 1719,
+    0x60E956: 1720,
+    0xEC1120: 1721,
+    0xE86D6E: 1722,
+    0x681605: 1723,
+    0x882012: 1724,
+    0x3C4E47: 1725,
+    0xF48771: 1726,
+    0xF897CF: 1727,
+    0xB49EE6: 1728,
+    0xBC4B79: 1729,
+    0xA49005: 1730,
+    0xC40ACB: 4,
+    0xD4A02A: 4,
+    0x88C36E: 1731,
+    0x645422: 1732,
+    0x00376D: 102,
+    0x50008C: 1733,
+    0x34AA99: 81,
+    0x24B88C: 1734,
+    0x4C9E80: 1735,
+    0x5CEB4E: 1736,
+    0x943AF0: 882,
+    0x0463E0: 1737,
+    0x940B2D: 1738,
+    0x306E5C: 1739,
+    0xC894D2: 1740,
+    0xBCFE8C: 1741,
+    0x649EF3: 4,
+    0x24BBC1: 1742,
+    0x9CCAD9: 882,
+    0x046D42: 1743,
+    0xD8E743: 1744,
+    0x80946C: 1745,
+    0x3CE624: 1746,
+    0xD8F0F2: 1747,
+    0x644D70: 1748,
+    0xD0CF5E: 1749,
+    0xDCC101: 1750,
+    0x080D84: 1751,
+    0x88E712: 1752,
+    0xD412BB: 1753,
+    0x806007: 1754,
+    0x94E0D0: 1755,
+    0xDCF858: 1756,
+    0x1803FA: 1757,
+    0xD8052E: 1758,
+    0x183825: 1759,
+    0x7C4B78: 1760,
+    0x64A0E7: 4,
+    0xEC6264: 1761,
+    0x00F051: 1762,
+    0xCCEF48: 4,
+    0x2437EF: 1763,
+    0x28B0CC: 1764,
+    0x205B5E: 1765,
+    0xB0E50E: 1766,
+    0x48C1AC: 830,
+    0x98588A: 1767,
+    0x94319B: 1768,
+    0xE878A1: 1769,
+    0x803F5D: 1770,
+    0x40BF17: 1771,
+    0x780738: 1772,
+    0x2037BC: 1773,
+    0xC8A620: 1774,
+    0xFC946C: 1775,
+    0x407B1B: 1776,
+    0x489BE2: 1777,
+    0x80FFA8: 1778,
+    0x40D559: 1779,
+    0x306CBE: 1780,
+    0x886B76: 1781,
+    0x78F7D0: 1782,
+    0x207600: 659,
+    0xF04B6A: 1783,
+    0x64AE0C: 4,
+    0x00E175: 1784,
+    0xCC501C: 1785,
+    0x04D783: 1786,
+    0xC83B45: 1787,
+    0xC058A7: 1788,
+    0xEC3F05: 1789,
+    0xE8DA96: 1790,
+    0xF013C3: 593,
+    0x04A82A: 882,
+    0xE44E18: 1791,
+    0x148A70: 1792,
+    0xB4D8DE: 1793,
+    0xC8903E: 1794,
+    0xDC2E6A: 1795,
+    0x2046A1: 1796,
+    0xFC01CD: 1797,
+    0x9C8BF1: 1798,
+    0x00B338: 1799,
+    0xE435FB: 1800,
+    0xF0022B: 1801,
+    0xB8288B: 1802,
+    0x90D11B: 1803,
+    0xA06E50: 1804,
+    0x84248D: 1805,
+    0xFCE892: 1806,
+    0x34A55D: 1807,
+    0x4C774F: 1808,
+    0xECBD09: 1809,
+    0x944696: 1145,
+    0x54847B: 1810,
+    0x843F4E: 1811,
+    0xC83232: 1812,
+    0xD453AF: 1813,
+    0x18AD4D: 1814,
+    0x1071F9: 1815,
+    0xB8621F: 4,
+    0x94C6EB: 1816,
+    0x549478: 1817,
+    0x54CDA7: 1818,
+    0x3C2763: 1819,
+    0xB0F1BC: 1820,
+    0x508ACB: 1821,
+    0xD0C282: 4,
+    0x147DB3: 1822,
+    0x3CD16E: 1823,
+    0x40040C: 1824,
+    0x948FEE: 1825,
+    0x50D6D7: 1826,
+    0x00FC70: 1827,
+    0x704AAE: 1828,
+    0x40B3FC: 1829,
+    0xDC3C84: 1830,
+    0xD0131E: 1831,
+    0xC40F09: 1832,
+    0x802E14: 1833,
+    0xD4C1FC: 882,
+    0x34BCA6: 1834,
+    0x5835D9: 4,
+    0x64D912: 1835,
+    0xC47B2F: 1836,
+    0xFC2E2D: 1837,
+    0x587521: 1838,
+    0x18E288: 1839,
+    0xB435F7: 1840,
+    0x9866EA: 1841,
+    0x983000: 1842,
+    0x90CF15: 882,
+    0xF081AF: 1843,
+    0x701404: 1844,
+    0x1C35F1: 1845,
+    0x803457: 1846,
+    0xB09928: 621,
+    0x04E1C8: 1847,
+    0x948B03: 1848,
+    0x48F47D: 1849,
+    0x703AD8: 1850,
+    0x88F077: 4,
+    0x2C0033: 1851,
+    0xAC199F: 1852,
+    0x7C4A82: 1853,
+    0xAC5E8C: 1854,
+    0x94E848: 1855,
+    0x94AAB8: 1856,
+    0x28F358: 1857,
+    0x301A28: 1858,
+    0x3831AC: 1859,
+    0x584C19: 1860,
+    0x3CA72B: 1861,
+    0x285132: 1862,
+    0xE42FF6: 1863,
+    0x84D9C8: 1864,
+    0xB80B9D: 1865,
+    0x5070E5: 1866,
+    0x802275: 1867,
+    0x24C86E: 1868,
+    0xF0AE51: 1869,
+    0x14F0C5: 1870,
+    0xE8C229: 1871,
+    0x5C0CBB: 1872,
+    0x306118: 1873,
+    0x4C7367: 1874,
+    0x90EA60: 1875,
+    0xC4242E: 1876,
+    0xF8EA0A: 1877,
+    0xCCF3A5: 1878,
+    0x14A9E3: 1879,
+    0x14B73D: 1880,
+    0x948D50: 1881,
+    0xA433D1: 1882,
+    0x6469BC: 1883,
+    0xB4F323: 1884,
+    0x14C21D: 1885,
+    0xC88439: 1886,
+    0xF0C27C: 1887,
+    0x283410: 1888,
+    0x0CE82F: 1889,
+    0x40F4EC: 4,
+    0xA41BC0: 1890,
+    0x205B2A: 13,
+    0xF40321: 1891,
+    0xA071A9: 882,
+    0xA4E32E: 1892,
+    0x5CBD9E: 1893,
+    0xF0BF97: 133,
+    0xC44AD0: 1894,
+    0x88E0A0: 1895,
+    0xFC10BD: 1896,
+    0xF87B8C: 1897,
+    0x241A8C: 1898,
+    0xD44F80: 1899,
+    0x08E672: 1900,
+    0xB8E589: 1901,
+    0xEC7D9D: 1902,
+    0xC81E8E: 1903,
+    0xA88792: 1904,
+    0x04E662: 1905,
+    0x64DC01: 1906,
+    0x607688: 1907,
+    0x78CD8E: 1659,
+    0xC8C126: 1908,
+    0x64DE1C: 1909,
+    0xA862A2: 1910,
+    0x984E97: 1911,
+    0x78A683: 1912,
+    0xFC1FC0: 1913,
+    0xBC6784: 1914,
+    0xB4C44E: 1915,
+    0x68DCE8: 1916,
+    0x488E42: 1917,
+    0x2C8065: 1918,
+    0x3CC0C6: 1919,
+    0x4468AB: 1920,
+    0xF81037: 1921,
+    0x707EDE: 1922,
+    0xE05FB9: 4,
+    0xF02572: 4,
+    0x04FF51: 1923,
+    0x4CB4EA: 1924,
+    0xD44C24: 1925,
+    0x8091C0: 1926,
+    0x084EBF: 1927,
+    0xAC02CF: 1928,
+    0xF8C678: 1929,
+    0x6CAB4D: 1930,
+    0x2CB0DF: 1931,
+    0xECE555: 1932,
+    0x58F98E: 1933,
+    0xB4749F: 234,
+    0x7C4AA8: 1934,
+    0xE0143E: 1935,
+    0xC07E40: 1936,
+    0xE44F29: 1937,
+    0x1C7C11: 1938,
+    0x48174C: 1939,
+    0x90507B: 1940,
+    0x20AA25: 1941,
+    0x349A0D: 1942,
+    0xD41296: 1943,
+    0x0876FF: 1944,
+    0x90D852: 1945,
+    0x380197: 1946,
+    0x588D09: 4,
+    0xC0C1C0: 1068,
+    0x0034F1: 1947,
+    0x6015C7: 1948,
+    0xDC2008: 1949,
+    0xA4D1D1: 1950,
+    0xC49313: 1951,
+    0x68597F: 1402,
+    0xF065DD: 1952,
+    0x706582: 1953,
+    0xC4B512: 1954,
+    0xE02538: 1955,
+    0xCC7A30: 1956,
+    0xB88E3A: 1957,
+    0xD4CBAF: 882,
+    0x10E8EE: 1958,
+    0xA47C1F: 1959,
+    0xD46CDA: 1960,
+    0x5CD998: 1167,
+    0x9433DD: 1961,
+    0xE0CF2D: 1962,
+    0xC4EEF5: 1963,
+    0xD491AF: 1964,
+    0x045D56: 1965,
+    0x68234B: 1966,
+    0xA4BE61: 1967,
+    0x58BC27: 4,
+    0x34D2C4: 1968,
+    0x7C3920: 1969,
+    0x9C77AA: 1970,
+    0x1C83B0: 1971,
+    0x1C3DE7: 1972,
+    0x8818AE: 1973,
+    0x20D607: 882,
+    0x443D21: 1974,
+    0x30493B: 1975,
+    0xD07DE5: 1976,
+    0x04DD4C: 1977,
+    0x6CE0B0: 1978,
+    0x9CFFBE: 1979,
+    0x00F860: 1980,
+    0xEC66D1: 1981,
+    0x385FC3: 1982,
+    0x888B5D: 1983,
+    0x18EF63: 4,
+    0x206FEC: 1984,
+    0xA45C27: 1265,
+    0x6C0460: 1985,
+    0x706417: 1986,
+    0xB8BA72: 1987,
+    0x78C6BB: 874,
+    0x100D32: 1988,
+    0x7CED8D: 1989,
+    0x88ACC1: 1990,
+    0xEC7C74: 1991,
+    0xA8B1D4: 4,
+    0xCCFCB1: 1992,
+    0x3C1A79: 1993,
+    0xC802A6: 1994,
+    0xC84C75: 4,
+    0x4C8B55: 1995,
+    0x04A3F3: 1996,
+    0x1C17D3: 4,
+    0x7CE044: 1997,
+    0x284C53: 1998,
+    0x64D02D: 1999,
+    0x68784C: 1034,
+    0x9CF61A: 2000,
+    0x7CF098: 2001,
+    0x8841C1: 2002,
+    0x9C7514: 2003,
+    0x4CF737: 2004,
+    0xF0D767: 2005,
+    0x84A991: 2006,
+    0xF8D756: 2007,
+    0xA40CC3: 4,
+    0x4CBAA3: 2008,
+    0x90513F: 2009,
+    0x00B5D6: 2010,
+    0x548922: 2011,
+    0x6C5CDE: 2012,
+    0x34F39B: 2013,
+    0x4C3089: 2014,
+    0xE86CDA: 2015,
+    0x240B2A: 2016,
+    0x84F64C: 2017,
+    0xC08B6F: 2018,
+    0xECB106: 2019,
+    0x481249: 2020,
+    0x24A937: 2021,
+    0x348302: 2022,
+    0xF86ECF: 2023,
+    0x8C8401: 13,
+    0x408493: 2024,
+    0x6C7039: 2025,
+    0xB43DB2: 2026,
+    0x34BA51: 2027,
+    0x089F97: 2028,
+    0x78A6BD: 2029,
+    0x3C1915: 2030,
+    0x147373: 2031,
+    0xC835B8: 2032,
+    0x982D56: 2033,
+    0xFCCF62: 2034,
+    0x084E1C: 2035,
+    0x88B627: 2036,
+    0xF06853: 2037,
+    0xA4ADB8: 2038,
+    0xE02630: 2039,
+    0x104369: 2040,
+    0xC06C0F: 2041,
+    0x502DF4: 2042,
+    0xA4B121: 2043,
+    0xE02636: 1034,
+    0x5C57C8: 882,
+    0xD46CBF: 2044,
+    0xF89D0D: 2045,
+    0x2C3F3E: 2046,
+    0xECC882: 4,
+    0x6CFDB9: 2047,
+    0xB42CBE: 2048,
+    0xCC2218: 2049,
+    0xC86C1E: 2050,
+    0x90A7C1: 2051,
+    0x80BAAC: 2052,
+    0x746B82: 2053,
+    0x9CC077: 2054,
+    0x3CB17F: 2055,
+    0xCC5459: 2056,
+    0xD4F143: 2057,
+    0xC86CB6: 2058,
+    0xA01859: 2059,
+    0xE8056D: 1034,
+    0xC45976: 2060,
+    0x8C56C5: 1265,
+    0xCCB888: 2061,
+    0x6C5E7A: 2062,
+    0x34862A: 2063,
+    0xB4ED54: 2064,
+    0x2CCD27: 2065,
+    0x10189E: 2066,
+    0x5849BA: 2067,
+    0x00D11C: 2068,
+    0x549A16: 2069,
+    0x601D0F: 2070,
+    0xA8F94B: 978,
+    0x0C8230: 2071,
+    0x50A6E3: 2072,
+    0x50934F: 2073,
+    0xACE348: 2074,
+    0x9018AE: 2075,
+    0x0494A1: 2076,
+    0x003A99: 4,
+    0x003A9A: 4,
+    0x003A98: 4,
+    0xF8DC7A: 2077,
+    0x7072CF: 2078,
+    0xB8B1C7: 2079,
+    0xDC2C26: 2080,
+    0x006440: 4,
+    0x94C4E9: 2081,
+    0x8843E1: 4,
+    0xB8F732: 2082,
+    0xE8DFF2: 2083,
+    0xA4AD00: 2084,
+    0x4C9EE4: 2085,
+    0xC47D4F: 4,
+    0x3CDF1E: 4,
+    0x9C4E8E: 2086,
+    0x042BBB: 2087,
+    0xFC0877: 2088,
+    0xECD00E: 2089,
+    0x986DC8: 2090,
+    0x6CAC60: 2091,
+    0xC87248: 2092,
+    0xF04BF2: 2093,
+    0x1C0FCF: 2094,
+    0x64F970: 2095,
+    0xD411D6: 2096,
+    0x9CAFCA: 4,
+    0xC82E94: 2097,
+    0x7C7BE4: 2098,
+    0xF0DE71: 2099,
+    0x60D30A: 2100,
+    0x24CF21: 2101,
+    0x10BAA5: 2102,
+    0xBC9DA5: 2103,
+    0x28FBD3: 1396,
+    0x586ED6: 13,
+    0xC8D2C1: 2104,
+    0xE09153: 1029,
+    0x64BC11: 2105,
+    0xEC3091: 4,
+    0xF4ACC1: 4,
+    0x4097D1: 2106,
+    0x0CE936: 2107,
+    0x60391F: 2108,
+    0xE8A4C1: 2109,
+    0xD4C766: 2110,
+    0xA02EF3: 2111,
+    0xA09805: 2112,
+    0x00271F: 2113,
+    0x88A5BD: 2114,
+    0x80177D: 1034,
+    0x0026A9: 2115,
+    0x0026A5: 2116,
+    0x0026A3: 2117,
+    0x00269D: 2118,
+    0x0026C5: 2119,
+    0x0026C4: 2120,
+    0x0026C8: 2121,
+    0x0026C2: 2122,
+    0x002697: 2123,
+    0x00268A: 2124,
+    0x002712: 2125,
+    0x0026CF: 2126,
+    0x0026F3: 2127,
+    0x0026E7: 2128,
+    0x0026E0: 2129,
+    0x00270C: 4,
+    0x002703: 2130,
+    0x002612: 2131,
+    0x002616: 2132,
+    0x00260B: 4,
+    0x0025FD: 2133,
+    0x002600: 2134,
+    0x002689: 2135,
+    0x002685: 2136,
+    0x002623: 2137,
+    0x002627: 2138,
+    0x00267A: 2139,
+    0x002664: 2140,
+    0x002659: 1265,
+    0x002651: 4,
+    0x00264E: 2141,
+    0x00264F: 2142,
+    0x002621: 2143,
+    0x00261C: 2144,
+    0x002639: 2145,
+    0x002672: 2146,
+    0x0025E9: 2147,
+    0x0025E6: 2148,
+    0x0025E0: 2149,
+    0x0025DE: 2150,
+    0x0025B0: 2151,
+    0x0025AD: 2152,
+    0x0025AC: 2153,
+    0x0025AB: 2154,
+    0x0025BA: 2155,
+    0x0025BB: 2156,
+    0x0025B1: 2157,
+    0x0025B8: 2158,
+    0x0025CE: 2159,
+    0x0025C6: 2160,
+    0x0025C5: 2161,
+    0x0025C7: 2162,
+    0x0025FF: 2163,
+    0x0025F3: 2164,
+    0x0025EC: 2165,
+    0x0025ED: 2166,
+    0x0025A1: 2167,
+    0x00259A: 2168,
+    0x002591: 2169,
+    0x00258D: 2170,
+    0x0025DD: 2171,
+    0x002537: 2172,
+    0x002538: 2173,
+    0x002544: 2174,
+    0x00254A: 2175,
+    0x00254F: 2176,
+    0x002549: 2177,
+    0x002539: 2178,
+    0x00251C: 2179,
+    0x00251A: 2180,
+    0x002514: 2181,
+    0x002532: 2182,
+    0x002571: 2183,
+    0x002583: 4,
+    0x00255D: 2184,
+    0x002558: 2185,
+    0x0024F8: 2186,
+    0x0024F9: 4,
+    0x0024F2: 2187,
+    0x002507: 2188,
+    0x002502: 2189,
+    0x00250B: 2190,
+    0x002506: 2191,
+    0x0024B5: 1034,
+    0x0024B0: 2192,
+    0x0024E1: 2193,
+    0x0024D9: 2194,
+    0x0024EE: 2195,
+    0x0024E3: 2196,
+    0x0024C3: 4,
+    0x0024C4: 4,
+    0x002469: 2197,
+    0x002464: 2198,
+    0x002462: 2199,
+    0x002494: 2200,
+    0x002489: 2201,
+    0x00247F: 1034,
+    0x002475: 2202,
+    0x00246F: 2203,
+    0x002420: 2204,
+    0x00241E: 1265,
+    0x00241F: 2205,
+    0x002460: 2206,
+    0x00245C: 2207,
+    0x002444: 1265,
+    0x00243D: 2208,
+    0x002437: 2209,
+    0x00249D: 2210,
+    0x00248E: 2211,
+    0x00244F: 2212,
+    0x0023FD: 2213,
+    0x0023E3: 2214,
+    0x0023DD: 2215,
+    0x0023DE: 2216,
+    0x0023D9: 2217,
+    0x0023DA: 2218,
+    0x002413: 4,
+    0x00240E: 2219,
+    0x002405: 2220,
+    0x0023EF: 2221,
+    0x0023E8: 2222,
+    0x0023AC: 4,
+    0x0023B7: 2223,
+    0x0023D8: 2224,
+    0x00231B: 2225,
+    0x00231E: 2226,
+    0x00231F: 2227,
+    0x002270: 2228,
+    0x002313: 2229,
+    0x002310: 2230,
+    0x00235B: 2231,
+    0x002359: 2232,
+    0x002357: 2233,
+    0x002355: 2234,
+    0x002373: 2235,
+    0x002367: 2236,
+    0x002368: 1805,
+    0x00236E: 2237,
+    0x002366: 2238,
+    0x00239F: 2239,
+    0x00239D: 2240,
+    0x002398: 2241,
+    0x00238F: 2242,
+    0x002380: 2243,
+    0x002334: 4,
+    0x00233F: 2244,
+    0x0022CB: 2245,
+    0x0022C6: 2246,
+    0x0022C8: 2247,
+    0x0022C0: 2248,
+    0x002296: 2249,
+    0x0022CD: 2250,
+    0x0022CC: 2251,
+    0x0022EB: 2252,
+    0x0022EF: 2253,
+    0x0022F2: 2254,
+    0x0022E8: 2255,
+    0x0022E9: 2256,
+    0x002278: 2257,
+    0x00227A: 2258,
+    0x0022A7: 2259,
+    0x0022A1: 2260,
+    0x00229D: 2261,
+    0x00230C: 2262,
+    0x002301: 2263,
+    0x0022F7: 2264,
+    0x0022E6: 2265,
+    0x0022E3: 2266,
+    0x0022E2: 2267,
+    0x0022A6: 2268,
+    0x002220: 2269,
+    0x002227: 2270,
+    0x002225: 2271,
+    0x00221E: 2272,
+    0x002237: 2273,
+    0x00222F: 2274,
+    0x002244: 2275,
+    0x002250: 2276,
+    0x00226F: 2277,
+    0x002260: 2278,
+    0x0021F6: 2279,
+    0x002206: 2280,
+    0x002202: 2281,
+    0x00220E: 2282,
+    0x002207: 625,
+    0x00223E: 2283,
+    0x0021CE: 2284,
+    0x0021CA: 2285,
+    0x0021CB: 2286,
+    0x0021C8: 2287,
+    0x0021BF: 2288,
+    0x0021EF: 2289,
+    0x0021ED: 2290,
+    0x0021EB: 2291,
+    0x00219F: 2292,
+    0x002196: 2293,
+    0x00218D: 2294,
+    0x002190: 2295,
+    0x002174: 2296,
+    0x002179: 2297,
+    0x0021DB: 2298,
+    0x0021DF: 2299,
+    0x0021D4: 2300,
+    0x0021D6: 2301,
+    0x0021A8: 2302,
+    0x0021A9: 2303,
+    0x0021A6: 2304,
+    0x0021BC: 2305,
+    0x0021B4: 2306,
+    0x002185: 2307,
+    0x002182: 2308,
+    0x002183: 2309,
+    0x002168: 2310,
+    0x002139: 2311,
+    0x00212C: 2312,
+    0x00212B: 2313,
+    0x00213B: 2314,
+    0x002137: 2315,
+    0x00215E: 2034,
+    0x002155: 4,
+    0x002157: 2316,
+    0x00210C: 2317,
+    0x00210B: 2318,
+    0x002104: 2319,
+    0x001FFB: 2320,
+    0x00212A: 2321,
+    0x00214D: 2322,
+    0x002150: 2323,
+    0x001FF0: 2324,
+    0x001FEA: 2325,
+    0x002110: 2326,
+    0x001F8B: 2327,
+    0x001F85: 2328,
+    0x001F87: 2329,
+    0x001F88: 2330,
+    0x001F86: 2331,
+    0x001F80: 2332,
+    0x001FA5: 2333,
+    0x001F9D: 4,
+    0x001F9F: 1944,
+    0x001FA1: 2334,
+    0x001FE9: 2335,
+    0x001FDD: 2336,
+    0x001FCE: 2337,
+    0x001B58: 2338,
+    0x001F79: 2339,
+    0x001F71: 2340,
+    0x001FDA: 1034,
+    0x001FD9: 2341,
+    0x001FB0: 2342,
+    0x001FAE: 2343,
+    0x001F99: 2344,
+    0x001F96: 2345,
+    0x001F6C: 4,
+    0x001F6F: 2346,
+    0x001F60: 2347,
+    0x001F6A: 2348,
+    0x001F65: 2349,
+    0x001F5E: 2350,
+    0x001EE8: 2351,
+    0x001EEE: 2352,
+    0x001EE0: 2353,
+    0x001EDA: 2354,
+    0x001F17: 2355,
+    0x001F55: 2356,
+    0x001F54: 2357,
+    0x001F4B: 2358,
+    0x001F40: 2359,
+    0x001EFC: 2360,
+    0x001F06: 2361,
+    0x001EFA: 2362,
+    0x001EFB: 2363,
+    0x001EF8: 2364,
+    0x001F1B: 2365,
+    0x001F0D: 2366,
+    0x001F2E: 2367,
+    0x001ECB: 2368,
+    0x001EBA: 2369,
+    0x001E9F: 2370,
+    0x001E9B: 2371,
+    0x001ED7: 2372,
+    0x001ED5: 2373,
+    0x001EB4: 2374,
+    0x001EA8: 2375,
+    0x001EAB: 2376,
+    0x001E61: 2377,
+    0x001E59: 2378,
+    0x001E71: 2379,
+    0x001E6B: 1185,
+    0x001E70: 2380,
+    0x001E51: 2381,
+    0x001E47: 2382,
+    0x001E48: 2383,
+    0x001E8A: 2384,
+    0x001E1B: 2385,
+    0x001E17: 2386,
+    0x001E18: 2387,
+    0x001E15: 2388,
+    0x001DC4: 2389,
+    0x001DC0: 2390,
+    0x001DBD: 2391,
+    0x001DF8: 2392,
+    0x001DF9: 2393,
+    0x001DF7: 2394,
+    0x001E05: 2395,
+    0x001E07: 2396,
+    0x001E0A: 2397,
+    0x001E03: 2398,
+    0x001E38: 2399,
+    0x001E30: 2400,
+    0x001E2E: 2401,
+    0x001DEB: 2402,
+    0x001DDC: 2403,
+    0x001E3E: 2404,
+    0x001DB7: 2405,
+    0x001D9D: 2406,
+    0x001D9E: 2407,
+    0x001D9A: 2408,
+    0x001D97: 2409,
+    0x001D43: 2410,
+    0x001D3F: 2411,
+    0x001D39: 2412,
+    0x001D37: 2413,
+    0x001D30: 2414,
+    0x001D7F: 2415,
+    0x001D70: 4,
+    0x001D79: 2416,
+    0x001D6F: 2417,
+    0x001D78: 2418,
+    0x001D62: 2419,
+    0x001D63: 2420,
+    0x001DAE: 2421,
+    0x001DA6: 2422,
+    0x001D91: 2423,
+    0x001D95: 2424,
+    0x001D8D: 2425,
+    0x001D13: 2426,
+    0x001D10: 2427,
+    0x001D14: 2428,
+    0x001CBB: 2429,
+    0x001CB2: 2430,
+    0x001CB5: 2431,
+    0x001CB4: 2432,
+    0x001CB6: 2433,
+    0x001D1F: 2434,
+    0x001CCD: 2435,
+    0x001CC7: 2436,
+    0x001D04: 2437,
+    0x001CD0: 2438,
+    0x001C9F: 2439,
+    0x001CEC: 2440,
+    0x001CE8: 2441,
+    0x001CF2: 2442,
+    0x001C1F: 2443,
+    0x001C16: 2444,
+    0x001C19: 2445,
+    0x001C47: 2446,
+    0x001C49: 2447,
+    0x001C3F: 2448,
+    0x001C3B: 2449,
+    0x001C32: 2450,
+    0x001C63: 2451,
+    0x001C5C: 2452,
+    0x001C52: 2453,
+    0x001C8D: 2454,
+    0x001C89: 2455,
+    0x001C87: 2456,
+    0x001C7D: 2457,
+    0x001C77: 2458,
+    0x001C6F: 2459,
+    0x001C6C: 2460,
+    0x001C61: 2461,
+    0x001C2B: 2462,
+    0x001C28: 2463,
+    0x001C09: 2464,
+    0x001C0C: 2465,
+    0x001B9B: 2466,
+    0x001B9C: 2467,
+    0x001B92: 2468,
+    0x001B8E: 2469,
+    0x001BE8: 2470,
+    0x001BE1: 2471,
+    0x001BDF: 2472,
+    0x001BEC: 2473,
+    0x001BB4: 2474,
+    0x001BB6: 2475,
+    0x001BA6: 2476,
+    0x001B8A: 2477,
+    0x001B80: 2478,
+    0x001B76: 2479,
+    0x001B70: 2480,
+    0x001BC7: 2481,
+    0x001BA4: 2482,
+    0x001B93: 2483,
+    0x001BD9: 2484,
+    0x001B07: 2485,
+    0x001B08: 2486,
+    0x001B01: 2487,
+    0x001B02: 2488,
+    0x001AFC: 2489,
+    0x001B6C: 2490,
+    0x001B6B: 2491,
+    0x001B69: 2492,
+    0x001B68: 2493,
+    0x001B62: 2494,
+    0x001B3F: 1040,
+    0x001B41: 2495,
+    0x001B3E: 2496,
+    0x001B37: 2497,
+    0x001B10: 2498,
+    0x001B0B: 2499,
+    0x001B0C: 4,
+    0x001B23: 2500,
+    0x001B18: 2501,
+    0x001AF6: 2502,
+    0x001AF9: 2503,
+    0x001AE0: 2504,
+    0x001B50: 2505,
+    0x001B30: 2506,
+    0x001B47: 2507,
+    0x001B45: 2508,
+    0x001ABE: 2509,
+    0x001AC1: 2510,
+    0x001ABB: 2511,
+    0x001ABD: 2512,
+    0x001AAE: 2513,
+    0x001A58: 2514,
+    0x001A5E: 2515,
+    0x001A87: 2516,
+    0x001A88: 2517,
+    0x001A74: 2518,
+    0x001AB4: 2519,
+    0x001AB5: 2520,
+    0x001A79: 2521,
+    0x001AAA: 2522,
+    0x001A8B: 2523,
+    0x001A8D: 2524,
+    0x001A95: 2525,
+    0x001A81: 2526,
+    0x001AD7: 2527,
+    0x001ACD: 2528,
+    0x001AE2: 4,
+    0x001AE7: 2529,
+    0x001AC9: 2530,
+    0x001AA4: 2531,
+    0x001A9F: 2532,
+    0x001A24: 2533,
+    0x001A20: 2534,
+    0x001A19: 2535,
+    0x001A18: 2536,
+    0x001A5C: 2537,
+    0x001A5B: 2538,
+    0x001A4E: 2539,
+    0x001A52: 2540,
+    0x001A13: 2541,
+    0x001A0F: 2542,
+    0x001A43: 2543,
+    0x001A47: 2544,
+    0x001A03: 2545,
+    0x0019F9: 2546,
+    0x0019F2: 2547,
+    0x001A2F: 4,
+    0x001A2D: 2548,
+    0x00198D: 2549,
+    0x001985: 2550,
+    0x001986: 2551,
+    0x0019A9: 4,
+    0x0019AE: 2552,
+    0x0019AF: 2553,
+    0x0019A7: 2554,
+    0x0019DE: 2555,
+    0x0019E5: 2556,
+    0x0019DB: 2557,
+    0x00199E: 2558,
+    0x00196A: 2559,
+    0x0019CE: 2560,
+    0x0019BD: 2561,
+    0x00196B: 2562,
+    0x00199F: 2563,
+    0x0018FF: 2564,
+    0x0018F4: 2565,
+    0x0018F6: 1944,
+    0x0018FC: 2566,
+    0x0018F5: 2567,
+    0x0018F9: 2568,
+    0x00193B: 2569,
+    0x001935: 2570,
+    0x001932: 2571,
+    0x001931: 2572,
+    0x001914: 2573,
+    0x001901: 2574,
+    0x001906: 4,
+    0x00193D: 2575,
+    0x001910: 2576,
+    0x001913: 2577,
+    0x001951: 2578,
+    0x0018FA: 2579,
+    0x0018EA: 2580,
+    0x0018E8: 2581,
+    0x001957: 2582,
+    0x001956: 4,
+    0x001958: 2583,
+    0x0018E3: 2584,
+    0x001899: 2585,
+    0x00189F: 2586,
+    0x0018B7: 2587,
+    0x0018C1: 2588,
+    0x0018C4: 2589,
+    0x0018C9: 2590,
+    0x0018BC: 2591,
+    0x00185D: 2592,
+    0x00185E: 2593,
+    0x00186D: 2594,
+    0x00186F: 2595,
+    0x001875: 2596,
+    0x0018D8: 2597,
+    0x0018D9: 2598,
+    0x0018CF: 2599,
+    0x00188E: 2600,
+    0x001883: 2601,
+    0x001895: 2602,
+    0x00184A: 2603,
+    0x00184B: 2604,
+    0x0017BB: 2605,
+    0x0017BC: 2606,
+    0x0017C1: 2607,
+    0x0017B2: 2608,
+    0x0017B1: 2609,
+    0x0017E1: 2610,
+    0x0017E0: 4,
+    0x0017D2: 2611,
+    0x0017C7: 2612,
+    0x001814: 2613,
+    0x001817: 2614,
+    0x001811: 2615,
+    0x0017DE: 2616,
+    0x0017D7: 2617,
+    0x001837: 2618,
+    0x001822: 2619,
+    0x001820: 2620,
+    0x0017B8: 2621,
+    0x001828: 2622,
+    0x001835: 2623,
+    0x00180E: 2624,
+    0x001801: 659,
+    0x0017F3: 2625,
+    0x001750: 2626,
+    0x001755: 2627,
+    0x001751: 2628,
+    0x0017A3: 2629,
+    0x0017A6: 2630,
+    0x00179C: 2631,
+    0x001796: 2632,
+    0x001775: 2633,
+    0x001776: 2634,
+    0x001779: 2635,
+    0x001767: 2636,
+    0x00177C: 2637,
+    0x001781: 2638,
+    0x001785: 2639,
+    0x00172C: 2640,
+    0x00174C: 2641,
+    0x001745: 2642,
+    0x001748: 2643,
+    0x00178D: 2644,
+    0x00178E: 2645,
+    0x001763: 2646,
+    0x00175D: 2647,
+    0x001739: 2648,
+    0x00171D: 2649,
+    0x001718: 2650,
+    0x001719: 2651,
+    0x0016FF: 2652,
+    0x001701: 2653,
+    0x00170E: 4,
+    0x001705: 2654,
+    0x0016DA: 2655,
+    0x0016D4: 2656,
+    0x0016D7: 2657,
+    0x0016D1: 2658,
+    0x001711: 2659,
+    0x001717: 2660,
+    0x001715: 2661,
+    0x0016C5: 2662,
+    0x0016CC: 2663,
+    0x0016EE: 2664,
+    0x0016ED: 2665,
+    0x0016DE: 2666,
+    0x001672: 2667,
+    0x001671: 2668,
+    0x001669: 2669,
+    0x001668: 2670,
+    0x001655: 2671,
+    0x001646: 4,
+    0x001648: 2672,
+    0x0016AA: 2673,
+    0x0016A8: 2674,
+    0x0016A6: 2675,
+    0x0016A2: 2676,
+    0x00167D: 2677,
+    0x001677: 2678,
+    0x00165A: 2679,
+    0x001659: 2680,
+    0x0016C7: 4,
+    0x001695: 2681,
+    0x0015DF: 2682,
+    0x0015D8: 2683,
+    0x0015D2: 2684,
+    0x0015D4: 2685,
+    0x0015D6: 2686,
+    0x0015D5: 2687,
+    0x0015F1: 2688,
+    0x0015EA: 2689,
+    0x0015E2: 2690,
+    0x0015E1: 2691,
+    0x00160C: 2692,
+    0x001612: 2693,
+    0x00160B: 2694,
+    0x001603: 2695,
+    0x001609: 2696,
+    0x001640: 2697,
+    0x00163C: 2698,
+    0x001619: 2699,
+    0x00161D: 2700,
+    0x001611: 2701,
+    0x0015C7: 4,
+    0x001625: 2702,
+    0x001623: 2703,
+    0x0015F5: 2704,
+    0x00158B: 2705,
+    0x001586: 2706,
+    0x00157E: 2707,
+    0x001580: 2708,
+    0x00157C: 2709,
+    0x00157F: 2710,
+    0x001533: 2711,
+    0x001537: 2712,
+    0x001534: 2713,
+    0x00159D: 2714,
+    0x001592: 2715,
+    0x00155C: 2716,
+    0x001559: 2717,
+    0x001557: 2718,
+    0x001554: 2719,
+    0x0015B3: 2720,
+    0x0015AA: 2721,
+    0x00153F: 2722,
+    0x001576: 2723,
+    0x0015BE: 2724,
+    0x00155E: 2725,
+    0x001502: 2726,
+    0x0014FD: 2727,
+    0x0014FC: 2728,
+    0x0014F8: 2729,
+    0x0014F7: 2730,
+    0x00150F: 2731,
+    0x00150B: 2732,
+    0x001507: 2733,
+    0x001508: 2734,
+    0x0014E5: 2735,
+    0x0014E0: 2736,
+    0x0014E2: 2737,
+    0x0014E4: 2738,
+    0x001518: 2739,
+    0x001515: 2740,
+    0x001526: 2741,
+    0x0014F1: 4,
+    0x0014EA: 2742,
+    0x0014CB: 2743,
+    0x0014C6: 2744,
+    0x0014DB: 2745,
+    0x0014CC: 2746,
+    0x001474: 2747,
+    0x00146F: 2748,
+    0x001466: 2749,
+    0x00146B: 2750,
+    0x00149F: 2751,
+    0x001498: 2752,
+    0x001496: 2753,
+    0x001493: 2754,
+    0x00143D: 2755,
+    0x00143A: 2756,
+    0x001461: 2757,
+    0x001462: 2758,
+    0x001463: 2759,
+    0x001465: 2760,
+    0x00148D: 2761,
+    0x001486: 2762,
+    0x001482: 2763,
+    0x001436: 2764,
+    0x001433: 2765,
+    0x001434: 2766,
+    0x00147F: 1944,
+    0x001475: 2767,
+    0x001455: 2768,
+    0x00144E: 2769,
+    0x0014B3: 2770,
+    0x0014B1: 2771,
+    0x0013A4: 2772,
+    0x0013A7: 2773,
+    0x0013A6: 2774,
+    0x00139F: 2775,
+    0x0013A2: 2776,
+    0x0013A0: 2777,
+    0x001398: 2778,
+    0x001415: 2779,
+    0x001410: 2780,
+    0x001417: 2781,
+    0x001408: 2782,
+    0x001423: 2783,
+    0x001425: 2784,
+    0x001419: 2785,
+    0x0013E2: 2786,
+    0x0013DE: 2787,
+    0x0013DD: 2788,
+    0x0013D7: 2789,
+    0x0013C7: 2790,
+    0x0013B2: 2791,
+    0x0013AD: 2792,
+    0x0013AA: 2793,
+    0x0013EE: 2794,
+    0x0013E5: 2795,
+    0x001402: 2796,
+    0x0013FF: 2797,
+    0x0013BC: 2798,
+    0x001384: 2799,
+    0x00137B: 588,
+    0x00134A: 2800,
+    0x00133A: 2801,
+    0x00132A: 2802,
+    0x00139B: 2803,
+    0x001396: 2804,
+    0x001393: 2805,
+    0x00138B: 2806,
+    0x001388: 2807,
+    0x001353: 2808,
+    0x00134D: 2809,
+    0x00134B: 2810,
+    0x001334: 2811,
+    0x001337: 2812,
+    0x001332: 2813,
+    0x00131F: 2814,
+    0x00136E: 2815,
+    0x00136D: 2816,
+    0x00136A: 2817,
+    0x00130E: 2818,
+    0x001309: 2819,
+    0x001319: 4,
+    0x00131C: 2820,
+    0x001363: 2821,
+    0x0012FF: 2822,
+    0x001303: 2823,
+    0x0012F9: 2824,
+    0x001304: 2825,
+    0x0012B3: 2826,
+    0x0012B0: 2827,
+    0x0012A6: 2828,
+    0x0012A4: 2829,
+    0x0012A9: 2510,
+    0x0012DC: 2830,
+    0x0012D7: 2831,
+    0x0012C4: 2832,
+    0x0012D0: 2833,
+    0x0012E5: 2834,
+    0x0012B8: 2835,
+    0x001299: 2836,
+    0x001280: 4,
+    0x001275: 2837,
+    0x001276: 2838,
+    0x001271: 2839,
+    0x001273: 2840,
+    0x001269: 2841,
+    0x001264: 2842,
+    0x001261: 2843,
+    0x001260: 2844,
+    0x00128C: 2845,
+    0x001293: 2846,
+    0x001294: 2847,
+    0x001296: 2848,
+    0x001258: 2849,
+    0x001250: 2850,
+    0x001252: 2851,
+    0x00127F: 4,
+    0x00127B: 2852,
+    0x001240: 2853,
+    0x00122E: 2854,
+    0x001231: 2855,
+    0x001224: 2856,
+    0x00124B: 53,
+    0x00124A: 2857,
+    0x001243: 4,
+    0x001203: 2858,
+    0x0011F8: 2859,
+    0x0011F4: 2860,
+    0x0011F6: 2861,
+    0x0011F0: 2862,
+    0x0011F1: 2863,
+    0x0011AA: 2864,
+    0x0011B1: 2865,
+    0x0011DB: 2866,
+    0x0011D2: 2867,
+    0x0011D9: 2868,
+    0x0011CF: 2869,
+    0x0011D4: 2870,
+    0x0011D5: 2871,
+    0x0011CC: 2872,
+    0x0011C7: 2873,
+    0x0011C9: 2874,
+    0x001211: 2875,
+    0x001219: 2876,
+    0x001216: 2877,
+    0x001215: 2878,
+    0x0011A6: 2879,
+    0x0011A2: 2880,
+    0x00119E: 2881,
+    0x0011B5: 2882,
+    0x0011BB: 4,
+    0x0011BD: 2883,
+    0x0011ED: 2884,
+    0x00111C: 2885,
+    0x001125: 2034,
+    0x00111F: 2886,
+    0x00111D: 2887,
+    0x001119: 2888,
+    0x001184: 2889,
+    0x00117E: 2890,
+    0x001152: 2891,
+    0x001150: 2892,
+    0x001166: 2893,
+    0x001164: 2894,
+    0x001155: 2895,
+    0x001146: 2896,
+    0x00114C: 2897,
+    0x001141: 2898,
+    0x00118A: 2899,
+    0x001179: 2900,
+    0x001173: 2901,
+    0x00112C: 2902,
+    0x000FCF: 2903,
+    0x000FD2: 2904,
+    0x000FCE: 2905,
+    0x000FA1: 2906,
+    0x000F99: 2907,
+    0x000FE8: 2908,
+    0x000FEB: 2909,
+    0x000FDC: 2910,
+    0x000FF4: 2911,
+    0x000FF8: 4,
+    0x000FF5: 2912,
+    0x000FD7: 2913,
+    0x000FD4: 2914,
+    0x001114: 2915,
+    0x00110E: 2916,
+    0x00110D: 2917,
+    0x000FA5: 2918,
+    0x000FB2: 2919,
+    0x001106: 2920,
+    0x000FAF: 2921,
+    0x000F43: 2922,
+    0x000F48: 2923,
+    0x000F50: 2924,
+    0x000F47: 2925,
+    0x000F4E: 2926,
+    0x000F31: 2927,
+    0x000F29: 2928,
+    0x000F27: 2929,
+    0x000F8E: 2930,
+    0x000F91: 2931,
+    0x000F73: 2932,
+    0x000F78: 2933,
+    0x000F70: 2934,
+    0x000F87: 2935,
+    0x000F80: 2936,
+    0x000F5F: 2937,
+    0x000F5A: 2938,
+    0x000F74: 2939,
+    0x000F6D: 2940,
+    0x000F3C: 2941,
+    0x000F18: 2942,
+    0x000F1D: 2943,
+    0x000F1B: 2944,
+    0x000F0F: 2945,
+    0x000F16: 2946,
+    0x000EF8: 2947,
+    0x000EF9: 2948,
+    0x000EF6: 2949,
+    0x000EEA: 2950,
+    0x000EAD: 2951,
+    0x000EAF: 2952,
+    0x000EE6: 2953,
+    0x000EC6: 2954,
+    0x000EBF: 2955,
+    0x000EE0: 2956,
+    0x000EAB: 2957,
+    0x000E9F: 2958,
+    0x000E92: 2959,
+    0x000E96: 2960,
+    0x000E8E: 2961,
+    0x000E91: 2962,
+    0x000E14: 2963,
+    0x000E1B: 2964,
+    0x000E0F: 2965,
+    0x000E10: 2966,
+    0x000E13: 2967,
+    0x000E0A: 2968,
+    0x000E7C: 2969,
+    0x000E73: 2970,
+    0x000E6E: 2971,
+    0x000E56: 2972,
+    0x000E55: 2973,
+    0x000E53: 2974,
+    0x000E66: 2975,
+    0x000E68: 2976,
+    0x000E33: 2977,
+    0x000E3A: 2978,
+    0x000E3B: 2979,
+    0x000E84: 4,
+    0x000E87: 2980,
+    0x000E75: 2981,
+    0x000E48: 2982,
+    0x000E3E: 2983,
+    0x000E27: 2984,
+    0x000E18: 2985,
+    0x000D9B: 2986,
+    0x000D8A: 2987,
+    0x000D8E: 2988,
+    0x000DCD: 2989,
+    0x000DCF: 2990,
+    0x000DCA: 2991,
+    0x000DDE: 2992,
+    0x000DE2: 2993,
+    0x000DDA: 2994,
+    0x000DD6: 2995,
+    0x000DD5: 2996,
+    0x000E0E: 2997,
+    0x000DFD: 2998,
+    0x000DF9: 2999,
+    0x000DFB: 3000,
+    0x000E00: 3001,
+    0x000DF4: 3002,
+    0x000DFA: 3003,
+    0x000DFC: 3004,
+    0x000DFE: 3005,
+    0x000DB8: 3006,
+    0x000DC4: 3007,
+    0x000DEC: 4,
+    0x000DF2: 13,
+    0x000DA0: 3008,
+    0x000D4F: 3009,
+    0x000D47: 3010,
+    0x000D43: 3011,
+    0x000D44: 3012,
+    0x000D3D: 3013,
+    0x000D3E: 3014,
+    0x000D5A: 3015,
+    0x000D61: 3016,
+    0x000D36: 3017,
+    0x000D3B: 3018,
+    0x000D1A: 3019,
+    0x000D1E: 3020,
+    0x000D0D: 3021,
+    0x000D06: 3022,
+    0x000D52: 3023,
+    0x000D4A: 3024,
+    0x000D7C: 3025,
+    0x000D6B: 1377,
+    0x000D71: 3026,
+    0x000D2D: 3027,
+    0x000D7E: 3028,
+    0x000CA7: 3029,
+    0x000CA0: 3030,
+    0x000CBE: 3031,
+    0x000CBD: 3032,
+    0x000CB2: 3033,
+    0x000CB9: 3034,
+    0x000CB8: 3035,
+    0x000C88: 3036,
+    0x000C82: 3037,
+    0x000C7C: 3038,
+    0x000D03: 3039,
+    0x000CFF: 3040,
+    0x000CFA: 3041,
+    0x000CFD: 3042,
+    0x000CBB: 3043,
+    0x000CC0: 3044,
+    0x000CA8: 3045,
+    0x000CEB: 3046,
+    0x000CD3: 3047,
+    0x000CD7: 3048,
+    0x000CD4: 3049,
+    0x000C99: 3050,
+    0x000C89: 3051,
+    0x000CCC: 3052,
+    0x000CC7: 3053,
+    0x000C7B: 3054,
+    0x000C77: 3055,
+    0x000C64: 3056,
+    0x000C5A: 3057,
+    0x000C5E: 3058,
+    0x000C61: 3059,
+    0x000C5F: 3060,
+    0x000C4B: 3061,
+    0x000C05: 3062,
+    0x000C27: 3063,
+    0x000C2A: 3064,
+    0x000C22: 3065,
+    0x000C1C: 3066,
+    0x000C69: 3067,
+    0x000C66: 3068,
+    0x000C45: 3069,
+    0x000C3C: 3070,
+    0x000C0F: 3071,
+    0x000C38: 3072,
+    0x000C4E: 3073,
+    0x000BC4: 3074,
+    0x000BAF: 3075,
+    0x000BB6: 3076,
+    0x000BB7: 3077,
+    0x000BB3: 3078,
+    0x000BE6: 3079,
+    0x000BAE: 3080,
+    0x000BD9: 3081,
+    0x000BF2: 3082,
+    0x000BEB: 3083,
+    0x000BEF: 3084,
+    0x000BDF: 3085,
+    0x000BF5: 3086,
+    0x000BFE: 3087,
+    0x000B7D: 3088,
+    0x000B94: 3089,
+    0x000BAB: 3090,
+    0x000BBA: 3091,
+    0x000B57: 238,
+    0x000B51: 3092,
+    0x000B53: 3093,
+    0x000B6D: 3094,
+    0x000B62: 3095,
+    0x000B64: 3096,
+    0x000B67: 3097,
+    0x000B48: 3098,
+    0x000AFB: 3099,
+    0x000AFF: 3100,
+    0x000B4A: 3101,
+    0x000B37: 3102,
+    0x000B2D: 3103,
+    0x000B1E: 3104,
+    0x000B1C: 3105,
+    0x000AF8: 3106,
+    0x000B17: 3107,
+    0x000A9A: 3108,
+    0x000A94: 3109,
+    0x000A97: 3110,
+    0x000A92: 3111,
+    0x000A64: 3112,
+    0x000A62: 3113,
+    0x000A6A: 3114,
+    0x000A66: 3115,
+    0x000AA3: 3116,
+    0x000AA7: 3117,
+    0x000AA6: 3118,
+    0x000AC7: 3119,
+    0x000ABF: 3120,
+    0x000ABC: 3121,
+    0x000A70: 3122,
+    0x000A72: 3123,
+    0x000A71: 3124,
+    0x000ADE: 3125,
+    0x000AE2: 3126,
+    0x000AD4: 3127,
+    0x000ACA: 3128,
+    0x000ACE: 3129,
+    0x000AAC: 3130,
+    0x000AB8: 4,
+    0x000A85: 3131,
+    0x000A83: 3132,
+    0x000A86: 3133,
+    0x000A50: 3134,
+    0x000A58: 3135,
+    0x000A4E: 3136,
+    0x000A3D: 3137,
+    0x000A46: 3138,
+    0x0009F6: 3139,
+    0x000A01: 3140,
+    0x0009EE: 3141,
+    0x000A31: 3142,
+    0x004252: 3143,
+    0x000A20: 3144,
+    0x000A24: 3145,
+    0x000A19: 3146,
+    0x0009E5: 3147,
+    0x0009DE: 3148,
+    0x0009E0: 3149,
+    0x0009CA: 3150,
+    0x000A11: 3151,
+    0x000A0F: 3152,
+    0x000A0C: 3153,
+    0x0009EC: 3154,
+    0x0009E7: 3155,
+    0x0009CF: 3156,
+    0x000A3F: 3157,
+    0x000956: 3158,
+    0x000948: 3159,
+    0x000949: 3160,
+    0x0009B1: 3161,
+    0x0009B0: 3162,
+    0x0009AB: 3163,
+    0x00099D: 3164,
+    0x000968: 3165,
+    0x000961: 3166,
+    0x000960: 3167,
+    0x00099E: 3168,
+    0x0009C1: 3169,
+    0x000999: 3170,
+    0x000994: 3171,
+    0x000988: 3172,
+    0x00098E: 3173,
+    0x000979: 3174,
+    0x000963: 3175,
+    0x000966: 3176,
+    0x0009BB: 3177,
+    0x0009B9: 3178,
+    0x0009AC: 3179,
+    0x00097C: 4,
+    0x00097B: 4,
+    0x00093C: 3180,
+    0x000935: 3181,
+    0x000936: 3182,
+    0x000937: 3183,
+    0x0008FD: 3184,
+    0x0008F8: 3185,
+    0x0008F3: 3186,
+    0x0008D9: 3187,
+    0x0008D5: 3188,
+    0x0008CD: 3189,
+    0x0008CC: 3190,
+    0x0008D1: 3191,
+    0x0008DE: 3192,
+    0x0008E0: 3193,
+    0x0008E4: 3194,
+    0x0008E3: 4,
+    0x0008E5: 3195,
+    0x000913: 3196,
+    0x00090E: 3197,
+    0x000946: 3198,
+    0x00093F: 3199,
+    0x00092A: 3200,
+    0x000925: 3201,
+    0x000900: 3202,
+    0x00082C: 3203,
+    0x000821: 4,
+    0x000822: 3204,
+    0x00081D: 3205,
+    0x000823: 3206,
+    0x000828: 3207,
+    0x00082D: 3208,
+    0x000820: 4,
+    0x000824: 3209,
+    0x00086C: 3210,
+    0x000868: 3211,
+    0x000869: 3212,
+    0x000862: 3213,
+    0x000861: 3214,
+    0x000891: 3215,
+    0x000892: 3216,
+    0x00088C: 3217,
+    0x00088A: 3218,
+    0x000887: 3219,
+    0x000877: 3220,
+    0x00087B: 3221,
+    0x000876: 3222,
+    0x000870: 3223,
+    0x00086E: 3224,
+    0x000814: 3225,
+    0x0008BD: 3226,
+    0x0008AE: 3227,
+    0x00084F: 3228,
+    0x000854: 3229,
+    0x00085C: 3230,
+    0x0008A7: 3231,
+    0x000899: 3232,
+    0x0008A0: 3233,
+    0x0008C3: 3234,
+    0x0008BC: 3235,
+    0x0007BD: 3236,
+    0x0007C4: 3237,
+    0x0007C3: 3238,
+    0x0007D2: 3239,
+    0x0007C9: 3240,
+    0x0007C7: 3241,
+    0x0007BF: 3242,
+    0x0007BB: 3243,
+    0x0007A5: 3244,
+    0x00079C: 3245,
+    0x0007B6: 3246,
+    0x0007B7: 3247,
+    0x0007B0: 3248,
+    0x000803: 3249,
+    0x000805: 3250,
+    0x0007FD: 3251,
+    0x0007FE: 3252,
+    0x0007D9: 3253,
+    0x0007DA: 3254,
+    0x0007CD: 3255,
+    0x0007CF: 3256,
+    0x000777: 3257,
+    0x000780: 986,
+    0x00078E: 3258,
+    0x0007E4: 3259,
+    0x000754: 3260,
+    0x000757: 3261,
+    0x00074C: 3262,
+    0x000753: 3263,
+    0x00074D: 3264,
+    0x00072F: 3265,
+    0x000732: 3266,
+    0x000725: 3267,
+    0x000723: 3268,
+    0x00071D: 3269,
+    0x000720: 3270,
+    0x00076E: 3271,
+    0x00076F: 3272,
+    0x000773: 3273,
+    0x00076C: 3274,
+    0x00075D: 3275,
+    0x000765: 3276,
+    0x000737: 3277,
+    0x000734: 3278,
+    0x00073F: 3279,
+    0x000728: 3280,
+    0x00072C: 3281,
+    0x00072D: 3282,
+    0x000724: 3283,
+    0x00071B: 3284,
+    0x000715: 3285,
+    0x0006FD: 3286,
+    0x0006F9: 3287,
+    0x0006F1: 3288,
+    0x0006E0: 3289,
+    0x0006D7: 4,
+    0x0006D5: 3290,
+    0x00D0B9: 3291,
+    0x00D05F: 3292,
+    0x000675: 3293,
+    0x00067B: 3294,
+    0x000670: 3295,
+    0x0005EA: 3296,
+    0x0006C9: 3297,
+    0x0006C8: 3298,
+    0x0006C0: 3299,
+    0x000698: 3300,
+    0x00069C: 3301,
+    0x0006AF: 3302,
+    0x0006A7: 3303,
+    0x0006A9: 3304,
+    0x00069E: 3305,
+    0x000668: 3306,
+    0x00066D: 3307,
+    0x000658: 3308,
+    0x000649: 3309,
+    0x000643: 3310,
+    0x00063E: 3311,
+    0x00066F: 3312,
+    0x000686: 3313,
+    0x000689: 3314,
+    0x000681: 3315,
+    0x0006B1: 3316,
+    0x0006AD: 3317,
+    0x00063B: 3318,
+    0x000626: 3319,
+    0x000606: 3320,
+    0x000603: 3321,
+    0x000607: 3322,
+    0x0005F7: 874,
+    0x000613: 3323,
+    0x0005D3: 3324,
+    0x000604: 3325,
+    0x00059C: 3326,
+    0x0005A2: 3327,
+    0x0005AA: 3328,
+    0x0005AE: 3329,
+    0x0005B0: 3330,
+    0x0005B2: 3331,
+    0x000618: 3332,
+    0x000620: 3333,
+    0x000617: 3334,
+    0x0005C8: 3335,
+    0x0005CB: 3336,
+    0x0005CD: 3337,
+    0x0005E7: 3338,
+    0x0005F4: 3339,
+    0x0005E1: 3340,
+    0x0005E2: 3341,
+    0x00054D: 3342,
+    0x000547: 3343,
+    0x00054E: 927,
+    0x000546: 3344,
+    0x000540: 3345,
+    0x00053C: 1028,
+    0x000596: 3346,
+    0x000579: 3347,
+    0x00052E: 3348,
+    0x00052F: 3349,
+    0x00053B: 3350,
+    0x000528: 3351,
+    0x000575: 3352,
+    0x00056B: 3353,
+    0x000560: 3354,
+    0x00055E: 4,
+    0x000544: 3355,
+    0x000597: 3356,
+    0x0005B5: 3357,
+    0x00058C: 3358,
+    0x000556: 3359,
+    0x000559: 3360,
+    0x000551: 3361,
+    0x000524: 3362,
+    0x000522: 3363,
+    0x000520: 3364,
+    0x00057F: 3365,
+    0x000573: 4,
+    0x0004BE: 3366,
+    0x0004C1: 4,
+    0x0004C4: 3367,
+    0x0004B7: 3368,
+    0x0004B9: 3369,
+    0x0004BB: 3370,
+    0x0004BC: 3371,
+    0x0004AF: 3372,
+    0x0004D6: 3373,
+    0x0004D1: 3374,
+    0x0004D0: 3375,
+    0x008087: 3376,
+    0x0004D9: 3377,
+    0x0004D8: 3378,
+    0x0004B2: 3379,
+    0x0004B4: 3380,
+    0x0004A9: 3381,
+    0x0004EB: 3382,
+    0x0004EF: 3383,
+    0x000514: 3384,
+    0x00050B: 3385,
+    0x000505: 3386,
+    0x0004FE: 3387,
+    0x000518: 3388,
+    0x000461: 3389,
+    0x000462: 3390,
+    0x00045F: 3391,
+    0x000456: 204,
+    0x000446: 3392,
+    0x00044A: 3393,
+    0x000440: 3394,
+    0x00043C: 3395,
+    0x00049C: 3396,
+    0x00049D: 3397,
+    0x000460: 3398,
+    0x00048F: 3399,
+    0x000419: 3400,
+    0x00041C: 3401,
+    0x000418: 3402,
+    0x000370: 3403,
+    0x000468: 3404,
+    0x00046F: 3405,
+    0x000469: 3406,
+    0x000402: 3407,
+    0x0003F7: 3408,
+    0x0003FC: 3409,
+    0x000495: 3410,
+    0x000487: 3411,
+    0x00042C: 3412,
+    0x00042A: 3413,
+    0x000458: 3414,
+    0x00044F: 3415,
+    0x0003E1: 3416,
+    0x0003E4: 4,
+    0x0003DC: 3417,
+    0x0003D8: 3418,
+    0x0003D5: 3419,
+    0x0003D6: 3420,
+    0x0003C8: 3421,
+    0x0003C3: 3422,
+    0x0003C0: 3423,
+    0x0003BD: 3424,
+    0x0003B8: 3425,
+    0x0003B7: 3426,
+    0x0003B0: 3427,
+    0x0003AA: 3428,
+    0x0003A8: 3429,
+    0x0003EF: 3430,
+    0x0003F1: 3431,
+    0x0003ED: 3432,
+    0x0003A0: 4,
+    0x0003A2: 3433,
+    0x00039C: 3434,
+    0x0003D4: 3435,
+    0x0003CE: 3436,
+    0x000385: 3437,
+    0x000369: 3438,
+    0x000373: 3439,
+    0x000377: 3440,
+    0x000355: 3441,
+    0x000354: 3442,
+    0x000350: 3443,
+    0x00034E: 3444,
+    0x000348: 3445,
+    0x000346: 3446,
+    0x000344: 3447,
+    0x0002E6: 3448,
+    0x0002E4: 3449,
+    0x0002DE: 3450,
+    0x0002E2: 3451,
+    0x0002DC: 3452,
+    0x0002E1: 3453,
+    0x0002D7: 3454,
+    0x0002F8: 3455,
+    0x0002F7: 3456,
+    0x00D024: 3457,
+    0x0002F1: 3458,
+    0x0002ED: 3459,
+    0x0002EC: 3460,
+    0x0002D3: 3461,
+    0x0002DA: 3462,
+    0x0002D4: 3463,
+    0x0002D6: 3464,
+    0x000343: 3465,
+    0x000335: 3466,
+    0x000336: 3467,
+    0x000337: 3468,
+    0x000365: 3469,
+    0x00033B: 3470,
+    0x00032D: 3471,
+    0x00032F: 3472,
+    0x00B052: 3473,
+    0x000314: 3474,
+    0x00025C: 3475,
+    0x000087: 3476,
+    0x000258: 3477,
+    0x000255: 2034,
+    0x000252: 3478,
+    0x00024E: 3479,
+    0x000242: 3480,
+    0x000244: 3481,
+    0x00023E: 3482,
+    0x000241: 3483,
+    0x00027D: 4,
+    0x00027C: 3484,
+    0x000275: 3485,
+    0x000269: 3486,
+    0x000264: 3487,
+    0x00025F: 1034,
+    0x000299: 3488,
+    0x000298: 3489,
+    0x000297: 3490,
+    0x000291: 3491,
+    0x0002C6: 3492,
+    0x0002C1: 3493,
+    0x0002C0: 3494,
+    0x00017A: 3495,
+    0x000238: 3496,
+    0x000229: 3497,
+    0x00028B: 3498,
+    0x00028C: 3499,
+    0x00028D: 3500,
+    0x0002A6: 3501,
+    0x0001E5: 3502,
+    0x0001D4: 3503,
+    0x0001DD: 3504,
+    0x0001D5: 3505,
+    0x0001D7: 455,
+    0x0001DE: 3506,
+    0x0001DC: 3507,
+    0x000207: 3508,
+    0x000208: 3509,
+    0x000204: 3510,
+    0x0001F9: 3511,
+    0x0001FB: 3512,
+    0x0001BF: 3513,
+    0x0001B4: 3514,
+    0x0001BA: 3515,
+    0x0001B0: 3516,
+    0x0001A9: 3517,
+    0x0001AA: 3518,
+    0x00019E: 3519,
+    0x000211: 3520,
+    0x000212: 3521,
+    0x000217: 4,
+    0x00022D: 3522,
+    0x000226: 3523,
+    0x000225: 3524,
+    0x000220: 3525,
+    0x00020D: 3526,
+    0x0001CF: 3527,
+    0x0001D0: 3528,
+    0x0001C7: 4,
+    0x00017D: 3529,
+    0x000181: 1034,
+    0x000194: 3530,
+    0x000198: 3531,
+    0x0001F8: 3532,
+    0x0001E8: 3533,
+    0x0001E9: 3534,
+    0x0001BE: 3535,
+    0x0001B1: 3536,
+    0x00010A: 3537,
+    0x000162: 3538,
+    0x000167: 3539,
+    0x000168: 3540,
+    0x00015F: 3541,
+    0x000164: 4,
+    0x00B04A: 4,
+    0x00B048: 3542,
+    0x00B0CE: 3543,
+    0x00B01C: 3544,
+    0x000119: 3545,
+    0x000122: 3546,
+    0x00011A: 3547,
+    0x000124: 3548,
+    0x000142: 4,
+    0x00012C: 3549,
+    0x000121: 3550,
+    0x000129: 3551,
+    0x000154: 3552,
+    0x000152: 3553,
+    0x000150: 3554,
+    0x000151: 3555,
+    0x000115: 3556,
+    0x000101: 13,
+    0x00010D: 3557,
+    0x000105: 3558,
+    0x00B017: 3559,
+    0x00012B: 3560,
+    0x00013F: 3561,
+    0x000185: 3562,
+    0x0001A2: 3563,
+    0x00303A: 3564,
+    0x00302C: 3565,
+    0x0030DF: 3566,
+    0x00304E: 3567,
+    0x003063: 3568,
+    0x003030: 3569,
+    0x0030A3: 4,
+    0x0030FD: 3570,
+    0x0030B9: 3571,
+    0x00307D: 3572,
+    0x003021: 3573,
+    0x00B02D: 3574,
+    0x0030EE: 3575,
+    0x00309E: 3576,
+    0x0030DE: 3577,
+    0x00303E: 3578,
+    0x0030D7: 3579,
+    0x0030A4: 3580,
+    0x00303B: 3581,
+    0x0030BC: 3582,
+    0x0030B8: 3583,
+    0x003071: 4,
+    0x003088: 3584,
+    0x0030B5: 3585,
+    0x003020: 3586,
+    0x0030EF: 3587,
+    0x003095: 3588,
+    0x0030CA: 3589,
+    0x0030CE: 3590,
+    0x003096: 4,
+    0x003039: 3591,
+    0x00301B: 3592,
+    0x00307B: 4,
+    0x00D03B: 3593,
+    0x00D0B3: 3594,
+    0x00D000: 3595,
+    0x00D0D0: 3596,
+    0x00D053: 3597,
+    0x00D097: 4,
+    0x00D08E: 3598,
+    0x00D056: 3599,
+    0x00D0E0: 3600,
+    0x00D033: 3601,
+    0x00D0D6: 3602,
+    0x00D063: 4,
+    0x00D0F8: 3603,
+    0x00D0ED: 3604,
+    0x003027: 3605,
+    0x003033: 3606,
+    0x0030DD: 3607,
+    0x003099: 3608,
+    0x0030F2: 4,
+    0x003051: 3609,
+    0x003008: 3610,
+    0x00301D: 3611,
+    0x0030BA: 3612,
+    0x00D030: 3613,
+    0x00D047: 3614,
+    0x00D055: 3615,
+    0x00D0B0: 3616,
+    0x00302A: 3617,
+    0x0030E1: 3618,
+    0x003001: 3619,
+    0x00D021: 3620,
+    0x00D09F: 3621,
+    0x00D0FE: 3622,
+    0x00D0D4: 3623,
+    0x00D0E7: 3624,
+    0x00D084: 3625,
+    0x00D099: 3626,
+    0x00D01B: 3627,
+    0x00D083: 3628,
+    0x00D0BA: 4,
+    0x00D0E4: 4,
+    0x00D08B: 149,
+    0x00D05A: 3629,
+    0x00D079: 4,
+    0x00D098: 3630,
+    0x00D0BE: 3631,
+    0x00D0F4: 3632,
+    0x00D07D: 3633,
+    0x00D0AF: 3634,
+    0x00D052: 3635,
+    0x00D0AD: 3636,
+    0x00D0A4: 3637,
+    0x00D00D: 3638,
+    0x00D04A: 3639,
+    0x00D074: 3640,
+    0x00D0C7: 3641,
+    0x00D07A: 3642,
+    0x00D0B8: 3643,
+    0x00509D: 3644,
+    0x00D054: 3645,
+    0x00D009: 3646,
+    0x00D092: 3647,
+    0x005058: 3648,
+    0x0050FE: 3649,
+    0x0050AB: 3650,
+    0x005037: 3651,
+    0x005006: 3652,
+    0x005009: 3653,
+    0x005030: 3654,
+    0x0050D6: 3655,
+    0x005082: 3656,
+    0x0050DF: 3657,
+    0x0050AA: 3658,
+    0x005038: 3659,
+    0x00509E: 3660,
+    0x005071: 3661,
+    0x00505F: 3662,
+    0x0050B4: 3663,
+    0x0050D0: 3664,
+    0x0050D8: 3665,
+    0x0050A8: 3666,
+    0x00509C: 3667,
+    0x005023: 3668,
+    0x0050B1: 3669,
+    0x0050B7: 3670,
+    0x005078: 3671,
+    0x005002: 3672,
+    0x00506A: 3673,
+    0x0050C5: 3674,
+    0x00508E: 3675,
+    0x005028: 3676,
+    0x00502F: 3677,
+    0x005074: 3678,
+    0x00500A: 3679,
+    0x005070: 3680,
+    0x00503F: 3681,
+    0x005032: 3682,
+    0x00504D: 3683,
+    0x00506D: 3684,
+    0x009008: 3685,
+    0x009088: 3686,
+    0x00906C: 3687,
+    0x0090A4: 3688,
+    0x0090F9: 3689,
+    0x009089: 3690,
+    0x0090EE: 3691,
+    0x009080: 3692,
+    0x0090E8: 3693,
+    0x0090A1: 3694,
+    0x009079: 3695,
+    0x00909A: 3696,
+    0x0090C2: 3697,
+    0x0090AC: 3698,
+    0x0050B2: 3699,
+    0x009076: 3700,
+    0x009017: 3701,
+    0x009049: 3702,
+    0x009043: 3703,
+    0x0090AD: 3704,
+    0x0090E6: 3705,
+    0x009070: 3706,
+    0x009030: 3707,
+    0x0090C8: 3708,
+    0x00901B: 3709,
+    0x00904E: 3710,
+    0x0090ED: 3711,
+    0x009075: 3712,
+    0x009001: 3713,
+    0x00901E: 3714,
+    0x0010EC: 3715,
+    0x001059: 3716,
+    0x001069: 3717,
+    0x0010BF: 3718,
+    0x001036: 3719,
+    0x001026: 3720,
+    0x0010AC: 3721,
+    0x0010FC: 3722,
+    0x001031: 3723,
+    0x00106D: 3724,
+    0x0010D0: 3725,
+    0x001093: 3726,
+    0x00108F: 3727,
+    0x001063: 3728,
+    0x001023: 3729,
+    0x00102B: 3730,
+    0x00108D: 3731,
+    0x0090F7: 3732,
+    0x009012: 3733,
+    0x00908A: 3734,
+    0x00900E: 3735,
+    0x001045: 1034,
+    0x00107D: 3736,
+    0x001039: 3737,
+    0x0010B6: 3738,
+    0x0090E4: 3739,
+    0x0090C1: 3740,
+    0x009040: 3741,
+    0x009047: 3742,
+    0x0090E1: 3743,
+    0x0090CB: 3744,
+    0x0090B7: 3745,
+    0x0090A0: 3746,
+    0x009032: 3747,
+    0x00104C: 3748,
+    0x0010CC: 3749,
+    0x001030: 3750,
+    0x001062: 3751,
+    0x0010F0: 3752,
+    0x001001: 3753,
+    0x00105C: 3754,
+    0x001075: 3755,
+    0x0010B1: 3756,
+    0x0010EE: 3757,
+    0x001041: 3758,
+    0x0010AA: 3759,
+    0x0010E8: 3760,
+    0x0010A2: 3761,
+    0x001000: 3762,
+    0x001009: 3763,
+    0x0010F8: 3532,
+    0x0010C0: 3764,
+    0x001002: 3765,
+    0x00105B: 3766,
+    0x0010EB: 3767,
+    0x00101D: 3768,
+    0x00109F: 3769,
+    0x001084: 3770,
+    0x0010F9: 3771,
+    0x0010CF: 3772,
+    0x0010A4: 1028,
+    0x0010F1: 3773,
+    0x001057: 3774,
+    0x001065: 3775,
+    0x001066: 3776,
+    0x00E09F: 3777,
+    0x00E0CC: 3778,
+    0x00E080: 3779,
+    0x00E004: 3780,
+    0x00E03B: 3781,
+    0x00E0F5: 3782,
+    0x00E0D7: 3783,
+    0x00E095: 3784,
+    0x00E00E: 3785,
+    0x00E048: 3786,
+    0x00E0CB: 3787,
+    0x00E0C8: 3788,
+    0x00E006: 3789,
+    0x00E0AC: 3790,
+    0x00E0FA: 3791,
+    0x00E02C: 3792,
+    0x00E067: 3793,
+    0x00E008: 3794,
+    0x00E0AE: 3795,
+    0x00E0E0: 3796,
+    0x00E003: 3797,
+    0x00E0F3: 3798,
+    0x08BBCC: 3799,
+    0x00E0DB: 3800,
+    0x00E0A6: 3801,
+    0x00604B: 3802,
+    0x00606B: 343,
+    0x00603B: 3803,
+    0x00E039: 3804,
+    0x00600B: 3805,
+    0x00E0EF: 3806,
+    0x00E051: 3807,
+    0x00E02D: 3808,
+    0x00E035: 3809,
+    0x00E090: 3810,
+    0x00E085: 3811,
+    0x00E0A0: 3812,
+    0x00E0C7: 3813,
+    0x00E0F1: 3814,
+    0x00E0AF: 3815,
+    0x00E054: 3816,
+    0x00E0B9: 3817,
+    0x00E023: 3818,
+    0x00E02A: 3819,
+    0x00E04E: 3820,
+    0x00E012: 3821,
+    0x00E04C: 3822,
+    0x0060B5: 3823,
+    0x006001: 3824,
+    0x0060FE: 3825,
+    0x0060BD: 3826,
+    0x000800: 3827,
+    0x00E0B5: 3828,
+    0x00E068: 3829,
+    0x00E049: 3830,
+    0x00E050: 3831,
+    0x00E0BE: 3832,
+    0x00E0B6: 3833,
+    0x00E0F4: 3834,
+    0x00607E: 3835,
+    0x0060D5: 3836,
+    0x00603F: 3837,
+    0x0060D2: 3838,
+    0x0060CD: 3839,
+    0x0060AA: 3840,
+    0x006065: 3841,
+    0x00605D: 3842,
+    0x00602C: 3843,
+    0x0060AC: 3844,
+    0x00604E: 3845,
+    0x006014: 3846,
+    0x0060E1: 3847,
+    0x0060E6: 3848,
+    0x0060FF: 3849,
+    0x006067: 3850,
+    0x00609F: 3851,
+    0x006042: 3852,
+    0x006079: 3853,
+    0x00609A: 3854,
+    0x00602B: 3855,
+    0x0060F1: 3856,
+    0x0005A8: 3857,
+    0x006040: 3858,
+    0x0060CC: 3859,
+    0x00606F: 3860,
+    0x006090: 3861,
+    0x006025: 3862,
+    0x0060A7: 3863,
+    0x006030: 3864,
+    0x00A00D: 3865,
+    0x00A0E9: 3866,
+    0x00A0BE: 3867,
+    0x00A010: 3868,
+    0x00A016: 3869,
+    0x00A048: 3870,
+    0x00A0BD: 3871,
+    0x00A059: 3872,
+    0x00A039: 3873,
+    0x00A0AD: 3874,
+    0x0060E5: 3875,
+    0x00605E: 3876,
+    0x0060C6: 3877,
+    0x00601E: 3878,
+    0x00600D: 3879,
+    0x00604A: 3880,
+    0x00A0FC: 3881,
+    0x00A09C: 3882,
+    0x00A0D6: 3883,
+    0x00A02E: 3884,
+    0x00A0AF: 3885,
+    0x00A057: 3886,
+    0x00A09F: 3887,
+    0x00A06E: 3888,
+    0x00A0BA: 3889,
+    0x00A0B5: 3890,
+    0x00A04D: 3891,
+    0x00A086: 3892,
+    0x00A01E: 3893,
+    0x00A062: 3894,
+    0x00A0AE: 3895,
+    0x00A076: 3896,
+    0x00A0A1: 3897,
+    0x00A0CA: 3898,
+    0x00A022: 3899,
+    0x00A0C0: 3900,
+    0x00A044: 3901,
+    0x00A011: 3902,
+    0x00A0B6: 3903,
+    0x00A079: 3904,
+    0x00A08D: 3905,
+    0x00A08E: 3906,
+    0x00A0F5: 3907,
+    0x00A084: 3908,
+    0x00A049: 3909,
+    0x00A09D: 3910,
+    0x00A0F9: 3911,
+    0x00A003: 3912,
+    0x000267: 3913,
+    0x0020B1: 3914,
+    0x002032: 3915,
+    0x0020E9: 3916,
+    0x002022: 3917,
+    0x0020AE: 3918,
+    0x0020AA: 3919,
+    0x00A06B: 3920,
+    0x00A030: 3921,
+    0x00A0DE: 1117,
+    0x00A0F8: 1805,
+    0x002005: 3922,
+    0x0020FA: 3923,
+    0x002038: 3924,
+    0x0020A3: 3091,
+    0x002059: 3925,
+    0x002080: 3926,
+    0x002018: 3537,
+    0x002098: 3927,
+    0x0020FD: 3928,
+    0x002034: 3929,
+    0x002079: 3930,
+    0x0020F5: 3931,
+    0x002074: 3932,
+    0x00203C: 3933,
+    0x002028: 3934,
+    0x002068: 3935,
+    0x0020C8: 3936,
+    0x00C023: 3937,
+    0x00C08B: 3938,
+    0x0020C4: 3939,
+    0x00200E: 3940,
+    0x0020E7: 3941,
+    0x00209D: 3942,
+    0x00209C: 3943,
+    0x00206D: 3944,
+    0x00203A: 3945,
+    0x0020A4: 3946,
+    0x002051: 3947,
+    0x00203B: 3948,
+    0x0020BA: 3949,
+    0x00C0C3: 3950,
+    0x00C0B3: 3951,
+    0x00C0E5: 3952,
+    0x00C04D: 3953,
+    0x0020DC: 3954,
+    0x002048: 3955,
+    0x00200C: 3956,
+    0x002011: 3957,
+    0x0020F0: 3958,
+    0x002089: 3959,
+    0x002061: 3960,
+    0x00C0A1: 3961,
+    0x00C02E: 3962,
+    0x00C047: 3963,
+    0x00C084: 3964,
+    0x00C041: 3965,
+    0x00C00D: 3966,
+    0x00C0B4: 3967,
+    0x00C080: 3968,
+    0x00C045: 3969,
+    0x0070B3: 1135,
+    0x00E6D3: 3970,
+    0x0070B0: 3971,
+    0x00C01F: 3972,
+    0x006086: 3973,
+    0x00C0B6: 3974,
+    0x00C07A: 3975,
+    0x00C06D: 3976,
+    0x00C0EA: 3977,
+    0x00C009: 3978,
+    0x00C081: 3979,
+    0x00C03B: 3980,
+    0x00C082: 3981,
+    0x00C099: 3982,
+    0x00C0DC: 3983,
+    0x00C03C: 3984,
+    0x00C01D: 3985,
+    0x00C070: 3986,
+    0x00C072: 3987,
+    0x00C0AE: 3988,
+    0x00C0D6: 3989,
+    0x00C0F6: 3990,
+    0x00C0C2: 3991,
+    0x00C0AF: 3992,
+    0x00C059: 3993,
+    0x00C0F1: 3994,
+    0x00C001: 3995,
+    0x00C0F4: 3996,
+    0x00C0E2: 3997,
+    0x00C07B: 3635,
+    0x00C098: 3998,
+    0x00C0BE: 3999,
+    0x00C06E: 4000,
+    0x00C0F8: 4001,
+    0x00C078: 4002,
+    0x00C09A: 4003,
+    0x00C01A: 4004,
+    0x00C068: 4005,
+    0x00C0D8: 4006,
+    0x004099: 4007,
+    0x004011: 4008,
+    0x0040A1: 4009,
+    0x004081: 4010,
+    0x004036: 4011,
+    0x004016: 4012,
+    0x00406A: 4013,
+    0x00400A: 4014,
+    0x004082: 4015,
+    0x00C08C: 4016,
+    0x00C007: 4017,
+    0x00C08A: 4018,
+    0x0040B7: 4019,
+    0x0040A8: 4020,
+    0x004070: 4021,
+    0x0040AC: 4022,
+    0x00C0F7: 4023,
+    0x10005A: 2034,
+    0x0040E0: 4024,
+    0x0040D1: 4025,
+    0x004069: 4026,
+    0x0040F1: 4027,
+    0x0040A9: 4028,
+    0x0040E3: 4029,
+    0x004091: 4030,
+    0x0040EA: 4031,
+    0x00408A: 4032,
+    0x0040FD: 4033,
+    0x0040FA: 4034,
+    0x00803B: 4035,
+    0x00806A: 4036,
+    0x00C0A8: 4037,
+    0x00403B: 4038,
+    0x00403F: 4039,
+    0x004014: 4040,
+    0x004000: 4041,
+    0x00406C: 4042,
+    0x004075: 3703,
+    0x004053: 4043,
+    0x008038: 4044,
+    0x00805E: 4045,
+    0x008060: 4046,
+    0x0040A7: 4047,
+    0x004064: 4048,
+    0x00405A: 4049,
+    0x004013: 4050,
+    0x0080F5: 4051,
+    0x0080B9: 4052,
+    0x0080A7: 4053,
+    0x00400C: 4054,
+    0x004063: 4055,
+    0x008028: 4056,
+    0x008061: 4057,
+    0x0080C3: 4058,
+    0x008044: 4059,
+    0x008006: 4060,
+    0x00808A: 4061,
+    0x004043: 4062,
+    0x00405E: 4063,
+    0x00807C: 4064,
+    0x008091: 4065,
+    0x00809D: 4066,
+    0x0080F4: 4067,
+    0x00808B: 4068,
+    0x0080CB: 4069,
+    0x008007: 4070,
+    0x008062: 4071,
+    0x00801E: 4072,
+    0x0080E2: 4073,
+    0x008036: 4074,
+    0x008083: 4075,
+    0x00804D: 4076,
+    0x00800B: 4077,
+    0x008018: 4078,
+    0x00809B: 4079,
+    0x0080DF: 4080,
+    0x0080D4: 4081,
+    0x00803D: 4082,
+    0x008049: 4083,
+    0x0080C1: 4084,
+    0x0080BC: 4085,
+    0x0080B2: 4086,
+    0x008076: 4087,
+    0x008022: 4088,
+    0x0000B2: 4089,
+    0x0000EE: 4090,
+    0x0000E5: 4091,
+    0x000089: 4092,
+    0x0000FF: 4093,
+    0x0000B7: 4094,
+    0x0000F2: 4095,
+    0x0000CC: 4096,
+    0x0080A8: 4097,
+    0x008033: 4098,
+    0x0080DD: 4099,
+    0x0080FB: 4100,
+    0x0000DB: 4101,
+    0x0000C1: 4102,
+    0x0000F6: 4103,
+    0x00003F: 4104,
+    0x00008E: 4105,
+    0x0000DC: 4106,
+    0x000063: 4107,
+    0x0080B4: 4108,
+    0x00807F: 4109,
+    0x0000BD: 4110,
+    0x00002E: 4111,
+    0x00004E: 4112,
+    0x0000C2: 4113,
+    0x0000FC: 4114,
+    0x0000CD: 4115,
+    0x008068: 4116,
+    0x00006D: 4117,
+    0x0000DA: 4118,
+    0x00802D: 4119,
+    0x0000A0: 4120,
+    0x0000C0: 4121,
+    0x000033: 4122,
+    0x0000EA: 4123,
+    0x000043: 4124,
+    0x000017: 4125,
+    0x000065: 4126,
+    0x000011: 4127,
+    0x0000C4: 4128,
+    0x0000A2: 4129,
+    0x0000EC: 4130,
+    0x000061: 4131,
+    0x0000A4: 4132,
+    0x0000DD: 4133,
+    0x0000AE: 4134,
+    0x000077: 4135,
+    0x000099: 4136,
+    0x000028: 4137,
+    0x000010: 4138,
+    0x0000EB: 4139,
+    0x080043: 4140,
+    0x080045: 4141,
+    0x08003B: 4142,
+    0x08003C: 4143,
+    0x080034: 4144,
+    0x080036: 4145,
+    0x080033: 4146,
+    0x080030: 4147,
+    0x080031: 4148,
+    0x08007E: 4149,
+    0x08007F: 4150,
+    0x080029: 4151,
+    0x080023: 880,
+    0x08005E: 4152,
+    0x080056: 4153,
+    0x080048: 4154,
+    0x08004F: 4155,
+    0x080050: 4156,
+    0x08002E: 4157,
+    0x08002B: 4158,
+    0x080075: 4159,
+    0x080078: 4160,
+    0x08006D: 4161,
+    0x00009D: 4162,
+    0x0000FD: 4163,
+    0x08000F: 4164,
+    0x0270B0: 3971,
+    0x000053: 4165,
+    0x08000A: 4166,
+    0x000004: 4167,
+    0x00DD0E: 4168,
+    0x080018: 4169,
+    0x0000A6: 4170,
+    0x00BBF0: 4168,
+    0x00408E: 3703,
+    0x08001C: 4171,
+    0x080090: 4172,
+    0x00800F: 4173,
+    0x00406B: 4174,
+    0x00DD0C: 4168,
+    0x0001C8: 4175,
+    0xCC45A5: 53,
+    0x602602: 53,
+    0xECBFD0: 53,
+    0xC4E733: 4176,
+    0x5CFCE1: 680,
+    0xF0A731: 94,
+    0x54DED3: 11,
+    0x749B89: 15,
+    0x5C53B4: 38,
+    0x50A6D8: 49,
+    0x68CAC4: 49,
+    0x00308E: 4177,
+    0x000633: 4177,
+    0x80F5AE: 54,
+    0x9415B2: 117,
+    0xE8B722: 4178,
+    0x606134: 4179,
+    0xA4978A: 4180,
+    0x4CEA41: 12,
+    0x74205F: 4181,
+    0x14064C: 4182,
+    0x8C6120: 38,
+    0x8C8E4E: 4183,
+    0xF8ACC1: 4184,
+    0x4064DC: 4185,
+    0x5CC787: 117,
+    0x845075: 117,
+    0x5CF838: 12,
+    0x30D97F: 456,
+    0x4080E1: 4186,
+    0xC44838: 4187,
+    0x9C37CB: 141,
+    0x3CB0ED: 4188,
+    0xECCF70: 287,
+    0x04F0E4: 4189,
+    0xD8E23F: 780,
+    0xD8032A: 4190,
+    0x847051: 159,
+    0x50131D: 78,
+    0xD47F78: 4191,
+    0x90A9F7: 12,
+    0xF0F7FC: 15,
+    0x30FFFD: 15,
+    0xB0995A: 15,
+    0x00F7AD: 15,
+    0xD4CBCC: 146,
+    0x3C8427: 14,
+    0x740BB0: 4192,
+    0x20ED47: 28,
+    0x94EF49: 4193,
+    0x90B685: 755,
+    0xA0D1B3: 49,
+    0x7C4B26: 49,
+    0x24D5E4: 4,
+    0x24A186: 258,
+    0xCC115A: 49,
+    0x0080A3: 4194,
+    0x90D432: 11,
+    0x18E83B: 4195,
+    0x008066: 4196,
+    0xEC41F9: 73,
+    0x785333: 4197,
+    0x9CF8B8: 107,
+    0x9432C1: 22,
+    0x189578: 4198,
+    0x147F67: 285,
+    0xEC9A0C: 12,
+    0xCC4D75: 166,
+    0x107C61: 398,
+    0x58FCC8: 4199,
+    0x008DF4: 12,
+    0x7818EC: 41,
+    0x6C7F0C: 20,
+    0x5CB26D: 25,
+    0x481CB9: 4200,
+    0xE02EFE: 510,
+    0xCCA08F: 11,
+    0xE8B0C5: 25,
+    0xFCB585: 4201,
+    0xD424DD: 427,
+    0x6C51E4: 117,
+    0xB0FA8B: 117,
+    0xECE660: 906,
+    0xE8288D: 117,
+    0xF462DC: 117,
+    0xC46237: 4202,
+    0xF4D58A: 95,
+    0xC8C6FE: 63,
+    0x1889DF: 4203,
+    0x44303F: 15,
+    0x5C07A6: 15,
+    0xCC1E56: 15,
+    0xA0551F: 3,
+    0x4CB911: 212,
+    0x000E5E: 212,
+    0x38C6BD: 40,
+    0x000C8D: 4204,
+    0x908938: 4205,
+    0xA8BA69: 90,
+    0xA83CA5: 110,
+    0x80F7A6: 4206,
+    0x302FAC: 4207,
+    0xB80BDA: 167,
+    0x342DA3: 5,
+    0x0C6AC4: 49,
+    0xBC37D3: 49,
+    0x20CC27: 4,
+    0x0C517E: 49,
+    0x28D25A: 444,
+    0x80EA0B: 112,
+    0x982F86: 146,
+    0x04E4B6: 90,
+    0xBCEA9C: 163,
+    0x0479FD: 655,
+    0x509893: 53,
+    0x6C8338: 4208,
+    0x000CEF: 4209,
+    0x503AA0: 4210,
+    0x5CDE34: 4210,
+    0x842712: 238,
+    0x7CC6B6: 238,
+    0x980C33: 238,
+    0x38398F: 238,
+    0x7CF0E5: 71,
+    0x505E5C: 4211,
+    0x3802E3: 4212,
+    0xE4A7D0: 15,
+    0xB42BB9: 15,
+    0x34C7E9: 210,
+    0xAC8C46: 166,
+    0x482D63: 4213,
+    0x8099E7: 133,
+    0x209339: 28,
+    0xE8FF1E: 12,
+    0x1C54E6: 4214,
+    0x0C4B48: 81,
+    0x7C7B1C: 78,
+    0x7834FD: 146,
+    0xFC3CD7: 220,
+    0xB09C63: 40,
+    0xE89847: 40,
+    0xFC386A: 107,
+    0x508811: 166,
+    0xF8C4FA: 69,
+    0xACCE92: 21,
+    0xAC81B5: 4215,
+    0xD0460C: 110,
+    0x84D5A0: 4216,
+    0x84E8CB: 310,
+    0x90A0BE: 4217,
+    0x38E1F4: 3,
+    0x6453E0: 15,
+    0x688BF4: 587,
+    0x94017D: 4218,
+    0xC0E5DA: 247,
+    0xD8A6FD: 4219,
+    0x202351: 4220,
+    0x8C8474: 293,
+    0xD83D3F: 4221,
+    0xD44867: 238,
+    0xD8C6F9: 4222,
+    0x6C483F: 40,
+    0x3CAFB7: 40,
+    0x540853: 780,
+    0xBC0866: 4223,
+    0xDC9B95: 4224,
+    0x4800B3: 4,
+    0x2CB68F: 15,
+    0xC8D1A9: 15,
+    0x40BB56: 4225,
+    0xE05D54: 138,
+    0x18188B: 4226,
+    0xDC71D0: 49,
+    0x9CFA76: 49,
+    0x20FA85: 49,
+    0x9C1A25: 49,
+    0x6C6016: 71,
+    0xA0782D: 49,
+    0xD011E5: 49,
+    0x40DA5C: 49,
+    0x5C9175: 49,
+    0xD84489: 4220,
+    0x44F770: 166,
+    0xA83162: 4227,
+    0x64FE15: 4228,
+    0xD86BFC: 11,
+    0xE04824: 466,
+    0x08F0B6: 4229,
+    0xC0555C: 4230,
+    0xA8595F: 25,
+    0xCC28AA: 398,
+    0x3C9FCD: 4231,
+    0x341453: 4232,
+    0xCC641A: 664,
+    0xA89609: 4186,
+    0x68B41E: 4233,
+    0x841571: 274,
+    0xE8BFB8: 25,
+    0xDC4BA1: 57,
+    0x34A6EF: 44,
+    0xBC3F4E: 4234,
+    0x540463: 4235,
+    0x882067: 5,
+    0xE85497: 90,
+    0x14E01D: 90,
+    0xDC54AD: 4236,
+    0xB0924A: 3,
+    0x40DE24: 90,
+    0x1083B4: 4237,
+    0x403059: 238,
+    0xB85C5C: 157,
+    0xF0D805: 4,
+    0x086332: 12,
+    0xB492FE: 587,
+    0x4471B3: 4238,
+    0xA4FCA1: 181,
+    0x787E42: 11,
+    0x345A18: 4239,
+    0x0C6825: 4240,
+    0x90B4DD: 4241,
+    0xA0FAC8: 15,
+    0x6429FF: 15,
+    0xC09B63: 15,
+    0x10A145: 4242,
+    0xC4E7AE: 492,
+    0xAC1518: 14,
+    0x648FDB: 4243,
+    0x001F23: 4244,
+    0x94E6BA: 90,
+    0x746DFA: 90,
+    0x980709: 117,
+    0x6083E7: 4220,
+    0x0441A5: 49,
+    0x1C0EC2: 49,
+    0xB08BA8: 77,
+    0x38ACDD: 4245,
+    0xC4CC37: 12,
+    0x7C7EF9: 63,
+    0xC40898: 4246,
+    0x3C996D: 4247,
+    0xB8CC5F: 73,
+    0x8850DD: 4248,
+    0x5C35FC: 4249,
+    0xE85FB4: 40,
+    0xACEAEA: 15,
+    0x38F195: 15,
+    0x982A0A: 1305,
+    0x081287: 4250,
+    0x1402EC: 4251,
+    0x1C98EC: 4251,
+    0x24F27F: 4251,
+    0x808DB7: 4251,
+    0x941882: 4251,
+    0x34FCB9: 4251,
+    0x484AE9: 4251,
+    0x4CAEA3: 4251,
+    0xB8977A: 181,
+    0x20A6CD: 4251,
+    0x703A0E: 4252,
+    0xD8C7C8: 4252,
+    0x6CC49F: 4252,
+    0xEC50AA: 4252,
+    0xF061C0: 4252,
+    0xB01F8C: 4252,
+    0x48B4C3: 4252,
+    0x209CB4: 4252,
+    0x4CD587: 4252,
+    0x9C3708: 4252,
+    0x34C515: 4252,
+    0x6026EF: 4252,
+    0xBCD7A5: 4252,
+    0x187A3B: 4252,
+    0xB86CE0: 4251,
+    0x204C03: 4252,
+    0xF01AA0: 4252,
+    0xA0A001: 4252,
+    0x8C7909: 4252,
+    0x000B86: 4252,
+    0x883A30: 4252,
+    0x7CA62A: 4251,
+    0x2462CE: 4252,
+    0xD8D8E5: 4253,
+    0x4C2338: 195,
+    0x4472AC: 4254,
+    0xA86E84: 4220,
+    0x888C1B: 38,
+    0x3CF083: 48,
+    0xC0D941: 4255,
+    0x68B76B: 5,
+    0x9C1221: 33,
+    0x103F8C: 21,
+    0xF09E9E: 14,
+    0x48B313: 4256,
+    0x68C6AC: 25,
+    0xBC3898: 25,
+    0xA04F52: 25,
+    0x3C94FD: 179,
+    0x94CA9A: 4257,
+    0x742EC1: 4258,
+    0x3023BA: 4259,
+    0x84F2C1: 11,
+    0x40827B: 4260,
+    0xD06DC8: 15,
+    0x4062EE: 4261,
+    0x742972: 28,
+    0xE45ECC: 28,
+    0x286B5C: 4,
+    0x5879E0: 90,
+    0xC47764: 90,
+    0x607FCB: 90,
+    0x6CB34D: 4262,
+    0x5C5A4C: 12,
+    0x980802: 4263,
+    0xFCB387: 4264,
+    0x70357B: 146,
+    0xA8A913: 358,
+    0xBC2978: 4265,
+    0x1423F3: 293,
+    0x9C0E51: 4266,
+    0x1CF64C: 49,
+    0xAC5C2C: 49,
+    0x50F265: 49,
+    0xC06C0C: 49,
+    0xEC09C9: 53,
+    0x6C3A36: 4267,
+    0xC8EED7: 4268,
+    0x603192: 4269,
+    0x58D15A: 53,
+    0x9CDAA8: 49,
+    0x0C07DF: 40,
+    0xF0ABF3: 5,
+    0x7CE712: 116,
+    0x0CEA14: 131,
+    0xE817FC: 366,
+    0xE82281: 167,
+    0x203B34: 40,
+    0xB43D6B: 175,
+    0x4CD7C8: 4270,
+    0xA42902: 54,
+    0x6CD008: 11,
+    0x508CC9: 11,
+    0x346E68: 15,
+    0xCC9096: 117,
+    0x2CE2D9: 117,
+    0x8492E5: 15,
+    0xFCAE2B: 4271,
+    0x5CEB52: 11,
+    0xFCABF5: 11,
+    0x083BE9: 21,
+    0x10B65E: 21,
+    0x28EBB7: 4272,
+    0x60CF84: 398,
+    0x685134: 4252,
+    0xF0CF4D: 4273,
+    0x00153B: 4274,
+    0xB848EC: 13,
+    0xF41E57: 439,
+    0x081031: 4275,
+    0xCC6E2A: 20,
+    0x30F23C: 231,
+    0x1C112F: 146,
+    0xE41E33: 119,
+    0x74AD45: 4276,
+    0xEC308E: 4277,
+    0x70C59C: 238,
+    0xE406BF: 238,
+    0x0CC56C: 49,
+    0x983FE8: 90,
+    0x10ABC9: 90,
+    0xE86A64: 4278,
+    0x902E16: 4278,
+    0xCC4B04: 49,
+    0x4409DA: 49,
+    0x809698: 49,
+    0xC484FC: 49,
+    0x60FF9E: 43,
+    0x001E96: 4279,
+    0xE88088: 4278,
+    0x745D22: 4278,
+    0x408556: 4280,
+    0x9C69ED: 89,
+    0x645563: 4281,
+    0xC8A913: 4282,
+    0x101A92: 4283,
+    0x781F7C: 81,
+    0x485C2C: 121,
+    0x88F4DA: 25,
+    0xEC8E77: 25,
+    0x8407C4: 4284,
+    0xECFC2F: 3,
+    0x6045CD: 3,
+    0x2C5683: 29,
+    0xD823E0: 4285,
+    0x30E3A4: 25,
+    0xA085E3: 14,
+    0x084857: 4286,
+    0x74F90F: 15,
+    0x2014C4: 15,
+    0x0C9515: 4287,
+    0x707DAF: 4288,
+    0x64E815: 4289,
+    0x50056E: 69,
+    0xEC470C: 638,
+    0x3854F5: 4254,
+    0x70F74F: 200,
+    0x485E0E: 12,
+    0xC0BAE6: 4290,
+    0xE01F34: 145,
+    0x4CF475: 117,
+    0x3C4AC9: 117,
+    0x2C0D27: 117,
+    0x5CBE69: 4291,
+    0x94CFB0: 117,
+    0xD8CF61: 3,
+    0xFC4116: 210,
+    0x48B424: 63,
+    0xA02442: 4292,
+    0x3C5765: 4293,
+    0x5805D9: 378,
+    0xEC5A31: 310,
+    0xF01EAC: 4294,
+    0x34E6E6: 285,
+    0xECA7B1: 12,
+    0xB48618: 4295,
+    0xEC1DA9: 143,
+    0xA4A584: 4,
+    0xC4A9B8: 4296,
+    0x345CF3: 4297,
+    0x58ED99: 11,
+    0x2441FE: 57,
+    0xF4BDB9: 4298,
+    0x20B5C6: 4299,
+    0x981CA2: 49,
+    0xE8FFF4: 49,
+    0x0C1563: 49,
+    0x3CDD57: 49,
+    0x7C3B2D: 49,
+    0xEC536F: 15,
+    0xD801D0: 15,
+    0x84EE7F: 15,
+    0x7CFAD6: 194,
+    0x788371: 15,
+    0xE8F0A4: 4300,
+    0xF43AFA: 12,
+    0xDC2FFA: 4301,
+    0xD0C0BF: 4302,
+    0x00749C: 138,
+    0xE01C41: 1,
+    0xBCF310: 1,
+    0x489BD5: 1,
+    0xDCB808: 1,
+    0x8C497A: 1,
+    0xB027CF: 1,
+    0xD854A2: 1,
+    0xF46E95: 1,
+    0x000130: 1,
+    0xFC0A81: 1,
+    0xC851FB: 1,
+    0xDC233B: 1,
+    0xC8665D: 1,
+    0xE4DBAE: 1,
+    0xCCCCEA: 4303,
+    0x000FEA: 538,
+    0x48417B: 181,
+    0x38AD2B: 520,
+    0xE8458B: 128,
+    0x1CAB48: 231,
+    0x608CDF: 4304,
+    0x3027CF: 4305,
+    0xD04433: 4306,
+    0x001277: 4307,
+    0x944560: 210,
+    0x5C337B: 210,
+    0x4086CB: 1167,
+    0x2047B5: 3,
+    0x60452E: 25,
+    0x8CE9EE: 25,
+    0xCCD342: 4,
+    0x40B8C2: 4308,
+    0x88B436: 4309,
+    0x2C9C58: 195,
+    0xB8F44F: 205,
+    0x540929: 233,
+    0x2CBACA: 4310,
+    0x009CC0: 146,
+    0x606682: 764,
+    0x788DAF: 3,
+    0xBC0FFE: 28,
+    0xBC1896: 15,
+    0x2831F8: 15,
+    0xC4AA99: 15,
+    0xA8F5E1: 4311,
+    0xE89E13: 4312,
+    0x7CFCFD: 5,
+    0x4887B8: 162,
+    0x7058A4: 4249,
+    0xA494DC: 4313,
+    0xE47876: 89,
+    0xA4A930: 166,
+    0x4C4341: 218,
+    0xE46CD1: 218,
+    0xD0F27F: 4314,
+    0x188025: 54,
+    0xE0D3B4: 20,
+    0xFC8C11: 157,
+    0x04FA3F: 4315,
+    0x441DB1: 4316,
+    0x88F00F: 4317,
+    0x4435D3: 167,
+    0xF8F09D: 4318,
+    0x7C752D: 90,
+    0x84EEE4: 90,
+    0xFC936B: 90,
+    0xBCB6FB: 4319,
+    0xA02252: 4320,
+    0xBC102F: 4321,
+    0x74C530: 146,
+    0x18A788: 4322,
+    0xBC96E5: 4323,
+    0x64DAED: 63,
+    0x289401: 511,
+    0xD878C9: 108,
+    0xA85EF2: 231,
+    0x789A18: 439,
+    0xA899AD: 4324,
+    0xD015BB: 12,
+    0x64CE6E: 4325,
+    0x84DB2F: 4325,
+    0xD0484F: 181,
+    0x78DF72: 442,
+    0x602B58: 38,
+    0x109D9C: 38,
+    0x28FF5F: 4326,
+    0x2C459A: 4327,
+    0x6C6E07: 4328,
+    0x6C6286: 81,
+    0xBC8529: 4329,
+    0x7492BA: 4330,
+    0x607623: 4331,
+    0xB8FC28: 4332,
+    0x0020FC: 4333,
+    0x888187: 576,
+    0x50482C: 12,
+    0x48C461: 69,
+    0xB8B7DB: 4334,
+    0x880CE0: 53,
+    0xB83DF6: 53,
+    0xB4DDE0: 4335,
+    0xC42795: 52,
+    0xE0885D: 52,
+    0x802994: 52,
+    0x9404E3: 52,
+    0x9064AD: 15,
+    0xD4D892: 15,
+    0x30E04F: 49,
+    0x64E4A5: 244,
+    0x6CA367: 4336,
+    0x589630: 52,
+    0x989D5D: 52,
+    0x484BD4: 52,
+    0xE0DBD1: 52,
+    0xECA81F: 52,
+    0x54A65C: 52,
+    0xDCEB69: 52,
+    0x946A77: 52,
+    0xD4B92F: 52,
+    0xD40F9E: 49,
+    0x980DAF: 49,
+    0xDC6DBC: 49,
+    0xA4D23E: 49,
+    0xB42A0E: 52,
+    0x603D26: 52,
+    0x48BDCE: 52,
+    0x98D3D7: 15,
+    0x886EEB: 15,
+    0xE40D3B: 228,
+    0xEC5382: 22,
+    0x0018AD: 4337,
+    0xA4CCB3: 40,
+    0x9C0971: 21,
+    0x98AB15: 4338,
+    0x7093C1: 63,
+    0x5449FC: 50,
+    0x201746: 4339,
+    0xCC4085: 199,
+    0xDCCD18: 35,
+    0x18F935: 4,
+    0x588B1C: 4,
+    0xBC3198: 12,
+    0xECA2A0: 278,
+    0x0C7043: 141,
+    0xC8154E: 25,
+    0x4C496C: 25,
+    0x0011A9: 55,
+    0xECE7C2: 29,
+    0x3C0D2C: 4340,
+    0xF4BFBB: 29,
+    0x789F38: 4341,
+    0x544C8A: 157,
+    0x84AC60: 4342,
+    0x9CA389: 81,
+    0x5C101E: 11,
+    0x905A08: 974,
+    0x9070D3: 5,
+    0x6C48A6: 5,
+    0xFCB9DF: 78,
+    0xD081C5: 28,
+    0xFCF763: 4343,
+    0x808C97: 74,
+    0xC46026: 319,
+    0x000D39: 83,
+    0x4C12E8: 4344,
+    0x2002FE: 4345,
+    0x74272C: 4346,
+    0xC05B44: 166,
+    0x208810: 110,
+    0xA06260: 13,
+    0xE44519: 4197,
+    0xE4B224: 15,
+    0xA83ED3: 15,
+    0x6467CD: 15,
+    0x34ECB6: 84,
+    0x807677: 4347,
+    0x9C1ECF: 4348,
+    0xF42B8C: 90,
+    0x4CD2FB: 4293,
+    0xE41A1D: 4349,
+    0xF4CAE7: 48,
+    0x3CEF42: 274,
+    0xB0A3F2: 4350,
+    0x84F175: 4351,
+    0x20E46F: 146,
+    0xC89828: 11,
+    0xDC3642: 11,
+    0x788A86: 242,
+    0xE82404: 116,
+    0xF86691: 135,
+    0x6C2ADF: 12,
+    0x883037: 28,
+    0xE43819: 4352,
+    0x60DC81: 4254,
+    0x847293: 53,
+    0xF82E0C: 53,
+    0x9006F2: 53,
+    0xE86E3A: 141,
+    0xBCB1D3: 20,
+    0xB87BD4: 210,
+    0xC8138B: 107,
+    0x34AA31: 107,
+    0xA04C0C: 107,
+    0x6CC242: 107,
+    0xE073E7: 19,
+    0x608246: 49,
+    0x98B379: 49,
+    0x049D05: 49,
+    0x544E45: 13,
+    0x54083B: 12,
+    0x54EF43: 15,
+    0xD81BB5: 15,
+    0x8464DD: 15,
+    0x68A46A: 15,
+    0xF8DB88: 110,
+    0x7845C4: 110,
+    0x5C260A: 110,
+    0xF48E38: 110,
+    0x28F10E: 110,
+    0x109836: 110,
+    0x001422: 110,
+    0x0015C5: 110,
+    0x90B11C: 110,
+    0x64006A: 110,
+    0xE4434B: 110,
+    0x001E4F: 110,
+    0x0026B9: 110,
+    0xC81F66: 110,
+    0xD067E5: 110,
+    0x209727: 4353,
+    0x001AE8: 82,
+    0x2CFE4F: 40,
+    0x907E43: 11,
+    0x943EE4: 4354,
+    0xA8BD3A: 4355,
+    0x48CAC6: 4355,
+    0xD43844: 4355,
+    0xD45347: 4356,
+    0x6C3C8C: 110,
+    0xC45AB1: 110,
+    0xA8B028: 4357,
+    0x407F5F: 28,
+    0x2CEA7F: 110,
+    0xF0D4E2: 110,
+    0xCC483A: 110,
+    0x30D042: 110,
+    0x8C04BA: 110,
+    0xE454E8: 110,
+    0xA4BB6D: 110,
+    0xE01F6A: 117,
+    0x00566D: 117,
+    0x90CC7A: 117,
+    0x8CC58C: 4358,
+    0x2C704F: 11,
+    0x645234: 135,
+    0x5C8816: 120,
+    0x381672: 37,
+    0x6C29D2: 4,
+    0x08CC81: 54,
+    0xC0DD8A: 4359,
+    0xCCA174: 4359,
+    0x18F46B: 4360,
+    0x28EA0B: 157,
+    0x0815AE: 29,
+    0x04B4FE: 427,
+    0xF45433: 120,
+    0x34C0F9: 120,
+    0xD07B6F: 4361,
+    0x04A526: 81,
+    0x20BA36: 205,
+    0xD80AE6: 11,
+    0x489E9D: 31,
+    0xA41437: 54,
+    0xF84DFC: 54,
+    0x849A40: 54,
+    0xC0517E: 54,
+    0x2CA59C: 54,
+    0x40ACBF: 54,
+    0x98F112: 54,
+    0x989DE5: 54,
+    0x3C1BF8: 54,
+    0x784558: 131,
+    0xAC8BA9: 131,
+    0x9C65EE: 123,
+    0x9C5416: 4,
+    0xA0AF12: 15,
+    0x6096A4: 15,
+    0x48BDA7: 22,
+    0xEC2150: 146,
+    0x30B64F: 28,
+    0x08B258: 28,
+    0xF4A739: 28,
+    0x4C16FC: 28,
+    0xC8E7F0: 28,
+    0x7C2586: 28,
+    0x0017CB: 28,
+    0x001F12: 28,
+    0x0024DC: 28,
+    0x5C5EAB: 28,
+    0x7819F7: 28,
+    0x9C05D6: 131,
+    0x28704E: 131,
+    0x00121E: 28,
+    0x0010DB: 28,
+    0x002283: 28,
+    0x100E7E: 28,
+    0x44F477: 28,
+    0x2C2172: 28,
+    0x4C9614: 28,
+    0x5C6AEC: 12,
+    0xCC9F7A: 134,
+    0x5414A7: 4362,
+    0x4CE705: 144,
+    0x0C7274: 427,
+    0x80DB17: 28,
+    0xB8F015: 28,
+    0xE4233C: 28,
+    0x98868B: 28,
+    0x005828: 4363,
+    0xFC3342: 28,
+    0x3C8C93: 28,
+    0x0C8126: 28,
+    0x182AD3: 28,
+    0x94BF94: 28,
+    0x380716: 524,
+    0x68228E: 28,
+    0xD8539A: 28,
+    0xF8C116: 28,
+    0x880AA3: 28,
+    0xEC3873: 28,
+    0xC00380: 28,
+    0x20D80B: 28,
+    0x4C6D58: 28,
+    0x408F9D: 28,
+    0xAC78D1: 28,
+    0xA0A3B3: 14,
+    0x34987A: 14,
+    0x685932: 412,
+    0xB4B9E6: 63,
+    0x30B216: 4364,
+    0x7495A7: 4365,
+    0x88625D: 4366,
+    0xC836A3: 4367,
+    0xF4EE31: 4,
+    0x141A97: 49,
+    0x4045C4: 15,
+    0x74872E: 15,
+    0x3C1EB5: 49,
+    0xAC86A3: 49,
+    0x001FD6: 4368,
+    0x80D266: 4369,
+    0xE42150: 4370,
+    0xD404E6: 293,
+    0x28EBA6: 4371,
+    0xC0B3C8: 4372,
+    0xCC4D74: 4373,
+    0x10BE99: 4374,
+    0x60DEF4: 73,
+    0x84D352: 4375,
+    0xF8D758: 4376,
+    0x24FE9A: 540,
+    0xB4CBB8: 638,
+    0xA031EB: 4377,
+    0xBC32B2: 90,
+    0xEC8A48: 89,
+    0x8C5DB2: 12,
+    0x88CE3F: 15,
+    0xECF8D0: 15,
+    0x30DF17: 159,
+    0xD8028A: 574,
+    0xB83C28: 49,
+    0x3C6D89: 49,
+    0xAC4500: 49,
+    0xE86538: 195,
+    0x242A04: 4,
+    0x141AAA: 4378,
+    0xCCDEDE: 81,
+    0x748669: 69,
+    0xC80A35: 4379,
+    0x24952F: 210,
+    0x047056: 48,
+    0x886D2D: 117,
+    0x40FF40: 4380,
+    0x106838: 43,
+    0xB894D9: 53,
+    0x7CE269: 53,
+    0x0804B4: 53,
+    0x30AF7E: 53,
+    0x84B1E4: 49,
+    0x54EBE9: 49,
+    0xAC1615: 49,
+    0xEC7379: 49,
+    0xFC2A46: 194,
+    0x9CFA3C: 4381,
+    0x80616C: 21,
+    0x40B607: 69,
+    0x0C3526: 157,
+    0x28CF51: 35,
+    0xFCB0DE: 195,
+    0xF44D5C: 112,
+    0x1CC316: 4382,
+    0x3C6A48: 86,
+    0x5CB12E: 4,
+    0x044A6A: 4383,
+    0x64C6D2: 378,
+    0x481F66: 29,
+    0x782459: 215,
+    0xA46C24: 15,
+    0x78071C: 4384,
+    0x1C8BEF: 4197,
+    0x28E297: 4385,
+    0x58F85C: 468,
+    0xBC6BFF: 257,
+    0x304449: 4386,
+    0xECC3B0: 11,
+    0x087B12: 3,
+    0xB457E6: 69,
+    0xBCBD84: 11,
+    0x50D45C: 77,
+    0x00301A: 4387,
+    0x70033F: 4388,
+    0x80F1A4: 15,
+    0xD0CF0E: 3,
+    0x08085C: 4389,
+    0x44D506: 135,
+    0x2C69CC: 4390,
+    0xD46137: 12,
+    0xC435D9: 49,
+    0xACC906: 49,
+    0x04BC6D: 49,
+    0x2C8AC7: 50,
+    0x80DECC: 4391,
+    0xA0ED6D: 50,
+    0xB08BBE: 4392,
+    0xC4EB42: 3,
+    0xF8345A: 520,
+    0x70C932: 4393,
+    0x744D6D: 15,
+    0x301984: 15,
+    0xF8C249: 4394,
+    0x648CBB: 53,
+    0x74B839: 53,
+    0xC4D36A: 53,
+    0x988924: 53,
+    0x341593: 272,
+    0x0CB937: 50,
+    0x440CEE: 4395,
+    0xA017F1: 1148,
+    0x2C6F4E: 4396,
+    0x90F82E: 77,
+    0x488F4C: 4397,
+    0xA8F1B2: 1148,
+    0xFCE9D8: 77,
+    0x642943: 1167,
+    0x585B69: 4398,
+    0xB8B2F7: 4399,
+    0xC49894: 12,
+    0x8CFADD: 15,
+    0xF89A25: 15,
+    0x083A8D: 14,
+    0x842388: 272,
+    0x386504: 22,
+    0xF8710C: 40,
+    0x3C135A: 40,
+    0xC084E0: 15,
+    0x900117: 15,
+    0xE0B668: 11,
+    0xA49DDD: 90,
+    0x6C5563: 90,
+    0x109F4F: 4400,
+    0x389E80: 11,
+    0x880FA2: 3,
+    0xEC96BF: 4401,
+    0xD42000: 12,
+    0x704DE7: 231,
+    0x74D873: 651,
+    0x30DE4B: 94,
+    0x1C2285: 4402,
+    0xD492B9: 4403,
+    0x001BB5: 4404,
+    0x68AAC4: 68,
+    0xDC97E6: 3,
+    0x68B8BB: 4197,
+    0x14AC60: 195,
+    0x80FD7B: 4405,
+    0x589351: 117,
+    0x2CA7EF: 71,
+    0x50FDD5: 4321,
+    0xD0F4F7: 117,
+    0xD4E98A: 25,
+    0x28808A: 15,
+    0x346679: 15,
+    0x448CAB: 4406,
+    0x682624: 4407,
+    0xA0218B: 4408,
+    0x2084F5: 4409,
+    0x142103: 218,
+    0x40B15C: 15,
+    0xC4D496: 4410,
+    0x2C326A: 49,
+    0x6CB133: 49,
+    0x28E71D: 89,
+    0x88287D: 263,
+    0x6C97AA: 4411,
+    0x6C6567: 4412,
+    0x4C24CE: 33,
+    0x1C97FB: 4413,
+    0x445ADF: 4414,
+    0x086E9C: 117,
+    0xD0DAD7: 49,
+    0xC4ACAA: 49,
+    0x4416FA: 90,
+    0xFC671F: 220,
+    0x78C57D: 112,
+    0x78F1C6: 4,
+    0x341B2D: 4,
+    0x843C4C: 4415,
+    0x6C72E2: 4416,
+    0x38A89B: 5,
+    0x6437A4: 4417,
+    0x90CAFA: 210,
+    0x10E840: 4418,
+    0x4405E8: 4419,
+    0x8C3592: 257,
+    0xA0465A: 78,
+    0x64B5F2: 90,
+    0x8C06CB: 4420,
+    0x303D51: 12,
+    0x70B306: 49,
+    0xB8496D: 49,
+    0x9C924F: 49,
+    0x200E2B: 49,
+    0xF0D793: 49,
+    0x04D9C8: 589,
+    0xDCAA43: 4421,
+    0x00FBF9: 4422,
+    0xDC0B09: 4,
+    0x08F3FB: 4,
+    0xA036BC: 398,
+    0x840BBB: 128,
+    0x447147: 4197,
+    0xF4BBC7: 146,
+    0x986610: 11,
+    0x1C24CD: 234,
+    0xA8DC5A: 4423,
+    0xA0FB83: 22,
+    0x906560: 38,
+    0x28BC05: 4405,
+    0x1CEF03: 339,
+    0x58B03E: 35,
+    0xAC4E65: 5,
+    0xBC5DA3: 135,
+    0xE00871: 281,
+    0x9C956E: 72,
+    0x1073EB: 4424,
+    0x2CA774: 53,
+    0x187A3E: 238,
+    0x300505: 25,
+    0xB0DCEF: 25,
+    0x7413EA: 25,
+    0xA88038: 4425,
+    0xDCF31C: 53,
+    0x544538: 53,
+    0x78C213: 3,
+    0x4022D8: 14,
+    0x184E03: 145,
+    0x38F0C8: 4426,
+    0x34FE1C: 4427,
+    0x60CF69: 4428,
+    0x4C627B: 4429,
+    0xBC7B72: 117,
+    0x38FDF5: 232,
+    0x3C26E4: 4,
+    0x3891B7: 4,
+    0x345DA8: 4,
+    0x38127B: 4430,
+    0xB0E45C: 90,
+    0xD868A0: 90,
+    0x04292E: 90,
+    0xF82B7F: 117,
+    0x40C3BC: 117,
+    0x2853E0: 4431,
+    0xC412EC: 15,
+    0xDC360C: 520,
+    0x687FF0: 94,
+    0xBC4CA0: 15,
+    0x74342B: 15,
+    0x7891DE: 4432,
+    0x88F2BD: 167,
+    0x6C0831: 4433,
+    0xA47EFA: 4434,
+    0xE0806B: 40,
+    0x7050E7: 12,
+    0x70AC08: 238,
+    0x200BCF: 35,
+    0x7070FC: 4435,
+    0x98D93D: 4436,
+    0xB4A678: 250,
+    0xACC4BD: 69,
+    0xE4B633: 4437,
+    0x085104: 117,
+    0x785B64: 117,
+    0x54E15B: 117,
+    0x8C9806: 4438,
+    0x200889: 11,
+    0xACA32F: 4439,
+    0x4C9E6C: 4440,
+    0x200B16: 53,
+    0x8801F9: 53,
+    0xF85548: 53,
+    0x68E74A: 53,
+    0x70A6BD: 22,
+    0x2426D6: 15,
+    0xEC819C: 15,
+    0xD0989C: 4441,
+    0x846993: 19,
+    0xC4A10E: 12,
+    0x542F04: 4442,
+    0x746F88: 11,
+    0x1CA410: 4443,
+    0xB41974: 49,
+    0x6095BD: 49,
+    0xEC1127: 53,
+    0x04E892: 4444,
+    0x98C81C: 4445,
+    0x748469: 35,
+    0x8CCBDF: 4446,
+    0xBCE9E2: 1183,
+    0x18A59C: 12,
+    0x10961A: 483,
+    0x74718B: 49,
+    0x70317F: 49,
+    0xA4CF99: 49,
+    0x4C2EB4: 49,
+    0x34AD61: 211,
+    0x2C553C: 4447,
+    0x5443B2: 14,
+    0x04B97D: 4448,
+    0xC4C063: 21,
+    0x0025CA: 4449,
+    0xE06CC5: 117,
+    0x30963B: 117,
+    0x8C6BDB: 117,
+    0x10DA49: 117,
+    0x60183A: 117,
+    0x18C007: 117,
+    0xACBF71: 389,
+    0xB48351: 25,
+    0xBCF4D4: 195,
+    0x74563C: 538,
+    0xEC551C: 15,
+    0xE0798D: 238,
+    0xD89C8E: 4450,
+    0xACD31D: 20,
+    0xB04A6A: 90,
+    0xA8798D: 90,
+    0x5CEDF4: 90,
+    0x64C269: 63,
+    0xBC6E6D: 38,
+    0xCCF305: 4451,
+    0x34BD20: 4452,
+    0xAC2AA1: 4,
+    0xF8E94F: 4,
+    0x30894A: 25,
+    0x98597A: 25,
+    0x64497D: 25,
+    0xB8D61A: 14,
+    0x283DC2: 90,
+    0x00D49E: 25,
+    0xDC9A7D: 349,
+    0x84F1D0: 4453,
+    0x30CB36: 4454,
+    0x30BB7D: 71,
+    0x6C67EF: 15,
+    0x88693D: 15,
+    0x00991D: 15,
+    0x208BD1: 175,
+    0x2C07F6: 4455,
+    0x3868BE: 135,
+    0x3492C2: 4456,
+    0x6CA401: 4457,
+    0x8C1759: 25,
+    0xB83FD2: 270,
+    0x283E0C: 4458,
+    0x04BC9F: 218,
+    0x28A53F: 146,
+    0x8C49B6: 146,
+    0x4851D0: 4459,
+    0x8077A4: 231,
+    0x00C30A: 40,
+    0x8852EB: 40,
+    0xB42875: 4460,
+    0x302364: 0,
+    0x0C1C1A: 63,
+    0xD4FB8E: 49,
+    0xB0DE28: 49,
+    0x7C131D: 165,
+    0xD49FDD: 117,
+    0x00D8A2: 117,
+    0xD850A1: 4461,
+    0x441AAC: 4462,
+    0x7C6CF0: 423,
+    0x342840: 49,
+    0x18E7B0: 49,
+    0x50578A: 49,
+    0xD833B7: 3,
+    0x2C784C: 4463,
+    0x488759: 40,
+    0xAC1E9E: 40,
+    0xE0AEA2: 15,
+    0x44456F: 4464,
+    0xE8FDF8: 487,
+    0xDC6B1B: 117,
+    0x98CA20: 4465,
+    0xD06DC9: 3,
+    0xDC152D: 29,
+    0x0857FB: 77,
+    0x00D0FC: 4466,
+    0x34976F: 4467,
+    0xC01803: 19,
+    0x04CF4B: 25,
+    0xF897A9: 228,
+    0x6C6C0F: 15,
+    0xEC9B2D: 29,
+    0xFC38C4: 4468,
+    0x5CF51A: 510,
+    0x101D51: 4469,
+    0x4CFE2E: 709,
+    0xA81306: 146,
+    0x1C34F1: 238,
+    0xAC93C4: 167,
+    0x000688: 4470,
+    0xD01B1F: 373,
+    0xCC7D5B: 570,
+    0x749552: 4471,
+    0x0C4EC0: 4472,
+    0xCC8CBF: 220,
+    0x901195: 77,
+    0x44EA30: 90,
+    0x845F04: 90,
+    0x9C2F9D: 192,
+    0xA4F33B: 11,
+    0x30E7BC: 69,
+    0x7CB566: 25,
+    0x50E9DF: 116,
+    0x6C4BB4: 132,
+    0x589BF7: 685,
+    0x50A030: 12,
+    0x60109E: 15,
+    0x40329D: 4473,
+    0xE8FA23: 117,
+    0xEC3A52: 117,
+    0x441B88: 49,
+    0x80045F: 49,
+    0x9C3E53: 49,
+    0xC889F3: 49,
+    0x10B9C4: 49,
+    0x000E24: 4474,
+    0x4C7713: 232,
+    0xD8AA59: 4375,
+    0x64CF13: 4475,
+    0x9C7403: 69,
+    0x3CECDE: 287,
+    0x9C6B00: 4476,
+    0x54F82A: 205,
+    0xD43538: 166,
+    0x10CE02: 77,
+    0x040D84: 238,
+    0x4C195D: 3,
+    0x0013DC: 4477,
+    0xD84A2B: 11,
+    0xD0F99B: 11,
+    0xF41399: 4478,
+    0x6026AA: 4,
+    0x5C3192: 4,
+    0x641ABA: 4479,
+    0x349454: 14,
+    0xA83A48: 4298,
+    0xC85ACF: 19,
+    0xFC29E3: 444,
+    0x9C1C6D: 4480,
+    0x88C227: 15,
+    0x8054D9: 15,
+    0x9C8566: 4481,
+    0x7070AA: 77,
+    0xD413F8: 4482,
+    0x98672E: 473,
+    0x480286: 194,
+    0x94DEB8: 238,
+    0xA4438C: 258,
+    0x642FC7: 21,
+    0x94A9A8: 53,
+    0x48B423: 77,
+    0x9C00D3: 4483,
+    0x282D06: 295,
+    0x202B20: 195,
+    0xE8CAC8: 31,
+    0xD419F6: 175,
+    0x64BF6B: 15,
+    0x30499E: 15,
+    0x9CEC61: 117,
+    0x747069: 117,
+    0x14FB70: 117,
+    0x84D3D5: 117,
+    0x001117: 4484,
+    0xB03366: 146,
+    0x7CC225: 90,
+    0xFC7692: 4485,
+    0xFCAFBE: 4486,
+    0x886EE1: 4487,
+    0xC475AB: 25,
+    0x80B745: 4488,
+    0x4CABF8: 234,
+    0xC8418A: 4489,
+    0xDC973A: 4490,
+    0x2066FD: 4491,
+    0x0CB088: 4492,
+    0x686725: 14,
+    0x202027: 4493,
+    0xA0A309: 49,
+    0x5C50D9: 49,
+    0x884D7C: 49,
+    0xA8FE9D: 49,
+    0x1848BE: 77,
+    0xF89E94: 25,
+    0x644212: 4201,
+    0xC403A8: 25,
+    0xD463DE: 146,
+    0x0C9043: 194,
+    0xB0F7C4: 77,
+    0x8C5646: 244,
+    0xCC7190: 4494,
+    0x1400E9: 4495,
+    0x541F8D: 11,
+    0x2CF1BB: 11,
+    0xDC2C6E: 439,
+    0x18A9A6: 4496,
+    0x547D40: 4497,
+    0xC0D7AA: 48,
+    0x6C0F0B: 29,
+    0xD4B7D0: 655,
+    0xACACE2: 4498,
+    0x4C8D53: 15,
+    0xBC2CE6: 4,
+    0xCCED4D: 4,
+    0x48BD4A: 15,
+    0xA8D4E0: 15,
+    0xA0406F: 15,
+    0x3429EF: 780,
+    0xA0B53C: 1134,
+    0xC4BDE5: 25,
+    0x6CB0FD: 4499,
+    0xFC5F49: 510,
+    0x3035C5: 117,
+    0x004F1A: 15,
+    0x7433A6: 37,
+    0x2C0DA7: 25,
+    0x649E31: 166,
+    0x24CD8D: 102,
+    0x541D61: 4500,
+    0x700971: 90,
+    0xD01B49: 90,
+    0xF820A9: 117,
+    0xA0FF22: 4501,
+    0x5C0214: 166,
+    0xE4936A: 69,
+    0x4877BD: 69,
+    0xF856C3: 11,
+    0x00B0EC: 4502,
+    0x6CD3EE: 1268,
+    0x04CD15: 238,
+    0xE42805: 4503,
+    0x381F8D: 220,
+    0x208C47: 4504,
+    0x3453D2: 3,
+    0x18EF3A: 33,
+    0x785EA2: 412,
+    0xDCF4CA: 49,
+    0x7CFC16: 49,
+    0x88B945: 49,
+    0xB0BE83: 49,
+    0x10321D: 15,
+    0x38FDF8: 4,
+    0x3C9FC3: 4505,
+    0x608FA4: 181,
+    0x7876D9: 4506,
+    0x94A408: 4507,
+    0xD0F865: 163,
+    0x7C8437: 4508,
+    0xB84D43: 332,
+    0xA84A63: 4509,
+    0x243FAA: 117,
+    0xD867D3: 117,
+    0x48474B: 117,
+    0x806F1C: 117,
+    0x6815D3: 4510,
+    0x0080E7: 4511,
+    0x7CC177: 8,
+    0xE0A258: 4512,
+    0x4CBCE9: 285,
+    0x385C76: 830,
+    0xC89F1A: 15,
+    0xD86852: 15,
+    0xAC6490: 15,
+    0x9C50D1: 102,
+    0x140020: 4513,
+    0x18E1DE: 4514,
+    0x8CF681: 238,
+    0x7C66EF: 113,
+    0x441793: 14,
+    0x745CFA: 4515,
+    0x5CDFB8: 4516,
+    0xE00AF6: 192,
+    0x2C1A05: 4,
+    0xB40ECF: 47,
+    0x00A388: 319,
+    0x503DEB: 250,
+    0xF87FA5: 4517,
+    0xF83869: 244,
+    0xF05ECD: 53,
+    0x2C0547: 44,
+    0xE0C58F: 275,
+    0x30B930: 11,
+    0x949869: 11,
+    0x785005: 4518,
+    0x701AD5: 4519,
+    0xFC2E19: 29,
+    0x50F908: 4520,
+    0xAC764C: 69,
+    0x5C58E6: 95,
+    0xEC94CB: 14,
+    0xEC97E0: 516,
+    0xD0B66F: 165,
+    0xF0B61E: 25,
+    0xC84D44: 4521,
+    0x2C3A91: 117,
+    0x64F705: 117,
+    0x60CE41: 15,
+    0x281709: 15,
+    0x606EE8: 40,
+    0x0CE159: 4522,
+    0x50C2E8: 195,
+    0x3009C0: 78,
+    0xB04692: 69,
+    0x7086CE: 167,
+    0x500F59: 4523,
+    0x90B57F: 73,
+    0xE42AAC: 157,
+    0xC0F827: 4524,
+    0x001413: 4525,
+    0x000799: 4526,
+    0xDC8D8A: 181,
+    0x98B177: 4527,
+    0xA029BD: 4528,
+    0x64DCDE: 4529,
+    0x00919E: 25,
+    0x241D48: 135,
+    0x287777: 11,
+    0x6006E3: 49,
+    0xD43DF3: 112,
+    0x20579E: 332,
+    0xC884CF: 15,
+    0x20E7B6: 638,
+    0x808ABD: 90,
+    0x3CCD57: 166,
+    0x245E48: 49,
+    0x08C729: 49,
+    0xC4C36B: 49,
+    0xE8A730: 49,
+    0xE023D7: 4530,
+    0x806A10: 4531,
+    0x60E32B: 25,
+    0xD8BE65: 77,
+    0x106FD9: 195,
+    0x584D42: 4532,
+    0xB8DAE8: 117,
+    0xB8AE1D: 4533,
+    0x28DEA8: 11,
+    0xACEC85: 63,
+    0xE06781: 281,
+    0x60A5E2: 25,
+    0xD4548B: 25,
+    0x1009F9: 77,
+    0x906976: 4534,
+    0xFC9257: 232,
+    0xD03E7D: 483,
+    0x60B6E1: 53,
+    0x6C79B8: 53,
+    0x8CA399: 108,
+    0x60DB15: 21,
+    0x5CA721: 21,
+    0x98F217: 737,
+    0x446752: 4535,
+    0xA82316: 81,
+    0x38E39F: 78,
+    0xD01E1D: 4536,
+    0x78BB88: 4537,
+    0x608A10: 72,
+    0xA864F1: 25,
+    0xA42A71: 135,
+    0x84EBEF: 4,
+    0x908060: 4538,
+    0x70A6CC: 25,
+    0xD48DD9: 4539,
+    0x582FF7: 3,
+    0xACE77B: 135,
+    0x6C433C: 231,
+    0x48F8FF: 4540,
+    0xE8C1E8: 4541,
+    0x7C70DB: 25,
+    0x8C94CC: 4542,
+    0x2CDDE9: 89,
+    0x709741: 48,
+    0xE408E7: 116,
+    0x8CFD15: 4543,
+    0xC4FF22: 117,
+    0xA0A0DC: 117,
+    0xC4808A: 4544,
+    0x40F420: 135,
+    0x645D92: 135,
+    0xCCA260: 135,
+    0x9C6121: 135,
+    0xE04FBD: 135,
+    0xACD829: 47,
+    0x5CA176: 135,
+    0x4CD3AF: 145,
+    0xC85142: 90,
+    0x14223B: 210,
+    0x683A48: 4545,
+    0xF44588: 15,
+    0xB0C952: 69,
+    0x10E4C2: 90,
+    0x0C8DCA: 90,
+    0xCC0DE7: 4546,
+    0x4456E2: 135,
+    0x3C3712: 427,
+    0xC8BB81: 117,
+    0x1C472F: 117,
+    0x205E64: 117,
+    0xF4419E: 117,
+    0x90F9B7: 15,
+    0xC47469: 4547,
+    0xF46FA4: 4548,
+    0x78F235: 33,
+    0x54AED2: 4549,
+    0x80B655: 25,
+    0x0CCB0C: 4550,
+    0xD0E042: 4,
+    0xF44EE3: 25,
+    0x60577D: 63,
+    0xCC242E: 37,
+    0xF0016E: 4551,
+    0xEC0BAE: 51,
+    0x802511: 163,
+    0x3802DE: 463,
+    0x9C760E: 49,
+    0x94EA32: 49,
+    0x50F4EB: 49,
+    0x28C709: 49,
+    0xD0CFD8: 4552,
+    0x5C625A: 1131,
+    0x7C0A3F: 90,
+    0x08AA89: 11,
+    0x04D60E: 4553,
+    0xA4352D: 4554,
+    0xC8BFFE: 117,
+    0x082FE9: 15,
+    0x984874: 15,
+    0x1CA681: 15,
+    0xE8A660: 15,
+    0xB881FA: 49,
+    0x082E36: 117,
+    0x049F81: 4555,
+    0x00808C: 4555,
+    0x20A7F9: 4556,
+    0xC006C3: 94,
+    0x184859: 737,
+    0x14517E: 21,
+    0x083A38: 21,
+    0xF8ABE5: 4557,
+    0x08BB3C: 618,
+    0x04BA1C: 117,
+    0x7C3D2B: 117,
+    0x18C241: 345,
+    0x58454C: 228,
+    0x2CBEEB: 4188,
+    0x7409AC: 4558,
+    0xF4C7AA: 4559,
+    0x70F088: 35,
+    0xCCED21: 0,
+    0xF04A02: 4,
+    0x10394E: 579,
+    0x509A46: 4560,
+    0x10D561: 220,
+    0xF0A3B2: 31,
+    0xFC4DA6: 15,
+    0xB414E6: 15,
+    0xAC9929: 15,
+    0x3C1512: 4561,
+    0x4024B2: 33,
+    0x640D22: 514,
+    0x2CFDB3: 4375,
+    0x9C9567: 117,
+    0xA47B1A: 117,
+    0x58AEF1: 5,
+    0x787A6F: 4562,
+    0xC0D46B: 117,
+    0x8C31E2: 4563,
+    0xE86CC7: 12,
+    0x641759: 4564,
+    0x504348: 4565,
+    0xD85982: 15,
+    0x48B25D: 15,
+    0xA41B34: 29,
+    0x8045DD: 25,
+    0x147D05: 4323,
+    0x24E853: 285,
+    0x482952: 3,
+    0xA47E36: 38,
+    0x98387D: 4566,
+    0x2CCE1E: 4567,
+    0xACD618: 71,
+    0x6C5640: 4405,
+    0xC8D884: 638,
+    0xB4A25C: 204,
+    0x2C71FF: 77,
+    0x48785E: 77,
+    0x20C74F: 4568,
+    0xDC9A8E: 4569,
+    0xDC0077: 86,
+    0xB05DD4: 258,
+    0x184CAE: 4570,
+    0xC4D0E3: 25,
+    0xF021E0: 63,
+    0x307C4A: 117,
+    0x145051: 224,
+    0x3CC786: 4571,
+    0x88C3E5: 4572,
+    0xE428A4: 4573,
+    0x943A91: 77,
+    0x80C501: 4574,
+    0x14D19E: 49,
+    0x40C711: 49,
+    0x5C7017: 49,
+    0xE45E1B: 210,
+    0xC430CA: 4575,
+    0x28052E: 4576,
+    0x8CEC7B: 49,
+    0x0040DD: 4577,
+    0x408C1F: 69,
+    0x002DB3: 295,
+    0xE4FD45: 25,
+    0x28C87C: 11,
+    0x04F03E: 117,
+    0x78E22C: 117,
+    0xC0D026: 117,
+    0x502DFB: 4578,
+    0x40EE15: 578,
+    0x606C63: 520,
+    0x00F361: 77,
+    0xA4423B: 25,
+    0xECBE5F: 229,
+    0xF42A7D: 86,
+    0x04F993: 444,
+    0xBCBD9E: 163,
+    0x70CF49: 25,
+    0x4851C5: 25,
+    0x6C0309: 4,
+    0xBCD295: 4,
+    0xF03965: 90,
+    0xEC7CB6: 90,
+    0x58A639: 90,
+    0xA4E57C: 14,
+    0x304E1B: 117,
+    0x74504E: 21,
+    0x6C0DE1: 4579,
+    0x8C0FC9: 117,
+    0xE8D765: 15,
+    0xCC208C: 15,
+    0x885A85: 57,
+    0xD80093: 4580,
+    0x20EFBD: 58,
+    0xBC6D05: 4581,
+    0xC0E018: 15,
+    0x5CE747: 15,
+    0x089AC7: 11,
+    0x744CA1: 192,
+    0xB4B291: 244,
+    0xA8FFBA: 15,
+    0x7CC2C6: 94,
+    0xA0024A: 12,
+    0xC86C3D: 77,
+    0x389052: 15,
+    0xC0F6EC: 15,
+    0x70617B: 4,
+    0x04E77E: 460,
+    0x74ECB2: 77,
+    0x4C52EC: 4582,
+    0x146B9A: 11,
+    0x30D941: 4583,
+    0x687627: 4584,
+    0x948ED3: 89,
+    0xE01FED: 0,
+    0x7040FF: 117,
+    0x34D693: 117,
+    0x24E4C8: 5,
+    0x249493: 4585,
+    0x28D044: 4586,
+    0x9C9AC0: 4587,
+    0xA09F10: 664,
+    0x201B88: 281,
+    0x74B7B3: 574,
+    0xDC9BD6: 274,
+    0xDC8C1B: 146,
+    0x3CBDC5: 48,
+    0xA8DA0C: 108,
+    0x5860D8: 258,
+    0x50A5DC: 258,
+    0xA4AAFE: 117,
+    0xF83B7E: 117,
+    0x8815C5: 117,
+    0x9C28B3: 49,
+    0xA07817: 49,
+    0x5C8730: 49,
+    0xB41BB0: 49,
+    0x58D349: 49,
+    0xF434F0: 49,
+    0xF85329: 15,
+    0xB08C75: 49,
+    0x983F60: 15,
+    0xC03FDD: 15,
+    0x303235: 247,
+    0x00301F: 4588,
+    0x0858A5: 4589,
+    0x7CC294: 166,
+    0xE0E2E6: 14,
+    0x9C7370: 15,
+    0x68D48B: 88,
+    0x40D4BD: 4590,
+    0x841B77: 25,
+    0x5C10C5: 90,
+    0xA8407D: 167,
+    0xFC4B57: 4591,
+    0x18EE86: 4592,
+    0x3CD2E5: 21,
+    0x001391: 4593,
+    0x582429: 210,
+    0xC43772: 4594,
+    0xCC3B27: 231,
+    0xE80AEC: 4595,
+    0xC4DE7B: 117,
+    0x6C1A75: 117,
+    0x6C7637: 117,
+    0xE8EB34: 4,
+    0xA4178B: 15,
+    0x94B271: 15,
+    0x78058C: 4596,
+    0xC4A72B: 407,
+    0xD0C31E: 4597,
+    0xD810CB: 4598,
+    0x24016F: 117,
+    0xCCF55F: 4599,
+    0x087C39: 77,
+    0x141333: 43,
+    0xC0C9E3: 86,
+    0xF88C21: 86,
+    0xC4278C: 117,
+    0x7C73EB: 117,
+    0xE48F1D: 117,
+    0xC03C59: 25,
+    0x4C3BDF: 157,
+    0x84E342: 220,
+    0xFCCD2F: 12,
+    0x808FE8: 1305,
+    0x18CC18: 25,
+    0xE0913C: 4600,
+    0xD05919: 11,
+    0x00B881: 4601,
+    0xB098BC: 117,
+    0x5C3400: 850,
+    0xB43161: 194,
+    0x10D7B0: 3,
+    0x341CF0: 40,
+    0xCC4F5C: 12,
+    0xFC6DD1: 4602,
+    0x30AFCE: 146,
+    0xB4FBE3: 263,
+    0x188740: 40,
+    0x6C09BF: 5,
+    0x64F947: 4603,
+    0xDC00B0: 524,
+    0x707414: 102,
+    0xA0764E: 14,
+    0xC8E600: 15,
+    0xD4D51B: 15,
+    0x2491BB: 15,
+    0x645E10: 15,
+    0xECF22B: 231,
+    0x309610: 117,
+    0x445943: 11,
+    0x343654: 11,
+    0x30578E: 63,
+    0xFCB3BC: 25,
+    0xC816DA: 194,
+    0xB04414: 21,
+    0x748F3C: 49,
+    0x40F946: 49,
+    0x1CFE2B: 77,
+    0xA4AE12: 589,
+    0x9C9D7E: 166,
+    0xDCA3A2: 4604,
+    0xEC570D: 4605,
+    0x7C25DA: 438,
+    0x3059B7: 1989,
+    0x44A54E: 186,
+    0xA8698C: 4606,
+    0xA4AC0F: 117,
+    0xCCFF90: 117,
+    0x003054: 737,
+    0xE45F01: 156,
+    0x001368: 4607,
+    0xA83512: 117,
+    0xB030C8: 4608,
+    0xD4F337: 4609,
+    0x48A2B8: 4610,
+    0x6C442A: 15,
+    0xA47CC9: 15,
+    0xC40D96: 15,
+    0x58E873: 4611,
+    0xC0B8E6: 138,
+    0x7412B3: 388,
+    0x9447B0: 4612,
+    0xE45AD4: 978,
+    0x84225E: 4613,
+    0xF85C7D: 4614,
+    0x44AF28: 25,
+    0xD4A651: 220,
+    0x842AFD: 19,
+    0xA0681C: 167,
+    0x90F644: 117,
+    0x846B48: 4615,
+    0xB460ED: 166,
+    0x00300B: 4616,
+    0xC01850: 476,
+    0x4427F3: 4617,
+    0x30CC21: 11,
+    0x646C80: 388,
+    0x0026C0: 4618,
+    0x80EACA: 4619,
+    0x000896: 4620,
+    0x0025DC: 1927,
+    0x047D7B: 476,
+    0x089E01: 476,
+    0xA81E84: 476,
+    0xDC41A9: 25,
+    0x8C941F: 4,
+    0x687DB4: 4,
+    0xBC7F7B: 117,
+    0xF0FAC7: 117,
+    0xB46F2D: 4621,
+    0x5C857E: 12,
+    0x8803E9: 69,
+    0xDCEF80: 15,
+    0x0CDC7E: 14,
+    0x2098D8: 4622,
+    0x182649: 25,
+    0x34C93D: 25,
+    0x1C012D: 4623,
+    0x3CA62F: 427,
+    0x7CC77E: 5,
+    0xA0CFF5: 11,
+    0x98B3EF: 117,
+    0x50F958: 117,
+    0xC0A36E: 319,
+    0x6032B1: 86,
+    0x7CFD6B: 40,
+    0x0005C9: 285,
+    0xACF108: 285,
+    0x345840: 15,
+    0x5C647A: 15,
+    0xE41F7B: 4,
+    0xE86DCB: 90,
+    0x304950: 12,
+    0x189552: 4624,
+    0x98C7A4: 4625,
+    0x00BED5: 21,
+    0xAC5FEA: 71,
+    0x044AC6: 4626,
+    0xC0FFA8: 15,
+    0xFC1499: 4627,
+    0x88948F: 4628,
+    0x5CD5B5: 4629,
+    0xC87EA1: 4630,
+    0x642C0F: 146,
+    0x08ED9D: 231,
+    0x209E79: 638,
+    0x5CFE9E: 4631,
+    0x881C95: 163,
+    0x002003: 4632,
+    0xF02E51: 4633,
+    0xC8E42F: 4634,
+    0x680AE2: 238,
+    0xF46942: 234,
+    0x08E9F6: 295,
+    0xCCC261: 12,
+    0x3066D0: 117,
+    0x3CB233: 117,
+    0x640BD7: 49,
+    0xA8913D: 49,
+    0x0C3B50: 49,
+    0x4CC95E: 90,
+    0xFCA5D0: 69,
+    0xC85BA0: 459,
+    0xE0BE03: 4635,
+    0xA48873: 4,
+    0xA4BDC4: 15,
+    0x5C9157: 15,
+    0x04CB88: 286,
+    0xB8804F: 53,
+    0x000F2D: 4636,
+    0xB46293: 90,
+    0x000DA1: 4637,
+    0x241407: 4638,
+    0xB47947: 4639,
+    0x98CBA4: 4640,
+    0x183CB7: 117,
+    0x5C9012: 4641,
+    0x38F7CD: 12,
+    0x9C2976: 25,
+    0x04F8F8: 87,
+    0x481693: 883,
+    0x18F697: 4642,
+    0x5C6BD7: 4643,
+    0x1848CA: 102,
+    0xA84025: 4644,
+    0xCCD9AC: 25,
+    0x347DF6: 25,
+    0x8022A7: 404,
+    0x5C2316: 4645,
+    0x042144: 412,
+    0x64E172: 4646,
+    0xCC0DF2: 78,
+    0x94434D: 655,
+    0xA027B6: 90,
+    0x103917: 90,
+    0x9880EE: 90,
+    0x90EEC7: 90,
+    0x1029AB: 90,
+    0x184ECB: 90,
+    0x60F43A: 4229,
+    0xFCB698: 820,
+    0xC4D8F3: 4647,
+    0x0001CD: 4648,
+    0x58A87B: 656,
+    0xC489ED: 4649,
+    0x488F5A: 439,
+    0x100645: 3,
+    0xAC67B2: 14,
+    0x985949: 4650,
+    0x68332C: 4651,
+    0xD8787F: 50,
+    0x9C28BF: 4652,
+    0x782B46: 25,
+    0x785773: 15,
+    0xAC6089: 15,
+    0x0006B3: 4653,
+    0x843E92: 15,
+    0x708CB6: 15,
+    0x50464A: 15,
+    0xC4A402: 15,
+    0x9CBD6E: 4654,
+    0x4C3329: 4655,
+    0x34E5EC: 95,
+    0x00B7A8: 4656,
+    0x34CFF6: 25,
+    0xD4D2D6: 438,
+    0x105072: 463,
+    0x98FAA7: 4657,
+    0xAC4A67: 4,
+    0x900A84: 270,
+    0xEC7949: 621,
+    0xB8E3B1: 15,
+    0x980D51: 117,
+    0xDC333D: 117,
+    0x285471: 117,
+    0xB88E82: 117,
+    0x70CA97: 272,
+    0x0887C6: 8,
+    0x3CB53D: 4658,
+    0xAC3A67: 4,
+    0x086BD1: 37,
+    0x345180: 1129,
+    0xF47335: 4238,
+    0x90ADFC: 191,
+    0x5CA62D: 4,
+    0x402B69: 4659,
+    0xA40801: 77,
+    0x00ADD5: 117,
+    0x905D7C: 21,
+    0xA4CFD2: 50,
+    0xA8A097: 4660,
+    0xBC1695: 11,
+    0xE8E98E: 4661,
+    0x842E14: 238,
+    0x0020E1: 4662,
+    0x08F458: 117,
+    0xEC97B2: 4663,
+    0x28FA7A: 250,
+    0x64F6BB: 4664,
+    0x4410FE: 4665,
+    0xEC316D: 4666,
+    0xBC542F: 25,
+    0x6CD94C: 146,
+    0xAC1ED0: 4667,
+    0x0088BA: 4668,
+    0x1005E1: 81,
+    0x343794: 4669,
+    0x4CA64D: 4,
+    0xCC7F75: 4,
+    0x20E874: 49,
+    0xD03FAA: 49,
+    0x7CAB60: 49,
+    0x44C65D: 49,
+    0x187EB9: 49,
+    0xD4DC09: 179,
+    0x380146: 664,
+    0x7894E8: 4670,
+    0x40EC99: 25,
+    0x98006A: 11,
+    0x1C97C5: 4671,
+    0x5CC1D7: 90,
+    0x889655: 4672,
+    0x74B6B6: 63,
+    0x7CDFA1: 14,
+    0xF4A4D6: 15,
+    0xFCE14F: 4673,
+    0xA84D4A: 4674,
+    0x547FBC: 4675,
+    0x5C27D4: 459,
+    0x74D83E: 25,
+    0x3CBF60: 49,
+    0xA87EEA: 25,
+    0xB00AD5: 11,
+    0x08D23E: 25,
+    0x20114E: 4676,
+    0xFCF29F: 4677,
+    0xF81F32: 78,
+    0x047295: 49,
+    0xD446E1: 49,
+    0x141459: 104,
+    0x5043B9: 4678,
+    0x88B6EE: 4679,
+    0x484EFC: 258,
+    0x1C919D: 281,
+    0x2C5741: 4,
+    0xB0B353: 12,
+    0x487B5E: 4680,
+    0x18300C: 850,
+    0x44A56E: 511,
+    0xAC15F4: 49,
+    0x78D162: 49,
+    0x08F8BC: 49,
+    0x90A25B: 49,
+    0x88A479: 49,
+    0x00104F: 4606,
+    0xF44955: 4681,
+    0x3C28A6: 4682,
+    0x5050A4: 90,
+    0x8086D9: 90,
+    0x386A77: 90,
+    0x0809C7: 4683,
+    0x041DC7: 11,
+    0x001A4D: 538,
+    0x8CAAB5: 14,
+    0x58961D: 25,
+    0x68AFFF: 4684,
+    0x402C76: 12,
+    0x80C955: 865,
+    0x7885F4: 117,
+    0x88541F: 210,
+    0x900CC8: 210,
+    0x68215F: 87,
+    0x44C7FC: 117,
+    0x001FD0: 538,
+    0x18C04D: 538,
+    0x0025A9: 4685,
+    0x5C68D0: 4686,
+    0x10364A: 4687,
+    0x000BCC: 4688,
+    0x00E059: 4689,
+    0x00B810: 4690,
+    0xA4B239: 4,
+    0x548D5A: 25,
+    0xD01C3C: 231,
+    0xB89A2A: 25,
+    0xDC21E2: 15,
+    0x000A23: 4691,
+    0x3843E5: 4692,
+    0xFC1BD1: 15,
+    0x582575: 15,
+    0x28DEE5: 15,
+    0x0C8E29: 48,
+    0xA0224E: 12,
+    0x18E777: 146,
+    0x0C7A15: 25,
+    0x94D6DB: 4693,
+    0xC49878: 4694,
+    0xB4ECF2: 4695,
+    0xC4954D: 12,
+    0xA44BD5: 40,
+    0x64956C: 244,
+    0x4077A9: 21,
+    0x64694E: 53,
+    0xF83331: 53,
+    0x6C06D6: 117,
+    0x6C639C: 258,
+    0x1CBFC0: 388,
+    0x34495B: 3,
+    0x801609: 4530,
+    0x78B46A: 15,
+    0x6CEBB6: 15,
+    0x4CF55B: 15,
+    0x643139: 12,
+    0xE83F67: 117,
+    0x3446EC: 117,
+    0x40A6B7: 25,
+    0xC8F319: 514,
+    0x14876A: 49,
+    0xE0B55F: 49,
+    0xF8FFC2: 49,
+    0xE0EB40: 49,
+    0x5C710D: 4,
+    0x98AF65: 25,
+    0x009096: 234,
+    0x442295: 4677,
+    0xE85A8B: 40,
+    0x80751F: 319,
+    0xF855CD: 114,
+    0x441847: 4696,
+    0x2C3AFD: 427,
+    0xAC61B9: 4697,
+    0x1CC1BC: 4690,
+    0xAC8B9C: 4698,
+    0x00AB48: 63,
+    0x0030B7: 4699,
+    0x2474F7: 235,
+    0x7CD566: 77,
+    0x686350: 4700,
+    0x18703B: 117,
+    0xD89E61: 117,
+    0x347E00: 117,
+    0x5CE50C: 166,
+    0xF8893C: 4701,
+    0x749EF5: 90,
+    0x68BFC4: 90,
+    0xB82ADC: 4702,
+    0x04B1A1: 90,
+    0xCC464E: 90,
+    0x306F07: 4703,
+    0xA0DF15: 15,
+    0xC4AD34: 439,
+    0x000733: 4704,
+    0xA85E45: 398,
+    0x9CFFC2: 4705,
+    0x44D878: 31,
+    0x7897C3: 4706,
+    0x64C901: 4707,
+    0xB43939: 423,
+    0x5CCD5B: 25,
+    0x84C807: 149,
+    0x10B3C6: 4,
+    0x10B3D6: 4,
+    0xA0D807: 117,
+    0x2C780E: 117,
+    0x34B20A: 117,
+    0x98F4AB: 14,
+    0xD8BFC0: 14,
+    0xA0AB51: 755,
+    0x3C894D: 4708,
+    0xF854B8: 77,
+    0x781735: 0,
+    0x4C90DB: 4709,
+    0x8CF112: 78,
+    0xB899AE: 4710,
+    0xE8D0B9: 278,
+    0xF4D620: 69,
+    0x949034: 407,
+    0x3C8F06: 4711,
+    0x987A10: 228,
+    0x202681: 231,
+    0xB00875: 15,
+    0x64FB92: 4712,
+    0x141346: 560,
+    0x542BDE: 21,
+    0x98F781: 258,
+    0x5885A2: 531,
+    0xA8C0EA: 4713,
+    0x00071C: 810,
+    0x2CF89B: 4,
+    0x847637: 15,
+    0xFC9435: 15,
+    0xE02481: 15,
+    0x44AEAB: 69,
+    0xA4F05E: 69,
+    0x1C687E: 459,
+    0xC03656: 5,
+    0xB03E51: 319,
+    0x28167F: 40,
+    0x087190: 25,
+    0x80B07B: 11,
+    0xC85A9F: 11,
+    0x500291: 14,
+    0x001DDF: 412,
+    0x8C0FFA: 4714,
+    0xACFE05: 163,
+    0xBCC31B: 4715,
+    0x64DF10: 4716,
+    0x100177: 15,
+    0x44A191: 15,
+    0x24526A: 510,
+    0x20DFB9: 210,
+    0x5CCAD3: 483,
+    0x782A79: 554,
+    0x786559: 3,
+    0x50D2F5: 166,
+    0xD05F64: 12,
+    0x5CE883: 15,
+    0xC463FB: 4717,
+    0x305714: 49,
+    0x04A222: 48,
+    0x04AB6A: 4718,
+    0x6023A4: 33,
+    0xA4530E: 4,
+    0x00403A: 4719,
+    0xC8B1CD: 49,
+    0x1460CB: 49,
+    0xB8F12A: 49,
+    0xF887F1: 49,
+    0x28FE65: 709,
+    0x1806F5: 4720,
+    0x60447A: 4721,
+    0x807215: 319,
+    0x74D637: 77,
+    0x7484E1: 4722,
+    0x4074E0: 25,
+    0x44FB5A: 11,
+    0x0035FF: 53,
+    0xDC54D7: 77,
+    0x20968A: 596,
+    0x8C1850: 596,
+    0xD8D4E6: 4723,
+    0x840B7C: 520,
+    0x889FAA: 4724,
+    0x48A73C: 4725,
+    0x04C807: 40,
+    0xF8E7A0: 146,
+    0x2CFFEE: 146,
+    0x4459E3: 15,
+    0x683F1E: 4726,
+    0x44D3CA: 4,
+    0xF8A763: 250,
+    0xA49813: 258,
+    0x6C2990: 4727,
+    0x9835ED: 15,
+    0x807693: 4728,
+    0xBC9740: 12,
+    0x084F0A: 15,
+    0xA8494D: 15,
+    0x44004D: 15,
+    0x18CF24: 15,
+    0x1449BC: 4729,
+    0x20F478: 40,
+    0x18B6F7: 4730,
+    0xC85D38: 132,
+    0x50F8A5: 4731,
+    0x04885F: 15,
+    0xC850CE: 15,
+    0xD89B3B: 15,
+    0x88403B: 15,
+    0xFC8743: 15,
+    0x00FA21: 90,
+    0x7C2302: 90,
+    0x6CAB05: 4,
+    0x5CB15F: 4732,
+    0x000BE4: 605,
+    0x4413D0: 11,
+    0x2462AB: 14,
+    0x18AACA: 4725,
+    0x0004DF: 4733,
+    0x7438B7: 1131,
+    0x90735A: 78,
+    0x1C8259: 12,
+    0x485DEB: 4734,
+    0x501395: 33,
+    0x18D9EF: 4735,
+    0x88DA33: 4736,
+    0x60D248: 258,
+    0xD49DC0: 90,
+    0xD0196A: 655,
+    0x84FDD1: 25,
+    0xB0700D: 81,
+    0x5041B9: 616,
+    0x84C78F: 4737,
+    0xC09FE1: 11,
+    0x80DABC: 4738,
+    0x184644: 4739,
+    0x002175: 4740,
+    0x346B5B: 21,
+    0x84E892: 659,
+    0x20DA22: 15,
+    0xE0B655: 508,
+    0xC821DA: 574,
+    0x8C0FA0: 4741,
+    0x78E2BD: 4742,
+    0xF848FD: 29,
+    0xF8BBBF: 63,
+    0xDCFB48: 25,
+    0x847C9B: 167,
+    0x3441A8: 4743,
+    0x34DB9C: 3,
+    0x7440BE: 285,
+    0x20658E: 15,
+    0x183D5E: 15,
+    0x889746: 33,
+    0x1CDE57: 5,
+    0xE0DCFF: 40,
+    0x846FCE: 69,
+    0xB0E71D: 4744,
+    0xC468D0: 629,
+    0x14AEDB: 629,
+    0x78DB2F: 53,
+    0x00778D: 4,
+    0x000E8C: 344,
+    0x008764: 4,
+    0xFCD2B6: 12,
+    0xA8E2C3: 574,
+    0xDC7137: 11,
+    0x804A14: 49,
+    0x703C69: 49,
+    0x4C6AF6: 145,
+    0x489DD1: 90,
+    0x7488BB: 4,
+    0xA4CF12: 14,
+    0xFCB662: 4745,
+    0x48049F: 4746,
+    0x087F98: 146,
+    0xC85261: 258,
+    0xC04121: 181,
+    0x70BF92: 27,
+    0x0CA06C: 4747,
+    0xB06FE0: 90,
+    0x44B994: 4748,
+    0x04D4C4: 398,
+    0xA0510B: 25,
+    0xAC2DA9: 231,
+    0x40A93F: 4749,
+    0x002F5C: 4,
+    0xF4645D: 1064,
+    0xC08C71: 78,
+    0xF46F4E: 4750,
+    0x08ECF5: 4,
+    0xD07650: 12,
+    0x38F85E: 132,
+    0x00CB51: 3,
+    0xC464B7: 5,
+    0x2479F8: 4751,
+    0xACBB61: 4752,
+    0x342003: 4753,
+    0x7CFD82: 651,
+    0x689A87: 77,
+    0x64AE88: 4754,
+    0x00D050: 1494,
+    0xF07D68: 1167,
+    0xEC4118: 698,
+    0x042DB4: 4755,
+    0x04E0B0: 574,
+    0x60D0A9: 90,
+    0x88CEFA: 15,
+    0x002706: 4756,
+    0x180D2C: 1305,
+    0x98DAC4: 86,
+    0xD8860B: 12,
+    0x00177B: 4757,
+    0x78DAA2: 4758,
+    0x38B19E: 12,
+    0x502B98: 4759,
+    0xC82832: 508,
+    0x38E26E: 4760,
+    0x70C9C6: 4,
+    0xC4346B: 607,
+    0x48F17F: 25,
+    0x8084A9: 4761,
+    0x4CC7D6: 4762,
+    0xC80873: 272,
+    0x701BFB: 554,
+    0x04766E: 159,
+    0xAC7A4D: 159,
+    0x38C096: 159,
+    0x002643: 159,
+    0x001697: 485,
+    0x003013: 485,
+    0x049DFE: 4763,
+    0xBC3E07: 520,
+    0x48FDA3: 40,
+    0x288088: 511,
+    0x1C3477: 4764,
+    0xD05157: 4765,
+    0x9458CB: 35,
+    0x28EC9A: 53,
+    0x0CEC84: 423,
+    0x9CDB07: 4766,
+    0xE0189F: 38,
+    0xF81308: 81,
+    0xF8A2D6: 192,
+    0xC4E506: 4767,
+    0x30EB5A: 4527,
+    0xF80F6F: 4,
+    0x282536: 4768,
+    0xB8A175: 1141,
+    0xFCBE7B: 146,
+    0xB40FB3: 146,
+    0xEC5C68: 388,
+    0xFC94CE: 11,
+    0x90869B: 11,
+    0x182A44: 4769,
+    0x74366D: 104,
+    0xCCD3C1: 229,
+    0x745F90: 4770,
+    0xA42655: 4771,
+    0x60A730: 4772,
+    0x1804ED: 53,
+    0xD43260: 235,
+    0xF4DD9E: 235,
+    0xD4D919: 235,
+    0x0080E3: 4773,
+    0xD8F2CA: 25,
+    0xB4C62E: 672,
+    0x0CD0F8: 4,
+    0x3C9BD6: 1066,
+    0x50DB3F: 725,
+    0x1081B4: 4774,
+    0x00D861: 1280,
+    0x74C17D: 444,
+    0x8871B1: 258,
+    0xF0AF85: 258,
+    0xFCAE34: 258,
+    0xB8259A: 4775,
+    0x004279: 412,
+    0xA45046: 40,
+    0x3881D7: 53,
+    0xF85B9C: 4776,
+    0x6CA928: 145,
+    0xDCDA80: 21,
+    0xF8501C: 4777,
+    0x44070B: 210,
+    0xCC7286: 4778,
+    0x141114: 231,
+    0x00B8B3: 4,
+    0xECF6BD: 4779,
+    0xB831B5: 157,
+    0x007C2D: 90,
+    0xE89363: 81,
+    0x7C0CF6: 4780,
+    0x20AD56: 356,
+    0x5029F5: 69,
+    0xFC8F7D: 725,
+    0x24BE18: 4781,
+    0x749D79: 463,
+    0x00D6FE: 4,
+    0xC84782: 4782,
+    0x0CBF74: 4783,
+    0xB41D2B: 574,
+    0x14C213: 49,
+    0xA4D931: 49,
+    0xBCFED9: 49,
+    0x808223: 49,
+    0x70D313: 15,
+    0x9C1D36: 15,
+    0xCCBBFE: 15,
+    0x38B4D3: 4784,
+    0x283166: 146,
+    0xC04004: 4785,
+    0xA4ED43: 12,
+    0x300A60: 12,
+    0x80D065: 4786,
+    0x0C7C28: 181,
+    0x6843D7: 4787,
+    0x007204: 4788,
+    0x40C81F: 1171,
+    0x1459C0: 511,
+    0xCC08FB: 86,
+    0xBCAF91: 4789,
+    0xF0D7DC: 4790,
+    0xA81087: 53,
+    0x8C61A3: 258,
+    0x94298D: 4791,
+    0x00AA6E: 4,
+    0xB86A97: 87,
+    0xC8C2F5: 4762,
+    0xF05849: 4792,
+    0x8CFE74: 272,
+    0xE43493: 15,
+    0x342912: 15,
+    0x000A5E: 717,
+    0x00105A: 717,
+    0x006097: 717,
+    0x006008: 717,
+    0x000102: 717,
+    0x8C8F8B: 4793,
+    0xA02833: 12,
+    0x001B6E: 4794,
+    0x00040B: 716,
+    0x0890BA: 502,
+    0x4C364E: 326,
+    0xBCA58B: 90,
+    0x80CEB9: 90,
+    0xD0D3FC: 4795,
+    0x6C6CD3: 4,
+    0xE049ED: 4796,
+    0x143719: 4797,
+    0x582F40: 35,
+    0x94A3CA: 4798,
+    0xE85D86: 4799,
+    0x604BAA: 4800,
+    0x4C0143: 63,
+    0xA8016D: 4801,
+    0x0440A9: 21,
+    0x48A472: 25,
+    0xB8BEF4: 726,
+    0x14D169: 15,
+    0x1062E5: 607,
+    0x0020B5: 4802,
+    0x286336: 344,
+    0x04C3E6: 12,
+    0x58FDBE: 4803,
+    0x244CE3: 77,
+    0x000157: 4804,
+    0x082525: 40,
+    0xC49500: 77,
+    0x68DD26: 4805,
+    0xE06267: 40,
+    0x70B7AA: 146,
+    0x84B31B: 4806,
+    0xF8272E: 4807,
+    0xF460E2: 40,
+    0xE4D124: 916,
+    0x0013A3: 4808,
+    0xF4F197: 4809,
+    0x6CED51: 4810,
+    0x98BB99: 4811,
+    0x002622: 384,
+    0x9CC950: 4812,
+    0xF89910: 554,
+    0x50E0EF: 81,
+    0xC0B6F9: 25,
+    0x000EEE: 4813,
+    0x7C1C4E: 285,
+    0xD8B6B7: 829,
+    0x2866E3: 43,
+    0x848A8D: 4,
+    0x1CC3EB: 69,
+    0x60F18A: 15,
+    0x8C14B4: 11,
+    0x3C9872: 463,
+    0x40C3C6: 4814,
+    0x504C7E: 4815,
+    0xD01CBB: 4816,
+    0x7487BB: 655,
+    0xCC50E3: 14,
+    0xDCE305: 414,
+    0xA4DA32: 53,
+    0x780473: 53,
+    0x2C4759: 4817,
+    0x144F8A: 25,
+    0x002106: 4818,
+    0xA83E0E: 145,
+    0x10C172: 15,
+    0x00138A: 4819,
+    0xA830AD: 755,
+    0xA41566: 755,
+    0x1C965A: 755,
+    0x401B5F: 755,
+    0x00151E: 4820,
+    0x00111E: 4820,
+    0x00409D: 4821,
+    0xDCE0EB: 4822,
+    0xBC5FF6: 751,
+    0x5C9656: 43,
+    0xE06066: 463,
+    0xC8E7D8: 751,
+    0x60D21C: 276,
+    0xCC51B4: 554,
+    0x00C3F4: 90,
+    0xB88AEC: 35,
+    0xAC3B77: 3,
+    0x78725D: 4,
+    0x149346: 4823,
+    0x5CCD7C: 4824,
+    0xEC8C9A: 15,
+    0xB48655: 15,
+    0xD0D783: 15,
+    0xA8E552: 4825,
+    0xFCE66A: 4826,
+    0x7836CC: 69,
+    0xCCC92C: 4827,
+    0x001E39: 4828,
+    0x8CCF5C: 4829,
+    0xB46BFC: 25,
+    0xB0FC0D: 77,
+    0x048AE1: 4762,
+    0x501D93: 15,
+    0xC8D779: 4830,
+    0x70C833: 4831,
+    0x0C73EB: 12,
+    0x480BB2: 12,
+    0xCCC079: 102,
+    0xF09CD7: 4832,
+    0xBCE143: 49,
+    0x10B36F: 4833,
+    0xFC9BC6: 987,
+    0xC8292A: 4834,
+    0x0080BA: 4835,
+    0xF0B5D1: 53,
+    0x00E000: 621,
+    0x90848B: 4836,
+    0xE482CC: 4837,
+    0x48605F: 514,
+    0x2816A8: 157,
+    0xF8F532: 258,
+    0xB083D6: 258,
+    0xB0416F: 4838,
+    0x0CF5A4: 4,
+    0x80C7C5: 5,
+    0xBCAB7C: 4839,
+    0x6C3838: 4840,
+    0x9C2EA1: 40,
+    0x0C6ABC: 5,
+    0xE019D8: 4841,
+    0x30D9D9: 49,
+    0x6030D4: 49,
+    0xF895EA: 49,
+    0x18F1D8: 49,
+    0x647033: 49,
+    0x846878: 49,
+    0xC8D083: 49,
+    0x3CCD5D: 15,
+    0x7C7668: 15,
+    0xA438CC: 35,
+    0x74721E: 4842,
+    0x780F77: 4843,
+    0x8C4CDC: 4844,
+    0x5065F3: 607,
+    0x3C9509: 192,
+    0x5821E9: 4845,
+    0x30FD38: 210,
+    0x64CB5D: 4846,
+    0x001386: 4847,
+    0x003C10: 4,
+    0xF041C8: 12,
+    0xCC9916: 554,
+    0xEC7FC6: 4848,
+    0xF0E3DC: 4849,
+    0xA8DA01: 4850,
+    0x88E90F: 4851,
+    0x0010D8: 4852,
+    0x002194: 796,
+    0x4CABFC: 11,
+    0x7C2A31: 25,
+    0x0CF346: 40,
+    0x5C5AEA: 4853,
+    0x000B7B: 4854,
+    0xBCDDC2: 14,
+    0x98D863: 4855,
+    0x7CFF4D: 427,
+    0x7470FD: 25,
+    0xC49F4C: 15,
+    0x0C704A: 15,
+    0xC88F26: 560,
+    0x703A73: 4493,
+    0x10F9EB: 4856,
+    0x80AD16: 40,
+    0x044EAF: 285,
+    0x003074: 4857,
+    0xB0B3AD: 132,
+    0x40BD32: 53,
+    0xCC8E71: 4,
+    0x1894C6: 4858,
+    0x70D081: 4859,
+    0x70C94E: 192,
+    0x38F554: 4860,
+    0x18A28A: 4861,
+    0x3CE824: 15,
+    0x54B7E5: 4862,
+    0x946372: 146,
+    0xBC0FA7: 4863,
+    0x20365B: 4738,
+    0xE8DE00: 4864,
+    0xFC643A: 90,
+    0xF8C120: 4865,
+    0x347E5C: 506,
+    0xA8515B: 90,
+    0xB4FBF9: 15,
+    0x506F77: 15,
+    0x0C41E9: 15,
+    0x001936: 4866,
+    0xF0C9D1: 167,
+    0xB4DE31: 4,
+    0xA44027: 11,
+    0x70F220: 659,
+    0x1C1161: 655,
+    0xB4F7A1: 514,
+    0x70EF00: 49,
+    0x28EDE0: 800,
+    0xC87765: 3015,
+    0xD0817A: 49,
+    0x98CA33: 49,
+    0x68AB1E: 49,
+    0x345A06: 224,
+    0xBCFFEB: 78,
+    0x2C37C5: 4867,
+    0xCC40D0: 511,
+    0x7C7630: 574,
+    0x9822EF: 192,
+    0x3CFB5C: 5,
+    0x7440BB: 885,
+    0x88BD45: 90,
+    0x54FCF0: 90,
+    0x306A85: 90,
+    0xB89F09: 57,
+    0x0402CA: 4868,
+    0x7C7635: 25,
+    0x4CDD31: 90,
+    0x788038: 4553,
+    0x4048FD: 12,
+    0xB80716: 146,
+    0x1CEEC9: 1497,
+    0x001862: 4869,
+    0x000C50: 4869,
+    0xF045DA: 53,
+    0xA8EEC6: 4870,
+    0xE4F042: 210,
+    0x20B399: 4871,
+    0xCC2D21: 901,
+    0xC8DEC9: 4872,
+    0xD896E0: 4873,
+    0x207852: 181,
+    0xF417B8: 1153,
+    0x38F73D: 77,
+    0x004097: 4874,
+    0x9C4FCF: 274,
+    0xC0A00D: 258,
+    0x342AF1: 53,
+    0x44D5A5: 4875,
+    0x58C17A: 204,
+    0xE0AADB: 4876,
+    0x0005FF: 4877,
+    0xF87B20: 4,
+    0x1C330E: 4878,
+    0xB8F74A: 4879,
+    0xECF451: 48,
+    0x645106: 607,
+    0x0C1539: 49,
+    0x0C6111: 4880,
+    0x581243: 1156,
+    0x0022C4: 4881,
+    0x002128: 2279,
+    0x001C73: 89,
+    0x2C8A72: 983,
+    0x6C5697: 77,
+    0x38019F: 989,
+    0x245CCB: 4882,
+    0xECFAF4: 4883,
+    0x38AD8E: 21,
+    0x34D0B8: 12,
+    0xA89FEC: 258,
+    0x00BE9E: 5,
+    0x54C57A: 276,
+    0xD88F76: 49,
+    0x409C28: 49,
+    0x782D7E: 4884,
+    0x741AE0: 12,
+    0xB06EBF: 398,
+    0x24B209: 470,
+    0x54DF24: 5,
+    0xAC1DDF: 12,
+    0xE8D819: 43,
+    0x609BC8: 4885,
+    0x406A8E: 4886,
+    0x1C0FAF: 4887,
+    0xBC5451: 90,
+    0x74860B: 4,
+    0x182D98: 4888,
+    0x88B4A6: 78,
+    0x28CF08: 4889,
+    0xBC903A: 96,
+    0xD0B128: 90,
+    0xFC65DE: 77,
+    0xF449EF: 4890,
+    0xEC51BC: 69,
+    0xF079E8: 69,
+    0x583879: 4891,
+    0xF44C70: 560,
+    0xB0935B: 258,
+    0xD8A534: 4892,
+    0x00A096: 155,
+    0x78617C: 155,
+    0x601803: 4893,
+    0x78321B: 329,
+    0x940E6B: 15,
+    0x08661F: 95,
+    0x74EAC8: 21,
+    0xB4D64E: 4894,
+    0xF89DBB: 4895,
+    0xC4F312: 53,
+    0x904E91: 12,
+    0x5CE8B7: 4291,
+    0xCC66B2: 81,
+    0xD8A01D: 14,
+    0xDC0C2D: 755,
+    0x8CFEB4: 4896,
+    0x68ECC5: 25,
+    0x64FB50: 4897,
+    0x34298F: 12,
+    0x5CEA1D: 885,
+    0x181456: 882,
+    0x58B42D: 4752,
+    0x3C11B2: 4898,
+    0x104B46: 1696,
+    0x38E2DD: 11,
+    0x885DFB: 11,
+    0x78CA04: 882,
+    0xB009DA: 4899,
+    0x00054F: 466,
+    0x58E28F: 49,
+    0x787B8A: 49,
+    0xE048D3: 1069,
+    0x0017C8: 873,
+    0x78BC1A: 4,
+    0x000E59: 3,
+    0x48BCA6: 4900,
+    0x005C86: 989,
+    0x288CB8: 11,
+    0xB8DB1C: 554,
+    0x3C10E6: 4901,
+    0x904506: 4902,
+    0x0021A1: 4,
+    0x5C546D: 15,
+    0x30053F: 4903,
+    0xF4939F: 589,
+    0x000726: 725,
+    0xFC8B97: 725,
+    0x2CAB25: 725,
+    0x1CA532: 725,
+    0x788C4D: 4904,
+    0x24B2DE: 14,
+    0xEC8AC7: 5,
+    0x88365F: 514,
+    0xFC7F56: 4905,
+    0x2C4053: 90,
+    0x788102: 463,
+    0x84AA9C: 128,
+    0x2880A2: 4592,
+    0x84A1D1: 3,
+    0x909D7D: 258,
+    0xF0EFD2: 4906,
+    0xDCEB53: 4907,
+    0x7CBACC: 12,
+    0x540237: 4908,
+    0x001F92: 390,
+    0x000C03: 1359,
+    0x0C8FFF: 15,
+    0x54B121: 15,
+    0xA80C63: 15,
+    0x5CC307: 15,
+    0x4CB008: 4909,
+    0xE86FF2: 659,
+    0x005018: 4910,
+    0x70DEF9: 4911,
+    0x404229: 4912,
+    0x101B54: 15,
+    0xC4017C: 272,
+    0x0025C4: 272,
+    0xC0C520: 272,
+    0xFC2F6B: 4913,
+    0x287B09: 11,
+    0xE0107F: 272,
+    0xB0EABC: 234,
+    0x94C691: 372,
+    0x3CF591: 69,
+    0x602101: 69,
+    0x7CEB7F: 4914,
+    0x8C8580: 4915,
+    0x78B28D: 4916,
+    0xF81D90: 4917,
+    0xA06A44: 1066,
+    0xDCBE7A: 4918,
+    0x3438B7: 132,
+    0xCC0677: 5,
+    0x784501: 4919,
+    0x88B111: 25,
+    0x54D751: 4920,
+    0x14780B: 4921,
+    0xACAFB9: 90,
+    0x145E45: 4922,
+    0x8C395C: 4923,
+    0x0080C2: 4924,
+    0xECF342: 69,
+    0x041B6D: 514,
+    0xF44156: 4925,
+    0xE45740: 258,
+    0x688DB6: 4926,
+    0x986C5C: 4927,
+    0x24792A: 272,
+    0x00F82C: 4,
+    0x00C1B1: 4,
+    0xF4FCB1: 4928,
+    0x50FF20: 4929,
+    0xD4258B: 25,
+    0x309C23: 1280,
+    0x70D923: 146,
+    0xB83A08: 901,
+    0x50D37F: 4930,
+    0xD8C8E9: 722,
+    0x7CB960: 4931,
+    0xB03D96: 4932,
+    0xF894C2: 25,
+    0x28B448: 15,
+    0x70D379: 4,
+    0x70DB98: 4,
+    0x100501: 814,
+    0x30D386: 11,
+    0x181212: 4933,
+    0xA49BF5: 4934,
+    0xF470AB: 146,
+    0x9CC8AE: 4935,
+    0xB0359F: 25,
+    0xC0D962: 234,
+    0xF80BCB: 4,
+    0xB47C9C: 77,
+    0x08028E: 511,
+    0x2C5A0F: 4,
+    0x2C3124: 4,
+    0x503237: 49,
+    0xB0481A: 49,
+    0xB49CDF: 49,
+    0x48BF6B: 49,
+    0x2CFAA2: 215,
+    0xE8E732: 215,
+    0x900628: 90,
+    0x2C1DB8: 258,
+    0x503DA1: 90,
+    0xF097E5: 4936,
+    0x4C1A3D: 69,
+    0x1CA0D3: 12,
+    0x7C2664: 3,
+    0xB4A9FE: 4937,
+    0x58821D: 4938,
+    0xD8A105: 4939,
+    0x9C84BF: 49,
+    0xBCA042: 4940,
+    0x9CFCD1: 4941,
+    0x3C0518: 90,
+    0xAC6B0F: 4942,
+    0x7C3866: 53,
+    0x0C61CF: 53,
+    0x9C1D58: 53,
+    0x00111B: 4943,
+    0xCCCE1E: 427,
+    0x0CF4D5: 272,
+    0xBC3F8F: 15,
+    0x143004: 15,
+    0x6C750D: 4944,
+    0x3805AC: 4945,
+    0x346E9D: 228,
+    0x38AA3C: 1016,
+    0xF4DC41: 4946,
+    0x6854C1: 851,
+    0x000F4F: 4947,
+    0x50A4D0: 12,
+    0x800010: 810,
+    0x0C3CCD: 61,
+    0x14ABC5: 25,
+    0x7CC6C4: 4948,
+    0xC4836F: 655,
+    0xA80CCA: 4493,
+    0x50D213: 4949,
+    0x001E29: 4950,
+    0x5004B8: 15,
+    0x000302: 4951,
+    0x0024F1: 4952,
+    0x142FFD: 4953,
+    0xC891F9: 3,
+    0x9C50EE: 820,
+    0x40ED98: 12,
+    0x78F29E: 814,
+    0x64777D: 520,
+    0x60D262: 4954,
+    0x8404D2: 4955,
+    0xACDCE5: 550,
+    0x00B362: 49,
+    0xE4E4AB: 49,
+    0x00D0B2: 4956,
+    0x5CFF35: 4957,
+    0x64EB8C: 378,
+    0xF48C50: 25,
+    0x001351: 4958,
+    0x000320: 4959,
+    0x54FA96: 181,
+    0x60334B: 49,
+    0xDCD255: 4960,
+    0xA02C36: 438,
+    0x38AFD7: 621,
+    0x28993A: 89,
+    0xAC1F6B: 974,
+    0x508A0F: 4961,
+    0x7CCBE2: 12,
+    0xA8A5E2: 4962,
+    0xE0508B: 510,
+    0x9C1E95: 659,
+    0x64DB43: 443,
+    0x60427F: 407,
+    0xBCA8A6: 25,
+    0x68AF13: 4963,
+    0x681AB2: 11,
+    0x7CEBAE: 4964,
+    0x0C4933: 425,
+    0x000064: 4965,
+    0xE89EB4: 885,
+    0xD46A6A: 885,
+    0x98FD74: 4966,
+    0x000E58: 506,
+    0x74FF4C: 560,
+    0x002590: 974,
+    0xD0F73B: 4967,
+    0x180675: 4968,
+    0x000FC2: 4969,
+    0xCCC5EF: 4970,
+    0x9002A9: 510,
+    0xC0288D: 4971,
+    0x6CEC5A: 4972,
+    0x44C346: 15,
+    0x307496: 15,
+    0x708A09: 15,
+    0xF4F524: 78,
+    0x00BBC1: 1131,
+    0x0013A5: 4973,
+    0x000B2E: 4974,
+    0x4865EE: 12,
+    0x24C1BD: 4975,
+    0x00A2EE: 4,
+    0x0059DC: 4,
+    0xC8D3FF: 607,
+    0xC4BE84: 53,
+    0x5098F3: 4976,
+    0x506B8D: 4639,
+    0x0038DF: 4,
+    0xF4CAE5: 524,
+    0x90004E: 885,
+    0x7C2634: 258,
+    0x40F413: 4977,
+    0xE00DB9: 4978,
+    0x248894: 4979,
+    0x48DA96: 4980,
+    0xF074E4: 4981,
+    0xA0722C: 132,
+    0xB04BBF: 4982,
+    0xCC2D83: 69,
+    0x0015FF: 4592,
+    0xB4D135: 4983,
+    0xEC107B: 90,
+    0x1C232C: 90,
+    0x78888A: 4984,
+    0x9C3DCF: 511,
+    0xD46E0E: 86,
+    0x88366C: 1530,
+    0xFCD848: 49,
+    0xFC83C6: 4985,
+    0xDC0D30: 4986,
+    0xF0ACD7: 12,
+    0x9495A0: 210,
+    0x00A6CA: 4,
+    0xD8452B: 554,
+    0xE4186B: 112,
+    0xC83DD4: 540,
+    0xE0B94D: 664,
+    0x38D547: 398,
+    0xD41D71: 95,
+    0x008731: 4,
+    0x88DEA9: 1141,
+    0xF02FA7: 15,
+    0x18DED7: 15,
+    0x60A10A: 90,
+    0x8C71F8: 90,
+    0xCC051B: 90,
+    0x8C7712: 90,
+    0x9463D1: 90,
+    0x1C9D3E: 554,
+    0x0021D2: 90,
+    0x0021D1: 90,
+    0x001FCC: 90,
+    0xA42983: 4987,
+    0xEC8892: 78,
+    0x004A77: 11,
+    0x2C3F0B: 20,
+    0x5C497D: 90,
+    0x98234E: 4988,
+    0x7487A9: 4989,
+    0x503F98: 4990,
+    0x782079: 4991,
+    0x5894CF: 4992,
+    0x20F85E: 4993,
+    0x0023E4: 4994,
+    0x70D4F2: 1754,
+    0xE4D53D: 885,
+    0xC0143D: 885,
+    0xC01885: 885,
+    0x0C6076: 885,
+    0x0CEEE6: 885,
+    0x08D42B: 90,
+    0x789ED0: 90,
+    0xB0C4E7: 90,
+    0xC81479: 90,
+    0x1CAF05: 90,
+    0x24C696: 90,
+    0x94D771: 90,
+    0xE84E84: 90,
+    0xB0DF3A: 90,
+    0x805719: 90,
+    0x549B12: 90,
+    0xFCA13E: 90,
+    0xA00798: 90,
+    0x001FCD: 90,
+    0x38ECE4: 90,
+    0x7825AD: 90,
+    0xECE09B: 90,
+    0x001632: 90,
+    0x0016DB: 90,
+    0x001EE2: 90,
+    0x002490: 90,
+    0x0023D7: 90,
+    0x945103: 90,
+    0x5CE8EB: 90,
+    0xBC20A4: 90,
+    0xE4E0C5: 90,
+    0x20D5BF: 90,
+    0x34BE00: 90,
+    0x78521A: 90,
+    0x78D6F0: 1016,
+    0x04FEA1: 758,
+    0x1C25E1: 275,
+    0xC0F636: 4995,
+    0x7C11CB: 15,
+    0x001A22: 4996,
+    0x7085C6: 258,
+    0x54E2E0: 258,
+    0x347A60: 258,
+    0x001CC3: 258,
+    0xC0BDD1: 305,
+    0xB479A7: 305,
+    0x240DC2: 274,
+    0x20BBC6: 4997,
+    0xEC8CA2: 272,
+    0xAC482D: 4998,
+    0x00549F: 470,
+    0x049FCA: 15,
+    0x50016B: 15,
+    0x546C0E: 53,
+    0xEC8EAE: 4999,
+    0x009058: 5000,
+    0x001CFD: 638,
+    0xB80018: 5001,
+    0xA043DB: 5002,
+    0xE0E7BB: 5003,
+    0x7472B0: 5004,
+    0xDC1A01: 5005,
+    0x001087: 5006,
+    0x00B0B3: 5006,
+    0x002347: 1040,
+    0x0024A8: 1040,
+    0xC09134: 1040,
+    0x001CEF: 1952,
+    0x000276: 1952,
+    0x4CB21C: 5007,
+    0x205EF7: 90,
+    0x141F78: 90,
+    0xD84710: 854,
+    0x001972: 5008,
+    0x080087: 3882,
+    0x002363: 5009,
+    0x00001B: 1031,
+    0x00140E: 1034,
+    0x001E1F: 1034,
+    0x001969: 1034,
+    0x0018B0: 1034,
+    0x0016CA: 1034,
+    0x000FCD: 1034,
+    0x001BBA: 1034,
+    0x0004DC: 1034,
+    0x000CF7: 1034,
+    0x2824FF: 57,
+    0x38256B: 1176,
+    0x203AEF: 5010,
+    0x005979: 5011,
+    0xB8BB23: 5012,
+    0x34EA34: 4843,
+    0xEC26FB: 5013,
+    0x0020F4: 5014,
+    0x04EE91: 5015,
+    0x207C8F: 5016,
+    0x000B34: 5017,
+    0x3092F6: 5018,
+    0xA8AD3D: 817,
+    0x44DC91: 4844,
+    0xE09DB8: 4844,
+    0x000F59: 5019,
+    0x74B57E: 11,
+    0x24AF4A: 2155,
+    0x7C2064: 2155,
+    0x48F8E1: 81,
+    0x8C90D3: 81,
+    0x001478: 86,
+    0x6CB9C5: 5020,
+    0x0028F8: 25,
+    0x58BC8F: 5021,
+    0xD455BE: 989,
+    0x54D272: 5022,
+    0x001A6A: 5023,
+    0xB47443: 90,
+    0xFCF647: 5,
+    0xF80CF3: 514,
+    0xC44BD1: 5024,
+    0x18686A: 11,
+    0xDC4427: 12,
+    0xC49A02: 514,
+    0x001F6B: 514,
+    0x0026E2: 514,
+    0x30766F: 514,
+    0xA8922C: 514,
+    0xBC3400: 12,
+    0xF4CB52: 15,
+    0xB808D7: 15,
+    0x94611E: 5025,
+    0x0003B2: 5026,
+    0x00A0C6: 1053,
+    0x649C81: 1053,
+    0x0024FF: 1054,
+    0x001E21: 1055,
+    0x00039D: 1055,
+    0x002186: 61,
+    0x183919: 5027,
+    0x00C0E4: 5028,
+    0x000D10: 5029,
+    0x001FA8: 5030,
+    0x000FDB: 5031,
+    0xE8886C: 5032,
+    0xDC35F1: 5033,
+    0xA47174: 15,
+    0x784476: 578,
+    0x001165: 5034,
+    0x000A68: 5035,
+    0x3C0771: 133,
+    0x80414E: 5036,
+    0x249442: 5037,
+    0xC46413: 4,
+    0x00080D: 1064,
+    0x000E7B: 1064,
+    0xE8E0B7: 1064,
+    0x5052D2: 5038,
+    0x90EED9: 5039,
+    0x340AFF: 906,
+    0x587E61: 906,
+    0xC0A1A2: 5040,
+    0x08D0B7: 906,
+    0xECD68A: 5041,
+    0x58528A: 1696,
+    0x680715: 25,
+    0x3CB6B7: 146,
+    0x0010CA: 1067,
+    0x00E09E: 5042,
+    0x000A08: 5043,
+    0x206A8A: 1063,
+    0x2C36A0: 5044,
+    0xB0B2DC: 112,
+    0xCC5D4E: 112,
+    0x404A03: 112,
+    0xC86C87: 112,
+    0xA020A6: 14,
+    0xC4F1D1: 5045,
+    0x38BC1A: 5046,
+    0x001EC0: 72,
+    0x00FEC8: 4,
+    0x00253E: 5047,
+    0x7C574E: 5048,
+    0x045604: 5049,
+    0x10BEF5: 329,
+    0x606453: 5050,
+    0x6C98EB: 1077,
+    0x009E1E: 4,
+    0x001848: 4447,
+    0x0016FB: 5051,
+    0x74CC39: 5,
+    0x0C8A87: 5052,
+    0x54EDA3: 5053,
+    0x945907: 5054,
+    0xC8AFE3: 685,
+    0x34A2A2: 15,
+    0x749D8F: 15,
+    0xA0415E: 5055,
+    0x2C5A8D: 5056,
+    0xE47B3F: 5057,
+    0x0022E7: 5058,
+    0x94E8C5: 258,
+    0xA860B6: 49,
+    0xC4B301: 49,
+    0xE05F45: 49,
+    0x483B38: 49,
+    0x1C9148: 49,
+    0x4851B7: 25,
+    0xB8E779: 5059,
+    0xC864C7: 11,
+    0x3822D6: 955,
+    0x905F2E: 274,
+    0x28F366: 5060,
+    0xE0A3AC: 15,
+    0xBC7574: 15,
+    0x20A680: 15,
+    0x8828B3: 15,
+    0xF823B2: 15,
+    0x341290: 5061,
+    0x7CFE4E: 5062,
+    0x644FB0: 5063,
+    0xA4E597: 5064,
+    0xA86BAD: 885,
+    0xD80F99: 885,
+    0xB4B15A: 5065,
+    0x00E0E6: 5066,
+    0x6C3B6B: 439,
+    0x006CBC: 4,
+    0x00A0A4: 4606,
+    0x749781: 11,
+    0x001D08: 1116,
+    0x5C70A3: 514,
+    0x9CDF03: 174,
+    0x001188: 4871,
+    0x0001F4: 4871,
+    0x00109B: 1102,
+    0x4487FC: 1101,
+    0x002465: 5067,
+    0x00089F: 1530,
+    0x0050FC: 1111,
+    0x00142A: 1101,
+    0x00115B: 1101,
+    0xC03FD5: 1101,
+    0xECA86B: 1101,
+    0xC89CDC: 1101,
+    0x002511: 1101,
+    0x94513D: 5068,
+    0x001D82: 5069,
+    0x001317: 5069,
+    0x0016FA: 1109,
+    0x7085C2: 4476,
+    0xEC93ED: 5070,
+    0x14D11F: 15,
+    0xDC094C: 15,
+    0x1C6758: 15,
+    0x24BCF8: 15,
+    0xDCEE06: 15,
+    0x001174: 916,
+    0x001954: 5071,
+    0x9466E7: 5072,
+    0xF8A188: 5073,
+    0xA082AC: 5074,
+    0xA86AC1: 5075,
+    0xD463FE: 48,
+    0xE85659: 5076,
+    0x30FC68: 86,
+    0x008A96: 4,
+    0xBC60A7: 141,
+    0xC84529: 5077,
+    0x689361: 554,
+    0xA0043E: 5078,
+    0x34BF90: 5,
+    0xCCB3F8: 5079,
+    0xE4A471: 25,
+    0x10F005: 25,
+    0x64CC2E: 40,
+    0x8801F2: 5080,
+    0x00BD82: 574,
+    0x4CB8B5: 574,
+    0xBC15AC: 104,
+    0x7C477C: 12,
+    0xF877B8: 90,
+    0xF0D2F1: 77,
+    0x0452C7: 389,
+    0xF02745: 5081,
+    0x54D0B4: 5082,
+    0x00137C: 5083,
+    0xA8E3EE: 141,
+    0x00248D: 141,
+    0x00041F: 141,
+    0x20A90E: 274,
+    0x0CA2F4: 5084,
+    0xEC438B: 5085,
+    0x980CA5: 443,
+    0x441102: 5086,
+    0x245EBE: 5087,
+    0x0404EA: 5088,
+    0x800DD7: 5089,
+    0xA85EE4: 5090,
+    0x4CCC6A: 1280,
+    0x182195: 90,
+    0x44783E: 90,
+    0x546751: 288,
+    0x240B0A: 95,
+    0xD099D5: 940,
+    0x00247D: 889,
+    0x002265: 889,
+    0xF4ED5F: 5091,
+    0x00E0E4: 5092,
+    0xD0B53D: 5093,
+    0x00D0EC: 958,
+    0xBC44B0: 5094,
+    0x74BFB7: 5095,
+    0x50DA00: 955,
+    0x14BB6E: 90,
+    0x14C3C2: 5096,
+    0x10785B: 659,
+    0x30636B: 49,
+    0x70884D: 5097,
+    0x1886AC: 889,
+    0x001F5C: 889,
+    0x001F00: 889,
+    0xA4F1E8: 49,
+    0x00164E: 889,
+    0x000D4B: 1141,
+    0xF88096: 5098,
+    0xA811FC: 258,
+    0x001DAA: 4729,
+    0xE498D1: 1176,
+    0x6C2779: 1176,
+    0x00CF1C: 5099,
+    0x28CC01: 90,
+    0x0018C5: 889,
+    0xF4F5A5: 882,
+    0xEC9B5B: 882,
+    0x2CCC15: 882,
+    0xD8FB5E: 234,
+    0x6CF373: 90,
+    0x9C3AAF: 90,
+    0x781FDB: 90,
+    0x183F47: 90,
+    0x0CBF15: 5100,
+    0x002326: 621,
+    0x002668: 889,
+    0x002547: 889,
+    0x00001D: 1136,
+    0x001BA9: 1138,
+    0x30A220: 5101,
+    0x0040FB: 745,
+    0xD0542D: 820,
+    0x00264D: 1149,
+    0x849CA6: 1149,
+    0x002557: 1151,
+    0x001CCC: 1151,
+    0x744AA4: 11,
+    0xB86CE8: 90,
+    0x0CB319: 90,
+    0x1867B0: 90,
+    0xC0FFD4: 511,
+    0x6CB0CE: 511,
+    0x008EF2: 511,
+    0x9CD36D: 511,
+    0xC40415: 511,
+    0x50A4C8: 90,
+    0x6C8336: 90,
+    0x4CA56D: 90,
+    0x00300A: 1147,
+    0x001F3F: 857,
+    0x246511: 857,
+    0xE03E44: 1142,
+    0xDCD87C: 5102,
+    0xC4DA7D: 5103,
+    0x000B6A: 5104,
+    0x001B9E: 234,
+    0xE0CA94: 234,
+    0x0026B6: 234,
+    0x145BD1: 258,
+    0x6CC1D2: 258,
+    0x74F612: 258,
+    0x002495: 258,
+    0x0024A0: 258,
+    0x3C754A: 258,
+    0xE48399: 258,
+    0x002143: 258,
+    0x002374: 258,
+    0xE8FCAF: 511,
+    0x841B5E: 511,
+    0x2CB05D: 511,
+    0xA021B7: 511,
+    0x0024B2: 511,
+    0x001B2F: 511,
+    0x001F33: 511,
+    0x1C1448: 258,
+    0x001784: 258,
+    0x001C11: 258,
+    0x001E46: 258,
+    0x0018A4: 258,
+    0x0018C0: 258,
+    0x747548: 77,
+    0x0000B1: 5105,
+    0x001802: 1159,
+    0x001CA8: 1153,
+    0x74DE2B: 192,
+    0x00225F: 192,
+    0x5C93A2: 192,
+    0xACE010: 192,
+    0x001CA4: 133,
+    0x001A75: 133,
+    0x78843C: 133,
+    0x0023F1: 133,
+    0xE86D52: 258,
+    0x0015CF: 258,
+    0x6CFAA7: 800,
+    0x00080E: 258,
+    0x00909C: 258,
+    0x001225: 258,
+    0x002040: 258,
+    0x386BBB: 258,
+    0x94CE2C: 133,
+    0xFC0FE6: 141,
+    0x24FD52: 192,
+    0x2CD05A: 192,
+    0x74E543: 192,
+    0x0013A9: 133,
+    0x000AD9: 133,
+    0x000E07: 133,
+    0x001E45: 133,
+    0x28C2DD: 43,
+    0x80A589: 43,
+    0xC40938: 287,
+    0x001C50: 5106,
+    0x0C6AE6: 5107,
+    0x54E4BD: 438,
+    0x5414FD: 5108,
+    0x485D60: 43,
+    0x74C63B: 43,
+    0x900BC1: 5109,
+    0xACE5F0: 5110,
+    0x00AA02: 1177,
+    0x7C7A91: 25,
+    0xAC7BA1: 25,
+    0x6C2995: 25,
+    0x984FEE: 25,
+    0xE82AEA: 25,
+    0x605718: 25,
+    0xDC85DE: 43,
+    0xB0EE45: 43,
+    0x54271E: 43,
+    0x00238E: 1155,
+    0x001D8B: 1155,
+    0x0013C8: 1155,
+    0xDC0B1A: 1155,
+    0x842615: 1155,
+    0xF0842F: 1155,
+    0x5CE0C5: 25,
+    0x58A839: 25,
+    0x7C5CF8: 25,
+    0xB4E1C4: 1176,
+    0x348446: 228,
+    0x044E06: 228,
+    0x00D09E: 1166,
+    0xE0757D: 78,
+    0x34BB26: 78,
+    0x806C1B: 78,
+    0x0019E4: 1166,
+    0x001AC4: 1166,
+    0x001B5B: 1166,
+    0x001EC7: 1166,
+    0x002650: 1166,
+    0x002351: 1166,
+    0x001E67: 25,
+    0x0022FA: 25,
+    0x001500: 25,
+    0x0016EB: 25,
+    0x0018DE: 25,
+    0x606720: 25,
+    0xFCF8AE: 25,
+    0x6036DD: 25,
+    0x100BA9: 25,
+    0x648099: 25,
+    0xD07E35: 25,
+    0x001E65: 25,
+    0xC4D987: 25,
+    0x8C705A: 25,
+    0x00270E: 25,
+    0xA088B4: 25,
+    0xCC3B3E: 5111,
+    0x2082C0: 40,
+    0x00173F: 1006,
+    0x001CDF: 1006,
+    0xC05627: 1006,
+    0x4C17EB: 3,
+    0xCC33BB: 3,
+    0x3CA348: 146,
+    0xE45AA2: 146,
+    0x3CEA4F: 1166,
+    0xDC7FA4: 1166,
+    0xB0D5CC: 53,
+    0x3829DD: 5112,
+    0xD86CE9: 3,
+    0xE8F1B0: 3,
+    0xDC6DCD: 69,
+    0xC4282D: 5113,
+    0x800A80: 12,
+    0x5846E1: 5114,
+    0x1CBA8C: 53,
+    0x205532: 5115,
+    0x2CFF65: 5116,
+    0x0015E9: 1167,
+    0x001B11: 1167,
+    0x00265A: 1167,
+    0xC8BE19: 329,
+    0x24BA13: 5117,
+    0x5C6B32: 53,
+    0x84DD20: 53,
+    0x0017E5: 53,
+    0x0017EC: 53,
+    0x0017E7: 53,
+    0x0017E9: 53,
+    0x002926: 5118,
+    0x2C27D7: 607,
+    0x984BE1: 607,
+    0x001831: 53,
+    0x24FD5B: 5119,
+    0x2876CD: 5120,
+    0x001A11: 210,
+    0x28BC56: 5121,
+    0xC8478C: 5122,
+    0xE498D6: 49,
+    0x006037: 1175,
+    0xDCC0EB: 5123,
+    0x48DB50: 15,
+    0xA4BA76: 15,
+    0x0050C2: 12,
+    0xA0F895: 423,
+    0x0078CD: 5124,
+    0x70CA4D: 5125,
+    0x440010: 49,
+    0x0056CD: 49,
+    0x00CDFE: 49,
+    0xE4FAFD: 25,
+    0x94659C: 25,
+    0x484520: 25,
+    0xC80E77: 948,
+    0x9C3426: 258,
+    0x2C6E85: 25,
+    0x9049FA: 25,
+    0xBC0F64: 25,
+    0x9CEFD5: 5126,
+    0x0002B3: 1177,
+    0x000347: 1177,
+    0x000E0C: 1177,
+    0x001320: 25,
+    0x001DD1: 258,
+    0x001DCF: 258,
+    0x001DD5: 258,
+    0x001DD4: 258,
+    0xCCA462: 258,
+    0x44E137: 258,
+    0x0000C5: 258,
+    0x6455B1: 258,
+    0x106F3F: 310,
+    0xB0C745: 310,
+    0x14CFE2: 258,
+    0x00234D: 885,
+    0x002556: 885,
+    0x601888: 11,
+    0xD860B0: 5127,
+    0xF8DB7F: 983,
+    0x64A769: 983,
+    0xE899C4: 983,
+    0xBCCFCC: 983,
+    0x28565A: 885,
+    0x000802: 607,
+    0x0002A5: 607,
+    0x6CC217: 607,
+    0x1458D0: 607,
+    0x5C8A38: 607,
+    0x0080E1: 5128,
+    0x001871: 607,
+    0x000E7F: 607,
+    0x001185: 607,
+    0x001279: 607,
+    0x001321: 607,
+    0x0004EA: 607,
+    0xD8D385: 607,
+    0x18A905: 607,
+    0x001B78: 607,
+    0xEC9A74: 607,
+    0x10604B: 607,
+    0xC8CBB8: 607,
+    0x843497: 607,
+    0x2C59E5: 607,
+    0xD8FC38: 5129,
+    0xAC2A0C: 5130,
+    0x2C6798: 5131,
+    0x6CB56B: 132,
+    0xE422A5: 830,
+    0x6021C0: 102,
+    0x88308A: 102,
+    0x5CDAD4: 102,
+    0x0026E8: 102,
+    0x002586: 86,
+    0x54E6FC: 86,
+    0x74EA3A: 86,
+    0xF81A67: 86,
+    0xEC172F: 86,
+    0x002268: 885,
+    0xBC3AEA: 69,
+    0xF431C3: 49,
+    0x64A5C3: 49,
+    0x0019E0: 86,
+    0x847778: 5132,
+    0x887F03: 5133,
+    0x50EB1A: 1183,
+    0x0027F8: 1183,
+    0x748EF8: 1183,
+    0x14E6E4: 86,
+    0xD81FCC: 1183,
+    0x001882: 15,
+    0xD4EA0E: 470,
+    0x6CFA58: 470,
+    0x20F3A3: 15,
+    0x0C37DC: 15,
+    0xBC7670: 15,
+    0x24DBAC: 15,
+    0x1C1D67: 15,
+    0x84A8E4: 15,
+    0xFCC897: 11,
+    0x002512: 11,
+    0x001C26: 885,
+    0x0016CE: 885,
+    0xD02DB3: 15,
+    0xE8CD2D: 15,
+    0x2469A5: 15,
+    0xEC233D: 15,
+    0x78F5FD: 15,
+    0x5C7D5E: 15,
+    0xF866D1: 885,
+    0xE8088B: 15,
+    0x002438: 1183,
+    0x0014C9: 1183,
+    0x344B50: 11,
+    0x300ED5: 885,
+    0x485AB6: 885,
+    0x543530: 885,
+    0x90671C: 15,
+    0xBC25E0: 15,
+    0xF4E3FB: 15,
+    0x0C96BF: 15,
+    0x60E701: 15,
+    0xCC53B5: 15,
+    0x60DE44: 15,
+    0x105172: 15,
+    0x08E84F: 15,
+    0x643E8C: 15,
+    0x0012D2: 53,
+    0xF0EBD0: 1184,
+    0x888603: 15,
+    0x04F938: 15,
+    0xAC853D: 15,
+    0x4846FB: 15,
+    0x70E422: 4,
+    0x00500F: 4,
+    0x0050A2: 4,
+    0x581626: 470,
+    0xA051C6: 470,
+    0xA863F2: 53,
+    0xD0FF50: 53,
+    0x20C38F: 53,
+    0x7C669D: 53,
+    0xD8DDFD: 53,
+    0xD05FB8: 53,
+    0x7C1DD9: 40,
+    0xA086C6: 40,
+    0x9C99A0: 40,
+    0x584498: 40,
+    0xE0247F: 15,
+    0x00464B: 15,
+    0x80FB06: 15,
+    0x7C6097: 15,
+    0x6CA849: 470,
+    0x64C354: 470,
+    0x50CD22: 470,
+    0xB4A95A: 470,
+    0x84EB18: 53,
+    0x00603E: 4,
+    0x00602F: 4,
+    0x006047: 4,
+    0x00E0B0: 4,
+    0x00E0FE: 4,
+    0x00E034: 4,
+    0xE8EDF3: 4,
+    0xE4C722: 4,
+    0x64E950: 4,
+    0xC07BBC: 4,
+    0x24E9B3: 4,
+    0x00E0F9: 4,
+    0xC8D719: 1068,
+    0x203A07: 4,
+    0xF41FC2: 4,
+    0x44ADD9: 4,
+    0x0C6803: 4,
+    0xC08C60: 4,
+    0x001079: 4,
+    0x001029: 4,
+    0x000E08: 1068,
+    0x4403A7: 4,
+    0xB0FAEB: 4,
+    0x7CAD74: 4,
+    0x00023D: 4,
+    0x00502A: 4,
+    0x0018F3: 398,
+    0x001A92: 398,
+    0x0011D8: 398,
+    0xF07816: 4,
+    0x00223A: 1185,
+    0x0021BE: 1185,
+    0x000C41: 1068,
+    0x0016B6: 1068,
+    0x0018F8: 1068,
+    0x00252E: 1185,
+    0x54D46F: 1185,
+    0xA4A24A: 1185,
+    0x44E08E: 1185,
+    0xBCC810: 1185,
+    0x7CB21B: 1185,
+    0x24767D: 1185,
+    0x481D70: 1185,
+    0x00E036: 1187,
+    0x00E04F: 4,
+    0x0010FF: 4,
+    0x001054: 4,
+    0x0010F6: 4,
+    0x0010A6: 4,
+    0x1CDEA7: 4,
+    0xF07F06: 4,
+    0xBC16F5: 4,
+    0xFC5B39: 4,
+    0x346F90: 4,
+    0x14DAE9: 398,
+    0xF4CFE2: 4,
+    0xA80C0D: 4,
+    0xF0B2E5: 4,
+    0x5897BD: 4,
+    0x5C838F: 4,
+    0xECBD1D: 4,
+    0x5CFC66: 4,
+    0xD46D50: 4,
+    0x74A02F: 4,
+    0x88F031: 4,
+    0x88908D: 4,
+    0x1CABA7: 49,
+    0xC0847A: 49,
+    0x0019E3: 49,
+    0x001B63: 49,
+    0x001EC2: 49,
+    0x001FF3: 49,
+    0x002332: 49,
+    0x00236C: 49,
+    0x0023DF: 49,
+    0x286AB8: 49,
+    0x28E02C: 49,
+    0xE0B9BA: 49,
+    0x00C610: 49,
+    0x78A3E4: 49,
+    0xE4CE8F: 49,
+    0xE8040B: 49,
+    0x145A05: 49,
+    0x148FC6: 49,
+    0x58B035: 49,
+    0x5C5948: 49,
+    0xC8BCC8: 49,
+    0x24AB81: 49,
+    0xE0F847: 49,
+    0x28E7CF: 49,
+    0x002500: 49,
+    0x0025BC: 49,
+    0x34159E: 49,
+    0x0010FA: 49,
+    0x0050E4: 49,
+    0x000D93: 49,
+    0x7CFADF: 49,
+    0x0C3021: 49,
+    0xDC86D8: 49,
+    0x90B931: 49,
+    0xD0E140: 49,
+    0x24A2E1: 49,
+    0x04214C: 5134,
+    0xF832E4: 398,
+    0x80EA96: 49,
+    0x600308: 49,
+    0xB8F6B1: 49,
+    0x8CFABA: 49,
+    0x7CD1C3: 49,
+    0xF0DCE2: 49,
+    0x04F13E: 49,
+    0x98F0AB: 49,
+    0x7831C1: 49,
+    0xA82066: 49,
+    0xBC52B7: 49,
+    0x881FA1: 49,
+    0xC8E0EB: 49,
+    0x98B8E3: 49,
+    0x885395: 49,
+    0x0C3E9F: 49,
+    0x783A84: 49,
+    0x786C1C: 49,
+    0x4C8D79: 49,
+    0x1CE62B: 49,
+    0x98E0D9: 49,
+    0xCC29F5: 49,
+    0x285AEB: 49,
+    0xFCFC48: 49,
+    0x9C293F: 49,
+    0x80A1AB: 5135,
+    0x84285A: 5136,
+    0xD4B8FF: 4739,
+    0x24A074: 49,
+    0xF02475: 49,
+    0x2C1F23: 49,
+    0x549F13: 49,
+    0xF0DBE2: 49,
+    0x748114: 49,
+    0x18F643: 49,
+    0xA45E60: 49,
+    0xA01828: 49,
+    0xD0034B: 49,
+    0x10417F: 49,
+    0xA8667F: 49,
+    0xD02598: 49,
+    0x087402: 49,
+    0x94F6A3: 49,
+    0x5C8D4E: 49,
+    0x8863DF: 49,
+    0x84788B: 49,
+    0x80BE05: 49,
+    0x84A423: 3,
+    0x3C7873: 5137,
+    0x9C88AD: 5,
+    0xC8A2CE: 5138,
+    0x88947E: 5,
+    0x4054E4: 5139,
+    0x58F496: 5140,
+    0x587F57: 49,
+    0xD07C2D: 5141,
+    0xEC64E7: 5142,
+    0x40862E: 5143,
+    0x98F428: 11,
+    0xE8343E: 5144,
+    0x346987: 11,
+    0xA4CC32: 5145,
+    0xC4BBEA: 5146,
+    0x006D52: 49,
+    0x305A3A: 398,
+    0x988744: 5147,
+    0x38F557: 5148,
+    0x70BF3E: 5149,
+    0xA8C87F: 5150,
+    0xA03299: 5151,
+    0x246C8A: 5152,
+    0x5CCF7F: 14,
+    0x3C831E: 5153,
+    0x90DFFB: 5154,
+    0x54A3FA: 5155,
+    0x2C081C: 5156,
+    0xC08488: 5157,
+    0xB844D9: 49,
+    0x385F66: 1185,
+    0x9C7A03: 655,
+    0x7011AE: 5158,
+    0xACC51B: 5159,
+    0xACEE9E: 90,
+    0xB857D8: 90,
+    0x681295: 5160,
+    0x041E7A: 5161,
+    0xC8A9FC: 5162,
+    0x1C497B: 182,
+    0x2CCF58: 15,
+    0xD09380: 5163,
+    0x68F956: 5164,
+    0x84A788: 5165,
+    0xAC60B6: 228,
+    0x14B370: 5166,
+    0x6889C1: 15,
+    0xFCFEC2: 5167,
+    0x689AB7: 5168,
+    0x444CA8: 89,
+    0x7C2BE1: 5169,
+    0x5031AD: 5170,
+    0xA4C138: 5171,
+    0x143EBF: 11,
+    0xFC2FEF: 5172,
+    0x046169: 5173,
+    0x20F510: 5174,
+    0xA8741D: 4303,
+    0x1C56FE: 78,
+    0xF09A51: 5175,
+    0xBCEB5F: 5176,
+    0xB899B0: 5177,
+    0xA8D828: 5178,
+    0xB869C2: 5179,
+    0x88CBA5: 5180,
+    0x4CB82C: 178,
+    0xE4A32F: 5181,
+    0x7CA23E: 15,
+    0x501AA5: 5069,
+    0xF4672D: 5182,
+    0xA48D3B: 1066,
+    0x88A2D7: 15,
+    0xD09DAB: 274,
+    0x887384: 1064,
+    0xF0AB54: 155,
+    0x14157C: 5183,
+    0x20E407: 5184,
+    0x809FAB: 5,
+    0xE00370: 5185,
+    0xD85DEF: 5186,
+    0x3C3178: 5187,
+    0x08ECA9: 90,
+    0xAC5A14: 90,
+    0x00323A: 5188,
+    0x24B0A9: 5189,
+    0x5CEB68: 5190,
+    0xE04B45: 5191,
+    0xF46A92: 989,
+    0xF0D657: 5192,
+    0xAC562C: 786,
+    0xFC9AFA: 5193,
+    0xC8E130: 5194,
+    0x1CC586: 5195,
+    0x24693E: 5196,
+    0xC0DC6A: 5197,
+    0x9C37F4: 15,
+    0x3C4711: 15,
+    0x1CF03E: 5198,
+    0x486EFB: 5199,
+    0xC43ABE: 133,
+    0x883B8B: 5200,
+    0xE4F939: 5201,
+    0x247656: 5202,
+    0xF8CFC5: 78,
+    0x407FE0: 5203,
+    0x146B72: 5204,
+    0xB8F080: 5205,
+    0x70DA9C: 5206,
+    0x7840E4: 90,
+    0xE09971: 90,
+    0x805067: 5207,
+    0x78F944: 13,
+    0x5C5B35: 179,
+    0xB0966C: 5208,
+    0xA47B85: 5209,
+    0x241B44: 5210,
+    0x80A85D: 5211,
+    0xACCAAB: 5212,
+    0xECBAFE: 5213,
+    0x3C2C94: 5214,
+    0x847303: 5215,
+    0x3CC2E1: 5216,
+    0xE48501: 5217,
+    0x8C873B: 5218,
+    0x2CA2B4: 5219,
+    0x10D38A: 90,
+    0x206274: 157,
+    0xE8162B: 5220,
+    0x485415: 5221,
+    0x349E34: 5222,
+    0xBC74D7: 5223,
+    0x28D98A: 5224,
+    0x700FC7: 5225,
+    0x142971: 5226,
+    0xB47356: 5227,
+    0x78E980: 5228,
+    0x3CB792: 5229,
+    0xD89341: 5230,
+    0x346895: 885,
+    0xE0FFF7: 5231,
+    0x3C6A9D: 5232,
+    0x1C9ECB: 5233,
+    0xDCC622: 5234,
+    0x902CC7: 5235,
+    0x94C038: 5236,
+    0x6836B5: 5237,
+    0x8870EF: 5238,
+    0x3C4937: 5239,
+    0x844464: 5240,
+    0x003560: 5241,
+    0xF8BC41: 5242,
+    0x5C966A: 5243,
+    0xBCBC46: 5244,
+    0xC40880: 5245,
+    0xD88039: 72,
+    0xF8B2F3: 5246,
+    0x78EB14: 989,
+    0x84930C: 5247,
+    0x1CA2B1: 5248,
+    0x384B76: 5249,
+    0x34B7FD: 5250,
+    0x90179B: 5251,
+    0x14F893: 5252,
+    0x9816EC: 5253,
+    0x34F6D2: 5254,
+    0x307512: 133,
+    0xD48F33: 157,
+    0x54F876: 5255,
+    0x582136: 5256,
+    0x64002D: 5257,
+    0x38B1DB: 885,
+    0xD062A0: 5258,
+    0x70FF5C: 5259,
+    0x800902: 4794,
+    0x0499E6: 5260,
+    0x4C48DA: 5261,
+    0x205CFA: 5262,
+    0xB47C29: 5263,
+    0x489D18: 5264,
+    0x20A99B: 157,
+    0x604826: 5265,
+    0x4CBB58: 4261,
+    0xA41242: 404,
+    0xC40006: 5266,
+    0xB41780: 5267,
+    0x38F33F: 5268,
+    0xD80CCF: 5269,
+    0x90203A: 5270,
+    0x38262B: 5271,
+    0x480C49: 958,
+    0x3CD9CE: 5272,
+    0x6077E2: 90,
+    0xFC1910: 90,
+    0xD00AAB: 4965,
+    0xFC790B: 5273,
+    0x6081F9: 5274,
+    0x8401A7: 5275,
+    0x98F170: 102,
+    0x04C991: 5276,
+    0xC4C9EC: 5277,
+    0x686E48: 5278,
+    0x14B484: 90,
+    0xF4C447: 5279,
+    0xA43D78: 69,
+    0xA0FC6E: 5280,
+    0x3CA10D: 90,
+    0x646CB2: 90,
+    0x680571: 90,
+    0x209AE9: 5281,
+    0x345D10: 5282,
+    0x6C14F7: 5283,
+    0xB0D59D: 5284,
+    0x6828BA: 5285,
+    0x78D66F: 5286,
+    0x441E91: 5287,
+    0x50C7BF: 86,
+    0x2053CA: 5288,
+    0xA8A668: 11,
+    0xACA9A0: 5289,
+    0xA481EE: 882,
+    0x78923E: 882,
+    0x34E42A: 5290,
+    0x20A787: 5291,
+    0x04572F: 5292,
+    0xD8977C: 5293,
+    0xBC8D0E: 81,
+    0x205A00: 5294,
+    0xA49F85: 5295,
+    0xB05706: 5296,
+    0x48EE07: 5297,
+    0x3C89A6: 5298,
+    0xA46CC1: 5299,
+    0xC40E45: 5300,
+    0xC4626B: 5301,
+    0xEC1766: 5302,
+    0xA0D12A: 5303,
+    0x00EEBD: 983,
+    0xA824EB: 5304,
+    0xA8B9B3: 4889,
+    0x6C09D6: 5305,
+    0x481842: 5306,
+    0x447098: 5307,
+    0x48B977: 5308,
+    0x2C534A: 5309,
+    0xA4BBAF: 5310,
+    0xF490CA: 5311,
+    0xD4319D: 5312,
+    0xB068B6: 5313,
+    0xE44C6C: 5314,
+    0x38F708: 5315,
+    0xE0DB88: 5316,
+    0x282246: 5317,
+    0x9C65F9: 1156,
+    0x487604: 13,
+    0x9CBD9D: 5318,
+    0x74C621: 5319,
+    0xA8574E: 86,
+    0xB843E4: 5320,
+    0xC4824E: 5321,
+    0xB898F7: 5322,
+    0x848336: 5323,
+    0x7071B3: 5324,
+    0x64E625: 5325,
+    0x10B713: 13,
+    0x208986: 11,
+    0xA47760: 882,
+    0xC85663: 5326,
+    0x88FED6: 5327,
+    0x7C72E4: 5328,
+    0x7C2048: 5329,
+    0x8CB7F7: 5330,
+    0xB8266C: 5331,
+    0x182012: 5332,
+    0x3C300C: 5333,
+    0x98FFD0: 1506,
+    0x38BF2F: 5334,
+    0xA875E2: 5335,
+    0xB87AC9: 5336,
+    0xF06130: 5337,
+    0x44C56F: 5338,
+    0x44C4A9: 5339,
+    0x6C3C53: 5340,
+    0x5C2AEF: 5341,
+    0x084027: 5342,
+    0x1C63B7: 5343,
+    0xB4527E: 133,
+    0x18AA45: 5344,
+    0x94B9B4: 5345,
+    0x407A80: 882,
+    0x644214: 5346,
+    0x0CA694: 412,
+    0x184462: 5347,
+    0x146080: 11,
+    0x9CBB98: 5348,
+    0x7060DE: 5349,
+    0x502E5C: 983,
+    0xFCFE77: 5350,
+    0x70533F: 5351,
+    0xB07908: 5352,
+    0xE47723: 11,
+    0x9CA9E4: 11,
+    0x90F3B7: 5353,
+    0x38B74D: 5354,
+    0x180C14: 5355,
+    0xC4E92F: 5356,
+    0xDC3EF8: 882,
+    0xA49F89: 5357,
+    0x50C271: 5358,
+    0x902083: 5359,
+    0x14B126: 4826,
+    0xD850E6: 398,
+    0xA88D7B: 5360,
+    0x3CF748: 5361,
+    0x6C15F9: 5362,
+    0xCC720F: 5363,
+    0x643F5F: 5364,
+    0x2CCD69: 5365,
+    0x8C2F39: 5366,
+    0xC0A0BB: 329,
+    0xF45F69: 5367,
+    0x28A1EB: 5368,
+    0xB8F828: 5369,
+    0x3C1A57: 5370,
+    0x541B5D: 5371,
+    0xD08A55: 473,
+    0x344F3F: 5372,
+    0x1446E4: 5373,
+    0xD095C7: 5374,
+    0x9CE7BD: 5375,
+    0x3842A6: 5376,
+    0x940BD5: 5377,
+    0x284D92: 5378,
+    0x248000: 5379,
+    0x1C4BB9: 5380,
+    0x346178: 5381,
+    0x044F8B: 5382,
+    0x2C7B84: 5383,
+    0xA4C0C7: 5384,
+    0xD02C45: 5385,
+    0xB4A82B: 5386,
+    0x742B62: 621,
+    0xC03580: 5387,
+    0x54FB58: 5388,
+    0xE0D1E6: 5389,
+    0xD82D9B: 5390,
+    0x709BFC: 5391,
+    0xACE42E: 5392,
+    0x306112: 5393,
+    0x041B94: 5394,
+    0xA0CEC8: 4328,
+    0x907A28: 5395,
+    0x883612: 5396,
+    0x083571: 5397,
+    0x9876B6: 5398,
+    0x503CC4: 1506,
+    0xE03E4A: 5399,
+    0xDC6F00: 5400,
+    0x54E3B0: 5401,
+    0x78FE41: 5402,
+    0x205721: 5403,
+    0x18104E: 5404,
+    0x789F4C: 5405,
+    0x043D98: 5406,
+    0xFC4BBC: 16,
+    0x9C1465: 5407,
+    0x4C55CC: 5408,
+    0x00C5DB: 5409,
+    0x8CF945: 5410,
+    0xF842FB: 5411,
+    0x40BD9E: 5412,
+    0x6C5779: 5413,
+    0xC0DA74: 5414,
+    0x887398: 5415,
+    0x2C922C: 5416,
+    0xD8FEE3: 329,
+    0x50A0BF: 5417,
+    0xB836D8: 5418,
+    0x58F387: 5419,
+    0x3C977E: 5420,
+    0xA4FB8D: 5421,
+    0x107A86: 5422,
+    0x882364: 5423,
+    0x581CBD: 5424,
+    0x284FCE: 5425,
+    0xF4CD90: 5426,
+    0x542160: 5427,
+    0x806C8B: 5428,
+    0x3065EC: 5429,
+    0x1001CA: 5430,
+    0x246AAB: 5431,
+    0x542CEA: 5432,
+    0xDC825B: 5433,
+    0x9CA577: 5434,
+    0xC04301: 5435,
+    0xE07C62: 5436,
+    0x601E02: 5437,
+    0xF07F0C: 5438,
+    0x4C6255: 5439,
+    0x18D6CF: 5440,
+    0xF48139: 1131,
+    0x1836FC: 5441,
+    0xA4D094: 5442,
+    0x2C9464: 5443,
+    0x804B20: 5444,
+    0x287994: 5445,
+    0x94B8C5: 5446,
+    0x604A1C: 5447,
+    0x082719: 5448,
+    0x505AC6: 5449,
+    0xB863BC: 5450,
+    0x980D2E: 983,
+    0x9C79AC: 5451,
+    0xC419EC: 5452,
+    0xD464F7: 5453,
+    0x6472D8: 5454,
+    0x846223: 1443,
+    0x1CFA68: 86,
+    0xDC1DD4: 5455,
+    0xFCDD55: 5456,
+    0xB01743: 5457,
+    0x60E00E: 5458,
+    0x545414: 5459,
+    0x24EB65: 5460,
+    0xE894F6: 86,
+    0x50CD32: 5461,
+    0xE0EDC7: 5462,
+    0xD4A499: 5463,
+    0x08482C: 5464,
+    0x9498A2: 5465,
+    0xDC2BCA: 5466,
+    0x5C8486: 5467,
+    0xBCBAE1: 5468,
+    0x18FA6F: 5469,
+    0xB4DD15: 5470,
+    0xE0C6B3: 5471,
+    0x188410: 5472,
+    0xFC229C: 5473,
+    0x1832A2: 5474,
+    0x40516C: 5475,
+    0x74D02B: 398,
+    0xA01C05: 5476,
+    0xD0BE2C: 5477,
+    0x2C26C5: 11,
+    0x94C962: 5478,
+    0xDC2A14: 5479,
+    0xF82EDB: 5480,
+    0xC04A00: 86,
+    0x045FA7: 5481,
+    0x808B5C: 5482,
+    0xC05E6F: 5483,
+    0xC0885B: 5484,
+    0x3CFB96: 5485,
+    0x081F3F: 5486,
+    0x087999: 5487,
+    0xC011A6: 5488,
+    0xC0B8B1: 5489,
+    0x105F06: 659,
+    0x1853E0: 5490,
+    0x00C14F: 5491,
+    0xE0CEC3: 234,
+    0xF0219D: 4974,
+    0x181725: 5492,
+    0x8462A6: 5493,
+    0xE4F365: 5494,
+    0xDCC0DB: 5495,
+    0xAC5D10: 5496,
+    0x88F490: 5497,
+    0x1C9179: 5498,
+    0x84C8B1: 5499,
+    0x30D357: 5500,
+    0xBC39A6: 5501,
+    0xECB541: 5502,
+    0x74372F: 5503,
+    0xE8A364: 5504,
+    0xBC51FE: 5505,
+    0xFC626E: 5506,
+    0x6886E7: 5507,
+    0xD819CE: 5508,
+    0x38F597: 5509,
+    0x807B1E: 5510,
+    0xB4AB2C: 5511,
+    0x74E424: 5512,
+    0xA0BAB8: 5513,
+    0xD8D5B9: 5514,
+    0x2411D0: 5515,
+    0xB461FF: 5516,
+    0xA0A130: 5517,
+    0x30215B: 5518,
+    0xCC593E: 5519,
+    0xECE915: 5520,
+    0x80D733: 5521,
+    0x34FA40: 5522,
+    0x1C5A6B: 5523,
+    0xA875D6: 5524,
+    0x10A743: 5525,
+    0x547FA8: 5526,
+    0x5474E6: 5527,
+    0xC46DF1: 5528,
+    0x303D08: 5529,
+    0xA81FAF: 5530,
+    0x08E5DA: 5531,
+    0xE4C146: 5532,
+    0xD40057: 5533,
+    0xD410CF: 5534,
+    0x6CB311: 5535,
+    0x94FD2E: 5536,
+    0x5884E4: 5537,
+    0xB0358D: 882,
+    0xF8E4FB: 659,
+    0x8C4AEE: 5538,
+    0x34C99D: 5539,
+    0x789F87: 5540,
+    0x5CE0F6: 5541,
+    0xC83D97: 882,
+    0x0CF361: 5542,
+    0xC8C791: 5543,
+    0xECD925: 5544,
+    0x005D03: 5545,
+    0xE8718D: 5546,
+    0xD0738E: 5547,
+    0x64C944: 5548,
+    0x600F77: 5549,
+    0x0C93FB: 5550,
+    0xE44F5F: 5551,
+    0xE86D54: 5552,
+    0x802FDE: 5553,
+    0x5C38E0: 5554,
+    0x08AF78: 5555,
+    0x1C9492: 5556,
+    0xB889CA: 5557,
+    0x64F50E: 5558,
+    0xACE64B: 5559,
+    0x044BFF: 5560,
+    0x2829D9: 5561,
+    0x88615A: 5562,
+    0x70E24C: 5563,
+    0x00FD4C: 5564,
+    0x144319: 5565,
+    0x7CC8D0: 5566,
+    0x88E917: 5567,
+    0x909DE0: 5568,
+    0xD8AFF1: 5569,
+    0x2C6289: 5570,
+    0x1848D8: 5571,
+    0xF0D3E7: 5572,
+    0xB01266: 5573,
+    0x58ECE1: 5574,
+    0x4C09B4: 11,
+    0x58CF4B: 5575,
+    0x68B43A: 5576,
+    0x60D2B9: 5577,
+    0x30FD11: 5578,
+    0x6032F0: 5579,
+    0xD8AF3B: 5580,
+    0xC4DA26: 5581,
+    0x7CC8AB: 5582,
+    0x10F3DB: 5583,
+    0x601929: 5584,
+    0x48B253: 5585,
+    0x305D38: 5586,
+    0xD04CC1: 5587,
+    0x503F56: 5588,
+    0x8CEEC6: 5589,
+    0x101248: 5590,
+    0x74943D: 5591,
+    0x3CF392: 5592,
+    0x149FE8: 1506,
+    0xBCD940: 5593,
+    0x049C62: 5594,
+    0x0C2A69: 5595,
+    0xC455C2: 5596,
+    0x00E8AB: 5597,
+    0xB4218A: 5598,
+    0x4C7897: 5599,
+    0x44E8A5: 5600,
+    0xB482C5: 5601,
+    0x985E1B: 5602,
+    0x60D1AA: 5603,
+    0x709BA5: 5604,
+    0xB48910: 5605,
+    0xB0C83F: 5606,
+    0x388AB7: 5607,
+    0xBCC23A: 5608,
+    0xD48CB5: 4,
+    0xACC2EC: 5609,
+    0xDC37D2: 5610,
+    0x549D85: 5611,
+    0xB0750C: 5612,
+    0xB4E1EB: 13,
+    0xA865B2: 5613,
+    0xE8D0FA: 5614,
+    0x98262A: 5615,
+    0x3C9174: 5616,
+    0xFC5090: 5617,
+    0x60B982: 5618,
+    0x348137: 5619,
+    0x38B12D: 5620,
+    0xACEE3B: 5621,
+    0x1C6BCA: 5622,
+    0xE83EFB: 5623,
+    0x642400: 5624,
+    0x9CE10E: 5625,
+    0xA06D09: 5626,
+    0x60F3DA: 5627,
+    0xB46238: 5628,
+    0xC8BBD3: 5629,
+    0xECD19A: 5630,
+    0x3C363D: 882,
+    0x808698: 5631,
+    0x407074: 5632,
+    0x20F002: 5633,
+    0x1CF4CA: 13,
+    0xB4A4B5: 5634,
+    0xAC1461: 5635,
+    0xE4C6E6: 5636,
+    0x502D1D: 882,
+    0xF48E09: 882,
+    0x5848C0: 5637,
+    0x8C604F: 4,
+    0xA4B980: 5638,
+    0xA47C14: 5639,
+    0x3C9F81: 5640,
+    0x445F7A: 5641,
+    0x141A51: 5642,
+    0x587FC8: 5643,
+    0x200505: 5644,
+    0xF8DB4C: 5645,
+    0x0C9D56: 5646,
+    0x002D76: 5647,
+    0x8020AF: 5648,
+    0x3CB87A: 13,
+    0x088F2C: 5649,
+    0x441319: 5650,
+    0x980284: 5651,
+    0x1CD40C: 5652,
+    0x2C750F: 5653,
+    0x5C5015: 4,
+    0xC035BD: 5654,
+    0x287184: 5655,
+    0x7CB03E: 5656,
+    0xBC8B55: 5657,
+    0xC0493D: 5658,
+    0xC84544: 5659,
+    0xE0EF25: 5660,
+    0x8C57FD: 5661,
+    0x54E63F: 5662,
+    0x20FABB: 5663,
+    0x2CBE97: 5664,
+    0xB01C91: 5665,
+    0x04F17D: 5666,
+    0x50ED94: 5667,
+    0x48A22D: 5668,
+    0xC86000: 398,
+    0x70A66A: 5669,
+    0xDC3E51: 5670,
+    0x18B591: 5671,
+    0x844915: 5672,
+    0xD878E5: 5673,
+    0xD824BD: 4,
+    0x28CD1C: 5674,
+    0xD443A8: 5675,
+    0xBCE59F: 5676,
+    0x7041B7: 5677,
+    0xDCA8CF: 5678,
+    0xA849A5: 5679,
+    0xA05E6B: 5680,
+    0xF83553: 5681,
+    0xF4044C: 5682,
+    0x3497FB: 5683,
+    0xF03A55: 5684,
+    0xC467B5: 5685,
+    0x4C3910: 5686,
+    0x903AA0: 81,
+    0xB06CBF: 5687,
+    0x98BC57: 5688,
+    0xDC3C2E: 5689,
+    0xAC0DFE: 5690,
+    0xFC5B26: 5691,
+    0x40F407: 1265,
+    0x900A3A: 5692,
+    0x54D0ED: 5693,
+    0x644BF0: 5694,
+    0x843611: 5695,
+    0x3440B5: 1594,
+    0x64ED62: 5696,
+    0x5CC9D3: 5697,
+    0xC81AFE: 5698,
+    0xEC63E5: 5699,
+    0x94DB49: 5700,
+    0xB4944E: 5701,
+    0xE00B28: 5702,
+    0x48022A: 5703,
+    0x345B11: 5704,
+    0xF0620D: 5705,
+    0x2C67FB: 5706,
+    0xD4D748: 4,
+    0x344F69: 5707,
+    0xF8313E: 5708,
+    0x143605: 882,
+    0x3CE5B4: 5709,
+    0x08D09F: 4,
+    0x2C002C: 5710,
+    0x70CA9B: 4,
+    0xC87CBC: 5711,
+    0xB81413: 5712,
+    0xCCA374: 5713,
+    0x58677F: 5714,
+    0x8C8A6E: 5715,
+    0x68BC0C: 4,
+    0xCC6BF1: 5716,
+    0x18E80F: 5717,
+    0x2C9717: 5718,
+    0x78BAD0: 5719,
+    0x2C3F38: 4,
+    0x4050E0: 5720,
+    0x000830: 4,
+    0xC4EEAE: 5721,
+    0xF8D3A9: 5722,
+    0x24E6BA: 5723,
+    0x0C5A19: 5724,
+    0xA8BD1A: 5725,
+    0x988217: 5726,
+    0x9CA3BA: 5727,
+    0xA078BA: 5374,
+    0x9C5C8D: 5728,
+    0xD4206D: 983,
+    0x7C1E52: 1989,
+    0xDCB4C4: 5729,
+    0xACCB09: 5730,
+    0x1866E3: 5731,
+    0x74FDA0: 5732,
+    0xCCB8F1: 5733,
+    0xA429B7: 5734,
+    0x48F317: 13,
+    0xD41C1C: 5735,
+    0x04888C: 5736,
+    0xCCF8F0: 5737,
+    0xBC779F: 5738,
+    0x406AAB: 1754,
+    0x248707: 5739,
+    0xD45AB2: 5740,
+    0xC4C19F: 5741,
+    0x58920D: 5742,
+    0x30DE86: 5743,
+    0x18C451: 5744,
+    0x704642: 5745,
+    0x280CB8: 5746,
+    0x3CC99E: 5747,
+    0xAC02EF: 5748,
+    0xB8B42E: 5322,
+    0x443EB2: 5749,
+    0xD059C3: 5750,
+    0xB4FC75: 5751,
+    0xB0BF99: 5752,
+    0xFC1794: 5753,
+    0xB40B7A: 5754,
+    0x182C91: 5755,
+    0x1C8E8E: 5756,
+    0x24EC99: 234,
+    0x2C1EEA: 5757,
+    0x78BEB6: 5758,
+    0xA44B15: 5759,
+    0x48C862: 5760,
+    0xA0165C: 5761,
+    0x449CB5: 5762,
+    0x40F14C: 5763,
+    0xE8944C: 5764,
+    0x9067F3: 1402,
+    0x9C417C: 5765,
+    0x9C6ABE: 5766,
+    0x9C934E: 5767,
+    0x2C8BF2: 5768,
+    0x68F895: 5769,
+    0x70B921: 5,
+    0xA0E295: 5770,
+    0x3826CD: 5771,
+    0xD8973B: 3809,
+    0xD4F0B4: 5772,
+    0x900917: 5773,
+    0xF4A52A: 5774,
+    0xE8B748: 4,
+    0x0C6E4F: 5775,
+    0xBC99BC: 5776,
+    0x783F15: 5777,
+    0x147411: 1754,
+    0xF8A9DE: 5778,
+    0xB8D49D: 5779,
+    0x88BFD5: 5780,
+    0x24CBE7: 5781,
+    0xB0A10A: 5782,
+    0x802DE1: 5783,
+    0x986022: 5784,
+    0x18D071: 5785,
+    0x3C672C: 5786,
+    0x58E476: 5787,
+    0x447E95: 5788,
+    0x044665: 102,
+    0x18AEBB: 5789,
+    0x50FAAB: 5790,
+    0x3891FB: 5791,
+    0xA8E018: 882,
+    0xBC5FF4: 4476,
+    0xE8B4AE: 5792,
+    0x781DFD: 5793,
+    0xCCC62B: 5794,
+    0xD8C068: 5795,
+    0x601199: 5796,
+    0xA88CEE: 5797,
+    0xDC2B66: 5798,
+    0x6C81FE: 5799,
+    0xC027B9: 5800,
+    0xB0BDA1: 5801,
+    0x70B265: 5802,
+    0x64D1A3: 5803,
+    0xF43E9D: 5804,
+    0xDC9B1E: 5805,
+    0xB8871E: 5806,
+    0xD4F027: 5807,
+    0x64094C: 5808,
+    0x04E2F8: 5809,
+    0xEC9ECD: 3809,
+    0x8C5105: 5810,
+    0xC8208E: 5811,
+    0x44D2CA: 5812,
+    0x386E21: 5813,
+    0x609E64: 5814,
+    0xBC15A6: 5815,
+    0x1C19DE: 5816,
+    0x9C807D: 5817,
+    0x0054AF: 356,
+    0xACCABA: 5818,
+    0x0C8112: 13,
+    0x9C95F8: 5819,
+    0xA4856B: 5820,
+    0x20D5AB: 5821,
+    0x743889: 5822,
+    0x7C7D41: 5823,
+    0x4C1480: 5824,
+    0x0CF3EE: 38,
+    0xDCDECA: 5825,
+    0xA0AAFD: 5826,
+    0x2872F0: 5827,
+    0x0455CA: 5828,
+    0xAC932F: 882,
+    0x30142D: 5829,
+    0x50AF73: 5830,
+    0x6CA906: 5831,
+    0x78223D: 5832,
+    0x3C02B1: 5833,
+    0xE441E6: 5834,
+    0x60DA23: 5835,
+    0x44DCCB: 5836,
+    0xF8F014: 5837,
+    0xBC71C1: 5838,
+    0xE0E8E8: 5839,
+    0x6052D0: 5840,
+    0x5C9AD8: 621,
+    0xA4C0E1: 1265,
+    0x4C3B74: 5841,
+    0x684352: 5842,
+    0xECE90B: 5843,
+    0xA08C9B: 5844,
+    0x0CF0B4: 5845,
+    0x48DF1C: 5846,
+    0xA83944: 659,
+    0x74E06E: 5847,
+    0xB08991: 5848,
+    0x34B571: 5849,
+    0x3C7437: 1754,
+    0xEC9233: 5850,
+    0xD49C8E: 5851,
+    0x34A183: 5852,
+    0x9873C4: 5853,
+    0xB40142: 5854,
+    0x740ABC: 5855,
+    0x10A13B: 5856,
+    0xCC34D7: 5857,
+    0xF02A61: 5858,
+    0xC8A70A: 5859,
+    0x304EC3: 5860,
+    0xB4CFDB: 5861,
+    0xC01242: 5862,
+    0xBC20BA: 5863,
+    0x1CFEA7: 5864,
+    0xA0DE05: 5865,
+    0x2826A6: 5866,
+    0xB428F1: 5867,
+    0xAC2FA8: 5868,
+    0x1064E2: 5869,
+    0xCCD811: 5870,
+    0x44599F: 5871,
+    0x3C2F3A: 5872,
+    0x74CE56: 5873,
+    0xAC8112: 182,
+    0x686359: 5874,
+    0x18922C: 5875,
+    0x28061E: 5876,
+    0x64E8E6: 5877,
+    0x5C6A7D: 5878,
+    0xFCD4F2: 5879,
+    0x0817F4: 2034,
+    0xF43814: 5880,
+    0x90610C: 5881,
+    0x3C5F01: 5882,
+    0xECBBAE: 5883,
+    0xF4E142: 5884,
+    0xE0D10A: 5885,
+    0xC44B44: 5886,
+    0x48C8B6: 5887,
+    0x3C6278: 5888,
+    0xD43D67: 5889,
+    0xC8D5FE: 5284,
+    0x2C3068: 5890,
+    0x00BD27: 5891,
+    0x5C4058: 5892,
+    0x58D08F: 1536,
+    0xCC09C8: 5893,
+    0x9C4563: 5894,
+    0xE446BD: 5895,
+    0x8CDD8D: 5896,
+    0x20A2E7: 5897,
+    0xFCEDB9: 5898,
+    0x44ED57: 5899,
+    0xEC98C1: 5900,
+    0x38A95F: 5901,
+    0xC46354: 5902,
+    0x405FBE: 1754,
+    0x58DB8D: 5903,
+    0xF4DCDA: 5904,
+    0xE80462: 4,
+    0xDCD0F7: 5905,
+    0xD4A928: 5906,
+    0xE06290: 5907,
+    0x100E2B: 5908,
+    0x7CB542: 5909,
+    0x905446: 5910,
+    0x544A05: 5911,
+    0x6C9CE9: 5912,
+    0xA49B13: 5913,
+    0xC8EE08: 5914,
+    0x70E139: 5915,
+    0x18422F: 1402,
+    0x6854F5: 5916,
+    0x7472F2: 5917,
+    0xE0A670: 882,
+    0x98E165: 5918,
+    0x785712: 5919,
+    0x380A0A: 5920,
+    0x0CD696: 5921,
+    0xF4DC4D: 5922,
+    0xDC4EDE: 5923,
+    0xF0F842: 5924,
+    0x4083DE: 1805,
+    0x8897DF: 5925,
+    0x4013D9: 5926,
+    0xAC4FFC: 5927,
+    0xB43741: 5928,
+    0x94857A: 5929,
+    0x24AF54: 5930,
+    0xF0AD4E: 5931,
+    0x08FAE0: 5932,
+    0x903D5A: 5933,
+    0xE087B1: 5934,
+    0x447C7F: 5935,
+    0x5C864A: 5936,
+    0xD496DF: 5937,
+    0x58B9E1: 5938,
+    0x20D906: 5939,
+    0xF45595: 5940,
+    0x180C77: 5941,
+    0x9C4E20: 4,
+    0x1C3A4F: 5942,
+    0xD87533: 882,
+    0x4C5DCD: 5943,
+    0x70D57E: 5944,
+    0x9835B8: 5945,
+    0x288915: 5946,
+    0x7CA29B: 5947,
+    0xA04041: 5948,
+    0x3018CF: 5949,
+    0x40406B: 5950,
+    0x6C22AB: 5951,
+    0x68CA00: 5952,
+    0xE0589E: 5953,
+    0x98DCD9: 5954,
+    0xC0CFA3: 5955,
+    0x6089B7: 5956,
+    0x30525A: 5957,
+    0x2CA780: 5958,
+    0xB0E39D: 5959,
+    0x7C2E0D: 5960,
+    0x5CE286: 1034,
+    0x8C640B: 5961,
+    0xFCE192: 5962,
+    0x949C55: 5963,
+    0xD479C3: 5964,
+    0x0C1DC2: 5965,
+    0x5475D0: 4,
+    0x94236E: 5966,
+    0x10E6AE: 5967,
+    0x7C6F06: 5968,
+    0x70D5E7: 5969,
+    0x3CF72A: 882,
+    0x545FA9: 5970,
+    0x408A9A: 5971,
+    0xF445ED: 5972,
+    0x6C32DE: 5973,
+    0x601283: 5974,
+    0x547FEE: 4,
+    0xACEA6A: 5975,
+    0xA8F470: 5976,
+    0x8C736E: 621,
+    0x04FE7F: 4,
+    0xEC4476: 4,
+    0xE0BC43: 5977,
+    0x2CA835: 1754,
+    0xC41ECE: 5978,
+    0x14A62C: 5979,
+    0x50F003: 5980,
+    0xDC49C9: 5981,
+    0x70D880: 5982,
+    0xA05DC1: 5983,
+    0xB86491: 5984,
+    0x583CC6: 5985,
+    0xB0C8AD: 5986,
+    0x181714: 5987,
+    0xF0EC39: 5988,
+    0x2046F9: 5989,
+    0x487119: 5990,
+    0xAC583B: 5991,
+    0xE8E776: 5992,
+    0xA4B1EE: 5993,
+    0x842141: 5994,
+    0xA8995C: 5995,
+    0x4012E4: 5996,
+    0x446C24: 5997,
+    0x681FD8: 5998,
+    0xA0231B: 5999,
+    0xB8A3E0: 6000,
+    0x3CF52C: 6001,
+    0x5403F5: 6002,
+    0x6C1811: 6003,
+    0xF8E968: 6004,
+    0x8038FD: 6005,
+    0xACBEB6: 6006,
+    0x2C9127: 6007,
+    0x5C1437: 6008,
+    0x9C55B4: 6009,
+    0xE4751E: 6010,
+    0x1065A3: 6011,
+    0x4001C6: 716,
+    0x9C5E73: 6012,
+    0x04C05B: 6013,
+    0x78B81A: 6014,
+    0xB0E97E: 6015,
+    0x50252B: 6016,
+    0xF8811A: 6017,
+    0x4C63EB: 6018,
+    0x702F97: 6019,
+    0x10CA81: 6020,
+    0x3863F6: 6021,
+    0x202CB7: 6022,
+    0x74E537: 6023,
+    0xCC0080: 6024,
+    0x644BC3: 6025,
+    0x609F9D: 6026,
+    0xCCCC4E: 6027,
+    0x688540: 6028,
+    0xA09A5A: 6029,
+    0x64A837: 6030,
+    0x942E63: 6031,
+    0xAC8317: 6032,
+    0xACD180: 6033,
+    0x40A6A4: 6034,
+    0x94BA31: 6035,
+    0x9C5B96: 6036,
+    0x60F13D: 6037,
+    0xB894D2: 6038,
+    0xF0C24C: 6039,
+    0x48343D: 6040,
+    0xD4AAFF: 6041,
+    0x002717: 6042,
+    0x002716: 6043,
+    0x0026E1: 6044,
+    0x0026DC: 6045,
+    0x0026C3: 6046,
+    0x0026C1: 6047,
+    0x0026EC: 6048,
+    0x0026E9: 6049,
+    0x0026EB: 6050,
+    0x002700: 6051,
+    0x0026D4: 6052,
+    0x002663: 6053,
+    0x002661: 6054,
+    0x00265B: 520,
+    0x002656: 6055,
+    0x002658: 6056,
+    0x00267F: 6057,
+    0x00267D: 6058,
+    0x00267C: 6059,
+    0x002674: 6060,
+    0x002673: 6061,
+    0x00266D: 6062,
+    0x00264C: 6063,
+    0x002646: 6064,
+    0x002644: 1944,
+    0x00268B: 6065,
+    0x002681: 6066,
+    0x002683: 6067,
+    0x00266F: 6068,
+    0x00266E: 6069,
+    0x0026BE: 6070,
+    0x0026B5: 6071,
+    0x00263F: 6072,
+    0x00263B: 6073,
+    0x002634: 6074,
+    0x002698: 4,
+    0x00269B: 6075,
+    0x00268C: 6076,
+    0x0026A1: 6077,
+    0x0025D4: 6078,
+    0x002606: 6079,
+    0x002607: 6080,
+    0x002602: 6081,
+    0x002605: 6082,
+    0x00262F: 6083,
+    0x002631: 4190,
+    0x002624: 6084,
+    0x0025FB: 6085,
+    0x0025F4: 6086,
+    0x0025EF: 6087,
+    0x0025C2: 6088,
+    0x00261A: 6089,
+    0x0025E3: 6090,
+    0x0025B4: 4,
+    0x0025B2: 6091,
+    0x0025A7: 6092,
+    0x002529: 6093,
+    0x00252A: 6094,
+    0x002528: 6095,
+    0x00259F: 6096,
+    0x00259D: 13,
+    0x002598: 6097,
+    0x002599: 6098,
+    0x002526: 6099,
+    0x002521: 6100,
+    0x00251F: 6101,
+    0x00251E: 6102,
+    0x00256B: 6103,
+    0x00256E: 6104,
+    0x002565: 6105,
+    0x00255E: 6106,
+    0x00255F: 6107,
+    0x002597: 6108,
+    0x002592: 6109,
+    0x002594: 6110,
+    0x00258A: 6111,
+    0x00253B: 6112,
+    0x00253D: 6113,
+    0x002535: 6114,
+    0x002584: 4,
+    0x002579: 6115,
+    0x00257F: 6116,
+    0x002577: 6117,
+    0x002572: 6118,
+    0x0024C2: 6119,
+    0x0024BF: 6120,
+    0x0024C0: 6121,
+    0x0024BB: 6122,
+    0x0024BC: 6123,
+    0x0024B7: 6124,
+    0x0024E4: 4434,
+    0x0024DE: 6125,
+    0x0024DB: 6126,
+    0x0024EA: 6127,
+    0x0024ED: 6128,
+    0x0024EC: 6129,
+    0x0024E6: 6130,
+    0x0024E7: 6131,
+    0x0024A7: 6132,
+    0x0024AB: 6133,
+    0x0024A4: 6134,
+    0x00249A: 6135,
+    0x0024DD: 6136,
+    0x0024D5: 6137,
+    0x0024AE: 6138,
+    0x0024AD: 6139,
+    0x002519: 6140,
+    0x002513: 6141,
+    0x002503: 2034,
+    0x002504: 6142,
+    0x00245F: 6143,
+    0x002455: 6144,
+    0x00245A: 6145,
+    0x00245B: 6146,
+    0x002459: 6147,
+    0x00249E: 6148,
+    0x00249F: 4818,
+    0x002488: 6149,
+    0x00248F: 6150,
+    0x002439: 6151,
+    0x002434: 6152,
+    0x00242F: 6153,
+    0x00243A: 6154,
+    0x002479: 6155,
+    0x002468: 987,
+    0x002466: 6156,
+    0x002426: 6157,
+    0x002429: 6158,
+    0x00244E: 6159,
+    0x00240B: 6160,
+    0x002402: 6161,
+    0x0023C1: 6162,
+    0x0023EB: 4,
+    0x0023EC: 6163,
+    0x0023C8: 6164,
+    0x002418: 6165,
+    0x002412: 6166,
+    0x00240D: 6167,
+    0x0023FC: 6168,
+    0x0023DB: 6169,
+    0x0023AA: 6170,
+    0x0023A5: 6171,
+    0x0023BB: 6172,
+    0x00238D: 6173,
+    0x002387: 6174,
+    0x002384: 6175,
+    0x00232D: 6176,
+    0x002323: 6177,
+    0x0022F8: 6178,
+    0x00231C: 6179,
+    0x00231D: 6180,
+    0x00236F: 6181,
+    0x002369: 1068,
+    0x00239E: 6182,
+    0x002391: 6183,
+    0x002392: 6184,
+    0x002393: 6185,
+    0x002330: 6186,
+    0x00230A: 6187,
+    0x002316: 6188,
+    0x00230F: 6189,
+    0x00237F: 830,
+    0x002295: 6190,
+    0x002287: 6191,
+    0x002288: 6192,
+    0x0022D7: 1265,
+    0x0022D6: 6193,
+    0x0022D0: 6194,
+    0x002285: 6195,
+    0x002281: 6196,
+    0x002273: 6197,
+    0x00226B: 1068,
+    0x002267: 1034,
+    0x0022A2: 6198,
+    0x00229E: 6199,
+    0x0022C3: 6200,
+    0x0022DE: 6201,
+    0x0022F1: 13,
+    0x002242: 6202,
+    0x002234: 6203,
+    0x002232: 6204,
+    0x00222B: 6205,
+    0x002221: 6206,
+    0x002226: 6207,
+    0x00221D: 6208,
+    0x0021FF: 6209,
+    0x0021F7: 6210,
+    0x0021F4: 6211,
+    0x0021F5: 6212,
+    0x002255: 4,
+    0x00224E: 6213,
+    0x002245: 6214,
+    0x00220A: 6215,
+    0x002203: 6216,
+    0x002204: 6217,
+    0x002224: 6218,
+    0x00221B: 6219,
+    0x002249: 6220,
+    0x002240: 6221,
+    0x00220F: 6222,
+    0x00225A: 6223,
+    0x00218F: 6224,
+    0x002187: 6225,
+    0x002181: 6226,
+    0x00217E: 6227,
+    0x0021AC: 6228,
+    0x0021A2: 6229,
+    0x00216E: 6230,
+    0x00216D: 6231,
+    0x002165: 6232,
+    0x0021E4: 6233,
+    0x0021E5: 6234,
+    0x0021E2: 6235,
+    0x00218E: 6236,
+    0x0021C9: 6237,
+    0x0021C2: 6238,
+    0x0021DD: 6239,
+    0x0021D5: 6240,
+    0x0021B2: 6241,
+    0x00214A: 6242,
+    0x002146: 6243,
+    0x001FF8: 6244,
+    0x001FFA: 6245,
+    0x001FF5: 6246,
+    0x00212E: 6247,
+    0x002130: 6248,
+    0x002133: 6249,
+    0x002134: 6250,
+    0x001FF2: 6251,
+    0x001FF1: 6252,
+    0x00215B: 6253,
+    0x00214E: 6254,
+    0x00211F: 6255,
+    0x002124: 6256,
+    0x002117: 6257,
+    0x00210F: 6258,
+    0x002101: 6259,
+    0x002103: 6260,
+    0x002142: 6261,
+    0x00213A: 6262,
+    0x001F90: 659,
+    0x001F91: 6263,
+    0x001F98: 6264,
+    0x001F93: 4956,
+    0x001FD1: 6265,
+    0x001FC9: 4,
+    0x001FE6: 6266,
+    0x001FDC: 6267,
+    0x001FA9: 6268,
+    0x001FA3: 6269,
+    0x001FA2: 6270,
+    0x001F70: 6271,
+    0x001FCF: 6272,
+    0x001F2C: 6273,
+    0x001F31: 6274,
+    0x001F2B: 6275,
+    0x001F2A: 6276,
+    0x001F30: 6277,
+    0x001F51: 6278,
+    0x001F53: 6279,
+    0x001F4C: 6280,
+    0x001F50: 6281,
+    0x001F48: 6282,
+    0x001F24: 6283,
+    0x001F21: 6284,
+    0x001F22: 6285,
+    0x001F1D: 6286,
+    0x001F15: 6287,
+    0x001EDF: 6288,
+    0x001EE3: 6289,
+    0x001ED9: 6290,
+    0x001F3E: 6291,
+    0x001F37: 6292,
+    0x001EF0: 6293,
+    0x001EF2: 6294,
+    0x001EEA: 6295,
+    0x001F6D: 4,
+    0x001F64: 6296,
+    0x001F04: 6297,
+    0x001E83: 6298,
+    0x001E7C: 6299,
+    0x001E78: 6300,
+    0x001E7A: 4,
+    0x001E62: 6301,
+    0x001E5C: 6302,
+    0x001E5D: 6303,
+    0x001E60: 6304,
+    0x001EA0: 6305,
+    0x001E98: 6306,
+    0x001E9A: 6307,
+    0x001EA6: 6308,
+    0x001EA5: 6309,
+    0x001EA7: 659,
+    0x001E94: 6310,
+    0x001E8F: 1131,
+    0x001ED3: 6311,
+    0x001ECF: 6312,
+    0x001E6C: 6313,
+    0x001DEC: 6314,
+    0x001DE8: 6315,
+    0x001DDA: 6316,
+    0x001DE3: 6317,
+    0x001DDE: 6318,
+    0x001DE5: 4,
+    0x001E22: 6319,
+    0x001E1A: 6320,
+    0x001E19: 6321,
+    0x001E14: 4,
+    0x001DB8: 6322,
+    0x001DB0: 6323,
+    0x001E0E: 6324,
+    0x001E0F: 6325,
+    0x001DCB: 6326,
+    0x001DCA: 6327,
+    0x001E2F: 6328,
+    0x001E36: 6329,
+    0x001E27: 6330,
+    0x001DFE: 6331,
+    0x001DF5: 6332,
+    0x001DF0: 6333,
+    0x001DC2: 6334,
+    0x001E44: 6335,
+    0x001DA7: 6336,
+    0x001DA8: 6337,
+    0x001DA9: 6338,
+    0x001DA5: 6339,
+    0x001D96: 6340,
+    0x001D8F: 6341,
+    0x001D55: 6342,
+    0x001D52: 6343,
+    0x001D4A: 6344,
+    0x001D36: 6345,
+    0x001D33: 6346,
+    0x001D2C: 6347,
+    0x001D71: 4,
+    0x001D65: 6348,
+    0x001D64: 6349,
+    0x001D5E: 6350,
+    0x001DA1: 4,
+    0x001D8C: 6351,
+    0x001D50: 6352,
+    0x001D45: 4,
+    0x001D69: 6353,
+    0x001CF8: 6354,
+    0x001CF7: 6355,
+    0x001CF6: 4,
+    0x001CF5: 6356,
+    0x001CEE: 224,
+    0x001CCA: 6357,
+    0x001CC9: 6358,
+    0x001CC8: 6359,
+    0x001CC6: 6360,
+    0x001CBE: 1265,
+    0x001D27: 6361,
+    0x001D24: 6362,
+    0x001CDE: 6363,
+    0x001CCF: 6364,
+    0x001CAB: 6365,
+    0x001C9E: 6366,
+    0x001C94: 6367,
+    0x001CAD: 6368,
+    0x001CA7: 6369,
+    0x001D07: 6370,
+    0x001D06: 6371,
+    0x001D01: 6372,
+    0x001D18: 6373,
+    0x001D1B: 6374,
+    0x001D17: 6375,
+    0x001CE3: 6376,
+    0x001C48: 6377,
+    0x001C46: 6378,
+    0x001C42: 6379,
+    0x001C3E: 6380,
+    0x001C80: 6381,
+    0x001C83: 6382,
+    0x001C76: 6383,
+    0x001C72: 6384,
+    0x001C8C: 6385,
+    0x001C93: 6386,
+    0x001C85: 6387,
+    0x001C0A: 6388,
+    0x001C0D: 6389,
+    0x001C03: 6390,
+    0x001C6A: 6391,
+    0x001C67: 6392,
+    0x001C60: 6393,
+    0x001C2F: 6394,
+    0x001C27: 6395,
+    0x001C22: 6396,
+    0x001C51: 6397,
+    0x001C54: 691,
+    0x001C59: 6398,
+    0x001C39: 6399,
+    0x001C37: 6400,
+    0x001C33: 6401,
+    0x001C1D: 6402,
+    0x001C0F: 4,
+    0x001BF6: 6403,
+    0x001BF8: 6404,
+    0x001BF1: 6405,
+    0x001BEF: 6406,
+    0x001BEB: 6407,
+    0x001BCE: 6408,
+    0x001BC9: 6409,
+    0x001BC3: 6410,
+    0x001BB8: 6411,
+    0x001BB2: 6412,
+    0x001BB0: 6413,
+    0x001BAD: 6414,
+    0x001BA7: 6415,
+    0x001B87: 6416,
+    0x001B7F: 6417,
+    0x001B7E: 6418,
+    0x001BA5: 6419,
+    0x001BA2: 6420,
+    0x001B9D: 6421,
+    0x001B7A: 1265,
+    0x001B72: 6422,
+    0x001B74: 6423,
+    0x001B6D: 6424,
+    0x001B6F: 6425,
+    0x001BDC: 6426,
+    0x001BD5: 4,
+    0x001BE7: 6427,
+    0x001BE3: 6428,
+    0x001B95: 6429,
+    0x001B90: 4,
+    0x001AF1: 6430,
+    0x001AF8: 6431,
+    0x001AF5: 6432,
+    0x001AED: 6433,
+    0x001AEE: 6434,
+    0x001B1D: 6435,
+    0x001B1A: 6436,
+    0x001B12: 6437,
+    0x001B5F: 6438,
+    0x001B5E: 6439,
+    0x001B61: 6440,
+    0x001B5C: 6441,
+    0x001B34: 6442,
+    0x001B3A: 6443,
+    0x001AFE: 6444,
+    0x001B4B: 6445,
+    0x001B4D: 6446,
+    0x001B0D: 4,
+    0x001B0A: 6447,
+    0x001B2E: 6448,
+    0x001B2D: 6449,
+    0x001AE3: 4,
+    0x001ADF: 6450,
+    0x001AE1: 6451,
+    0x001AE9: 1265,
+    0x001AE5: 6452,
+    0x001AE4: 6453,
+    0x001A98: 6454,
+    0x001A97: 6455,
+    0x001A90: 6456,
+    0x001A94: 6457,
+    0x001A86: 6458,
+    0x001ACE: 6459,
+    0x001ACC: 6460,
+    0x001AC7: 6461,
+    0x001AB1: 6462,
+    0x001AB2: 6463,
+    0x001AB7: 6464,
+    0x001AA2: 4,
+    0x001AA5: 6465,
+    0x001A9C: 6466,
+    0x001A9E: 6467,
+    0x001AD2: 6468,
+    0x001AC0: 6469,
+    0x001AC2: 6470,
+    0x001A7E: 6471,
+    0x001A72: 6472,
+    0x001A37: 6473,
+    0x001A38: 6243,
+    0x001A2B: 6474,
+    0x001A28: 6475,
+    0x001A2C: 6476,
+    0x001A27: 6477,
+    0x001A68: 6478,
+    0x001A5A: 6479,
+    0x001A5F: 6480,
+    0x001A2E: 6481,
+    0x001A32: 6482,
+    0x001A35: 6483,
+    0x001A48: 6484,
+    0x001A21: 6485,
+    0x001A0B: 6486,
+    0x001A06: 6487,
+    0x001A5D: 6488,
+    0x001A00: 6489,
+    0x0019FF: 6490,
+    0x0019FA: 6491,
+    0x0019F1: 6492,
+    0x0019EC: 6493,
+    0x0019A5: 6494,
+    0x001993: 6495,
+    0x0019C8: 6496,
+    0x0019C4: 6497,
+    0x0019BC: 6498,
+    0x001973: 6499,
+    0x001975: 6500,
+    0x00197B: 6501,
+    0x0019D8: 6502,
+    0x0019D5: 6503,
+    0x0019CC: 6504,
+    0x001981: 6505,
+    0x0019EA: 6506,
+    0x00199B: 6507,
+    0x001990: 6508,
+    0x00198F: 6509,
+    0x0019A3: 6510,
+    0x0019AD: 6511,
+    0x0019A2: 6512,
+    0x001926: 6513,
+    0x001929: 6514,
+    0x00192A: 6515,
+    0x00190F: 6516,
+    0x001911: 6517,
+    0x00192E: 6518,
+    0x00192B: 6519,
+    0x00191E: 6520,
+    0x00191F: 6521,
+    0x001920: 6522,
+    0x0018F1: 6523,
+    0x0018F2: 6524,
+    0x0018EC: 6525,
+    0x00196E: 6526,
+    0x001965: 6527,
+    0x001966: 5104,
+    0x001917: 6528,
+    0x001918: 6529,
+    0x00190B: 6530,
+    0x001903: 6531,
+    0x00195C: 6532,
+    0x00195F: 6533,
+    0x001900: 6534,
+    0x001902: 6535,
+    0x001945: 6536,
+    0x001948: 6537,
+    0x001943: 6538,
+    0x001940: 6539,
+    0x00193C: 6540,
+    0x00189B: 6084,
+    0x001894: 6541,
+    0x001898: 6542,
+    0x001892: 6543,
+    0x001891: 6544,
+    0x001889: 6545,
+    0x0018B2: 6546,
+    0x0018B3: 6547,
+    0x0018AC: 6548,
+    0x0018AB: 6549,
+    0x0018ED: 6550,
+    0x0018E0: 6551,
+    0x0018CB: 6552,
+    0x0018BD: 6553,
+    0x0018A5: 6554,
+    0x0018A6: 6555,
+    0x001867: 6556,
+    0x001865: 6557,
+    0x00186A: 6558,
+    0x001878: 6559,
+    0x00186E: 2510,
+    0x00186B: 6560,
+    0x001877: 6561,
+    0x0018CE: 6562,
+    0x0017D3: 6563,
+    0x0017CC: 940,
+    0x0017C4: 6564,
+    0x0017BD: 6565,
+    0x0017BF: 6566,
+    0x001847: 6567,
+    0x001843: 6568,
+    0x00182C: 6569,
+    0x001836: 6570,
+    0x0017ED: 6571,
+    0x0017DD: 6572,
+    0x0017D9: 6573,
+    0x0017DC: 6574,
+    0x00181B: 6575,
+    0x001805: 6576,
+    0x0017F9: 6577,
+    0x0017F4: 6578,
+    0x0017F7: 6579,
+    0x00181D: 6580,
+    0x00181F: 6581,
+    0x00180D: 6582,
+    0x001854: 6583,
+    0x0017AD: 6584,
+    0x00179E: 6585,
+    0x0017A7: 6586,
+    0x00179F: 6587,
+    0x0017A1: 6588,
+    0x00173C: 6589,
+    0x001736: 6590,
+    0x001737: 6591,
+    0x001733: 4542,
+    0x00174F: 6592,
+    0x00174A: 6593,
+    0x00174E: 6594,
+    0x00175B: 6595,
+    0x001758: 6596,
+    0x001792: 6597,
+    0x001797: 6598,
+    0x00178C: 6599,
+    0x00176F: 207,
+    0x001771: 6600,
+    0x001766: 6601,
+    0x001764: 6602,
+    0x00175E: 6603,
+    0x0017B4: 6604,
+    0x0017AC: 6605,
+    0x001788: 6606,
+    0x001729: 6607,
+    0x001727: 6608,
+    0x00172A: 6609,
+    0x00171B: 6610,
+    0x001714: 6611,
+    0x001709: 6612,
+    0x001703: 6613,
+    0x0016FC: 6614,
+    0x0016F8: 6615,
+    0x0016E8: 6616,
+    0x0016E9: 6617,
+    0x0016DC: 6618,
+    0x0016D0: 6619,
+    0x001725: 6620,
+    0x0016F0: 6621,
+    0x0016A9: 6622,
+    0x0016B0: 6623,
+    0x0016B1: 6624,
+    0x00167F: 6625,
+    0x00167C: 6626,
+    0x001673: 6627,
+    0x00168C: 6628,
+    0x001683: 6629,
+    0x001684: 6630,
+    0x001687: 6631,
+    0x0016C3: 6632,
+    0x0016C1: 6633,
+    0x00169C: 4,
+    0x001694: 6634,
+    0x00165F: 6635,
+    0x001657: 6636,
+    0x0016AE: 712,
+    0x0016AC: 6637,
+    0x00164C: 6638,
+    0x001649: 6639,
+    0x001665: 6640,
+    0x00161B: 6641,
+    0x001618: 6642,
+    0x00161E: 6643,
+    0x00161F: 6644,
+    0x001614: 6645,
+    0x00160E: 6646,
+    0x0015E3: 6647,
+    0x0015E0: 3584,
+    0x0015D3: 6648,
+    0x0015CA: 6649,
+    0x001647: 4,
+    0x001643: 6650,
+    0x001644: 6651,
+    0x00163E: 6652,
+    0x001634: 6653,
+    0x0015F9: 4,
+    0x0015FD: 6654,
+    0x0015F6: 6655,
+    0x001605: 6656,
+    0x00162C: 6657,
+    0x0015F3: 6658,
+    0x0015E7: 6659,
+    0x00154B: 6660,
+    0x001548: 6661,
+    0x001570: 1805,
+    0x00156E: 6662,
+    0x001568: 6663,
+    0x00155F: 6664,
+    0x0015AD: 6665,
+    0x0015AC: 6666,
+    0x0015A9: 6667,
+    0x00153C: 6668,
+    0x00158E: 6669,
+    0x001589: 6670,
+    0x001574: 6671,
+    0x00155A: 6672,
+    0x00E0A8: 6673,
+    0x001598: 6674,
+    0x00158A: 6675,
+    0x0015B4: 6676,
+    0x0014FA: 6677,
+    0x0014FB: 6678,
+    0x0014F4: 6679,
+    0x0014F5: 6680,
+    0x0014EC: 6681,
+    0x001512: 6682,
+    0x00150A: 6683,
+    0x0014FF: 6684,
+    0x0014D2: 6685,
+    0x0014DC: 6686,
+    0x0014EB: 6687,
+    0x00153A: 6688,
+    0x001532: 6689,
+    0x0014CD: 6690,
+    0x0014C0: 6691,
+    0x00151D: 6692,
+    0x0014AD: 6693,
+    0x0014AF: 6694,
+    0x0014A9: 4,
+    0x00149B: 6695,
+    0x0014A1: 6696,
+    0x00149E: 6697,
+    0x0014C1: 6698,
+    0x0014C4: 6699,
+    0x0014AB: 6700,
+    0x0014B0: 6701,
+    0x00148E: 6702,
+    0x00148F: 6703,
+    0x00148C: 6078,
+    0x001487: 6704,
+    0x00144D: 6705,
+    0x00144A: 6706,
+    0x001445: 6707,
+    0x001444: 6708,
+    0x001468: 6709,
+    0x001481: 6710,
+    0x00147C: 2510,
+    0x001464: 6711,
+    0x00145E: 2034,
+    0x0014A2: 6712,
+    0x001458: 6713,
+    0x001437: 6714,
+    0x001431: 6715,
+    0x00142B: 6716,
+    0x00142C: 6717,
+    0x0013BA: 6718,
+    0x0013B8: 6719,
+    0x0013B6: 6720,
+    0x001424: 6721,
+    0x001421: 6722,
+    0x001420: 6723,
+    0x001418: 6724,
+    0x00141B: 4,
+    0x00140F: 6725,
+    0x001407: 6726,
+    0x001406: 6727,
+    0x0013F0: 6728,
+    0x0013EF: 6729,
+    0x0013EB: 6730,
+    0x0013EC: 6731,
+    0x00140A: 6732,
+    0x0013FA: 6733,
+    0x0013FB: 6734,
+    0x0013C3: 4,
+    0x0013BD: 6735,
+    0x0013D0: 6736,
+    0x0013D2: 6737,
+    0x0013D1: 6738,
+    0x001366: 6739,
+    0x00135B: 6740,
+    0x00135E: 6741,
+    0x001373: 6742,
+    0x00136F: 6743,
+    0x00134E: 6744,
+    0x001344: 6745,
+    0x001348: 6746,
+    0x00137D: 6747,
+    0x001383: 6748,
+    0x001387: 6749,
+    0x0013B4: 6750,
+    0x0013AE: 6751,
+    0x001397: 4606,
+    0x001336: 6752,
+    0x0012DB: 6753,
+    0x0012D6: 6754,
+    0x0012DA: 4,
+    0x0012D3: 6755,
+    0x0012D5: 6756,
+    0x0012D8: 6757,
+    0x001322: 6758,
+    0x001323: 6759,
+    0x001314: 6760,
+    0x001316: 6761,
+    0x0012BA: 6762,
+    0x0012B2: 6763,
+    0x0012AE: 6764,
+    0x0012AF: 6765,
+    0x0012E9: 6766,
+    0x0012E6: 6767,
+    0x0012E3: 6768,
+    0x001312: 6769,
+    0x001300: 6770,
+    0x0012EF: 1283,
+    0x00123B: 6771,
+    0x001236: 6772,
+    0x001235: 6773,
+    0x001257: 6774,
+    0x001251: 6775,
+    0x001245: 6776,
+    0x0012A2: 6777,
+    0x0012A8: 6778,
+    0x0012A5: 6779,
+    0x00129E: 6780,
+    0x00129A: 6781,
+    0x001282: 6782,
+    0x001287: 6783,
+    0x001285: 6784,
+    0x001242: 6785,
+    0x001241: 6786,
+    0x00126D: 6787,
+    0x001267: 6788,
+    0x001265: 6789,
+    0x00128D: 6790,
+    0x00128E: 6791,
+    0x001292: 6792,
+    0x0011F3: 6793,
+    0x0011E9: 6794,
+    0x0011EC: 6795,
+    0x0011E7: 6796,
+    0x0011E8: 6797,
+    0x0011FD: 6798,
+    0x0011FA: 6799,
+    0x0011F2: 6800,
+    0x001228: 6801,
+    0x00121F: 6802,
+    0x001220: 6803,
+    0x001210: 6804,
+    0x00120D: 6805,
+    0x00120E: 6806,
+    0x001202: 6807,
+    0x0011FE: 6808,
+    0x0011CE: 6809,
+    0x0011D0: 6810,
+    0x0011C3: 6811,
+    0x0011C2: 6812,
+    0x0011B7: 6813,
+    0x0011B9: 6814,
+    0x0011A7: 6815,
+    0x001226: 6816,
+    0x001229: 6817,
+    0x001222: 6818,
+    0x0011BF: 6819,
+    0x0011E0: 6820,
+    0x0011A3: 6821,
+    0x0011A4: 6822,
+    0x001198: 6823,
+    0x001197: 6824,
+    0x001199: 6825,
+    0x001176: 6826,
+    0x001177: 6827,
+    0x001170: 6828,
+    0x00116B: 6829,
+    0x001169: 6830,
+    0x001162: 6831,
+    0x001161: 6832,
+    0x001156: 6833,
+    0x001159: 6834,
+    0x00115C: 4,
+    0x001181: 6835,
+    0x001194: 6836,
+    0x00113D: 6837,
+    0x001134: 6838,
+    0x00115D: 4,
+    0x001149: 6839,
+    0x00113B: 6840,
+    0x001135: 6841,
+    0x001126: 6842,
+    0x000FC0: 6843,
+    0x000FBA: 6844,
+    0x000FB8: 6845,
+    0x000FB7: 6846,
+    0x000FD1: 6847,
+    0x000FC1: 6848,
+    0x000FC4: 6849,
+    0x000FC9: 6850,
+    0x000FC6: 6851,
+    0x000FBE: 6852,
+    0x001116: 6853,
+    0x001110: 6854,
+    0x001109: 6855,
+    0x001104: 6856,
+    0x001100: 4266,
+    0x000FFA: 6857,
+    0x000FFD: 6858,
+    0x00112E: 6859,
+    0x001121: 4,
+    0x001122: 6860,
+    0x000FD8: 6861,
+    0x000FD3: 6862,
+    0x000FF9: 6863,
+    0x000FF7: 4,
+    0x000FA9: 6864,
+    0x000F85: 6865,
+    0x000F82: 6866,
+    0x000F81: 6867,
+    0x000F7F: 6868,
+    0x000F9A: 6869,
+    0x000FA0: 6870,
+    0x000F95: 6871,
+    0x000F4B: 2279,
+    0x000F4A: 6872,
+    0x000F44: 6873,
+    0x000F40: 6874,
+    0x000F60: 6875,
+    0x000F5B: 6876,
+    0x000F55: 6877,
+    0x000F56: 6878,
+    0x000F49: 6879,
+    0x000F77: 6880,
+    0x000F8A: 6881,
+    0x000F90: 4,
+    0x000F8D: 6882,
+    0x000F7B: 6883,
+    0x000F68: 6884,
+    0x000F33: 6885,
+    0x000F2F: 6886,
+    0x000EEB: 6887,
+    0x000EEC: 6888,
+    0x000EEF: 13,
+    0x000EF1: 6889,
+    0x000EE7: 6890,
+    0x000EE2: 6891,
+    0x000ED0: 6892,
+    0x000EC3: 6893,
+    0x000EC4: 6894,
+    0x000EC1: 6895,
+    0x000EBD: 6896,
+    0x000EE3: 6897,
+    0x000EE5: 6898,
+    0x000ECF: 6899,
+    0x000EDA: 6900,
+    0x000EC9: 6901,
+    0x000F0A: 6902,
+    0x000F02: 6903,
+    0x000F05: 6904,
+    0x000F1C: 6905,
+    0x000F1A: 6906,
+    0x000EB9: 6907,
+    0x000EB2: 6908,
+    0x000EB5: 6909,
+    0x000EA1: 6910,
+    0x000E98: 4005,
+    0x000E99: 6911,
+    0x000EF7: 6912,
+    0x000EE9: 6913,
+    0x000EF0: 6914,
+    0x000EA7: 6915,
+    0x000E95: 6916,
+    0x000E97: 6917,
+    0x000E45: 6918,
+    0x000E3F: 6919,
+    0x000E82: 6920,
+    0x000E89: 6921,
+    0x000E79: 6922,
+    0x000E15: 6923,
+    0x000E1D: 6924,
+    0x000E12: 6925,
+    0x000E4F: 6926,
+    0x000E50: 1944,
+    0x000E4B: 6927,
+    0x000E38: 4,
+    0x000E36: 6928,
+    0x000E2B: 6929,
+    0x000E28: 6930,
+    0x000E17: 13,
+    0x000E6F: 6931,
+    0x000DCB: 6932,
+    0x000DCC: 6933,
+    0x000DCE: 6934,
+    0x000DB9: 6935,
+    0x000DB7: 6936,
+    0x000DC3: 6937,
+    0x000DE6: 6938,
+    0x000DDF: 6939,
+    0x000E04: 6940,
+    0x000DE8: 6941,
+    0x000DE9: 6942,
+    0x000DDB: 6943,
+    0x000DAC: 6944,
+    0x000E01: 6945,
+    0x000D45: 6946,
+    0x000D46: 6947,
+    0x000D41: 6948,
+    0x000D42: 6949,
+    0x000D3C: 6950,
+    0x000D2A: 6951,
+    0x000D29: 4,
+    0x000D26: 6952,
+    0x000D65: 4,
+    0x000D55: 6953,
+    0x000D57: 6954,
+    0x000D58: 13,
+    0x000D51: 6955,
+    0x000D19: 6956,
+    0x000D1C: 6957,
+    0x000D13: 6958,
+    0x000D16: 6959,
+    0x000D1F: 6960,
+    0x000D0C: 6961,
+    0x000D01: 6962,
+    0x000D35: 6963,
+    0x000D95: 6964,
+    0x000D91: 6965,
+    0x000D62: 6966,
+    0x000D80: 6967,
+    0x000CA3: 6968,
+    0x000CAA: 6969,
+    0x000CAC: 6970,
+    0x000CAE: 6971,
+    0x000C9E: 6972,
+    0x000C95: 6973,
+    0x000C9C: 6974,
+    0x000C97: 6975,
+    0x000C8F: 6976,
+    0x000C92: 6977,
+    0x000C93: 6978,
+    0x000C7F: 6979,
+    0x000C81: 6980,
+    0x000C80: 6981,
+    0x000C7D: 6982,
+    0x000CF0: 6983,
+    0x000CF4: 6984,
+    0x000CF3: 6985,
+    0x000CE0: 6986,
+    0x000CE2: 6987,
+    0x000CD1: 6988,
+    0x000CD8: 6989,
+    0x000CCE: 4,
+    0x000CCF: 4,
+    0x000D00: 6990,
+    0x000CF9: 6991,
+    0x000CED: 6992,
+    0x000CC6: 6993,
+    0x000CC4: 6994,
+    0x000CBA: 6995,
+    0x000CB7: 6996,
+    0x000CAD: 6997,
+    0x000C0A: 6998,
+    0x000C0B: 6999,
+    0x000C07: 7000,
+    0x000C0C: 7001,
+    0x000C18: 7002,
+    0x000C0E: 7003,
+    0x000C12: 7004,
+    0x000C10: 7005,
+    0x000C40: 7006,
+    0x000C3E: 7007,
+    0x000C3A: 7008,
+    0x000C35: 7009,
+    0x000C37: 7010,
+    0x000C56: 7011,
+    0x000C57: 7012,
+    0x000C76: 2557,
+    0x000C4A: 7013,
+    0x000C23: 7014,
+    0x000C25: 7015,
+    0x000C54: 7016,
+    0x000C68: 7017,
+    0x000BE5: 7018,
+    0x000BE9: 7019,
+    0x000BE3: 7020,
+    0x000BE8: 7021,
+    0x000BDC: 7022,
+    0x000BD8: 7023,
+    0x000BD7: 7024,
+    0x000BD3: 7025,
+    0x000BD5: 7026,
+    0x000BD1: 7027,
+    0x000BD2: 7028,
+    0x000BC7: 7029,
+    0x000B9F: 7030,
+    0x000B95: 7031,
+    0x000B98: 7032,
+    0x000B9E: 7033,
+    0x000B88: 7034,
+    0x000BB8: 7035,
+    0x000BC0: 7036,
+    0x000BB0: 7037,
+    0x000BB4: 7038,
+    0x000B8A: 7039,
+    0x000B8C: 7040,
+    0x000B90: 149,
+    0x000B79: 7041,
+    0x000BF9: 7042,
+    0x000BFC: 4,
+    0x000BAC: 2510,
+    0x000BEA: 7043,
+    0x000BDD: 7044,
+    0x000B4C: 7045,
+    0x000B4B: 7046,
+    0x000B36: 7047,
+    0x000B35: 7048,
+    0x000B3F: 7049,
+    0x000B15: 7050,
+    0x000B18: 13,
+    0x000B0D: 7051,
+    0x000B0B: 7052,
+    0x000B08: 7053,
+    0x000B54: 7054,
+    0x000B43: 7055,
+    0x000B45: 4,
+    0x000B21: 7056,
+    0x000B25: 7057,
+    0x000B1A: 7058,
+    0x000B68: 7059,
+    0x000B58: 7060,
+    0x000B55: 7061,
+    0x000B87: 7062,
+    0x000B75: 7063,
+    0x000B70: 7064,
+    0x000B6F: 7065,
+    0x000AFA: 7066,
+    0x000AFC: 7067,
+    0x000B3C: 7068,
+    0x000B27: 7069,
+    0x000B63: 7070,
+    0x000ABA: 7071,
+    0x000AAF: 7072,
+    0x000AB2: 7073,
+    0x000AB6: 7074,
+    0x000AAA: 7075,
+    0x000ABE: 7076,
+    0x000AC0: 7077,
+    0x000AAE: 7078,
+    0x000AB3: 7079,
+    0x000AC9: 7080,
+    0x000AC1: 7081,
+    0x000AC3: 7082,
+    0x000AC4: 7083,
+    0x000AE8: 7084,
+    0x000ADD: 7085,
+    0x000AE1: 7086,
+    0x000ADF: 7087,
+    0x000ADA: 7088,
+    0x000A8D: 7089,
+    0x000A9F: 7090,
+    0x000A8F: 7091,
+    0x000AA0: 7092,
+    0x000A8E: 7093,
+    0x000AF1: 7094,
+    0x000AF3: 4,
+    0x000AEC: 7095,
+    0x000AE7: 7096,
+    0x000A76: 7097,
+    0x000A99: 7098,
+    0x000A93: 7099,
+    0x000A89: 7100,
+    0x000A80: 7101,
+    0x000A79: 7102,
+    0x000A30: 114,
+    0x000A2F: 7103,
+    0x000A2C: 7104,
+    0x000A2A: 7105,
+    0x0009D6: 7106,
+    0x0009C7: 7107,
+    0x0009C9: 7108,
+    0x0009D4: 7109,
+    0x000A60: 7110,
+    0x000A5D: 7111,
+    0x000A5C: 7112,
+    0x000A5A: 7113,
+    0x000A04: 2510,
+    0x0009F1: 7114,
+    0x0009F4: 7115,
+    0x000A1F: 7116,
+    0x000A15: 7117,
+    0x000A1B: 7118,
+    0x000A56: 7119,
+    0x000A51: 7120,
+    0x000A53: 7121,
+    0x000A4A: 7122,
+    0x000A39: 7123,
+    0x000A37: 7124,
+    0x000A34: 7125,
+    0x0009F5: 7126,
+    0x0009EA: 7127,
+    0x0009E3: 7128,
+    0x000A1A: 7129,
+    0x000A0A: 7130,
+    0x000A05: 7131,
+    0x0009CB: 7132,
+    0x0009C5: 7133,
+    0x0009CD: 7134,
+    0x0009C0: 7135,
+    0x0009BF: 1265,
+    0x00097E: 7136,
+    0x000971: 7137,
+    0x00096A: 7138,
+    0x00095A: 7139,
+    0x0009B4: 7140,
+    0x0009AE: 7141,
+    0x000974: 7142,
+    0x000967: 7143,
+    0x000996: 7144,
+    0x00098B: 7145,
+    0x000991: 7146,
+    0x0009BA: 7147,
+    0x00092F: 7148,
+    0x00091F: 7149,
+    0x000924: 7150,
+    0x00090D: 7151,
+    0x0008FE: 7152,
+    0x0008FF: 7153,
+    0x000904: 7154,
+    0x000921: 7155,
+    0x000919: 7156,
+    0x000918: 7157,
+    0x000910: 7158,
+    0x0008FC: 7159,
+    0x0008EF: 7160,
+    0x0008F0: 7161,
+    0x000947: 7162,
+    0x00093D: 7163,
+    0x000951: 7164,
+    0x00094E: 7165,
+    0x0008E9: 7166,
+    0x0008E7: 7167,
+    0x000914: 7168,
+    0x00090C: 7169,
+    0x000938: 7170,
+    0x0008C1: 7171,
+    0x0008C6: 7172,
+    0x0008BF: 7173,
+    0x0008B8: 7174,
+    0x0008BB: 7175,
+    0x0008BE: 7176,
+    0x000865: 7177,
+    0x000864: 7178,
+    0x000860: 7179,
+    0x000897: 7180,
+    0x000890: 7181,
+    0x00088D: 7182,
+    0x000884: 7183,
+    0x000851: 7184,
+    0x000859: 7185,
+    0x00084E: 7186,
+    0x000825: 7187,
+    0x00081F: 7188,
+    0x0008A8: 7189,
+    0x0008A4: 4,
+    0x08006B: 7190,
+    0x0008D7: 7191,
+    0x000794: 7192,
+    0x000797: 7193,
+    0x00078C: 7194,
+    0x0007C6: 7195,
+    0x0007CC: 7196,
+    0x0007C0: 7197,
+    0x00047E: 7198,
+    0x000807: 7199,
+    0x0007FC: 7200,
+    0x0007E8: 7201,
+    0x0007A9: 7202,
+    0x0007A1: 7203,
+    0x00079E: 7204,
+    0x0007A0: 7205,
+    0x000819: 7206,
+    0x00081A: 7207,
+    0x000810: 7208,
+    0x0007BC: 7209,
+    0x0007EB: 4,
+    0x0007F5: 7210,
+    0x0007EC: 4,
+    0x0007B8: 7211,
+    0x0007DC: 7212,
+    0x000748: 7213,
+    0x000746: 7214,
+    0x000741: 7215,
+    0x000745: 7216,
+    0x00073E: 7217,
+    0x00071E: 7218,
+    0x000717: 7219,
+    0x000711: 7220,
+    0x00070A: 7221,
+    0x000702: 7222,
+    0x000705: 7223,
+    0x0006FF: 7224,
+    0x00072B: 7225,
+    0x000718: 7226,
+    0x000716: 7227,
+    0x00071A: 7228,
+    0x00075C: 7229,
+    0x000756: 7230,
+    0x00075A: 7231,
+    0x000781: 7232,
+    0x000788: 7233,
+    0x00077B: 7234,
+    0x000769: 7235,
+    0x00076B: 7236,
+    0x000768: 7237,
+    0x00075F: 7238,
+    0x00073B: 7239,
+    0x000731: 7240,
+    0x000709: 7241,
+    0x0006D6: 4,
+    0x000647: 7242,
+    0x0006CB: 7243,
+    0x0006CD: 7244,
+    0x0006C7: 7245,
+    0x000674: 7246,
+    0x000663: 7247,
+    0x000665: 7248,
+    0x000662: 7249,
+    0x00068B: 7250,
+    0x000687: 7251,
+    0x0006E4: 7252,
+    0x0006D9: 7253,
+    0x0006D3: 7254,
+    0x0006A4: 7255,
+    0x000694: 7256,
+    0x000695: 7257,
+    0x000691: 7258,
+    0x000692: 7259,
+    0x0006A1: 7260,
+    0x0006AB: 7261,
+    0x0006AC: 7262,
+    0x0006EB: 7263,
+    0x0006E3: 7264,
+    0x0006B9: 7265,
+    0x0005C0: 7266,
+    0x0005B8: 7267,
+    0x0005BA: 7268,
+    0x0005BF: 7269,
+    0x0005AC: 7270,
+    0x0005D1: 7271,
+    0x0005D5: 7272,
+    0x0005D2: 7273,
+    0x0005C5: 7274,
+    0x0005CA: 7275,
+    0x000669: 7276,
+    0x00066E: 7277,
+    0x00065A: 7278,
+    0x000652: 4,
+    0x000656: 7279,
+    0x000641: 7280,
+    0x000648: 7281,
+    0x00064C: 7282,
+    0x000638: 7283,
+    0x00060F: 7284,
+    0x000610: 7285,
+    0x000611: 7286,
+    0x0005EC: 7287,
+    0x00061A: 7288,
+    0x00061F: 7289,
+    0x00061B: 7290,
+    0x000602: 7291,
+    0x0005FB: 7292,
+    0x000635: 7293,
+    0x0005F0: 7294,
+    0x0005FE: 7295,
+    0x00057D: 7296,
+    0x000581: 7297,
+    0x000586: 7298,
+    0x00057B: 7299,
+    0x000571: 7300,
+    0x0005AD: 7301,
+    0x0005B1: 7302,
+    0x000599: 7303,
+    0x00059A: 4,
+    0x0005AB: 7304,
+    0x000592: 7305,
+    0x00058B: 7306,
+    0x000549: 7307,
+    0x00054C: 7308,
+    0x000543: 7309,
+    0x000570: 7310,
+    0x000577: 7311,
+    0x00056E: 7312,
+    0x00056D: 7313,
+    0x000538: 7314,
+    0x000530: 7315,
+    0x00052B: 7316,
+    0x00055C: 7317,
+    0x0004E9: 7318,
+    0x0004E8: 7319,
+    0x0004E0: 7320,
+    0x0004DB: 7321,
+    0x0004DD: 4,
+    0x008086: 7322,
+    0x000513: 7323,
+    0x00050E: 7324,
+    0x000510: 7325,
+    0x000501: 4,
+    0x000508: 7326,
+    0x0004FF: 7327,
+    0x000504: 7328,
+    0x000509: 7329,
+    0x0004FB: 7330,
+    0x000516: 7331,
+    0x000515: 7332,
+    0x00051B: 7333,
+    0x0004D4: 7334,
+    0x0004CD: 7335,
+    0x0004C0: 4,
+    0x0004BA: 7336,
+    0x0004B6: 7337,
+    0x0004D7: 7338,
+    0x00051D: 7339,
+    0x0004B3: 7340,
+    0x0004A4: 7341,
+    0x000444: 7342,
+    0x000439: 7343,
+    0x00043A: 7344,
+    0x00043F: 7345,
+    0x000433: 7346,
+    0x000473: 7347,
+    0x000470: 7348,
+    0x00046C: 7349,
+    0x000471: 7350,
+    0x00046E: 4,
+    0x000474: 7351,
+    0x000434: 7352,
+    0x00042D: 7353,
+    0x00042E: 7354,
+    0x000425: 7355,
+    0x00041B: 7356,
+    0x000492: 7357,
+    0x00048C: 7358,
+    0x000491: 7359,
+    0x000493: 7360,
+    0x000494: 7361,
+    0x000489: 7362,
+    0x00048A: 7363,
+    0x000481: 7364,
+    0x000477: 7365,
+    0x000416: 7366,
+    0x00040F: 7367,
+    0x00040A: 7368,
+    0x000404: 7369,
+    0x000405: 7370,
+    0x000401: 7371,
+    0x00045D: 7372,
+    0x000459: 7373,
+    0x00044C: 7374,
+    0x0003A7: 7375,
+    0x0003AE: 7376,
+    0x0003A3: 7377,
+    0x0003A1: 7378,
+    0x000396: 7379,
+    0x00039A: 7380,
+    0x000371: 7381,
+    0x000363: 7382,
+    0x00035F: 7383,
+    0x000360: 7384,
+    0x000361: 7385,
+    0x000359: 7386,
+    0x000352: 7387,
+    0x0003D2: 7388,
+    0x0003D0: 7389,
+    0x0003CF: 7390,
+    0x0003D1: 7391,
+    0x0003F4: 7392,
+    0x0003F2: 7393,
+    0x0003F0: 7394,
+    0x0003EB: 7395,
+    0x0003E7: 7396,
+    0x000374: 7397,
+    0x000376: 7398,
+    0x000378: 132,
+    0x00036D: 7399,
+    0x00036E: 7400,
+    0x000394: 7401,
+    0x00038A: 7402,
+    0x00038D: 7403,
+    0x000388: 7404,
+    0x0003B6: 7405,
+    0x0003B1: 7406,
+    0x0003B3: 7407,
+    0x0003AD: 7408,
+    0x00037E: 7409,
+    0x0003E3: 4,
+    0x0003DB: 7410,
+    0x00031F: 7411,
+    0x00029F: 7412,
+    0x00031B: 7413,
+    0x00031C: 7414,
+    0x0001A8: 7415,
+    0x000317: 7416,
+    0x000318: 7417,
+    0x00030C: 7418,
+    0x000308: 7419,
+    0x000307: 7420,
+    0x000306: 7421,
+    0x0002FC: 4,
+    0x00032A: 7422,
+    0x000325: 7423,
+    0x0002FA: 7424,
+    0x0002FB: 7425,
+    0x0002F6: 7426,
+    0x000223: 7427,
+    0x0002CB: 7428,
+    0x0002CA: 7429,
+    0x0002C4: 7430,
+    0x0002BF: 7431,
+    0x0002E3: 7432,
+    0x0002DD: 7433,
+    0x00034C: 6063,
+    0x000349: 7434,
+    0x00033E: 7435,
+    0x00033C: 7436,
+    0x000272: 7437,
+    0x00026D: 7438,
+    0x00026B: 7439,
+    0x000266: 7440,
+    0x000268: 7441,
+    0x00025E: 7442,
+    0x000260: 7443,
+    0x00012F: 7444,
+    0x000247: 7445,
+    0x000243: 7446,
+    0x000289: 7447,
+    0x000283: 7448,
+    0x000284: 7449,
+    0x000280: 7450,
+    0x009064: 6084,
+    0x00029E: 7451,
+    0x00029B: 7452,
+    0x000293: 7453,
+    0x000231: 7454,
+    0x000234: 7455,
+    0x000236: 7456,
+    0x00022B: 413,
+    0x00027A: 7457,
+    0x000274: 7458,
+    0x000224: 7459,
+    0x00021F: 7460,
+    0x00021A: 7461,
+    0x000222: 7462,
+    0x0002A7: 7463,
+    0x000213: 7464,
+    0x00020A: 7465,
+    0x0001D1: 7466,
+    0x0001B2: 7467,
+    0x0001B8: 7468,
+    0x0001B9: 7469,
+    0x0001BD: 7470,
+    0x0001B3: 7471,
+    0x0001B7: 7472,
+    0x000209: 7473,
+    0x000206: 7474,
+    0x000202: 7475,
+    0x000201: 7476,
+    0x000184: 7477,
+    0x00018E: 7478,
+    0x000179: 7479,
+    0x000160: 7480,
+    0x00014E: 7481,
+    0x0001A4: 7482,
+    0x000195: 7483,
+    0x00017E: 7484,
+    0x000183: 7485,
+    0x0001DB: 7486,
+    0x0001DF: 7487,
+    0x0001CA: 7488,
+    0x0001EF: 7489,
+    0x0001B5: 7490,
+    0x00B0F5: 7491,
+    0x00B0DB: 7492,
+    0x00B0AE: 7493,
+    0x00B0E7: 7494,
+    0x00B08E: 4,
+    0x000118: 7495,
+    0x000128: 7496,
+    0x00011C: 7497,
+    0x00010C: 7498,
+    0x000111: 7499,
+    0x003073: 7500,
+    0x00303F: 7501,
+    0x00016D: 7502,
+    0x00016A: 7503,
+    0x00016F: 7504,
+    0x000170: 7505,
+    0x000135: 7506,
+    0x000141: 7507,
+    0x000146: 7508,
+    0x000149: 7509,
+    0x000165: 7510,
+    0x000156: 7511,
+    0x000153: 7512,
+    0x000114: 7513,
+    0x000107: 7514,
+    0x00010B: 7515,
+    0x00B0DF: 7516,
+    0x000131: 7517,
+    0x00304F: 7518,
+    0x003022: 7519,
+    0x003070: 7520,
+    0x0030F8: 7521,
+    0x0030B3: 7522,
+    0x003009: 7523,
+    0x00307A: 7524,
+    0x003061: 7525,
+    0x003056: 7526,
+    0x0030E7: 7527,
+    0x003043: 7528,
+    0x0030B4: 7529,
+    0x003000: 7530,
+    0x003011: 7531,
+    0x00308F: 7532,
+    0x00309C: 7533,
+    0x00307E: 7534,
+    0x003004: 7535,
+    0x0030F9: 7536,
+    0x003002: 7537,
+    0x003078: 4,
+    0x0030BE: 7538,
+    0x003092: 7539,
+    0x00305C: 7540,
+    0x0030B1: 7541,
+    0x0030E0: 7542,
+    0x003064: 7543,
+    0x003050: 7544,
+    0x0030C0: 7545,
+    0x003005: 7546,
+    0x0030DB: 7547,
+    0x0030C7: 7548,
+    0x0030E4: 7549,
+    0x003066: 7550,
+    0x003031: 7551,
+    0x003060: 7552,
+    0x0030A0: 7553,
+    0x003015: 7554,
+    0x00304B: 7555,
+    0x0030FA: 7556,
+    0x0030A5: 7557,
+    0x003084: 7558,
+    0x0030E9: 7559,
+    0x00D03E: 7560,
+    0x00D093: 7561,
+    0x00D03F: 7562,
+    0x00D0CE: 7563,
+    0x00D0F9: 7564,
+    0x00D0F7: 7565,
+    0x00D003: 7566,
+    0x00D0D2: 7567,
+    0x003068: 7568,
+    0x003091: 7569,
+    0x0030CD: 7570,
+    0x00305B: 7571,
+    0x003029: 7572,
+    0x003083: 7573,
+    0x0030B6: 4,
+    0x00D028: 3091,
+    0x00D025: 7574,
+    0x00D044: 7575,
+    0x00D018: 7576,
+    0x00D007: 7577,
+    0x00D0FF: 4,
+    0x00D077: 7578,
+    0x00D08C: 7579,
+    0x00D059: 7580,
+    0x00D0FD: 7581,
+    0x00D0E6: 7582,
+    0x00D0D1: 7583,
+    0x00D087: 7584,
+    0x00D091: 7585,
+    0x00D080: 7586,
+    0x00D04E: 7587,
+    0x00D027: 7588,
+    0x00D0A9: 7589,
+    0x00D0DD: 7590,
+    0x00D031: 7591,
+    0x00D038: 7592,
+    0x00D0C6: 7593,
+    0x0001A7: 7594,
+    0x00D089: 7595,
+    0x00D072: 7596,
+    0x00D0E2: 7597,
+    0x00D0A6: 7598,
+    0x00D049: 7599,
+    0x00D05B: 7600,
+    0x00D042: 7601,
+    0x00D02C: 7602,
+    0x00D0CD: 7603,
+    0x00D040: 7604,
+    0x00D06F: 7605,
+    0x00D01A: 7606,
+    0x00D06A: 7607,
+    0x00504E: 7608,
+    0x0050D7: 7609,
+    0x0050F6: 7610,
+    0x00506C: 7611,
+    0x005044: 7612,
+    0x00500E: 7613,
+    0x005060: 7614,
+    0x0050EE: 7615,
+    0x0050FF: 7616,
+    0x0050D2: 7617,
+    0x0050F9: 7618,
+    0x005048: 7619,
+    0x00501C: 7620,
+    0x00507A: 7621,
+    0x00504F: 7622,
+    0x00506E: 7623,
+    0x00502C: 7624,
+    0x0050E6: 7625,
+    0x00503C: 7626,
+    0x005033: 7627,
+    0x005045: 7628,
+    0x00502B: 7629,
+    0x00502E: 7630,
+    0x005007: 7631,
+    0x005022: 7632,
+    0x005040: 7633,
+    0x0050C9: 7634,
+    0x005069: 7635,
+    0x005068: 7636,
+    0x00D0CC: 7637,
+    0x005077: 7638,
+    0x0050EC: 7639,
+    0x0050F8: 7640,
+    0x005042: 7641,
+    0x0050C0: 7642,
+    0x005051: 7643,
+    0x0050BB: 7644,
+    0x005062: 7645,
+    0x005097: 7646,
+    0x005010: 7647,
+    0x00509A: 7648,
+    0x0050EB: 7649,
+    0x0050EF: 7650,
+    0x005098: 7651,
+    0x0050BC: 7652,
+    0x009022: 7653,
+    0x009016: 7654,
+    0x0090FF: 7655,
+    0x00903E: 7656,
+    0x0090BA: 7657,
+    0x009018: 7658,
+    0x0050D5: 7659,
+    0x0050F3: 7660,
+    0x0050BE: 7661,
+    0x00506F: 7662,
+    0x00507D: 7663,
+    0x0090B3: 7664,
+    0x00905D: 7665,
+    0x0090D1: 7666,
+    0x009046: 7667,
+    0x0090CD: 7668,
+    0x0090D0: 1944,
+    0x00909B: 7669,
+    0x0090FB: 7670,
+    0x009094: 7671,
+    0x0090DA: 7672,
+    0x0090E0: 7673,
+    0x009071: 7674,
+    0x0090DC: 7675,
+    0x0090E2: 7676,
+    0x0090C7: 7677,
+    0x009035: 7678,
+    0x0090F0: 7679,
+    0x00907A: 7680,
+    0x009020: 7681,
+    0x0010A3: 7682,
+    0x0010AD: 7683,
+    0x0010A7: 7594,
+    0x0010D5: 7684,
+    0x001055: 7685,
+    0x00904F: 7686,
+    0x009060: 7687,
+    0x009013: 7688,
+    0x009085: 7689,
+    0x009053: 7690,
+    0x00903C: 7691,
+    0x009077: 7692,
+    0x009099: 7693,
+    0x009055: 7694,
+    0x00905C: 7695,
+    0x0090E3: 7696,
+    0x0090A9: 7697,
+    0x0090F3: 7698,
+    0x001052: 7699,
+    0x00106B: 7700,
+    0x0010C3: 7701,
+    0x00900F: 7702,
+    0x0090EA: 7703,
+    0x0090A7: 7704,
+    0x001051: 7705,
+    0x001037: 7706,
+    0x00101B: 7707,
+    0x0010DC: 2557,
+    0x00100A: 7708,
+    0x001032: 7709,
+    0x0010F4: 7710,
+    0x001077: 7711,
+    0x0010B3: 7712,
+    0x00107A: 7713,
+    0x00102D: 7714,
+    0x001033: 7715,
+    0x0010DD: 7716,
+    0x001078: 7717,
+    0x001015: 7718,
+    0x0010B9: 7719,
+    0x00105D: 7720,
+    0x001012: 7721,
+    0x001091: 7722,
+    0x001080: 7723,
+    0x00101E: 7724,
+    0x00104D: 7725,
+    0x00E0BB: 7726,
+    0x00E08A: 7727,
+    0x00E086: 7728,
+    0x00E01B: 7729,
+    0x00E07F: 7730,
+    0x00E013: 7731,
+    0x00E0FD: 7732,
+    0x00E0BD: 7733,
+    0x00E0C5: 7734,
+    0x00E0EE: 7735,
+    0x00E08E: 7736,
+    0x00E03F: 7737,
+    0x00E0D4: 7738,
+    0x00E005: 7739,
+    0x00E0C1: 7740,
+    0x00E084: 7741,
+    0x00E06E: 7742,
+    0x00E06D: 7743,
+    0x00607F: 7744,
+    0x00E029: 7745,
+    0x0060A5: 7746,
+    0x00E038: 7747,
+    0x00E09C: 7748,
+    0x00E0E9: 7749,
+    0x00E00C: 7750,
+    0x00E00A: 7751,
+    0x00E0C4: 7752,
+    0x00E096: 7753,
+    0x00E017: 7754,
+    0x0060A1: 7755,
+    0x006027: 7756,
+    0x0060BC: 7757,
+    0x00E015: 7758,
+    0x00E069: 7759,
+    0x00E0A4: 7760,
+    0x00E0DE: 7761,
+    0x00E0EA: 7762,
+    0x00E064: 7763,
+    0x00E0C9: 7764,
+    0x00E0E8: 7765,
+    0x00E016: 7766,
+    0x00E0A5: 7767,
+    0x00E0A9: 4553,
+    0x006029: 7768,
+    0x0060A8: 7769,
+    0x0060D4: 7770,
+    0x0060FC: 7771,
+    0x006018: 7772,
+    0x0060B6: 7773,
+    0x00606C: 7774,
+    0x00602E: 7775,
+    0x006074: 7776,
+    0x006076: 7777,
+    0x006061: 7778,
+    0x0060F9: 7779,
+    0x0060EA: 7780,
+    0x0060E3: 7781,
+    0x006071: 7782,
+    0x0060D9: 7783,
+    0x00601F: 7784,
+    0x00601B: 7785,
+    0x00600A: 7786,
+    0x0060A4: 7787,
+    0x006064: 7788,
+    0x0060C5: 7789,
+    0x0060A9: 7790,
+    0x0060F2: 7791,
+    0x00A07A: 7792,
+    0x00A04E: 7793,
+    0x00A05A: 7794,
+    0x00A052: 7795,
+    0x00A05E: 7796,
+    0x00A095: 7797,
+    0x00A0F2: 7798,
+    0x00A0DF: 7799,
+    0x00A094: 7800,
+    0x006054: 7801,
+    0x0060C2: 7802,
+    0x00609B: 7803,
+    0x0060DB: 7804,
+    0x006052: 7805,
+    0x0060B2: 7806,
+    0x006081: 7807,
+    0x00A005: 7808,
+    0x00A053: 7809,
+    0x00A069: 7810,
+    0x0060C3: 7811,
+    0x006082: 7812,
+    0x0060E7: 7813,
+    0x00A0EF: 7814,
+    0x00A0CE: 7815,
+    0x00A020: 7816,
+    0x00A067: 7817,
+    0x00A0E0: 7818,
+    0x00A099: 7819,
+    0x00A0EC: 7820,
+    0x00A0AB: 7821,
+    0x00A0D8: 7822,
+    0x00A080: 3703,
+    0x00A02B: 7823,
+    0x00A0E8: 7824,
+    0x00A008: 7825,
+    0x00A0C3: 7826,
+    0x00A00A: 7827,
+    0x00A0E7: 7828,
+    0x00A0FA: 7829,
+    0x00A0CB: 7830,
+    0x00A050: 7831,
+    0x00A0DD: 7832,
+    0x00A028: 7833,
+    0x00A09E: 7834,
+    0x00A0FD: 7835,
+    0x00A00F: 7836,
+    0x00A002: 7837,
+    0x00A0E4: 7838,
+    0x00A0EE: 7839,
+    0x00A066: 7840,
+    0x00A034: 7841,
+    0x00A001: 7842,
+    0x00A075: 7843,
+    0x00A009: 7844,
+    0x002023: 7845,
+    0x0020B2: 7846,
+    0x002052: 7847,
+    0x0020FE: 7848,
+    0x002073: 7849,
+    0x002035: 2034,
+    0x00207A: 7850,
+    0x00203E: 7851,
+    0x002058: 7852,
+    0x00205A: 7853,
+    0x002000: 617,
+    0x00201D: 7854,
+    0x00A00C: 7855,
+    0x00A0BB: 7856,
+    0x00A091: 7857,
+    0x00A0A5: 7858,
+    0x00A017: 7859,
+    0x00A025: 7860,
+    0x00A0A2: 7861,
+    0x0020B7: 7862,
+    0x0020E3: 7863,
+    0x002013: 7864,
+    0x0020AB: 7865,
+    0x00208D: 7866,
+    0x0020DD: 7867,
+    0x0020E6: 7868,
+    0x002086: 7869,
+    0x002046: 7870,
+    0x002026: 7871,
+    0x00A054: 13,
+    0x00208E: 7872,
+    0x00209B: 7873,
+    0x00201C: 7874,
+    0x00207F: 7875,
+    0x002008: 7876,
+    0x00C00B: 7877,
+    0x0020B0: 7878,
+    0x00205B: 7879,
+    0x002065: 7880,
+    0x002019: 7881,
+    0x00209E: 7882,
+    0x00202A: 7883,
+    0x002083: 7884,
+    0x0020D3: 7885,
+    0x0020F6: 7886,
+    0x0020C9: 7887,
+    0x002077: 7888,
+    0x002097: 7889,
+    0x0020C6: 7890,
+    0x00C048: 7891,
+    0x00C00E: 7892,
+    0x00C031: 7893,
+    0x000701: 7894,
+    0x00C09C: 3539,
+    0x00C097: 7895,
+    0x00C004: 7896,
+    0x00C02D: 7897,
+    0x00C0BD: 7898,
+    0x00C088: 7899,
+    0x00C0FD: 7900,
+    0x00C076: 7901,
+    0x00C046: 7902,
+    0x00C014: 7903,
+    0x00AA3C: 7904,
+    0x00C011: 7905,
+    0x00C03E: 7906,
+    0x00C0AA: 7907,
+    0x00C066: 7908,
+    0x00C060: 7909,
+    0x00C0C9: 7910,
+    0x00C054: 7911,
+    0x00C022: 7912,
+    0x00C025: 7913,
+    0x00C0DF: 7914,
+    0x00C0F5: 7915,
+    0x00C091: 7916,
+    0x00C049: 7917,
+    0x00C09D: 7918,
+    0x00407B: 7919,
+    0x00402C: 7920,
+    0x0040CC: 7921,
+    0x00C09E: 7922,
+    0x00C0AC: 7923,
+    0x00C034: 7924,
+    0x00C093: 7925,
+    0x0040CF: 7926,
+    0x004077: 7927,
+    0x0040E7: 7928,
+    0x004087: 7929,
+    0x004007: 7930,
+    0x00C0E9: 7931,
+    0x00C0C5: 7932,
+    0x00C051: 7933,
+    0x00C085: 7934,
+    0x00C0B2: 7935,
+    0x00C02C: 7936,
+    0x00C02B: 7937,
+    0x004073: 7938,
+    0x00407D: 7939,
+    0x00404D: 7940,
+    0x00400D: 7941,
+    0x004019: 7942,
+    0x0040BE: 7943,
+    0x00406E: 7944,
+    0x00C0FB: 7945,
+    0x00405B: 7946,
+    0x00408B: 7947,
+    0x0040EF: 7948,
+    0x004093: 7949,
+    0x004085: 7950,
+    0x004023: 7951,
+    0x0040A4: 7952,
+    0x004022: 7953,
+    0x004074: 7954,
+    0x0040B8: 7955,
+    0x0040E8: 7956,
+    0x0040C0: 7957,
+    0x00405D: 7958,
+    0x004008: 7959,
+    0x0040B5: 7960,
+    0x004012: 7961,
+    0x0040D5: 7962,
+    0x0080D7: 7963,
+    0x00807A: 7964,
+    0x0080DC: 7965,
+    0x00C0A0: 7966,
+    0x00C010: 7967,
+    0x0040BF: 7968,
+    0x00401E: 7969,
+    0x00409A: 7970,
+    0x004094: 7971,
+    0x004055: 7972,
+    0x0040E2: 7973,
+    0x0040C4: 7974,
+    0x00C037: 7975,
+    0x004083: 7976,
+    0x004027: 7977,
+    0x004045: 7978,
+    0x004076: 7979,
+    0x0040F0: 7980,
+    0x004089: 7981,
+    0x004028: 7788,
+    0x0040CB: 7982,
+    0x0040B2: 7983,
+    0x0040E6: 7984,
+    0x00801C: 7985,
+    0x008095: 7986,
+    0x0080AE: 7987,
+    0x004010: 7988,
+    0x0040CA: 7989,
+    0x008031: 7990,
+    0x00803A: 7991,
+    0x004015: 7992,
+    0x008056: 7993,
+    0x008013: 7994,
+    0x00806E: 7995,
+    0x008010: 7996,
+    0x0080D5: 7997,
+    0x00801B: 7998,
+    0x0080D3: 7999,
+    0x0080B3: 8000,
+    0x0080A1: 8001,
+    0x008082: 8002,
+    0x008039: 8003,
+    0x008023: 8004,
+    0x00806B: 8005,
+    0x008059: 8006,
+    0x00802B: 8007,
+    0x008001: 8008,
+    0x008097: 8009,
+    0x008088: 8010,
+    0x0080D8: 8011,
+    0x00809E: 8012,
+    0x008041: 8013,
+    0x008080: 8014,
+    0x008098: 8015,
+    0x00803F: 8016,
+    0x0080E6: 8017,
+    0x0080E0: 8018,
+    0x0080DB: 8019,
+    0x0080CA: 8020,
+    0x008071: 8021,
+    0x008020: 8022,
+    0x008070: 8023,
+    0x008008: 8024,
+    0x0000E4: 8025,
+    0x000094: 8026,
+    0x000090: 8027,
+    0x0000B6: 8028,
+    0x000082: 8029,
+    0x00002B: 8030,
+    0x000014: 8031,
+    0x000072: 8032,
+    0x0000A1: 8033,
+    0x0000F5: 8034,
+    0x008047: 8035,
+    0x008067: 8036,
+    0x008045: 8037,
+    0x0080BF: 8038,
+    0x008017: 8039,
+    0x0080F8: 8040,
+    0x000051: 8041,
+    0x0000A7: 8042,
+    0x000026: 8043,
+    0x0080A9: 8044,
+    0x0080F9: 8045,
+    0x000047: 8046,
+    0x000070: 8047,
+    0x00008F: 8048,
+    0x000045: 8049,
+    0x00009C: 8050,
+    0x00007C: 8051,
+    0x000068: 8052,
+    0x000046: 8053,
+    0x00008D: 8054,
+    0x00003B: 8055,
+    0x000021: 8056,
+    0x000074: 8057,
+    0x00005C: 8058,
+    0x0000AC: 8059,
+    0x0000F1: 8060,
+    0x000054: 4266,
+    0x000020: 8061,
+    0x00007A: 8062,
+    0x000098: 8063,
+    0x0000C6: 8064,
+    0x00008B: 8065,
+    0x000030: 8066,
+    0x000035: 8067,
+    0x0000E9: 8068,
+    0x00009F: 8069,
+    0x0000E3: 8070,
+    0x0000AD: 8071,
+    0x0000D3: 8072,
+    0x0000D0: 8073,
+    0x000093: 8074,
+    0x080067: 8075,
+    0x08005D: 8076,
+    0x08005B: 8077,
+    0x080057: 8078,
+    0x080071: 8079,
+    0x08006C: 8080,
+    0x0000B3: 8081,
+    0x08002D: 8082,
+    0x08008C: 8083,
+    0x080081: 8084,
+    0x00DD00: 4168,
+    0x0000AA: 4167,
+    0x100000: 13,
+    0x080011: 8085,
+    0x08001D: 8086,
+    0x00DD0B: 4168,
+    0xAA0004: 4158,
+    0x08000C: 8087,
+    0x00DD05: 4168,
+    0x080003: 8088,
+    0x00DD0F: 4168,
+    0x000001: 4167,
+    0x00DD03: 4168,
+    0x0000D7: 8089,
+    0x080017: 8090,
+    0x040AE0: 8091,
+    0x080026: 8092,
+    0x080025: 8093,
+    0x48D017: 8094,
+    0xF809A4: 8095,
+    0xA842A1: 94,
+    0x9CF55F: 174,
+    0x902C09: 49,
+    0xA0B40F: 49,
+    0x807C0A: 11,
+    0xEC0D51: 49,
+    0xACDFA1: 49,
+    0xC05F87: 8096,
+    0x685210: 8097,
+    0xC8CCB5: 6060,
+    0x14DAB9: 117,
+    0xB0CAE7: 117,
+    0xA87C45: 15,
+    0x2CEDB0: 15,
+    0x2C693E: 15,
+    0xDC621F: 15,
+    0x48836F: 38,
+    0xF4832C: 373,
+    0x48EDE6: 112,
+    0xA410B6: 4,
+    0xC84709: 4,
+    0x3C25F8: 110,
+    0x000324: 8098,
+    0x70BDD2: 8099,
+    0xD00B27: 102,
+    0x4C5739: 90,
+    0x48E533: 276,
+    0xF0FDDD: 8100,
+    0x00D598: 8101,
+    0x904528: 35,
+    0xF45246: 234,
+    0x6C1629: 4229,
+    0xF037CF: 117,
+    0x2CC8F5: 117,
+    0xAC361B: 8102,
+    0xD8132A: 14,
+    0x9C1ECE: 8103,
+    0xB8060D: 220,
+    0x001F9C: 8104,
+    0xC8E193: 163,
+    0xD4A23D: 21,
+    0x28CB5C: 8105,
+    0xD05BCB: 4551,
+    0xBC9A8E: 8106,
+    0x502065: 116,
+    0x102CB1: 4915,
+    0xFC478D: 8107,
+    0x806599: 14,
+    0x04AEC7: 8108,
+    0xE4F8BE: 231,
+    0x00C0F2: 4194,
+    0xE4AAE4: 40,
+    0x68C44C: 40,
+    0xA0004C: 349,
+    0xD8E593: 49,
+    0xCC68E0: 49,
+    0x70DA48: 4,
+    0xF4B62D: 8109,
+    0x20108A: 11,
+    0x58FFA1: 11,
+    0xB08B9E: 191,
+    0xBC1FE1: 8110,
+    0xACDB22: 8111,
+    0xB8B1EA: 22,
+    0x2C58B9: 19,
+    0x3050F1: 8112,
+    0xB0FA91: 38,
+    0xD4F921: 247,
+    0xE47A2C: 4200,
+    0x60601F: 4200,
+    0x488002: 4,
+    0xB46AD4: 26,
+    0xAC712E: 41,
+    0xCCD843: 166,
+    0xC03532: 192,
+    0x740635: 165,
+    0xF801B4: 244,
+    0x5421A9: 163,
+    0x7CC0AA: 157,
+    0x94AB18: 8113,
+    0x1073C6: 8114,
+    0xF03F03: 13,
+    0xC421B9: 11,
+    0xBCB2CC: 90,
+    0x08A5DF: 90,
+    0x6CD63F: 15,
+    0x0C184E: 15,
+    0xD4F7D5: 141,
+    0x98288B: 8115,
+    0xE0E8E6: 4206,
+    0x6C1FF7: 8116,
+    0x045EA4: 8117,
+    0x64EEB7: 8117,
+    0x048D38: 8117,
+    0xE82587: 8118,
+    0x507B91: 8119,
+    0x8C44A5: 4,
+    0x08E342: 8120,
+    0xA0E025: 8121,
+    0xF4FE3E: 49,
+    0x1455B9: 181,
+    0x9C2472: 3,
+    0xF439A6: 49,
+    0xFC5557: 49,
+    0x342B6E: 49,
+    0x606525: 49,
+    0x8C5570: 12,
+    0x205A1D: 11,
+    0x8C0879: 53,
+    0x6823B0: 53,
+    0x78CD55: 53,
+    0xF8F519: 8122,
+    0x808544: 1305,
+    0x24698E: 4210,
+    0x640DCE: 4210,
+    0x6C5CB1: 238,
+    0x5CC7C1: 238,
+    0x60B647: 238,
+    0xA46DD4: 238,
+    0x0CAE5F: 238,
+    0x28DBA7: 238,
+    0x583BC2: 238,
+    0x3425B4: 238,
+    0x006005: 8123,
+    0x4CB7E0: 4210,
+    0xBC0FB7: 8124,
+    0x601D56: 1,
+    0x9CF1D4: 58,
+    0x00408C: 600,
+    0x00CAE0: 69,
+    0x44D465: 8125,
+    0x54606D: 15,
+    0xA486DB: 8126,
+    0x9C63C0: 270,
+    0x5C2573: 270,
+    0xD4F04A: 319,
+    0xACBAC0: 8127,
+    0x1C7ACF: 146,
+    0xA86A86: 40,
+    0x3C450B: 8128,
+    0x70D51E: 5,
+    0xB87E39: 78,
+    0x646772: 4323,
+    0x54ECB0: 387,
+    0xDCDA4D: 211,
+    0x505E24: 11,
+    0x84BA59: 8129,
+    0x1090FA: 21,
+    0x7473E2: 8130,
+    0xD401C3: 439,
+    0x74077E: 116,
+    0x30EC7C: 8131,
+    0x382656: 162,
+    0x54C6A6: 8132,
+    0xB09E1B: 8133,
+    0x14A1DF: 29,
+    0xD0A011: 12,
+    0xB0B369: 170,
+    0xA8CFE0: 8134,
+    0xD0B3C2: 4359,
+    0xD8F760: 38,
+    0x40B82D: 272,
+    0x005092: 8135,
+    0xB47748: 4231,
+    0xC43EAB: 117,
+    0xCC4460: 117,
+    0x24506F: 8136,
+    0x34EA10: 8137,
+    0x6C92CF: 293,
+    0xF43149: 8138,
+    0x78E996: 12,
+    0x3C3576: 163,
+    0xA021AA: 29,
+    0xF42015: 257,
+    0x90212E: 8139,
+    0x50D448: 13,
+    0x1C7A43: 146,
+    0x084473: 11,
+    0x943589: 15,
+    0x94261D: 15,
+    0xA45C25: 53,
+    0x98F487: 53,
+    0xFC599F: 138,
+    0x84A329: 48,
+    0x9C098B: 4,
+    0x9C5884: 49,
+    0x24B339: 49,
+    0xE04E7A: 4362,
+    0xD07602: 31,
+    0x94BDBE: 8140,
+    0x940BFA: 38,
+    0x84821B: 8141,
+    0x80A579: 12,
+    0x6CEFBD: 20,
+    0x743989: 86,
+    0x283984: 8142,
+    0x5CFA5A: 8143,
+    0xF49D8A: 8144,
+    0x7C992E: 8145,
+    0x8CEA88: 8146,
+    0x105FAD: 25,
+    0x4CB04A: 25,
+    0x40EEBE: 175,
+    0xFC9816: 159,
+    0xE08F4C: 25,
+    0x54726E: 8147,
+    0x88659F: 5,
+    0x3C0A7A: 90,
+    0x2424B7: 90,
+    0xF0051B: 90,
+    0xBCA080: 90,
+    0x002B70: 90,
+    0xC44606: 4,
+    0x487410: 4,
+    0xB436A9: 4664,
+    0x942770: 1553,
+    0xAC1EA9: 1305,
+    0x80E94A: 8148,
+    0x20185B: 8149,
+    0x58FE7E: 11,
+    0x34194D: 48,
+    0x9C5A80: 28,
+    0x6C80AB: 8150,
+    0x588670: 28,
+    0x7C0CFA: 15,
+    0x3483D5: 15,
+    0xC40826: 349,
+    0x2817CB: 8151,
+    0x7C5E98: 63,
+    0xC8586A: 8152,
+    0x1C64F0: 78,
+    0x74BEF3: 78,
+    0xAC8866: 107,
+    0x5C4842: 8153,
+    0x8CC9E9: 117,
+    0xD854F2: 117,
+    0xE454E5: 117,
+    0x886BDB: 49,
+    0x1435B7: 49,
+    0x7CC025: 95,
+    0xC4AB4D: 4,
+    0x10E376: 4,
+    0xF45293: 49,
+    0x942157: 49,
+    0x9C9E6E: 14,
+    0x74C17E: 244,
+    0xB4174D: 8154,
+    0x644842: 49,
+    0x109819: 110,
+    0xFC915D: 210,
+    0xCCB777: 11,
+    0x3089A6: 15,
+    0x60F419: 63,
+    0xDC9272: 3,
+    0x180C7A: 3,
+    0xF84D8B: 8155,
+    0x1CE89E: 8156,
+    0xACA31E: 4252,
+    0xD06726: 4251,
+    0xEC9B8B: 4251,
+    0x089734: 4251,
+    0xB0B867: 4251,
+    0x8030E0: 4251,
+    0x004E35: 4251,
+    0xB45D50: 4252,
+    0x40E3D6: 4252,
+    0x00FD45: 4251,
+    0xC8B5AD: 4251,
+    0x5CBA2C: 4251,
+    0x5CED8C: 4251,
+    0x9020C2: 4252,
+    0x94F128: 4251,
+    0x0CC3B8: 8157,
+    0xEC6794: 4252,
+    0xA025D7: 4252,
+    0x988F00: 4252,
+    0xA40E75: 4252,
+    0x38BD7A: 4252,
+    0xE81098: 4252,
+    0x445BED: 4252,
+    0xA85BF7: 4252,
+    0xECFCC6: 4252,
+    0x64E881: 4252,
+    0xEC3BAF: 38,
+    0x5C241F: 780,
+    0x48E2AD: 8106,
+    0x5038AB: 8158,
+    0xAC8EBD: 157,
+    0xACFAE4: 35,
+    0x98B71E: 444,
+    0x782E03: 651,
+    0x4438E8: 25,
+    0x7829AD: 8159,
+    0x381B9E: 247,
+    0x64078C: 15,
+    0x480234: 15,
+    0xE8DF24: 373,
+    0x7CBAC6: 8160,
+    0x0401A1: 41,
+    0xD056FB: 90,
+    0xC07AD6: 90,
+    0x5C15C5: 8161,
+    0x28AF21: 11,
+    0x0C323A: 90,
+    0x000295: 8162,
+    0xF87A39: 12,
+    0x78E61C: 22,
+    0x04137A: 49,
+    0x70F94A: 49,
+    0x90B790: 49,
+    0x044707: 53,
+    0x945044: 53,
+    0xC8844E: 8163,
+    0x78EE4C: 14,
+    0xF49ECE: 8164,
+    0x34105D: 53,
+    0xF0D635: 49,
+    0x9CDBCB: 5120,
+    0x382CE5: 220,
+    0x847848: 131,
+    0xC418FC: 4,
+    0xEC5BCD: 12,
+    0xCC96A2: 29,
+    0x543D60: 48,
+    0x6C1D2C: 15,
+    0x20C2B0: 15,
+    0xC05234: 15,
+    0xB0C2C7: 78,
+    0x648B9B: 8165,
+    0x382835: 11,
+    0x68BF6C: 89,
+    0x74A5C2: 338,
+    0x741213: 8166,
+    0x343D7F: 8167,
+    0x38DE35: 8168,
+    0x94B3F7: 31,
+    0xA00A9A: 117,
+    0x1C83EC: 8169,
+    0x280708: 90,
+    0x581F19: 4274,
+    0x08DA33: 12,
+    0xB8B4C9: 20,
+    0xC01C6A: 210,
+    0x8C1ECF: 4293,
+    0x7C3E82: 47,
+    0xF024F9: 14,
+    0xF8160C: 73,
+    0x68CCBA: 8170,
+    0x4C6BB8: 31,
+    0x0056F1: 11,
+    0x744218: 49,
+    0x904CC5: 49,
+    0xEC4654: 49,
+    0x5405DB: 4278,
+    0x50F351: 49,
+    0x202DF6: 49,
+    0x545B86: 91,
+    0xC4EFBB: 4278,
+    0x84A938: 4278,
+    0xFC5CEE: 4278,
+    0x40F4C9: 4186,
+    0x38A5C9: 220,
+    0xF8172D: 220,
+    0x8C5C20: 52,
+    0x987596: 38,
+    0x00A159: 244,
+    0x4C22C9: 11,
+    0xC41375: 195,
+    0x8CBFEA: 14,
+    0xB41DC4: 15,
+    0x105F02: 138,
+    0x2824C9: 77,
+    0xCC6C52: 123,
+    0x341736: 73,
+    0x1C627E: 15,
+    0x6056B1: 15,
+    0x5000E0: 4,
+    0x74E2E7: 4,
+    0xC4600A: 4243,
+    0x147E19: 4252,
+    0x3806E6: 48,
+    0x1074C5: 218,
+    0xBCCD7F: 117,
+    0x742869: 117,
+    0x44896D: 351,
+    0xE451A9: 8171,
+    0x00F8CC: 3,
+    0x145A41: 195,
+    0xAC45CA: 69,
+    0xD0C1B5: 110,
+    0x8876B9: 1167,
+    0xECE78E: 8172,
+    0xC48B66: 31,
+    0x14E289: 8173,
+    0x502FBB: 78,
+    0x6C0B5E: 19,
+    0x2C195C: 166,
+    0x50695A: 8174,
+    0xC463C4: 15,
+    0x54A245: 8175,
+    0x90A196: 13,
+    0x1435B3: 8176,
+    0xFCD96B: 194,
+    0x0C1BCC: 433,
+    0x68E580: 49,
+    0x58666D: 49,
+    0xDC9E8F: 49,
+    0xE0C29E: 11,
+    0xB496A5: 49,
+    0x3809FB: 49,
+    0x60B02B: 780,
+    0x4C5D6A: 49,
+    0x306893: 8177,
+    0xFC1928: 4302,
+    0xD4C9B2: 8178,
+    0x6C8720: 21,
+    0x0C8D7A: 8179,
+    0xFCA9F5: 40,
+    0x6C0370: 1,
+    0x7896A3: 1,
+    0xDCE650: 1,
+    0x241FBD: 1,
+    0xE444E5: 1,
+    0x40882F: 1,
+    0x4018B1: 1,
+    0x206C8A: 1,
+    0x885BDD: 1,
+    0x348584: 1,
+    0x949B2C: 1,
+    0xA4EA8E: 1,
+    0xB85001: 1,
+    0x14144B: 138,
+    0x0004A5: 8180,
+    0xACED32: 1,
+    0x00E60E: 1,
+    0x44D980: 8181,
+    0x0016E6: 538,
+    0xD0DC2C: 4,
+    0xF83C44: 8182,
+    0x2015DE: 90,
+    0x18523D: 8183,
+    0xD843EA: 8184,
+    0xD09168: 407,
+    0xD4A38B: 8185,
+    0x5413CA: 163,
+    0x10E83A: 8186,
+    0xE8C829: 25,
+    0xE04C05: 8187,
+    0x58687A: 3,
+    0x80482C: 342,
+    0x885EBD: 8188,
+    0x1C6066: 8189,
+    0x9C891E: 8190,
+    0xD0F405: 589,
+    0x58A2E1: 270,
+    0xB0CF0E: 270,
+    0x8809AF: 24,
+    0xB04AB4: 78,
+    0xC414A2: 20,
+    0x64E738: 8191,
+    0x5C7DF3: 5,
+    0xEC0482: 8192,
+    0xE88DA6: 116,
+    0x3C0AF3: 195,
+    0xCCE9FA: 90,
+    0x6466D8: 90,
+    0x489A5B: 73,
+    0x9C9613: 8193,
+    0xDCF51B: 48,
+    0x087B87: 4,
+    0x000CEC: 8194,
+    0x58D312: 11,
+    0xD8097F: 11,
+    0x848687: 8195,
+    0x00E63A: 272,
+    0x44E761: 444,
+    0x6C68A4: 4270,
+    0x44B59C: 8196,
+    0xA436C7: 285,
+    0x38F6ED: 8197,
+    0xD82D40: 8198,
+    0x003969: 8199,
+    0xC07C90: 574,
+    0x94F929: 4359,
+    0xB8C065: 638,
+    0x2091DF: 49,
+    0xA89C78: 49,
+    0x7C6130: 49,
+    0x80B989: 49,
+    0xC4524F: 49,
+    0x603E5F: 49,
+    0xD0CEC9: 8200,
+    0xA4BD7E: 145,
+    0x68DA73: 12,
+    0x8CD08B: 8201,
+    0x4432C8: 52,
+    0x08952A: 52,
+    0xFC528D: 52,
+    0x6C55E8: 52,
+    0x889E68: 52,
+    0xF85E42: 52,
+    0xEC937D: 52,
+    0x7C9A54: 52,
+    0xE03717: 52,
+    0x905851: 52,
+    0x087E64: 52,
+    0x1033BF: 52,
+    0x00651E: 8202,
+    0x087073: 15,
+    0x28BE9B: 52,
+    0xD05A00: 52,
+    0x3C9A77: 52,
+    0xD4E2CB: 52,
+    0x5C22DA: 52,
+    0xFCC233: 398,
+    0x00EE01: 8203,
+    0x80F0CF: 272,
+    0x68DECE: 5,
+    0xFCB467: 14,
+    0xD8BC38: 14,
+    0x38315A: 8204,
+    0x3C19CB: 231,
+    0xFCFA21: 11,
+    0xD07CB2: 8119,
+    0x0438DC: 8205,
+    0xDCBDCC: 116,
+    0xA800E3: 8206,
+    0xB096EA: 167,
+    0x64009C: 8207,
+    0x605699: 8208,
+    0xA82C3E: 448,
+    0xD0F928: 11,
+    0x38922E: 8209,
+    0x186A81: 3,
+    0xA07F8A: 3,
+    0x2C9975: 90,
+    0xB0F00C: 8210,
+    0xA8FB40: 181,
+    0xA8E539: 55,
+    0xA8584E: 8211,
+    0xC47EE0: 4,
+    0x1091D1: 25,
+    0x6C4CE2: 25,
+    0x1C7C98: 404,
+    0x00E04D: 8212,
+    0x743AEF: 74,
+    0xF854F6: 43,
+    0x087458: 5,
+    0xC482E1: 220,
+    0x24E4CE: 74,
+    0xF0C558: 8213,
+    0x60C9AA: 81,
+    0xE068EE: 84,
+    0x6879DD: 8214,
+    0x48062B: 13,
+    0xE87640: 319,
+    0x743357: 146,
+    0xAC00F9: 8215,
+    0x681A7C: 135,
+    0x00181C: 1099,
+    0x989F1E: 15,
+    0x944788: 15,
+    0x5412CB: 15,
+    0x98FBF5: 8216,
+    0x90395F: 77,
+    0x301D49: 8217,
+    0x401482: 4,
+    0x800794: 90,
+    0xF43C3B: 332,
+    0x74D7CA: 91,
+    0xD4B680: 8218,
+    0xC81337: 28,
+    0xAC416A: 77,
+    0x8CEEFD: 11,
+    0xC04943: 11,
+    0x58CDC9: 195,
+    0xBCF499: 120,
+    0x903C1D: 349,
+    0x246C84: 4,
+    0x90EB50: 4,
+    0x609532: 6,
+    0xD4E95E: 53,
+    0x1015C1: 8219,
+    0x8CF3E7: 8220,
+    0x90A7BF: 38,
+    0x80EE25: 107,
+    0x1055E4: 107,
+    0x28EF01: 77,
+    0xD452C7: 8221,
+    0x8488E1: 49,
+    0x10BD3A: 49,
+    0x184A53: 49,
+    0x109F41: 49,
+    0x7072FE: 49,
+    0x2CC253: 49,
+    0xB0FB15: 4449,
+    0x80C45D: 8222,
+    0x68F63B: 77,
+    0x6885A4: 69,
+    0x24E8E5: 107,
+    0x04AB08: 107,
+    0xE8D52B: 210,
+    0xCC3ADF: 8223,
+    0x68EC8A: 8224,
+    0x111111: 13,
+    0xB456FA: 8225,
+    0xE8F8D0: 0,
+    0x408E2C: 157,
+    0x04CE09: 107,
+    0x40679B: 107,
+    0xC068CC: 107,
+    0x28BEF3: 287,
+    0xE0CB19: 81,
+    0x848F69: 110,
+    0x549F35: 110,
+    0x845A3E: 4,
+    0xB0216F: 15,
+    0x94DF34: 15,
+    0x7430AF: 5,
+    0xA44CC8: 110,
+    0xE4F004: 110,
+    0x20040F: 110,
+    0xD4BED9: 110,
+    0xECF4BB: 110,
+    0xB8CA3A: 110,
+    0xB82A72: 110,
+    0xBC305B: 110,
+    0x000D56: 110,
+    0x001D09: 110,
+    0x0023AE: 110,
+    0x14C35E: 4585,
+    0x880894: 473,
+    0x902AEE: 40,
+    0x40FAFE: 78,
+    0x201C3A: 35,
+    0x249038: 8226,
+    0xF8EDAE: 8227,
+    0xD8478F: 72,
+    0x3C0CDB: 4355,
+    0xF4D9C6: 4355,
+    0x94988F: 3,
+    0xF07B65: 3,
+    0xC025A5: 110,
+    0xE8B5D0: 110,
+    0x089204: 110,
+    0x70B5E8: 110,
+    0xB8CB29: 110,
+    0x34735A: 110,
+    0x8CEC4B: 110,
+    0x544810: 110,
+    0xA89969: 110,
+    0xF40270: 110,
+    0x3448ED: 110,
+    0xA8C56F: 69,
+    0xAC7A94: 69,
+    0x04DA28: 8228,
+    0x0C014B: 11,
+    0x74D6E5: 117,
+    0x5C2167: 120,
+    0x20F597: 8229,
+    0x988CB3: 135,
+    0xD8E35E: 285,
+    0x786829: 63,
+    0x14A417: 8230,
+    0x60489C: 8231,
+    0x34AFA3: 8232,
+    0xDC9EAB: 8233,
+    0x4891D5: 4,
+    0x6C8F4E: 8233,
+    0xE01FFC: 443,
+    0xCC4740: 43,
+    0x001491: 8234,
+    0x200BC5: 4,
+    0x90E95E: 4,
+    0x2857BE: 54,
+    0x5850ED: 54,
+    0x1012FB: 54,
+    0x4CF5DC: 54,
+    0x988B0A: 54,
+    0x807C62: 54,
+    0xBC9B5E: 54,
+    0x2029B9: 8235,
+    0x304F75: 123,
+    0xD096FB: 123,
+    0x000147: 123,
+    0x000271: 123,
+    0x1868CB: 54,
+    0xBCBAC2: 54,
+    0xACCB51: 54,
+    0x9C65FA: 8236,
+    0x882508: 4359,
+    0x80BEAF: 54,
+    0x040312: 54,
+    0x4881D4: 138,
+    0x9C84B6: 73,
+    0x34CA81: 4400,
+    0x280C2D: 8237,
+    0x8867DC: 15,
+    0xC4678B: 8238,
+    0x60F04D: 22,
+    0x5C628B: 94,
+    0xD43A2F: 5051,
+    0x60030C: 574,
+    0x40410D: 15,
+    0x5C8B6B: 77,
+    0xC0613D: 8239,
+    0x0418D6: 131,
+    0x24A43C: 131,
+    0x0019E2: 28,
+    0x002688: 28,
+    0x841888: 28,
+    0xC82B6B: 4557,
+    0x1814AE: 81,
+    0x44D9E7: 131,
+    0xD021F9: 131,
+    0x70A741: 131,
+    0xB0A86E: 28,
+    0x0881F4: 28,
+    0xE4BCAA: 40,
+    0x545DD9: 8240,
+    0x404CCA: 14,
+    0x307C5E: 28,
+    0xF01C2D: 28,
+    0x64649B: 28,
+    0x009069: 28,
+    0x80ACAC: 28,
+    0x0C8610: 28,
+    0x544B8C: 28,
+    0x2C2131: 28,
+    0x9CCC83: 28,
+    0x44AA50: 28,
+    0xE8B6C2: 28,
+    0xC409B7: 28,
+    0x74E798: 28,
+    0x487310: 28,
+    0xE4FC82: 28,
+    0xB8C253: 28,
+    0x14B3A1: 28,
+    0xD4996C: 28,
+    0x045C6C: 28,
+    0x40DEAD: 28,
+    0x0C599C: 28,
+    0x9CD1D0: 8241,
+    0x3C792B: 8242,
+    0x000E51: 8243,
+    0xC0C70A: 272,
+    0x001616: 8244,
+    0xB461E9: 33,
+    0x64E204: 8245,
+    0x2C9811: 195,
+    0x90D689: 8246,
+    0xC08B2A: 4,
+    0x2CCA75: 8247,
+    0xCCD81F: 8248,
+    0xE0D8C4: 247,
+    0x38141B: 8249,
+    0xBC9E2C: 29,
+    0x88C6E8: 15,
+    0x707CE3: 15,
+    0x3C6F9B: 11,
+    0x5C9462: 5861,
+    0x386F6B: 69,
+    0x541149: 146,
+    0x9052BF: 135,
+    0x881E59: 8250,
+    0x2C002A: 423,
+    0xFC9CA7: 49,
+    0x48E15C: 49,
+    0x7415F5: 49,
+    0x48A98A: 439,
+    0xE88843: 40,
+    0x28022E: 49,
+    0xACFC82: 4493,
+    0x705A6F: 12,
+    0xDCA313: 8251,
+    0x182654: 90,
+    0x1C6760: 8252,
+    0x043201: 293,
+    0x7C1779: 38,
+    0xB04B68: 958,
+    0xF86B14: 8253,
+    0x704698: 15,
+    0x78084D: 15,
+    0xECAA8F: 15,
+    0x689A21: 5,
+    0x38396C: 117,
+    0x5066E5: 117,
+    0xDC7794: 117,
+    0xD8341C: 167,
+    0x00187F: 8254,
+    0xCCF826: 90,
+    0x70B651: 8255,
+    0x90CEB8: 53,
+    0xB4BC7C: 53,
+    0xF88A5E: 53,
+    0xF4331C: 8256,
+    0x5451DE: 4,
+    0x4C0617: 278,
+    0xD49AF6: 43,
+    0xAC81F3: 882,
+    0x606E41: 8253,
+    0x2C1809: 49,
+    0xFC47D8: 49,
+    0xE49D73: 87,
+    0x44EB2E: 159,
+    0x047F0E: 8253,
+    0xD40145: 8257,
+    0xA8F8C9: 175,
+    0x94720F: 8258,
+    0x646876: 4229,
+    0x7C646C: 244,
+    0x48C1EE: 22,
+    0x88948E: 8259,
+    0xDCB347: 989,
+    0x60292B: 86,
+    0xA486AE: 116,
+    0x58D391: 116,
+    0x0024AC: 8260,
+    0xCC087B: 15,
+    0x5C64F3: 8124,
+    0x28E424: 21,
+    0x50804A: 116,
+    0x601521: 8261,
+    0xE426D5: 78,
+    0xFC3FA6: 63,
+    0xE04B41: 8262,
+    0x8C8E0D: 11,
+    0x9C8824: 8263,
+    0x5C2FAF: 8264,
+    0x704777: 272,
+    0x00068F: 8265,
+    0x040067: 8266,
+    0x7830F5: 8267,
+    0x88AF7B: 8268,
+    0xC47B80: 8269,
+    0x00090F: 41,
+    0x000CE6: 41,
+    0xA024F9: 8270,
+    0xE0B98A: 8271,
+    0xA8EE6D: 8272,
+    0x54C6FF: 21,
+    0xF4E975: 21,
+    0xD4D4DA: 14,
+    0x386407: 247,
+    0x1C63A5: 8273,
+    0xC4E5B1: 8274,
+    0xACC4A9: 5,
+    0x7C949F: 73,
+    0x3C2CA6: 4197,
+    0x34F223: 8275,
+    0x280AEE: 232,
+    0x70AED5: 49,
+    0x4C22F3: 48,
+    0x200C86: 4295,
+    0x88B86F: 444,
+    0xC4EB43: 3,
+    0xC4EB41: 3,
+    0x743E39: 8276,
+    0x4C74A7: 12,
+    0xB8D4BC: 11,
+    0x385319: 8277,
+    0x846082: 8278,
+    0xF04F7C: 77,
+    0xF0A225: 77,
+    0xD43A2C: 210,
+    0xE8AACB: 90,
+    0xC4AAC4: 510,
+    0xBCD0EB: 21,
+    0x605801: 8279,
+    0xD8630D: 443,
+    0x9C635B: 11,
+    0x1461A4: 22,
+    0xD09686: 12,
+    0x94D86B: 8280,
+    0x38A9EA: 8281,
+    0xE8EF22: 8282,
+    0x786C84: 77,
+    0x94BE09: 29,
+    0xE07526: 242,
+    0xE48E10: 4235,
+    0x64DBF7: 0,
+    0x3CA2C3: 146,
+    0x5C475E: 602,
+    0x54102E: 15,
+    0x94D54D: 15,
+    0x24E50F: 210,
+    0xC091B9: 77,
+    0x702804: 194,
+    0xF8075D: 117,
+    0x98226E: 77,
+    0xF8A4FB: 8283,
+    0x24F0D3: 90,
+    0x582071: 90,
+    0x684992: 20,
+    0xF89B6E: 181,
+    0x14DC51: 8284,
+    0x04331F: 117,
+    0xD4BABA: 12,
+    0x9CD8E3: 8285,
+    0xE0C264: 25,
+    0x24DC0F: 307,
+    0x7C2F80: 2319,
+    0x60C7BE: 194,
+    0x0404B8: 8286,
+    0x40C2BA: 384,
+    0x18D6DD: 15,
+    0xFC1803: 15,
+    0x68962E: 15,
+    0xCC3DD1: 15,
+    0x54C45B: 48,
+    0x80BC37: 272,
+    0xE001A6: 87,
+    0x203626: 94,
+    0xC0515C: 11,
+    0xBC89A7: 49,
+    0x30B0EA: 8287,
+    0x4CFC22: 8288,
+    0xE4ECE8: 90,
+    0xC8908A: 90,
+    0x403306: 278,
+    0x000BF8: 8289,
+    0x783EA1: 0,
+    0x7C50DA: 8290,
+    0xA41CB4: 8291,
+    0x401A58: 57,
+    0x2CF2A5: 3,
+    0x7408DE: 8292,
+    0x10FC33: 117,
+    0x943C96: 3,
+    0x70B7E4: 293,
+    0x1423F2: 293,
+    0xB08101: 22,
+    0x485DED: 135,
+    0x5CFC6E: 135,
+    0x7CDCCC: 8293,
+    0x34479A: 69,
+    0x94AD23: 49,
+    0x20A5CB: 49,
+    0xF421CA: 49,
+    0x3C0268: 8289,
+    0xCC5EF8: 195,
+    0xFC1263: 234,
+    0x58305B: 8294,
+    0xA03131: 8295,
+    0xC071AA: 8296,
+    0x709C45: 15,
+    0xFC0736: 117,
+    0x94A07D: 117,
+    0x5C0758: 743,
+    0x142D79: 5,
+    0x84F44C: 8297,
+    0x589A3E: 77,
+    0xE838A0: 1066,
+    0xECC07A: 4449,
+    0xC81EC2: 163,
+    0x6883CB: 49,
+    0x68B9C2: 121,
+    0x88B863: 349,
+    0x1C46D1: 319,
+    0x003F10: 8298,
+    0x8822B2: 4297,
+    0x4802AF: 6227,
+    0x2004F3: 22,
+    0x38E7C0: 31,
+    0xF0C1CE: 8299,
+    0x906AEB: 157,
+    0xC4EB39: 3,
+    0x0052C8: 8300,
+    0x582B0A: 53,
+    0x089DF4: 25,
+    0xDC4628: 25,
+    0x0C9192: 25,
+    0x48AD9A: 25,
+    0xD8E844: 11,
+    0xE46A35: 194,
+    0x6865B7: 8301,
+    0x9C0591: 270,
+    0xE4B555: 117,
+    0x2877B1: 8302,
+    0x405EF6: 90,
+    0x945244: 90,
+    0x9C2E7A: 90,
+    0x7C6305: 77,
+    0xD87E6F: 8303,
+    0x044F7A: 29,
+    0xFCC737: 8304,
+    0x94286F: 11,
+    0x400EF3: 11,
+    0x743AF4: 25,
+    0x687A64: 25,
+    0xBC0358: 25,
+    0x5431D4: 8305,
+    0xE016B1: 8306,
+    0xAC606F: 0,
+    0xC43CB0: 664,
+    0xC06911: 89,
+    0x9401AC: 8307,
+    0x2C93FB: 387,
+    0x7844FD: 86,
+    0xB4466B: 8308,
+    0x58C57E: 5,
+    0x2418C0: 8309,
+    0x0021D0: 8310,
+    0x4C312D: 33,
+    0xC04E30: 14,
+    0xAC15A2: 94,
+    0xB8B409: 90,
+    0x34CF6C: 8311,
+    0x489BE0: 194,
+    0xACDF9F: 48,
+    0xB859C8: 4617,
+    0xC82496: 1116,
+    0xE0F678: 5,
+    0x28F7D6: 5,
+    0xA8E207: 4334,
+    0xD4E22F: 58,
+    0x5CFA25: 3,
+    0xF8CDC8: 135,
+    0x402230: 37,
+    0x145BB9: 4441,
+    0x0830CE: 5,
+    0x14130B: 466,
+    0x90235B: 77,
+    0x1CBCEC: 8312,
+    0x64D814: 4,
+    0x7C11CD: 8313,
+    0x447F77: 8314,
+    0xB0285B: 8315,
+    0xE06A05: 574,
+    0x90CD1F: 116,
+    0x749779: 195,
+    0x403B7B: 117,
+    0xF0B661: 63,
+    0x0425F0: 81,
+    0x4857D2: 293,
+    0x9C2183: 293,
+    0xD834EE: 8316,
+    0x94C5A6: 163,
+    0x5CE91E: 49,
+    0x88034C: 755,
+    0x047C16: 1280,
+    0x001794: 4,
+    0xF4CE46: 607,
+    0xE0D738: 8317,
+    0xC8EBEC: 574,
+    0x404244: 4,
+    0x04B6BE: 4235,
+    0x7CECB1: 49,
+    0xC0EDE5: 69,
+    0x10A562: 4463,
+    0xD4A3EB: 73,
+    0xFCB97E: 8318,
+    0x30E8E4: 186,
+    0x281293: 22,
+    0xC0A938: 15,
+    0x48DC9D: 8319,
+    0x64FD96: 3,
+    0x64989E: 8320,
+    0xBCC746: 113,
+    0x8C763F: 258,
+    0xF0D415: 25,
+    0xD4D853: 25,
+    0x643172: 8321,
+    0xD0FCD0: 132,
+    0x20FADB: 8322,
+    0x0C8B95: 14,
+    0x9CBFCD: 15,
+    0xB89FCC: 15,
+    0x3425BE: 77,
+    0x9CE041: 81,
+    0x783486: 81,
+    0x685E1C: 53,
+    0x38AB41: 53,
+    0xCC4792: 8323,
+    0xE046EE: 511,
+    0x5876AC: 165,
+    0x9C4F5F: 210,
+    0xA02942: 25,
+    0x1071B3: 112,
+    0xDCBE49: 163,
+    0x9C9561: 31,
+    0xE0036B: 90,
+    0x1869D4: 90,
+    0x0463D0: 117,
+    0x14448F: 87,
+    0x50C1F0: 175,
+    0xF4848D: 86,
+    0x581122: 398,
+    0x74694A: 135,
+    0x00B0EE: 8324,
+    0x50DCD0: 8325,
+    0x78152D: 8326,
+    0x00A554: 25,
+    0xD4F0EA: 166,
+    0x0C8629: 12,
+    0x98A92D: 21,
+    0x94ABFE: 81,
+    0x5C24E2: 8327,
+    0x90DF7D: 194,
+    0xBC1D89: 78,
+    0xE47305: 8328,
+    0xA854A2: 289,
+    0xB87EE5: 1305,
+    0x60BEB4: 8329,
+    0xB4B742: 77,
+    0x78A03F: 77,
+    0x5046AE: 426,
+    0xB099D7: 90,
+    0x30F70D: 4,
+    0x742A8A: 4557,
+    0xA069D9: 21,
+    0x20FE00: 77,
+    0xF421AE: 8330,
+    0x747446: 210,
+    0x7820A5: 35,
+    0x2078CD: 49,
+    0x30D53E: 49,
+    0xF412FA: 14,
+    0xB0F208: 427,
+    0xF0B2B9: 25,
+    0xD0880C: 49,
+    0x1C57DC: 49,
+    0x604F5B: 117,
+    0xDC99FE: 8331,
+    0x9CF155: 81,
+    0x5023A2: 49,
+    0x98698A: 49,
+    0x78FBD8: 49,
+    0xA4C337: 49,
+    0xB0F1D8: 49,
+    0xB01B4B: 8332,
+    0x487412: 71,
+    0xA8E621: 77,
+    0x3CCFB4: 570,
+    0x043CE8: 37,
+    0x24813B: 4,
+    0x0CB8E8: 232,
+    0xF0A654: 195,
+    0xE8F375: 81,
+    0xE831CD: 14,
+    0x381EC7: 8333,
+    0xC0886D: 8334,
+    0x14DCE2: 8335,
+    0xEC5C84: 102,
+    0xC89BD7: 194,
+    0x28B133: 8336,
+    0x74E6B8: 244,
+    0x28D0F5: 138,
+    0x941865: 511,
+    0xA8587C: 8337,
+    0x985F4F: 8338,
+    0x34F86E: 8339,
+    0x0CAEBD: 4229,
+    0x90F260: 4614,
+    0x1889CF: 231,
+    0x84160C: 293,
+    0x6CD869: 8340,
+    0x38F7F1: 117,
+    0x4076A9: 117,
+    0xF438C1: 117,
+    0x28EA2D: 49,
+    0xD004B0: 90,
+    0x98B08B: 90,
+    0x9C2595: 90,
+    0xE8EECC: 8144,
+    0x04BD97: 4,
+    0x541651: 138,
+    0xA06720: 242,
+    0x94C9B7: 12,
+    0x60BC4C: 8341,
+    0x0C2369: 8342,
+    0xAC0425: 8343,
+    0xA08069: 25,
+    0x2072A9: 4197,
+    0xD0622C: 8344,
+    0xE05689: 301,
+    0xA81710: 47,
+    0x086AE5: 77,
+    0x209BE6: 257,
+    0x7087A7: 102,
+    0x4CE0DB: 40,
+    0x7C33F9: 15,
+    0xB8E60C: 49,
+    0x48352B: 49,
+    0x4CE6C0: 49,
+    0x3888A4: 49,
+    0x44DA30: 49,
+    0xA02BB8: 607,
+    0x8CB094: 8345,
+    0x70A8D3: 25,
+    0xD8FBD6: 77,
+    0x9C47F9: 8346,
+    0x206296: 8347,
+    0x2C3358: 25,
+    0x00064D: 8348,
+    0x1C869A: 90,
+    0xEC6488: 22,
+    0x98BEDC: 22,
+    0xE42761: 22,
+    0xA06974: 22,
+    0x0CC6FD: 40,
+    0x50DAD6: 40,
+    0x3408E1: 53,
+    0x18B96E: 281,
+    0x64BE63: 8349,
+    0xD46624: 4,
+    0x5058B0: 8350,
+    0x14CB65: 157,
+    0x7813E0: 287,
+    0x4861EE: 90,
+    0xA84B4D: 90,
+    0xF4F309: 90,
+    0xD07880: 5,
+    0xE06CF6: 8351,
+    0x78C62B: 287,
+    0x3C869A: 15,
+    0x2C2768: 15,
+    0x546990: 15,
+    0xD80A60: 15,
+    0xD4F98D: 14,
+    0x9C9019: 8352,
+    0x0434F6: 443,
+    0x546925: 8353,
+    0xF89522: 15,
+    0xF8B132: 15,
+    0xE84727: 116,
+    0x28C538: 49,
+    0x7857B0: 4367,
+    0x14019C: 8354,
+    0xE8CBED: 8333,
+    0xC4F122: 8355,
+    0x6007C4: 69,
+    0xBCDB09: 20,
+    0x0499B9: 49,
+    0x78028B: 49,
+    0xF84D89: 49,
+    0x086F48: 73,
+    0x0816D5: 8356,
+    0x1C568E: 578,
+    0x28563A: 5,
+    0x540F57: 238,
+    0x4448FF: 780,
+    0xD4D7CF: 194,
+    0xF4E4D7: 287,
+    0xF84E17: 133,
+    0x04C461: 102,
+    0xA08222: 780,
+    0xE01F2B: 181,
+    0xAC8226: 780,
+    0xC8CB9E: 25,
+    0x3C5576: 195,
+    0x90EB48: 8357,
+    0xA8C266: 132,
+    0x185345: 81,
+    0xE48210: 15,
+    0xF8F7B9: 15,
+    0x9C2BA6: 138,
+    0x941457: 4493,
+    0xBC5729: 8358,
+    0x64B94E: 8359,
+    0x5447E8: 902,
+    0xEC2BEB: 77,
+    0xB898AD: 78,
+    0x7052D8: 163,
+    0x249745: 15,
+    0xD86C5A: 132,
+    0xE4C0E2: 3,
+    0x4C3FA7: 8360,
+    0x001D5B: 8361,
+    0x1CAE3E: 12,
+    0xD0C35A: 8362,
+    0x84B630: 135,
+    0x58C7AC: 21,
+    0x0CCAFB: 8363,
+    0x687724: 86,
+    0x182DF7: 8364,
+    0xEC2C11: 8365,
+    0xF03575: 31,
+    0x2067E0: 73,
+    0xF8B54D: 25,
+    0x38A8CD: 12,
+    0x546706: 69,
+    0xC0F535: 295,
+    0x908175: 90,
+    0x307467: 90,
+    0xF0CD31: 90,
+    0x6401FB: 8366,
+    0x545284: 117,
+    0x646140: 117,
+    0xC4170E: 117,
+    0x7C8334: 12,
+    0x207BD2: 8323,
+    0xC4E532: 48,
+    0x0CAAEE: 8367,
+    0x906A94: 8368,
+    0x100C29: 8369,
+    0x8C3DB1: 8370,
+    0xD8A6F0: 513,
+    0x08E4DF: 8371,
+    0x105A17: 220,
+    0x008A76: 49,
+    0xFCA64C: 8372,
+    0xE069BA: 4,
+    0x2436DA: 4,
+    0x2037A5: 49,
+    0xDCB54F: 49,
+    0xB8374A: 49,
+    0xEC7C2C: 15,
+    0x5C8382: 81,
+    0x283613: 12,
+    0x145808: 278,
+    0xF4239C: 165,
+    0x4CEBD6: 14,
+    0xF4B19C: 263,
+    0xA8D081: 117,
+    0x740CEE: 117,
+    0x6CB4FD: 117,
+    0x7432C2: 8373,
+    0x00CE30: 8374,
+    0x1C9DC2: 14,
+    0x640E9B: 8375,
+    0x24F603: 15,
+    0x08FA28: 15,
+    0xF8CA85: 485,
+    0x1C2CE0: 8376,
+    0x2442BC: 8377,
+    0x18FC26: 186,
+    0xECC1AB: 257,
+    0x0000C8: 8378,
+    0xA0941A: 69,
+    0x300EB8: 244,
+    0xBC3329: 141,
+    0xA88940: 117,
+    0x0C0E76: 329,
+    0x703E97: 4463,
+    0x6C11B3: 513,
+    0x104738: 0,
+    0x38B800: 57,
+    0xCC312A: 8379,
+    0x30B037: 21,
+    0xFC122C: 15,
+    0x6CD1E5: 15,
+    0x3039A9: 8380,
+    0xFCD908: 40,
+    0x1C573E: 68,
+    0xD0167C: 63,
+    0x84144D: 25,
+    0x9C6BF0: 375,
+    0x44953B: 8381,
+    0x945AFC: 77,
+    0x00D76D: 25,
+    0xB41CAB: 8382,
+    0xA85B36: 12,
+    0x2C1165: 238,
+    0xDCED83: 166,
+    0xBCD7D4: 58,
+    0xAC0BFB: 14,
+    0x20B868: 78,
+    0x289C6E: 487,
+    0x1C2A8B: 81,
+    0x84F703: 14,
+    0x485A67: 8383,
+    0x945C9A: 49,
+    0x8C1F64: 12,
+    0xF47B09: 25,
+    0xE87829: 12,
+    0x50325F: 238,
+    0x1C4190: 638,
+    0xFC8A3D: 11,
+    0x085A11: 329,
+    0x64C403: 116,
+    0xEC9468: 8384,
+    0x00F39F: 49,
+    0x64C394: 15,
+    0x4C77CB: 25,
+    0x44D5CC: 77,
+    0x00005B: 8385,
+    0x5CE42A: 25,
+    0xF0C814: 664,
+    0x705FA3: 40,
+    0x3C62F0: 463,
+    0x983B67: 317,
+    0x6C9392: 8386,
+    0x58355D: 117,
+    0xAC7E01: 117,
+    0x1874E2: 12,
+    0xA0B086: 4192,
+    0x30B346: 8387,
+    0x0004B8: 8388,
+    0x000B3A: 8389,
+    0x04B9E3: 90,
+    0x94AA0A: 5,
+    0xE85C0A: 4,
+    0x9843FA: 25,
+    0x20D276: 163,
+    0x3CBDD8: 1047,
+    0x54C250: 1494,
+    0x00FAB6: 8390,
+    0x7CF462: 8391,
+    0x70B950: 53,
+    0x781C5A: 224,
+    0xC45E5C: 15,
+    0xD01769: 102,
+    0x20C19B: 25,
+    0x2C6DC1: 25,
+    0xD09FD9: 12,
+    0xA0D722: 90,
+    0x5049B0: 90,
+    0xE805DC: 8392,
+    0x000CDF: 8393,
+    0xC4A151: 135,
+    0x201F3B: 210,
+    0xC8059E: 8394,
+    0x34FCA1: 8395,
+    0x107BCE: 81,
+    0xB825B5: 8396,
+    0x20415A: 8397,
+    0xB0A7B9: 94,
+    0x6C5AB0: 94,
+    0x60E6F0: 57,
+    0xC8F5D6: 12,
+    0x2897B8: 8398,
+    0xF44E38: 8399,
+    0xF092B4: 135,
+    0xECF8EB: 135,
+    0x405899: 4238,
+    0x08A842: 117,
+    0x2C6373: 135,
+    0x88E056: 15,
+    0x540E58: 69,
+    0x5C648E: 112,
+    0x0000B8: 8400,
+    0xD035E5: 38,
+    0x9096F3: 310,
+    0x082CED: 8401,
+    0x145AFC: 192,
+    0xEC153D: 8402,
+    0x2066CF: 524,
+    0x2C8DB1: 25,
+    0x586C25: 25,
+    0x2CC81B: 439,
+    0x7847E3: 135,
+    0x30E396: 117,
+    0xD07D33: 117,
+    0xC0E1BE: 15,
+    0x042728: 157,
+    0x18BFB3: 2173,
+    0xA49BCD: 4,
+    0xB4E3F9: 238,
+    0x1842D4: 8403,
+    0xA8637D: 329,
+    0x6C1B3F: 8404,
+    0xB03DC2: 8405,
+    0xC84D34: 8406,
+    0x2025D2: 5,
+    0x2C43BE: 276,
+    0x5810B7: 444,
+    0xE0925C: 49,
+    0x00116C: 8407,
+    0x28F49B: 8408,
+    0xD8A35C: 90,
+    0xC09296: 11,
+    0x50E24E: 11,
+    0xD8E72B: 4555,
+    0x78E36D: 14,
+    0x000139: 8409,
+    0xB02491: 117,
+    0x98751A: 117,
+    0xB48901: 15,
+    0x449BC1: 15,
+    0x1C9180: 49,
+    0x4CB910: 49,
+    0x34865D: 14,
+    0x1CA0EF: 12,
+    0x446FF8: 8410,
+    0x28AFFD: 4,
+    0xD097FE: 194,
+    0x843A5B: 101,
+    0x98CDAC: 14,
+    0xF845C4: 8411,
+    0xEC9365: 8412,
+    0x9C7613: 602,
+    0x808AF7: 8413,
+    0x182A57: 15,
+    0xF83E95: 15,
+    0x481258: 15,
+    0xCC3296: 117,
+    0xD8EB46: 210,
+    0x2C17E0: 8414,
+    0x5449DF: 8415,
+    0x781053: 29,
+    0xA84397: 8416,
+    0x08474C: 81,
+    0x90C119: 81,
+    0x8CAACE: 40,
+    0xE89F39: 81,
+    0xB0227A: 19,
+    0x60A751: 117,
+    0x102B41: 90,
+    0x344AC3: 8417,
+    0x803428: 72,
+    0x00E421: 141,
+    0xD85ED3: 538,
+    0x249AD8: 143,
+    0xD8CD2C: 8418,
+    0x7CF880: 4,
+    0x981A35: 15,
+    0x682D83: 8419,
+    0x403F8C: 86,
+    0xCCDB04: 8420,
+    0x04D6F4: 167,
+    0xD8BBC1: 1280,
+    0x58FC20: 68,
+    0xB844AE: 274,
+    0xF8AA3F: 317,
+    0x0CCF89: 664,
+    0xE4F75B: 258,
+    0xF8790A: 258,
+    0x1C937C: 258,
+    0xAC5AFC: 25,
+    0xD4351D: 1134,
+    0xF077C3: 25,
+    0x049081: 8421,
+    0x4C796E: 25,
+    0xF09E4A: 25,
+    0xC89402: 388,
+    0x7CB94C: 47,
+    0x0C8C69: 8422,
+    0x00682B: 117,
+    0x98AD1D: 117,
+    0x446FD8: 12,
+    0x84D343: 218,
+    0x38B5D3: 8423,
+    0xDC15C8: 427,
+    0x6CD630: 8424,
+    0xB068E6: 388,
+    0xBCD7CE: 596,
+    0x34318F: 49,
+    0xC41411: 49,
+    0xCCC95D: 49,
+    0x7061BE: 57,
+    0xC833E5: 15,
+    0xE86DE9: 15,
+    0x144658: 15,
+    0x58BE72: 15,
+    0x108FFE: 15,
+    0xD847BB: 117,
+    0x2CDD0C: 8425,
+    0xBC9D42: 787,
+    0x44B6BE: 4,
+    0x8CDEE6: 90,
+    0x10EC81: 90,
+    0xC45D83: 90,
+    0x9C9C1F: 14,
+    0x240B88: 278,
+    0x0C938F: 69,
+    0xA0412D: 8426,
+    0xC43960: 167,
+    0x5CBD9A: 117,
+    0x14A3B4: 117,
+    0x5CA4A4: 5,
+    0xD809D6: 8427,
+    0x9CA570: 63,
+    0x7404F0: 8428,
+    0xB4B5B6: 388,
+    0x047A0B: 508,
+    0x900F0C: 195,
+    0x4C1154: 8428,
+    0xC4BF60: 231,
+    0xD040EF: 102,
+    0xD056BF: 8429,
+    0x2C9AA4: 8430,
+    0x18D5B6: 8431,
+    0x70F096: 4,
+    0xBC9A53: 117,
+    0xDC2727: 117,
+    0xF042F5: 117,
+    0xE02E3F: 117,
+    0xEC75ED: 8432,
+    0x4C7525: 14,
+    0x001340: 8433,
+    0x002236: 8434,
+    0x80B97A: 63,
+    0xA453EE: 12,
+    0xC8A40D: 8435,
+    0x38420B: 506,
+    0x608D26: 48,
+    0x1C3929: 373,
+    0x48701E: 53,
+    0x508E49: 40,
+    0xAC3328: 117,
+    0x8CF319: 144,
+    0xB00CD1: 607,
+    0x2CF05D: 1280,
+    0x8C476E: 12,
+    0x0002F4: 8436,
+    0x309E1D: 373,
+    0x687912: 12,
+    0x74D6CB: 21,
+    0x0C3AFA: 21,
+    0xA8817E: 49,
+    0x18B6CC: 460,
+    0x30A023: 8437,
+    0xE848B8: 94,
+    0x78CB2C: 8438,
+    0xF8665A: 49,
+    0x60BEC4: 49,
+    0xF8B1DD: 49,
+    0x588694: 1530,
+    0xC09435: 258,
+    0xDCB72E: 40,
+    0xE0C377: 90,
+    0x4CFBF4: 8439,
+    0xE02BE9: 25,
+    0xF86D73: 8440,
+    0xAC3728: 278,
+    0x6CE874: 15,
+    0xC469F0: 15,
+    0xBC9930: 15,
+    0xE868E7: 14,
+    0x647924: 117,
+    0xD8CC98: 117,
+    0x20CD6E: 194,
+    0x64037F: 90,
+    0xB49D02: 90,
+    0x809FF5: 90,
+    0xD0BCC1: 755,
+    0xDC4A9E: 12,
+    0xFC8D3D: 8441,
+    0x4014AD: 117,
+    0x78C95E: 8442,
+    0xC033DA: 8443,
+    0xA87484: 11,
+    0xBC69CB: 8444,
+    0x089356: 15,
+    0xDCB7FC: 8445,
+    0xACFAA5: 8446,
+    0xB40EDE: 25,
+    0x6C146E: 15,
+    0x44E968: 15,
+    0x4CEF56: 4493,
+    0xE84F4B: 8447,
+    0xB04A39: 8448,
+    0xA4F9E4: 8449,
+    0xF44FD3: 8450,
+    0xAC122F: 8144,
+    0xFC45C3: 53,
+    0xAC6AA3: 8451,
+    0xE4C32A: 86,
+    0x909A4A: 86,
+    0xBC9789: 117,
+    0x684571: 117,
+    0x8493A0: 117,
+    0x9C8E9C: 117,
+    0xFC698C: 8452,
+    0x3CE038: 8453,
+    0x44CE3A: 8454,
+    0x9C1EA4: 232,
+    0x001FB8: 8455,
+    0xB8AE1C: 8456,
+    0x607072: 8457,
+    0x6C2D24: 526,
+    0xC8B6D3: 15,
+    0xE04BA6: 15,
+    0x800384: 272,
+    0xD8373B: 286,
+    0xA8301C: 247,
+    0x7C78B2: 342,
+    0xB8477A: 8458,
+    0x6CADAD: 388,
+    0x0060E9: 8459,
+    0xD8F3BC: 192,
+    0xD4482D: 8460,
+    0x78E3DE: 49,
+    0xF46FED: 5,
+    0x94B97E: 14,
+    0xCCE0DA: 154,
+    0x408C4C: 4710,
+    0x141B30: 375,
+    0xD0D23C: 49,
+    0x64D2C4: 49,
+    0xDC5285: 49,
+    0xE88152: 49,
+    0x908158: 49,
+    0xD8F8AF: 8461,
+    0xE4842B: 8462,
+    0x94026B: 8463,
+    0x084296: 8464,
+    0x34EFB6: 87,
+    0xE874C7: 8465,
+    0xB4ADA3: 257,
+    0x18FDCB: 12,
+    0x009023: 8466,
+    0xB0FEE5: 117,
+    0x4487DB: 8467,
+    0x642315: 117,
+    0xA4C74B: 117,
+    0x085BD6: 25,
+    0xC81739: 163,
+    0x58D061: 15,
+    0x90CCDF: 25,
+    0xB8D309: 8468,
+    0x689320: 21,
+    0x9454CE: 69,
+    0x388ABE: 69,
+    0x047E23: 275,
+    0x14CCB3: 8469,
+    0x001C7B: 737,
+    0x5484DC: 11,
+    0x38549B: 11,
+    0xDCCD2F: 378,
+    0x343EA4: 602,
+    0x04C1D8: 117,
+    0xC8BC9C: 117,
+    0x8C8D28: 25,
+    0x6CBAB8: 3,
+    0xE0D464: 25,
+    0xC0F6C2: 15,
+    0x007E56: 242,
+    0x083AF2: 14,
+    0x743A20: 21,
+    0x3C1A9E: 8470,
+    0xC884A1: 4,
+    0xD8778B: 1305,
+    0x30C9AB: 195,
+    0xD4AFF7: 89,
+    0xC4D738: 117,
+    0x60077C: 8471,
+    0x609866: 53,
+    0x1CD6BE: 57,
+    0x28D127: 166,
+    0x30A452: 8472,
+    0xF469D5: 12,
+    0x8CC5B4: 3,
+    0xF81B04: 8473,
+    0xD88C79: 210,
+    0x10341B: 8474,
+    0xF86465: 8475,
+    0x90A935: 8476,
+    0x60D4E9: 69,
+    0xC868DE: 117,
+    0xD00DF7: 117,
+    0x4805E2: 117,
+    0x001E68: 476,
+    0x2C600C: 476,
+    0x00238B: 476,
+    0x0008F6: 1927,
+    0x000BA2: 1927,
+    0x00005F: 1927,
+    0x18ECE7: 310,
+    0xBC03A7: 8477,
+    0xCCDB93: 4,
+    0xC8E265: 25,
+    0x18D61C: 423,
+    0x5448E6: 166,
+    0x2C6F51: 8478,
+    0x80EA07: 86,
+    0x8012DF: 37,
+    0x04A2F3: 5,
+    0x982FF8: 117,
+    0x40DCA5: 117,
+    0x30C50F: 15,
+    0x2868D2: 15,
+    0x00D0B6: 8479,
+    0xC01C30: 8480,
+    0x1CE61D: 90,
+    0x441C7F: 78,
+    0x00B8B6: 78,
+    0xBC17B8: 25,
+    0x08FA79: 146,
+    0xD8C678: 128,
+    0xECC01B: 15,
+    0x9844CE: 15,
+    0xF09BB8: 15,
+    0x44BB3B: 210,
+    0x14C14E: 210,
+    0xD8C0A6: 43,
+    0x10E77A: 4523,
+    0xE43D1A: 293,
+    0x7018A7: 4,
+    0x24F150: 8481,
+    0x304240: 11,
+    0x98A942: 8482,
+    0x4C2113: 0,
+    0x183EEF: 49,
+    0x607EC9: 49,
+    0x982CBC: 25,
+    0x2050E7: 295,
+    0x4CC53E: 112,
+    0x108B6A: 603,
+    0x802DBF: 4,
+    0x8C5EBD: 117,
+    0x2CA042: 117,
+    0xC083C9: 117,
+    0xFC609B: 21,
+    0xE8A1F8: 11,
+    0x14C88B: 49,
+    0xEC2651: 49,
+    0x08ACC4: 8483,
+    0x28B371: 272,
+    0xD4F829: 3,
+    0xDC503A: 8484,
+    0x18473D: 388,
+    0xD477B2: 8485,
+    0xF86BD9: 4,
+    0xC014FE: 4,
+    0x7CAD4F: 4,
+    0x605661: 8486,
+    0x706979: 12,
+    0x244BFE: 398,
+    0x7CDDE9: 8487,
+    0x942533: 15,
+    0x44F4E7: 8488,
+    0xF82F65: 117,
+    0x0831A4: 117,
+    0xA8E978: 117,
+    0xE06234: 53,
+    0x50382F: 8489,
+    0x708CBB: 8490,
+    0xB848AA: 38,
+    0xE0D462: 117,
+    0x909838: 117,
+    0xF8AC65: 25,
+    0x0019F4: 8491,
+    0xF0B022: 8492,
+    0x0C14D2: 29,
+    0x987ECA: 233,
+    0x6C2F8A: 90,
+    0x2C9FFB: 57,
+    0x84CCA8: 14,
+    0x002060: 8493,
+    0x948AC6: 194,
+    0x448DBF: 8494,
+    0xC0A66D: 8495,
+    0xAC7A56: 4,
+    0xD89136: 8496,
+    0xE0F6B5: 35,
+    0x40B31E: 638,
+    0x884033: 15,
+    0xE8986D: 95,
+    0xFC956A: 8497,
+    0x24C8D3: 8498,
+    0xB8E3EE: 638,
+    0xC88314: 8499,
+    0x68B9D3: 4507,
+    0x9056FC: 231,
+    0x98ED5C: 8500,
+    0xC44268: 8501,
+    0x40F520: 14,
+    0x78AA82: 21,
+    0x7C89C1: 95,
+    0x84D6C5: 8502,
+    0x38F601: 8503,
+    0x1070FD: 270,
+    0xB8C6AA: 121,
+    0x54AED0: 8504,
+    0xB86392: 651,
+    0x5471DD: 117,
+    0x00062A: 4,
+    0x6CF712: 181,
+    0x20826A: 69,
+    0x487AF6: 8505,
+    0x486E70: 250,
+    0x601D9D: 33,
+    0x6409AC: 274,
+    0x24B657: 4,
+    0x5C5578: 8506,
+    0x08C0EB: 270,
+    0xE4E112: 53,
+    0x3414B5: 53,
+    0xD003EB: 53,
+    0x08BFA0: 90,
+    0x701F3C: 90,
+    0xD48A39: 90,
+    0xE4F3C4: 90,
+    0x9C2F4E: 11,
+    0xD8A8C8: 11,
+    0x189E2C: 117,
+    0x94DB56: 432,
+    0x3822E2: 19,
+    0xF01090: 21,
+    0x646266: 12,
+    0xD85F77: 570,
+    0x2C97ED: 8507,
+    0x188A6A: 8508,
+    0x3C7D0A: 49,
+    0xB4157E: 8509,
+    0x645E2C: 8510,
+    0x147740: 117,
+    0xB89047: 49,
+    0x909C4A: 49,
+    0x908C43: 49,
+    0x18D98F: 117,
+    0x2811EC: 15,
+    0x00692D: 276,
+    0xF4032A: 77,
+    0x9C28F7: 40,
+    0x10521C: 14,
+    0x803049: 192,
+    0xE42686: 317,
+    0x0C3796: 8511,
+    0x38EB47: 15,
+    0x10C3AB: 15,
+    0x943BB0: 21,
+    0x289AF7: 149,
+    0xE84943: 8512,
+    0x9043E2: 8513,
+    0x501408: 8514,
+    0xF0F0A4: 77,
+    0xCC2D1B: 4542,
+    0xB0B194: 11,
+    0xA02D13: 1153,
+    0x3C5731: 4,
+    0x342FBD: 35,
+    0x6C42AB: 8515,
+    0x64F6F7: 8516,
+    0x941C56: 659,
+    0x80E540: 258,
+    0xC0D682: 89,
+    0xD80BCB: 570,
+    0x9CFCE8: 25,
+    0x8468C8: 8517,
+    0x2C91AB: 427,
+    0x807B3E: 90,
+    0xF8F1E6: 90,
+    0x88A9B7: 49,
+    0xECCED7: 49,
+    0xAC9085: 49,
+    0xA824B8: 81,
+    0x6490C1: 166,
+    0xCC5CDE: 29,
+    0x4C4FEE: 71,
+    0x60CE86: 463,
+    0x0009FC: 8518,
+    0x48EB62: 102,
+    0x50DE19: 12,
+    0xD005E4: 117,
+    0x30AAE4: 117,
+    0x5CE176: 4,
+    0x28CDC4: 388,
+    0xE8D8D1: 19,
+    0x9055DE: 5,
+    0xE8910F: 5,
+    0x14AB56: 8519,
+    0x4CE175: 4,
+    0x50E549: 538,
+    0xCC5289: 8520,
+    0xCC5D78: 8521,
+    0xB0A454: 8522,
+    0xACEB51: 638,
+    0xC4B239: 4,
+    0xA82BCD: 15,
+    0x48DC2D: 15,
+    0x809F9B: 33,
+    0xBCF9F2: 8523,
+    0x6010A2: 8524,
+    0x349F7B: 1131,
+    0x34F150: 31,
+    0xD03110: 8525,
+    0xA8E77D: 53,
+    0xDC543D: 163,
+    0x08CC27: 78,
+    0x04D395: 78,
+    0xE09806: 14,
+    0xF4CFA2: 14,
+    0x2877F1: 49,
+    0x3C510E: 4,
+    0xD8AED0: 8526,
+    0x0C42A1: 270,
+    0xE0859A: 787,
+    0x748A28: 145,
+    0xECA940: 258,
+    0xFC8596: 8527,
+    0x50C6AD: 5,
+    0x0C8447: 5,
+    0x9C6B72: 531,
+    0x5CB4E2: 8528,
+    0xD42493: 8529,
+    0x6C410E: 4,
+    0x149138: 77,
+    0xF81E6F: 8530,
+    0x6C310E: 4,
+    0x58D50A: 102,
+    0x14A32F: 117,
+    0x04D3B5: 117,
+    0x00BB1C: 117,
+    0xDC4BFE: 8230,
+    0x506255: 12,
+    0x80AC7C: 33,
+    0x88A303: 90,
+    0xFCDE90: 90,
+    0x1854CF: 90,
+    0x80795D: 444,
+    0xF0A7B2: 8531,
+    0x609B2D: 8532,
+    0xF0A35A: 49,
+    0x608373: 49,
+    0x84AD8D: 49,
+    0x74428B: 49,
+    0x642CAC: 15,
+    0xE884C6: 15,
+    0x6C710D: 4,
+    0x00D2B1: 8140,
+    0x1C4455: 8533,
+    0xE01F88: 40,
+    0x803253: 25,
+    0xC0E434: 43,
+    0x5CE7A0: 81,
+    0x8CDC02: 11,
+    0xD03D52: 8534,
+    0x246F8C: 117,
+    0x1C1386: 117,
+    0xBC2EF6: 117,
+    0x4455C4: 117,
+    0x10C65E: 8535,
+    0x20311C: 146,
+    0xB4E842: 8536,
+    0x7CA7B0: 664,
+    0x683943: 8537,
+    0x2852F9: 8538,
+    0xB8F853: 48,
+    0xE0D083: 90,
+    0xD80B9A: 90,
+    0x6C1DEB: 205,
+    0x287FCF: 25,
+    0x8031F0: 90,
+    0x743C18: 278,
+    0x1088CE: 5,
+    0x8C02FA: 8539,
+    0x4C80BA: 733,
+    0x34B5A3: 4235,
+    0xAC8D34: 15,
+    0x743170: 1149,
+    0x401175: 12,
+    0x84A9EA: 8540,
+    0xE405F8: 8541,
+    0x583526: 8542,
+    0x283334: 117,
+    0x30A2C2: 117,
+    0xF47488: 21,
+    0xDCDFD6: 11,
+    0xACA88E: 224,
+    0x98415C: 35,
+    0x848094: 8543,
+    0x10B3D5: 4,
+    0x000084: 8544,
+    0x50A132: 4710,
+    0x807871: 234,
+    0x4C7A48: 8545,
+    0x705425: 258,
+    0x5C0BCA: 8546,
+    0xF4B688: 830,
+    0x000C86: 4,
+    0x083A88: 61,
+    0x08318B: 15,
+    0x4CB1CD: 272,
+    0xF83CBF: 8547,
+    0xFC589A: 4,
+    0x88517A: 145,
+    0xACB3B5: 15,
+    0xF49C12: 8548,
+    0x60AB14: 285,
+    0xBC62D2: 8549,
+    0x6C9E7C: 5,
+    0x84D15A: 274,
+    0xF08620: 48,
+    0xDCCC8D: 554,
+    0xB8F653: 286,
+    0x446747: 15,
+    0x884A70: 353,
+    0xA463A1: 233,
+    0x3C9D56: 15,
+    0x70FD45: 15,
+    0x44D5F2: 12,
+    0x0CDD24: 25,
+    0xF05C77: 210,
+    0x001D29: 580,
+    0xECA5DE: 8550,
+    0x8C4962: 58,
+    0xD44BB6: 250,
+    0x38184C: 432,
+    0x347563: 787,
+    0x142E5E: 463,
+    0x0025CB: 8551,
+    0x44237C: 166,
+    0x309435: 146,
+    0x50EB71: 25,
+    0xC4AC59: 102,
+    0x5816D7: 159,
+    0xFCA47A: 12,
+    0x6CD71F: 69,
+    0xF06865: 278,
+    0xF4B5BB: 8552,
+    0x507AC5: 49,
+    0x4C6BE8: 49,
+    0x8C861E: 49,
+    0x542B8D: 49,
+    0x000A17: 8553,
+    0x381A52: 378,
+    0xC064E4: 4,
+    0xD82FE6: 250,
+    0xE4FDA1: 15,
+    0xE419C1: 15,
+    0xB86685: 3,
+    0xB452A9: 53,
+    0x140F42: 81,
+    0x006D61: 339,
+    0x5C879C: 25,
+    0x24EE9A: 25,
+    0xD8AF81: 414,
+    0xD0C65B: 15,
+    0x9078B2: 40,
+    0x78C313: 29,
+    0x7434AE: 8554,
+    0x74ADB7: 29,
+    0x78CC2B: 8555,
+    0xD0C857: 12,
+    0x94D00D: 15,
+    0xC48A5A: 8556,
+    0xB49A95: 8557,
+    0x000970: 8558,
+    0x14A2A0: 4,
+    0x54EF44: 302,
+    0xE4AB89: 128,
+    0x1C20DB: 15,
+    0x8CFD18: 15,
+    0xFCBCD1: 15,
+    0x7460FA: 15,
+    0xC40683: 15,
+    0x50D4F7: 86,
+    0x402B50: 258,
+    0x001F47: 8559,
+    0xB45459: 596,
+    0xFC492D: 77,
+    0x74EE2A: 664,
+    0x080039: 8560,
+    0x889E33: 274,
+    0x6C8AEC: 8561,
+    0x84C2E4: 604,
+    0x8CE5C0: 90,
+    0xF08A76: 90,
+    0xECAA25: 90,
+    0x687D6B: 90,
+    0x485169: 90,
+    0xB4CFE0: 4725,
+    0xBC7FA4: 40,
+    0xAC83E9: 8562,
+    0xD8CA06: 8563,
+    0x6095CE: 12,
+    0xD8F15B: 14,
+    0x6CF17E: 8564,
+    0x90473C: 29,
+    0x7C21D8: 8565,
+    0xFCEA50: 554,
+    0x00E06B: 8566,
+    0xD4F057: 35,
+    0x488764: 146,
+    0x5C1CB9: 146,
+    0xC0FD84: 11,
+    0x444B7E: 5,
+    0xE8D0FC: 192,
+    0xE8E8B7: 102,
+    0x083A2F: 8567,
+    0x1C3A60: 272,
+    0x6009C3: 205,
+    0xDC8C37: 4,
+    0x103D3E: 29,
+    0x64CC22: 48,
+    0x4C9157: 8568,
+    0x9C25BE: 8569,
+    0xD039EA: 1124,
+    0xF8DFE1: 8570,
+    0x788C77: 617,
+    0x3C0C7D: 8571,
+    0x3476C5: 616,
+    0x60D2DD: 8572,
+    0x5C32C5: 8573,
+    0x24DA33: 15,
+    0xFCAB90: 15,
+    0xA4975C: 629,
+    0x1C2704: 11,
+    0x5078B3: 11,
+    0xF0D4F7: 8574,
+    0xE0CC7A: 15,
+    0xB02A1F: 1162,
+    0x5893D8: 53,
+    0x5051A9: 53,
+    0xF47960: 15,
+    0x145290: 8575,
+    0x6C23CB: 8576,
+    0x60AB67: 40,
+    0xAC710C: 29,
+    0xA8DB03: 305,
+    0x308944: 8577,
+    0x00B600: 8578,
+    0x002615: 5970,
+    0x9C8EDC: 5970,
+    0x000191: 8579,
+    0x4889E7: 25,
+    0xA0BD1D: 510,
+    0xB4D0A9: 29,
+    0x4846C1: 438,
+    0xACE2D3: 607,
+    0x00FD22: 4,
+    0xACEE70: 8580,
+    0x4418FD: 49,
+    0x005B94: 49,
+    0xE0897E: 49,
+    0x2CCCE6: 560,
+    0xCC2C83: 8581,
+    0xDCED84: 8582,
+    0x644C36: 25,
+    0xACD564: 388,
+    0x94D075: 8583,
+    0x28B4FB: 8584,
+    0xC05336: 8585,
+    0x606ED0: 8586,
+    0x40F9D5: 8587,
+    0xE44CC7: 12,
+    0xD4E880: 4,
+    0x3C20F6: 90,
+    0x7C38AD: 90,
+    0x2C01B5: 4,
+    0xA8346A: 90,
+    0xFC29F3: 8588,
+    0xF8AFDB: 5,
+    0x688B0F: 275,
+    0xE49F1E: 258,
+    0x3CF011: 25,
+    0xD49CDD: 295,
+    0x50F722: 4,
+    0x9809CF: 71,
+    0xB8DE5E: 8589,
+    0x9849E1: 4987,
+    0x04D7A5: 21,
+    0x885A06: 69,
+    0x5447D3: 8590,
+    0x4C4D66: 8591,
+    0xA4817A: 4235,
+    0xCCEDDC: 128,
+    0x20B780: 8592,
+    0xA4E7E4: 8593,
+    0xF0B31E: 638,
+    0xECA9FA: 651,
+    0x0003A5: 8594,
+    0xBCE67C: 204,
+    0x7C1E06: 21,
+    0x18DFB4: 8595,
+    0xF89173: 8596,
+    0xB8EF8B: 8597,
+    0xB8186F: 8598,
+    0x001A3F: 1305,
+    0x544741: 8599,
+    0xCCF735: 77,
+    0xC4F839: 8600,
+    0xC84F86: 66,
+    0x6429ED: 8601,
+    0xF82F6A: 163,
+    0xC0D834: 8602,
+    0x14D4FE: 258,
+    0x443C88: 8603,
+    0x841C70: 11,
+    0x78DD12: 48,
+    0xD425CC: 12,
+    0x8C6DC4: 8604,
+    0xC8F742: 4843,
+    0x006FF2: 155,
+    0x30DF8D: 725,
+    0xD4C93C: 4,
+    0x2C5D34: 69,
+    0x9C1463: 510,
+    0xE0750A: 159,
+    0x0019C1: 159,
+    0x0016FE: 159,
+    0x9C8D7C: 159,
+    0x002433: 159,
+    0x002306: 159,
+    0xB4EC02: 159,
+    0xCCD39D: 12,
+    0xBC7536: 159,
+    0xE0AE5E: 159,
+    0xD4B761: 33,
+    0x7C035E: 40,
+    0x44FE3B: 48,
+    0xD83AF5: 8605,
+    0x38D9A5: 8606,
+    0x646038: 4192,
+    0x649D99: 8607,
+    0x00169D: 4,
+    0x4C875D: 389,
+    0xB0E7DE: 8608,
+    0x00D279: 8609,
+    0x00004C: 485,
+    0x8CCF8F: 8610,
+    0x4C962D: 8611,
+    0x484A30: 8612,
+    0x4861A3: 8613,
+    0x4CE5AE: 8614,
+    0xF4C7C8: 8615,
+    0x304A26: 4507,
+    0xD467D3: 69,
+    0xA41232: 69,
+    0x48E3C3: 8616,
+    0xCC355A: 8617,
+    0x80546A: 725,
+    0xB447F5: 121,
+    0x1CF29A: 210,
+    0x748A0D: 258,
+    0xCC75E2: 258,
+    0xA89CA4: 8618,
+    0x2875D8: 287,
+    0x90E202: 53,
+    0x302478: 3,
+    0x184BDF: 8619,
+    0xFC7774: 25,
+    0x700B4F: 4,
+    0xE4388C: 8620,
+    0x4455B1: 15,
+    0x98F9C7: 12,
+    0xA40C66: 8621,
+    0x84A93E: 607,
+    0x349342: 8622,
+    0x589EC6: 2319,
+    0xB0C387: 8623,
+    0x086BD7: 238,
+    0x6458AD: 275,
+    0xA0A3B8: 8624,
+    0x38F9D3: 49,
+    0xFC183C: 49,
+    0x64C753: 49,
+    0x201F31: 625,
+    0x6C2CDC: 560,
+    0x7835A0: 8625,
+    0x8C7BF0: 8626,
+    0xE0A509: 8627,
+    0x3C5CC4: 77,
+    0xD8A756: 3,
+    0x54833A: 112,
+    0xF43909: 607,
+    0xB89A9A: 8628,
+    0x2CCC44: 141,
+    0xF47DEF: 90,
+    0x7C8BB5: 90,
+    0xD8A98B: 53,
+    0xD8D6F3: 554,
+    0x787052: 8629,
+    0x14EFCF: 8630,
+    0x3830F9: 514,
+    0x00F48D: 192,
+    0x702ED9: 8631,
+    0x70192F: 15,
+    0xA83FA1: 12,
+    0xF4DBE6: 4,
+    0x10B9F7: 8632,
+    0x18A7F1: 780,
+    0x90E17B: 49,
+    0xD81C79: 49,
+    0x58E6BA: 49,
+    0x248498: 8633,
+    0x6C9BC0: 8634,
+    0x04EB40: 4,
+    0x1801F1: 40,
+    0xC074AD: 8635,
+    0xF095F1: 8636,
+    0xC0847D: 800,
+    0x44E4EE: 57,
+    0xDC41E5: 8637,
+    0x10C22F: 8638,
+    0xBC3865: 8639,
+    0x0409A5: 6170,
+    0x94917F: 234,
+    0x9C0CDF: 69,
+    0x7CD30A: 713,
+    0x001E33: 713,
+    0xFC1D84: 8640,
+    0x00A5BF: 4,
+    0xC8BAE9: 8641,
+    0xC44F33: 14,
+    0x546AD8: 8642,
+    0x002654: 717,
+    0x0050DA: 717,
+    0x000476: 717,
+    0x000475: 717,
+    0x00D096: 716,
+    0x3009F9: 12,
+    0xB4DDD0: 8643,
+    0x48F027: 8644,
+    0xB42E99: 538,
+    0x342CC4: 288,
+    0xDC16B2: 15,
+    0x24FB65: 15,
+    0x0CB527: 15,
+    0x7C03AB: 40,
+    0xC8544B: 112,
+    0x14C697: 69,
+    0x242124: 81,
+    0x18AC9E: 163,
+    0xEC84B4: 4235,
+    0x4422F1: 8645,
+    0x78524A: 8646,
+    0xC46E7B: 787,
+    0xC048FB: 1143,
+    0x20E882: 11,
+    0x4C1159: 8647,
+    0x00B5D0: 90,
+    0x1496E5: 90,
+    0xD07FA0: 90,
+    0x009093: 8648,
+    0xF09FFC: 224,
+    0x0CB5DE: 1402,
+    0x50DCFC: 8649,
+    0x000B3B: 726,
+    0x240588: 210,
+    0x00049F: 8650,
+    0x00D07B: 8651,
+    0x14E9B2: 5,
+    0x700B01: 3,
+    0x5C2623: 8652,
+    0x303855: 882,
+    0x00B670: 4,
+    0xAC6417: 344,
+    0xEC6F0B: 8653,
+    0x3466EA: 8654,
+    0x28385C: 8655,
+    0x00BB60: 25,
+    0x7C6DA6: 8656,
+    0xB870F4: 384,
+    0x1C3947: 384,
+    0x342792: 524,
+    0x883F99: 344,
+    0x705AB6: 384,
+    0x201A06: 384,
+    0xF8A963: 384,
+    0xDC0EA1: 384,
+    0x0006EC: 2625,
+    0x0C1C57: 53,
+    0x806FB0: 53,
+    0x347916: 15,
+    0xD016B4: 15,
+    0xF0F08F: 8657,
+    0x8CB0E9: 4489,
+    0xA46191: 8658,
+    0x40A108: 443,
+    0x745933: 8659,
+    0xEC58EA: 272,
+    0x84A24D: 8660,
+    0x7C6B9C: 69,
+    0x009D6B: 102,
+    0xD45251: 8661,
+    0x0018B5: 8662,
+    0xD87EB1: 8663,
+    0x20A8B9: 314,
+    0xD0EFC1: 15,
+    0x485702: 15,
+    0x0017B6: 8664,
+    0x105917: 8665,
+    0x388B59: 210,
+    0x880118: 8666,
+    0xA42618: 554,
+    0x34E12D: 25,
+    0xDCAF68: 755,
+    0x882D53: 8667,
+    0x644F42: 8668,
+    0x2C97B1: 15,
+    0x24EC51: 8669,
+    0x7089CC: 29,
+    0x2C5BE1: 8670,
+    0xDCEFCA: 102,
+    0x00BC60: 4,
+    0x00D0B5: 8671,
+    0xCC7B61: 8672,
+    0x9C713A: 15,
+    0xB8B7F1: 57,
+    0x8050F6: 163,
+    0xA8CAB9: 1016,
+    0x5061BF: 4,
+    0x0009DF: 229,
+    0x000FA2: 8673,
+    0x746BAB: 8674,
+    0x0CB6D2: 329,
+    0x7829ED: 234,
+    0x000BB2: 8675,
+    0xF4032F: 8676,
+    0x944A0C: 463,
+    0x700F6A: 4,
+    0x108EE0: 90,
+    0xFCA621: 90,
+    0x8CF228: 751,
+    0x80029C: 182,
+    0xE8D099: 5,
+    0x00305E: 8677,
+    0xFC6BF0: 8678,
+    0x001477: 518,
+    0x00079B: 2763,
+    0x54B203: 814,
+    0x3868DD: 713,
+    0x3C6AA7: 25,
+    0xA028ED: 145,
+    0xD0C5D3: 43,
+    0x14169E: 1162,
+    0x107BA4: 8679,
+    0x203956: 145,
+    0x78AFE4: 8680,
+    0x90A137: 8681,
+    0xBC325F: 510,
+    0xAC5474: 275,
+    0x8C1CDA: 12,
+    0x7C41A2: 81,
+    0xF8C39E: 15,
+    0x505BC2: 192,
+    0x6C21A2: 800,
+    0x9C2F73: 8682,
+    0xD832E3: 40,
+    0x9487E0: 40,
+    0x38AF29: 510,
+    0x300AC5: 8683,
+    0x00E065: 8684,
+    0xC88629: 8685,
+    0xCCC2E0: 212,
+    0x883F4A: 53,
+    0xD88A3B: 8686,
+    0xEC5A86: 1030,
+    0xC4BAA3: 8687,
+    0x9CFEA1: 5,
+    0x4466FC: 69,
+    0x50A009: 40,
+    0x001DFA: 8568,
+    0x9814D2: 8688,
+    0x08F69C: 49,
+    0x04FA83: 780,
+    0x78F9B4: 181,
+    0x2016B9: 25,
+    0x00165C: 8689,
+    0x50A67F: 49,
+    0x60DEF3: 15,
+    0x1409DC: 15,
+    0x38BAF8: 25,
+    0x0007A8: 8690,
+    0x14205E: 49,
+    0xB841A4: 49,
+    0x9CE65E: 49,
+    0xC49880: 49,
+    0xE0338E: 49,
+    0x88964E: 258,
+    0xC0EEB5: 8691,
+    0xD461DA: 49,
+    0xF01898: 49,
+    0x881908: 49,
+    0x5C0947: 49,
+    0x641CAE: 90,
+    0xF8E44E: 4216,
+    0x40CD7A: 906,
+    0x004098: 8692,
+    0x949990: 8693,
+    0xF4BC97: 8694,
+    0x28FEDE: 8695,
+    0x907910: 554,
+    0x003DE8: 514,
+    0x68FEDA: 5,
+    0xD076E7: 86,
+    0x9CA615: 86,
+    0xE44E76: 8696,
+    0xDC4EF4: 8697,
+    0xF08173: 77,
+    0x00508B: 607,
+    0x146B9C: 664,
+    0x948DEF: 8698,
+    0x144E34: 454,
+    0x3403DE: 53,
+    0x34D712: 8699,
+    0xA06610: 621,
+    0x44FFBA: 11,
+    0x2CD974: 31,
+    0xD4F786: 5,
+    0x94B86D: 25,
+    0x240A63: 258,
+    0x8817A3: 554,
+    0x88A9A7: 12,
+    0xF88B37: 258,
+    0x6084BD: 310,
+    0x347ECA: 8700,
+    0xEC8914: 15,
+    0xB89436: 15,
+    0xE0E62E: 274,
+    0xB42EF8: 8701,
+    0xA4D4B2: 8702,
+    0x8CF773: 81,
+    0xF4C248: 90,
+    0xF47190: 90,
+    0x2802D8: 90,
+    0xDCE533: 12,
+    0xD8445C: 8703,
+    0x7C3953: 11,
+    0x38E1AA: 11,
+    0x48C796: 90,
+    0x501479: 8704,
+    0xE42D7B: 275,
+    0x387862: 133,
+    0x4CEFC0: 77,
+    0xC464E3: 53,
+    0xCC3B58: 8705,
+    0xDCDD24: 8706,
+    0x641CB0: 90,
+    0x903A72: 272,
+    0xC4FFBC: 12,
+    0x283B82: 329,
+    0x509551: 258,
+    0x804126: 15,
+    0xACF970: 15,
+    0x58D759: 15,
+    0x8C5973: 112,
+    0x24181D: 305,
+    0xF89066: 8707,
+    0x7006AC: 8708,
+    0x6C54CD: 8709,
+    0x94290C: 8710,
+    0x000889: 4679,
+    0x04C9D9: 4679,
+    0x7055F8: 8711,
+    0x580454: 8712,
+    0xC477AF: 5874,
+    0xD4909C: 49,
+    0xE4E0A6: 49,
+    0x5C0038: 8713,
+    0x9C32CE: 1131,
+    0x802BF9: 885,
+    0x54B802: 90,
+    0xF0B5B7: 8714,
+    0xB4DEDF: 11,
+    0x805E0C: 143,
+    0x6C49C1: 8715,
+    0x34415D: 25,
+    0x005091: 8716,
+    0x70EEA3: 8717,
+    0x7047E9: 146,
+    0x5C521E: 35,
+    0x3C2C99: 87,
+    0x10CEA9: 53,
+    0x88D039: 4375,
+    0x20E09C: 81,
+    0x2CFDA1: 398,
+    0x3807D4: 8718,
+    0x04197F: 8719,
+    0x14444A: 8720,
+    0x5C81A7: 8721,
+    0x5C0C0E: 8722,
+    0x5C86C1: 8723,
+    0x38437D: 288,
+    0x506F98: 8724,
+    0x4CAE1C: 4536,
+    0x142882: 8725,
+    0x30E48E: 8726,
+    0x683E02: 8727,
+    0x000261: 8728,
+    0x0014C3: 4869,
+    0x0004CF: 4869,
+    0x002037: 4869,
+    0xEC8193: 4971,
+    0x6CDD30: 4,
+    0x6C4E86: 8729,
+    0xFC9DD8: 8730,
+    0x503CEA: 69,
+    0xDC2834: 8731,
+    0x001730: 8732,
+    0x00E091: 244,
+    0xDCE1AD: 8733,
+    0x948854: 53,
+    0x001D0D: 141,
+    0xECB0E1: 655,
+    0x449160: 102,
+    0xB4F1DA: 514,
+    0xC863F1: 141,
+    0x5C7776: 274,
+    0x70E56E: 53,
+    0x547DCD: 53,
+    0x0019C2: 8734,
+    0x80000B: 25,
+    0x00AECD: 8735,
+    0x84509A: 8736,
+    0x6C05D5: 8737,
+    0xF8B7E2: 4,
+    0xF82055: 8738,
+    0xACA667: 8739,
+    0x000097: 848,
+    0x8CCF09: 848,
+    0x8C839D: 8740,
+    0xB0FC36: 540,
+    0x001DF4: 8741,
+    0x0081F9: 53,
+    0xECB5FA: 6606,
+    0x44CD0E: 4762,
+    0xE8825B: 258,
+    0x74E19A: 5,
+    0x001CAE: 8742,
+    0x80B03D: 49,
+    0xE49ADC: 49,
+    0xACE4B5: 49,
+    0xD0D2B0: 49,
+    0xB0C19E: 11,
+    0x0C3747: 11,
+    0x78DDD9: 5004,
+    0xE8DF70: 427,
+    0xD05995: 5,
+    0x18CC88: 8743,
+    0x7CDD76: 1953,
+    0x246880: 8744,
+    0xA8D3C8: 956,
+    0xF06D78: 69,
+    0x707D95: 8745,
+    0x28AD3E: 8746,
+    0x70991C: 8747,
+    0x001C56: 8748,
+    0x80C755: 5569,
+    0x1878D4: 8749,
+    0xF0BD2E: 8750,
+    0x746EE4: 8751,
+    0x2C431A: 574,
+    0x70708B: 4,
+    0x389F5A: 8752,
+    0xD843ED: 8753,
+    0x38A6CE: 319,
+    0x0040E4: 8754,
+    0x984B4A: 258,
+    0xE084F3: 8755,
+    0x0C62A6: 31,
+    0x18132D: 11,
+    0xBC4101: 423,
+    0x043A0D: 8756,
+    0x44EAD8: 53,
+    0x448F17: 4788,
+    0x00FC8B: 77,
+    0x0076B1: 8757,
+    0xC0742B: 8758,
+    0x74D21D: 15,
+    0x3890A5: 4,
+    0x6CC147: 8759,
+    0xA072E4: 8760,
+    0x4C1365: 8761,
+    0xCCF957: 205,
+    0x5C6776: 6420,
+    0x1CDDEA: 69,
+    0xB8D94D: 3,
+    0x189BA5: 12,
+    0xA491B1: 1134,
+    0x1C7022: 102,
+    0xCC9891: 4,
+    0x28BF89: 5,
+    0x8C4500: 102,
+    0xA43412: 8762,
+    0x681F40: 8763,
+    0x90ADF7: 146,
+    0xECFA03: 8764,
+    0x002294: 825,
+    0x3889DC: 8765,
+    0x903DBD: 8766,
+    0xFC017C: 885,
+    0x90324B: 885,
+    0x940006: 8767,
+    0x6C96CF: 49,
+    0x78886D: 49,
+    0x74E5F9: 25,
+    0x40CE24: 4,
+    0x3432E6: 8768,
+    0x40017A: 4,
+    0x38CD07: 8769,
+    0x20EE28: 49,
+    0xB4F61C: 49,
+    0x08F4AB: 49,
+    0x8C8590: 49,
+    0xBC88C3: 8770,
+    0x00127D: 8771,
+    0x00D060: 8772,
+    0xA08869: 25,
+    0x58A0CB: 8773,
+    0x0C4B54: 86,
+    0x74819A: 8774,
+    0xA82BB5: 87,
+    0x283545: 407,
+    0x602E20: 15,
+    0xE472E2: 15,
+    0x18B81F: 258,
+    0x94E36D: 53,
+    0xF0F8F2: 53,
+    0x341513: 53,
+    0xE06089: 8775,
+    0x783690: 1030,
+    0x508F4C: 40,
+    0xA47758: 8776,
+    0x60F677: 25,
+    0xE8E1E2: 8777,
+    0x7811DC: 698,
+    0xD463C6: 78,
+    0xC444A0: 4,
+    0x18742E: 77,
+    0xF844E3: 278,
+    0x24A534: 8778,
+    0x001D2E: 272,
+    0x044F4C: 15,
+    0x1C151F: 15,
+    0x008BFC: 8779,
+    0x90A365: 145,
+    0xDC44B6: 90,
+    0x1007B6: 90,
+    0x342D0D: 90,
+    0xD837BE: 725,
+    0x001392: 272,
+    0xD4684D: 272,
+    0x8C0C90: 272,
+    0x6CAAB3: 272,
+    0xC08ADE: 272,
+    0x085114: 8780,
+    0x70788B: 146,
+    0x4859A4: 11,
+    0x70F11C: 8781,
+    0x7065A3: 8782,
+    0x74D0DC: 228,
+    0x54BD79: 90,
+    0xAC9E17: 398,
+    0x641666: 8783,
+    0xEC42B4: 8784,
+    0x60DA83: 955,
+    0x2C5731: 1162,
+    0xCC4639: 8785,
+    0xA0423F: 8786,
+    0xD8DF7A: 8787,
+    0xE4A749: 95,
+    0xA86B7C: 686,
+    0xB03956: 511,
+    0xB4E62A: 285,
+    0xA0C5F2: 12,
+    0x8C147D: 12,
+    0xA0AFBD: 25,
+    0xA0341B: 8788,
+    0xA0239F: 4,
+    0x70F35A: 4,
+    0xFC4DD4: 61,
+    0x145BE1: 8789,
+    0x30074D: 305,
+    0x00180A: 20,
+    0x88D50C: 69,
+    0xD428D5: 274,
+    0x7C8BCA: 86,
+    0xB04E26: 86,
+    0xB089C2: 8790,
+    0xF023B9: 12,
+    0x1C1FD4: 8791,
+    0xE83935: 607,
+    0xA4F4C2: 8792,
+    0x009AD2: 4,
+    0x947BE7: 90,
+    0x5092B9: 90,
+    0xDC74A8: 90,
+    0x5C6A80: 112,
+    0xD860B3: 8793,
+    0x64351C: 8794,
+    0x605317: 8795,
+    0x9CAF6F: 163,
+    0xFC539E: 1195,
+    0xA8D579: 8796,
+    0x84CD62: 8797,
+    0x907065: 53,
+    0x481063: 8798,
+    0xA08E78: 3,
+    0x60BA18: 8799,
+    0x001FA4: 725,
+    0xC4AE12: 90,
+    0x18A958: 8800,
+    0x94D299: 8801,
+    0x488803: 8802,
+    0xB436E3: 8803,
+    0x6C4B90: 8804,
+    0xC83A6B: 58,
+    0xB4C6F8: 8805,
+    0x9CE951: 8806,
+    0x74C9A3: 5,
+    0xEC8A4C: 11,
+    0xB8D50B: 412,
+    0xBC66DE: 8807,
+    0x2CABEB: 4,
+    0x58D9D5: 901,
+    0xD45F25: 574,
+    0x40C8CB: 8808,
+    0x64D154: 439,
+    0x28FF3E: 11,
+    0xB8D7AF: 102,
+    0xD4AE05: 90,
+    0xF0EE10: 90,
+    0xE048AF: 8809,
+    0x2C3311: 4,
+    0x5082D5: 49,
+    0x341A35: 5,
+    0x2C029F: 8810,
+    0x00050F: 8811,
+    0x989E63: 49,
+    0x886B6E: 49,
+    0xD4DCCD: 49,
+    0x484BAA: 49,
+    0xDCA904: 49,
+    0x6CAB31: 49,
+    0x4C74BF: 49,
+    0x04946B: 231,
+    0xA04C5B: 423,
+    0xF85971: 25,
+    0xF4E4AD: 11,
+    0xBC024A: 145,
+    0x949901: 8812,
+    0x1005CA: 4,
+    0x7894B4: 463,
+    0xC4700B: 8813,
+    0x443708: 8814,
+    0x285F2F: 8815,
+    0x3CA067: 192,
+    0x1C1EE3: 31,
+    0x2C55D3: 15,
+    0xDCC64B: 15,
+    0x043389: 15,
+    0xB81DAA: 514,
+    0x00E400: 854,
+    0x542F8A: 351,
+    0x6014B3: 540,
+    0x105611: 258,
+    0x44032C: 25,
+    0x500FF5: 901,
+    0xBC452E: 8816,
+    0x706DEC: 8817,
+    0xB0C205: 8818,
+    0x94F551: 8819,
+    0x00A068: 8820,
+    0x703ACB: 210,
+    0x105AF7: 8821,
+    0x00C024: 8822,
+    0x7C4685: 443,
+    0x1C398A: 5,
+    0x00179B: 939,
+    0x0823B2: 146,
+    0x88C3B3: 8823,
+    0xE05124: 1175,
+    0x6C160E: 8824,
+    0x803A0A: 554,
+    0xA462DF: 8825,
+    0x08CCA7: 4,
+    0x0896AD: 4,
+    0x347877: 8826,
+    0x0020CC: 8827,
+    0x285261: 4,
+    0x286F7F: 4,
+    0xF0C850: 15,
+    0x001DA3: 8828,
+    0x689FF0: 11,
+    0x5CAF06: 514,
+    0x4C1694: 8829,
+    0x00014F: 262,
+    0x7868F7: 4752,
+    0xC81451: 15,
+    0x44D437: 625,
+    0xECE154: 8830,
+    0xE865D4: 901,
+    0x24D51C: 8831,
+    0x4CECEF: 8832,
+    0x1CEFCE: 8833,
+    0x64DBA0: 8834,
+    0xEC43F6: 112,
+    0x60C658: 8835,
+    0xFCB58A: 8836,
+    0x20780B: 8837,
+    0x2CD02D: 4,
+    0x24A7DC: 319,
+    0x0C73BE: 8838,
+    0xC8AA55: 8839,
+    0x98B6E9: 35,
+    0x186590: 49,
+    0xF86214: 49,
+    0x784F43: 49,
+    0x404D7F: 49,
+    0x64B0A6: 49,
+    0x7C04D0: 49,
+    0x84FCAC: 49,
+    0xDC0C5C: 49,
+    0xF8983A: 8840,
+    0x001D72: 4957,
+    0x30E171: 607,
+    0xF015B9: 8841,
+    0x64136C: 11,
+    0x04B648: 8842,
+    0x98F199: 404,
+    0x1840A4: 8843,
+    0x4C7487: 8844,
+    0x4C38D5: 599,
+    0x54B56C: 8845,
+    0x1C48CE: 69,
+    0x344CC8: 8846,
+    0x603E7B: 8847,
+    0xD8197A: 8848,
+    0x70700D: 49,
+    0x6C5C14: 69,
+    0xAC83F3: 800,
+    0xCC8CDA: 8849,
+    0xD436DB: 8850,
+    0xE80945: 554,
+    0xC80CC8: 15,
+    0x0425C5: 15,
+    0x2CDCAD: 57,
+    0xB0A2E7: 423,
+    0x7C2587: 8851,
+    0x002144: 8852,
+    0x00501E: 3598,
+    0xEC0D9A: 270,
+    0x3CFA43: 15,
+    0x145F94: 15,
+    0x90D7BE: 8853,
+    0x244E7B: 12,
+    0xCC9470: 8854,
+    0x085DDD: 426,
+    0x001F82: 4974,
+    0x883C1C: 426,
+    0x2834A2: 4,
+    0x7823AE: 258,
+    0x006BF1: 4,
+    0x30AEA4: 14,
+    0xCC61E5: 78,
+    0x20719E: 8855,
+    0x2CC260: 4606,
+    0x3C3F51: 8856,
+    0x50584F: 8857,
+    0xB439D6: 1040,
+    0x34F39A: 25,
+    0x8C60E7: 8858,
+    0x8C8ABB: 8859,
+    0x00039B: 8860,
+    0x609AC1: 49,
+    0x748D08: 49,
+    0x9C8BA0: 49,
+    0xCC088D: 49,
+    0x38A4ED: 40,
+    0xB89919: 8861,
+    0x40FE0D: 8862,
+    0xAC64DD: 12,
+    0xBC39D9: 8863,
+    0x3C2AF4: 8864,
+    0xC0854C: 1396,
+    0xD816C1: 8865,
+    0x94B819: 81,
+    0x787D48: 163,
+    0x8871E5: 77,
+    0x60EFC6: 8866,
+    0x20DBAB: 8867,
+    0x383A21: 12,
+    0xD8380D: 8868,
+    0xFCCAC4: 8869,
+    0x88AD43: 814,
+    0xB4EFFA: 8870,
+    0xB0C128: 8871,
+    0xF81D78: 12,
+    0x38F7B2: 8872,
+    0x7802B7: 8873,
+    0x646184: 8874,
+    0x3087D9: 272,
+    0xF09838: 15,
+    0xF0D9B2: 8875,
+    0xE4C801: 4405,
+    0x001FC6: 398,
+    0x6C71BD: 8876,
+    0xC87E75: 90,
+    0x00265F: 90,
+    0x00233A: 90,
+    0x101250: 554,
+    0x0007AB: 90,
+    0xE8E5D6: 90,
+    0x80691A: 1006,
+    0xB80756: 20,
+    0x001427: 8877,
+    0x001E84: 8878,
+    0x10DDB1: 49,
+    0x002329: 8879,
+    0xC80E14: 427,
+    0xAC63BE: 77,
+    0x086A0A: 234,
+    0x98E7F4: 607,
+    0xEC65CC: 8880,
+    0x3456FE: 20,
+    0x0026AD: 8881,
+    0x002486: 8882,
+    0x002478: 8883,
+    0x382DD1: 90,
+    0x001B2C: 8884,
+    0x9034FC: 885,
+    0x0C84DC: 885,
+    0xFC1F19: 1016,
+    0x840B2D: 1016,
+    0x206432: 1016,
+    0xB407F9: 1016,
+    0x889FFA: 885,
+    0x8C7CB5: 885,
+    0xC44619: 885,
+    0x506313: 885,
+    0xD0667B: 90,
+    0xE8039A: 90,
+    0x30CDA7: 90,
+    0x3C8BFE: 90,
+    0xD4E8B2: 90,
+    0x002339: 90,
+    0x5001BB: 90,
+    0x00166C: 90,
+    0x001599: 90,
+    0x0012FB: 90,
+    0x001247: 90,
+    0x0015B9: 90,
+    0x002491: 90,
+    0x60D819: 885,
+    0xF82FA8: 885,
+    0xC40142: 8885,
+    0x8430E5: 8886,
+    0x1C77F6: 69,
+    0x58E326: 8887,
+    0x001B2A: 4,
+    0x749DDC: 1166,
+    0xC8BA94: 305,
+    0x843838: 305,
+    0x54880E: 305,
+    0xF025B7: 305,
+    0xF04347: 15,
+    0x9CB2B2: 15,
+    0xA8C83A: 15,
+    0x14DDE5: 8888,
+    0x001A09: 8889,
+    0x742344: 40,
+    0xE492FB: 90,
+    0x6CB7F4: 90,
+    0x181EB0: 90,
+    0x247F20: 3,
+    0x684898: 90,
+    0x3423BA: 305,
+    0x400E85: 305,
+    0xE09DFA: 417,
+    0x1489FD: 90,
+    0xBC851F: 90,
+    0xB85E7B: 90,
+    0x2C4401: 90,
+    0xB8D9CE: 90,
+    0x1C66AA: 90,
+    0x5C3C27: 90,
+    0xBC72B1: 90,
+    0x78F7BE: 90,
+    0x70A84C: 8890,
+    0x84C7EA: 133,
+    0x24E43F: 8891,
+    0xD013FD: 514,
+    0x287AEE: 258,
+    0x00258B: 270,
+    0xBC644B: 258,
+    0x88797E: 78,
+    0x305890: 8892,
+    0x708BCD: 398,
+    0x2CAC44: 8893,
+    0x003676: 258,
+    0xFC8E7E: 258,
+    0xFC6FB7: 258,
+    0xD42C0F: 258,
+    0xA055DE: 258,
+    0x80F503: 258,
+    0x44AAF5: 258,
+    0x606405: 53,
+    0x00562B: 4,
+    0xE8FD90: 8894,
+    0x1899F5: 854,
+    0x18ABF5: 8895,
+    0xB03EB0: 8896,
+    0x0025C3: 8897,
+    0x000F57: 8898,
+    0x000342: 1034,
+    0x001283: 1034,
+    0x0011F9: 1034,
+    0x10E68F: 8899,
+    0x4CFACA: 820,
+    0xA48269: 8900,
+    0x001158: 1034,
+    0x000F6A: 1034,
+    0x000E62: 1034,
+    0x000CF8: 1034,
+    0x000997: 1034,
+    0x001CEB: 1034,
+    0x001C17: 1034,
+    0x001A8F: 1034,
+    0x001591: 8901,
+    0x00182E: 8902,
+    0x0026F1: 1040,
+    0x380DD4: 1952,
+    0x98FDB4: 1952,
+    0xD8C46A: 102,
+    0xD8FB68: 8903,
+    0x685388: 8904,
+    0x14C1FF: 8905,
+    0xECFAAA: 8906,
+    0x0014C7: 1034,
+    0x001DAF: 1034,
+    0x888322: 90,
+    0xE89309: 90,
+    0x982F3C: 854,
+    0xF00786: 8907,
+    0x00D0F6: 81,
+    0x54A619: 817,
+    0x38F8CA: 8908,
+    0x002105: 2155,
+    0x0017D1: 1034,
+    0x2057AF: 8909,
+    0x54DC1D: 1030,
+    0x6CD032: 244,
+    0x88A6C6: 3,
+    0x94D469: 4,
+    0x882BD7: 8910,
+    0xC0E42D: 86,
+    0x8CA6DF: 86,
+    0x8416F9: 86,
+    0x18D6C7: 86,
+    0x44334C: 5060,
+    0xACA213: 5060,
+    0x3C3300: 5060,
+    0x0090CC: 4844,
+    0x0022CF: 4844,
+    0xE417D8: 8911,
+    0x9CD332: 8912,
+    0x64899A: 514,
+    0xF8A9D0: 514,
+    0xCCFA00: 514,
+    0x74A722: 514,
+    0xF01C13: 514,
+    0xA816B2: 514,
+    0x64BC0C: 514,
+    0x344DF7: 514,
+    0x583F54: 514,
+    0xB0C5CA: 12,
+    0x7419F8: 12,
+    0x001BC5: 12,
+    0x78C3E9: 90,
+    0x8C1ABF: 90,
+    0x30CBF8: 90,
+    0xA0CBFD: 90,
+    0xE45D75: 90,
+    0x000031: 8913,
+    0x000E1E: 1054,
+    0x0014D1: 4884,
+    0xC01ADA: 49,
+    0x00121C: 1036,
+    0x9003B7: 1036,
+    0x90C682: 12,
+    0x58FCDB: 12,
+    0x001C14: 8914,
+    0x005056: 8914,
+    0x0010C1: 8915,
+    0x38A28C: 787,
+    0xA09E1A: 6194,
+    0xB4A5EF: 463,
+    0x849D64: 8916,
+    0x0080F7: 8917,
+    0x483C0C: 15,
+    0x208756: 314,
+    0xBC307D: 57,
+    0x48A9D2: 57,
+    0x80EA23: 57,
+    0x74B472: 8918,
+    0xFCF152: 133,
+    0x309BAD: 5036,
+    0xCC52AF: 61,
+    0x002713: 61,
+    0x001BB1: 57,
+    0xBC307E: 57,
+    0x68B35E: 8919,
+    0x1CD6BD: 8920,
+    0xD0D94F: 12,
+    0x506583: 53,
+    0xB09122: 53,
+    0xFC51A4: 258,
+    0x9857D3: 8921,
+    0xAC0481: 8922,
+    0xFCF528: 112,
+    0x00A0C5: 112,
+    0x408805: 78,
+    0x60C0BF: 8923,
+    0x001E04: 8924,
+    0x98398E: 90,
+    0xD0FCCC: 90,
+    0x24E271: 906,
+    0xBC6010: 906,
+    0xF0F644: 8925,
+    0x7C6AF3: 554,
+    0x20F17C: 15,
+    0x346AC2: 15,
+    0xC41CFF: 1066,
+    0x44D1FA: 8926,
+    0xC09727: 305,
+    0xDC293A: 8927,
+    0x40562D: 8928,
+    0xE46251: 8929,
+    0xA0D385: 8930,
+    0x1414E6: 8931,
+    0x3876D1: 8932,
+    0x0C5101: 49,
+    0x2CF0A2: 49,
+    0x68FB7E: 49,
+    0x84A134: 49,
+    0x001A34: 1088,
+    0x0011FC: 8933,
+    0x002389: 955,
+    0x3CE5A6: 955,
+    0xD8209F: 8934,
+    0x8C7716: 8589,
+    0xC4693E: 8935,
+    0x009569: 8936,
+    0xB0CF4D: 8937,
+    0x289AFA: 274,
+    0x904D4A: 3,
+    0x044E5A: 258,
+    0x5CDD70: 955,
+    0x3C8C40: 955,
+    0xA067BE: 8938,
+    0xE04F43: 61,
+    0x38700C: 258,
+    0x6C2483: 1176,
+    0x6891D0: 12,
+    0x002582: 8939,
+    0x48C049: 8940,
+    0xAC6FBB: 8941,
+    0x001C41: 8942,
+    0x146308: 8943,
+    0x001E25: 8944,
+    0x00E0CF: 8945,
+    0x0060B1: 8946,
+    0x547F54: 8947,
+    0x90C7D8: 11,
+    0x003A7D: 4,
+    0x001A45: 5069,
+    0x002088: 8948,
+    0x001CD7: 174,
+    0x001921: 1101,
+    0x0016EC: 1101,
+    0x000795: 1101,
+    0x541379: 885,
+    0x844076: 8949,
+    0x00065F: 1109,
+    0x00208F: 1109,
+    0xFC0F4B: 53,
+    0xD4883F: 8950,
+    0x60B617: 5,
+    0x18A3E8: 5,
+    0xDC9C9F: 574,
+    0x74DFBF: 192,
+    0xF03E90: 272,
+    0x00185C: 8951,
+    0x000E2E: 1111,
+    0x84AD58: 15,
+    0x58605F: 15,
+    0xD8D723: 8952,
+    0x00A0F4: 1085,
+    0xAC0D1B: 514,
+    0xF0D1B8: 8953,
+    0x986D35: 12,
+    0x88795B: 1088,
+    0xB07E70: 8954,
+    0x0080B1: 8955,
+    0x202DF8: 8956,
+    0xFC2FAA: 81,
+    0x081F71: 86,
+    0x5CCA1A: 1176,
+    0x741E93: 5,
+    0x0C5A9E: 8957,
+    0xD8803C: 8958,
+    0x10D0AB: 11,
+    0x0004C6: 8959,
+    0x981FB1: 8960,
+    0x202D07: 90,
+    0xB44BD2: 49,
+    0xDC415F: 49,
+    0x641225: 4,
+    0x7864E6: 8961,
+    0x3CBEE1: 8962,
+    0x18C501: 725,
+    0x00A0B8: 1124,
+    0x102AB3: 40,
+    0x40D357: 8963,
+    0xA0B9ED: 8964,
+    0x0034DA: 514,
+    0x3810D5: 427,
+    0x006016: 8965,
+    0x00C88B: 4,
+    0x0009D2: 8966,
+    0x24C3F9: 6162,
+    0x2C21D7: 8967,
+    0xE8B2AC: 49,
+    0xE49A79: 49,
+    0x30A9DE: 285,
+    0xF01B6C: 146,
+    0x4C2578: 882,
+    0xBCC6DB: 882,
+    0x60A8FE: 181,
+    0x94C960: 8968,
+    0xA41588: 258,
+    0xF45C89: 49,
+    0x20768F: 49,
+    0x9C5CF9: 133,
+    0x0011D1: 8969,
+    0x98D686: 8970,
+    0x8CC661: 8971,
+    0x88A084: 8972,
+    0x74C330: 989,
+    0x001D3B: 889,
+    0x001DFD: 889,
+    0x001E3B: 889,
+    0x001EA4: 889,
+    0x0026CC: 889,
+    0x000EED: 889,
+    0x00119F: 889,
+    0x001A16: 889,
+    0xDCB3B4: 8973,
+    0x00247C: 889,
+    0x001A89: 889,
+    0x001ADC: 889,
+    0x0025CF: 889,
+    0x0021AB: 889,
+    0x001FDE: 889,
+    0x001FDF: 889,
+    0x547975: 882,
+    0xA87B39: 882,
+    0x002266: 889,
+    0x0021FE: 889,
+    0x702559: 540,
+    0x001D20: 829,
+    0x08373D: 90,
+    0xC488E5: 90,
+    0x607EDD: 1176,
+    0xA8A089: 8974,
+    0x48365F: 8975,
+    0x000BCA: 8976,
+    0xC477AB: 8977,
+    0x0C75BD: 4,
+    0x300D43: 1176,
+    0x5056BF: 90,
+    0x90F1AA: 90,
+    0x1077B1: 90,
+    0x001FC7: 8978,
+    0xFCC734: 90,
+    0x8425DB: 90,
+    0xB0EC71: 90,
+    0xE458B8: 90,
+    0x088C2C: 90,
+    0xA49A58: 90,
+    0x08EE8B: 90,
+    0x64B853: 90,
+    0x389496: 90,
+    0x00000E: 621,
+    0x000B5D: 621,
+    0x080581: 1141,
+    0x74458A: 90,
+    0xC4473F: 15,
+    0x5CDC96: 1149,
+    0x001A2A: 1149,
+    0x88252C: 1149,
+    0x00E063: 1136,
+    0x000DF3: 8979,
+    0x000DB6: 1142,
+    0x000AF7: 1142,
+    0xD40129: 1142,
+    0x001D00: 8980,
+    0x0020D6: 7361,
+    0x1CC63C: 1149,
+    0x1883BF: 1149,
+    0x68ED43: 1151,
+    0x70AAB2: 1151,
+    0x000F86: 1151,
+    0x00146C: 511,
+    0x001E2A: 511,
+    0x00184D: 511,
+    0x00040E: 857,
+    0x9CC7A6: 857,
+    0xA06391: 511,
+    0x20E52A: 511,
+    0x4494FC: 511,
+    0x200CC8: 511,
+    0x0CA42A: 8981,
+    0x744401: 511,
+    0xE091F5: 511,
+    0x40BA61: 1150,
+    0x0011F5: 234,
+    0x0016E3: 234,
+    0xE839DF: 234,
+    0x0024D2: 234,
+    0xB4EEB4: 234,
+    0x745612: 258,
+    0xE46449: 258,
+    0x40FC89: 258,
+    0x2C9E5F: 258,
+    0x002636: 258,
+    0x001311: 258,
+    0x0023EE: 258,
+    0x001ADE: 258,
+    0x001CC1: 258,
+    0x001E5A: 258,
+    0x0050E3: 258,
+    0x7CBFB1: 258,
+    0x001371: 258,
+    0x0019A6: 258,
+    0x002136: 258,
+    0x001626: 258,
+    0xD0DF9A: 192,
+    0x1C659D: 192,
+    0x3010B3: 192,
+    0xE8C74F: 192,
+    0xD05349: 192,
+    0xE874E6: 1155,
+    0x0020E0: 659,
+    0x002662: 659,
+    0x948815: 8982,
+    0x5CB524: 133,
+    0x90C115: 133,
+    0xD05162: 133,
+    0x18002D: 133,
+    0x280DFC: 141,
+    0x0016B8: 133,
+    0x0024EF: 133,
+    0x0025E7: 133,
+    0x58170C: 133,
+    0x701A04: 192,
+    0x48D224: 192,
+    0x20689D: 192,
+    0x002553: 1155,
+    0x00193E: 1155,
+    0x000827: 1155,
+    0xD0E44A: 102,
+    0x080046: 133,
+    0x4C14A3: 5106,
+    0x4CB0E8: 8983,
+    0x74DAEA: 53,
+    0xD887D5: 8984,
+    0x00F28B: 4,
+    0xECF00E: 6806,
+    0x00E098: 6806,
+    0x742F68: 43,
+    0x384FF0: 43,
+    0x3413E8: 25,
+    0x34E6AD: 25,
+    0x081196: 25,
+    0x183DA2: 25,
+    0x809B20: 25,
+    0xB4B676: 25,
+    0x3CA9F4: 25,
+    0x9C4E36: 25,
+    0xB88A60: 25,
+    0x78FF57: 25,
+    0x002710: 25,
+    0x001B21: 25,
+    0x18FF0F: 25,
+    0xA48E0A: 8985,
+    0xAC2B6E: 25,
+    0x000A8A: 4,
+    0x9C3583: 8986,
+    0xC06118: 86,
+    0x002314: 25,
+    0x340286: 25,
+    0x001CBF: 25,
+    0x34DE1A: 25,
+    0xE8B1FC: 25,
+    0xCC3D82: 25,
+    0xF8E079: 78,
+    0xCCC3EA: 78,
+    0x40786A: 78,
+    0xD02212: 12,
+    0x100723: 12,
+    0xA44F29: 12,
+    0x74F8DB: 12,
+    0xA43BFA: 12,
+    0x001F3C: 25,
+    0x002315: 25,
+    0x00166F: 25,
+    0x0019D1: 25,
+    0x0019D2: 25,
+    0xC0830A: 1166,
+    0x383BC8: 1166,
+    0x60FE20: 1166,
+    0x00183F: 1166,
+    0x002456: 1166,
+    0x18622C: 3,
+    0x3C81D8: 3,
+    0x40F201: 3,
+    0xD084B0: 3,
+    0x181E78: 3,
+    0x0037B7: 3,
+    0x0054BD: 8987,
+    0x20BB76: 8988,
+    0x3CDD89: 8989,
+    0x1801E3: 8990,
+    0x001E4C: 885,
+    0xD8543A: 53,
+    0x649C8E: 53,
+    0x102EAF: 53,
+    0x7C8EE4: 53,
+    0xB4EED4: 53,
+    0x388602: 8991,
+    0x4065A3: 3,
+    0x00194B: 3,
+    0x001E74: 3,
+    0x149182: 1006,
+    0xC4EDBA: 53,
+    0x9059AF: 53,
+    0xBC6A29: 53,
+    0x847E40: 53,
+    0xC83E99: 53,
+    0x40984E: 53,
+    0x0017EB: 53,
+    0x0017E6: 53,
+    0x001832: 53,
+    0x3C2DB7: 53,
+    0xD03761: 53,
+    0x5464D9: 3,
+    0x9C8E99: 607,
+    0x00195B: 1167,
+    0x000F3D: 1167,
+    0x24DA11: 8992,
+    0xD0B33F: 423,
+    0xBCD1D3: 423,
+    0xEC2280: 329,
+    0x2400BA: 15,
+    0x24DF6A: 15,
+    0x40D855: 12,
+    0xF4F5D8: 210,
+    0xD83C69: 423,
+    0xB0C090: 4261,
+    0x907F61: 4261,
+    0xAC06C7: 8993,
+    0x0059AC: 8994,
+    0x001735: 8995,
+    0x74AC5F: 8996,
+    0x18AF61: 49,
+    0x5CF938: 49,
+    0x0C0535: 8997,
+    0xBC83A7: 407,
+    0xBCEC23: 407,
+    0x788B77: 8998,
+    0x001DCD: 258,
+    0x001DD2: 258,
+    0xE83EFC: 258,
+    0x8C579B: 57,
+    0x34AB37: 49,
+    0x38CADA: 49,
+    0x900DCB: 258,
+    0x8C09F4: 258,
+    0x101F74: 607,
+    0x009C02: 607,
+    0x0019BB: 607,
+    0x001F29: 607,
+    0x780CB8: 25,
+    0x185E0F: 25,
+    0x001635: 607,
+    0x0008C7: 607,
+    0x0010E3: 607,
+    0x000883: 607,
+    0x8CDCD4: 607,
+    0xDCFB02: 310,
+    0x8857EE: 310,
+    0x00215A: 607,
+    0x00237D: 607,
+    0x002655: 607,
+    0x000D9D: 607,
+    0x001560: 607,
+    0xE8ED05: 258,
+    0x789684: 258,
+    0xCC65AD: 258,
+    0x00207B: 1177,
+    0x001175: 1177,
+    0xD4C9EF: 607,
+    0xFC15B4: 607,
+    0x940937: 132,
+    0xE84DD0: 15,
+    0x0C45BA: 15,
+    0x20906F: 8999,
+    0x6CE3B6: 9000,
+    0xEC5F23: 9001,
+    0x047D50: 9002,
+    0x54EFFE: 9003,
+    0xDCD321: 132,
+    0x4482E5: 15,
+    0x00234E: 885,
+    0x2C8158: 885,
+    0x8002DF: 9004,
+    0x2C233A: 607,
+    0x000A57: 607,
+    0x0001E7: 607,
+    0x0001E6: 607,
+    0x00306E: 607,
+    0xCC4463: 49,
+    0x6C72E7: 49,
+    0x741BB2: 49,
+    0x001D0F: 86,
+    0x3C4A92: 607,
+    0x002376: 983,
+    0x38E7D8: 983,
+    0x188796: 983,
+    0xB4CEF6: 983,
+    0x7C7D3D: 15,
+    0x3CA82A: 607,
+    0x90489A: 885,
+    0x0071CC: 885,
+    0xB05B67: 15,
+    0xCCA223: 15,
+    0x786A89: 15,
+    0x14B968: 15,
+    0x882593: 86,
+    0x001FE1: 885,
+    0x10A5D0: 102,
+    0x0012F2: 1183,
+    0x00051E: 1183,
+    0x384608: 11,
+    0x4CAC0A: 11,
+    0xB4B362: 11,
+    0xB075D5: 11,
+    0x6CE873: 86,
+    0xC46E1F: 86,
+    0x50FA84: 86,
+    0x44B32D: 86,
+    0x0023CD: 86,
+    0xD85D4C: 86,
+    0xA0F3C1: 86,
+    0x783E53: 319,
+    0x0019FB: 319,
+    0xC4F57C: 1183,
+    0xD0154A: 11,
+    0x0026ED: 11,
+    0x002293: 11,
+    0x083E8E: 885,
+    0x006057: 102,
+    0x70A8E3: 15,
+    0xF8E811: 15,
+    0x200BC7: 15,
+    0xF84ABF: 15,
+    0x78D752: 15,
+    0x104780: 15,
+    0x94772B: 15,
+    0xD440F0: 15,
+    0x04021F: 15,
+    0x50A72B: 15,
+    0x0CD6BD: 15,
+    0x00F81C: 15,
+    0x404D8E: 15,
+    0x4C5499: 15,
+    0xF81547: 470,
+    0x087A4C: 15,
+    0xACE215: 15,
+    0x346BD3: 15,
+    0x70723C: 15,
+    0xACE87B: 15,
+    0xF83DFF: 15,
+    0x285FDB: 15,
+    0x5CF96A: 15,
+    0xF49FF3: 15,
+    0x240995: 15,
+    0x84DBAC: 15,
+    0x506184: 470,
+    0x10CDAE: 470,
+    0x048A15: 470,
+    0xB4B017: 470,
+    0x90FB5B: 470,
+    0xC8F406: 470,
+    0x7052C5: 470,
+    0x00040D: 470,
+    0x548998: 15,
+    0x30D17E: 15,
+    0x640980: 40,
+    0x185936: 40,
+    0x20A783: 9005,
+    0x0090F2: 4,
+    0x74D6EA: 53,
+    0x209148: 53,
+    0xF8A45F: 40,
+    0x60735C: 4,
+    0x34A84E: 4,
+    0x54781A: 4,
+    0xE02F6D: 4,
+    0x94049C: 15,
+    0x688F84: 15,
+    0x00605C: 4,
+    0x0006C1: 4,
+    0x00E014: 4,
+    0x0050F0: 4,
+    0x005014: 4,
+    0x0050BD: 4,
+    0x00906F: 4,
+    0x544A16: 53,
+    0x58971E: 4,
+    0xB4E9B0: 4,
+    0x000832: 4,
+    0x70105C: 4,
+    0x10F311: 4,
+    0x3085A9: 398,
+    0xB83861: 4,
+    0x580A20: 4,
+    0x001731: 398,
+    0x002215: 398,
+    0xE0CB4E: 398,
+    0x2C3ECF: 4,
+    0x508789: 4,
+    0x381C1A: 4,
+    0xBC671C: 4,
+    0x346288: 4,
+    0xCCD8C1: 4,
+    0x7C0ECE: 4,
+    0xA0ECF9: 4,
+    0x5CA48A: 4,
+    0x1C1D86: 4,
+    0x5017FF: 4,
+    0x189C5D: 4,
+    0xDCA5F4: 4,
+    0x547C69: 4,
+    0x9C57AD: 4,
+    0xB05947: 459,
+    0x004096: 4,
+    0x0CE0E4: 830,
+    0x74A2E6: 4,
+    0xBCF1F2: 4,
+    0xC80084: 4,
+    0x40A6E8: 4,
+    0xE86549: 4,
+    0xB07D47: 4,
+    0x38ED18: 4,
+    0x382056: 4,
+    0xDCCEC1: 4,
+    0x60FEC5: 49,
+    0xE425E7: 49,
+    0xBC926B: 49,
+    0x101C0C: 49,
+    0x080007: 49,
+    0x40D32D: 49,
+    0xC42C03: 49,
+    0x9027E4: 49,
+    0x109ADD: 49,
+    0x0016CB: 49,
+    0x0017F2: 49,
+    0x001F5B: 49,
+    0x002436: 49,
+    0x001947: 1185,
+    0x001839: 1068,
+    0x00254B: 49,
+    0x7C6D62: 49,
+    0x6C3E6D: 49,
+    0xBC6778: 49,
+    0x20C9D0: 49,
+    0x68967B: 49,
+    0x84FCFE: 49,
+    0xE48B7F: 49,
+    0x581FAA: 49,
+    0x88C663: 49,
+    0xA46706: 49,
+    0x8C5877: 49,
+    0x283737: 49,
+    0x50EAD6: 49,
+    0xB817C2: 49,
+    0x7C11BE: 49,
+    0xBC3BAF: 49,
+    0x3CE072: 49,
+    0x38484C: 49,
+    0xD8D1CB: 49,
+    0xA8FAD8: 49,
+    0x008865: 49,
+    0xE0F5C6: 49,
+    0xA0EDCD: 49,
+    0x189EFC: 49,
+    0x804971: 49,
+    0x98D6BB: 49,
+    0x7CF05F: 49,
+    0x5C97F3: 49,
+    0xD4F46F: 49,
+    0x48437C: 49,
+    0x34A395: 49,
+    0x787E61: 49,
+    0xC0F2FB: 49,
+    0x24E314: 49,
+    0x80E650: 49,
+    0x90FD61: 49,
+    0x2CF0EE: 49,
+    0x3C15C2: 49,
+    0x6C709F: 49,
+    0x6476BA: 49,
+    0x34E2FD: 49,
+    0x04489A: 49,
+    0x087045: 49,
+    0xA88808: 49,
+    0xA4C361: 49,
+    0xB09FBA: 49,
+    0x8C2937: 49,
+    0xACCF5C: 49,
+    0x80006E: 49,
+    0x848E0C: 49,
+    0xF099BF: 49,
+    0x94E96A: 49,
+    0xAC293A: 49,
+    0x9CFC01: 49,
+    0x60F81D: 49,
+    0x5CF5DA: 49,
+    0x18EE69: 49,
+    0x649ABE: 49,
+    0x9C35EB: 49,
+    0x507A55: 49,
+    0x0C4DE9: 49,
+    0xF0F61C: 49,
+    0xF0F249: 520,
+    0x38C986: 49,
+    0xD03311: 49,
+    0x5882A8: 1989,
+    0xC8C2C6: 9006,
+    0x789C85: 9007,
+    0xDCFE07: 814,
+    0x707938: 9008,
+    0xB813E9: 9009,
+    0x58685D: 9010,
+    0x243184: 224,
+    0x582BDB: 9011,
+    0x24DA9B: 78,
+    0x30E090: 9012,
+    0xF44D30: 1101,
+    0xE03676: 15,
+    0xEC388F: 15,
+    0xC49E41: 9013,
+    0xD03E5C: 15,
+    0xF00D5C: 9014,
+    0x54BE53: 11,
+    0x280E8B: 9015,
+    0x80B709: 9016,
+    0xA4DCBE: 15,
+    0xD494E8: 15,
+    0xB078F0: 9017,
+    0x38D40B: 90,
+    0x209BCD: 49,
+    0x94BBAE: 9018,
+    0xD40AA9: 258,
+    0x203D66: 258,
+    0xECB870: 9019,
+    0x3095E3: 9020,
+    0xE83A12: 90,
+    0x80656D: 90,
+    0xFCF136: 90,
+    0xB88687: 192,
+    0x18895B: 90,
+    0x584925: 9021,
+    0x94F278: 9022,
+    0x0894EF: 1063,
+    0x283713: 9023,
+    0xE0319E: 9024,
+    0x7CAB25: 9025,
+    0x584822: 133,
+    0x747336: 9026,
+    0xB0411D: 9027,
+    0x7CA237: 9028,
+    0xD404CD: 258,
+    0x3C5CC3: 9029,
+    0xECEED8: 9030,
+    0x80EB77: 4957,
+    0x483974: 9031,
+    0x30FFF6: 9032,
+    0x48E244: 885,
+    0xD8EFCD: 181,
+    0x4CC681: 9033,
+    0xC49FF3: 9034,
+    0x788E33: 9035,
+    0x884157: 9036,
+    0xD89A34: 9037,
+    0xC4EA1D: 1134,
+    0x7CF90E: 90,
+    0x382B78: 9038,
+    0xA47B2C: 81,
+    0xDCDB70: 9039,
+    0x800B51: 9040,
+    0x3481F4: 9041,
+    0xF8BF09: 15,
+    0x7CB25C: 9042,
+    0x803B2A: 9043,
+    0xA0A65C: 9044,
+    0xF80D60: 1131,
+    0xF0182B: 9045,
+    0xE8377A: 112,
+    0x00A784: 9046,
+    0x5CB43E: 15,
+    0x54E140: 8947,
+    0xE4907E: 78,
+    0x3CCE15: 9047,
+    0x38FACA: 560,
+    0x149A10: 157,
+    0x707781: 885,
+    0x50F0D3: 90,
+    0x24E5AA: 9048,
+    0x78BDBC: 90,
+    0x287610: 9049,
+    0x746A3A: 9050,
+    0x94A7B7: 11,
+    0x1844E6: 11,
+    0x485073: 157,
+    0x349B5B: 9051,
+    0x84119E: 90,
+    0x54E2C8: 9052,
+    0x20D75A: 9053,
+    0xF41563: 455,
+    0x8C8B83: 53,
+    0x4011DC: 9054,
+    0x1C8341: 9055,
+    0x706879: 9056,
+    0x081FEB: 9057,
+    0x785F4C: 9058,
+    0x6C1E70: 9059,
+    0xD8ADDD: 9060,
+    0x8833BE: 9061,
+    0x54B80A: 329,
+    0x34CC28: 9062,
+    0x249EAB: 15,
+    0x6CA75F: 11,
+    0x10AF78: 9063,
+    0xE48D8C: 439,
+    0x8C7967: 11,
+    0xCCA4AF: 9064,
+    0xCC19A8: 9065,
+    0xB4B265: 9066,
+    0x74E28C: 157,
+    0x0071C2: 814,
+    0x7C8274: 9067,
+    0x94D417: 9068,
+    0xE03560: 9069,
+    0x244B81: 90,
+    0xD855A3: 11,
+    0x38D82F: 11,
+    0x7858F3: 9070,
+    0x244B03: 90,
+    0x3CCB7C: 274,
+    0xE4CE70: 9071,
+    0x704E66: 989,
+    0x102C83: 9072,
+    0x709C8F: 9073,
+    0x844BB7: 271,
+    0x68F0BC: 9074,
+    0x2884FA: 224,
+    0x60D9A0: 1506,
+    0xF07959: 398,
+    0xE08E3C: 1147,
+    0x3C1E04: 329,
+    0x300EE3: 8664,
+    0x60AF6D: 90,
+    0xB85A73: 90,
+    0x68B983: 9075,
+    0x18F145: 9076,
+    0xACABBF: 9077,
+    0x981DFA: 90,
+    0x186882: 9078,
+    0x78B3B9: 9079,
+    0x04C09C: 9080,
+    0x7429AF: 885,
+    0x40EACE: 9081,
+    0x848EDF: 133,
+    0xEC8009: 9082,
+    0x50ADD5: 9083,
+    0xB04519: 274,
+    0xD88D5C: 5067,
+    0x3C1A0F: 9084,
+    0xE8CC18: 329,
+    0xB09137: 9085,
+    0x8C0551: 9086,
+    0xD897BA: 814,
+    0xA8D88A: 9087,
+    0x207693: 9088,
+    0x600417: 9089,
+    0x2497ED: 9090,
+    0xA49D49: 9091,
+    0xC03896: 885,
+    0x2C5089: 9092,
+    0x1C7E51: 9093,
+    0x948E89: 9094,
+    0x084656: 9095,
+    0xEC3C5A: 9096,
+    0x4488CB: 9097,
+    0x6872DC: 9098,
+    0x00AEFA: 102,
+    0x841826: 9099,
+    0x50294D: 9100,
+    0x0CCFD1: 9101,
+    0x74BADB: 9102,
+    0x909F33: 1530,
+    0x3077CB: 9103,
+    0x102F6B: 157,
+    0x945493: 9104,
+    0x6CBFB5: 9105,
+    0xB8F317: 9106,
+    0x8CF813: 9107,
+    0x68F06D: 9108,
+    0xF82441: 9109,
+    0x108A1B: 9110,
+    0xF8E903: 329,
+    0xE89606: 9111,
+    0xF42853: 578,
+    0x1C9C26: 9112,
+    0xD4EC86: 9113,
+    0x046785: 9114,
+    0xD0FA1D: 9115,
+    0xB89BE4: 9116,
+    0x505065: 9117,
+    0x40C62A: 9118,
+    0xE8150E: 882,
+    0xDC537C: 288,
+    0xAC11D3: 9119,
+    0x8432EA: 9120,
+    0xE01D38: 9121,
+    0xE47FB2: 621,
+    0xFC6DC0: 9122,
+    0x24D13F: 9123,
+    0x7824AF: 398,
+    0x0CAC05: 9124,
+    0xFC9FE1: 9125,
+    0xA81B5D: 9126,
+    0x44A6E5: 9127,
+    0x3CAA3F: 9128,
+    0x0C383E: 9129,
+    0x60CDA9: 9130,
+    0xB8AD3E: 9131,
+    0x183009: 9132,
+    0x74DBD1: 9133,
+    0x80AD67: 1038,
+    0x30B5F1: 9134,
+    0xB01041: 885,
+    0xC44202: 90,
+    0xB4AE6F: 9135,
+    0x90DA6A: 9136,
+    0x103047: 90,
+    0x5C2E59: 90,
+    0x4C6E6E: 9137,
+    0x8C3357: 9138,
+    0xF884F2: 90,
+    0xA45DA1: 1155,
+    0xC46BB4: 9139,
+    0x84948C: 520,
+    0xA8F7E0: 7518,
+    0x4486C1: 9140,
+    0xE0CBEE: 90,
+    0x4C3909: 9141,
+    0x907EBA: 9142,
+    0xA002DC: 77,
+    0x4045DA: 9143,
+    0x3451AA: 9144,
+    0x98BE94: 1594,
+    0x6C198F: 329,
+    0xC8FF77: 8410,
+    0x542AA2: 1159,
+    0xB49EAC: 9145,
+    0x54B753: 9146,
+    0xB0754D: 81,
+    0xCC07E4: 1506,
+    0xACB859: 9147,
+    0x88B1E1: 916,
+    0x54EE75: 761,
+    0x0C63FC: 9148,
+    0xD4E08E: 9149,
+    0xC89F1D: 9150,
+    0x0874F6: 9151,
+    0x143DF2: 9152,
+    0x6047D4: 9153,
+    0xD8492F: 1131,
+    0x2C39C1: 655,
+    0x800E24: 9154,
+    0x3C25D7: 882,
+    0x30A8DB: 133,
+    0x54D163: 9155,
+    0x083F3E: 9156,
+    0x1820A6: 9157,
+    0x20EAC7: 9158,
+    0x64B370: 9159,
+    0x5CF50D: 9160,
+    0x749C52: 9161,
+    0x48B5A7: 9162,
+    0x0C4F5A: 9163,
+    0xCCA614: 9164,
+    0x4C8B30: 659,
+    0x0805CD: 9165,
+    0x18FF2E: 9166,
+    0x847207: 109,
+    0xD4224E: 1402,
+    0x9C86DA: 9167,
+    0x2C073C: 9168,
+    0x7C1A03: 9169,
+    0x10DEE4: 9170,
+    0xF03A4B: 9171,
+    0x90F1B0: 9172,
+    0x90DB46: 9173,
+    0x344F5C: 9174,
+    0x7CE4AA: 13,
+    0xC4291D: 9175,
+    0xFCF8B7: 9176,
+    0x30F42F: 9177,
+    0x704E01: 9178,
+    0x746A8F: 9179,
+    0x54A31B: 9180,
+    0xCC398C: 9181,
+    0x6C5F1C: 1506,
+    0x404A18: 9182,
+    0xC0C569: 9183,
+    0xC4C0AE: 9184,
+    0xACC595: 9185,
+    0xD8EE78: 9186,
+    0x7CE1FF: 9187,
+    0xD8150D: 86,
+    0x4CD7B6: 9188,
+    0x8425A4: 9189,
+    0x483D32: 9190,
+    0xA0E453: 133,
+    0x3C0C48: 9191,
+    0xCC856C: 9192,
+    0x2C957F: 11,
+    0x98FF6A: 9193,
+    0x7CCD11: 9194,
+    0x5850AB: 9195,
+    0x241148: 9196,
+    0xCC7498: 9197,
+    0x64BABD: 9198,
+    0x24C848: 9199,
+    0x50ED78: 9200,
+    0x1CC11A: 9201,
+    0x90028A: 9202,
+    0x085AE0: 9203,
+    0xE0C86A: 9204,
+    0x1879A2: 9205,
+    0xC445EC: 9206,
+    0xE0E631: 9207,
+    0xF8572E: 9208,
+    0x78B5D2: 9209,
+    0xFC09D8: 9210,
+    0x743ECB: 9211,
+    0x7C444C: 9212,
+    0x0444A1: 9213,
+    0x20C60D: 9214,
+    0x38CA97: 9215,
+    0xBC2D98: 9216,
+    0xBC1A67: 9217,
+    0xAC6BAC: 9218,
+    0x7C9763: 9219,
+    0x48A2B7: 9220,
+    0xBCEE7B: 398,
+    0x3413A8: 9221,
+    0x8CAE89: 9222,
+    0xFCE1D9: 9223,
+    0xB04545: 9224,
+    0xC8EE75: 9225,
+    0x682DDC: 9226,
+    0xE8611F: 9227,
+    0x705957: 9228,
+    0x9CD643: 329,
+    0x3C18A0: 809,
+    0x94E98C: 81,
+    0x94C3E4: 9229,
+    0x20E791: 9230,
+    0x089758: 9231,
+    0xFC19D0: 9232,
+    0xCC3429: 86,
+    0x7CBF88: 9233,
+    0x60DB2A: 9234,
+    0x9486D4: 9235,
+    0xB424E7: 9236,
+    0xA0A23C: 9237,
+    0x68FCB3: 9238,
+    0x542F89: 9239,
+    0x2847AA: 882,
+    0x5CD61F: 9240,
+    0xCCFB65: 1265,
+    0xFCD817: 9241,
+    0x34885D: 4238,
+    0x88576D: 9242,
+    0xBC4100: 9243,
+    0x5027C7: 9244,
+    0x6C5AB5: 5106,
+    0xB43E3B: 9245,
+    0x0C5CD8: 9246,
+    0xEC3E09: 9247,
+    0x947C3E: 9248,
+    0x385AA8: 9249,
+    0xF4A294: 9250,
+    0x9C443D: 9251,
+    0x3C15EA: 9252,
+    0xE80410: 13,
+    0x909916: 9253,
+    0xA0143D: 1036,
+    0x6024C1: 9254,
+    0x60A9B0: 9255,
+    0x34A3BF: 9256,
+    0x8C088B: 454,
+    0xFC1BFF: 9257,
+    0x00A2FF: 9258,
+    0xF4BD7C: 9259,
+    0xDCC422: 9260,
+    0xC8F36B: 9261,
+    0x6CD1B0: 9262,
+    0x98F8C1: 9263,
+    0xA4F522: 9264,
+    0x845C93: 9265,
+    0x68E166: 13,
+    0x60FEF9: 9266,
+    0xB8DC87: 9267,
+    0x78CB33: 9268,
+    0xDCF755: 9269,
+    0xBC2BD7: 9270,
+    0x7C6FF8: 9271,
+    0x286D97: 4545,
+    0x24ECD6: 9272,
+    0xCC2A80: 9273,
+    0xF42896: 9274,
+    0x1C48F9: 5069,
+    0x9C4EBF: 9275,
+    0x34A843: 873,
+    0x80BBEB: 9276,
+    0x00B78D: 9277,
+    0x5C026A: 9278,
+    0x0C9301: 9279,
+    0x746630: 9280,
+    0x6CB350: 9281,
+    0xE89218: 9282,
+    0x0075E1: 9283,
+    0xD46A91: 9284,
+    0xB0793C: 9285,
+    0x3859F8: 9286,
+    0x4CDF3D: 9287,
+    0x98CDB4: 9288,
+    0xA42305: 9289,
+    0xA05B21: 9290,
+    0x50B8A2: 9291,
+    0xB04C05: 9292,
+    0x34CD6D: 9293,
+    0xB0FEBD: 13,
+    0x60699B: 9294,
+    0xD4D50D: 9295,
+    0xE438F2: 9296,
+    0xC4C755: 9121,
+    0x0C2D89: 9297,
+    0xA8D236: 9298,
+    0x788DF7: 520,
+    0x945047: 9299,
+    0xE031D0: 9300,
+    0x54112F: 9301,
+    0x4C55B8: 9302,
+    0x088039: 1185,
+    0x981094: 9303,
+    0xA4F3C1: 9304,
+    0x141330: 9305,
+    0x74CA25: 9306,
+    0xB4346C: 9307,
+    0x9046B7: 9308,
+    0x04CF25: 9309,
+    0xB050BC: 9310,
+    0x841E26: 9311,
+    0xDC7014: 13,
+    0xE4F3E3: 9312,
+    0x0086A0: 13,
+    0x60FE1E: 9313,
+    0x0CF405: 9314,
+    0x5061D6: 9315,
+    0x04BFA8: 9316,
+    0x8CC7D0: 9317,
+    0xB8AE6E: 1265,
+    0xD0EB03: 9318,
+    0x683EEC: 9319,
+    0x0C2AE7: 9320,
+    0x983071: 9321,
+    0xD49524: 9322,
+    0x0C0400: 9323,
+    0x687CD5: 9324,
+    0xC04DF7: 9325,
+    0x50A715: 9326,
+    0xC42628: 9327,
+    0x30AABD: 9328,
+    0xA4B818: 9329,
+    0x907AF1: 9330,
+    0x2CB693: 5026,
+    0xAC4122: 9331,
+    0x0C8484: 9332,
+    0x005907: 9333,
+    0xA861AA: 9334,
+    0xC8B373: 1068,
+    0x2C245F: 9335,
+    0x905692: 9336,
+    0xFC1186: 9337,
+    0xC8EEA6: 9338,
+    0x2481AA: 9339,
+    0xE01877: 621,
+    0xE457A8: 9340,
+    0x789966: 9341,
+    0x841715: 9342,
+    0x58EB14: 9343,
+    0xC458C2: 9344,
+    0xD0CDE1: 9345,
+    0x104D77: 9346,
+    0x5CE0CA: 9347,
+    0xE08177: 9348,
+    0x9C9811: 9349,
+    0xB86091: 9350,
+    0x301518: 9351,
+    0xD0D471: 9352,
+    0x0868D0: 9353,
+    0xD4223F: 1506,
+    0xE8E875: 9354,
+    0xC80E95: 9355,
+    0x6897E8: 9356,
+    0x7CA15D: 9357,
+    0x3C081E: 9358,
+    0xFC58FA: 9359,
+    0x60BB0C: 9360,
+    0x10B9FE: 9361,
+    0xA42C08: 9362,
+    0x8C078C: 9363,
+    0xF8DFA8: 11,
+    0xA895B0: 9364,
+    0x28CBEB: 9365,
+    0xB8C46F: 9366,
+    0xD8B02E: 9367,
+    0x4CCC34: 390,
+    0x30055C: 1138,
+    0x080EA8: 9368,
+    0xC4E032: 1536,
+    0x8C76C1: 9369,
+    0x08F1B7: 9370,
+    0xC044E3: 9371,
+    0x18550F: 1185,
+    0x187A93: 735,
+    0x8887DD: 9372,
+    0x30C82A: 9373,
+    0xC45DD8: 9374,
+    0xC4EBE3: 9375,
+    0x94756E: 9376,
+    0x4C1A95: 9377,
+    0xA00363: 9378,
+    0x6499A0: 9379,
+    0x848E96: 9380,
+    0x449B78: 9381,
+    0xDCA989: 9382,
+    0x7C438F: 9383,
+    0xF0F669: 9384,
+    0x78995C: 9385,
+    0x54115F: 9386,
+    0x8CAE4C: 9387,
+    0x0CC655: 9388,
+    0x5C89D4: 9389,
+    0x182A7B: 1265,
+    0x68FB95: 9390,
+    0xD0B498: 9391,
+    0xE05597: 9392,
+    0x242FFA: 9393,
+    0x849DC5: 9394,
+    0x580943: 13,
+    0xECFC55: 9395,
+    0x88A3CC: 9396,
+    0xC0A0C7: 9397,
+    0xA0E25A: 9398,
+    0xD40FB2: 9399,
+    0x485A3F: 9400,
+    0x70F1E5: 9401,
+    0xE496AE: 9402,
+    0xF8F082: 9403,
+    0x4C2258: 9404,
+    0xF45214: 270,
+    0x10F49A: 9405,
+    0x3C57BD: 9406,
+    0x04E9E5: 9407,
+    0x50465D: 398,
+    0x74BFA1: 9408,
+    0x08B738: 9409,
+    0xF8AA8A: 9410,
+    0x7C0187: 9411,
+    0x54F666: 9412,
+    0x1C11E1: 9413,
+    0x703811: 9414,
+    0xCC4BFB: 9415,
+    0x6CADEF: 9416,
+    0x745FAE: 9417,
+    0x60BD91: 9418,
+    0x6851B7: 9419,
+    0x1C959F: 9420,
+    0xB4009C: 9421,
+    0x2C5AA3: 9422,
+    0x34E0CF: 11,
+    0xF05F5A: 9423,
+    0xCC262D: 9424,
+    0x3C8AE5: 9425,
+    0xC0AA68: 9426,
+    0x88D7BC: 9427,
+    0xF49466: 9428,
+    0x742D0A: 9429,
+    0x34C803: 882,
+    0x80AAA4: 9430,
+    0xA40BED: 9431,
+    0x702393: 9432,
+    0xF85F2A: 882,
+    0xC438D3: 9433,
+    0x6CE4CE: 9434,
+    0x803FD6: 9435,
+    0xE85BF0: 9436,
+    0xF82285: 9437,
+    0x24EE3A: 9438,
+    0x0CC66A: 882,
+    0x74273C: 9439,
+    0x087CBE: 9440,
+    0x044A50: 9441,
+    0x38A5B6: 9442,
+    0x0CD9C1: 114,
+    0x68AB8A: 9443,
+    0xE804F3: 9444,
+    0x289EDF: 9445,
+    0x784405: 9446,
+    0xC4AD21: 9447,
+    0x0868EA: 9448,
+    0x801DAA: 470,
+    0x7C092B: 9449,
+    0x842BBC: 9450,
+    0xC401B1: 9451,
+    0xC0C946: 9452,
+    0xE8CBA1: 882,
+    0xE0AAB0: 9453,
+    0x649FF7: 9454,
+    0x20C1AF: 9455,
+    0x085B0E: 41,
+    0xEC42F0: 9456,
+    0x502ECE: 9457,
+    0xAC14D2: 9458,
+    0x9C4CAE: 9459,
+    0x18421D: 13,
+    0x28C914: 9460,
+    0x7493A4: 3264,
+    0xE47185: 9461,
+    0x802AFA: 9462,
+    0x30AEF6: 9463,
+    0xF4600D: 9464,
+    0xA82BD6: 9465,
+    0xACCF23: 9466,
+    0xCC912B: 9467,
+    0xC05E79: 9468,
+    0xC8AE9C: 9469,
+    0x080CC9: 9470,
+    0x640E94: 9471,
+    0x0CB4EF: 9472,
+    0xAC40EA: 9473,
+    0x002AAF: 9474,
+    0x1CE165: 9475,
+    0x4016FA: 9476,
+    0x0C130B: 9477,
+    0x58BFEA: 4,
+    0xFC1D59: 9478,
+    0x78C4AB: 9479,
+    0x146A0B: 9480,
+    0xF490EA: 9481,
+    0x2C542D: 4,
+    0xAC3FA4: 70,
+    0x6CAE8B: 1630,
+    0xBC1401: 520,
+    0x5CEE79: 9482,
+    0x80CEB1: 9483,
+    0xFC2A54: 9484,
+    0x40AC8D: 9485,
+    0x4CAA16: 9486,
+    0x609084: 9487,
+    0x782544: 9488,
+    0xA41875: 4,
+    0x045C06: 9489,
+    0x747B7A: 9490,
+    0x48EA63: 9491,
+    0xE88DF5: 5034,
+    0x642DB7: 9492,
+    0x28BA18: 9493,
+    0xAC3D75: 9494,
+    0xA090DE: 9495,
+    0xF436E1: 9496,
+    0x94CA0F: 9497,
+    0x2C2D48: 9498,
+    0x284121: 9499,
+    0x38458C: 9500,
+    0x10E4AF: 9501,
+    0xD05785: 5374,
+    0x408B07: 659,
+    0x90F72F: 9502,
+    0xF4EA67: 4,
+    0x04F021: 9503,
+    0x342F6E: 9504,
+    0xBC2C55: 9505,
+    0x0C7523: 9506,
+    0xB08E1A: 9507,
+    0xD8E952: 9508,
+    0x940070: 882,
+    0xE80C75: 9509,
+    0xCCEED9: 9510,
+    0x608C2B: 9511,
+    0x645299: 553,
+    0x800A06: 9512,
+    0x002A6A: 4,
+    0x40E793: 9513,
+    0x000831: 4,
+    0x34D09B: 9514,
+    0xBCA4E1: 9515,
+    0x2818FD: 9516,
+    0xD8B90E: 9517,
+    0x34BA9A: 9518,
+    0xF0007F: 9519,
+    0x30B3A2: 9520,
+    0x506028: 9521,
+    0x0091FA: 9522,
+    0xA05AA4: 9523,
+    0xF0EEBB: 9524,
+    0xE4FA1D: 9525,
+    0x005CB1: 9526,
+    0x1C5C55: 9527,
+    0x908FCF: 9528,
+    0x6CE907: 882,
+    0x984A47: 9529,
+    0x144978: 9530,
+    0x2C10C1: 1265,
+    0x8CD17B: 9531,
+    0x3C6A7D: 9532,
+    0x502267: 9533,
+    0x506441: 9534,
+    0x9C1FDD: 9535,
+    0x7CDD11: 9536,
+    0xB8FD32: 9537,
+    0x0064A6: 9538,
+    0x988BAD: 9539,
+    0xD44B5E: 9540,
+    0x640E36: 9541,
+    0xC8AF40: 9542,
+    0x40984C: 9543,
+    0x3C7059: 9544,
+    0x502690: 621,
+    0x5C18B5: 9545,
+    0x64E161: 9546,
+    0x8823FE: 9547,
+    0x70EE50: 9548,
+    0xD4F63F: 9549,
+    0x58B0D4: 9550,
+    0x64557F: 9551,
+    0x00082F: 4,
+    0x386077: 814,
+    0x708105: 4,
+    0x941D1C: 9552,
+    0x94AE61: 1402,
+    0x5CCEAD: 9553,
+    0xAC54EC: 9554,
+    0x709756: 9555,
+    0xE455EA: 9556,
+    0xB89AED: 9557,
+    0xC87D77: 9558,
+    0xB820E7: 9559,
+    0x00CD90: 9560,
+    0x7C6B52: 9561,
+    0xE0ED1A: 9562,
+    0x685E6B: 9563,
+    0xB05CE5: 882,
+    0x3482DE: 9564,
+    0x20C8B3: 9565,
+    0x4C5FD2: 940,
+    0xB8F5E7: 9566,
+    0xB81999: 9567,
+    0x34255D: 9568,
+    0xFC0012: 9569,
+    0xC029F3: 9570,
+    0x94DE0E: 9571,
+    0x807A7F: 9572,
+    0x24DAB6: 9573,
+    0xB07D62: 9574,
+    0x9CC7D1: 224,
+    0x149090: 9575,
+    0x28C718: 9576,
+    0x7C4C58: 9577,
+    0x1013EE: 9578,
+    0x8C271D: 9579,
+    0x38DE60: 9580,
+    0x2839E7: 9581,
+    0xD4CEB8: 9582,
+    0x30688C: 9583,
+    0xF8E7B5: 9584,
+    0x10EED9: 1140,
+    0x181420: 9585,
+    0x4CA74B: 1402,
+    0x1CE192: 1055,
+    0x706F81: 13,
+    0xDCF05D: 9586,
+    0x8CB82C: 9587,
+    0x807DE3: 9588,
+    0xDC175A: 9589,
+    0x900D66: 9590,
+    0xAC4AFE: 9591,
+    0x54F5B6: 9592,
+    0x90342B: 9593,
+    0x5C16C7: 89,
+    0x3C096D: 9594,
+    0xC8A1BA: 9595,
+    0xC43A9F: 9596,
+    0x686E23: 9597,
+    0xF49461: 9598,
+    0x0C924E: 9599,
+    0xB8CDA7: 9600,
+    0xA4B36A: 9601,
+    0xF43D80: 9602,
+    0x5435DF: 9603,
+    0x48DCFB: 882,
+    0xF0DB30: 9604,
+    0x9C31B6: 9605,
+    0x10C586: 9606,
+    0x10768A: 9607,
+    0x0C3956: 9608,
+    0xDCA6BD: 9609,
+    0xA45A1C: 9610,
+    0x806459: 9611,
+    0x8C89A5: 9612,
+    0xB4A5A9: 9613,
+    0xE8C320: 9614,
+    0xC436DA: 9615,
+    0x688470: 9616,
+    0x8C5CA1: 9617,
+    0xD43AE9: 9618,
+    0x589835: 1134,
+    0xE8CC32: 9619,
+    0xE4DD79: 9620,
+    0x18F650: 9621,
+    0x20B7C0: 9622,
+    0x8058C5: 9623,
+    0xB8C716: 5,
+    0xD42C3D: 9624,
+    0x1C184A: 9625,
+    0xF44EFD: 9626,
+    0x24B8D2: 9627,
+    0xA49981: 9628,
+    0xB83A7B: 9629,
+    0xD0EB9E: 9630,
+    0x78028F: 9631,
+    0x24C9DE: 9632,
+    0x54055F: 1402,
+    0x6C5D63: 9633,
+    0x0432F4: 9634,
+    0x1407E0: 9635,
+    0xDCCF94: 9636,
+    0xA4DB2E: 9637,
+    0xDC16A2: 9638,
+    0x308CFB: 9639,
+    0xBCCD45: 9640,
+    0x143E60: 81,
+    0x5C56ED: 9641,
+    0x941673: 9642,
+    0xC8FE30: 9643,
+    0xE4D71D: 9644,
+    0x8427CE: 9645,
+    0x48D8FE: 9646,
+    0x70A41C: 9647,
+    0x7032D5: 9648,
+    0x78510C: 9649,
+    0x44AAE8: 9650,
+    0x70E843: 9651,
+    0x2C7ECF: 9652,
+    0x74B00C: 9653,
+    0xBCBBC9: 9654,
+    0xB42A39: 9655,
+    0xD4945A: 9656,
+    0x304C7E: 9657,
+    0x5CF207: 9658,
+    0xE84040: 4,
+    0xD89DB9: 9659,
+    0x405A9B: 9660,
+    0x103711: 9661,
+    0xB4B88D: 9662,
+    0x4C73A5: 9663,
+    0xD428B2: 9664,
+    0xE83EB6: 1754,
+    0xBC35E5: 9665,
+    0x28CCFF: 9666,
+    0x94FD1D: 9667,
+    0x4C07C9: 9668,
+    0x00B342: 9669,
+    0x9C5D95: 9670,
+    0xB8A8AF: 9671,
+    0x60F673: 9672,
+    0xE42AD3: 9673,
+    0x1CF5E7: 9674,
+    0x980EE4: 13,
+    0x447DA5: 9675,
+    0x0CCDD3: 9676,
+    0x84DE3D: 9677,
+    0xE06995: 814,
+    0xF8769B: 9678,
+    0xC89C1D: 4,
+    0xD075BE: 9679,
+    0xBC6E76: 4384,
+    0xE828D5: 9680,
+    0xF8DAF4: 9681,
+    0x08D5C0: 9682,
+    0x6C33A9: 9683,
+    0x108CCF: 4,
+    0xD8E3AE: 9684,
+    0xCC7669: 9685,
+    0xAC20AA: 9686,
+    0xE437D7: 9687,
+    0xE0A1D7: 4542,
+    0x9481A4: 9688,
+    0xBCE09D: 9689,
+    0xBC4377: 9690,
+    0x7CDD90: 9691,
+    0x9C220E: 9692,
+    0x0C3C65: 9693,
+    0xC8DF7C: 882,
+    0xFCAF6A: 9694,
+    0x081735: 4,
+    0xCCBE71: 9695,
+    0x0C469D: 9696,
+    0x00B033: 9697,
+    0x08B7EC: 9698,
+    0x18AF9F: 9699,
+    0xE46C21: 9700,
+    0xE0F379: 9701,
+    0x78B6C1: 9702,
+    0xB09AE2: 9703,
+    0x14EE9D: 9704,
+    0xB44CC2: 9705,
+    0x48CB6E: 9706,
+    0x006DFB: 9707,
+    0x78D004: 9708,
+    0x8895B9: 9709,
+    0x78A051: 9710,
+    0x804F58: 9711,
+    0x448C52: 9712,
+    0x346F92: 9713,
+    0x34BDF9: 9714,
+    0xD8FE8F: 9715,
+    0x888C19: 9716,
+    0x08D29A: 9717,
+    0xC89383: 9718,
+    0x9067B5: 940,
+    0x0475F5: 9719,
+    0xE80C38: 9720,
+    0xE08A7E: 9721,
+    0x8C4DEA: 9722,
+    0x34DF2A: 9723,
+    0x70A191: 9724,
+    0x24BA30: 9725,
+    0x188ED5: 9726,
+    0x40B2C8: 1034,
+    0x708B78: 9727,
+    0xA8B0AE: 9728,
+    0xE42771: 9729,
+    0x70B08C: 9730,
+    0xC03B8F: 9731,
+    0x20FEDB: 9732,
+    0xC8A729: 9733,
+    0x4454C0: 9734,
+    0x64317E: 9735,
+    0x3C99F7: 9736,
+    0x507D02: 9737,
+    0xB4A4E3: 4,
+    0x94DD3F: 9738,
+    0xF44227: 9739,
+    0x8C1F94: 9740,
+    0x4491DB: 1304,
+    0xA8556A: 9741,
+    0xD0574C: 4,
+    0xF8DAE2: 9742,
+    0xAC83F0: 9743,
+    0xCC6B98: 9744,
+    0x3C04BF: 9745,
+    0x7C55E7: 9746,
+    0xC4F464: 9747,
+    0x602A54: 9748,
+    0xBCFFAC: 9749,
+    0x14D76E: 9750,
+    0x445EF3: 9751,
+    0x68DB96: 9752,
+    0x94A7BC: 9753,
+    0xC8A1B6: 9754,
+    0x38580C: 9755,
+    0x4451DB: 9756,
+    0x585076: 9757,
+    0xF0F9F7: 9758,
+    0x64A232: 9759,
+    0x64FC8C: 9760,
+    0x0C8D98: 9761,
+    0x40C7C9: 9762,
+    0x9803A0: 9763,
+    0xDCFAD5: 9764,
+    0x6C8D65: 9765,
+    0x7CBB6F: 9766,
+    0x20B0F7: 9767,
+    0xB4C810: 9768,
+    0x543131: 9769,
+    0xD0E347: 9770,
+    0x705EAA: 9771,
+    0x34F968: 9772,
+    0xF8C091: 9773,
+    0xAC9B84: 9774,
+    0x90F278: 9775,
+    0x806629: 9776,
+    0x4C60D5: 9777,
+    0x842914: 9778,
+    0xBC7DD1: 9779,
+    0x646707: 9780,
+    0x58FD20: 9781,
+    0xF0ED1E: 9782,
+    0xC416FA: 9783,
+    0x506F9A: 9784,
+    0x241F2C: 9785,
+    0xF0BDF1: 9786,
+    0xCC43E3: 9787,
+    0xACA016: 4,
+    0x58E747: 9788,
+    0x40618E: 9789,
+    0x68E41F: 9790,
+    0x389F83: 9791,
+    0xBC6A16: 9792,
+    0x003A9D: 404,
+    0x009363: 9793,
+    0x7C7673: 9794,
+    0x003532: 9795,
+    0x081FF3: 4,
+    0x44376F: 9796,
+    0x6CDC6A: 9797,
+    0x9055AE: 2032,
+    0x84C727: 9798,
+    0x28CD4C: 9799,
+    0x8C53F7: 9800,
+    0x404022: 498,
+    0xA85BB0: 9801,
+    0x888717: 1131,
+    0x1010B6: 9802,
+    0xD4823E: 9803,
+    0x44A689: 9804,
+    0x087695: 9805,
+    0xACCE8F: 9806,
+    0x8C9236: 9807,
+    0xF8912A: 9808,
+    0x10C73F: 9809,
+    0x44E49A: 9810,
+    0x08F2F4: 9811,
+    0x0C7D7C: 9812,
+    0xB482FE: 234,
+    0x307C30: 1754,
+    0xBC4E3C: 9813,
+    0x3037A6: 4,
+    0xDC1D9F: 9814,
+    0xB09074: 9815,
+    0x94F692: 9816,
+    0x785C72: 9817,
+    0x580556: 9818,
+    0x10445A: 9819,
+    0xF47626: 9820,
+    0x68EFBD: 4,
+    0xF02FD8: 9821,
+    0x502A8B: 9822,
+    0xEC43E6: 9823,
+    0xF02408: 9824,
+    0x8081A5: 9825,
+    0x8894F9: 9826,
+    0x502A7E: 9827,
+    0xF0264C: 9828,
+    0x544249: 133,
+    0x0C17F1: 9829,
+    0x7812B8: 9830,
+    0x10B7F6: 9831,
+    0x448E81: 9832,
+    0x0C8411: 9833,
+    0x98BC99: 9834,
+    0x904716: 9835,
+    0xA4DA3F: 9836,
+    0xA8C222: 9837,
+    0x003D41: 9838,
+    0xCC5076: 9839,
+    0x5C8778: 9840,
+    0x38BB23: 9841,
+    0x003A9B: 4,
+    0x2C3427: 9842,
+    0x80912A: 1087,
+    0x803B9A: 9843,
+    0x743256: 9844,
+    0x4CC452: 9845,
+    0x7CCB0D: 9846,
+    0xC01E9B: 9847,
+    0xC4E17C: 9848,
+    0x20BFDB: 9849,
+    0x448312: 9850,
+    0xE0ABFE: 9851,
+    0xA05DE7: 9852,
+    0x087618: 9853,
+    0xD0E40B: 9854,
+    0x747E1A: 9855,
+    0x14A86B: 9856,
+    0x0CC3A7: 9857,
+    0xDCE2AC: 9858,
+    0x98D88C: 1034,
+    0x78192E: 9859,
+    0x48EB30: 9860,
+    0x4C322D: 9861,
+    0xAC867E: 9862,
+    0x8C598B: 9863,
+    0xD44CA7: 9864,
+    0xA04025: 9865,
+    0x4C4B68: 9866,
+    0x201257: 9867,
+    0xE8DAAA: 9868,
+    0x647D81: 9869,
+    0x7CCFCF: 9870,
+    0xDC3350: 9871,
+    0xE064BB: 9872,
+    0x68AAD2: 9873,
+    0xA4DE50: 9874,
+    0xD8D67E: 9875,
+    0xC4AAA1: 9876,
+    0x1CF061: 9877,
+    0xA893E6: 9878,
+    0x3032D4: 9879,
+    0x04B466: 9880,
+    0x68CC9C: 9881,
+    0x146E0A: 13,
+    0x0CE709: 9882,
+    0x6C0F6A: 9883,
+    0xF0BCC8: 9884,
+    0x24828A: 9885,
+    0x00271B: 9886,
+    0x002718: 9887,
+    0x00270B: 9888,
+    0x00270D: 4,
+    0x002707: 9889,
+    0x0026FE: 9890,
+    0xB4B5AF: 9891,
+    0x04B3B6: 9892,
+    0x0026E5: 9893,
+    0x0026BC: 9894,
+    0x0026AE: 9895,
+    0x0026B1: 9896,
+    0x0026AA: 9897,
+    0x002670: 9898,
+    0x002671: 9899,
+    0x0026D7: 9900,
+    0x0026D0: 9901,
+    0x0026D2: 9902,
+    0x0026A0: 9903,
+    0x002696: 9904,
+    0x00269A: 9905,
+    0x002695: 9906,
+    0x002693: 9907,
+    0x0026CD: 9908,
+    0x00268E: 9909,
+    0x002678: 9910,
+    0x002677: 9911,
+    0x0026E3: 9912,
+    0x002665: 9913,
+    0x002660: 9914,
+    0x002614: 9915,
+    0x002610: 9916,
+    0x00260E: 9917,
+    0x00260D: 9918,
+    0x00260A: 4,
+    0x00262C: 9919,
+    0x00262E: 9920,
+    0x002629: 9921,
+    0x002648: 9922,
+    0x002645: 9923,
+    0x00263E: 9924,
+    0x00263C: 9925,
+    0x00263D: 9926,
+    0x002632: 9927,
+    0x0025E2: 9928,
+    0x0025E1: 9929,
+    0x002625: 9930,
+    0x002626: 9931,
+    0x00261B: 9932,
+    0x0025F9: 9933,
+    0x0025F7: 9934,
+    0x002603: 9935,
+    0x0025A6: 9936,
+    0x0025AA: 9937,
+    0x0025A3: 9938,
+    0x00259C: 1068,
+    0x0025A2: 9939,
+    0x0025DA: 9940,
+    0x0025DB: 9941,
+    0x0025D5: 9942,
+    0x0025CC: 9943,
+    0x0025C8: 9944,
+    0x0025C0: 9945,
+    0x0025BD: 9946,
+    0x0025B7: 9947,
+    0x00257D: 9948,
+    0x002588: 9949,
+    0x002580: 9950,
+    0x00256D: 9951,
+    0x00256C: 9952,
+    0x002563: 9953,
+    0x002593: 9954,
+    0x00258E: 9955,
+    0x00250D: 9956,
+    0x00250E: 9957,
+    0x002508: 9958,
+    0x002524: 9959,
+    0x002522: 4476,
+    0x00251B: 9960,
+    0x002518: 9961,
+    0x002515: 4542,
+    0x002536: 5116,
+    0x002541: 9962,
+    0x00254E: 9963,
+    0x002546: 4,
+    0x002545: 4,
+    0x002542: 9964,
+    0x002531: 9965,
+    0x00252D: 9966,
+    0x00252B: 9967,
+    0x0024FC: 9968,
+    0x002560: 9969,
+    0x0024B3: 9970,
+    0x0024AA: 9971,
+    0x0024D0: 9972,
+    0x0024CC: 9973,
+    0x0024CB: 9974,
+    0x0024D1: 6084,
+    0x0024C9: 9975,
+    0x0024CA: 9976,
+    0x0024A9: 9977,
+    0x0024A6: 9978,
+    0x0024A3: 9979,
+    0x0024FB: 13,
+    0x0024FA: 9980,
+    0x0024F6: 9981,
+    0x0024F0: 9982,
+    0x0024C7: 9983,
+    0x0024B8: 9984,
+    0x00249B: 9985,
+    0x002497: 4,
+    0x0024DF: 9986,
+    0x002425: 9987,
+    0x002427: 9988,
+    0x00241C: 9989,
+    0x002419: 13,
+    0x002415: 9990,
+    0x002411: 9991,
+    0x00240F: 9992,
+    0x00243F: 9993,
+    0x002440: 9994,
+    0x002446: 9995,
+    0x002445: 262,
+    0x002472: 9996,
+    0x002471: 9997,
+    0x002474: 9998,
+    0x0023FA: 9999,
+    0x0023F2: 10000,
+    0x00240A: 10001,
+    0x002407: 10002,
+    0x002463: 10003,
+    0x0023C2: 10004,
+    0x0023C4: 10005,
+    0x0023C5: 10006,
+    0x0023C6: 8916,
+    0x0023B9: 10007,
+    0x0023BD: 10008,
+    0x0023BF: 10009,
+    0x0023B2: 10010,
+    0x0023B5: 10011,
+    0x002390: 10012,
+    0x002388: 10013,
+    0x002386: 10014,
+    0x002383: 10015,
+    0x002381: 10016,
+    0x00237B: 10017,
+    0x002324: 10018,
+    0x0023E0: 10019,
+    0x0023D5: 10020,
+    0x0023E7: 10021,
+    0x0023E6: 10022,
+    0x0023E2: 10023,
+    0x0023C9: 10024,
+    0x0023CE: 10025,
+    0x0023CF: 10026,
+    0x0023A9: 10027,
+    0x0023A7: 865,
+    0x00239B: 10028,
+    0x0022EE: 10029,
+    0x0022EA: 10030,
+    0x0022F0: 10031,
+    0x0022EC: 10032,
+    0x002331: 1265,
+    0x002335: 10033,
+    0x00232F: 10034,
+    0x002319: 10035,
+    0x002311: 10036,
+    0x00235D: 4,
+    0x00235C: 10037,
+    0x002352: 10038,
+    0x002309: 10039,
+    0x002304: 4,
+    0x0022F9: 10040,
+    0x002353: 10041,
+    0x002342: 10042,
+    0x002337: 10043,
+    0x0022DD: 10044,
+    0x0022DB: 10045,
+    0x00236A: 10046,
+    0x002370: 7297,
+    0x002325: 10047,
+    0x002321: 10048,
+    0x002274: 10049,
+    0x00226A: 720,
+    0x002262: 10050,
+    0x002263: 10051,
+    0x00226C: 10052,
+    0x00225C: 10053,
+    0x0022B9: 10054,
+    0x0022B8: 10055,
+    0x0022B7: 10056,
+    0x0022B3: 10057,
+    0x0022AB: 10058,
+    0x00229B: 10059,
+    0x00229C: 10060,
+    0x00229A: 10061,
+    0x002284: 10062,
+    0x002286: 10063,
+    0x002282: 10064,
+    0x002276: 10065,
+    0x002254: 10066,
+    0x002257: 716,
+    0x002246: 10067,
+    0x002248: 157,
+    0x0022C5: 10068,
+    0x0022BF: 10069,
+    0x0022BE: 4,
+    0x002290: 4,
+    0x00228A: 10070,
+    0x00228E: 10071,
+    0x0022DA: 10072,
+    0x002214: 10073,
+    0x00220B: 10074,
+    0x00220C: 4,
+    0x0021EA: 10075,
+    0x0021FD: 10076,
+    0x002228: 10077,
+    0x002229: 10078,
+    0x002200: 2034,
+    0x002230: 10079,
+    0x00222E: 10080,
+    0x0021E1: 1034,
+    0x0021CD: 10081,
+    0x002216: 10082,
+    0x00216F: 10083,
+    0x002166: 993,
+    0x002164: 10084,
+    0x002160: 10085,
+    0x0021C0: 10086,
+    0x0021BB: 10087,
+    0x0021B1: 10088,
+    0x0021B0: 10089,
+    0x002152: 10090,
+    0x002158: 10091,
+    0x002188: 10092,
+    0x00217F: 10093,
+    0x00217D: 10094,
+    0x0021AD: 10095,
+    0x0021A3: 10096,
+    0x0021A5: 10097,
+    0x0021C6: 10098,
+    0x0021C3: 10099,
+    0x0021C7: 10100,
+    0x0021C1: 10101,
+    0x002148: 10102,
+    0x00219D: 10103,
+    0x002195: 10104,
+    0x002116: 10105,
+    0x002115: 10106,
+    0x002111: 10107,
+    0x002114: 10108,
+    0x002132: 10109,
+    0x002131: 10110,
+    0x002129: 1068,
+    0x00211D: 10111,
+    0x002120: 10112,
+    0x00211A: 10113,
+    0x002141: 10114,
+    0x00213D: 10115,
+    0x002140: 10116,
+    0x00213C: 10117,
+    0x001FE7: 10118,
+    0x001FDB: 10119,
+    0x001FD4: 10120,
+    0x001FCB: 10121,
+    0x001FF7: 10122,
+    0x001FEB: 10123,
+    0x001FB5: 10124,
+    0x001FAD: 10125,
+    0x001FBF: 10126,
+    0x001FBE: 10127,
+    0x001FC2: 10128,
+    0x001F9B: 10129,
+    0x001F97: 10130,
+    0x001F8C: 10131,
+    0x001F81: 10132,
+    0x001F83: 10133,
+    0x001F68: 10134,
+    0x001F63: 10135,
+    0x001F69: 10136,
+    0x001FD2: 10137,
+    0x001F78: 10138,
+    0x001F4D: 10139,
+    0x001FA6: 10140,
+    0x001F13: 10141,
+    0x001F10: 10142,
+    0x001F0F: 10143,
+    0x001F02: 10144,
+    0x001EFE: 10145,
+    0x001F34: 10146,
+    0x001F25: 10147,
+    0x001F27: 4,
+    0x001EDB: 10148,
+    0x001ED1: 10149,
+    0x001ED0: 10150,
+    0x001EEF: 10151,
+    0x001EDE: 10152,
+    0x001EDD: 10153,
+    0x001F42: 10154,
+    0x001F35: 10155,
+    0x001F26: 4,
+    0x001F1A: 10156,
+    0x001F18: 10157,
+    0x001ECD: 10158,
+    0x001EBF: 10159,
+    0x001EEB: 10160,
+    0x001EBC: 10161,
+    0x001EB1: 10162,
+    0x001EAF: 10163,
+    0x001EAD: 10164,
+    0x001E32: 10165,
+    0x001E35: 1265,
+    0x001E2B: 10166,
+    0x001E28: 10167,
+    0x001E43: 10168,
+    0x001E6F: 10169,
+    0x001E6A: 10170,
+    0x001E66: 10171,
+    0x001E63: 10172,
+    0x001E53: 10173,
+    0x001E4E: 10174,
+    0x001E49: 4,
+    0x001E42: 10175,
+    0x001E87: 10176,
+    0x001E7F: 10177,
+    0x001E82: 10178,
+    0x001E8E: 10179,
+    0x001EA1: 10180,
+    0x001DB9: 10181,
+    0x001DBB: 10182,
+    0x001DB3: 6210,
+    0x001DB1: 10183,
+    0x001DB4: 10184,
+    0x001E24: 10185,
+    0x001E20: 10186,
+    0x001E1C: 10187,
+    0x001E12: 10188,
+    0x001DDB: 10189,
+    0x001DE6: 4,
+    0x001DE7: 10190,
+    0x001E16: 10191,
+    0x001E08: 10192,
+    0x001DC5: 10193,
+    0x001DC6: 10194,
+    0x001DA4: 10195,
+    0x001D9F: 10196,
+    0x001DBF: 10197,
+    0x001DFB: 10198,
+    0x001D3E: 10199,
+    0x001D40: 10200,
+    0x001D34: 10201,
+    0x001D32: 10202,
+    0x001D2A: 9565,
+    0x001D2D: 10203,
+    0x001D90: 10204,
+    0x001D93: 10205,
+    0x001D94: 10206,
+    0x001D8E: 10207,
+    0x001D5D: 10208,
+    0x001D59: 10209,
+    0x001D57: 10210,
+    0x001D51: 10211,
+    0x001D2B: 10212,
+    0x001D22: 10213,
+    0x001D23: 10214,
+    0x001D7B: 10215,
+    0x001D6C: 10216,
+    0x001D4C: 940,
+    0x001D84: 10217,
+    0x001D85: 10218,
+    0x001D1A: 10219,
+    0x001D0B: 10220,
+    0x001D02: 10221,
+    0x001CFE: 10222,
+    0x001C81: 10223,
+    0x001C7A: 10224,
+    0x001C75: 10225,
+    0x001C74: 10226,
+    0x001CB7: 10227,
+    0x001CB1: 4,
+    0x001CAF: 10228,
+    0x001CE9: 10229,
+    0x001CEA: 10230,
+    0x001CCB: 10231,
+    0x001CBC: 10232,
+    0x001CDB: 10233,
+    0x001CD5: 10234,
+    0x001CD3: 10235,
+    0x001CE7: 10236,
+    0x001CE4: 10237,
+    0x001CE2: 10238,
+    0x001CAA: 10239,
+    0x001CA0: 10240,
+    0x001C98: 10241,
+    0x001C91: 10242,
+    0x001C92: 10243,
+    0x001C8A: 10244,
+    0x001C02: 10245,
+    0x001C05: 10246,
+    0x001C06: 8282,
+    0x001C04: 10247,
+    0x001C01: 10248,
+    0x001BFF: 10249,
+    0x001BEA: 1265,
+    0x001BE5: 10250,
+    0x001BE4: 10251,
+    0x001C68: 10252,
+    0x001C66: 10253,
+    0x001C2A: 10254,
+    0x001BF2: 10255,
+    0x001BF0: 10256,
+    0x001C4D: 10257,
+    0x001C38: 10258,
+    0x001C30: 10259,
+    0x001C2E: 6210,
+    0x001C53: 10260,
+    0x001C1B: 10261,
+    0x001C10: 1068,
+    0x001BC6: 10262,
+    0x001BC4: 10263,
+    0x001BC2: 10264,
+    0x001BBB: 10265,
+    0x001B5D: 10266,
+    0x001B5A: 10267,
+    0x001B56: 10268,
+    0x001B86: 10269,
+    0x001B7C: 10270,
+    0x001BD2: 10271,
+    0x001B8D: 10272,
+    0x001BAA: 10273,
+    0x001BA1: 10274,
+    0x001B96: 10275,
+    0x001AD5: 10276,
+    0x001AD0: 10277,
+    0x001AD3: 10278,
+    0x001AD8: 10279,
+    0x001ADA: 10280,
+    0x001ACB: 10281,
+    0x001ACF: 10282,
+    0x001B15: 10283,
+    0x001AEA: 10284,
+    0x001ADD: 10285,
+    0x001AD4: 10286,
+    0x001AD6: 10287,
+    0x001AFB: 10288,
+    0x001AFD: 10289,
+    0x001B03: 10290,
+    0x001B1E: 10291,
+    0x001B14: 10292,
+    0x001B4C: 10293,
+    0x001A6F: 10294,
+    0x001A71: 10295,
+    0x001A69: 10296,
+    0x001A67: 10297,
+    0x001AB8: 10298,
+    0x001ABC: 10299,
+    0x001AA3: 10300,
+    0x001A9B: 10301,
+    0x001A9D: 10302,
+    0x001AC3: 10230,
+    0x001ABF: 10303,
+    0x001A8E: 10304,
+    0x001A85: 10305,
+    0x001A64: 2034,
+    0x001A55: 10306,
+    0x001A1C: 10307,
+    0x001A1F: 10308,
+    0x001A23: 10309,
+    0x001A1D: 10310,
+    0x001A17: 10311,
+    0x001A51: 10312,
+    0x001A44: 10313,
+    0x0019E6: 10314,
+    0x0019E8: 4,
+    0x0019DF: 6084,
+    0x0019DD: 10315,
+    0x001A05: 10316,
+    0x0019FC: 10317,
+    0x0019D4: 10318,
+    0x0019CF: 10319,
+    0x001A49: 10320,
+    0x001A3D: 10321,
+    0x001A41: 10322,
+    0x001A0A: 10323,
+    0x001A33: 10324,
+    0x0019B2: 10325,
+    0x0019A4: 10326,
+    0x0019AA: 4,
+    0x0019B1: 10327,
+    0x001996: 10328,
+    0x001997: 10329,
+    0x001998: 10330,
+    0x00199C: 10331,
+    0x001952: 10332,
+    0x001946: 10333,
+    0x001949: 10334,
+    0x001967: 10335,
+    0x001971: 10336,
+    0x001964: 10337,
+    0x001976: 10338,
+    0x00196C: 10339,
+    0x0019B3: 10340,
+    0x00198B: 10341,
+    0x001961: 10342,
+    0x001944: 10343,
+    0x001942: 10344,
+    0x00193F: 10345,
+    0x001941: 10346,
+    0x00192D: 882,
+    0x001930: 4,
+    0x001927: 10347,
+    0x001908: 10348,
+    0x00190C: 10349,
+    0x0018FD: 10350,
+    0x0018F0: 10351,
+    0x0018E9: 10352,
+    0x0018EF: 10353,
+    0x0018E6: 10354,
+    0x0018DB: 10355,
+    0x0018D6: 10356,
+    0x0018CD: 10357,
+    0x0018C8: 10358,
+    0x0018BE: 10359,
+    0x0018BA: 4,
+    0x001919: 10360,
+    0x0018F7: 10361,
+    0x00189D: 10362,
+    0x001885: 390,
+    0x001888: 10363,
+    0x00188A: 10364,
+    0x001849: 10365,
+    0x001846: 10366,
+    0x001845: 10367,
+    0x00183D: 10368,
+    0x0018A3: 10369,
+    0x001893: 10370,
+    0x0018A0: 10371,
+    0x001863: 10372,
+    0x00185A: 10373,
+    0x0018B4: 10374,
+    0x0018B6: 10375,
+    0x0018B1: 2034,
+    0x001886: 10376,
+    0x001887: 10377,
+    0x00187B: 10378,
+    0x00187E: 10379,
+    0x001852: 10380,
+    0x001850: 10381,
+    0x001858: 10382,
+    0x001825: 13,
+    0x001879: 10383,
+    0x0017CE: 10384,
+    0x0017CD: 10385,
+    0x0017D0: 10386,
+    0x0017EF: 2034,
+    0x0017F5: 10387,
+    0x0017FE: 10388,
+    0x0017F8: 10389,
+    0x0017DB: 10390,
+    0x0017D6: 10391,
+    0x00181E: 10392,
+    0x0017C6: 10393,
+    0x0017C3: 10394,
+    0x0017B7: 10395,
+    0x001807: 10396,
+    0x001808: 10397,
+    0x001803: 10398,
+    0x0017AB: 1265,
+    0x001824: 10399,
+    0x001798: 10400,
+    0x00178F: 10401,
+    0x00178A: 10402,
+    0x001721: 10403,
+    0x001720: 10404,
+    0x00171A: 10405,
+    0x001789: 10406,
+    0x001787: 10407,
+    0x001760: 10408,
+    0x001761: 13,
+    0x001768: 10409,
+    0x001769: 10410,
+    0x001762: 10411,
+    0x00173E: 10412,
+    0x001734: 10413,
+    0x00172E: 10414,
+    0x00172B: 10415,
+    0x001726: 10416,
+    0x001772: 10417,
+    0x00177A: 10418,
+    0x00171C: 10419,
+    0x001716: 10420,
+    0x001747: 10421,
+    0x0016BD: 10422,
+    0x0016C0: 10423,
+    0x0016C2: 10424,
+    0x0016F1: 10425,
+    0x0016F4: 10426,
+    0x0016E7: 10427,
+    0x0016BA: 10428,
+    0x0016B2: 10429,
+    0x0016B3: 10430,
+    0x0016AD: 10431,
+    0x0016E5: 10432,
+    0x0016DD: 10433,
+    0x0016C8: 4,
+    0x0016C4: 10434,
+    0x0016F3: 10435,
+    0x0016F5: 10436,
+    0x0016F9: 10437,
+    0x00170A: 10438,
+    0x00162A: 10439,
+    0x001629: 10440,
+    0x001621: 10441,
+    0x00161A: 10442,
+    0x001631: 10443,
+    0x00162E: 10444,
+    0x00166E: 10445,
+    0x00166A: 10446,
+    0x001663: 10447,
+    0x001654: 10448,
+    0x001656: 1265,
+    0x001651: 10449,
+    0x00164B: 10450,
+    0x001688: 10451,
+    0x00168B: 10452,
+    0x001682: 10453,
+    0x00169F: 10454,
+    0x00169A: 10455,
+    0x001692: 10456,
+    0x001691: 10457,
+    0x0016AF: 10458,
+    0x00169E: 10459,
+    0x0015ED: 10460,
+    0x0015F0: 10461,
+    0x0015EE: 10462,
+    0x00160A: 10463,
+    0x001602: 10464,
+    0x001600: 10465,
+    0x0015F4: 10466,
+    0x0015C0: 10467,
+    0x0015C2: 10468,
+    0x0015B2: 10469,
+    0x001615: 10470,
+    0x001617: 10471,
+    0x001594: 10472,
+    0x001590: 10473,
+    0x001610: 10474,
+    0x001606: 10475,
+    0x001607: 10476,
+    0x0015A5: 10477,
+    0x0015C8: 10478,
+    0x0015DA: 10479,
+    0x00154A: 10480,
+    0x00154C: 10481,
+    0x00154D: 10482,
+    0x001549: 10483,
+    0x001511: 10484,
+    0x00150E: 10485,
+    0x00150D: 10486,
+    0x001506: 10487,
+    0x001504: 10488,
+    0x001505: 659,
+    0x00158C: 10489,
+    0x00158F: 10490,
+    0x001583: 10491,
+    0x001588: 10492,
+    0x001585: 10493,
+    0x00152B: 4,
+    0x00152C: 4,
+    0x001528: 10494,
+    0x001527: 10495,
+    0x001521: 10496,
+    0x001520: 10497,
+    0x001539: 10498,
+    0x001531: 10499,
+    0x001535: 10500,
+    0x001536: 10501,
+    0x00151C: 10502,
+    0x001519: 10503,
+    0x001547: 10504,
+    0x00153D: 10505,
+    0x001544: 10506,
+    0x00156B: 10507,
+    0x001566: 10508,
+    0x001579: 10509,
+    0x0014CF: 10510,
+    0x0014BE: 10511,
+    0x0014B2: 10512,
+    0x0014AE: 10513,
+    0x0014A6: 10514,
+    0x0014AA: 10515,
+    0x001489: 10516,
+    0x0014BA: 10517,
+    0x0014B6: 10518,
+    0x0014D7: 10519,
+    0x0014DD: 10520,
+    0x0014D4: 10521,
+    0x0014E6: 10522,
+    0x0014DE: 10523,
+    0x0014DF: 10524,
+    0x0014FE: 10525,
+    0x0014F3: 10526,
+    0x00148A: 10527,
+    0x001409: 8208,
+    0x00140B: 10528,
+    0x0013FD: 889,
+    0x001400: 10529,
+    0x0013FC: 10530,
+    0x001480: 10531,
+    0x00147E: 10532,
+    0x00147D: 10533,
+    0x001476: 10534,
+    0x001473: 10535,
+    0x00144F: 4606,
+    0x001456: 10536,
+    0x001450: 10537,
+    0x001452: 10538,
+    0x00145D: 10539,
+    0x001442: 10540,
+    0x001447: 10541,
+    0x00143E: 10542,
+    0x00143B: 10543,
+    0x00142D: 4420,
+    0x001414: 10544,
+    0x001429: 10545,
+    0x00141E: 10546,
+    0x00146E: 10547,
+    0x001469: 4,
+    0x0013D8: 10548,
+    0x0013CB: 10549,
+    0x0013CF: 10550,
+    0x0013C9: 10551,
+    0x001378: 10552,
+    0x00137A: 10553,
+    0x001381: 10554,
+    0x0013F6: 10555,
+    0x0013F3: 10556,
+    0x0013F4: 10557,
+    0x0013E9: 10558,
+    0x0013BE: 10559,
+    0x0013B9: 10560,
+    0x0013AB: 10561,
+    0x001395: 10562,
+    0x0013A8: 10563,
+    0x001399: 10564,
+    0x0013AC: 10565,
+    0x0013C6: 10566,
+    0x0013DA: 10567,
+    0x001367: 10568,
+    0x00135C: 10569,
+    0x00135F: 4,
+    0x001356: 10570,
+    0x00135A: 10571,
+    0x001361: 10572,
+    0x001362: 10573,
+    0x00134F: 10574,
+    0x001338: 10575,
+    0x00132D: 10576,
+    0x00132C: 10577,
+    0x001324: 10578,
+    0x001326: 10579,
+    0x001327: 10580,
+    0x0012F6: 10581,
+    0x0012F4: 10582,
+    0x0012F1: 10583,
+    0x0012F5: 10584,
+    0x00130F: 10585,
+    0x001313: 10586,
+    0x0012F8: 10587,
+    0x00131D: 10588,
+    0x001318: 10589,
+    0x00131A: 4,
+    0x00130C: 10590,
+    0x001379: 10591,
+    0x001374: 10592,
+    0x001369: 10593,
+    0x001342: 10594,
+    0x00133B: 10595,
+    0x001301: 10596,
+    0x0012CB: 10597,
+    0x0012CE: 10598,
+    0x0012CA: 10599,
+    0x0012C7: 10600,
+    0x0012E8: 10601,
+    0x0012DD: 10602,
+    0x0012E0: 10603,
+    0x0012A1: 10604,
+    0x00129B: 10605,
+    0x001298: 10606,
+    0x0012AC: 10607,
+    0x0012BC: 10608,
+    0x0012BD: 10609,
+    0x0012AB: 10610,
+    0x0012CD: 10611,
+    0x0012C0: 10612,
+    0x0012B7: 10613,
+    0x0012DE: 10614,
+    0x00127C: 10615,
+    0x001278: 10616,
+    0x00127A: 10617,
+    0x001206: 10618,
+    0x001207: 10619,
+    0x001209: 10620,
+    0x00120B: 10621,
+    0x001205: 10622,
+    0x001254: 10623,
+    0x00124F: 10624,
+    0x001249: 10625,
+    0x001221: 10626,
+    0x001212: 10627,
+    0x001213: 10628,
+    0x001218: 10629,
+    0x001266: 10630,
+    0x00125E: 10631,
+    0x00125D: 10632,
+    0x001272: 10633,
+    0x00126A: 10634,
+    0x001268: 10635,
+    0x00123E: 10636,
+    0x00123A: 10637,
+    0x001234: 10638,
+    0x00124D: 10639,
+    0x001238: 10640,
+    0x00123C: 10641,
+    0x001223: 10642,
+    0x001190: 10643,
+    0x001196: 10644,
+    0x001187: 10645,
+    0x00116F: 10646,
+    0x001171: 10647,
+    0x001167: 10648,
+    0x0011D3: 10649,
+    0x0011C4: 10650,
+    0x0011CB: 10651,
+    0x00117B: 10652,
+    0x0011E3: 10653,
+    0x0011DC: 10654,
+    0x0011F7: 10655,
+    0x0011AB: 10656,
+    0x0011A5: 10657,
+    0x000FFE: 10018,
+    0x000FDA: 10658,
+    0x000FEF: 10659,
+    0x001105: 16,
+    0x001102: 10660,
+    0x00113C: 10661,
+    0x001131: 10662,
+    0x00114E: 10663,
+    0x001145: 10664,
+    0x001127: 10665,
+    0x00112A: 10666,
+    0x00112B: 10667,
+    0x00112D: 10668,
+    0x001154: 10669,
+    0x001151: 10670,
+    0x001123: 10671,
+    0x00110F: 10672,
+    0x00116D: 10673,
+    0x001160: 10674,
+    0x001115: 10675,
+    0x00110B: 10676,
+    0x000FEE: 10677,
+    0x000FE4: 5890,
+    0x000FE7: 10678,
+    0x000FE6: 10679,
+    0x000FE9: 10680,
+    0x000FE1: 10681,
+    0x000FAB: 10682,
+    0x000FAD: 10683,
+    0x000FAC: 10684,
+    0x000FB3: 659,
+    0x000F9C: 10685,
+    0x000F7A: 10686,
+    0x000F64: 10687,
+    0x000F72: 10688,
+    0x000F75: 10689,
+    0x000F7C: 10690,
+    0x000FC7: 10691,
+    0x000FC8: 10692,
+    0x000FBB: 4062,
+    0x000FBC: 10693,
+    0x000FDF: 10694,
+    0x000FD6: 10695,
+    0x000F98: 10696,
+    0x000F97: 10697,
+    0x000F96: 1067,
+    0x000FB6: 10698,
+    0x000FB9: 10699,
+    0x000F8B: 10700,
+    0x000F8C: 10701,
+    0x000F45: 10702,
+    0x000F3B: 10703,
+    0x000F37: 10704,
+    0x000F38: 10705,
+    0x000F3A: 10706,
+    0x000F34: 4,
+    0x000F30: 10707,
+    0x000F2E: 10708,
+    0x000F26: 10709,
+    0x000F53: 5035,
+    0x000F51: 10710,
+    0x000F07: 10711,
+    0x000F00: 10712,
+    0x000F01: 10713,
+    0x000F03: 10714,
+    0x000F54: 10715,
+    0x000EDF: 10716,
+    0x000EE1: 10717,
+    0x000F25: 10718,
+    0x000F19: 10719,
+    0x000ED3: 10720,
+    0x000ED7: 4,
+    0x000F10: 10721,
+    0x000EC5: 10722,
+    0x000EC7: 10723,
+    0x000EBA: 10724,
+    0x000EBC: 10725,
+    0x000EA8: 10726,
+    0x000E8B: 10727,
+    0x000E80: 10728,
+    0x000EAA: 10729,
+    0x000EAC: 10730,
+    0x000EAE: 10731,
+    0x000EA4: 10732,
+    0x000E6B: 10733,
+    0x000E67: 10734,
+    0x000E65: 10735,
+    0x000E7A: 10736,
+    0x000E6C: 10737,
+    0x000E9D: 10738,
+    0x000E5F: 10739,
+    0x000E57: 10740,
+    0x000E47: 10741,
+    0x000E85: 10742,
+    0x000E74: 10743,
+    0x000DE7: 10744,
+    0x000DF0: 10745,
+    0x000DE5: 10746,
+    0x000DDD: 10747,
+    0x000DF5: 10748,
+    0x000DF7: 10749,
+    0x000DEB: 10750,
+    0x000DEE: 10751,
+    0x000DEF: 10752,
+    0x000E11: 10753,
+    0x000DF8: 10754,
+    0x000E46: 10755,
+    0x000E43: 10756,
+    0x000E44: 10757,
+    0x000E1F: 10758,
+    0x000E26: 10759,
+    0x000E16: 10760,
+    0x000E0B: 10761,
+    0x000E32: 10762,
+    0x000DAF: 10763,
+    0x000DB1: 10764,
+    0x000DA7: 13,
+    0x000DAD: 10765,
+    0x000DA9: 10766,
+    0x000DAB: 10767,
+    0x000D78: 10768,
+    0x000D79: 10769,
+    0x000D6D: 10770,
+    0x000D6E: 10771,
+    0x000DA8: 10772,
+    0x000D9E: 10773,
+    0x000DA3: 10774,
+    0x000DA4: 10775,
+    0x000D9A: 10776,
+    0x000DC0: 10777,
+    0x000DC6: 10778,
+    0x000DC1: 10779,
+    0x000D85: 10780,
+    0x000D82: 10781,
+    0x000D83: 10782,
+    0x000D7F: 10783,
+    0x000D75: 10784,
+    0x000D6A: 10785,
+    0x000D5D: 10786,
+    0x000D63: 10787,
+    0x000D66: 4,
+    0x000D96: 10788,
+    0x000D8B: 10789,
+    0x000D90: 10790,
+    0x000DBA: 10791,
+    0x000DBD: 4,
+    0x000DB5: 10792,
+    0x000DB4: 10793,
+    0x000CCB: 10794,
+    0x000CC9: 10795,
+    0x000D02: 404,
+    0x000D07: 10796,
+    0x000D2F: 10797,
+    0x000D21: 10798,
+    0x000D23: 10799,
+    0x000D27: 10800,
+    0x000D1B: 10801,
+    0x000D1D: 10802,
+    0x000D09: 10803,
+    0x000CEE: 10804,
+    0x000CE9: 10805,
+    0x000CEA: 10806,
+    0x000D40: 10807,
+    0x000D37: 10808,
+    0x000D33: 10809,
+    0x000CDA: 10810,
+    0x000CDD: 10811,
+    0x000CCD: 10812,
+    0x000CFB: 10813,
+    0x000CF5: 10814,
+    0x000C85: 4,
+    0x000C84: 10815,
+    0x000C7A: 10816,
+    0x000C79: 10817,
+    0x000C6D: 10818,
+    0x000C70: 10819,
+    0x000C6A: 10820,
+    0x000C6B: 10821,
+    0x000C9D: 10822,
+    0x000C9F: 10823,
+    0x000C9A: 10824,
+    0x000C91: 10825,
+    0x000C5D: 10826,
+    0x000C4F: 10827,
+    0x000C62: 10828,
+    0x000C4C: 10829,
+    0x000C47: 10830,
+    0x000CAF: 10831,
+    0x000CB3: 10832,
+    0x000CA5: 10833,
+    0x000CA9: 10834,
+    0x000C75: 10835,
+    0x000C20: 10836,
+    0x000C15: 10837,
+    0x000BD6: 10838,
+    0x000BD0: 10839,
+    0x000BD4: 10840,
+    0x000BE7: 10841,
+    0x000BDA: 10842,
+    0x000C16: 10843,
+    0x000C09: 10844,
+    0x000BEC: 10845,
+    0x000C3F: 10846,
+    0x000C30: 4,
+    0x000C1F: 10847,
+    0x000C02: 10848,
+    0x000BFF: 10849,
+    0x000B73: 10850,
+    0x000B76: 10851,
+    0x000B5E: 10852,
+    0x000B5F: 4,
+    0x000B60: 4,
+    0x000B65: 10853,
+    0x000B61: 10854,
+    0x000B99: 10855,
+    0x000B9C: 10856,
+    0x000B89: 10857,
+    0x000B8B: 10858,
+    0x000B59: 10859,
+    0x000B5C: 10860,
+    0x000B5B: 10861,
+    0x000B7C: 10862,
+    0x000B83: 10863,
+    0x000B71: 10864,
+    0x000B74: 10865,
+    0x000B7E: 10866,
+    0x000B80: 10867,
+    0x000BA7: 10868,
+    0x000BAA: 10869,
+    0x000BA4: 10870,
+    0x000BC1: 10871,
+    0x000BC5: 10872,
+    0x000BC6: 10873,
+    0x000B41: 10874,
+    0x000B05: 10875,
+    0x000B00: 10876,
+    0x000B03: 10877,
+    0x000B01: 10878,
+    0x000AEA: 10879,
+    0x000AE3: 10880,
+    0x000ADC: 5446,
+    0x000AE0: 10881,
+    0x000B20: 10882,
+    0x000B22: 10883,
+    0x000B1B: 10884,
+    0x000B3E: 10885,
+    0x000B29: 10886,
+    0x000ABB: 10887,
+    0x000AAD: 10888,
+    0x000B39: 10889,
+    0x000B33: 10890,
+    0x000B11: 10891,
+    0x000A6E: 3091,
+    0x000A6D: 10892,
+    0x000A74: 10893,
+    0x000A6F: 10894,
+    0x000AA4: 10895,
+    0x000A9E: 10896,
+    0x000A90: 10897,
+    0x000A9D: 10898,
+    0x000AB1: 10899,
+    0x000AB7: 4,
+    0x000AB9: 10900,
+    0x000AA1: 10901,
+    0x000A25: 8552,
+    0x000A21: 10902,
+    0x000A1E: 10903,
+    0x000A4B: 10904,
+    0x000A43: 10905,
+    0x000A45: 10906,
+    0x000A33: 1102,
+    0x000A2E: 10907,
+    0x000A2D: 10908,
+    0x000A35: 10909,
+    0x000A3B: 10910,
+    0x000A8B: 4,
+    0x000A88: 10911,
+    0x000A7C: 10912,
+    0x000A63: 10913,
+    0x000A67: 10914,
+    0x0009DA: 10915,
+    0x0009D7: 10916,
+    0x0009D8: 10917,
+    0x0009DB: 10918,
+    0x0009D5: 10919,
+    0x0009FB: 10920,
+    0x0009F9: 10921,
+    0x0009FD: 10922,
+    0x0009B6: 4,
+    0x0009B3: 10923,
+    0x0009A3: 10924,
+    0x0009A5: 10925,
+    0x0009D3: 10926,
+    0x000A14: 10927,
+    0x000A0B: 10928,
+    0x000A10: 10929,
+    0x0009E6: 10930,
+    0x0009E2: 10931,
+    0x00099A: 10932,
+    0x00099C: 10933,
+    0x0009BC: 2665,
+    0x0009BE: 10934,
+    0x000992: 10935,
+    0x000995: 10936,
+    0x000998: 10937,
+    0x00098F: 10938,
+    0x000986: 10939,
+    0x000987: 10940,
+    0x000989: 10941,
+    0x00098C: 10942,
+    0x000985: 10943,
+    0x00098D: 10944,
+    0x000981: 10945,
+    0x00092C: 10946,
+    0x00092B: 10947,
+    0x000926: 10948,
+    0x000927: 10949,
+    0x000923: 10950,
+    0x00091D: 10951,
+    0x000955: 10952,
+    0x00094A: 10953,
+    0x00094B: 10954,
+    0x00094D: 10955,
+    0x000950: 10956,
+    0x000954: 10957,
+    0x000952: 10958,
+    0x000944: 4,
+    0x000962: 10959,
+    0x00095D: 10960,
+    0x00095C: 10961,
+    0x000958: 10962,
+    0x000909: 10963,
+    0x00090A: 10964,
+    0x000984: 10965,
+    0x000917: 10966,
+    0x000873: 10967,
+    0x00087A: 10968,
+    0x000871: 10969,
+    0x00087E: 10970,
+    0x000880: 10971,
+    0x0008B4: 10972,
+    0x0008B3: 10973,
+    0x0008B2: 10974,
+    0x0008B1: 10975,
+    0x0008AF: 10976,
+    0x0008A6: 10977,
+    0x0008EB: 10978,
+    0x0008E8: 10979,
+    0x0008DC: 10980,
+    0x0008DD: 10981,
+    0x0008E1: 10982,
+    0x0008DA: 10983,
+    0x0008D4: 10984,
+    0x0008D6: 10985,
+    0x0008CE: 10986,
+    0x00088E: 10987,
+    0x000881: 10988,
+    0x000882: 10989,
+    0x000903: 10990,
+    0x000907: 10991,
+    0x000906: 10992,
+    0x0008FB: 10993,
+    0x0008EE: 10994,
+    0x0008C2: 4,
+    0x0008C0: 10995,
+    0x0008A3: 4,
+    0x00089E: 10996,
+    0x0007DD: 10997,
+    0x0007D5: 10998,
+    0x0007DB: 10999,
+    0x00086D: 11000,
+    0x00086A: 11001,
+    0x000863: 11002,
+    0x000866: 11003,
+    0x00085F: 11004,
+    0x00047B: 11005,
+    0x0007D1: 11006,
+    0x0007B9: 11007,
+    0x00047F: 11008,
+    0x00080C: 11009,
+    0x000804: 11010,
+    0x0007FF: 11011,
+    0x0007F7: 11012,
+    0x000829: 11013,
+    0x00081B: 11014,
+    0x0007B4: 4,
+    0x0007B3: 4,
+    0x0007B5: 11015,
+    0x0007EF: 11016,
+    0x0007F4: 11017,
+    0x000852: 11018,
+    0x000857: 11019,
+    0x000736: 11020,
+    0x000738: 11021,
+    0x00077F: 11022,
+    0x000771: 11023,
+    0x000770: 1347,
+    0x000764: 11024,
+    0x000766: 11025,
+    0x000761: 11026,
+    0x000755: 11027,
+    0x000759: 11028,
+    0x000751: 11029,
+    0x000750: 4,
+    0x000789: 11030,
+    0x000787: 11031,
+    0x000785: 4,
+    0x000775: 11032,
+    0x000793: 11033,
+    0x000796: 11034,
+    0x00078B: 11035,
+    0x000783: 11036,
+    0x000742: 11037,
+    0x00074B: 11038,
+    0x00074A: 11039,
+    0x00073C: 2258,
+    0x000719: 11040,
+    0x00070D: 4,
+    0x00070E: 4,
+    0x00070B: 11041,
+    0x0007A2: 11042,
+    0x000729: 11043,
+    0x00072A: 11044,
+    0x0006EE: 11045,
+    0x0006E8: 11046,
+    0x0006E2: 11047,
+    0x0006E1: 11048,
+    0x000710: 11049,
+    0x0006F8: 5381,
+    0x0006FB: 11050,
+    0x0006FC: 11051,
+    0x0006B5: 6285,
+    0x0006A5: 11052,
+    0x00069D: 11053,
+    0x0006A8: 11054,
+    0x0006A0: 11055,
+    0x0006BA: 11056,
+    0x0006BE: 11057,
+    0x0006C4: 11058,
+    0x0006F4: 11059,
+    0x000690: 11060,
+    0x0006DA: 11061,
+    0x0006D0: 11062,
+    0x0006CC: 11063,
+    0x0006BF: 11064,
+    0x00067E: 11065,
+    0x000677: 11066,
+    0x00062E: 11067,
+    0x000625: 11068,
+    0x000627: 11069,
+    0x000624: 11070,
+    0x00062C: 11071,
+    0x000621: 11072,
+    0x00061C: 11073,
+    0x0005F5: 11074,
+    0x0005FD: 11075,
+    0x0005E4: 11076,
+    0x0005F2: 11077,
+    0x0005F3: 11078,
+    0x000601: 11079,
+    0x000667: 11080,
+    0x000660: 11081,
+    0x00064E: 11082,
+    0x00062D: 11083,
+    0x00063C: 11084,
+    0x000630: 11085,
+    0x000637: 11086,
+    0x0005DF: 11087,
+    0x0005E0: 11088,
+    0x0005D8: 11089,
+    0x0005DE: 11090,
+    0x0005C4: 11091,
+    0x000605: 11092,
+    0x0005FA: 11093,
+    0x0005E5: 11094,
+    0x000623: 11095,
+    0x00060B: 3809,
+    0x000615: 11096,
+    0x00060A: 11097,
+    0x000679: 11098,
+    0x00066C: 11099,
+    0x000666: 11100,
+    0x000646: 11101,
+    0x00064B: 11102,
+    0x000563: 11103,
+    0x000557: 11104,
+    0x00055B: 4951,
+    0x000554: 11105,
+    0x000553: 11106,
+    0x00054B: 11107,
+    0x000567: 11108,
+    0x000565: 11109,
+    0x000566: 11110,
+    0x00056C: 11111,
+    0x00055F: 4,
+    0x00055D: 11112,
+    0x000561: 11113,
+    0x0005D4: 11114,
+    0x0005CE: 11115,
+    0x000594: 7526,
+    0x00057C: 11116,
+    0x000583: 11117,
+    0x00056F: 11118,
+    0x000574: 4,
+    0x00059E: 11119,
+    0x00058E: 11120,
+    0x0005C2: 6919,
+    0x00059D: 11121,
+    0x0005A4: 11122,
+    0x0005B3: 11123,
+    0x0005A5: 11124,
+    0x0005A3: 11125,
+    0x000542: 11126,
+    0x0004F6: 11127,
+    0x0004F4: 11128,
+    0x0004F1: 11129,
+    0x000521: 7397,
+    0x00051F: 11130,
+    0x000523: 11131,
+    0x000537: 11132,
+    0x000532: 4,
+    0x000511: 11133,
+    0x000506: 11134,
+    0x00050A: 11135,
+    0x0004EC: 11136,
+    0x0004E4: 11137,
+    0x00050C: 11138,
+    0x0004E2: 10872,
+    0x000536: 11139,
+    0x000526: 11140,
+    0x00042F: 11141,
+    0x000429: 11142,
+    0x000426: 11143,
+    0x000421: 11144,
+    0x000424: 11145,
+    0x00041D: 11146,
+    0x00041A: 11147,
+    0x00041E: 11148,
+    0x000467: 11149,
+    0x00045A: 11068,
+    0x000463: 11150,
+    0x00045C: 11151,
+    0x000451: 11152,
+    0x000453: 11153,
+    0x000450: 11154,
+    0x000443: 1161,
+    0x000449: 11155,
+    0x0004CB: 11156,
+    0x0004CC: 11157,
+    0x0004C8: 11158,
+    0x0004BF: 11159,
+    0x0004C3: 11160,
+    0x0004B1: 11161,
+    0x000483: 11162,
+    0x000482: 11163,
+    0x000415: 11164,
+    0x000441: 11165,
+    0x0004B5: 11166,
+    0x0003C7: 11167,
+    0x0003C2: 11168,
+    0x0003C6: 11169,
+    0x0003BB: 11170,
+    0x0003BE: 11171,
+    0x000403: 11172,
+    0x000406: 11173,
+    0x0003F8: 11174,
+    0x0003FA: 11175,
+    0x0003FB: 11176,
+    0x0003F6: 11177,
+    0x000397: 11178,
+    0x000398: 11179,
+    0x00039E: 11180,
+    0x000392: 11181,
+    0x000395: 11182,
+    0x0003E5: 11183,
+    0x0003E8: 11184,
+    0x0003DF: 11185,
+    0x0003DA: 11186,
+    0x0003D9: 11187,
+    0x0003F3: 11188,
+    0x0003EC: 11189,
+    0x0003E9: 11190,
+    0x0003B4: 11191,
+    0x0003A6: 11192,
+    0x0003A4: 11193,
+    0x0003AB: 11194,
+    0x0003CA: 11195,
+    0x0003CB: 11196,
+    0x00037C: 11197,
+    0x00037F: 10592,
+    0x0002F0: 11198,
+    0x00038E: 11199,
+    0x00030D: 11200,
+    0x000309: 11201,
+    0x000303: 11202,
+    0x000305: 11203,
+    0x0002FE: 11204,
+    0x00019F: 11205,
+    0x0002FF: 11206,
+    0x000321: 11207,
+    0x000316: 11208,
+    0x00030F: 11209,
+    0x000311: 11210,
+    0x000327: 7526,
+    0x00032E: 11211,
+    0x000329: 11212,
+    0x00031A: 11213,
+    0x00035B: 11214,
+    0x000357: 11215,
+    0x000345: 11216,
+    0x0002E9: 11217,
+    0x0002E5: 11218,
+    0x0002E0: 11219,
+    0x00033F: 11220,
+    0x000368: 11221,
+    0x0002F5: 11222,
+    0x0002B7: 11223,
+    0x0002AF: 11224,
+    0x0002A8: 11225,
+    0x0002AB: 11226,
+    0x0002A4: 11227,
+    0x0002A3: 11228,
+    0x0002A0: 11229,
+    0x0002C8: 11230,
+    0x0002B8: 11231,
+    0x0002BB: 11232,
+    0x0002BC: 11233,
+    0x0002A9: 11234,
+    0x0002B2: 11235,
+    0x00025B: 11236,
+    0x000256: 11237,
+    0x000259: 11238,
+    0x000251: 11239,
+    0x00026A: 11240,
+    0x00026C: 11241,
+    0x000262: 11242,
+    0x000265: 11243,
+    0x00028A: 11244,
+    0x0001FA: 11245,
+    0x000282: 11246,
+    0x000285: 11247,
+    0x000294: 11248,
+    0x000296: 11249,
+    0x00028E: 11250,
+    0x000279: 11251,
+    0x00024F: 11252,
+    0x0002D5: 11253,
+    0x0002CE: 11254,
+    0x0002C3: 11255,
+    0x00023C: 11256,
+    0x00022C: 11257,
+    0x0001FF: 11258,
+    0x0001FC: 4365,
+    0x0001FD: 11259,
+    0x0001EE: 11260,
+    0x0001F0: 11261,
+    0x0001F1: 11262,
+    0x0001E2: 11263,
+    0x00022F: 11264,
+    0x000227: 11265,
+    0x00021D: 11266,
+    0x000219: 11267,
+    0x0001DA: 11268,
+    0x0001D2: 11269,
+    0x0001C6: 11270,
+    0x000210: 11271,
+    0x00020B: 11272,
+    0x000218: 11273,
+    0x000203: 11274,
+    0x0001F5: 11275,
+    0x0001CE: 11276,
+    0x0001BB: 11277,
+    0x0001BC: 11278,
+    0x0001C0: 11279,
+    0x0001A0: 11280,
+    0x000196: 4,
+    0x00017C: 11281,
+    0x0001D3: 11282,
+    0x0001E1: 4960,
+    0x000199: 11283,
+    0x000110: 11284,
+    0x000112: 11285,
+    0x000116: 11286,
+    0x000108: 11287,
+    0x00306C: 11288,
+    0x00308B: 11289,
+    0x000177: 11290,
+    0x00014D: 11291,
+    0x000174: 11292,
+    0x00015E: 11293,
+    0x000161: 11294,
+    0x000155: 11295,
+    0x0001A1: 11296,
+    0x000186: 11297,
+    0x0001A6: 11298,
+    0x000172: 11299,
+    0x00012E: 11300,
+    0x00013E: 11301,
+    0x000132: 11302,
+    0x00013B: 11303,
+    0x00019D: 11304,
+    0x00018B: 11305,
+    0x00018D: 11306,
+    0x000113: 11307,
+    0x000134: 11308,
+    0x00011E: 11309,
+    0x00016E: 11310,
+    0x003032: 11311,
+    0x0030EA: 11312,
+    0x003069: 11313,
+    0x0030C3: 11314,
+    0x00305A: 11315,
+    0x00309B: 11316,
+    0x003045: 11317,
+    0x0030E5: 11318,
+    0x003094: 4,
+    0x003040: 4,
+    0x00308A: 11319,
+    0x00062B: 11320,
+    0x000100: 11321,
+    0x00B09D: 11322,
+    0x00B06D: 11323,
+    0x00B094: 11324,
+    0x003072: 11325,
+    0x003006: 11326,
+    0x003038: 11327,
+    0x003079: 11328,
+    0x0030F0: 11329,
+    0x0030C9: 11330,
+    0x00300C: 11331,
+    0x00304C: 11332,
+    0x0030E8: 11333,
+    0x003028: 11334,
+    0x0030D9: 11335,
+    0x003026: 11336,
+    0x003047: 11337,
+    0x003077: 11338,
+    0x0030D4: 11339,
+    0x003010: 11340,
+    0x003017: 11341,
+    0x0030F7: 11342,
+    0x00D0D7: 11343,
+    0x00D073: 11344,
+    0x00D057: 11345,
+    0x00D0E5: 11346,
+    0x00D0D3: 4,
+    0x00D017: 11347,
+    0x00D036: 11348,
+    0x0030AB: 11349,
+    0x003049: 11350,
+    0x00306D: 7578,
+    0x00D045: 11351,
+    0x00D004: 11352,
+    0x00D005: 11353,
+    0x003080: 4,
+    0x003081: 11354,
+    0x0030D0: 11355,
+    0x003014: 11356,
+    0x00301C: 11357,
+    0x00D01E: 11358,
+    0x00D065: 11359,
+    0x00D014: 11360,
+    0x00D0CA: 11084,
+    0x00D023: 11361,
+    0x00D0A2: 8945,
+    0x00D010: 11362,
+    0x00D04B: 11363,
+    0x00D00E: 11364,
+    0x00D012: 11365,
+    0x00D04D: 11366,
+    0x00D02E: 11367,
+    0x00D0C5: 11368,
+    0x00D046: 11369,
+    0x00D0DE: 11370,
+    0x00D00C: 11371,
+    0x00D0DA: 11372,
+    0x00D03C: 11373,
+    0x00D09A: 11374,
+    0x00D0AE: 11375,
+    0x00D0F2: 11376,
+    0x00D0A8: 11377,
+    0x00D0B4: 11378,
+    0x00D086: 11379,
+    0x00D0E8: 11380,
+    0x00D06B: 11381,
+    0x00D0DC: 11382,
+    0x00D026: 11383,
+    0x00D0F0: 11384,
+    0x00D0E3: 11385,
+    0x00D0C4: 11386,
+    0x00D061: 11387,
+    0x00D0AB: 11388,
+    0x00D01D: 11389,
+    0x00D0A7: 11390,
+    0x005076: 2034,
+    0x0050D4: 11391,
+    0x0050A6: 11392,
+    0x0050DB: 11393,
+    0x00507C: 11394,
+    0x005047: 13,
+    0x005084: 10732,
+    0x0050A9: 11395,
+    0x00509B: 11396,
+    0x00507E: 11397,
+    0x0050CE: 11398,
+    0x0050F7: 11399,
+    0x005019: 11400,
+    0x00501B: 11401,
+    0x0050DC: 11402,
+    0x005008: 11403,
+    0x00501F: 11404,
+    0x0050FD: 11405,
+    0x0050BF: 3076,
+    0x005036: 11406,
+    0x005083: 11407,
+    0x00D06C: 11408,
+    0x00D0EE: 11409,
+    0x00504C: 11410,
+    0x00D034: 11411,
+    0x00D08A: 11412,
+    0x0050A7: 4,
+    0x005043: 11413,
+    0x0050FA: 11414,
+    0x005055: 11415,
+    0x005072: 11416,
+    0x0090EF: 11417,
+    0x0090C5: 11418,
+    0x00908C: 11419,
+    0x009048: 11420,
+    0x009007: 11421,
+    0x00902D: 11422,
+    0x005016: 11423,
+    0x005052: 11424,
+    0x005064: 11425,
+    0x00903D: 11426,
+    0x009057: 11427,
+    0x009083: 11428,
+    0x0090D7: 11429,
+    0x005027: 11430,
+    0x00505A: 11431,
+    0x005039: 11432,
+    0x005095: 11433,
+    0x0090B9: 11434,
+    0x0090A5: 11435,
+    0x0090A3: 11436,
+    0x00901F: 11437,
+    0x009038: 11438,
+    0x0090B0: 11439,
+    0x00505B: 11440,
+    0x0050CC: 818,
+    0x0090D4: 11441,
+    0x0090C4: 11442,
+    0x0050B8: 11443,
+    0x0090B6: 11444,
+    0x009063: 11445,
+    0x009062: 11446,
+    0x0090C3: 11447,
+    0x00905A: 11448,
+    0x0090EC: 11449,
+    0x0010FB: 11450,
+    0x001053: 11451,
+    0x0010ED: 11452,
+    0x00109D: 11453,
+    0x00100E: 11454,
+    0x009095: 11455,
+    0x009041: 11456,
+    0x009024: 11457,
+    0x00903A: 11458,
+    0x0090B2: 11459,
+    0x009082: 11460,
+    0x009000: 11461,
+    0x009054: 11462,
+    0x00906E: 11463,
+    0x0090F6: 11464,
+    0x0090A8: 11465,
+    0x009015: 11466,
+    0x009029: 11467,
+    0x00900B: 11468,
+    0x009061: 11469,
+    0x009011: 11470,
+    0x009065: 11471,
+    0x0010D3: 11472,
+    0x0090C0: 11473,
+    0x0090CE: 11474,
+    0x0090DF: 11475,
+    0x0010C8: 11476,
+    0x001086: 11477,
+    0x0010F3: 11478,
+    0x0010DF: 11479,
+    0x001072: 11480,
+    0x0010DA: 11481,
+    0x0010E4: 11482,
+    0x001088: 11483,
+    0x00107E: 11484,
+    0x0010A0: 11485,
+    0x001016: 11486,
+    0x001090: 11487,
+    0x0010F5: 11488,
+    0x00103D: 11489,
+    0x0010EA: 11490,
+    0x001022: 11491,
+    0x001096: 11492,
+    0x001082: 11493,
+    0x001098: 11494,
+    0x001068: 11495,
+    0x00103F: 11496,
+    0x0010CD: 11497,
+    0x001056: 11498,
+    0x001061: 11499,
+    0x001099: 11500,
+    0x001042: 11501,
+    0x0010E1: 11502,
+    0x0010BB: 11503,
+    0x001020: 11504,
+    0x00103A: 11505,
+    0x001004: 11506,
+    0x0010EF: 11507,
+    0x001076: 11508,
+    0x0010AE: 11509,
+    0x0010C4: 5173,
+    0x0010FE: 4158,
+    0x00106C: 11510,
+    0x0010E9: 11511,
+    0x001003: 11512,
+    0x001071: 11513,
+    0x00102A: 11514,
+    0x0010E5: 11515,
+    0x0010F7: 11516,
+    0x0010AB: 11517,
+    0x001010: 11518,
+    0x0010F2: 11519,
+    0x00E007: 11520,
+    0x0010BE: 11521,
+    0x0010AF: 11522,
+    0x00108C: 11523,
+    0x001058: 11524,
+    0x00100F: 11525,
+    0x0010BC: 11526,
+    0x001049: 11527,
+    0x00105E: 11528,
+    0x00E0BF: 11529,
+    0x00E0E3: 11530,
+    0x00E0C6: 11531,
+    0x00E0E5: 11532,
+    0x00E061: 11533,
+    0x00E0B8: 11534,
+    0x00E07C: 11535,
+    0x00E026: 11536,
+    0x00E020: 11537,
+    0x00E00D: 11538,
+    0x00E0DC: 11539,
+    0x00E037: 11540,
+    0x00E053: 11541,
+    0x00E0D3: 11542,
+    0x00E043: 11543,
+    0x00E0B3: 11544,
+    0x00E0ED: 11545,
+    0x00E0FB: 11546,
+    0x00E0C2: 11547,
+    0x00E09B: 11548,
+    0x00E045: 11549,
+    0x00E040: 11550,
+    0x00E01A: 11551,
+    0x00E081: 11552,
+    0x00E057: 11553,
+    0x00E0BC: 11554,
+    0x00E07E: 11555,
+    0x00E078: 11556,
+    0x00E087: 11557,
+    0x00E041: 11558,
+    0x00E0E2: 11559,
+    0x00E082: 11560,
+    0x00E077: 11561,
+    0x00E056: 11562,
+    0x00E02F: 11563,
+    0x00E06C: 5000,
+    0x00E04A: 11564,
+    0x00E031: 11565,
+    0x00E00B: 11566,
+    0x00E0B2: 11567,
+    0x00E0EC: 211,
+    0x00E07A: 11568,
+    0x00E099: 11569,
+    0x006022: 11570,
+    0x0060EE: 11571,
+    0x0060D8: 11572,
+    0x0060EF: 11573,
+    0x006085: 11574,
+    0x006053: 11575,
+    0x006056: 11576,
+    0x00600C: 11577,
+    0x006032: 11578,
+    0x006033: 11579,
+    0x006013: 11580,
+    0x000288: 8948,
+    0x006034: 11581,
+    0x006050: 11582,
+    0x0060E0: 11583,
+    0x006096: 11584,
+    0x00601D: 7578,
+    0x00607B: 11585,
+    0x006011: 11586,
+    0x0060FA: 11587,
+    0x0060DA: 11588,
+    0x0060AE: 11589,
+    0x006043: 11590,
+    0x00603A: 11591,
+    0x006028: 11592,
+    0x00601C: 11593,
+    0x0060C9: 11594,
+    0x00605F: 11595,
+    0x006091: 11596,
+    0x00A061: 11597,
+    0x00A03C: 11598,
+    0x00A0C4: 11599,
+    0x00A063: 11600,
+    0x006045: 11601,
+    0x00A05D: 11602,
+    0x00A033: 11603,
+    0x00A0A9: 11604,
+    0x00A071: 11605,
+    0x00A0EA: 11606,
+    0x00A0DC: 11607,
+    0x00A00B: 11608,
+    0x00A0E2: 11609,
+    0x0060F0: 11610,
+    0x0060F5: 11611,
+    0x006062: 11612,
+    0x0060E4: 11613,
+    0x0060BE: 11614,
+    0x0060BF: 11615,
+    0x006000: 11616,
+    0x0060A6: 11617,
+    0x00602A: 11618,
+    0x00A06D: 11619,
+    0x00A0F6: 11620,
+    0x00608F: 11621,
+    0x0060C4: 11622,
+    0x006080: 11623,
+    0x00A037: 11624,
+    0x00A04C: 11625,
+    0x00A031: 11626,
+    0x00A041: 11627,
+    0x00A01A: 11628,
+    0x00A088: 11629,
+    0x00A0C2: 11630,
+    0x00A04B: 11631,
+    0x00A064: 11632,
+    0x00A03E: 11633,
+    0x00A098: 1124,
+    0x00A06C: 11634,
+    0x00A01F: 11635,
+    0x00A0FB: 11636,
+    0x00A07E: 11637,
+    0x00A06F: 11638,
+    0x00A0C7: 11639,
+    0x00A02C: 11640,
+    0x00A0F7: 11641,
+    0x00A090: 11642,
+    0x00A0A7: 11643,
+    0x00A08B: 11644,
+    0x00A0B1: 11645,
+    0x002010: 11646,
+    0x00209F: 11647,
+    0x002091: 11648,
+    0x0020BD: 11649,
+    0x002054: 7583,
+    0x0020A7: 11650,
+    0x002072: 11651,
+    0x0020CB: 11652,
+    0x0020EB: 11653,
+    0x0020A0: 11654,
+    0x00200D: 11655,
+    0x00202D: 11656,
+    0x00A0DB: 11657,
+    0x00A097: 11658,
+    0x00A073: 11659,
+    0x00A03A: 11660,
+    0x00A0B2: 11661,
+    0x00A027: 11662,
+    0x00A081: 11663,
+    0x00A0D4: 11664,
+    0x0020B9: 11665,
+    0x002039: 11666,
+    0x00A046: 11667,
+    0x00A092: 11668,
+    0x0020EC: 11669,
+    0x00206E: 11670,
+    0x0020F1: 11671,
+    0x002041: 11672,
+    0x002076: 11673,
+    0x0020E8: 11674,
+    0x0020C5: 11675,
+    0x0020E2: 11676,
+    0x002007: 11677,
+    0x00205C: 11678,
+    0x002055: 11679,
+    0x00200A: 11680,
+    0x0020CF: 11681,
+    0x0020A5: 11682,
+    0x002064: 11683,
+    0x002033: 11684,
+    0x0020EA: 11685,
+    0x00206A: 11686,
+    0x0020B4: 11687,
+    0x0020E4: 11688,
+    0x0020A2: 11689,
+    0x002031: 3703,
+    0x0020D0: 11690,
+    0x00206C: 11691,
+    0x00205E: 11692,
+    0x002012: 11693,
+    0x002075: 11694,
+    0x0020BB: 11695,
+    0x0020A8: 11696,
+    0x002045: 11697,
+    0x00208A: 11698,
+    0x002021: 11699,
+    0x002049: 11700,
+    0x002050: 11701,
+    0x002084: 11702,
+    0x002009: 11703,
+    0x002027: 11704,
+    0x00202C: 11705,
+    0x0020DB: 11706,
+    0x001C7C: 11707,
+    0x00C039: 11708,
+    0x00C0A9: 11709,
+    0x00C019: 11710,
+    0x00C0CF: 11711,
+    0x00C07D: 11712,
+    0x00C0B5: 11713,
+    0x00C04B: 11714,
+    0x00C0B9: 11715,
+    0x00C015: 11716,
+    0x00C083: 11717,
+    0x00C094: 11718,
+    0x00C0F9: 3809,
+    0x00C075: 11719,
+    0x00C05B: 11720,
+    0x00C008: 11721,
+    0x00C0B7: 11722,
+    0x00C0FC: 11723,
+    0x00C0BB: 11724,
+    0x0020D2: 11725,
+    0x002002: 11726,
+    0x00204B: 11727,
+    0x00208C: 11728,
+    0x0020A6: 11729,
+    0x00C043: 11730,
+    0x00C028: 11731,
+    0x00C08D: 11732,
+    0x00C02A: 11733,
+    0x00C0EF: 11734,
+    0x00C061: 11735,
+    0x00C0AD: 11736,
+    0x00C07F: 11737,
+    0x00C057: 11738,
+    0x00C056: 11739,
+    0x00C027: 11740,
+    0x00C05C: 11741,
+    0x00C0ED: 11742,
+    0x0040BD: 11743,
+    0x0040ED: 11744,
+    0x0040E5: 11745,
+    0x0040A5: 11746,
+    0x004005: 11747,
+    0x00C030: 11748,
+    0x00C0A6: 11749,
+    0x00C0CB: 11750,
+    0x00C0D1: 11751,
+    0x00C038: 11752,
+    0x00C092: 11753,
+    0x00C052: 11754,
+    0x00C0EB: 11755,
+    0x0040DB: 11756,
+    0x00409B: 11757,
+    0x0040EB: 11758,
+    0x00C032: 11759,
+    0x00C0A5: 11760,
+    0x00C0D3: 11761,
+    0x00C0E8: 11762,
+    0x00400E: 11763,
+    0x00C03D: 11764,
+    0x00404C: 11765,
+    0x00C0E0: 11766,
+    0x00C0DA: 11767,
+    0x0040C8: 11768,
+    0x0040BA: 11769,
+    0x0040CE: 11770,
+    0x004062: 11771,
+    0x0040D9: 11772,
+    0x004021: 11773,
+    0x0040C1: 11774,
+    0x0040E1: 11775,
+    0x0040FE: 11776,
+    0x0040D4: 11777,
+    0x004038: 11778,
+    0x0040D8: 11779,
+    0x0040C6: 11780,
+    0x004032: 11781,
+    0x0040C2: 11782,
+    0x004088: 11783,
+    0x0080AA: 11784,
+    0x00C050: 11785,
+    0x00401C: 11786,
+    0x00400F: 11787,
+    0x004006: 11788,
+    0x004034: 11789,
+    0x008093: 11790,
+    0x008092: 11791,
+    0x00805A: 11792,
+    0x00807E: 11793,
+    0x0080EF: 11794,
+    0x0080F0: 880,
+    0x008051: 11795,
+    0x0080C6: 11796,
+    0x004050: 11797,
+    0x004047: 11798,
+    0x004041: 11799,
+    0x008000: 3827,
+    0x008069: 11800,
+    0x008035: 11801,
+    0x00804E: 11802,
+    0x008055: 11803,
+    0x00802A: 11804,
+    0x00801D: 11805,
+    0x0080C0: 11806,
+    0x008075: 11807,
+    0x0080ED: 11808,
+    0x00809A: 11809,
+    0x00804A: 11810,
+    0x008004: 11811,
+    0x0080D0: 11812,
+    0x008024: 11813,
+    0x008040: 11814,
+    0x008021: 11815,
+    0x0080E8: 11816,
+    0x000066: 11817,
+    0x000049: 11818,
+    0x0000FA: 11819,
+    0x0000D4: 11820,
+    0x000019: 11821,
+    0x0000AB: 11822,
+    0x0080F2: 11823,
+    0x0080BD: 813,
+    0x008025: 11824,
+    0x0080EA: 149,
+    0x00800D: 11825,
+    0x0080D1: 11826,
+    0x00001E: 11827,
+    0x000050: 11828,
+    0x00802E: 11829,
+    0x00004F: 11830,
+    0x000015: 11831,
+    0x00001C: 11832,
+    0x000034: 11833,
+    0x000022: 11834,
+    0x0000B5: 11835,
+    0x0000E0: 11836,
+    0x000027: 11837,
+    0x0000E8: 11838,
+    0x00002F: 11839,
+    0x0000E6: 11840,
+    0x00009A: 11841,
+    0x00004B: 11842,
+    0x008042: 3809,
+    0x0080AC: 11843,
+    0x000080: 11844,
+    0x080089: 11845,
+    0x080086: 3658,
+    0x080083: 11846,
+    0x000073: 11847,
+    0x0000B9: 11848,
+    0x0000BF: 11849,
+    0x00002D: 11850,
+    0x000059: 11851,
+    0x000069: 11852,
+    0x0000E7: 11853,
+    0x00004D: 11854,
+    0x00006F: 4102,
+    0x000078: 11855,
+    0x00005A: 11856,
+    0x000071: 11857,
+    0x000023: 11858,
+    0x000018: 11859,
+    0x0000D5: 11860,
+    0x00003A: 11861,
+    0x0000BE: 11862,
+    0x0000D9: 11863,
+    0x080024: 11864,
+    0x080022: 11865,
+    0x080020: 2279,
+    0x08001F: 11866,
+    0x020701: 7894,
+    0x080006: 314,
+    0x08002A: 11867,
+    0x080013: 11868,
+    0x021C7C: 11707,
+    0x080061: 11869,
+    0x08005F: 11870,
+    0x080058: 11871,
+    0x04E0C4: 11872,
+    0x080049: 11873,
+    0x000005: 4167,
+    0x00DD08: 4168,
+    0xAA0000: 4158,
+    0xAA0001: 4158,
+    0xAA0002: 4158,
+    0x080014: 11874,
+    0x080065: 11875,
+    0x000007: 4167,
+    0x00801F: 11876,
+    0x02AA3C: 11877,
+    0x080059: 11878,
+    0x080008: 11879,
+    0x8487FF: 107,
+    0x645725: 31,
+    0x0080E9: 4102,
+    0x0040D6: 11880,
+    0x08004B: 11881,
+    0x0425E8: 53,
+    0x283C90: 53,
+    0xE4FA5B: 53,
+    0x000009: 4167,
+    0x44C3B6: 15,
+    0xE8F72F: 15,
+    0x50A1F3: 117,
+    0xDC1057: 49,
+    0x30D875: 49,
+    0x485FDF: 11,
+    0x6C1544: 157,
+    0x683EC0: 49,
+    0x3C55DB: 107,
+    0xF0F84A: 310,
+    0xEC6E79: 11882,
+    0xC80C53: 29,
+    0xA4004E: 4,
+    0x2C9EE0: 11883,
+    0x64C17E: 11884,
+    0xB02EE0: 117,
+    0xA4373E: 117,
+    0xC44F5F: 117,
+    0x785F28: 38,
+    0x38EFE3: 11885,
+    0xFC8D13: 287,
+    0x9CB1DC: 121,
+    0x240462: 11886,
+    0x388871: 234,
+    0xBCF87E: 48,
+    0x284EE9: 11887,
+    0x58E359: 11888,
+    0x8C3223: 11889,
+    0x00C896: 4235,
+    0x001B09: 11890,
+    0x2800AF: 110,
+    0x000413: 11891,
+    0x74B059: 78,
+    0xE48429: 21,
+    0xF41A79: 12,
+    0x8C0734: 13,
+    0x987A9B: 4630,
+    0x781699: 15,
+    0xE40A16: 15,
+    0x409CA7: 11892,
+    0xD0AD08: 19,
+    0x60045C: 175,
+    0x849C02: 11893,
+    0xCC40B2: 1109,
+    0xA4E287: 40,
+    0x80953A: 49,
+    0x68AE04: 37,
+    0xCC6023: 49,
+    0x0CDBEA: 49,
+    0x6845CC: 49,
+    0xAC9738: 49,
+    0x08C224: 77,
+    0x68932E: 11894,
+    0x2CC44F: 12,
+    0x981223: 11895,
+    0x1C4C27: 11896,
+    0xD0C901: 11897,
+    0x4099E3: 11898,
+    0x7C8899: 4186,
+    0xFC702E: 33,
+    0xB4F95D: 28,
+    0x046874: 195,
+    0x7490BC: 48,
+    0xB047E9: 25,
+    0x6C2F80: 25,
+    0xD06578: 25,
+    0x98BD80: 25,
+    0xD476A0: 41,
+    0x94FF3C: 41,
+    0xA0F509: 11899,
+    0x6C45C4: 11900,
+    0x000D97: 11901,
+    0x187F88: 602,
+    0xB87E40: 117,
+    0x1C2FA2: 257,
+    0xA43F68: 587,
+    0xBC9D4E: 107,
+    0x1C3B01: 8330,
+    0x94706C: 116,
+    0x64D81B: 229,
+    0x30DCE7: 11,
+    0xD01255: 31,
+    0x3C2D9E: 11902,
+    0x08C7F5: 4253,
+    0xC01693: 40,
+    0xFC5B8C: 40,
+    0x284E44: 15,
+    0x802EC3: 15,
+    0x3CB8D6: 11903,
+    0x9C9E03: 11904,
+    0xD4D659: 4359,
+    0x80053A: 11905,
+    0xD8B32F: 195,
+    0x54104F: 90,
+    0xB05476: 90,
+    0xEC90C1: 90,
+    0x74CA60: 506,
+    0x30D959: 4442,
+    0x007839: 81,
+    0x108A7B: 81,
+    0xA052AB: 11906,
+    0xBC744B: 35,
+    0x6C6F18: 11907,
+    0xF0866F: 38,
+    0x5CB260: 38,
+    0xA8BB56: 49,
+    0x282D7F: 49,
+    0x8C26AA: 49,
+    0x90623F: 49,
+    0x5C07A4: 655,
+    0x004BF3: 4210,
+    0xBC54FC: 4210,
+    0x90769F: 4210,
+    0x4C7766: 4210,
+    0x005CC2: 4210,
+    0xFCE8C0: 14,
+    0x88548E: 146,
+    0x581DC9: 11908,
+    0xCC7B5C: 14,
+    0x505B1D: 4206,
+    0x88010C: 135,
+    0xA49E69: 238,
+    0xF082C0: 238,
+    0x60EFAB: 238,
+    0xD87A3B: 238,
+    0x3C2EF5: 238,
+    0x3410F4: 238,
+    0x0CEFF6: 238,
+    0xECF64C: 238,
+    0x70C912: 33,
+    0x488EB7: 6,
+    0x90AB96: 238,
+    0x0C82D5: 11909,
+    0x0401BB: 231,
+    0xAC72DD: 167,
+    0x64BB1E: 121,
+    0x648214: 4186,
+    0xE09CE5: 11910,
+    0xFCD290: 319,
+    0x78305D: 11,
+    0x940B83: 11,
+    0xE47450: 11911,
+    0xB4A3BD: 1,
+    0x7CD3E5: 15,
+    0xB8876E: 8127,
+    0x3C0B4F: 8127,
+    0x6C62FE: 28,
+    0xC8A23B: 4493,
+    0x9C9ED5: 40,
+    0x743822: 40,
+    0xB83BAB: 48,
+    0x40A63D: 11912,
+    0x605464: 11913,
+    0xCCE536: 8537,
+    0xBC0004: 5,
+    0x98A829: 4254,
+    0x84E9C1: 194,
+    0xB4622E: 11914,
+    0xC46E33: 11914,
+    0x2C67BE: 317,
+    0xEC192E: 4,
+    0xF896FE: 285,
+    0xA4C40D: 11915,
+    0x58306E: 81,
+    0xA8CA77: 77,
+    0xD0C907: 13,
+    0x142B2F: 14,
+    0xC4A451: 231,
+    0xF89D9D: 11916,
+    0xF061F3: 4450,
+    0xD48D26: 285,
+    0xF4F28A: 15,
+    0x94E300: 15,
+    0x0CE5B5: 15,
+    0xFCF738: 15,
+    0x8C862A: 15,
+    0xC03379: 15,
+    0x241E2B: 11917,
+    0xAC7F8D: 1,
+    0x24ACAC: 6194,
+    0x50206B: 11918,
+    0x80D10A: 33,
+    0x1047E7: 574,
+    0x94F6F2: 22,
+    0x449046: 22,
+    0xB0C38E: 117,
+    0x143B51: 117,
+    0xD07380: 117,
+    0xACFCE3: 38,
+    0x042DAD: 11919,
+    0x781C1E: 8233,
+    0x78A13E: 21,
+    0x48CA43: 14,
+    0x7CBAC0: 11920,
+    0x98256E: 13,
+    0xB0A7D2: 5,
+    0x8C87D0: 11921,
+    0x5C1783: 26,
+    0x647060: 53,
+    0x00AAFD: 53,
+    0x0C4BEE: 53,
+    0xD413B3: 513,
+    0x60E5D8: 11,
+    0x5435E9: 11922,
+    0x7CB59F: 15,
+    0x505C88: 4,
+    0x30138B: 19,
+    0x606832: 11923,
+    0x8433F2: 11924,
+    0x28D043: 43,
+    0xE4D3AA: 4226,
+    0xB0D576: 49,
+    0x142876: 49,
+    0x147FCE: 49,
+    0x6CC3B2: 20,
+    0xF8CE07: 11925,
+    0x2098ED: 4254,
+    0x983910: 74,
+    0x804C5D: 175,
+    0xF88FC8: 4297,
+    0x4C10D5: 86,
+    0x289176: 4904,
+    0x28A06B: 25,
+    0x7C8BC1: 444,
+    0x3CCA61: 231,
+    0xECA971: 54,
+    0x68A2AA: 11926,
+    0x88AE35: 194,
+    0x7049A2: 112,
+    0xA07D9C: 90,
+    0xF8C3F1: 11927,
+    0xE00855: 427,
+    0xD89563: 11928,
+    0xE8A848: 353,
+    0x5CA3EB: 11929,
+    0x5CBE05: 11930,
+    0x08524E: 11931,
+    0xACF42C: 121,
+    0xC0AB2B: 117,
+    0x3877CD: 11932,
+    0x508A7F: 15,
+    0xC4CBBE: 4234,
+    0xE8B527: 4224,
+    0x98A878: 11933,
+    0x305223: 167,
+    0xDC4965: 11934,
+    0x189E2D: 1148,
+    0x9C6076: 49,
+    0x38E13D: 49,
+    0xD0D49F: 49,
+    0x9C2D49: 11935,
+    0x887FD5: 11,
+    0xF47470: 4,
+    0x60A434: 12,
+    0x387B01: 11936,
+    0x0CEDC8: 40,
+    0x88BCAC: 6,
+    0xC88DD4: 11937,
+    0x2C36F2: 15,
+    0xE4995F: 15,
+    0xA8F059: 15,
+    0x283DE8: 257,
+    0x180403: 146,
+    0x206BD5: 146,
+    0xB47AF1: 4251,
+    0x489ECB: 4251,
+    0x9C1C12: 4252,
+    0x04BD88: 4252,
+    0xE8F724: 4251,
+    0xDC680C: 4251,
+    0x48DF37: 4251,
+    0x20677C: 4251,
+    0x4448C1: 4251,
+    0x6828CF: 4252,
+    0xE4DE40: 4252,
+    0x480020: 4252,
+    0x5CA47D: 4252,
+    0xE89505: 11936,
+    0xDCB7AC: 4252,
+    0x54D7E3: 4252,
+    0x14ABEC: 4252,
+    0x104F58: 4252,
+    0xCCD083: 4252,
+    0xBC4632: 5,
+    0x685377: 47,
+    0xF05C19: 4252,
+    0x7C573C: 4252,
+    0x348A12: 4252,
+    0x1063A3: 12,
+    0xE80690: 14,
+    0xDCA706: 4540,
+    0xE0604A: 5,
+    0x5006F5: 58,
+    0x9816CD: 11938,
+    0x34516F: 11939,
+    0xC86E08: 25,
+    0xB8374B: 4251,
+    0x188637: 8,
+    0x78078F: 15,
+    0x309E62: 15,
+    0x10C0D5: 11940,
+    0x54FA89: 11941,
+    0x241651: 4297,
+    0x58769C: 95,
+    0xB4C556: 11942,
+    0xEC725B: 11,
+    0xE49282: 90,
+    0xF0090D: 4220,
+    0x0009F7: 11943,
+    0x0494E9: 11944,
+    0x387ACC: 664,
+    0x7C72E7: 53,
+    0x3030D0: 53,
+    0x54FEEB: 53,
+    0x0884FB: 22,
+    0x14BEFC: 8591,
+    0x905F7A: 49,
+    0xF8F58C: 49,
+    0x0C85E1: 49,
+    0x282E89: 57,
+    0x90FB5D: 166,
+    0x441690: 11945,
+    0x9CA6D8: 5,
+    0x0C2A6F: 238,
+    0x20DBEA: 4,
+    0xE01CA7: 11946,
+    0xA0479B: 11947,
+    0x74C90F: 11948,
+    0x34CDB0: 14,
+    0x18E204: 11949,
+    0x2CB7A1: 117,
+    0x6C8243: 117,
+    0xB476A4: 117,
+    0x5026D2: 11950,
+    0x942453: 15,
+    0x184F43: 4293,
+    0xF86BFA: 444,
+    0xB03226: 11951,
+    0x3C5836: 3,
+    0x84CB85: 38,
+    0xACF23C: 195,
+    0xE45768: 146,
+    0x48E6C6: 12,
+    0x000417: 4266,
+    0xD01BBE: 11952,
+    0x246A0E: 19,
+    0xB07C51: 272,
+    0x884F59: 4,
+    0x7CFA80: 11953,
+    0xC08706: 11954,
+    0xC4B349: 49,
+    0x34F68D: 49,
+    0x9454C5: 14,
+    0xACB722: 780,
+    0xCC2746: 49,
+    0x285923: 40,
+    0xD0CEC0: 40,
+    0x0C01A5: 11,
+    0x98FA9B: 4278,
+    0xF875A4: 4278,
+    0x8C8CAA: 4278,
+    0x701988: 4362,
+    0xFC1A46: 90,
+    0x983DAE: 14,
+    0x5C5E0A: 90,
+    0xCCB0B3: 157,
+    0x80D52C: 11955,
+    0x88B2AB: 5,
+    0x24E3A4: 5,
+    0x3000FC: 81,
+    0x64DE6D: 25,
+    0xEC4C8C: 25,
+    0xEC6652: 11956,
+    0xCC763A: 11,
+    0x300475: 11957,
+    0x000AF6: 11958,
+    0x5C18DD: 4235,
+    0x14360E: 112,
+    0x5C4EEE: 4254,
+    0x5CC1F2: 15,
+    0xC805A4: 11959,
+    0x0072EE: 25,
+    0xC858B3: 25,
+    0xE41FD5: 25,
+    0xEC1B5F: 4252,
+    0x1CB46C: 15,
+    0xE8F673: 157,
+    0x7864A0: 4,
+    0x5CDB36: 218,
+    0x4C7B35: 4293,
+    0x9C45F0: 11960,
+    0x409249: 788,
+    0x0C7E24: 466,
+    0x7475DF: 11961,
+    0x686B6A: 307,
+    0x3407AC: 11962,
+    0x58B858: 4200,
+    0xD0CBDD: 63,
+    0x44B423: 11963,
+    0x6887BD: 11,
+    0x3058EB: 11,
+    0x4405B8: 117,
+    0x841A24: 4293,
+    0x786CAB: 69,
+    0x007D3B: 90,
+    0x5C40E3: 11964,
+    0x986297: 11965,
+    0xE8BCE4: 4,
+    0x8C8726: 11966,
+    0x68628A: 146,
+    0x2844F4: 22,
+    0xBC31E2: 21,
+    0x18E8EC: 4523,
+    0x28F52B: 4186,
+    0xF8EF5D: 78,
+    0xA409B3: 15,
+    0x3C07D7: 49,
+    0x1C1DD3: 49,
+    0xC81FE8: 49,
+    0x24B2B9: 192,
+    0xE8E7C3: 11,
+    0x08B95F: 238,
+    0xB4C799: 1,
+    0x58696C: 138,
+    0x8C8394: 48,
+    0xF0AB1F: 11,
+    0x7CB30A: 11,
+    0x4C62DF: 54,
+    0xB00C9D: 116,
+    0xC8675E: 1,
+    0xC413E2: 1,
+    0x90B832: 1,
+    0x40E317: 1,
+    0xAC4DD9: 1,
+    0xF4CE48: 1,
+    0x00DCB2: 1,
+    0x9C5D12: 1,
+    0xF09CE9: 1,
+    0xCC14BC: 4229,
+    0xE8D3EB: 63,
+    0x200B74: 43,
+    0x0025DF: 11967,
+    0xB0104B: 5,
+    0x44365D: 11968,
+    0xF8FE5E: 25,
+    0x54C078: 444,
+    0x88F916: 11969,
+    0xE81711: 11970,
+    0x7CBF77: 4285,
+    0x18C009: 21,
+    0x7C7398: 14,
+    0x6CB456: 14,
+    0xE4E26C: 69,
+    0x3030F9: 14,
+    0xBC2411: 11971,
+    0x706173: 11972,
+    0x9C4952: 281,
+    0xC022F1: 12,
+    0x041471: 15,
+    0xC816A5: 24,
+    0x446D05: 11973,
+    0x38C0EA: 41,
+    0xD094CF: 15,
+    0x542259: 15,
+    0xDC6880: 11,
+    0x102874: 8149,
+    0x043855: 11974,
+    0xA8B483: 37,
+    0x900E9E: 37,
+    0x54F29F: 332,
+    0xC82E18: 14,
+    0xE86BEA: 14,
+    0x288EB9: 353,
+    0xC89D6D: 163,
+    0xECB0D2: 38,
+    0x4CEB76: 11975,
+    0x6855D4: 378,
+    0xD422CD: 11976,
+    0x28BBED: 47,
+    0x344E2F: 4180,
+    0x4CA0D4: 570,
+    0x98EDCA: 5,
+    0x0C659A: 8880,
+    0x00409E: 11977,
+    0xECAB3E: 4889,
+    0x384A80: 90,
+    0xE41088: 90,
+    0xBC8D1F: 4,
+    0x045791: 4292,
+    0x88A6EF: 12,
+    0x54DF1B: 229,
+    0x38F9F5: 466,
+    0x60BD2C: 278,
+    0xC493BB: 166,
+    0xE89C25: 398,
+    0xECC38A: 39,
+    0x14993E: 40,
+    0x2C4C15: 28,
+    0x78467D: 11978,
+    0xEC748C: 141,
+    0xB04FA6: 401,
+    0x4C9992: 146,
+    0x000CC8: 11979,
+    0x84F5EB: 11,
+    0xD8E72F: 4297,
+    0x74C76E: 11980,
+    0x14C050: 651,
+    0x441A4C: 11981,
+    0x4C62CD: 81,
+    0x3C52A1: 94,
+    0x98DA92: 11982,
+    0x78465C: 195,
+    0xD0DD7C: 11,
+    0x843C99: 11,
+    0x9CF86B: 11983,
+    0xF8E5CE: 49,
+    0x68E59E: 4,
+    0x1CC992: 22,
+    0x400FC1: 52,
+    0x74978E: 11984,
+    0x0823C6: 15,
+    0x107B93: 526,
+    0x705A9E: 52,
+    0x88F7C7: 52,
+    0x1C9D72: 52,
+    0x3C82C0: 52,
+    0x80DAC2: 52,
+    0x481B40: 52,
+    0xB85E71: 52,
+    0x0C0227: 52,
+    0x14B7F8: 52,
+    0x1062D0: 52,
+    0x10C25A: 52,
+    0xF4C114: 52,
+    0xF83B1D: 52,
+    0xE4BFFA: 52,
+    0x08D1F9: 14,
+    0x34B7DA: 14,
+    0x1071FA: 69,
+    0xD08A91: 52,
+    0xC87F54: 398,
+    0x7036B2: 11985,
+    0x4CD717: 110,
+    0x00C711: 163,
+    0xC84C78: 11,
+    0x802D1A: 11,
+    0x6823F4: 11986,
+    0x90837E: 5,
+    0xCCB071: 5,
+    0x485541: 1494,
+    0xF09008: 107,
+    0x348D52: 135,
+    0x1C860B: 11987,
+    0x74D713: 4350,
+    0x2CC3E6: 664,
+    0xF020FF: 25,
+    0xC88A9A: 25,
+    0xA0B339: 25,
+    0x6CF6DA: 25,
+    0xC86BBC: 12,
+    0x30600A: 4235,
+    0x6813F3: 77,
+    0x806D97: 13,
+    0x4C70CC: 11988,
+    0x302F1E: 314,
+    0x28EB0A: 11989,
+    0x848A59: 11990,
+    0x586861: 11991,
+    0x14C9CF: 8119,
+    0x847ADF: 287,
+    0xDCCD66: 175,
+    0x6074F4: 13,
+    0xA03768: 11992,
+    0x44FA66: 195,
+    0xFCB2D6: 4235,
+    0x60FCF1: 13,
+    0x5476B2: 212,
+    0x143375: 112,
+    0x2CFEE2: 906,
+    0xB0FF72: 12,
+    0x649A63: 602,
+    0x102834: 11993,
+    0x60C01E: 11994,
+    0x2C3C05: 11995,
+    0x148554: 121,
+    0x0008B9: 74,
+    0xC4D666: 20,
+    0x18DE50: 220,
+    0x98CCF3: 77,
+    0x5091E3: 94,
+    0xF02178: 4293,
+    0x947918: 163,
+    0x68F0B5: 22,
+    0x001457: 83,
+    0x005001: 11996,
+    0x6CEEF7: 11997,
+    0x2C3EBF: 11998,
+    0x40D563: 11999,
+    0x3C3332: 1167,
+    0xB440DC: 90,
+    0x6417CD: 90,
+    0xDC69E2: 90,
+    0xC05064: 4444,
+    0x9CFB77: 69,
+    0x643E0A: 15,
+    0x348818: 4,
+    0x402A8F: 487,
+    0xDC2DDE: 12000,
+    0x101849: 755,
+    0x08F9E0: 14,
+    0x0036D7: 12001,
+    0x34DC99: 21,
+    0x5CE8D3: 12002,
+    0x44053F: 3,
+    0x80802C: 41,
+    0x4831B7: 14,
+    0x543204: 14,
+    0xCCB54C: 53,
+    0x74A58C: 53,
+    0x3CE002: 53,
+    0x98038A: 53,
+    0xB86061: 29,
+    0xB03893: 12003,
+    0x8CDF2C: 146,
+    0xF87928: 11,
+    0xD88ED4: 63,
+    0x943FD6: 49,
+    0x002067: 13,
+    0x2CD7FF: 3886,
+    0x38AB16: 12004,
+    0x348511: 107,
+    0xF8B8B4: 107,
+    0x681AA4: 107,
+    0x48555E: 107,
+    0x28C1A0: 49,
+    0xEC2C73: 49,
+    0x7CC06F: 49,
+    0xEC8150: 49,
+    0xD42FCA: 49,
+    0xD058A5: 49,
+    0x2C67AB: 8876,
+    0xB09738: 107,
+    0x1C880C: 107,
+    0x700692: 12,
+    0x38B5C9: 8,
+    0x984B06: 15,
+    0xACFF6B: 15,
+    0x844DBE: 5,
+    0x80B946: 81,
+    0xF8CAB8: 110,
+    0x44A842: 110,
+    0x4C7625: 110,
+    0x001143: 110,
+    0x001372: 110,
+    0xF8BC12: 110,
+    0x3417EB: 110,
+    0xB083FE: 110,
+    0x000874: 110,
+    0x0024E8: 110,
+    0x002219: 110,
+    0x00188B: 110,
+    0xF01FAF: 110,
+    0x18A99B: 110,
+    0xACDE48: 13,
+    0x0050C7: 13,
+    0x5488FE: 12005,
+    0xF4D580: 1117,
+    0x5030F4: 12006,
+    0x601895: 110,
+    0xB04F13: 110,
+    0x381428: 110,
+    0xF4EE08: 110,
+    0x908D6E: 110,
+    0xEC2A72: 110,
+    0x7486E2: 110,
+    0x00BE43: 110,
+    0x605B30: 110,
+    0xC84BD6: 110,
+    0xE8655F: 110,
+    0xE8B265: 110,
+    0xAC91A1: 110,
+    0xC4CBE1: 110,
+    0x107D1A: 110,
+    0x509A4C: 110,
+    0x405CFD: 110,
+    0xD09466: 110,
+    0xD89EF3: 110,
+    0xB4E10F: 110,
+    0x1866DA: 110,
+    0x18DBF2: 110,
+    0x14B31F: 110,
+    0x886FD4: 110,
+    0x5CF9DD: 110,
+    0x004E01: 110,
+    0x106530: 110,
+    0x3C2C30: 110,
+    0x247152: 110,
+    0x8C47BE: 110,
+    0x94CBCD: 11,
+    0x805F8E: 12007,
+    0xA83A79: 179,
+    0xE49069: 120,
+    0x184C08: 120,
+    0xFC35E6: 114,
+    0x8CBA25: 4355,
+    0x54725E: 4355,
+    0xF814FE: 4355,
+    0xCC62FE: 4355,
+    0xC09573: 12008,
+    0x404101: 120,
+    0x68C8EB: 120,
+    0x40F21C: 123,
+    0x00180C: 123,
+    0x00E0DF: 123,
+    0x00A01B: 123,
+    0xD09395: 12,
+    0x7CBFAE: 232,
+    0x80AFCA: 12009,
+    0x1C6E74: 12010,
+    0x04472A: 95,
+    0xC02C17: 4,
+    0x984925: 28,
+    0x4419B6: 54,
+    0xB417A8: 4359,
+    0xC04884: 12011,
+    0x7C8931: 117,
+    0xBC5E33: 54,
+    0xFC9FFD: 54,
+    0xE8A0ED: 54,
+    0x5C345B: 54,
+    0x7CEDC6: 77,
+    0x4825F3: 117,
+    0x4CBD8F: 54,
+    0xF412DA: 11,
+    0x540295: 15,
+    0xC8787D: 1167,
+    0xD8B370: 131,
+    0xB0A732: 14,
+    0xB0B21C: 14,
+    0xE09B27: 655,
+    0x8CE042: 146,
+    0xFCECDA: 131,
+    0x942A6F: 131,
+    0xF4E2C6: 131,
+    0x78FE3D: 28,
+    0x648788: 28,
+    0xAC4BC8: 28,
+    0x3C94D5: 28,
+    0xB4FBE4: 131,
+    0x687251: 131,
+    0xDC38E1: 28,
+    0xCCE17F: 28,
+    0x9CC893: 28,
+    0x58E434: 28,
+    0xB0EB7F: 28,
+    0x28B829: 28,
+    0xE897B8: 134,
+    0x94F524: 12012,
+    0x60FAB1: 12013,
+    0x407183: 28,
+    0x40B4F0: 28,
+    0x384F49: 28,
+    0x5800BB: 28,
+    0xD007CA: 28,
+    0xD8B122: 28,
+    0xFC5703: 579,
+    0x64C3D6: 28,
+    0xC0BFA7: 28,
+    0xB033A6: 28,
+    0x201BC9: 28,
+    0x541E56: 28,
+    0x88A25E: 28,
+    0x003146: 28,
+    0x50C709: 28,
+    0x00C52C: 28,
+    0xB48A5F: 28,
+    0xE0F62D: 28,
+    0xEC7C5C: 28,
+    0x807FF8: 28,
+    0xC0EAC3: 12,
+    0xFCA0F3: 15,
+    0x04A81C: 15,
+    0x304074: 11,
+    0xA01077: 11,
+    0x54B7BD: 48,
+    0xBC73A4: 12014,
+    0x14F5F9: 332,
+    0x140FA6: 232,
+    0x148473: 4,
+    0xAC1754: 12015,
+    0xACE0D6: 12016,
+    0xA4C23E: 12017,
+    0x0050C4: 12018,
+    0x001AA6: 12019,
+    0x7C45F9: 12,
+    0x10CF0F: 49,
+    0x90314B: 4254,
+    0xD8638C: 12020,
+    0x1CCA41: 414,
+    0x347DE4: 664,
+    0xCCCF83: 4235,
+    0x04F778: 141,
+    0xB4636F: 181,
+    0x24D337: 40,
+    0x7C7A3C: 21,
+    0x483177: 35,
+    0x1C76F2: 90,
+    0x0092A5: 285,
+    0x205F3D: 262,
+    0x3C3B4D: 12021,
+    0x3CBCD0: 11,
+    0xD0A9D3: 38,
+    0x14DD02: 12022,
+    0x60C727: 12023,
+    0x408EF6: 444,
+    0xE02DF0: 159,
+    0x646E60: 11,
+    0x4C421E: 4,
+    0x64B2B4: 5,
+    0x4831DB: 117,
+    0x58707F: 228,
+    0x887477: 15,
+    0xFC315D: 49,
+    0xD039FA: 90,
+    0xB40B1D: 90,
+    0xAC80FB: 90,
+    0x147F0F: 53,
+    0x444AD6: 12024,
+    0x189EAD: 12025,
+    0x94DDF8: 8864,
+    0x84B386: 12,
+    0xA45D5E: 12026,
+    0x98BFF4: 12027,
+    0x78605B: 86,
+    0x04F9F8: 86,
+    0x74A6CD: 49,
+    0x2C7CF2: 49,
+    0x30D7A1: 49,
+    0xE0382D: 12,
+    0x68FCB6: 69,
+    0xA8727E: 12028,
+    0xDCD2FD: 15,
+    0x5873D1: 15,
+    0xF42D06: 11,
+    0x1C674A: 11,
+    0x7C5758: 19,
+    0xC829C8: 95,
+    0x9C5322: 94,
+    0x482254: 94,
+    0x4CB087: 15,
+    0x88B4BE: 15,
+    0x947BAE: 40,
+    0x38F8F6: 262,
+    0xB4E265: 170,
+    0x00C28F: 171,
+    0x3847F2: 8232,
+    0xD8AD49: 22,
+    0xB484D5: 12029,
+    0x54077D: 511,
+    0xC45379: 12030,
+    0x804AF2: 506,
+    0xD8312C: 11,
+    0x049F15: 12031,
+    0x3838A6: 89,
+    0x50236D: 35,
+    0xA03975: 12032,
+    0x7493DA: 234,
+    0xC84AA0: 141,
+    0x4C968A: 353,
+    0xEC83B7: 12033,
+    0x0C6422: 12034,
+    0xC8F2B4: 12035,
+    0xF42756: 11934,
+    0xE0A1CE: 11,
+    0x24A6FA: 755,
+    0x2C75CB: 12036,
+    0x9C558F: 12037,
+    0xE8268D: 37,
+    0x6C9106: 12038,
+    0x6C70CB: 90,
+    0x907BC6: 53,
+    0x904846: 53,
+    0xC47905: 8564,
+    0x5027A9: 63,
+    0xA411BB: 4,
+    0x504921: 4,
+    0x10BBF3: 332,
+    0xD04E99: 15,
+    0x20A766: 15,
+    0x3C058E: 15,
+    0xF0C725: 49,
+    0x201A94: 49,
+    0xB0E5EF: 49,
+    0x288FF6: 49,
+    0x44B7D0: 72,
+    0xD4DA21: 166,
+    0x6444D5: 12039,
+    0xE88F6F: 274,
+    0x84FCE6: 14,
+    0x58B965: 49,
+    0x743174: 49,
+    0xCCCC77: 12040,
+    0xBC458C: 12041,
+    0x947806: 12042,
+    0x784F24: 278,
+    0xF8AAB3: 12043,
+    0xECDA3B: 14,
+    0x6813E2: 12044,
+    0x7C669A: 15,
+    0xCC1E97: 15,
+    0xB4E46B: 275,
+    0xBCB923: 12045,
+    0x9C5467: 81,
+    0xB46142: 15,
+    0x8C8442: 4,
+    0x84F117: 12046,
+    0xC8EFBC: 12047,
+    0x98CCE4: 12048,
+    0x3C0664: 12049,
+    0xBC5274: 90,
+    0x9009DF: 25,
+    0xE40D36: 25,
+    0x149F43: 20,
+    0x64DB38: 11,
+    0x2C08B4: 117,
+    0xB40421: 11,
+    0xE84368: 11,
+    0x5007C3: 77,
+    0x848DCE: 655,
+    0xE466AB: 11,
+    0xA0957F: 165,
+    0x64135A: 12050,
+    0x54E1B6: 232,
+    0xCC77C9: 5,
+    0x2C572C: 1148,
+    0xECDFC9: 12051,
+    0x3CE441: 77,
+    0x444201: 77,
+    0xE46D7F: 655,
+    0x80276C: 4,
+    0x6C4EF6: 4,
+    0x5C2763: 12052,
+    0x40C1F6: 8149,
+    0xFC22D3: 12053,
+    0x4C5CDF: 163,
+    0xC02E26: 12054,
+    0x0030AF: 12055,
+    0x1CB8BA: 12056,
+    0xF0CCE0: 12057,
+    0xF85C7E: 4614,
+    0xF824E4: 12058,
+    0x44E2F1: 12059,
+    0x504877: 22,
+    0x78C1AE: 516,
+    0x30C6D7: 21,
+    0xF40595: 3,
+    0x00234B: 12060,
+    0x00176E: 12061,
+    0x1C6A76: 49,
+    0x6C7E67: 49,
+    0xA4C6F0: 49,
+    0xA88FD9: 49,
+    0x089542: 49,
+    0xE49C67: 49,
+    0x64E220: 1055,
+    0xD4F242: 117,
+    0xB07839: 167,
+    0xF41C71: 12062,
+    0xBC107B: 90,
+    0xD4AD20: 12063,
+    0x1CFC17: 4,
+    0x10AE60: 77,
+    0x1C3283: 12064,
+    0xC8848C: 272,
+    0xD85482: 12065,
+    0xC4EFDA: 720,
+    0xD8F507: 5,
+    0x70110E: 11,
+    0x98818A: 117,
+    0xA8AA7C: 117,
+    0xB4C2F7: 117,
+    0xE05A1B: 14,
+    0x488AE8: 146,
+    0xCCBA6F: 15,
+    0x785C5E: 15,
+    0xE886CF: 81,
+    0x08B61F: 14,
+    0x3C4E56: 407,
+    0xA08CF2: 12066,
+    0x40475E: 63,
+    0x5C3E1B: 49,
+    0x7C2ACA: 49,
+    0x288EEC: 49,
+    0x8812AC: 332,
+    0x306371: 4292,
+    0x98A2C0: 4,
+    0x00410E: 195,
+    0xFC6179: 12,
+    0xEC74D7: 12067,
+    0x28011C: 11,
+    0x20E6DF: 63,
+    0xF4931C: 638,
+    0x6C302A: 53,
+    0x7446B3: 53,
+    0x74375F: 4323,
+    0xC82AF1: 274,
+    0x3CE90E: 14,
+    0xA842E3: 14,
+    0xD49B74: 12068,
+    0x480EEC: 86,
+    0x503EAA: 86,
+    0x50F261: 12069,
+    0x944E5B: 50,
+    0xB4BA9D: 319,
+    0xE08614: 4592,
+    0x40F8DF: 1131,
+    0x0C7FED: 12,
+    0x7C67AB: 58,
+    0xA8DE68: 12070,
+    0xF43BD8: 25,
+    0xA0889D: 117,
+    0x3CFEAC: 4,
+    0x04A741: 4,
+    0x7C0C92: 12071,
+    0x98D742: 90,
+    0xF46ADD: 192,
+    0x18E91D: 15,
+    0x48706F: 15,
+    0x18B185: 12072,
+    0x04BAD6: 1167,
+    0x303F5D: 4982,
+    0xB0FBDD: 37,
+    0xE09C8D: 12073,
+    0x307F10: 69,
+    0xA490CE: 146,
+    0x3C69D1: 12074,
+    0x54A9C8: 4739,
+    0xA0B765: 14,
+    0xCCDBA7: 14,
+    0xC86C20: 135,
+    0x18863A: 12075,
+    0xC8D6B7: 4439,
+    0xF0877F: 12076,
+    0x34AC11: 29,
+    0x4432C2: 12077,
+    0x70662A: 141,
+    0xDC71DD: 12078,
+    0x2064DE: 412,
+    0xA40F98: 69,
+    0x74B725: 117,
+    0x408EDF: 117,
+    0xD880DC: 117,
+    0xE8B3EF: 5,
+    0x5CFB3A: 388,
+    0xD04E50: 8428,
+    0xF46C68: 57,
+    0x8493B2: 11,
+    0xE8F791: 40,
+    0xB49F4D: 5,
+    0xE83A4B: 29,
+    0x60E9AA: 195,
+    0x240F5E: 12079,
+    0x000C06: 12080,
+    0xAC2929: 444,
+    0x18FD74: 439,
+    0x6C976D: 78,
+    0x6411A4: 78,
+    0x78669D: 31,
+    0x48468D: 12081,
+    0x904992: 4752,
+    0x3CCE0D: 12082,
+    0x000EDB: 12083,
+    0x40D95A: 295,
+    0xD0497C: 71,
+    0x74D4DD: 476,
+    0x4CD0DD: 15,
+    0xE4902A: 15,
+    0x905E44: 15,
+    0x10F068: 272,
+    0x7820BD: 12084,
+    0x50E636: 427,
+    0x7CE152: 12085,
+    0xEC2125: 12086,
+    0x28CDC1: 156,
+    0x68CE4E: 12087,
+    0x00E5F1: 310,
+    0x34EE2A: 4441,
+    0x684E05: 332,
+    0x0499BB: 49,
+    0xF04DD4: 3,
+    0x5C1BF4: 49,
+    0xA851AB: 49,
+    0x50392F: 8,
+    0xFC8417: 22,
+    0x2CA79E: 15,
+    0xACB566: 232,
+    0x381F26: 12,
+    0x30045C: 37,
+    0x9079CF: 11,
+    0x8C1E80: 4,
+    0xC0EE40: 4449,
+    0x888FA4: 117,
+    0x5068AC: 117,
+    0xA4F933: 25,
+    0x10F60A: 25,
+    0x70D823: 25,
+    0x3C4645: 12088,
+    0xC4DEE2: 14,
+    0x68B6B3: 14,
+    0xFCA05A: 12089,
+    0x90486C: 602,
+    0xA41EE1: 278,
+    0xE8FB1C: 43,
+    0x0C7FB2: 258,
+    0x102407: 15,
+    0x74D9EB: 12090,
+    0xB4A7C6: 108,
+    0x80C3BA: 12091,
+    0x487E48: 121,
+    0x286B35: 25,
+    0x4035E6: 90,
+    0xD0A46F: 242,
+    0x5478C9: 295,
+    0x3043D7: 12,
+    0xE84DEC: 5767,
+    0xC8B82F: 63,
+    0xB85DC3: 15,
+    0x2C60CD: 9705,
+    0xC4DF39: 194,
+    0xCC60C8: 157,
+    0x00405F: 12092,
+    0xB43AE2: 15,
+    0xF0C8B5: 15,
+    0xFC101A: 95,
+    0x6CAEE3: 81,
+    0x0CAC8A: 3,
+    0xD8365F: 1305,
+    0x0060E2: 12093,
+    0x7404F1: 25,
+    0x00A265: 12094,
+    0x809733: 12095,
+    0x1054D2: 12,
+    0xF46D2F: 86,
+    0x00EBD8: 12096,
+    0xBC606B: 788,
+    0xDCFE23: 102,
+    0x347379: 12097,
+    0xD83DCC: 12098,
+    0x6C51BF: 117,
+    0xC814B4: 135,
+    0x6C8D77: 4,
+    0x7411B2: 4,
+    0x04E69E: 12099,
+    0x0417B6: 4915,
+    0xAC80AE: 5,
+    0xE85F02: 49,
+    0xE8C7CF: 57,
+    0xCC5C61: 117,
+    0x1CF42B: 117,
+    0xE893F3: 12100,
+    0x00198E: 12101,
+    0x60FB00: 664,
+    0xD09200: 12102,
+    0x7CC180: 49,
+    0x280244: 49,
+    0xBCDF58: 210,
+    0x2C301A: 12103,
+    0xE42B79: 81,
+    0x5C843C: 141,
+    0xE8AEC5: 89,
+    0x4017F6: 12104,
+    0x60A6C5: 15,
+    0x208C86: 15,
+    0xF0A951: 15,
+    0xC049EF: 14,
+    0x94B555: 14,
+    0x74F2FA: 40,
+    0xECE7A7: 25,
+    0x004058: 12105,
+    0x185E0B: 11,
+    0xD0BB61: 11,
+    0x588FCF: 516,
+    0x64D69A: 25,
+    0x3CE9F7: 25,
+    0xF4CE23: 25,
+    0xA84FB1: 4,
+    0xAC7352: 69,
+    0x50C275: 27,
+    0xC8727E: 81,
+    0x0CB815: 14,
+    0x6CFFCE: 3,
+    0xC899B2: 48,
+    0xF4B898: 53,
+    0xB0D278: 53,
+    0x6425EC: 12106,
+    0x00E0CD: 12107,
+    0x54ACFC: 12108,
+    0x4C7274: 4292,
+    0x0024B6: 4869,
+    0xA439B3: 166,
+    0x800CF9: 77,
+    0xA09208: 220,
+    0xE484D3: 40,
+    0x04106B: 40,
+    0x04CCBC: 15,
+    0x1CE504: 15,
+    0x2C0BAB: 15,
+    0x94D2BC: 15,
+    0xE0D045: 25,
+    0x201F54: 212,
+    0x7C97E1: 117,
+    0x147EA1: 12109,
+    0xE81656: 51,
+    0xE0A25A: 12110,
+    0x2887BA: 94,
+    0x3460F9: 94,
+    0x684AE9: 90,
+    0xC83E9E: 117,
+    0x60DD70: 49,
+    0x98A5F9: 49,
+    0xECA907: 49,
+    0xA88C3E: 157,
+    0xF82551: 378,
+    0x7453A8: 12111,
+    0x4C06B7: 12112,
+    0x605747: 4235,
+    0x149E5D: 12113,
+    0x940D2D: 638,
+    0x14EBB6: 94,
+    0x54AF97: 94,
+    0x54CF8D: 15,
+    0xD48866: 15,
+    0xD48457: 167,
+    0xBC4760: 90,
+    0x2C4DDE: 231,
+    0x303F7B: 574,
+    0xF863D9: 258,
+    0xA405D6: 258,
+    0xDCA633: 258,
+    0xD8CFBF: 78,
+    0x1845B3: 12,
+    0x68BE49: 12114,
+    0x94F827: 442,
+    0x0CB789: 22,
+    0xF0B040: 332,
+    0x70B8F6: 14,
+    0x34CE69: 181,
+    0xE0720A: 37,
+    0x24D904: 12115,
+    0x3C457A: 319,
+    0x483E5E: 165,
+    0x50EBF6: 398,
+    0xC448FA: 278,
+    0xA89892: 69,
+    0x2804C6: 417,
+    0xD47954: 117,
+    0xC839AC: 117,
+    0x145594: 117,
+    0x08C06C: 117,
+    0xFC0296: 40,
+    0x60E85B: 53,
+    0xB4BA02: 12116,
+    0x60FF12: 90,
+    0x24C613: 90,
+    0x94E129: 90,
+    0xC44F96: 5043,
+    0x685811: 5,
+    0x902759: 8591,
+    0x5C46B0: 12117,
+    0x3C219C: 25,
+    0xDC6294: 12118,
+    0x84BA20: 238,
+    0x003C84: 238,
+    0x281D21: 12119,
+    0x74E336: 287,
+    0xC4345B: 15,
+    0x703217: 25,
+    0x3498B5: 511,
+    0xB0739C: 77,
+    0x1859F5: 4,
+    0xD45763: 49,
+    0xC02C5C: 49,
+    0xEC4269: 145,
+    0x24B72A: 242,
+    0x1C73E2: 15,
+    0x8C83E8: 15,
+    0xF829C0: 941,
+    0x34A5B4: 12120,
+    0xE89F6D: 14,
+    0x6457E5: 12121,
+    0xFC9BD4: 12122,
+    0x145790: 780,
+    0x9877CB: 12123,
+    0x389461: 232,
+    0x485519: 14,
+    0xF8FCE1: 77,
+    0x942957: 12124,
+    0x986EE8: 12,
+    0x405F7D: 274,
+    0x4C034F: 25,
+    0xD4C3B0: 12125,
+    0xE070EA: 19,
+    0xB88A72: 232,
+    0x2C53D7: 1128,
+    0xE8979A: 116,
+    0x5CA6E6: 94,
+    0xB4B024: 94,
+    0x18F22C: 86,
+    0xDCA782: 15,
+    0x045170: 12126,
+    0x384554: 174,
+    0x88D82E: 25,
+    0x50547B: 4362,
+    0x90F3B8: 29,
+    0x38563D: 157,
+    0x28937D: 135,
+    0xD41AD1: 112,
+    0xB845F4: 21,
+    0xEC01D5: 4,
+    0x180EAC: 989,
+    0x144920: 15,
+    0x04D921: 12127,
+    0x48B9C2: 12128,
+    0x7463C2: 117,
+    0xD48FA2: 117,
+    0x8881B9: 117,
+    0x3C38F4: 133,
+    0x0CC413: 210,
+    0x4CEAAE: 69,
+    0xC436C0: 310,
+    0x08B49D: 231,
+    0x081605: 104,
+    0x2CE032: 162,
+    0xA0D2B1: 77,
+    0x806D71: 77,
+    0x9897CC: 86,
+    0x3CE4B0: 53,
+    0xE80115: 12129,
+    0x2CB0FD: 4710,
+    0x88AC9E: 574,
+    0x9C36F8: 12130,
+    0xE0B72E: 12131,
+    0xB859CE: 121,
+    0x8C7AAA: 49,
+    0x7C2499: 49,
+    0xC4FBC8: 12132,
+    0x000D4E: 12133,
+    0x100020: 49,
+    0xBC1E85: 15,
+    0x8CEA12: 4710,
+    0xC8BD4D: 90,
+    0x2C15BF: 90,
+    0x1C53F9: 210,
+    0x04421A: 398,
+    0x207C14: 12134,
+    0xCC3F8A: 12135,
+    0x305696: 444,
+    0x7CB073: 194,
+    0x0CE5A3: 12136,
+    0x409151: 14,
+    0xB0E9FE: 12137,
+    0xC89665: 157,
+    0x305F77: 21,
+    0x8C7A3D: 40,
+    0x987EE3: 146,
+    0x34317F: 5569,
+    0x00BD3E: 1066,
+    0xB85600: 15,
+    0x04B86A: 319,
+    0x18F87F: 12138,
+    0x0899E8: 12139,
+    0xE446B0: 12140,
+    0x54CE82: 11,
+    0x584849: 12,
+    0xE075AA: 12141,
+    0x80CBBC: 247,
+    0xEC354D: 392,
+    0x7C3985: 15,
+    0x44AE44: 117,
+    0x444F8E: 199,
+    0x000534: 12142,
+    0xBC091B: 25,
+    0x0026A7: 12143,
+    0x180712: 12144,
+    0xF02A2B: 12,
+    0x10F605: 194,
+    0x5C8F40: 231,
+    0x90F157: 466,
+    0xFC5C45: 272,
+    0x20D778: 53,
+    0x4C2FD7: 117,
+    0xD47415: 117,
+    0x001441: 12145,
+    0xB4ECFF: 12146,
+    0xF057A6: 25,
+    0x20BECD: 63,
+    0x04ECD8: 25,
+    0x7CC255: 974,
+    0x50586F: 117,
+    0xF0B13F: 117,
+    0x1CE639: 15,
+    0x8C6794: 146,
+    0x642677: 12147,
+    0x700777: 12148,
+    0x0064AF: 4679,
+    0x00BFAF: 31,
+    0xE0CB56: 73,
+    0x40E1E4: 181,
+    0x2864EF: 12149,
+    0x38FF13: 12150,
+    0xD0DBB7: 4633,
+    0xE4B503: 194,
+    0xECF40C: 4,
+    0x1006ED: 4,
+    0xD4EB68: 4,
+    0xC44D84: 4,
+    0x102CEF: 12151,
+    0x8C1D96: 25,
+    0x60DD8E: 25,
+    0xB4CDF5: 12152,
+    0x6CCF39: 12153,
+    0xD88C73: 11,
+    0x3865B2: 49,
+    0xD8DE3A: 49,
+    0x205383: 15,
+    0xB8857B: 15,
+    0x50D065: 12154,
+    0x90593C: 12155,
+    0x1CC10C: 25,
+    0xF4A475: 25,
+    0xC89E43: 511,
+    0xE87865: 49,
+    0xA04ECF: 49,
+    0x0887C7: 49,
+    0xC0D063: 38,
+    0x7C10C9: 398,
+    0xDCF56E: 12156,
+    0x844709: 12157,
+    0x5CD06E: 40,
+    0x0091EB: 232,
+    0xA8671E: 12158,
+    0x8CE9B4: 510,
+    0x08855B: 12159,
+    0xE84FA7: 117,
+    0x449F46: 117,
+    0x345184: 117,
+    0xFCF77B: 117,
+    0x64ED57: 258,
+    0xEC08E5: 78,
+    0x80CC9C: 511,
+    0x74E20C: 77,
+    0x4CD577: 388,
+    0x507097: 29,
+    0x0C6046: 146,
+    0xCC1531: 25,
+    0xC0F9B0: 15,
+    0x280FEB: 285,
+    0xCC2D8C: 1047,
+    0x105403: 12160,
+    0xB81332: 295,
+    0x589153: 275,
+    0x987DDD: 29,
+    0x44DB60: 12161,
+    0xB8B77D: 12162,
+    0xC478A2: 117,
+    0x9C9E71: 117,
+    0xC0238D: 90,
+    0x745D68: 5,
+    0xC0FBF9: 12,
+    0x2811A8: 25,
+    0x74CF00: 37,
+    0x0C9A3C: 25,
+    0xDC2148: 25,
+    0x9C5A81: 40,
+    0x20CFAE: 4,
+    0x98499F: 12163,
+    0x148C4A: 15,
+    0x609BB4: 15,
+    0x7C27BC: 31,
+    0xACE14F: 12164,
+    0xAC976C: 12165,
+    0x2CEADC: 234,
+    0x1469A2: 135,
+    0x046B25: 135,
+    0x1012B4: 135,
+    0x88C9B3: 12,
+    0x5813D3: 182,
+    0x201E88: 25,
+    0x5CB00A: 15,
+    0x206A94: 520,
+    0x309587: 332,
+    0x20CE2A: 12,
+    0x9C32A9: 135,
+    0x908674: 135,
+    0x68262A: 135,
+    0xB8224F: 135,
+    0xC8BD69: 90,
+    0xC04B13: 12166,
+    0x9C7F81: 989,
+    0x642753: 117,
+    0x28534E: 15,
+    0xA87650: 90,
+    0x54D17D: 90,
+    0x603AAF: 90,
+    0x00E5E4: 135,
+    0x643AB1: 135,
+    0x8048A5: 135,
+    0x44BA46: 135,
+    0xF40228: 305,
+    0x0C83CC: 1159,
+    0x14CB19: 19,
+    0x001CC5: 2510,
+    0xE84F25: 102,
+    0x0425E0: 278,
+    0xC8B6FE: 656,
+    0x187CAA: 29,
+    0xC4BCD7: 12167,
+    0xC0AEFD: 12168,
+    0x1027F5: 94,
+    0xECB970: 138,
+    0x308398: 14,
+    0xF889D2: 195,
+    0xDC87CB: 12169,
+    0x385247: 117,
+    0xC0DCD7: 117,
+    0x3037B3: 15,
+    0x7CF666: 220,
+    0x102D41: 33,
+    0xA44C62: 12051,
+    0x40BEEE: 12170,
+    0x7C55A7: 12171,
+    0xFCE806: 4229,
+    0x3078D3: 12172,
+    0x3085EB: 5,
+    0x8406FA: 5,
+    0xB8D43E: 146,
+    0x741575: 40,
+    0x90A822: 77,
+    0x0C5CB5: 12,
+    0x74AD98: 4,
+    0x0017E8: 53,
+    0xE8EA4D: 15,
+    0x3CFFD8: 15,
+    0x50C2ED: 27,
+    0x7864C0: 49,
+    0xE81CD8: 49,
+    0x3C0630: 49,
+    0x848C8D: 49,
+    0x0CE441: 49,
+    0xB82AA9: 49,
+    0x00C06A: 12173,
+    0x8C4361: 12174,
+    0x4851CF: 1305,
+    0x4C5D3C: 4,
+    0x34732D: 4,
+    0x8C3446: 117,
+    0xF46B8C: 589,
+    0xFC3497: 398,
+    0x847AB6: 263,
+    0x245DFC: 12,
+    0xA4CEDA: 48,
+    0x34E9FE: 12175,
+    0x4C617E: 117,
+    0xE0E37C: 117,
+    0x2418C6: 332,
+    0x649714: 63,
+    0xB4107B: 53,
+    0x9C8281: 146,
+    0xAC139C: 262,
+    0x804786: 90,
+    0xD4475A: 12176,
+    0x78A6A0: 516,
+    0x98C3D2: 12177,
+    0xCC86EC: 238,
+    0x047BCB: 61,
+    0xE44164: 81,
+    0x0881B2: 12178,
+    0xC4F174: 63,
+    0x28D0EA: 25,
+    0xCC812A: 146,
+    0x7C1B93: 117,
+    0xDC2D3C: 117,
+    0xE455A8: 20,
+    0x041119: 12,
+    0xE00CE5: 15,
+    0x2841EC: 15,
+    0x7C004D: 15,
+    0x1C9957: 25,
+    0x38A067: 181,
+    0x18A6F7: 86,
+    0x04D320: 163,
+    0x30F94B: 638,
+    0xD8ECE5: 112,
+    0xC470AB: 138,
+    0xCC6B1E: 195,
+    0xF0D08C: 274,
+    0x982782: 12,
+    0xFC4009: 11,
+    0x24A65E: 11,
+    0x509839: 40,
+    0x6407F6: 90,
+    0x48007D: 12179,
+    0x30B1B5: 48,
+    0xE4C90B: 12180,
+    0x70DFF7: 258,
+    0x003DE1: 117,
+    0x5CC336: 8537,
+    0x50ED3C: 49,
+    0xFC041C: 69,
+    0xF4D488: 49,
+    0x682F67: 49,
+    0xE0E8BB: 12181,
+    0x708976: 220,
+    0x245B83: 232,
+    0x584120: 86,
+    0x3C06A7: 86,
+    0x24E927: 12182,
+    0x68ABBC: 166,
+    0x34C103: 12183,
+    0x0C7329: 463,
+    0xB06088: 25,
+    0x6413AB: 15,
+    0x6C13D5: 4,
+    0xF0F564: 90,
+    0xF06F46: 12184,
+    0x6C02E0: 19,
+    0xF0ACA4: 12185,
+    0x802278: 275,
+    0x14230A: 15,
+    0x58AEA8: 15,
+    0x64D7C0: 117,
+    0x946010: 117,
+    0xD814DF: 1129,
+    0x90027A: 12186,
+    0xD05AFD: 194,
+    0x6CD704: 15,
+    0x543AD6: 90,
+    0x845CF3: 25,
+    0x70E46E: 824,
+    0x58AE2B: 117,
+    0xE43C80: 12187,
+    0x0C4885: 514,
+    0x544617: 11,
+    0x5C85F8: 12188,
+    0x2C793D: 12189,
+    0x903CB3: 87,
+    0x9CBCF0: 40,
+    0xA46BB6: 25,
+    0xFC0C45: 37,
+    0x5467E6: 5051,
+    0x34FEC5: 12190,
+    0x5466F9: 4441,
+    0x8C64D4: 12191,
+    0x8444AF: 250,
+    0x14B2E5: 73,
+    0xA8F766: 12192,
+    0x7C210D: 4,
+    0xD03C1F: 25,
+    0xA03D6E: 4,
+    0xB08BD0: 4,
+    0x000BDE: 12193,
+    0xF89725: 12194,
+    0x3C5447: 15,
+    0x006B6F: 15,
+    0x8CDEF9: 166,
+    0x74E9BF: 15,
+    0xD8109F: 15,
+    0x482567: 12195,
+    0xA89AD7: 81,
+    0x181171: 12196,
+    0x603573: 121,
+    0xA49733: 234,
+    0xF02F74: 398,
+    0x006E02: 12197,
+    0xFCD436: 78,
+    0x0CEC8D: 78,
+    0x184F5D: 12198,
+    0x103F44: 40,
+    0xE07726: 117,
+    0x8C3401: 69,
+    0x249F89: 53,
+    0x247625: 53,
+    0x2C1875: 560,
+    0xD06EDE: 3,
+    0xF87A41: 4,
+    0x84F147: 4,
+    0x94A67E: 511,
+    0xD439B8: 655,
+    0xF023AE: 295,
+    0xACF85C: 12199,
+    0x08CBE5: 12200,
+    0x249494: 8536,
+    0x30BE3B: 1696,
+    0x3CA37E: 15,
+    0x7898E8: 329,
+    0x0034A1: 12201,
+    0x78F09B: 117,
+    0x48EF61: 117,
+    0xF0B3EC: 49,
+    0xF465A6: 49,
+    0x00E93A: 43,
+    0x44F21B: 49,
+    0x74650C: 49,
+    0xE06D17: 49,
+    0xF85EA0: 25,
+    0x5C6199: 195,
+    0xE8DB84: 14,
+    0xD05509: 35,
+    0x00081E: 12202,
+    0xA07751: 12203,
+    0x305684: 12204,
+    0x38FC98: 25,
+    0x9CB2E8: 15,
+    0x60DB98: 218,
+    0x6872C3: 90,
+    0x70B13D: 90,
+    0x502F9B: 25,
+    0x14563A: 117,
+    0x7090B7: 117,
+    0xF8E43B: 8323,
+    0x342B70: 12205,
+    0x4C0220: 40,
+    0xD41B81: 388,
+    0xF40B9F: 4235,
+    0xD021AC: 12206,
+    0x7845B3: 117,
+    0x20DCFD: 117,
+    0xFC65B3: 117,
+    0xC094AD: 11,
+    0x00188C: 12207,
+    0x1C90BE: 228,
+    0x787DF3: 12208,
+    0x74731D: 12209,
+    0x001F94: 12210,
+    0x109D7A: 117,
+    0xDC6373: 12211,
+    0xD47EE4: 275,
+    0x1CA852: 12212,
+    0x401C83: 25,
+    0x443B32: 1305,
+    0x88892F: 15,
+    0x28E5B0: 15,
+    0xC440F6: 69,
+    0x84EA97: 73,
+    0xA47D9F: 73,
+    0x38CA73: 4710,
+    0x6C0DC4: 508,
+    0xE01CFC: 329,
+    0x683E26: 25,
+    0x8C554A: 25,
+    0x549FC6: 4,
+    0xF01D2D: 4,
+    0x0055B1: 788,
+    0x74901F: 12213,
+    0x204EF6: 43,
+    0x088FC3: 384,
+    0x9CBF0D: 12214,
+    0x0C8B7D: 1066,
+    0x0023E9: 455,
+    0x3C7C3F: 398,
+    0x24470E: 12215,
+    0x8CD67F: 38,
+    0x34916F: 12216,
+    0xEC4D3E: 166,
+    0x5C91FD: 12217,
+    0xEC3EB3: 112,
+    0xFC449F: 11,
+    0x9860CA: 49,
+    0x4490BB: 49,
+    0x34FD6A: 49,
+    0x443583: 49,
+    0xD8A491: 117,
+    0x681324: 117,
+    0xA8C092: 117,
+    0x24B105: 4265,
+    0x709CD1: 25,
+    0x142C78: 12029,
+    0x98FC84: 12,
+    0xDC7223: 31,
+    0x90AAC3: 520,
+    0x44917C: 145,
+    0x245F9F: 117,
+    0xCCB0A8: 117,
+    0x502873: 117,
+    0xF82E3F: 15,
+    0x90A5AF: 15,
+    0x0476B0: 4,
+    0x40F078: 4,
+    0x78D71A: 655,
+    0x20F44F: 81,
+    0x4CB99B: 755,
+    0xBC7E8B: 90,
+    0x4CAEEC: 12218,
+    0x9C6B37: 232,
+    0xA83759: 117,
+    0x50F7ED: 117,
+    0x6433DB: 53,
+    0xA406E9: 53,
+    0xB0B113: 53,
+    0x3420E3: 272,
+    0x78719C: 258,
+    0x0C31DC: 15,
+    0x40DDD1: 12219,
+    0xC0E7BF: 33,
+    0x8060B7: 195,
+    0x6CA4D1: 5,
+    0xA446B4: 117,
+    0xDCD444: 117,
+    0x70828E: 12220,
+    0x20A171: 77,
+    0x346D9C: 3478,
+    0x7CF9A0: 5,
+    0x345594: 287,
+    0x4C93A6: 12,
+    0xCC47BD: 12221,
+    0x40AA56: 242,
+    0x68545A: 25,
+    0x001E31: 471,
+    0x3CE3E7: 29,
+    0x24FD0D: 1305,
+    0xE0693A: 12222,
+    0x0002AC: 12223,
+    0x5488DE: 4,
+    0x782B64: 389,
+    0xD4F756: 11,
+    0x54AB3A: 476,
+    0xE89A8F: 476,
+    0xEC6C9A: 48,
+    0x0CC844: 178,
+    0xE0B260: 12224,
+    0x482335: 4619,
+    0xE8DA20: 35,
+    0xE8136E: 15,
+    0x4CAE13: 15,
+    0x4C2EFE: 12225,
+    0x643AEA: 4,
+    0x3C53D7: 12226,
+    0xA0D83D: 5,
+    0x58F2FC: 117,
+    0x10BC97: 146,
+    0xD01411: 12,
+    0x507043: 319,
+    0x4401BB: 664,
+    0xC80210: 285,
+    0xE06CA6: 12227,
+    0x44680C: 353,
+    0x980E24: 307,
+    0xA830BC: 90,
+    0x001EB2: 285,
+    0xC086B3: 12228,
+    0x44ADB1: 3,
+    0x1C98C1: 195,
+    0xA09B17: 278,
+    0x0063DE: 12229,
+    0x60A423: 238,
+    0x7846D4: 90,
+    0x6888A1: 638,
+    0xE43EC6: 15,
+    0x38881E: 15,
+    0x2CDB07: 25,
+    0x988D46: 25,
+    0x001693: 12230,
+    0xAC1F09: 12231,
+    0x10F920: 4,
+    0x9077EE: 4,
+    0x3C13CC: 4,
+    0xD8DC40: 49,
+    0x805FC5: 49,
+    0x3C4DBE: 49,
+    0x48262C: 49,
+    0x147DDA: 49,
+    0xC4910C: 49,
+    0x2848E7: 117,
+    0xE4268B: 117,
+    0x6C9961: 3,
+    0x206980: 49,
+    0xBC13A8: 574,
+    0x94E3EE: 11,
+    0x8CE468: 12232,
+    0xC0E3A0: 232,
+    0xAC2334: 444,
+    0xF8BC0E: 63,
+    0xE01995: 4639,
+    0x2479EF: 12233,
+    0xB05CDA: 19,
+    0xFCBC0E: 11917,
+    0x2CD066: 40,
+    0x50E039: 112,
+    0xB85776: 12234,
+    0xF85128: 12235,
+    0x2400FA: 12236,
+    0xDCBD7A: 257,
+    0x342EB7: 25,
+    0x60AAEF: 117,
+    0xD0F3F5: 117,
+    0x9016BA: 15,
+    0xD44649: 15,
+    0x9400B0: 15,
+    0xBC26A1: 12237,
+    0x18DFC1: 12238,
+    0xE44122: 71,
+    0x9C19C2: 281,
+    0xB01B7C: 12239,
+    0x001C70: 12240,
+    0x000FA4: 12241,
+    0x0024A2: 12242,
+    0x74CBF3: 12243,
+    0x84A3B5: 12244,
+    0x9CEDFA: 12245,
+    0xEC63ED: 12246,
+    0x1C1338: 12247,
+    0x2468B0: 90,
+    0x30FCEB: 514,
+    0xFC71FA: 12248,
+    0x0002D8: 12249,
+    0xB4EF1C: 12250,
+    0xB8F009: 14,
+    0x0001CC: 12251,
+    0x04F5F4: 11729,
+    0x008016: 12252,
+    0xE8B470: 12,
+    0xA4B1C1: 25,
+    0x00092E: 12253,
+    0xD41AC8: 12254,
+    0x5061F6: 638,
+    0xF4EB9F: 12255,
+    0xE898C2: 12256,
+    0x64DDE9: 40,
+    0x4C4088: 12257,
+    0xB04502: 117,
+    0x1C1FF1: 117,
+    0x14DE39: 117,
+    0xF45420: 351,
+    0x0C817D: 12258,
+    0xC8BCE5: 12259,
+    0x9C611D: 12260,
+    0xC095DA: 12261,
+    0x6849B2: 12262,
+    0x487AFF: 4889,
+    0xC8D778: 4784,
+    0xCCA7C1: 210,
+    0xA4C54E: 117,
+    0xD4BBE6: 117,
+    0x40B6E7: 117,
+    0xD0B45D: 117,
+    0x8836CF: 117,
+    0x009EEE: 5033,
+    0x8C5FAD: 5,
+    0xACC25D: 5,
+    0x8C0C87: 81,
+    0xF0D5BF: 25,
+    0xDCD2FC: 15,
+    0x60F262: 25,
+    0x00A058: 12263,
+    0x7C9EBD: 14,
+    0x1C0219: 69,
+    0x6C6A77: 25,
+    0x1869D8: 220,
+    0xC8B29B: 25,
+    0xCC418E: 12264,
+    0xB42200: 8864,
+    0x402F86: 285,
+    0x186F2D: 4493,
+    0xF84FAD: 31,
+    0x4C0A3D: 12265,
+    0xCC7F76: 4,
+    0x9405BB: 12,
+    0xB802A4: 12266,
+    0xA84122: 12267,
+    0x206D31: 12268,
+    0xE48326: 15,
+    0x447654: 15,
+    0x7CD9A0: 15,
+    0xF033E5: 15,
+    0x3C806B: 12269,
+    0x60DE35: 12270,
+    0x28317E: 950,
+    0xB4F18C: 117,
+    0xC432D1: 12271,
+    0xDC9840: 157,
+    0xB8CEF6: 270,
+    0x6CDDBC: 90,
+    0x8C3B32: 12272,
+    0x3C58C2: 25,
+    0xCCF9E4: 25,
+    0x645CF3: 12273,
+    0x90749D: 8510,
+    0x28401A: 12274,
+    0xD06544: 49,
+    0xE490FD: 49,
+    0x84AB1A: 49,
+    0xE45E37: 25,
+    0xB0CCFE: 117,
+    0x540DF9: 117,
+    0x006619: 117,
+    0xFC3964: 163,
+    0xE8ABFA: 12275,
+    0x14472D: 69,
+    0x000E9E: 12276,
+    0x5894B2: 12277,
+    0xB09575: 86,
+    0x000C1E: 12278,
+    0xF008D1: 14,
+    0x90E2FC: 12,
+    0xC853E1: 12279,
+    0x14169D: 4,
+    0x48A2E6: 680,
+    0xCCD42E: 48,
+    0x14AE85: 12,
+    0x048C16: 15,
+    0x98DD5B: 12280,
+    0xB4B055: 15,
+    0x3C5CF1: 63,
+    0x48D24F: 3,
+    0xE4AAEC: 12281,
+    0x94BE46: 443,
+    0x6C5D3A: 157,
+    0x8CC681: 25,
+    0xC8C750: 78,
+    0xACF8CC: 258,
+    0x8C5A25: 258,
+    0x2CDCD7: 43,
+    0x483FDA: 14,
+    0xE0BB9E: 378,
+    0x48DD0C: 63,
+    0x58278C: 310,
+    0x140AC5: 77,
+    0x2083F8: 5874,
+    0x940C98: 49,
+    0xE8FBE9: 49,
+    0x38EC0D: 49,
+    0x9C54DA: 357,
+    0x4C494F: 11,
+    0xC4741E: 11,
+    0xD46075: 154,
+    0x78C5F8: 117,
+    0xDC8983: 90,
+    0x5CCB99: 90,
+    0x90B144: 90,
+    0x001D7D: 538,
+    0x1C6F65: 538,
+    0x00241D: 538,
+    0xE47C65: 12282,
+    0x5C78F8: 117,
+    0xB827C5: 117,
+    0xD45D64: 398,
+    0x142A14: 12283,
+    0xB86142: 12284,
+    0xFC8E5B: 4677,
+    0xA4307A: 90,
+    0x00A0B3: 12285,
+    0x384B5B: 12286,
+    0x34E3DA: 12287,
+    0xD87E76: 163,
+    0x200A0D: 12,
+    0x2CE310: 12288,
+    0x6819AC: 12289,
+    0xE82E0C: 12290,
+    0x1892A4: 655,
+    0x14115D: 560,
+    0xB0735D: 117,
+    0xF0B4D2: 329,
+    0x5C3A45: 388,
+    0xA03C31: 8230,
+    0xE4F327: 12291,
+    0x404C77: 258,
+    0xA897CD: 258,
+    0x10082C: 53,
+    0x6802B8: 288,
+    0x3463D4: 12292,
+    0x08F7E9: 12293,
+    0x502DBB: 167,
+    0x3C22FB: 49,
+    0xD49E3B: 257,
+    0xDC4BDD: 37,
+    0xC0B5CD: 117,
+    0x4C5077: 117,
+    0x30FD65: 15,
+    0x58EAFC: 12294,
+    0x9013DA: 12295,
+    0xDCDCE2: 90,
+    0xA0AC69: 90,
+    0x1089FB: 90,
+    0x5C3A3D: 11,
+    0x7CA1AE: 49,
+    0x80E455: 21,
+    0x00909E: 12296,
+    0xACBD70: 117,
+    0x90B8E0: 12297,
+    0x2C4CC6: 102,
+    0x38E8EE: 12298,
+    0x440377: 12,
+    0x0812A5: 77,
+    0x9CF531: 69,
+    0xC809A8: 25,
+    0x748B34: 12299,
+    0x4CBC72: 12300,
+    0xD4772B: 12301,
+    0x64F9C0: 12302,
+    0xBCA511: 511,
+    0xF8C4F3: 12088,
+    0xC4E90A: 329,
+    0x18D0C5: 69,
+    0x30E98E: 15,
+    0xC4447D: 15,
+    0x34ED1B: 4,
+    0x142475: 12303,
+    0x80647A: 12304,
+    0xC0B883: 25,
+    0x70F82B: 317,
+    0x44CB8B: 285,
+    0xEC1BBD: 238,
+    0x10DCB6: 12,
+    0xD8A315: 146,
+    0x14A1BF: 12305,
+    0x9483C4: 12306,
+    0x1CEA0B: 87,
+    0x24418C: 25,
+    0x44EFBF: 242,
+    0x4CB44A: 12307,
+    0xF8D027: 378,
+    0x5C666C: 69,
+    0x4C4BF9: 12,
+    0x9C93B0: 12308,
+    0x64AEF1: 12309,
+    0x048C9A: 117,
+    0xEC3CBB: 117,
+    0x28BD89: 210,
+    0x984827: 86,
+    0x70441C: 12188,
+    0xACE342: 15,
+    0x9017C8: 15,
+    0x88D5A8: 163,
+    0xB81F5E: 12310,
+    0xD81265: 388,
+    0x8C3A7E: 638,
+    0x208593: 12,
+    0xE4922A: 12311,
+    0x2C641F: 1066,
+    0x54E7D5: 5759,
+    0xB47C59: 12312,
+    0x300D9E: 138,
+    0xBCB0E7: 15,
+    0x5434EF: 15,
+    0xECFA5C: 508,
+    0xF8B46A: 607,
+    0x4801C5: 71,
+    0x18BF1C: 1290,
+    0x207759: 12313,
+    0x889D98: 12314,
+    0x4C56DF: 12315,
+    0xB4EE25: 8230,
+    0xC82B96: 14,
+    0xDCF8B9: 11,
+    0x189088: 63,
+    0x241510: 12,
+    0x6C4D51: 12316,
+    0x98523D: 412,
+    0x000163: 4,
+    0xE00084: 15,
+    0x04819B: 319,
+    0x2CA89C: 12317,
+    0x4CDC0D: 12318,
+    0xC4E1A1: 69,
+    0xACC358: 4652,
+    0xF09919: 466,
+    0x1855E3: 49,
+    0xE450EB: 49,
+    0x886440: 49,
+    0x6070C0: 49,
+    0xF0C371: 49,
+    0x60634C: 329,
+    0x683489: 12319,
+    0x94BF80: 11,
+    0x0000DE: 12320,
+    0xF43E66: 12321,
+    0xDC396F: 427,
+    0xB4C476: 12322,
+    0x9C3A9A: 4493,
+    0xB46C47: 5569,
+    0x64FF0A: 57,
+    0x44422F: 12323,
+    0x549C27: 12324,
+    0x541589: 8559,
+    0x845733: 157,
+    0x3CECEF: 974,
+    0x987A14: 157,
+    0xC83DDC: 40,
+    0xB0B5E8: 12325,
+    0x58F39C: 4,
+    0x002423: 9486,
+    0x8C593C: 12,
+    0x6029D5: 12326,
+    0x509744: 554,
+    0x0077E4: 181,
+    0x380118: 12327,
+    0x14ADCA: 4677,
+    0x00AD63: 12328,
+    0xF41D6B: 15,
+    0x7CEC9B: 12329,
+    0xCC9070: 4,
+    0x2841C6: 15,
+    0xE415F6: 53,
+    0xE828C1: 978,
+    0x78D347: 228,
+    0xF82387: 12330,
+    0x809133: 43,
+    0xBC98DF: 78,
+    0x70FC8F: 524,
+    0x501B32: 278,
+    0x1819D6: 90,
+    0xAC4228: 12331,
+    0xB4F58E: 15,
+    0xC48FC1: 12332,
+    0xB0A6F5: 12333,
+    0xACF5E6: 4,
+    0xD4D252: 25,
+    0x58A023: 25,
+    0xDCB082: 81,
+    0xF8C397: 12334,
+    0x70DDA8: 69,
+    0x4C6F9C: 69,
+    0x782C29: 21,
+    0xA4A179: 12335,
+    0x68DB67: 8561,
+    0x980D67: 112,
+    0x702E80: 12336,
+    0xACA46E: 725,
+    0xC8B422: 234,
+    0x94EE9F: 145,
+    0xF4323D: 4725,
+    0x109397: 258,
+    0x5075F1: 258,
+    0x001EA3: 889,
+    0x38F32E: 473,
+    0xDC2AA1: 12337,
+    0xE4F3E8: 37,
+    0xF8B797: 404,
+    0xB0AAD2: 4725,
+    0xCCA12B: 1129,
+    0xC46516: 607,
+    0xE41E0A: 12,
+    0xAC00D0: 11,
+    0xE8C417: 5,
+    0x243154: 15,
+    0x981E19: 3,
+    0x84B866: 12338,
+    0x1422DB: 63,
+    0xE8ECA3: 12339,
+    0x08A6BC: 77,
+    0x2C58E8: 15,
+    0x18BC5A: 250,
+    0xC4C138: 12340,
+    0xAC37C9: 12341,
+    0x205869: 272,
+    0xCC37AB: 87,
+    0x907841: 25,
+    0xC86314: 12,
+    0x1CB3E9: 12342,
+    0x84B8B8: 443,
+    0xD041C9: 5,
+    0xE8018D: 5,
+    0x18399C: 12343,
+    0x94C2BD: 12344,
+    0x4883B4: 69,
+    0x701E68: 12345,
+    0xC0074A: 12346,
+    0xE8B2FE: 132,
+    0x0017FA: 157,
+    0x10A3B8: 1494,
+    0x70CD91: 4733,
+    0x941625: 49,
+    0x543B30: 12347,
+    0x8C965F: 12348,
+    0xB0BB8B: 12349,
+    0x34A8EB: 49,
+    0xA483E7: 49,
+    0xF4AFE7: 49,
+    0xAC88FD: 49,
+    0x6489F1: 90,
+    0x503E7C: 12350,
+    0x243F30: 12351,
+    0x3C9180: 192,
+    0x20326C: 90,
+    0x80FD7A: 4405,
+    0xB4A305: 12352,
+    0x803E48: 725,
+    0x24586E: 11,
+    0x94BFC4: 272,
+    0x2034FB: 40,
+    0xA89CED: 40,
+    0x6CA604: 258,
+    0xD0EC35: 4,
+    0x00124E: 12353,
+    0x88E034: 12354,
+    0xBCCF4F: 112,
+    0x0CE041: 12355,
+    0xB88FB4: 12356,
+    0xC010B1: 145,
+    0x0052C2: 644,
+    0x90895F: 755,
+    0x48D845: 12357,
+    0xE458E7: 90,
+    0x00104A: 12358,
+    0x380025: 25,
+    0x48C3B0: 12359,
+    0xDC58BC: 12360,
+    0x001025: 12361,
+    0x70EA1A: 4,
+    0x808A8B: 146,
+    0x0CF475: 12362,
+    0x68FF7B: 86,
+    0x808F1D: 86,
+    0x48BD0E: 12363,
+    0x000F69: 12364,
+    0x8C53D2: 29,
+    0xD058C0: 12365,
+    0xF8D478: 618,
+    0xD45383: 102,
+    0xA04246: 12366,
+    0xDC6723: 12367,
+    0x44B462: 618,
+    0xA45F9B: 12368,
+    0x1C3B8F: 12369,
+    0xE4E749: 607,
+    0x9844B6: 12370,
+    0x38839A: 787,
+    0xC8F6C8: 5,
+    0xECC57F: 12371,
+    0xA86DAA: 25,
+    0x38C2BA: 12372,
+    0xA0F9B7: 12373,
+    0xA83CCB: 12374,
+    0xCC3FEA: 12375,
+    0xE85BB7: 12376,
+    0x94677E: 12377,
+    0xAC4330: 12378,
+    0xD43A2E: 5051,
+    0x30C3D9: 159,
+    0xAC5775: 145,
+    0x50AD92: 12379,
+    0x4CF2BF: 820,
+    0xCC9EA2: 77,
+    0x003217: 4,
+    0x001BFB: 159,
+    0x8CAEDB: 9403,
+    0x78B213: 317,
+    0x7CDB98: 234,
+    0xF00DF5: 12380,
+    0x58C232: 485,
+    0x381D14: 12381,
+    0x74F737: 12382,
+    0x48A493: 70,
+    0x88D211: 12383,
+    0xB8C227: 12384,
+    0x3C286D: 210,
+    0x00093A: 672,
+    0x6CA936: 12385,
+    0x708540: 560,
+    0x94E0D6: 242,
+    0xB4A9FC: 476,
+    0x380B3C: 53,
+    0x6845F1: 12386,
+    0xB40B78: 5754,
+    0x207918: 25,
+    0xA48CC0: 12387,
+    0xDC48B2: 12388,
+    0xACAE19: 58,
+    0x0C9541: 483,
+    0x14D00D: 49,
+    0xC03DD9: 128,
+    0x2CAA8E: 342,
+    0x703A51: 40,
+    0x9C6937: 186,
+    0xE82C6D: 12389,
+    0x04F9D9: 12390,
+    0x181E95: 12391,
+    0xDC080F: 49,
+    0xF8E94E: 49,
+    0xEC2CE2: 49,
+    0x40BC60: 49,
+    0xE83617: 49,
+    0x9C648B: 49,
+    0x344262: 49,
+    0x48E695: 12392,
+    0xB479C8: 272,
+    0x706D15: 4,
+    0xA4A1E4: 12393,
+    0x001060: 12394,
+    0xC4D489: 12395,
+    0xB82CA0: 680,
+    0xB4F949: 12396,
+    0x48352E: 12397,
+    0x6CC7EC: 305,
+    0xD89685: 235,
+    0xC0BDC8: 90,
+    0x647BCE: 90,
+    0xA887B3: 90,
+    0x6C006B: 90,
+    0x3C01EF: 133,
+    0x04E598: 40,
+    0x3C3786: 511,
+    0x98D3E7: 12398,
+    0xF063F9: 15,
+    0x7CC385: 15,
+    0x900EB3: 12399,
+    0x00AD24: 329,
+    0x1CFD08: 12,
+    0xB8599F: 270,
+    0x301389: 12400,
+    0xA0A4C5: 25,
+    0x105BAD: 693,
+    0x94EAEA: 351,
+    0xF4D108: 25,
+    0x60CE92: 12401,
+    0x74BFC0: 1131,
+    0xC8D9D2: 607,
+    0x24FCE5: 90,
+    0x809621: 675,
+    0x78055F: 12402,
+    0x1862E4: 53,
+    0x20B001: 1134,
+    0xF05494: 12403,
+    0x54068B: 12404,
+    0x549FAE: 12405,
+    0xB02A43: 210,
+    0x181DEA: 25,
+    0x185680: 25,
+    0xC474F8: 12406,
+    0x48872D: 12407,
+    0xE81A58: 12408,
+    0x00EABD: 4,
+    0x5CC999: 21,
+    0xEC79F2: 12409,
+    0x04BC87: 12410,
+    0x54C33E: 655,
+    0x142233: 5,
+    0xBCB22B: 12411,
+    0xDC3757: 554,
+    0x005099: 716,
+    0xD4AB82: 258,
+    0x704FB8: 258,
+    0x0060EB: 12412,
+    0x743400: 12413,
+    0x6035C0: 4542,
+    0x001AC5: 4794,
+    0x00201E: 12414,
+    0x00608C: 717,
+    0x00A024: 717,
+    0x0020AF: 717,
+    0x00104B: 717,
+    0xB08BCF: 4,
+    0xC4985C: 31,
+    0x30A1FA: 15,
+    0x645D86: 25,
+    0x64628A: 12415,
+    0x0415D9: 12416,
+    0x9CAA1B: 157,
+    0xA89A93: 3,
+    0x8C9246: 12417,
+    0xECB313: 725,
+    0x242E90: 12418,
+    0xF4068D: 726,
+    0x988ED4: 163,
+    0xE8A788: 12056,
+    0x0C9D92: 398,
+    0x0CCB85: 78,
+    0x4017E2: 12419,
+    0x4898CA: 33,
+    0x247E51: 11,
+    0xE8B541: 11,
+    0x0C96E6: 707,
+    0x3C8994: 319,
+    0x582D34: 12420,
+    0x20DE88: 12421,
+    0xA85AF3: 12422,
+    0x70FD46: 90,
+    0x8C83E1: 90,
+    0x889F6F: 90,
+    0x5C63C9: 12423,
+    0x000E94: 12424,
+    0x000C43: 12425,
+    0x001A31: 12426,
+    0x001B84: 12427,
+    0xE00EE1: 460,
+    0x482CA0: 40,
+    0xA4E615: 407,
+    0xA09351: 4,
+    0x88AE1D: 384,
+    0xB888E3: 384,
+    0x3412F9: 15,
+    0xBCE265: 15,
+    0x4CD1A1: 15,
+    0x88BFE4: 15,
+    0x741F79: 12428,
+    0x208984: 384,
+    0xB4CEFE: 12429,
+    0xF8CC6E: 12430,
+    0xF8369B: 53,
+    0x00C055: 12431,
+    0xE41FE9: 12432,
+    0xD8760A: 12433,
+    0x5C2ED2: 12434,
+    0x20163D: 554,
+    0x641331: 12435,
+    0x183A48: 12436,
+    0x782F17: 12437,
+    0xB0027E: 12438,
+    0x24FAF3: 12439,
+    0xC4518D: 574,
+    0x486834: 12440,
+    0x001133: 12441,
+    0x000B23: 4808,
+    0x340A98: 15,
+    0x646D6C: 15,
+    0xC4B8B4: 15,
+    0x289EFC: 3,
+    0xE0735F: 12442,
+    0x0051ED: 285,
+    0x98039B: 270,
+    0x40DC9D: 12443,
+    0xF0BCC9: 8039,
+    0x88D2BF: 12444,
+    0x8C3579: 12445,
+    0x38C70A: 12446,
+    0xD82477: 12447,
+    0x00907F: 3550,
+    0x4C5E0C: 439,
+    0xD4CA6D: 439,
+    0xFCFBFB: 4,
+    0x007E95: 4,
+    0x08D46A: 514,
+    0x4006A0: 53,
+    0x487583: 12448,
+    0x9C5A44: 384,
+    0x14CAA0: 12449,
+    0x80B575: 15,
+    0xA4BE2B: 15,
+    0x2811A5: 389,
+    0xD8F3DB: 12450,
+    0xDCB4AC: 4762,
+    0xF4EE14: 751,
+    0x6C5940: 751,
+    0xD02516: 751,
+    0x1C60DE: 751,
+    0x001472: 12451,
+    0xA45385: 755,
+    0x00402F: 12452,
+    0x04ECBB: 5,
+    0x001017: 10269,
+    0xD42122: 463,
+    0x00C002: 463,
+    0x68E7C2: 90,
+    0x58B10F: 90,
+    0x203DBD: 285,
+    0x280245: 12453,
+    0xE48F65: 12454,
+    0x840D8E: 14,
+    0xA492CB: 81,
+    0xC0D2F3: 31,
+    0x94193A: 12455,
+    0xBC9911: 112,
+    0x3CF5CC: 21,
+    0x00BB3A: 77,
+    0xC08135: 12456,
+    0x3CF4F9: 12457,
+    0x0CB34F: 12458,
+    0x64A2F9: 71,
+    0xA87D12: 15,
+    0xF82DC0: 258,
+    0x189C27: 258,
+    0x88D37B: 12459,
+    0xB4C0F5: 423,
+    0x406231: 12460,
+    0xFCB7F0: 12461,
+    0x5050CE: 12462,
+    0x2C28B7: 12463,
+    0x046B1B: 12464,
+    0xE8FAF7: 12465,
+    0x949D57: 12466,
+    0xFC6947: 53,
+    0x1C666D: 885,
+    0xDCDE4F: 12467,
+    0x4CD0CB: 15,
+    0x3C24F0: 12,
+    0x58DB15: 231,
+    0x002082: 12468,
+    0x0000A8: 768,
+    0x0004FC: 768,
+    0xE07DEA: 53,
+    0x505DAC: 15,
+    0xB0A37E: 4830,
+    0x04D3B0: 25,
+    0x3CEAF9: 12469,
+    0x682C7B: 4,
+    0x441E98: 272,
+    0x00250C: 12470,
+    0x0C8063: 86,
+    0x007278: 4,
+    0x00A021: 6078,
+    0x90DD5D: 49,
+    0xDC2919: 12471,
+    0x645AED: 49,
+    0x84F3EB: 14,
+    0x001B48: 12472,
+    0x50BC96: 49,
+    0xFC2A9C: 49,
+    0xA056F3: 49,
+    0x549963: 49,
+    0xC0B658: 49,
+    0x48A91C: 49,
+    0x002FD9: 5,
+    0x885FE8: 12,
+    0xF0AF50: 12473,
+    0xB4CD27: 15,
+    0xC819F7: 90,
+    0xC42C4F: 12474,
+    0x24CACB: 5,
+    0x543E64: 5,
+    0x6402CB: 258,
+    0x3880DF: 78,
+    0xBC6A2F: 12475,
+    0x48BD3D: 21,
+    0x0C08B4: 132,
+    0xF4E11E: 53,
+    0x002705: 12476,
+    0x180F76: 329,
+    0xDC0265: 12477,
+    0x909497: 15,
+    0xDC729B: 15,
+    0x14A72B: 12478,
+    0x3C1710: 3,
+    0x34029B: 12479,
+    0x84DB9E: 12480,
+    0x900372: 12481,
+    0xA4DA22: 12,
+    0x8C4CAD: 12482,
+    0xD4E6B7: 90,
+    0x4C776D: 4,
+    0x3CDCBC: 90,
+    0x804E70: 90,
+    0x74E182: 53,
+    0xE8DEFB: 12483,
+    0x94FE9D: 725,
+    0x6CB6CA: 12484,
+    0x04D13A: 40,
+    0x8CF957: 12485,
+    0x0CC6CC: 15,
+    0x6CC4D5: 145,
+    0x80C548: 12486,
+    0xC400AD: 3090,
+    0x3499D7: 12487,
+    0x0C8BD3: 163,
+    0x0024AF: 4679,
+    0xC0A8F0: 12488,
+    0x9C431E: 12,
+    0x4CC206: 12489,
+    0x785860: 15,
+    0xE8ABF3: 15,
+    0x449EF9: 146,
+    0xB4E9A3: 12490,
+    0x6C2ACB: 10838,
+    0x980074: 212,
+    0x18C19D: 554,
+    0x0C9838: 40,
+    0x282C02: 12,
+    0x583BD9: 5,
+    0xDCA266: 885,
+    0xC48466: 49,
+    0x347C25: 49,
+    0xCC2DB7: 49,
+    0xA0BDCD: 319,
+    0xFCA183: 77,
+    0x74EACB: 21,
+    0xBC91B5: 444,
+    0xD41A3F: 69,
+    0x30C507: 1109,
+    0x282FC2: 12491,
+    0xE88E60: 12492,
+    0x000F9B: 12493,
+    0x0024BA: 53,
+    0x60512C: 274,
+    0x64DB81: 12494,
+    0x44AD19: 12495,
+    0x38ADBE: 21,
+    0x04B167: 40,
+    0xEC8350: 157,
+    0x5C865C: 90,
+    0x5CAD76: 869,
+    0x646E6C: 12496,
+    0x04F128: 145,
+    0x0C5203: 12497,
+    0x2C5491: 157,
+    0xE4A7A0: 25,
+    0xC8458F: 12498,
+    0x001BB9: 1101,
+    0x002461: 12499,
+    0x1CDF52: 53,
+    0x001E1D: 12500,
+    0x5CE28C: 112,
+    0xE4BD4B: 11,
+    0x3C2EF9: 49,
+    0x7C010A: 53,
+    0x000144: 848,
+    0x08001B: 848,
+    0x38D7CA: 12501,
+    0xA04EA7: 49,
+    0xF0989D: 49,
+    0xE42B34: 49,
+    0x7846C4: 833,
+    0xFCD6BD: 96,
+    0x18396E: 12502,
+    0xEC7D11: 146,
+    0xD80831: 90,
+    0x701F53: 4,
+    0x9441C1: 12503,
+    0x48BA4E: 607,
+    0x500F80: 4,
+    0x504EDC: 796,
+    0x08674E: 579,
+    0x8C68C8: 11,
+    0xEC8263: 11,
+    0x74BBD3: 12504,
+    0x683C7D: 12505,
+    0x0C1C20: 12506,
+    0x94282E: 21,
+    0x10F1F2: 514,
+    0x8C3C4A: 958,
+    0x6CB749: 15,
+    0x989C57: 15,
+    0x185282: 5,
+    0x7086C1: 53,
+    0xDC6AEA: 444,
+    0x98F5A9: 373,
+    0xD86162: 57,
+    0xF4D7B2: 12507,
+    0x00152A: 882,
+    0xA41115: 12508,
+    0x28840E: 12509,
+    0x80615F: 4505,
+    0x444AB0: 12510,
+    0xB019C6: 49,
+    0x9C4A7B: 882,
+    0x2CD2E7: 882,
+    0x386EA2: 146,
+    0x982D68: 12511,
+    0xBC2E48: 258,
+    0x608CE6: 258,
+    0x080070: 6290,
+    0x48EC5B: 181,
+    0xC421C8: 825,
+    0x80739F: 825,
+    0x3866F0: 49,
+    0x705812: 878,
+    0x04209A: 878,
+    0x34008A: 12,
+    0x9050CA: 520,
+    0x409922: 43,
+    0xC06D1A: 12512,
+    0x107B44: 398,
+    0x1CAB34: 21,
+    0x3C7843: 15,
+    0x5C0979: 15,
+    0xE4FB5D: 15,
+    0xE86819: 15,
+    0xAC512C: 444,
+    0x0030C8: 12513,
+    0x0016E0: 2510,
+    0x40D63C: 12514,
+    0xF4F3AA: 12515,
+    0x40A3CC: 25,
+    0xD8DECE: 12516,
+    0x801934: 25,
+    0x703EAC: 49,
+    0x0011C0: 12517,
+    0x0005F1: 12518,
+    0x84253F: 8312,
+    0x0008C9: 12519,
+    0xD8B12A: 879,
+    0x8C2505: 15,
+    0x08A8A1: 12520,
+    0xF4B520: 12521,
+    0x008009: 12522,
+    0x00C064: 2876,
+    0x30C01B: 286,
+    0x8C3BAD: 511,
+    0x64CFD9: 53,
+    0x747D24: 722,
+    0x50642B: 698,
+    0x887A31: 12523,
+    0x8C0F6F: 814,
+    0x309935: 11,
+    0x0C72D9: 11,
+    0x6432A8: 25,
+    0x8886C2: 12524,
+    0xCC2F71: 25,
+    0xB8F8BE: 9131,
+    0x2C5D93: 272,
+    0x38FF36: 272,
+    0x84183A: 272,
+    0xA47B9D: 14,
+    0x7C2EDD: 90,
+    0x3CF7A4: 90,
+    0x0000FE: 12525,
+    0x38E595: 725,
+    0xBC9680: 725,
+    0x24C9A1: 272,
+    0x002482: 272,
+    0x689234: 272,
+    0x50A733: 272,
+    0x103034: 12526,
+    0x00D01F: 12527,
+    0x4C65A8: 12,
+    0xD822F4: 12528,
+    0x348F27: 272,
+    0x2C9EEC: 12529,
+    0x706E6D: 4,
+    0xE86D65: 12530,
+    0x6447E0: 11922,
+    0xB44F96: 12531,
+    0xB0DFC1: 901,
+    0x9C6F52: 11,
+    0x604762: 12532,
+    0x986F60: 69,
+    0xBC1C81: 12533,
+    0x900A1A: 278,
+    0x506E92: 12534,
+    0x30FE31: 81,
+    0xC4571F: 12535,
+    0x886AE3: 1159,
+    0x1C4D70: 25,
+    0x001CFA: 12536,
+    0x60313B: 276,
+    0x6CB227: 12537,
+    0x00A3D1: 4,
+    0x488D36: 48,
+    0xE8E1E1: 182,
+    0x28070D: 12538,
+    0xFC4D8C: 12539,
+    0xFC06ED: 12094,
+    0xBCD713: 12540,
+    0x000CAB: 1097,
+    0x745427: 989,
+    0x60720B: 4405,
+    0x308976: 12541,
+    0x2C2617: 12542,
+    0x10C6FC: 466,
+    0xAC2205: 288,
+    0x80A036: 447,
+    0xF07485: 12543,
+    0x34D954: 12544,
+    0x4857DD: 12545,
+    0x487D2E: 86,
+    0xF0D4F6: 12546,
+    0xF4A997: 1131,
+    0xB0DAF9: 258,
+    0x1835D1: 258,
+    0x64DFE9: 12547,
+    0xA0094C: 12548,
+    0x20F452: 12549,
+    0xB43934: 12550,
+    0x7426AC: 4,
+    0x143F27: 12551,
+    0x105887: 5,
+    0xB02628: 293,
+    0x900E83: 12552,
+    0x601466: 11,
+    0x38AC3D: 12553,
+    0x9874DA: 444,
+    0x1C5A0B: 12554,
+    0x046E02: 12555,
+    0x9C061B: 955,
+    0x50338B: 53,
+    0x6854ED: 940,
+    0xE037BF: 57,
+    0xAC7409: 955,
+    0x680235: 12556,
+    0xD8D866: 12557,
+    0xD8C06A: 12558,
+    0x001192: 4,
+    0x38F135: 12559,
+    0xE8DE8E: 554,
+    0xE81367: 12560,
+    0xAC202E: 520,
+    0x70AF24: 12561,
+    0xA41163: 12,
+    0x7CE97C: 163,
+    0xC4D197: 12562,
+    0xF49634: 25,
+    0xF093C5: 12563,
+    0x9810E8: 49,
+    0x2C86D2: 4,
+    0xDCA4CA: 49,
+    0x8C8FE9: 49,
+    0xC0D012: 49,
+    0xBCA920: 49,
+    0x48A195: 49,
+    0xF80377: 49,
+    0xC49DED: 157,
+    0x98A40E: 12564,
+    0x8058F8: 78,
+    0x70AF25: 12565,
+    0xE8D11B: 234,
+    0x0C5F35: 12566,
+    0x9800C1: 12567,
+    0xCCBE59: 218,
+    0x903D6B: 12568,
+    0xB0C46C: 12569,
+    0x98D3D2: 12570,
+    0x001912: 12571,
+    0xB8F883: 86,
+    0xDCFE18: 86,
+    0x704F57: 86,
+    0x8C78D7: 989,
+    0xB8EAAA: 12572,
+    0x5CBA37: 157,
+    0x00C0C6: 12573,
+    0x3C7F6F: 191,
+    0xF8A34F: 11,
+    0xC87324: 12574,
+    0x00210D: 12575,
+    0x0002A1: 12576,
+    0x00E022: 874,
+    0x50E666: 12577,
+    0x0016D3: 4957,
+    0x001F16: 4957,
+    0x00262D: 4957,
+    0xB04089: 12578,
+    0x5425EA: 15,
+    0xC894BB: 15,
+    0x10B1F8: 15,
+    0x089E08: 210,
+    0x28FECD: 8870,
+    0x4C4E03: 274,
+    0x0495E6: 901,
+    0x702D84: 12579,
+    0xC0D9F7: 12580,
+    0x00608B: 12581,
+    0xCCA219: 12582,
+    0x4C1A3A: 12583,
+    0x2C200B: 49,
+    0x8866A5: 49,
+    0x901711: 12584,
+    0x0010DE: 12585,
+    0x38BC01: 15,
+    0x341E6B: 15,
+    0x886639: 15,
+    0x000048: 378,
+    0x8CA5A1: 12586,
+    0xB8ECA3: 112,
+    0xB0B98A: 511,
+    0x805A04: 514,
+    0xACC1EE: 40,
+    0x5419C8: 146,
+    0x000277: 12587,
+    0xBC8385: 157,
+    0xE4B005: 12588,
+    0xB05216: 885,
+    0xB0E892: 378,
+    0xAC1826: 378,
+    0xA4EE57: 378,
+    0x9CAED3: 378,
+    0x707C69: 470,
+    0x500B91: 12,
+    0xF8461C: 141,
+    0x14A78B: 510,
+    0x2C598A: 514,
+    0x686975: 12589,
+    0x18F87A: 12590,
+    0xA0E4CB: 112,
+    0x284ED7: 12591,
+    0x64A68F: 12592,
+    0x00425A: 4,
+    0x704D7B: 398,
+    0x9CFBD5: 146,
+    0x18F76B: 12593,
+    0x5CE30E: 258,
+    0x4C26E7: 12594,
+    0x006041: 4965,
+    0x583112: 12595,
+    0x9C83BF: 12596,
+    0x78EF4C: 12597,
+    0x00C05A: 12598,
+    0x0007F9: 12599,
+    0x001CB3: 49,
+    0x20D25F: 12600,
+    0xE47DBD: 90,
+    0x48D343: 258,
+    0xA0B8F8: 12601,
+    0x884477: 15,
+    0x149D09: 15,
+    0x4C11BF: 510,
+    0x1CC0E1: 12,
+    0x00B0E1: 4,
+    0x005093: 12602,
+    0xC81B5C: 12603,
+    0x28EE52: 86,
+    0x001A39: 12604,
+    0xE07C13: 11,
+    0xF41F88: 11,
+    0xE43ED7: 48,
+    0x14EDBB: 1166,
+    0x18E29F: 146,
+    0xF07960: 49,
+    0xA0D795: 49,
+    0x0090E7: 12605,
+    0x905C44: 288,
+    0x00F22C: 12606,
+    0x842519: 12607,
+    0x5C2443: 12608,
+    0x707990: 15,
+    0xA04E01: 12609,
+    0x28CA09: 12610,
+    0x2047ED: 319,
+    0x748A69: 12611,
+    0x24920E: 90,
+    0xFC4203: 90,
+    0xA01081: 90,
+    0x5454CF: 12612,
+    0x6474F6: 12613,
+    0x3C8BCD: 817,
+    0x4CF95D: 15,
+    0x8421F1: 15,
+    0x0005EE: 1003,
+    0xF8633F: 25,
+    0x088620: 231,
+    0x002566: 90,
+    0x981333: 11,
+    0xD0DB32: 882,
+    0xE80036: 12614,
+    0xC09F05: 69,
+    0x04180F: 90,
+    0x2013E0: 90,
+    0xF43C96: 228,
+    0x388479: 20,
+    0xC4411E: 1006,
+    0x24F5A2: 1006,
+    0xF89E28: 20,
+    0x683A1E: 20,
+    0xC0F945: 12615,
+    0x70F8E7: 12,
+    0xD42C44: 4,
+    0x843DC6: 4,
+    0x002485: 12616,
+    0x28FCF6: 12617,
+    0x001F58: 12618,
+    0x5C4979: 427,
+    0x689423: 885,
+    0x844BF5: 885,
+    0x08EDB9: 885,
+    0x5C6D20: 885,
+    0x5CAC4C: 885,
+    0x0016DF: 12619,
+    0x001D0C: 12620,
+    0xE0CBBC: 20,
+    0xB88EDF: 12621,
+    0xDC7144: 1016,
+    0x980C82: 1016,
+    0xA00BBA: 1016,
+    0x3C77E6: 885,
+    0x70188B: 885,
+    0x8CC8CD: 90,
+    0x8018A7: 90,
+    0xF47B5E: 90,
+    0x08C6B3: 2337,
+    0x606BBD: 90,
+    0x00214C: 90,
+    0x00166B: 90,
+    0x0000F0: 90,
+    0x184617: 90,
+    0x380A94: 90,
+    0xD0DFC7: 90,
+    0xD0C1B1: 90,
+    0x70F927: 90,
+    0xA8F274: 90,
+    0xD487D8: 90,
+    0xF0728C: 90,
+    0x34AA8B: 90,
+    0xBC4486: 90,
+    0x20D390: 90,
+    0x0018AF: 90,
+    0x001EE1: 90,
+    0x34E71C: 574,
+    0x886AB1: 146,
+    0x6C1E90: 12622,
+    0xC8DE51: 12623,
+    0x24DBED: 90,
+    0xC45006: 90,
+    0x88329B: 305,
+    0x1449E0: 305,
+    0xD02544: 305,
+    0xA00460: 511,
+    0x9401C2: 90,
+    0x50FC9F: 90,
+    0x380B40: 90,
+    0x005A13: 15,
+    0x946124: 12624,
+    0x70B14E: 258,
+    0xB8FF61: 49,
+    0x304487: 685,
+    0x2C9D1E: 15,
+    0x400D10: 258,
+    0x943DC9: 12625,
+    0x9884E3: 53,
+    0x38D269: 53,
+    0xC8FD19: 53,
+    0x508CB1: 53,
+    0x440444: 69,
+    0x98F058: 12626,
+    0x68C44D: 78,
+    0x0081C4: 4,
+    0x58E876: 12,
+    0x00177E: 12627,
+    0xC4F5A5: 12628,
+    0xF8E61A: 90,
+    0x84B541: 90,
+    0x006F64: 90,
+    0xDC6672: 90,
+    0xEC8EB5: 607,
+    0x70AF6A: 686,
+    0xE0DDC0: 146,
+    0xAC9CE4: 817,
+    0x00233E: 2155,
+    0x6CBEE9: 2155,
+    0xD03742: 1030,
+    0x20F543: 31,
+    0x001765: 1034,
+    0x0015E8: 1034,
+    0x00159B: 1034,
+    0x001540: 1034,
+    0x001ECA: 1034,
+    0x00130A: 1034,
+    0x001F0A: 1034,
+    0x000F06: 1034,
+    0xC4047B: 574,
+    0x20F41B: 5060,
+    0x6CA858: 5,
+    0xA84E3F: 520,
+    0x00164D: 2155,
+    0x001AF0: 2155,
+    0x38521A: 81,
+    0x001E40: 1043,
+    0x94D723: 1043,
+    0xFCFAF7: 788,
+    0xD826B9: 12629,
+    0x0022A9: 514,
+    0x0025E5: 514,
+    0x0021FB: 514,
+    0xA091C8: 11,
+    0xE4956E: 12,
+    0xB437D1: 12,
+    0x2C6A6F: 12,
+    0xA46032: 1861,
+    0x40667A: 12630,
+    0x9C2A83: 90,
+    0x68A0F6: 15,
+    0x000E5C: 258,
+    0x845DD7: 12631,
+    0xE892A4: 514,
+    0x10683F: 514,
+    0x40B0FA: 514,
+    0xA039F7: 514,
+    0x00B064: 4,
+    0x34FCEF: 514,
+    0xBCF5AC: 514,
+    0x98D6F7: 514,
+    0x700514: 514,
+    0x0055DA: 12,
+    0x78C2C0: 12,
+    0x1CCAE3: 12,
+    0x08D833: 12632,
+    0x00199D: 1066,
+    0x001938: 12633,
+    0x4439C4: 61,
+    0x402CF4: 61,
+    0x001E37: 61,
+    0x001A6B: 61,
+    0x001641: 61,
+    0x0010C6: 61,
+    0x00247E: 61,
+    0x000EE8: 578,
+    0x00C095: 5034,
+    0x002025: 12634,
+    0x683563: 12635,
+    0x004072: 7674,
+    0x00E08B: 1054,
+    0x1C57D8: 12636,
+    0x00DD0A: 4168,
+    0x002517: 12637,
+    0x00600F: 5031,
+    0x00183A: 5031,
+    0x446EE5: 15,
+    0xC8778B: 12638,
+    0x00044B: 12639,
+    0xD8EB97: 4884,
+    0x001C7E: 1064,
+    0x002318: 1064,
+    0xB86B23: 1064,
+    0x0008F1: 12640,
+    0xAC9B0A: 133,
+    0x104FA8: 133,
+    0xAC040B: 8415,
+    0x48FCB6: 786,
+    0xB0E235: 40,
+    0x40C729: 3,
+    0x14C913: 244,
+    0xD8E0B8: 12641,
+    0x603197: 112,
+    0xF8A097: 258,
+    0x0014B4: 12642,
+    0xA0B437: 12643,
+    0xE09861: 78,
+    0x9C8ECD: 8202,
+    0x0004A3: 72,
+    0x789CE7: 12644,
+    0x509F3B: 8915,
+    0xFC2325: 12645,
+    0xFC3D93: 8589,
+    0x00F663: 4,
+    0x000B6B: 57,
+    0x6002B4: 57,
+    0x94DF4E: 761,
+    0x98EECB: 1063,
+    0xC0C976: 423,
+    0x588BF3: 112,
+    0x5067F0: 112,
+    0x001349: 112,
+    0x8C6D50: 5051,
+    0xA009ED: 470,
+    0x683E34: 5046,
+    0x001BFE: 12646,
+    0x5410EC: 72,
+    0xA06090: 90,
+    0xBC765E: 90,
+    0xE0A8B8: 948,
+    0xF45B73: 12647,
+    0xB88198: 25,
+    0xC83DFC: 12648,
+    0xCCD31E: 12,
+    0x34B354: 15,
+    0x6C0EE6: 12649,
+    0x005F86: 4,
+    0x381DD9: 438,
+    0x1CB9C4: 272,
+    0x2CDDA3: 11322,
+    0x00809F: 12650,
+    0xB824F0: 12651,
+    0xD85B2A: 90,
+    0xFCA89A: 412,
+    0x1C7B23: 906,
+    0xB0D7CC: 12652,
+    0x8C59C3: 8821,
+    0x48C663: 12653,
+    0x1C6E76: 12654,
+    0x000763: 12655,
+    0x240A11: 274,
+    0xD8E56D: 274,
+    0x540593: 12656,
+    0xC02FF1: 12657,
+    0xE8A7F2: 12658,
+    0x001F20: 12659,
+    0x0062EC: 4,
+    0xCC167E: 4,
+    0xC46AB7: 40,
+    0x000AED: 8933,
+    0xCC500A: 5,
+    0xD046DC: 12660,
+    0x70A2B3: 49,
+    0xE41D2D: 270,
+    0xF40F24: 49,
+    0x4C57CA: 49,
+    0x90C1C6: 49,
+    0x0CDA41: 955,
+    0x74258A: 955,
+    0x741F4A: 955,
+    0xE42F56: 12661,
+    0xF8DA0C: 885,
+    0x1C1B0D: 538,
+    0x48E9F1: 49,
+    0x903809: 228,
+    0xC83F26: 157,
+    0x000C49: 12662,
+    0xA0B662: 12663,
+    0x002238: 12664,
+    0x3497F6: 398,
+    0xA08CFD: 607,
+    0x50680A: 15,
+    0x00A006: 12665,
+    0x8019FE: 12666,
+    0x60B4F7: 12667,
+    0x44650D: 77,
+    0x60B387: 12668,
+    0xA4D8CA: 12669,
+    0x1078D2: 1101,
+    0x002197: 1101,
+    0x001E90: 1101,
+    0x0022B1: 12670,
+    0x0000B4: 1111,
+    0x487ADA: 955,
+    0x140C5B: 12671,
+    0x50FF99: 12,
+    0x84E323: 12672,
+    0xFC3F7C: 15,
+    0x384C4F: 15,
+    0x001F45: 4871,
+    0x000E03: 1102,
+    0x000D87: 1101,
+    0x00168F: 5069,
+    0xBC9889: 5,
+    0x24615A: 29,
+    0x00CAE5: 4,
+    0x004268: 4,
+    0x4883C7: 3,
+    0x40163B: 90,
+    0x04A316: 53,
+    0xD4F207: 12673,
+    0xD4AD2D: 5,
+    0xF08CFB: 5,
+    0x48555F: 5,
+    0x405EE1: 12674,
+    0x002578: 12675,
+    0x30B49E: 86,
+    0x34E70B: 12676,
+    0x007888: 4,
+    0xFC084A: 621,
+    0x0CBF3F: 12677,
+    0x900325: 15,
+    0x98E7F5: 15,
+    0x001706: 12678,
+    0xA09D91: 12679,
+    0x40B688: 12680,
+    0x9CD48B: 12681,
+    0x085BDA: 12682,
+    0x1CC035: 4844,
+    0x34543C: 12683,
+    0x9C9D5D: 12684,
+    0xDC4D23: 8814,
+    0x0023B3: 12685,
+    0x248A07: 270,
+    0xC83870: 90,
+    0x1C553A: 12686,
+    0x008E73: 4,
+    0x402E28: 12687,
+    0x583277: 12688,
+    0x6C8FB5: 1176,
+    0x0015C1: 141,
+    0x90A62F: 12689,
+    0xC0C522: 258,
+    0x1C9E46: 49,
+    0x9C4FDA: 49,
+    0x00351A: 4,
+    0x00AF1F: 4,
+    0xC0CCF8: 49,
+    0xC4E510: 12690,
+    0x0021FC: 889,
+    0x001F5D: 889,
+    0x001F01: 889,
+    0x001BEE: 889,
+    0x803896: 224,
+    0x8489AD: 49,
+    0x347E39: 889,
+    0x001979: 889,
+    0x0060EC: 12691,
+    0xDC3A5E: 1141,
+    0x00507F: 4729,
+    0x001A73: 182,
+    0x00904B: 182,
+    0x001A7F: 5854,
+    0x0024D4: 524,
+    0xAC3A7A: 1141,
+    0xB83E59: 1141,
+    0x544408: 882,
+    0x3CC243: 882,
+    0x0090A2: 540,
+    0x0090D6: 12692,
+    0x647791: 90,
+    0x9CE6E7: 90,
+    0x9C0298: 90,
+    0x28987B: 90,
+    0x0C715D: 90,
+    0x00180F: 889,
+    0xC8979F: 882,
+    0xECF35B: 882,
+    0x0025D0: 889,
+    0x7C1CF1: 15,
+    0x78F557: 15,
+    0xE02861: 15,
+    0xD0D04B: 15,
+    0x480031: 15,
+    0x4C09D4: 1149,
+    0x9C80DF: 1149,
+    0x002308: 1149,
+    0x880355: 1149,
+    0x34BB1F: 1151,
+    0x406F2A: 1151,
+    0xD476EA: 11,
+    0x00175A: 4,
+    0x54FA3E: 90,
+    0x0C8910: 90,
+    0x78ABBB: 90,
+    0xD8C4E9: 90,
+    0xBCD11F: 90,
+    0xF4428F: 90,
+    0x0896D7: 857,
+    0x506A03: 511,
+    0x446D6C: 90,
+    0x00F46F: 90,
+    0x001018: 1142,
+    0x18C086: 1142,
+    0xFCB4E6: 234,
+    0xC8FF28: 192,
+    0xB81619: 258,
+    0x0023ED: 258,
+    0x001B52: 258,
+    0x001E8D: 258,
+    0x001BDD: 258,
+    0x001D6B: 258,
+    0x001DBE: 258,
+    0x0012C9: 258,
+    0x00192C: 258,
+    0x00195E: 258,
+    0x001A1B: 258,
+    0x001A66: 258,
+    0x001A77: 258,
+    0xA4ED4E: 258,
+    0x00211E: 258,
+    0x002180: 258,
+    0x0023A2: 258,
+    0xB077AC: 258,
+    0x002493: 258,
+    0x002641: 258,
+    0x0017E2: 258,
+    0x001675: 258,
+    0x000CE5: 258,
+    0xE0469A: 511,
+    0x30469A: 511,
+    0x100D7F: 511,
+    0x504A6E: 511,
+    0x0022F4: 800,
+    0x001DBA: 133,
+    0x0024BE: 133,
+    0x000FDE: 133,
+    0xF8D0AC: 141,
+    0x0CFE45: 141,
+    0x2016D8: 192,
+    0xE8617E: 192,
+    0x18CF5E: 192,
+    0x00D0C9: 1582,
+    0x6487D7: 1155,
+    0x38229D: 1155,
+    0xA4526F: 1155,
+    0x74888B: 1155,
+    0x008C54: 1155,
+    0xF0272D: 77,
+    0x84D6D0: 77,
+    0x90B134: 258,
+    0x40B7F3: 258,
+    0x0015D0: 258,
+    0x001596: 258,
+    0x04E676: 800,
+    0x18FE34: 14,
+    0xB8F934: 133,
+    0x8C6422: 133,
+    0xE063E5: 133,
+    0x001B59: 133,
+    0x002298: 133,
+    0x2421AB: 133,
+    0x0003E0: 258,
+    0x20E564: 258,
+    0x00006E: 12693,
+    0x00DA55: 4,
+    0x985FD3: 157,
+    0x0010B5: 1157,
+    0x001974: 12694,
+    0xE0B2F1: 438,
+    0x0C4C39: 128,
+    0x002243: 43,
+    0x18E3BC: 274,
+    0xCC1FC4: 12695,
+    0x605BB4: 43,
+    0x64D954: 278,
+    0x5C36B8: 1129,
+    0x00AA01: 1177,
+    0x84A6C8: 25,
+    0x5891CF: 25,
+    0x0C8BFD: 25,
+    0x843A4B: 25,
+    0x5C514F: 25,
+    0xA44E31: 25,
+    0x4CEB42: 25,
+    0x00AA00: 1177,
+    0x00C2C6: 25,
+    0x5CD2E4: 25,
+    0x28B2BD: 25,
+    0x4C79BA: 25,
+    0xF81654: 25,
+    0x606C66: 25,
+    0x4C8093: 25,
+    0xAC7289: 25,
+    0x448500: 25,
+    0x0CD292: 25,
+    0x00247B: 659,
+    0x0004E3: 1157,
+    0x448723: 12696,
+    0xD86C02: 12697,
+    0x60BEB5: 78,
+    0xF8F1B6: 78,
+    0xF4F1E1: 78,
+    0x9CD917: 78,
+    0x9068C3: 78,
+    0x685D43: 25,
+    0xA0369F: 25,
+    0x64D4DA: 25,
+    0x4025C2: 25,
+    0x502DA2: 25,
+    0x78929C: 25,
+    0xDCA971: 25,
+    0x58946B: 25,
+    0x3CFDFE: 25,
+    0xA4C494: 25,
+    0x902E1C: 25,
+    0xA434D9: 25,
+    0x0024D7: 25,
+    0x0024D6: 25,
+    0x001DE0: 25,
+    0xA0A8CD: 25,
+    0x5CC5D4: 25,
+    0x001E64: 25,
+    0x00215C: 25,
+    0x00216B: 25,
+    0x0022FB: 25,
+    0x001517: 25,
+    0x34EF44: 1166,
+    0xB0E754: 1166,
+    0xB8E625: 1166,
+    0x001D5A: 1166,
+    0x00253C: 1166,
+    0x3C197D: 228,
+    0x247C4C: 12698,
+    0xE46F13: 329,
+    0x1C4419: 86,
+    0x5C353B: 288,
+    0xF8E71E: 272,
+    0x08863B: 1006,
+    0x90013B: 3,
+    0x7C034C: 3,
+    0x6C2E85: 3,
+    0x94FEF4: 3,
+    0x28FAA0: 146,
+    0xECDF3A: 146,
+    0xF42981: 146,
+    0x84F6FA: 12699,
+    0x2C56DC: 398,
+    0x00604C: 3,
+    0x001F95: 3,
+    0x002348: 3,
+    0x002691: 3,
+    0x988B5D: 3,
+    0x78DEE4: 53,
+    0x001833: 53,
+    0x001834: 53,
+    0x0017E3: 53,
+    0x001830: 53,
+    0x0023D4: 53,
+    0xC0E422: 53,
+    0xD00790: 53,
+    0x3C7DB1: 53,
+    0x001783: 53,
+    0xF4FC32: 53,
+    0x90D7EB: 53,
+    0x00F871: 12101,
+    0x34B1F7: 53,
+    0x2CFD37: 12700,
+    0x0C6127: 659,
+    0x2C3033: 511,
+    0x78542E: 329,
+    0xC4A81D: 329,
+    0x2435CC: 12701,
+    0xF88FCA: 210,
+    0x002191: 1167,
+    0xACF1DF: 329,
+    0xBCF685: 329,
+    0x3CD92B: 607,
+    0xBC4434: 423,
+    0x04BF6D: 112,
+    0xCC46D6: 4,
+    0x0041D2: 4,
+    0x2CAB00: 15,
+    0xA8CA7B: 15,
+    0xFCFFAA: 12,
+    0x3898D8: 12702,
+    0x9486CD: 12703,
+    0x8896B6: 12704,
+    0x88B8D0: 12705,
+    0x601971: 258,
+    0x58AC78: 4,
+    0x5C571A: 258,
+    0xE8892C: 258,
+    0x84ACFB: 12706,
+    0x7CBB8A: 1265,
+    0x3897D6: 955,
+    0x1CA770: 407,
+    0x0CD746: 49,
+    0x60A37D: 49,
+    0x68DBCA: 49,
+    0x086698: 49,
+    0xBC5436: 49,
+    0x044BED: 49,
+    0x6C8DC1: 49,
+    0x000D0B: 310,
+    0x001D73: 310,
+    0x001601: 310,
+    0x7403BD: 310,
+    0xB8FC9A: 948,
+    0x94877C: 258,
+    0x407009: 258,
+    0x083E0C: 258,
+    0x207355: 258,
+    0xF8EDA5: 258,
+    0x5465DE: 258,
+    0x6CCA08: 258,
+    0x000423: 1177,
+    0x001111: 1177,
+    0x001302: 25,
+    0xD40598: 258,
+    0xE83381: 258,
+    0x8C7F3B: 258,
+    0x3C36E4: 258,
+    0x1C1B68: 258,
+    0x780AC7: 12707,
+    0x002481: 607,
+    0x000F61: 607,
+    0x0014C2: 607,
+    0x00805F: 607,
+    0x288023: 607,
+    0x0018FE: 607,
+    0x001A4B: 607,
+    0xA4516F: 1176,
+    0xFC64BA: 40,
+    0x8CAB8E: 1184,
+    0xD40B1A: 983,
+    0x945330: 885,
+    0xA08D16: 15,
+    0x4CD08A: 132,
+    0xCC4EEC: 132,
+    0x403DEC: 132,
+    0xEC4D47: 15,
+    0xC44044: 12708,
+    0x4CA161: 12709,
+    0xCC3E5F: 607,
+    0xD89D67: 607,
+    0xA45D36: 607,
+    0xF0921C: 607,
+    0xA0481C: 607,
+    0xA01D48: 607,
+    0x40A8F0: 607,
+    0x8851FB: 607,
+    0x9060F1: 49,
+    0x542758: 443,
+    0x082E5F: 607,
+    0xE4115B: 607,
+    0x28924A: 607,
+    0x480FCF: 607,
+    0x00242B: 885,
+    0x1C994C: 102,
+    0xF02765: 102,
+    0x5CF8A1: 102,
+    0x44A7CF: 102,
+    0x0013E0: 102,
+    0x90FBA6: 885,
+    0x4437E6: 885,
+    0xCCAF78: 885,
+    0xF4B7E2: 885,
+    0x785968: 885,
+    0x08181A: 11,
+    0x001E73: 11,
+    0x0015EB: 11,
+    0x001C25: 885,
+    0x00197E: 885,
+    0xEC26CA: 86,
+    0x9471AC: 274,
+    0x2C088C: 132,
+    0x000480: 1183,
+    0x000CDB: 1183,
+    0x647002: 86,
+    0x10FEED: 86,
+    0x645601: 86,
+    0xF8D111: 86,
+    0xB0487A: 86,
+    0x940C6D: 86,
+    0x001BED: 1183,
+    0x000533: 1183,
+    0x006069: 1183,
+    0x0060DF: 1183,
+    0x000088: 1183,
+    0xECCB30: 15,
+    0xF4DCF9: 15,
+    0xC8D15E: 15,
+    0xF4559C: 15,
+    0x80B686: 15,
+    0x10C61F: 15,
+    0xCC96A0: 15,
+    0x00664B: 15,
+    0x9CC172: 15,
+    0x247F3C: 15,
+    0x581F28: 15,
+    0xC07009: 15,
+    0x308730: 15,
+    0xC057BC: 470,
+    0x8038BC: 15,
+    0xC4072F: 15,
+    0xF48E92: 15,
+    0x241FA0: 15,
+    0x34CDBE: 15,
+    0xD8490B: 15,
+    0xF80113: 15,
+    0xA49947: 15,
+    0x64A7DD: 470,
+    0xA4251B: 470,
+    0x646A52: 470,
+    0x44322A: 470,
+    0x7038EE: 470,
+    0x703018: 470,
+    0x9C28EF: 15,
+    0x00900C: 4,
+    0x00905F: 4,
+    0x00100B: 4,
+    0x00173B: 4,
+    0x080028: 53,
+    0x405FC2: 53,
+    0x20CD39: 53,
+    0xB4994C: 53,
+    0x68DFDD: 40,
+    0x98FAE3: 40,
+    0xF0B429: 40,
+    0x7054F5: 15,
+    0x9017AC: 15,
+    0x18C58A: 15,
+    0x006083: 4,
+    0x006009: 4,
+    0x00067C: 4,
+    0x00E0F7: 4,
+    0x00107B: 4,
+    0x0050E2: 4,
+    0x0090A6: 4,
+    0x009086: 4,
+    0x005080: 4,
+    0x005073: 4,
+    0x001BD7: 1185,
+    0xE4D3F1: 4,
+    0xEC24B8: 53,
+    0x7CEC79: 53,
+    0x689E19: 53,
+    0xE0E5CF: 53,
+    0x1C872C: 398,
+    0x60182E: 12710,
+    0xC4143C: 4,
+    0x3C08F6: 4,
+    0x501CBF: 4,
+    0x001E8C: 398,
+    0x0013D4: 398,
+    0x20CF30: 398,
+    0x00248C: 398,
+    0x002354: 398,
+    0xBC1665: 4,
+    0xF872EA: 4,
+    0xD0C789: 4,
+    0xF84F57: 4,
+    0x7C69F6: 4,
+    0x8478AC: 4,
+    0x04DAD2: 4,
+    0xF02929: 4,
+    0x20BBC0: 4,
+    0x4C4E35: 4,
+    0xB000B4: 4,
+    0x544A00: 4,
+    0x00E16D: 4,
+    0xE0899D: 4,
+    0xC47295: 4,
+    0xE0D173: 4,
+    0x78DA6E: 4,
+    0x78BAF9: 4,
+    0x1C6E4C: 12711,
+    0x34BDC8: 4,
+    0xB8782E: 49,
+    0x000502: 49,
+    0x000A95: 49,
+    0xE80688: 49,
+    0x7CC537: 49,
+    0x78CA39: 49,
+    0x18E7F4: 49,
+    0x70CD60: 49,
+    0xE4AA5D: 4,
+    0xDCEB94: 4,
+    0x84B517: 4,
+    0x188B9D: 4,
+    0x24374C: 1185,
+    0xF45FD4: 1185,
+    0x2CABA4: 1185,
+    0x0022CE: 1185,
+    0x000F66: 1068,
+    0x00264A: 49,
+    0x041E64: 49,
+    0x90840D: 49,
+    0x001124: 49,
+    0x002241: 49,
+    0x88CB87: 49,
+    0x685B35: 49,
+    0x2CB43A: 49,
+    0x689C70: 49,
+    0x380F4A: 49,
+    0x3010E4: 49,
+    0xA886DD: 49,
+    0xF0C1F1: 49,
+    0xB4F0AB: 49,
+    0x80929F: 49,
+    0x9C04EB: 49,
+    0x5C969D: 49,
+    0xA8968A: 49,
+    0xD89E3F: 49,
+    0xB8C75D: 49,
+    0x0C74C2: 49,
+    0x403004: 49,
+    0x74E2F5: 49,
+    0xE0C97A: 49,
+    0x444C0C: 49,
+    0xF41BA1: 49,
+    0x041552: 49,
+    0xCC785F: 49,
+    0x7073CB: 49,
+    0xEC852F: 49,
+    0x00F4B9: 49,
+    0x60C547: 49,
+    0x68A86D: 49,
+    0x7CC3A1: 49,
+    0x5C95AE: 49,
+    0x842999: 49,
+    0x8C7B9D: 49,
+    0x9803D8: 49,
+    0x60D9C7: 49,
+    0x3CAB8E: 49,
+    0x609217: 49,
+    0x84B153: 49,
+    0xE06678: 49,
+    0x48D705: 49,
+    0x908D6C: 49,
+    0xB8098A: 49,
+    0x4C7C5F: 49,
+    0x68644B: 49,
+    0xC81EE7: 49,
+    0xA43135: 49,
+    0x68D93C: 49,
+    0x00F76F: 49,
+    0xC88550: 49,
+    0x7014A6: 49,
+    0x985AEB: 49,
+    0x78D75F: 49,
+    0x843835: 49,
+    0x8C006D: 49,
+    0x907240: 49,
+    0xE0B52D: 49,
+    0x6C94F8: 49,
+    0xF82793: 49,
+    0xC0CECD: 49,
+    0xF44B2A: 1185,
+    0x746F19: 12712,
+    0xA0F9E0: 12713,
+    0x2CAE2B: 90,
+    0xC4ADF1: 12714,
+    0x58FC73: 12715,
+    0x0C1A10: 12716,
+    0xC4EF70: 12717,
+    0x7C5A67: 12718,
+    0x5CE3B6: 5,
+    0xC869CD: 49,
+    0xA4B805: 49,
+    0xC01173: 90,
+    0x7853F2: 12719,
+    0xBCE63F: 90,
+    0x7C9122: 90,
+    0x6CEBB2: 12720,
+    0xF40E22: 90,
+    0x3C7A8A: 258,
+    0xE81363: 12721,
+    0x741865: 1043,
+    0xF8C372: 12722,
+    0xD47208: 12723,
+    0x90C99B: 12724,
+    0x5CADCF: 49,
+    0xBC6C21: 49,
+    0xB49D0B: 1306,
+    0x3C8CF8: 4884,
+    0xA87285: 12725,
+    0x080A4E: 12726,
+    0x780541: 12727,
+    0x044169: 235,
+    0xC02DEE: 12728,
+    0x9023EC: 941,
+    0x441CA8: 885,
+    0xACBC32: 49,
+    0x544E90: 49,
+    0xA4A6A9: 13,
+    0x8C10D4: 3,
+    0xF898B9: 15,
+    0x5CB559: 12729,
+    0xB83A9D: 12536,
+    0x6858C5: 12730,
+    0x881B99: 12731,
+    0x906F18: 13,
+    0x98CB27: 12732,
+    0xCC794A: 12733,
+    0x94D859: 274,
+    0x2CFCE4: 12734,
+    0xB4293D: 12735,
+    0x54FF82: 12736,
+    0x50DF95: 824,
+    0x2827BF: 90,
+    0xF4E926: 12737,
+    0xE855B4: 12738,
+    0x340CED: 12739,
+    0x9CA69D: 12740,
+    0x5853C0: 12741,
+    0x247260: 12742,
+    0xE8F2E2: 285,
+    0x2CA539: 12743,
+    0x245BF0: 12744,
+    0x1005B1: 258,
+    0xC0B713: 12745,
+    0x188EF9: 12746,
+    0x20635F: 12747,
+    0x083A5C: 12748,
+    0xB8B3DC: 12749,
+    0x702A7D: 12750,
+    0x4CAE31: 12751,
+    0xF4E9D4: 1054,
+    0x44F436: 11,
+    0xF4B8A7: 11,
+    0x300C23: 11,
+    0x4CB76D: 12752,
+    0x185D9A: 12753,
+    0xC47D46: 621,
+    0x609C9F: 1183,
+    0xA8827F: 12754,
+    0xB8C3BF: 12755,
+    0x6CE01E: 12756,
+    0x74852A: 814,
+    0x9CB6D0: 12757,
+    0x40B89A: 885,
+    0x1CB72C: 398,
+    0x40B837: 133,
+    0x800184: 983,
+    0x4CEEB0: 12758,
+    0x44C69B: 12759,
+    0xC02567: 12760,
+    0xFCE33C: 15,
+    0xD048F3: 12761,
+    0x44962B: 12762,
+    0xB89ACD: 12763,
+    0xD468BA: 4493,
+    0x086266: 398,
+    0x9C3066: 12764,
+    0xC8C50E: 12765,
+    0xD06A1F: 12766,
+    0xE807BF: 12767,
+    0x84F129: 12768,
+    0x60E6BC: 12769,
+    0x700136: 12770,
+    0xFCA22A: 12771,
+    0x18BDAD: 12772,
+    0xA45602: 12773,
+    0xD4522A: 12774,
+    0xB008BF: 12775,
+    0xE076D0: 800,
+    0x6CF5E8: 12776,
+    0xA89008: 12777,
+    0x1CC72D: 12778,
+    0x8CBFA6: 90,
+    0xC8A823: 90,
+    0xB0C559: 90,
+    0x183864: 12779,
+    0xC0335E: 1989,
+    0xB0E03C: 274,
+    0xBC1485: 90,
+    0xF01E34: 12780,
+    0xDCE026: 12781,
+    0xB40566: 12782,
+    0xF42C56: 12783,
+    0xFCDC4A: 12784,
+    0x1C14B3: 12785,
+    0x9C6C15: 157,
+    0x94E2FD: 12786,
+    0x84CFBF: 12787,
+    0xACD1B8: 885,
+    0xA48CDB: 675,
+    0xD85DE2: 885,
+    0x3C912B: 12788,
+    0x346C0F: 12789,
+    0xE8447E: 12790,
+    0x445ECD: 12791,
+    0x4CA928: 12792,
+    0xB0495F: 12793,
+    0xD0929E: 157,
+    0xDC0914: 10160,
+    0xBC52B4: 81,
+    0x9405B6: 12794,
+    0xC81B6B: 12795,
+    0x00A509: 12796,
+    0x7491BD: 12797,
+    0xD43266: 12798,
+    0x78312B: 11,
+    0x900CB4: 12799,
+    0xF0FE6B: 4855,
+    0x60F189: 102,
+    0x742EFC: 12800,
+    0x48C093: 12801,
+    0xA0C2DE: 12802,
+    0x88E161: 12803,
+    0x00F3DB: 12804,
+    0x3CAE69: 12805,
+    0x1008B1: 885,
+    0xE48C0F: 12806,
+    0xE42354: 12807,
+    0x9470D2: 12808,
+    0xA44AD3: 12809,
+    0x94BF95: 12810,
+    0x10FACE: 12811,
+    0x00A2F5: 12812,
+    0x44CE7D: 4542,
+    0x344DEA: 11,
+    0x4C16F1: 11,
+    0x3438AF: 12813,
+    0xB4A828: 12814,
+    0xC4BD6A: 12815,
+    0xC401CE: 12816,
+    0x587BE9: 12817,
+    0x7CB177: 12818,
+    0xCC3080: 12819,
+    0xEC1D7F: 11,
+    0xAC3870: 1506,
+    0x70F196: 659,
+    0x188219: 4873,
+    0xE4C62B: 12820,
+    0x4CE933: 12821,
+    0x187117: 12822,
+    0xEC0EC4: 885,
+    0x8C18D9: 12632,
+    0xD8FB11: 12823,
+    0x30FAB7: 12824,
+    0x0809B6: 12825,
+    0x4CF5A0: 12826,
+    0x600292: 814,
+    0xB4B859: 12827,
+    0x5CF9F0: 12828,
+    0xD0A0D6: 183,
+    0xECB907: 12829,
+    0x0C8C8F: 12830,
+    0xA4A4D3: 12831,
+    0xA8329A: 12832,
+    0xF42833: 12833,
+    0x4C83DE: 1185,
+    0xA81374: 878,
+    0xF4D032: 12834,
+    0x3C46D8: 86,
+    0x147590: 86,
+    0x50BD5F: 86,
+    0x4CBC42: 12835,
+    0x28A5EE: 12836,
+    0x083D88: 90,
+    0x987E46: 12837,
+    0xBC4E5D: 12838,
+    0x7C6AC3: 12839,
+    0x702DD1: 12840,
+    0xF4F646: 12841,
+    0x28E6E9: 12842,
+    0xF4FD2B: 12843,
+    0x109266: 90,
+    0x045C8E: 12844,
+    0x7CC4EF: 12845,
+    0xD85DFB: 13,
+    0x5C5BC2: 12846,
+    0x300D2A: 12847,
+    0x3C189F: 882,
+    0x08CD9B: 12848,
+    0x30595B: 12849,
+    0x84850A: 12850,
+    0xEC2E4E: 12851,
+    0xDCF110: 882,
+    0x908C63: 12852,
+    0xD46761: 12853,
+    0x3481C4: 857,
+    0x608F5C: 90,
+    0xE8EF89: 12854,
+    0xF84A73: 12855,
+    0x142BD6: 12856,
+    0xCCB691: 12857,
+    0x40167E: 398,
+    0x983713: 12858,
+    0xA47E39: 11,
+    0x18CC23: 12859,
+    0x98349D: 12860,
+    0x880FB6: 12861,
+    0xB46698: 12862,
+    0x687CC8: 12863,
+    0x74F85D: 12864,
+    0xB061C7: 12865,
+    0x400107: 12866,
+    0x30C750: 12867,
+    0x4411C2: 12868,
+    0x8059FD: 12869,
+    0x0092FA: 12870,
+    0x100F18: 12871,
+    0xD0C7C0: 86,
+    0xFCC2DE: 102,
+    0x5CE7BF: 12872,
+    0x386C9B: 12873,
+    0xB42C92: 12874,
+    0xE0D31A: 12875,
+    0x447E76: 12876,
+    0xB0EC8F: 12877,
+    0x4C7F62: 882,
+    0x580528: 12878,
+    0x407875: 12879,
+    0xD881CE: 12880,
+    0x28C825: 12881,
+    0x80618F: 12882,
+    0xD82A15: 12883,
+    0x28DEF6: 12884,
+    0x987770: 12885,
+    0xBC14EF: 12886,
+    0xD87CDD: 12887,
+    0x34466F: 12888,
+    0x68D247: 12889,
+    0x50B695: 12890,
+    0xB4430D: 12891,
+    0x50A054: 12892,
+    0xB48547: 12893,
+    0x748F1B: 12894,
+    0x083F76: 12895,
+    0xA07771: 12896,
+    0x10DDF4: 12897,
+    0x387B47: 12898,
+    0xC064C6: 882,
+    0x14F28E: 12899,
+    0x5056A8: 12900,
+    0xA06518: 8792,
+    0x7C8D91: 12901,
+    0x080371: 12902,
+    0x200E95: 12903,
+    0xC8F68D: 12904,
+    0x6C641A: 12905,
+    0xCC89FD: 882,
+    0x707C18: 12906,
+    0x78EC74: 12907,
+    0x783D5B: 12908,
+    0xD0B523: 12909,
+    0x24A495: 12910,
+    0xD0C42F: 12911,
+    0x549359: 998,
+    0xC0F991: 12912,
+    0x90356E: 2201,
+    0x5C1193: 12913,
+    0x847616: 12914,
+    0xDC0575: 12915,
+    0xE40439: 12916,
+    0xE097F2: 12917,
+    0x70305E: 12918,
+    0xC098E5: 12919,
+    0x50E14A: 13,
+    0x0C1262: 11,
+    0x3CD4D6: 12920,
+    0x705986: 12921,
+    0x844F03: 12922,
+    0xE8E770: 12923,
+    0x609620: 13,
+    0x443C9C: 12924,
+    0x8CCDA2: 12925,
+    0x84262B: 81,
+    0x986CF5: 11,
+    0x906717: 12926,
+    0x6064A1: 12927,
+    0x9CF8DB: 12928,
+    0x0C473D: 520,
+    0x680AD7: 12929,
+    0xBC8893: 12930,
+    0x447BC4: 12931,
+    0x407496: 12932,
+    0x701D7F: 12933,
+    0x9C039E: 12934,
+    0x708D09: 882,
+    0x98FB12: 12935,
+    0x3C1040: 12936,
+    0x28FC51: 12937,
+    0x20D21F: 12938,
+    0xF89550: 12939,
+    0x7C49B9: 12940,
+    0x9C2840: 12941,
+    0x1C7B21: 133,
+    0x6CF97C: 12942,
+    0xF8FF5F: 12943,
+    0x44700B: 12944,
+    0x1C4158: 12945,
+    0xBC2B6B: 12946,
+    0x98D331: 12947,
+    0x38EC11: 12948,
+    0x4CCBF5: 11,
+    0x187ED5: 12949,
+    0x841B38: 4410,
+    0xE0AF4B: 9471,
+    0x54A54B: 12950,
+    0xEC2257: 12951,
+    0xF037A1: 12952,
+    0x58B961: 12953,
+    0x78491D: 12954,
+    0xF46ABC: 12955,
+    0x840F45: 12956,
+    0x2C5FF3: 12957,
+    0x58639A: 12958,
+    0x28C671: 12959,
+    0xD86960: 12960,
+    0x08EF3B: 8559,
+    0xE8EADA: 12961,
+    0xF85BC9: 12962,
+    0x907A0A: 12963,
+    0xF47A4E: 12964,
+    0x04848A: 12965,
+    0x7CB77B: 12966,
+    0xB0CE18: 12967,
+    0xA0C6EC: 12968,
+    0x78E8B6: 11,
+    0xDCAE04: 12969,
+    0x8005DF: 12970,
+    0x102279: 12971,
+    0x7C1AFC: 12972,
+    0xF08EDB: 12973,
+    0x681D64: 12974,
+    0x704CED: 12975,
+    0xC47F51: 12976,
+    0xA897DC: 1594,
+    0x109AB9: 12977,
+    0x142D8B: 12978,
+    0xCCD29B: 12979,
+    0x78DAB3: 12980,
+    0x700FEC: 12981,
+    0x68EE96: 1185,
+    0x78D38D: 12982,
+    0x1078CE: 12983,
+    0xD41090: 12984,
+    0x3495DB: 7478,
+    0x9CB793: 12985,
+    0x5C335C: 12986,
+    0xD8DA52: 12987,
+    0x587A4D: 12988,
+    0xF02405: 12989,
+    0x84E629: 12990,
+    0x04DF69: 12991,
+    0x4C21D0: 133,
+    0x78D5B5: 12992,
+    0xCCBD35: 12993,
+    0x6CECA1: 12994,
+    0x105C3B: 12995,
+    0x349D90: 12996,
+    0xB03850: 12997,
+    0xE8481F: 12998,
+    0xD40BB9: 12999,
+    0xF415FD: 13000,
+    0x748E08: 13001,
+    0x78F5E5: 13002,
+    0xC47DFE: 13003,
+    0xD862DB: 13004,
+    0x8C3C07: 13005,
+    0xE4F7A1: 13006,
+    0x381766: 13007,
+    0x1441E2: 13008,
+    0xE47D5A: 13009,
+    0x70E027: 13010,
+    0xA09BBD: 13011,
+    0x38A86B: 13012,
+    0xF07765: 13013,
+    0xECD040: 13014,
+    0xF80DEA: 13015,
+    0xB08807: 13016,
+    0x5CF370: 13017,
+    0xA4E0E6: 13018,
+    0x249504: 4542,
+    0xF45842: 13019,
+    0x106682: 404,
+    0xD81EDE: 13020,
+    0xF084C9: 11,
+    0xD4016D: 86,
+    0x985C93: 13021,
+    0xA08A87: 13022,
+    0x386793: 13023,
+    0x0C8268: 86,
+    0xC0C3B6: 13024,
+    0xA0EB76: 13025,
+    0xFC4499: 13026,
+    0xDC647C: 13027,
+    0x148692: 86,
+    0xA8154D: 86,
+    0x24EA40: 13028,
+    0xFCDB96: 13029,
+    0x1423D7: 13030,
+    0x28CD9C: 13031,
+    0x504F94: 13032,
+    0x60B185: 13033,
+    0x745F00: 13034,
+    0xE0C3F3: 11,
+    0x5C20D0: 13035,
+    0xACA430: 13036,
+    0x44184F: 13037,
+    0x18E8DD: 13038,
+    0xD073D5: 13039,
+    0x149448: 13040,
+    0x48F925: 13041,
+    0x68831A: 13042,
+    0xD429EA: 13043,
+    0x34ADE4: 13044,
+    0x541FD5: 13045,
+    0xACE97F: 13046,
+    0xA0FE91: 13047,
+    0x74ECF1: 13048,
+    0x90DA4E: 13049,
+    0x281878: 157,
+    0x7038B4: 13050,
+    0x84ACA4: 13051,
+    0x5809E5: 13052,
+    0xDC6F08: 13053,
+    0xBC629F: 13054,
+    0x380FE4: 13055,
+    0x847A88: 983,
+    0xA4D856: 13056,
+    0x785517: 13057,
+    0xB47F5E: 13058,
+    0xB85AF7: 13059,
+    0x34F62D: 224,
+    0x4C8FA5: 1094,
+    0x78324F: 13060,
+    0x48F230: 13061,
+    0x384369: 13062,
+    0xE85AA7: 13063,
+    0xD0D6CC: 13064,
+    0x58D071: 13065,
+    0x20858C: 13066,
+    0x1C52D6: 13067,
+    0xD0DFB2: 13068,
+    0x80FA5B: 352,
+    0xC0B339: 13069,
+    0x84ED33: 13070,
+    0xE82E24: 13071,
+    0x386645: 13072,
+    0xC0A0E2: 13073,
+    0x6C5A34: 13074,
+    0xDCB058: 13075,
+    0x9038DF: 13076,
+    0x185253: 11142,
+    0x9C9C1D: 8206,
+    0x9CE1D6: 13077,
+    0xD8182B: 13078,
+    0x80CF41: 1506,
+    0x58D6D3: 13079,
+    0x046E49: 13080,
+    0xB49DB4: 13081,
+    0xACE87E: 13082,
+    0x60CDC5: 13083,
+    0x2C3BFD: 13084,
+    0xAC3CB4: 13085,
+    0x8007A2: 13086,
+    0x080FFA: 13087,
+    0x683B1E: 13088,
+    0x2091D9: 13089,
+    0x141BF0: 13090,
+    0x5887E2: 1443,
+    0xF46DE2: 11,
+    0x503955: 1185,
+    0x808287: 13091,
+    0x28A186: 13092,
+    0x6C9AC9: 13093,
+    0x10FBF0: 13094,
+    0xAC7236: 13095,
+    0x3CD7DA: 13096,
+    0x04F8C2: 127,
+    0x6869F2: 13097,
+    0xB85AFE: 13098,
+    0xACA22C: 13099,
+    0x303294: 13100,
+    0x7C822D: 13101,
+    0xAC8D14: 13102,
+    0x388EE7: 13103,
+    0xCCE798: 13104,
+    0xA036F0: 13105,
+    0x180CAC: 1131,
+    0x00DB1E: 13106,
+    0x60748D: 13107,
+    0xB8B7D7: 13108,
+    0x78D129: 13109,
+    0x84DF0C: 13110,
+    0x78AB60: 13111,
+    0x8482F4: 13112,
+    0x5CD41B: 13113,
+    0x2CEDEB: 13114,
+    0x0CDCCC: 13115,
+    0x0CD996: 4,
+    0x30F33A: 13116,
+    0x98291D: 13117,
+    0x34AF2C: 1265,
+    0x7CD9FE: 13118,
+    0xCCC104: 13119,
+    0xA4B1E9: 1134,
+    0x60455E: 13120,
+    0xD806D1: 13121,
+    0x647657: 13122,
+    0x0C57EB: 13123,
+    0x745327: 13124,
+    0xD08CFF: 13125,
+    0x68D1FD: 13126,
+    0x9C066E: 13127,
+    0x642216: 13128,
+    0xF8A03D: 13129,
+    0x2CD444: 621,
+    0x907025: 13130,
+    0x10D1DC: 13131,
+    0x34996F: 13132,
+    0x5869F9: 13133,
+    0xD41E35: 8492,
+    0x98A7B0: 13134,
+    0x4C068A: 13135,
+    0xBC811F: 13136,
+    0xD867D9: 4,
+    0x944A09: 13137,
+    0xBC28D6: 13138,
+    0x10BD18: 4,
+    0x443839: 13139,
+    0xA4E731: 882,
+    0x4C72B9: 814,
+    0x68D925: 13140,
+    0x848D84: 13141,
+    0xD8337F: 13142,
+    0x0036F8: 13143,
+    0xA4F7D0: 13144,
+    0x048B42: 13145,
+    0x5076A6: 13146,
+    0xA44C11: 4,
+    0x60843B: 13147,
+    0x209BA5: 13148,
+    0xA0F450: 983,
+    0x6089B1: 13149,
+    0x44D15E: 13150,
+    0x0036FE: 13151,
+    0x3CEAFB: 13152,
+    0x8CC7AA: 13153,
+    0x40336C: 13154,
+    0x489153: 13155,
+    0xAC9403: 13156,
+    0x1C973D: 13157,
+    0xBC0200: 13158,
+    0xE856D6: 5625,
+    0xC08170: 13159,
+    0x60B933: 13160,
+    0x54466B: 13161,
+    0x44B382: 13162,
+    0x709E86: 13163,
+    0xA0F419: 882,
+    0x0043FF: 13164,
+    0x7CACB2: 13165,
+    0x18D66A: 13166,
+    0x28E608: 13167,
+    0xC47BA3: 13168,
+    0xF44848: 13169,
+    0x50D274: 13170,
+    0xF85063: 13171,
+    0xF0D14F: 13172,
+    0x5C6F4F: 13173,
+    0x901B0E: 13174,
+    0x74FF7D: 13175,
+    0xACF0B2: 13176,
+    0xC85645: 13177,
+    0x44348F: 13178,
+    0x2C36F8: 4,
+    0x5808FA: 13179,
+    0x845787: 13180,
+    0xAC3D05: 13181,
+    0x504A5E: 24,
+    0x1C7C45: 13182,
+    0x3C3888: 13183,
+    0x48D7FF: 13184,
+    0xC47130: 13185,
+    0xD4EC0C: 13186,
+    0x6CA96F: 13187,
+    0xAC0142: 13188,
+    0x542A9C: 13189,
+    0xC43C3C: 13190,
+    0xB826D4: 13191,
+    0xB87447: 13192,
+    0x7463DF: 13193,
+    0xBC125E: 13194,
+    0x14E4EC: 13195,
+    0xC8F704: 13196,
+    0x508A42: 13197,
+    0xBCEA2B: 13198,
+    0xA45630: 4,
+    0x0C9E91: 13199,
+    0xC8F9F9: 4,
+    0x80DB31: 13200,
+    0xE05DA6: 13201,
+    0x846AED: 13202,
+    0x045A95: 882,
+    0x04F4BC: 13203,
+    0x6C3A84: 13204,
+    0x00D632: 13205,
+    0x1C51B5: 13206,
+    0xD01AA7: 13207,
+    0x383F10: 13208,
+    0x286094: 13209,
+    0xACD364: 13210,
+    0xA4EF52: 13211,
+    0xA826D9: 983,
+    0x28940F: 4,
+    0xB8DAF7: 13212,
+    0x143AEA: 13213,
+    0xA086EC: 13214,
+    0x942E17: 13215,
+    0x98FE03: 13216,
+    0x20AA4B: 1068,
+    0xCC944A: 13217,
+    0x0C8525: 4,
+    0xB4D8A9: 13218,
+    0x7CC8D7: 13219,
+    0xC46044: 13220,
+    0x9CB008: 13221,
+    0xA8776F: 13222,
+    0x00FA3B: 13223,
+    0x2838CF: 13224,
+    0xE03C5B: 13225,
+    0x3828EA: 13226,
+    0x2CEE26: 13227,
+    0xFC8FC4: 13228,
+    0x541DFB: 13229,
+    0x60B606: 13230,
+    0x9092B4: 13231,
+    0xFC455F: 13232,
+    0x4833DD: 13233,
+    0x10FC54: 13234,
+    0xC02973: 13235,
+    0x98AAD7: 13236,
+    0x9C53CD: 13237,
+    0x608645: 13238,
+    0x64C5AA: 13239,
+    0xCC6DEF: 13240,
+    0xA85BF3: 13241,
+    0xB8975A: 13242,
+    0x24C0B3: 13243,
+    0x603553: 13244,
+    0xE039D7: 13245,
+    0x24BC82: 13246,
+    0x087572: 13247,
+    0x10C2BA: 13248,
+    0x90D74F: 13249,
+    0x500B32: 13250,
+    0xF04A2B: 13251,
+    0x4C32D9: 13252,
+    0x68CD0F: 13253,
+    0xA4E391: 13254,
+    0x603FC5: 13255,
+    0xAC6FD9: 13256,
+    0x90A783: 13257,
+    0x28AF0A: 13258,
+    0x5CD4AB: 13259,
+    0x08FC52: 13260,
+    0xF8462D: 13261,
+    0x78A5DD: 13262,
+    0xECE744: 13263,
+    0x28D1AF: 882,
+    0x64E84F: 13264,
+    0x2C9EFC: 1131,
+    0xDC1EA3: 13265,
+    0xA40130: 13266,
+    0x302DE8: 13267,
+    0x48A6D2: 13268,
+    0x7C336E: 13269,
+    0x182B05: 13270,
+    0x08A12B: 13271,
+    0xA00CA1: 13272,
+    0xF8F7D3: 13273,
+    0xD4E33F: 81,
+    0xB40C25: 95,
+    0x240BB1: 13274,
+    0x20EEC6: 13275,
+    0xE01E07: 13276,
+    0x7C6B33: 13277,
+    0x64D989: 4,
+    0x147DC5: 102,
+    0x00B9F6: 13278,
+    0xFCC23D: 7355,
+    0x644346: 13279,
+    0xCCE7DF: 13280,
+    0xA446FA: 13281,
+    0x2804E0: 13282,
+    0x0462D7: 13283,
+    0xD4507A: 13284,
+    0x88E7A6: 13285,
+    0xD4024A: 13286,
+    0x0041B4: 13287,
+    0xF44450: 13288,
+    0x645DD7: 13289,
+    0xEC4670: 13290,
+    0xD05A0F: 13291,
+    0xEC9681: 13292,
+    0x5C076F: 13293,
+    0x3C0FC1: 13294,
+    0x58E636: 13295,
+    0x10F9EE: 882,
+    0x742B0F: 13296,
+    0xC8F981: 13297,
+    0x14307A: 13298,
+    0xA06CEC: 1754,
+    0x24497B: 13299,
+    0x98E79A: 13300,
+    0xA0E9DB: 13301,
+    0x788973: 13302,
+    0x203706: 4,
+    0x90B97D: 13303,
+    0xF4B164: 13304,
+    0x70B035: 5284,
+    0x8821E3: 13305,
+    0x7CF429: 13306,
+    0x1045BE: 13307,
+    0x8C82A8: 13308,
+    0xCCB55A: 13309,
+    0xAC8ACD: 13310,
+    0x984246: 13311,
+    0x3429EA: 13312,
+    0x28A574: 13313,
+    0x90B8D0: 13314,
+    0xF80332: 13315,
+    0x60190C: 13316,
+    0xD05FCE: 13317,
+    0xD4A425: 13318,
+    0x8C11CB: 13319,
+    0xD09B05: 13320,
+    0xAC4723: 13321,
+    0xE8BA70: 4,
+    0xFC8329: 13322,
+    0x14EB33: 13323,
+    0xF4B549: 13324,
+    0x88B168: 13325,
+    0xAC8674: 703,
+    0x68876B: 13326,
+    0x1CAA07: 4,
+    0x685B36: 13327,
+    0x28EE2C: 13328,
+    0x782EEF: 882,
+    0x7CF0BA: 13329,
+    0x94D93C: 13330,
+    0xB8BEBF: 4,
+    0x64B64A: 13331,
+    0x8C4435: 13332,
+    0xF81D93: 13333,
+    0xCCF841: 13334,
+    0xD8DF0D: 13335,
+    0xACF97E: 13336,
+    0x204005: 13337,
+    0x64D241: 13338,
+    0x18B79E: 13339,
+    0x281471: 13340,
+    0x38D135: 13341,
+    0x901900: 13342,
+    0xD45D42: 882,
+    0xB03829: 13343,
+    0x7C6C39: 13344,
+    0xBC2846: 13345,
+    0xBC0F2B: 13346,
+    0x30EB25: 8944,
+    0x44E4D9: 4,
+    0xACCA54: 13347,
+    0x648125: 13348,
+    0x8CF9C9: 13349,
+    0x042605: 13350,
+    0x24F0FF: 13351,
+    0xC0626B: 4,
+    0x94E226: 13352,
+    0x18B3BA: 13353,
+    0xD47B75: 8933,
+    0x8C5FDF: 13354,
+    0x300B9C: 13355,
+    0xD46F42: 13356,
+    0x04C5A4: 4,
+    0x6CAD3F: 13357,
+    0x9CC0D2: 13358,
+    0xDCD87F: 13359,
+    0xB4E0CD: 13360,
+    0x286046: 13361,
+    0x10E2D5: 13362,
+    0x303955: 13363,
+    0xFC5B24: 13364,
+    0xEC986C: 13365,
+    0xCCF67A: 13366,
+    0xD8C99D: 13367,
+    0x1083D2: 13368,
+    0xD093F8: 13369,
+    0x9C645E: 13370,
+    0x1C334D: 13371,
+    0x4CB9C8: 13372,
+    0x34684A: 13373,
+    0xCCFC6D: 13374,
+    0xE03E7D: 13375,
+    0x0CC6AC: 13376,
+    0x78593E: 13377,
+    0x509772: 13378,
+    0x8CB64F: 4,
+    0x503DE5: 4,
+    0x540496: 13379,
+    0xEC4644: 13380,
+    0x8065E9: 13381,
+    0x204AAA: 13382,
+    0x60C980: 13383,
+    0xA036FA: 13384,
+    0xEC836C: 13385,
+    0x20FECD: 13386,
+    0xF0933A: 13387,
+    0x5CF3FC: 2034,
+    0x582F42: 12447,
+    0x0474A1: 13388,
+    0x5C6984: 13389,
+    0xB8415F: 13390,
+    0x2CB69D: 13391,
+    0xA86A6F: 1754,
+    0x500E6D: 13392,
+    0xEC3BF0: 13393,
+    0x70DDA1: 11355,
+    0x94D019: 13394,
+    0x8C278A: 1065,
+    0xCC0CDA: 13395,
+    0xE41C4B: 13396,
+    0xB8FF6F: 13397,
+    0x68122D: 13398,
+    0x94F720: 13399,
+    0xDC9C52: 13400,
+    0x4891F6: 13401,
+    0x649B24: 13402,
+    0x846EB1: 13403,
+    0x6C504D: 4,
+    0xB41489: 4,
+    0xA0B5DA: 13404,
+    0x8886A0: 13405,
+    0xA45055: 13406,
+    0xACAB8D: 13407,
+    0x6083B2: 13408,
+    0x80D019: 13409,
+    0x68EBC5: 13410,
+    0xE8995A: 13411,
+    0x401D59: 13412,
+    0xB8D06F: 13413,
+    0xEC14F6: 13414,
+    0x1CBD0E: 13415,
+    0xA0F217: 13416,
+    0xF0A764: 13417,
+    0x1C0656: 13418,
+    0x4CEDDE: 234,
+    0xE8E08F: 13419,
+    0xA89B10: 13420,
+    0xA4A80F: 1443,
+    0xF8B599: 13421,
+    0xB8921D: 13422,
+    0x80C6CA: 13423,
+    0xC88B47: 13424,
+    0xC4CD45: 13425,
+    0x54FDBF: 13426,
+    0xD0BB80: 13427,
+    0xE061B2: 13428,
+    0x9411DA: 13429,
+    0x8039E5: 13430,
+    0xD08999: 13431,
+    0xC88447: 13432,
+    0x5C17D3: 5848,
+    0x1CDF0F: 4,
+    0x68BDAB: 4,
+    0x9CADEF: 13433,
+    0x90903C: 13434,
+    0x8CE7B3: 13435,
+    0x088DC8: 13436,
+    0x94E711: 13437,
+    0x7076F0: 13438,
+    0xB081D8: 13439,
+    0x6C9B02: 882,
+    0x641E81: 13440,
+    0xEC542E: 13441,
+    0xF0E5C3: 13442,
+    0x5CCA32: 13443,
+    0xC02BFC: 13444,
+    0x94C7AF: 13445,
+    0x043604: 13446,
+    0xA4B2A7: 13447,
+    0xD0D0FD: 4,
+    0x14FEAF: 13448,
+    0xDC7B94: 4,
+    0xD81C14: 13449,
+    0x008C10: 13450,
+    0xB0B8D5: 13451,
+    0xD82986: 13452,
+    0x446132: 13453,
+    0xE05B70: 13454,
+    0xF41F0B: 13455,
+    0xA082C7: 13456,
+    0xE87AF3: 13457,
+    0x7415E2: 13458,
+    0xD48FAA: 13459,
+    0x98FC11: 1068,
+    0x34E0D7: 13460,
+    0xD84606: 13461,
+    0xCC5C75: 13462,
+    0x90E0F0: 13463,
+    0xFCD4F6: 13464,
+    0xD466A8: 13465,
+    0xF8AC6D: 13466,
+    0x18B209: 13467,
+    0x40520D: 13468,
+    0x807D1B: 13469,
+    0xC848F5: 13470,
+    0x1880CE: 13471,
+    0xD84B2A: 13472,
+    0x684B88: 13473,
+    0xA4AE9A: 13474,
+    0x78A714: 13475,
+    0xF450EB: 13476,
+    0x988EDD: 13477,
+    0x141BBD: 13478,
+    0xA4561B: 13479,
+    0x80C63F: 13480,
+    0x40D40E: 13481,
+    0x0C826A: 13482,
+    0x7C051E: 13483,
+    0x7866AE: 13484,
+    0x4C022E: 13485,
+    0x34AAEE: 13486,
+    0x48FCB8: 13487,
+    0xF893F3: 13488,
+    0x78A2A0: 1265,
+    0x24B6B8: 13489,
+    0xD4000D: 13490,
+    0xAC5135: 13491,
+    0x44D63D: 13492,
+    0x08F6F8: 13493,
+    0x10090C: 13494,
+    0xE01CEE: 13495,
+    0x74B9EB: 13496,
+    0xD45297: 13497,
+    0xE0271A: 13498,
+    0x0097FF: 13499,
+    0xE4AB46: 13500,
+    0x945B7E: 13501,
+    0x04E548: 13502,
+    0x2893FE: 4,
+    0xF4C795: 13503,
+    0x781185: 13504,
+    0xE85E53: 13505,
+    0x88BA7F: 13506,
+    0x64DB18: 13507,
+    0xD05875: 13508,
+    0xD81BFE: 13509,
+    0x7071BC: 814,
+    0x7884EE: 13510,
+    0xFC4463: 13511,
+    0x90A2DA: 13512,
+    0x9889ED: 13513,
+    0x042F56: 13514,
+    0xC8EF2E: 13515,
+    0xA4C2AB: 13516,
+    0x48AA5D: 13517,
+    0x0CC9C6: 13518,
+    0x1062C9: 13519,
+    0xD8AE90: 12052,
+    0xB8653B: 13520,
+    0x38E8DF: 13521,
+    0x1C129D: 13522,
+    0xE0CA4D: 13523,
+    0xA06986: 13524,
+    0xEC8EAD: 13525,
+    0xF0B6EB: 13526,
+    0x1C8F8A: 13527,
+    0xFCCCE4: 13528,
+    0x60B3C4: 13529,
+    0x04C880: 13530,
+    0x5C35DA: 13531,
+    0x3C4C69: 13532,
+    0x7830E1: 13533,
+    0xB09134: 13534,
+    0x34C69A: 13535,
+    0xF88DEF: 13536,
+    0x042234: 13537,
+    0x80C862: 13538,
+    0x102D96: 13539,
+    0x5850E6: 13540,
+    0x3C1CBE: 13541,
+    0x7C08D9: 13542,
+    0xBCD5B6: 13543,
+    0xFC683E: 13544,
+    0x28E794: 13545,
+    0xA438FC: 13546,
+    0x18FC9F: 13547,
+    0x94592D: 13548,
+    0xCC69B0: 13549,
+    0xA0593A: 13550,
+    0xCCEA1C: 13551,
+    0x0CD502: 5031,
+    0x687F74: 1068,
+    0x38E98C: 13552,
+    0x34EF8B: 13553,
+    0x2059A0: 13554,
+    0x0C2755: 13555,
+    0xF8472D: 13556,
+    0x849000: 13557,
+    0x08184C: 13558,
+    0x10880F: 13559,
+    0xFC6198: 13560,
+    0x74D850: 13561,
+    0x78998F: 13562,
+    0x34CE94: 13563,
+    0x24D2CC: 13564,
+    0x0CEF7C: 13565,
+    0xB05B1F: 13566,
+    0xECE9F8: 13567,
+    0xD0D286: 13568,
+    0xBCB181: 11866,
+    0xA0BFA5: 13569,
+    0xC8873B: 13570,
+    0x2C0623: 13571,
+    0xA8CE90: 13572,
+    0xE41F13: 2034,
+    0xE4FFDD: 13573,
+    0x68A1B7: 13574,
+    0x0CD7C2: 13575,
+    0xC4198B: 13576,
+    0xC83A35: 13577,
+    0x6C8CDB: 13578,
+    0x40F52E: 13579,
+    0x906DC8: 13580,
+    0xE84ECE: 1265,
+    0x1045F8: 13581,
+    0xDCE71C: 13582,
+    0xA870A5: 13583,
+    0x4456B7: 13584,
+    0x44C9A2: 13585,
+    0x406186: 13586,
+    0x584CEE: 13587,
+    0xA07332: 13588,
+    0x64C6AF: 13589,
+    0x701AED: 13590,
+    0x6465C0: 13591,
+    0x40ECF8: 344,
+    0x54B620: 13592,
+    0x78C40E: 13593,
+    0x44568D: 13594,
+    0x7C1EB3: 13595,
+    0x0026DF: 13596,
+    0x0026D8: 13597,
+    0x0026D6: 13598,
+    0x0026F8: 13599,
+    0x0026F4: 13600,
+    0x0026EE: 13601,
+    0x0026EF: 13602,
+    0x0026E6: 13603,
+    0x002701: 13604,
+    0x0026FB: 13605,
+    0x0026F5: 13606,
+    0x0026B2: 13607,
+    0x0026AF: 13608,
+    0x0026B3: 13609,
+    0x002721: 13610,
+    0x0026D1: 13611,
+    0x0026D3: 13612,
+    0x0026CB: 4,
+    0x00271A: 13613,
+    0x002714: 13614,
+    0x002715: 13615,
+    0x00270F: 13616,
+    0x00270A: 13617,
+    0x002709: 1265,
+    0x0026A2: 13618,
+    0x00269F: 13,
+    0x002699: 4,
+    0x002653: 13619,
+    0x002647: 13620,
+    0x00266A: 13621,
+    0x00266B: 13622,
+    0x002667: 13623,
+    0x002640: 13624,
+    0x002633: 13625,
+    0x002630: 13626,
+    0x00262A: 13627,
+    0x002687: 7102,
+    0x00267B: 13628,
+    0x00268D: 13629,
+    0x002628: 13630,
+    0x00261F: 13631,
+    0x00261E: 13632,
+    0x002619: 13633,
+    0x0025F0: 13634,
+    0x0025E8: 13635,
+    0x0025E4: 13636,
+    0x0025C9: 13637,
+    0x0025FA: 13638,
+    0x0025EA: 13639,
+    0x0025BE: 13640,
+    0x0025B5: 4,
+    0x0025FE: 13641,
+    0x0025D7: 13642,
+    0x0025D8: 13643,
+    0x0025D2: 13644,
+    0x00255B: 13645,
+    0x00254D: 13646,
+    0x00254C: 13647,
+    0x002543: 13648,
+    0x00257B: 13649,
+    0x00257C: 13650,
+    0x002575: 13651,
+    0x002570: 13652,
+    0x002596: 13653,
+    0x002595: 13654,
+    0x00258F: 13655,
+    0x002589: 13656,
+    0x002585: 13657,
+    0x002551: 13658,
+    0x00256A: 13659,
+    0x002562: 13660,
+    0x002581: 13661,
+    0x0025A0: 1265,
+    0x00259B: 13662,
+    0x00253A: 13663,
+    0x0024F7: 4,
+    0x0024F3: 1265,
+    0x0024E0: 13664,
+    0x0024E2: 13665,
+    0x002516: 13666,
+    0x002510: 13667,
+    0x002520: 13668,
+    0x002527: 13669,
+    0x002525: 13670,
+    0x0024C8: 9975,
+    0x0024C5: 13671,
+    0x0024E5: 13672,
+    0x002501: 13673,
+    0x002458: 13674,
+    0x00245D: 13675,
+    0x002450: 4,
+    0x002496: 13676,
+    0x002499: 13677,
+    0x00248A: 13678,
+    0x002487: 13679,
+    0x0024B9: 13680,
+    0x0024BD: 13681,
+    0x002477: 13682,
+    0x00246E: 13683,
+    0x002473: 716,
+    0x002451: 4,
+    0x00244A: 13684,
+    0x002447: 13685,
+    0x00246B: 13686,
+    0x002435: 13687,
+    0x002431: 13688,
+    0x002432: 13689,
+    0x002430: 13690,
+    0x00242E: 13691,
+    0x0023F9: 13692,
+    0x0023F5: 13693,
+    0x0023FF: 13694,
+    0x0023F6: 13695,
+    0x0023F3: 13696,
+    0x0023F0: 13697,
+    0x00241A: 13698,
+    0x002414: 4,
+    0x002410: 13699,
+    0x0023CC: 1265,
+    0x002443: 1034,
+    0x002441: 13700,
+    0x00243B: 13701,
+    0x002408: 13702,
+    0x00240C: 13703,
+    0x0023EA: 4,
+    0x0023E5: 13704,
+    0x002350: 13705,
+    0x00234F: 13706,
+    0x002349: 13707,
+    0x002346: 13708,
+    0x002344: 13709,
+    0x0023B6: 13710,
+    0x0023B8: 13711,
+    0x0023BA: 13712,
+    0x0023BC: 13713,
+    0x0023B1: 13714,
+    0x00239A: 13715,
+    0x002396: 13716,
+    0x002394: 13717,
+    0x0023A1: 13718,
+    0x0023A6: 13719,
+    0x0023A8: 13720,
+    0x002377: 13721,
+    0x002371: 13722,
+    0x002364: 13723,
+    0x00238C: 13,
+    0x002379: 13724,
+    0x002362: 13725,
+    0x00235E: 4,
+    0x002358: 13726,
+    0x002356: 13727,
+    0x0023C0: 13728,
+    0x0022BB: 13729,
+    0x0022B6: 13730,
+    0x0022B5: 13731,
+    0x0022B2: 13732,
+    0x0022AC: 13733,
+    0x0022AD: 13734,
+    0x0022AE: 13735,
+    0x002307: 13736,
+    0x002305: 4,
+    0x0022FF: 13737,
+    0x002302: 13738,
+    0x0022F5: 13739,
+    0x0022C7: 13740,
+    0x0022C1: 13741,
+    0x0022C2: 13742,
+    0x0022BD: 4,
+    0x0022BA: 13743,
+    0x0022D1: 13744,
+    0x0022D2: 13745,
+    0x0022CA: 13746,
+    0x00233C: 13747,
+    0x002333: 4,
+    0x00232E: 13748,
+    0x0022E4: 13749,
+    0x0022D5: 13750,
+    0x0022E5: 13751,
+    0x002320: 13752,
+    0x002322: 13753,
+    0x002317: 13754,
+    0x00230E: 13755,
+    0x00225E: 13756,
+    0x002258: 13757,
+    0x00225B: 13758,
+    0x002259: 13759,
+    0x002253: 13760,
+    0x002239: 13761,
+    0x002235: 13762,
+    0x00222C: 13763,
+    0x00222D: 13764,
+    0x00227E: 13765,
+    0x00227C: 13766,
+    0x002277: 13767,
+    0x002279: 13768,
+    0x0022A3: 13769,
+    0x0022A0: 4316,
+    0x00224F: 13770,
+    0x002251: 13771,
+    0x002247: 13772,
+    0x002271: 13773,
+    0x002297: 13774,
+    0x00228F: 13775,
+    0x002292: 13776,
+    0x00223D: 13777,
+    0x00222A: 13778,
+    0x0021EE: 13779,
+    0x0021EC: 13780,
+    0x0021E6: 13781,
+    0x0021E0: 13782,
+    0x0021CC: 1462,
+    0x0021CF: 13783,
+    0x0021C5: 13784,
+    0x0021B9: 13785,
+    0x0021B3: 13786,
+    0x0021B6: 13787,
+    0x0021AE: 13788,
+    0x0021AF: 13789,
+    0x0021F9: 13790,
+    0x0021FA: 13791,
+    0x0021F0: 13792,
+    0x002211: 13793,
+    0x002212: 13794,
+    0x00220D: 4,
+    0x0021DE: 13795,
+    0x0021D3: 13796,
+    0x002208: 13797,
+    0x002205: 13798,
+    0x002209: 13799,
+    0x00221F: 13800,
+    0x002217: 13801,
+    0x0021A4: 13802,
+    0x00214B: 13803,
+    0x002145: 13804,
+    0x00218C: 13805,
+    0x00218A: 13806,
+    0x00218B: 13807,
+    0x002184: 13808,
+    0x002121: 13809,
+    0x002123: 13810,
+    0x00211B: 4,
+    0x00217A: 13811,
+    0x002178: 13812,
+    0x002173: 13813,
+    0x002177: 13814,
+    0x002199: 13815,
+    0x0021A0: 4,
+    0x002198: 13816,
+    0x002172: 13817,
+    0x002169: 13818,
+    0x002153: 13819,
+    0x002154: 13820,
+    0x00213E: 12182,
+    0x00213F: 13821,
+    0x00212D: 13822,
+    0x001FD8: 13823,
+    0x001FD7: 13824,
+    0x001FD3: 13825,
+    0x001FD5: 13826,
+    0x001FCA: 4,
+    0x001FC3: 13827,
+    0x001FC1: 13828,
+    0x001FEE: 13829,
+    0x001FEF: 13830,
+    0x001FEC: 13831,
+    0x001FFC: 13832,
+    0x001FFD: 13833,
+    0x001FBB: 13834,
+    0x001FB1: 13835,
+    0x00210A: 13836,
+    0x002107: 13837,
+    0x001FFE: 6210,
+    0x001FFF: 13838,
+    0x001FE8: 13839,
+    0x001FE0: 13840,
+    0x001FAB: 13841,
+    0x001FAC: 13842,
+    0x001FB2: 13843,
+    0x001F44: 13844,
+    0x001F39: 13845,
+    0x001F3D: 13846,
+    0x001F36: 13847,
+    0x001F38: 13848,
+    0x001F8E: 13849,
+    0x001F89: 13850,
+    0x001F8A: 13851,
+    0x001F7F: 13852,
+    0x001F7C: 13853,
+    0x001F7A: 13854,
+    0x001F77: 13855,
+    0x001F76: 13856,
+    0x001F73: 13857,
+    0x001F11: 13858,
+    0x001F2D: 13859,
+    0x001F2F: 13860,
+    0x001F32: 1265,
+    0x001F56: 13861,
+    0x001F52: 13862,
+    0x001F4F: 13863,
+    0x001F62: 13864,
+    0x001F67: 13865,
+    0x001F61: 13866,
+    0x001F1C: 13867,
+    0x001F19: 13868,
+    0x001EC8: 13869,
+    0x001ECC: 13870,
+    0x001EC5: 13871,
+    0x001EBE: 4,
+    0x001EC3: 13872,
+    0x001EBD: 4,
+    0x001EB9: 13873,
+    0x001EF6: 4,
+    0x001EF9: 13874,
+    0x001EF3: 13875,
+    0x001EE7: 13876,
+    0x001EE9: 13877,
+    0x001F03: 13878,
+    0x001EFD: 13879,
+    0x001EFF: 13880,
+    0x001F05: 13881,
+    0x001F07: 13882,
+    0x001E93: 13883,
+    0x001E92: 13884,
+    0x001E91: 13885,
+    0x001E89: 13886,
+    0x001E86: 13887,
+    0x001E88: 13888,
+    0x001EB7: 13889,
+    0x001EA2: 13890,
+    0x001EA9: 1265,
+    0x001E9E: 13891,
+    0x001EE4: 13892,
+    0x001EED: 13893,
+    0x001ED4: 13894,
+    0x001ED2: 13895,
+    0x001ECE: 13896,
+    0x001E9D: 13897,
+    0x001E95: 13898,
+    0x001E79: 4,
+    0x001E54: 13899,
+    0x001E4D: 13900,
+    0x001E4B: 13901,
+    0x001E4A: 4,
+    0x001E3C: 13902,
+    0x001E0D: 13903,
+    0x001E09: 13904,
+    0x001E06: 13905,
+    0x001E0C: 13906,
+    0x001E02: 13907,
+    0x001E01: 13908,
+    0x001DFF: 13909,
+    0x001E5F: 13910,
+    0x001E5B: 13911,
+    0x001E5E: 13912,
+    0x001E76: 13913,
+    0x001E72: 13914,
+    0x001E69: 6084,
+    0x001DEE: 13915,
+    0x001DEA: 13916,
+    0x001DDD: 13917,
+    0x001DE4: 13918,
+    0x001E00: 13919,
+    0x001DF3: 13920,
+    0x001E23: 13921,
+    0x001E13: 4,
+    0x001E2C: 13922,
+    0x001E26: 13923,
+    0x001D89: 13924,
+    0x001D86: 13925,
+    0x001D88: 13926,
+    0x001D81: 13927,
+    0x001D76: 13928,
+    0x001D7A: 13929,
+    0x001D68: 1944,
+    0x001D61: 13930,
+    0x001D5C: 13931,
+    0x001DE2: 13932,
+    0x001DD7: 13933,
+    0x001DC9: 13934,
+    0x001DC7: 13935,
+    0x001DBC: 1265,
+    0x001D66: 13936,
+    0x001D77: 13937,
+    0x001DA2: 4,
+    0x001D99: 13938,
+    0x001D9B: 13939,
+    0x001DB6: 13940,
+    0x001DAC: 13941,
+    0x001D4E: 13942,
+    0x001D49: 13943,
+    0x001D46: 4,
+    0x001D48: 13944,
+    0x001D47: 13945,
+    0x001D41: 13946,
+    0x001CE6: 13947,
+    0x001CE1: 13948,
+    0x001CE0: 13949,
+    0x001D11: 13950,
+    0x001D12: 13951,
+    0x001D03: 13952,
+    0x001D3D: 13953,
+    0x001D3C: 13954,
+    0x001D3A: 13955,
+    0x001D35: 13956,
+    0x001D31: 13957,
+    0x001CD9: 13958,
+    0x001CDA: 13959,
+    0x001CD2: 13960,
+    0x001CF9: 4,
+    0x001CF1: 13961,
+    0x001CF3: 13962,
+    0x001CF4: 13963,
+    0x001D26: 13964,
+    0x001D21: 13965,
+    0x001D1C: 13966,
+    0x001D15: 13967,
+    0x001D16: 4542,
+    0x001D56: 13968,
+    0x001C90: 13969,
+    0x001C8E: 2155,
+    0x001C8F: 13970,
+    0x001C88: 13971,
+    0x001CA9: 13972,
+    0x001C99: 13973,
+    0x001C9B: 13974,
+    0x001C95: 13975,
+    0x001C97: 13976,
+    0x001C58: 4,
+    0x001C5A: 13977,
+    0x001C4F: 13978,
+    0x001C4E: 13979,
+    0x001C6E: 13980,
+    0x001C6B: 13981,
+    0x001C69: 13982,
+    0x001C65: 13983,
+    0x001C5F: 13984,
+    0x001C3D: 13985,
+    0x001C2D: 13986,
+    0x001C86: 13987,
+    0x001C7F: 3906,
+    0x001C78: 13988,
+    0x001CCE: 13989,
+    0x001CB9: 13990,
+    0x001C4B: 13991,
+    0x001C40: 13992,
+    0x001C3A: 13993,
+    0x001CA3: 13994,
+    0x001CA6: 13995,
+    0x001BCA: 13996,
+    0x001BCC: 13997,
+    0x001BC8: 13998,
+    0x001BC1: 13999,
+    0x001BBC: 14000,
+    0x001C1E: 14001,
+    0x001C18: 14002,
+    0x001C1A: 14003,
+    0x001C0E: 4,
+    0x001C13: 14004,
+    0x001BF4: 14005,
+    0x001BF9: 14006,
+    0x001BFA: 14007,
+    0x001BF3: 14008,
+    0x001BDB: 14009,
+    0x001BD8: 14010,
+    0x001BD4: 4,
+    0x001BD0: 14011,
+    0x001BCD: 14012,
+    0x001BDE: 14013,
+    0x001BAB: 14014,
+    0x001BAE: 14015,
+    0x001BA8: 14016,
+    0x001C2C: 14017,
+    0x001C21: 14018,
+    0x001C0B: 14019,
+    0x001C08: 14020,
+    0x001BA0: 14021,
+    0x001B42: 14022,
+    0x001B35: 14023,
+    0x001B36: 14024,
+    0x001B39: 14025,
+    0x001B3B: 14026,
+    0x001B51: 14027,
+    0x001B54: 4,
+    0x001B4A: 14028,
+    0x001B44: 10178,
+    0x001B46: 14029,
+    0x001B40: 14030,
+    0x001B79: 14031,
+    0x001B71: 14032,
+    0x001B73: 14033,
+    0x001B20: 14034,
+    0x001B1C: 14035,
+    0x001B22: 14036,
+    0x001B19: 14037,
+    0x001B65: 14038,
+    0x001B64: 14039,
+    0x001B97: 14040,
+    0x001B88: 14041,
+    0x001B83: 14042,
+    0x001B81: 14043,
+    0x001B7D: 14044,
+    0x001B26: 14045,
+    0x001AA8: 14046,
+    0x001A99: 14047,
+    0x001A96: 14048,
+    0x001AFA: 14049,
+    0x001AF7: 14050,
+    0x001AF3: 14051,
+    0x001AEF: 14052,
+    0x001AEC: 14053,
+    0x001AA9: 287,
+    0x001A8C: 66,
+    0x001A91: 14054,
+    0x001AB9: 14055,
+    0x001ABA: 14056,
+    0x001AB3: 14057,
+    0x001ACA: 14058,
+    0x001B13: 14059,
+    0x001B0F: 14060,
+    0x001AD1: 14061,
+    0x001A15: 14062,
+    0x001A0D: 14063,
+    0x001A0E: 14064,
+    0x001A84: 14065,
+    0x001A7B: 14066,
+    0x001A6D: 4,
+    0x001A6E: 14067,
+    0x001A6C: 4,
+    0x001A3E: 14068,
+    0x001A3A: 14069,
+    0x001A3B: 14070,
+    0x001A3C: 14071,
+    0x001A40: 14072,
+    0x001A30: 4,
+    0x001A36: 14073,
+    0x001A26: 14074,
+    0x001A25: 14075,
+    0x001A46: 14076,
+    0x001A4A: 14077,
+    0x001A63: 14078,
+    0x001A59: 14079,
+    0x0019FE: 14080,
+    0x0019FD: 1265,
+    0x0019ED: 14081,
+    0x0019F6: 14082,
+    0x0019CD: 14083,
+    0x0019D9: 14084,
+    0x0019CA: 14085,
+    0x0019D3: 14086,
+    0x0019C3: 14087,
+    0x0019BE: 14088,
+    0x0019B4: 14089,
+    0x0019BA: 14090,
+    0x001980: 14091,
+    0x001983: 14092,
+    0x00197F: 830,
+    0x001A01: 14093,
+    0x00198A: 14094,
+    0x001989: 14095,
+    0x0019A1: 14096,
+    0x0019A8: 14097,
+    0x00197A: 14098,
+    0x001978: 14099,
+    0x00191D: 1265,
+    0x001924: 14100,
+    0x00191A: 14101,
+    0x001916: 14102,
+    0x001950: 14103,
+    0x00194C: 14104,
+    0x00194A: 14105,
+    0x001939: 14106,
+    0x00193A: 14107,
+    0x00192F: 4,
+    0x001922: 14108,
+    0x001968: 14109,
+    0x00196D: 14110,
+    0x001970: 14111,
+    0x00190E: 14112,
+    0x001960: 14113,
+    0x00195A: 14114,
+    0x001905: 14115,
+    0x001907: 4,
+    0x0018C6: 14116,
+    0x0018C3: 14117,
+    0x0018CA: 14118,
+    0x0018C7: 14119,
+    0x0018BB: 14120,
+    0x0018BF: 14121,
+    0x0018FB: 14122,
+    0x0018EE: 14123,
+    0x0018EB: 14124,
+    0x001870: 14125,
+    0x001872: 14126,
+    0x001874: 4,
+    0x001869: 14127,
+    0x0018E2: 14128,
+    0x0018DC: 14129,
+    0x0018D1: 4808,
+    0x0018D0: 14130,
+    0x0018D2: 14131,
+    0x0018D3: 14132,
+    0x00188F: 14133,
+    0x001884: 13185,
+    0x001880: 14134,
+    0x00187C: 14135,
+    0x0018B9: 4,
+    0x0018B8: 14136,
+    0x0018A1: 14137,
+    0x001896: 14138,
+    0x001890: 14139,
+    0x0018AA: 14140,
+    0x001810: 14141,
+    0x001804: 14142,
+    0x001809: 4312,
+    0x001861: 14143,
+    0x001855: 14144,
+    0x001851: 14145,
+    0x001856: 14146,
+    0x00184E: 14147,
+    0x00184C: 14148,
+    0x001812: 14149,
+    0x00180B: 14150,
+    0x001800: 14151,
+    0x0017FC: 14152,
+    0x0017FD: 14153,
+    0x0017FB: 14154,
+    0x0017D8: 14155,
+    0x0017DA: 14156,
+    0x00185B: 14157,
+    0x001841: 14158,
+    0x001826: 14159,
+    0x00182D: 14160,
+    0x00182A: 14161,
+    0x00183B: 14162,
+    0x00183C: 14163,
+    0x001819: 4,
+    0x00175C: 11866,
+    0x001759: 4,
+    0x001754: 14164,
+    0x001752: 14165,
+    0x001756: 14166,
+    0x001790: 14167,
+    0x001791: 14168,
+    0x001795: 4,
+    0x001799: 14169,
+    0x00177F: 14170,
+    0x00175F: 14171,
+    0x001774: 14172,
+    0x001777: 14173,
+    0x00176A: 14174,
+    0x001786: 14175,
+    0x001782: 14176,
+    0x00176B: 14177,
+    0x001778: 14178,
+    0x0017B3: 14179,
+    0x0017A2: 14180,
+    0x00179D: 14181,
+    0x0017CF: 14182,
+    0x0017B9: 14183,
+    0x00171E: 14184,
+    0x001712: 14185,
+    0x00170D: 14186,
+    0x00170C: 14187,
+    0x00170B: 14188,
+    0x00170F: 4,
+    0x001704: 14189,
+    0x00172D: 14190,
+    0x001724: 14191,
+    0x001707: 14192,
+    0x001702: 14193,
+    0x0016D8: 14194,
+    0x0016D6: 14195,
+    0x0016D5: 14196,
+    0x001741: 14197,
+    0x001738: 14198,
+    0x0016F7: 14199,
+    0x0016A1: 14200,
+    0x0016A4: 14201,
+    0x001699: 14202,
+    0x00169B: 14203,
+    0x001690: 14204,
+    0x001698: 14205,
+    0x001696: 14206,
+    0x001661: 14207,
+    0x001664: 14208,
+    0x00165E: 14209,
+    0x001658: 14210,
+    0x001653: 14211,
+    0x001652: 14212,
+    0x001650: 14213,
+    0x001666: 14214,
+    0x001662: 14215,
+    0x001680: 14216,
+    0x001681: 14217,
+    0x00BAC0: 14218,
+    0x0016AB: 14219,
+    0x0016A5: 14220,
+    0x0016C9: 14221,
+    0x0016C6: 14222,
+    0x0016D2: 14223,
+    0x0016BE: 14224,
+    0x001685: 14225,
+    0x0015FA: 4,
+    0x0015FC: 14226,
+    0x0015F7: 8975,
+    0x0015DB: 14227,
+    0x0015D7: 14228,
+    0x0015CB: 14229,
+    0x001630: 14230,
+    0x00162F: 14231,
+    0x00162B: 14232,
+    0x001642: 14233,
+    0x00163B: 14234,
+    0x001637: 14235,
+    0x0015CC: 14236,
+    0x0015C6: 4,
+    0x0015C3: 14237,
+    0x0015F8: 14238,
+    0x0015E6: 14239,
+    0x001608: 14240,
+    0x001624: 14241,
+    0x00161C: 14242,
+    0x001581: 14243,
+    0x00157A: 14244,
+    0x001573: 14245,
+    0x001575: 14246,
+    0x00156C: 14247,
+    0x00156A: 14248,
+    0x0015B8: 14249,
+    0x0015B6: 14250,
+    0x0015B0: 14251,
+    0x0015B1: 14252,
+    0x00159F: 14253,
+    0x00159E: 14254,
+    0x0015A1: 14255,
+    0x001593: 14256,
+    0x00158D: 14257,
+    0x001546: 14258,
+    0x00153E: 14259,
+    0x001542: 14260,
+    0x00156F: 14261,
+    0x001572: 14262,
+    0x001567: 14263,
+    0x001551: 14264,
+    0x001552: 14265,
+    0x00154E: 14266,
+    0x001550: 14267,
+    0x00155D: 157,
+    0x001562: 4,
+    0x00155B: 14268,
+    0x001553: 14269,
+    0x001584: 14270,
+    0x0015A7: 14271,
+    0x00152D: 14272,
+    0x001523: 14273,
+    0x001524: 14274,
+    0x001529: 14275,
+    0x001509: 14276,
+    0x0014F9: 14277,
+    0x0014E9: 14278,
+    0x0014ED: 14279,
+    0x0014E1: 14280,
+    0x0014E3: 14281,
+    0x0014D9: 14282,
+    0x0014D6: 14283,
+    0x0014D0: 14284,
+    0x0014CE: 14285,
+    0x0014F0: 14286,
+    0x0014F2: 4,
+    0x0014E7: 14287,
+    0x001510: 14288,
+    0x001513: 14289,
+    0x001503: 14290,
+    0x00151B: 14291,
+    0x001459: 14292,
+    0x001453: 14293,
+    0x001454: 14294,
+    0x00148B: 14295,
+    0x001490: 14296,
+    0x001448: 14297,
+    0x00144B: 14298,
+    0x00143C: 14299,
+    0x001488: 14300,
+    0x001484: 645,
+    0x001479: 14301,
+    0x00147B: 14302,
+    0x00147A: 14303,
+    0x00146D: 14304,
+    0x001470: 14305,
+    0x001467: 14306,
+    0x0014AC: 14307,
+    0x0014A8: 4,
+    0x0014A0: 14308,
+    0x0014BB: 14309,
+    0x00145F: 14310,
+    0x0013E6: 14311,
+    0x0013DF: 14312,
+    0x0013D5: 14313,
+    0x0013D6: 14314,
+    0x0013DB: 14315,
+    0x0013F2: 14316,
+    0x0013F7: 10872,
+    0x0013ED: 14317,
+    0x001426: 14318,
+    0x00141C: 4,
+    0x00141A: 14319,
+    0x00140C: 14320,
+    0x0013FE: 14321,
+    0x0013F8: 14322,
+    0x0013F9: 14323,
+    0x0013C5: 14324,
+    0x0013C4: 4,
+    0x0013C2: 14325,
+    0x0013BF: 14326,
+    0x0013BB: 14327,
+    0x0013B5: 14328,
+    0x0013CD: 14329,
+    0x0013D3: 2557,
+    0x0013CA: 14330,
+    0x001435: 14331,
+    0x001416: 14332,
+    0x00133C: 14333,
+    0x00133D: 14334,
+    0x00133F: 14335,
+    0x001341: 14336,
+    0x001331: 14337,
+    0x001335: 14338,
+    0x00132F: 14339,
+    0x001330: 14340,
+    0x001325: 14341,
+    0x001350: 14342,
+    0x00134C: 14343,
+    0x00138D: 14344,
+    0x001390: 14345,
+    0x00139A: 14346,
+    0x00139E: 14347,
+    0x00139D: 14348,
+    0x0013AF: 14349,
+    0x0013B0: 14350,
+    0x0013B1: 14351,
+    0x00137F: 4,
+    0x001382: 14352,
+    0x001358: 14353,
+    0x001359: 14354,
+    0x001375: 14355,
+    0x0012B4: 14356,
+    0x0012B5: 14357,
+    0x0012B1: 14358,
+    0x0012C3: 14359,
+    0x0012C8: 14360,
+    0x0012C6: 14361,
+    0x0012CC: 14362,
+    0x0012C1: 3906,
+    0x0012BB: 14363,
+    0x0012B6: 14364,
+    0x0012B9: 14365,
+    0x0012ED: 14366,
+    0x0012EA: 14367,
+    0x0012FD: 14368,
+    0x001305: 14369,
+    0x001306: 14370,
+    0x0012FA: 14371,
+    0x0012E7: 14372,
+    0x0012E4: 14373,
+    0x00129F: 14374,
+    0x001297: 14375,
+    0x00129D: 14376,
+    0x00129C: 14377,
+    0x001290: 14378,
+    0x001291: 14379,
+    0x001295: 14380,
+    0x00128B: 14381,
+    0x00128F: 14382,
+    0x001246: 14383,
+    0x00123D: 14384,
+    0x0012A3: 14385,
+    0x0012A7: 14386,
+    0x0012AA: 14387,
+    0x00127E: 14388,
+    0x00125B: 14389,
+    0x001259: 14390,
+    0x00125A: 157,
+    0x001289: 14391,
+    0x001284: 14392,
+    0x001281: 14393,
+    0x001256: 14096,
+    0x00126B: 14394,
+    0x0011E2: 14395,
+    0x0011DA: 14396,
+    0x0011DD: 14397,
+    0x0011E4: 14398,
+    0x0011E1: 4289,
+    0x0011BE: 14399,
+    0x0011BA: 14400,
+    0x0011BC: 4,
+    0x0011B3: 14401,
+    0x0011B6: 14402,
+    0x00122F: 14403,
+    0x001230: 14404,
+    0x0011FB: 14405,
+    0x0011EF: 14406,
+    0x0011D6: 14407,
+    0x0011CA: 14408,
+    0x0011C5: 14409,
+    0x0011CD: 14410,
+    0x0011EB: 14411,
+    0x0011EA: 14412,
+    0x001239: 14413,
+    0x001233: 14414,
+    0x00121D: 14415,
+    0x001214: 14416,
+    0x00120F: 14417,
+    0x00120C: 14418,
+    0x001153: 14419,
+    0x00114F: 14420,
+    0x0011B0: 14421,
+    0x0011AC: 14422,
+    0x0011AD: 14423,
+    0x0011A8: 14424,
+    0x00118F: 14425,
+    0x001191: 14426,
+    0x00118D: 14427,
+    0x001189: 14428,
+    0x001163: 14429,
+    0x00115F: 14430,
+    0x001182: 14431,
+    0x00117A: 14432,
+    0x001148: 14433,
+    0x001140: 14434,
+    0x001144: 14435,
+    0x0011A1: 14436,
+    0x0011A0: 14437,
+    0x00119B: 14438,
+    0x001172: 14439,
+    0x001168: 14440,
+    0x00113A: 14441,
+    0x00113F: 14442,
+    0x000FFC: 14443,
+    0x000FFB: 14444,
+    0x000FF2: 14445,
+    0x000FF1: 14446,
+    0x000FF3: 14447,
+    0x000FA6: 14448,
+    0x000FAA: 14449,
+    0x000FA8: 14450,
+    0x000F9D: 12385,
+    0x001101: 14451,
+    0x000FFF: 14452,
+    0x001113: 14453,
+    0x001112: 14454,
+    0x000FBD: 1861,
+    0x000FB4: 14455,
+    0x001137: 14456,
+    0x001128: 14457,
+    0x000FCB: 2510,
+    0x000FC5: 14458,
+    0x000FBF: 14459,
+    0x000FE3: 14460,
+    0x000FD5: 14461,
+    0x000FE0: 14462,
+    0x000F6B: 14463,
+    0x000F67: 14464,
+    0x000F6E: 14465,
+    0x000F6F: 14466,
+    0x000F63: 14467,
+    0x000F21: 14468,
+    0x000F11: 14469,
+    0x000F13: 14470,
+    0x000F14: 14471,
+    0x000F89: 14472,
+    0x000F65: 14473,
+    0x000F5D: 14474,
+    0x000F58: 14475,
+    0x000F46: 14476,
+    0x000F41: 14477,
+    0x000F71: 14478,
+    0x000F92: 14479,
+    0x000F4D: 14480,
+    0x000EB6: 1077,
+    0x000EB7: 14481,
+    0x000EB1: 14482,
+    0x000EB4: 14483,
+    0x000EA9: 14484,
+    0x000EFB: 14485,
+    0x000EFA: 14486,
+    0x000EFD: 14487,
+    0x000EF5: 14488,
+    0x000ECD: 14489,
+    0x000ECA: 14490,
+    0x000ECC: 14491,
+    0x000ED5: 14492,
+    0x000EC8: 14493,
+    0x000ECB: 14494,
+    0x000ED2: 14495,
+    0x000ED9: 14496,
+    0x000EC2: 14497,
+    0x000F09: 13,
+    0x000EA2: 14498,
+    0x000E9B: 11244,
+    0x000F12: 8772,
+    0x000F0E: 14499,
+    0x000F0C: 14500,
+    0x000F0B: 14501,
+    0x000EA3: 14502,
+    0x000EDD: 8316,
+    0x000EDC: 14503,
+    0x000E23: 14504,
+    0x000E25: 14505,
+    0x000E20: 14506,
+    0x000E21: 14507,
+    0x000E22: 13,
+    0x000E1C: 14508,
+    0x000E7D: 14509,
+    0x000E78: 14510,
+    0x000E71: 14511,
+    0x000E70: 14512,
+    0x000E37: 14513,
+    0x000E31: 14514,
+    0x000E2F: 14515,
+    0x000E2C: 14516,
+    0x000E4A: 14517,
+    0x000E41: 14518,
+    0x000E3C: 14519,
+    0x000E63: 14520,
+    0x000E5B: 14521,
+    0x000E60: 14522,
+    0x000E09: 14523,
+    0x000E05: 14524,
+    0x000E93: 14525,
+    0x000E8D: 14526,
+    0x000E54: 14527,
+    0x000E4E: 14528,
+    0x000E76: 14529,
+    0x000DE0: 14530,
+    0x000DE3: 14531,
+    0x000DD4: 14532,
+    0x000DD2: 14533,
+    0x000DD1: 14534,
+    0x000DD7: 14535,
+    0x000DBE: 14536,
+    0x000DBC: 4,
+    0x000DEA: 14537,
+    0x000DED: 4,
+    0x000DE4: 14538,
+    0x000DDC: 14539,
+    0x000DD9: 14540,
+    0x000DC9: 14541,
+    0x000D9F: 14542,
+    0x000DA5: 14543,
+    0x000DC5: 14544,
+    0x000DC8: 14545,
+    0x000E02: 14546,
+    0x000D89: 14547,
+    0x000D86: 14548,
+    0x000D81: 14549,
+    0x000D7A: 14550,
+    0x000D77: 14551,
+    0x000D76: 14552,
+    0x000D14: 14553,
+    0x000D17: 14554,
+    0x000D18: 14555,
+    0x000D20: 14556,
+    0x000D6F: 14557,
+    0x000D5E: 14558,
+    0x000D5B: 14559,
+    0x000D59: 14560,
+    0x000D50: 14561,
+    0x000D25: 14562,
+    0x000D24: 14563,
+    0x000D22: 14564,
+    0x000D99: 14565,
+    0x000D8F: 14566,
+    0x000D49: 14567,
+    0x000D48: 14568,
+    0x000D3F: 14569,
+    0x000D3A: 14570,
+    0x000D30: 14571,
+    0x000D31: 14572,
+    0x000D7B: 14573,
+    0x000D6C: 14574,
+    0x000D70: 14575,
+    0x000CE3: 14576,
+    0x000CE7: 14577,
+    0x000CE4: 14578,
+    0x000CE8: 14579,
+    0x000C34: 14580,
+    0x000CB1: 14581,
+    0x000CBC: 14582,
+    0x000CCA: 14583,
+    0x000CB5: 14584,
+    0x000CB6: 14585,
+    0x000CC3: 14586,
+    0x000CD0: 14587,
+    0x000CD9: 14588,
+    0x000CD5: 14589,
+    0x000CD2: 14590,
+    0x000D04: 14591,
+    0x000D05: 14592,
+    0x000D08: 14593,
+    0x000CFE: 14594,
+    0x000D0E: 14595,
+    0x000D11: 14596,
+    0x000CB4: 14597,
+    0x000A07: 14598,
+    0x000CB0: 14599,
+    0x000C96: 14600,
+    0x000C98: 14601,
+    0x000C8E: 14602,
+    0x000CA2: 14603,
+    0x000CA4: 14604,
+    0x000C24: 14605,
+    0x000C19: 14606,
+    0x000C1D: 14607,
+    0x000C13: 14608,
+    0x000C2D: 14609,
+    0x000C26: 14610,
+    0x000C2B: 14611,
+    0x000C1A: 14612,
+    0x000C65: 14613,
+    0x000C6F: 14614,
+    0x000C6C: 14615,
+    0x000C73: 14616,
+    0x000C7E: 14617,
+    0x000C87: 14618,
+    0x000C83: 14619,
+    0x000C5B: 14620,
+    0x000C60: 14621,
+    0x000C32: 14622,
+    0x000C33: 14623,
+    0x000C36: 14624,
+    0x000C58: 14625,
+    0x000C51: 14626,
+    0x000C39: 14627,
+    0x000BF6: 14628,
+    0x000C01: 14629,
+    0x000BFD: 4,
+    0x000BF4: 13,
+    0x000BFA: 14630,
+    0x000BFB: 14631,
+    0x000BA9: 14632,
+    0x000BA1: 14633,
+    0x000BA6: 14634,
+    0x000B93: 14635,
+    0x000B9B: 14636,
+    0x000BF0: 14637,
+    0x000BF1: 14638,
+    0x000BEE: 14639,
+    0x000BE2: 14640,
+    0x000C08: 14641,
+    0x000C0D: 14642,
+    0x000C04: 14643,
+    0x000BCE: 14644,
+    0x000BCF: 14645,
+    0x000BC3: 14646,
+    0x000BBE: 4,
+    0x000B8E: 14647,
+    0x000B8F: 14648,
+    0x000BCB: 14649,
+    0x000BC8: 14650,
+    0x000BE1: 14651,
+    0x000BE0: 14652,
+    0x000BBD: 14653,
+    0x000BA8: 14654,
+    0x000B16: 5099,
+    0x000B12: 14655,
+    0x000B0F: 14656,
+    0x000B0C: 14657,
+    0x000B0A: 14658,
+    0x000B09: 14659,
+    0x000B8D: 14660,
+    0x000B7F: 14661,
+    0x000B85: 4,
+    0x000B81: 14662,
+    0x000B4E: 14234,
+    0x000B4D: 14663,
+    0x000B40: 14664,
+    0x000B44: 14665,
+    0x000B42: 14666,
+    0x000B47: 14667,
+    0x000B3D: 14668,
+    0x000B24: 14669,
+    0x000B1D: 14670,
+    0x000B19: 14671,
+    0x000B82: 8635,
+    0x000B6E: 14672,
+    0x000B72: 14673,
+    0x000B78: 14674,
+    0x000B6C: 14675,
+    0x0091D6: 12692,
+    0x000B31: 14676,
+    0x000B2F: 14677,
+    0x000B5A: 14678,
+    0x000A98: 14679,
+    0x000A9B: 14680,
+    0x000AC5: 14681,
+    0x000ABD: 14682,
+    0x000AB0: 14683,
+    0x000AB5: 14684,
+    0x000AFD: 14685,
+    0x000AEF: 14686,
+    0x000AE5: 14687,
+    0x000A84: 14688,
+    0x000A7E: 14689,
+    0x000A78: 14690,
+    0x000AFE: 14691,
+    0x000AA5: 14692,
+    0x000AA9: 14693,
+    0x000ACB: 14694,
+    0x000AD5: 14695,
+    0x000AD6: 14696,
+    0x000AD2: 14697,
+    0x000AA2: 14698,
+    0x000A91: 14699,
+    0x000A6C: 14700,
+    0x000A6B: 14701,
+    0x000A5F: 14702,
+    0x000A61: 14703,
+    0x000A5B: 14704,
+    0x000A3A: 14705,
+    0x000A47: 14706,
+    0x000A44: 14707,
+    0x000A3C: 14708,
+    0x000A40: 14709,
+    0x000A7B: 14710,
+    0x000A73: 2729,
+    0x000A69: 14711,
+    0x0009EB: 14712,
+    0x0009E8: 4,
+    0x0009E9: 4,
+    0x0009ED: 14713,
+    0x0009F2: 14714,
+    0x000A26: 14715,
+    0x000A29: 14716,
+    0x000A1D: 14717,
+    0x000A16: 14718,
+    0x000A18: 14719,
+    0x0009F8: 14720,
+    0x0009FF: 14721,
+    0x000A03: 14722,
+    0x0009FE: 14723,
+    0x000A28: 14724,
+    0x000A55: 14725,
+    0x000A4C: 14726,
+    0x000A4D: 14727,
+    0x000A06: 14728,
+    0x000A0D: 13475,
+    0x0009A2: 14729,
+    0x0009A1: 14730,
+    0x000976: 14731,
+    0x00097A: 14732,
+    0x00096B: 2034,
+    0x00096D: 14733,
+    0x000964: 14734,
+    0x000965: 14735,
+    0x000982: 14736,
+    0x000983: 14737,
+    0x00097D: 14738,
+    0x0009AF: 14739,
+    0x0009AD: 14740,
+    0x0009A9: 14741,
+    0x00099F: 14742,
+    0x0009C2: 14743,
+    0x0009C3: 14744,
+    0x0009B5: 14745,
+    0x0009B8: 14746,
+    0x0009DC: 14747,
+    0x0009DD: 14748,
+    0x0009C6: 14749,
+    0x0009D1: 14750,
+    0x0009CE: 14751,
+    0x0009BD: 14752,
+    0x00096F: 14753,
+    0x00095E: 14754,
+    0x000939: 14755,
+    0x000933: 14756,
+    0x000932: 14757,
+    0x00091C: 14758,
+    0x00091A: 14759,
+    0x00091B: 14760,
+    0x000959: 14761,
+    0x000957: 14762,
+    0x00094F: 14763,
+    0x0008F2: 14764,
+    0x0008EA: 14765,
+    0x000902: 14766,
+    0x0008FA: 14767,
+    0x000929: 14768,
+    0x000928: 14769,
+    0x0008ED: 14770,
+    0x000943: 4,
+    0x000872: 14771,
+    0x00087C: 4,
+    0x000879: 14772,
+    0x00087D: 4,
+    0x000875: 14773,
+    0x00086F: 14774,
+    0x0008DF: 14775,
+    0x0008DB: 14776,
+    0x0008D8: 14777,
+    0x0008D2: 14778,
+    0x0008B6: 14779,
+    0x0008B0: 14780,
+    0x0008AC: 14781,
+    0x0008A1: 14782,
+    0x000893: 14783,
+    0x000888: 14784,
+    0x000885: 14785,
+    0x0008C5: 14786,
+    0x0008CA: 14787,
+    0x0008AA: 14788,
+    0x0008AB: 14789,
+    0x0008AD: 14790,
+    0x00089A: 14791,
+    0x000826: 14792,
+    0x00081C: 14793,
+    0x000867: 14794,
+    0x00085E: 14795,
+    0x000856: 14796,
+    0x000853: 14797,
+    0x0007A3: 14798,
+    0x00079A: 14799,
+    0x000774: 14800,
+    0x000798: 14801,
+    0x000791: 14802,
+    0x0005F9: 14803,
+    0x0007CA: 14804,
+    0x0007C5: 14805,
+    0x0007C8: 14806,
+    0x0007C1: 14807,
+    0x0007AE: 14808,
+    0x0007B1: 14809,
+    0x0007A7: 14810,
+    0x0007A6: 14811,
+    0x0007F3: 14812,
+    0x0007EE: 14813,
+    0x0007E2: 14814,
+    0x0007E6: 14815,
+    0x000816: 14816,
+    0x000811: 14817,
+    0x000806: 14818,
+    0x0007E5: 14819,
+    0x0007DE: 14820,
+    0x0007DF: 14821,
+    0x0007C2: 14822,
+    0x00078F: 14823,
+    0x000782: 4606,
+    0x0007F8: 14824,
+    0x0006F2: 14825,
+    0x0006FA: 14826,
+    0x000703: 14827,
+    0x000706: 14828,
+    0x0006EF: 14829,
+    0x0006E9: 14830,
+    0x000760: 14831,
+    0x00074E: 14832,
+    0x000752: 14833,
+    0x00074F: 4,
+    0x000707: 14834,
+    0x0006F0: 14835,
+    0x000700: 14836,
+    0x000743: 14837,
+    0x000747: 14838,
+    0x000744: 14839,
+    0x000749: 14840,
+    0x000730: 14841,
+    0x000722: 14842,
+    0x00071F: 14843,
+    0x000721: 14844,
+    0x000739: 14845,
+    0x00073D: 14846,
+    0x000735: 14847,
+    0x000786: 14848,
+    0x000779: 14849,
+    0x00077E: 14850,
+    0x000778: 14851,
+    0x000708: 14852,
+    0x000712: 14853,
+    0x000713: 14854,
+    0x00076D: 14855,
+    0x00075E: 14856,
+    0x0006BC: 14857,
+    0x0006C2: 14858,
+    0x000654: 14859,
+    0x0006B4: 14860,
+    0x0006AE: 14861,
+    0x0006B0: 14862,
+    0x0006CA: 14863,
+    0x0006CE: 14864,
+    0x0006C5: 14865,
+    0x0006C6: 14866,
+    0x0006B7: 14867,
+    0x0006EA: 14868,
+    0x0006E5: 14869,
+    0x0006DE: 14870,
+    0x0006DF: 14871,
+    0x00068E: 14872,
+    0x00068A: 14873,
+    0x000685: 14874,
+    0x00067F: 14835,
+    0x000683: 14875,
+    0x000655: 14876,
+    0x00067A: 14877,
+    0x000673: 14878,
+    0x000676: 14879,
+    0x000664: 14880,
+    0x0006DD: 14881,
+    0x0006D1: 14882,
+    0x0006D4: 14883,
+    0x00069B: 14884,
+    0x000693: 14885,
+    0x000696: 14886,
+    0x00065D: 14887,
+    0x000650: 14888,
+    0x00065E: 14889,
+    0x0005D7: 14890,
+    0x0005DB: 14891,
+    0x0005DD: 4,
+    0x0005D9: 14892,
+    0x0005DC: 4,
+    0x0005C3: 14893,
+    0x0005B9: 14894,
+    0x0005BC: 14895,
+    0x0005BE: 14896,
+    0x0005BD: 14897,
+    0x0005C1: 14898,
+    0x0005B6: 14899,
+    0x000644: 14900,
+    0x000645: 14901,
+    0x000640: 14902,
+    0x00063A: 14903,
+    0x000628: 4,
+    0x00061D: 14904,
+    0x000619: 14905,
+    0x000632: 14906,
+    0x000634: 14907,
+    0x000608: 14908,
+    0x0005F6: 14909,
+    0x0005FC: 14910,
+    0x0005E8: 14911,
+    0xA06A00: 3947,
+    0x0005F8: 14912,
+    0x0005EB: 14913,
+    0x00060C: 14914,
+    0x00060E: 14915,
+    0x000614: 14916,
+    0x0005D0: 14917,
+    0x000580: 14918,
+    0x000582: 14919,
+    0x000578: 13,
+    0x000572: 14920,
+    0x000576: 14921,
+    0x00054A: 14922,
+    0x000548: 14923,
+    0x00053E: 14924,
+    0x00053F: 14925,
+    0x0005B4: 14926,
+    0x000598: 14927,
+    0x0005B7: 14928,
+    0x00059B: 4,
+    0x000590: 14929,
+    0x000595: 14930,
+    0x000562: 14931,
+    0x000555: 14932,
+    0x000552: 14933,
+    0x00059F: 14934,
+    0x000587: 14935,
+    0x00053D: 3522,
+    0x000535: 14936,
+    0x000527: 14937,
+    0x000529: 14938,
+    0x00056A: 14939,
+    0x000568: 14940,
+    0x0004DA: 14941,
+    0x0004E5: 14942,
+    0x0004D2: 14943,
+    0x0004D3: 14944,
+    0x0004D5: 14945,
+    0x0004CA: 14946,
+    0x00050D: 14947,
+    0x000500: 4,
+    0x0004FD: 14948,
+    0x0004F7: 14949,
+    0x0004EE: 14950,
+    0x0004F0: 1100,
+    0x0004C5: 14951,
+    0x00052C: 14952,
+    0x000519: 14953,
+    0x000507: 14954,
+    0x0004B0: 14955,
+    0x0004AB: 14956,
+    0x0004A7: 14957,
+    0x0004AA: 14958,
+    0x0004A0: 14959,
+    0x00049E: 14960,
+    0x00049A: 4,
+    0x000447: 14961,
+    0x00043E: 14962,
+    0x000436: 14963,
+    0x000435: 280,
+    0x000432: 14964,
+    0x000437: 14965,
+    0x000414: 14966,
+    0x00040C: 14967,
+    0x000408: 14968,
+    0x000409: 14969,
+    0x000407: 14970,
+    0x000455: 14971,
+    0x000488: 14972,
+    0x000485: 14973,
+    0x000479: 14974,
+    0x000457: 14975,
+    0x00044D: 4,
+    0x000454: 14976,
+    0x000448: 14977,
+    0x000498: 14978,
+    0x000497: 14979,
+    0x00046D: 4,
+    0x000466: 14980,
+    0x000428: 4,
+    0x0003D3: 14981,
+    0x0003CD: 14982,
+    0x0003CC: 14983,
+    0x00037D: 14984,
+    0x000383: 14985,
+    0x000379: 14986,
+    0x00038B: 14987,
+    0x00038C: 14988,
+    0x000386: 14989,
+    0x0003E6: 14990,
+    0x0003D7: 14991,
+    0x0003EE: 14992,
+    0x0003EA: 14993,
+    0x0003B5: 14994,
+    0x00039F: 4,
+    0x000390: 14995,
+    0x0003E2: 14996,
+    0x0003FF: 157,
+    0x0003A9: 14997,
+    0x000366: 14998,
+    0x000362: 14999,
+    0x000364: 15000,
+    0x00035E: 15001,
+    0x00035C: 15002,
+    0x00035D: 15003,
+    0x000341: 15004,
+    0x008037: 15005,
+    0x00033D: 15006,
+    0x000334: 15007,
+    0x00033A: 15008,
+    0x0002E8: 15009,
+    0x0002D9: 15010,
+    0x00030E: 15011,
+    0x000312: 15012,
+    0x0002F2: 15013,
+    0x0002EF: 15014,
+    0x000332: 4,
+    0x000326: 15015,
+    0x00036F: 15016,
+    0x000372: 15017,
+    0x00034D: 15018,
+    0x000322: 15019,
+    0x00031D: 15020,
+    0x00025D: 15021,
+    0x000257: 15022,
+    0x000253: 15023,
+    0x00024A: 4,
+    0x000249: 15024,
+    0x000245: 15025,
+    0x000246: 15026,
+    0x000290: 15027,
+    0x000292: 15028,
+    0x000286: 15029,
+    0x001095: 6084,
+    0x00027B: 15030,
+    0x000273: 15031,
+    0x0002B4: 15032,
+    0x0002B0: 15033,
+    0x0002AA: 15034,
+    0x00029D: 15035,
+    0x0002D2: 15036,
+    0x0002CD: 15037,
+    0x0002D0: 15038,
+    0x0002CC: 15039,
+    0x00026F: 15040,
+    0x0002C5: 15041,
+    0x0002B5: 15042,
+    0x00027E: 4,
+    0x00027F: 15043,
+    0x00023A: 15044,
+    0x000232: 15045,
+    0x000235: 15046,
+    0x000237: 15047,
+    0x000228: 15048,
+    0x0001AC: 15049,
+    0x0001AD: 15050,
+    0x00019B: 15051,
+    0x000230: 15052,
+    0x00021C: 15053,
+    0x00020C: 15054,
+    0x000216: 4,
+    0x000214: 15055,
+    0x00020F: 15056,
+    0x0001C3: 15057,
+    0x0001C2: 15058,
+    0x0001ED: 15059,
+    0x0001EA: 15060,
+    0x0001E0: 15061,
+    0x0001D6: 15062,
+    0x0001F6: 15063,
+    0x0001CB: 15064,
+    0x00013A: 15065,
+    0x000140: 15066,
+    0x000123: 15067,
+    0x000125: 15068,
+    0x000126: 15069,
+    0x00011B: 15070,
+    0x000171: 15071,
+    0x000176: 15072,
+    0x000158: 15073,
+    0x0030AC: 15074,
+    0x00015A: 15075,
+    0x00011D: 15076,
+    0x00011F: 15077,
+    0x00012A: 15078,
+    0x00012D: 15079,
+    0x000148: 15080,
+    0x000188: 15081,
+    0x00017F: 15082,
+    0x000187: 15083,
+    0x00019A: 15084,
+    0x000197: 4,
+    0x000159: 15085,
+    0x000166: 15086,
+    0x000180: 15087,
+    0x00B09A: 15088,
+    0x0030A9: 15089,
+    0x0030FE: 15090,
+    0x0030C4: 15091,
+    0x00304D: 15092,
+    0x00302E: 15093,
+    0x0030ED: 15094,
+    0x00300F: 15095,
+    0x003082: 15096,
+    0x0030FB: 15097,
+    0x003003: 15098,
+    0x0030AE: 15099,
+    0x0030E2: 15100,
+    0x0030D5: 15101,
+    0x003018: 15102,
+    0x003089: 15103,
+    0x00B080: 15104,
+    0x00B01E: 15105,
+    0x00B0F0: 15106,
+    0x003090: 15107,
+    0x0030A7: 15108,
+    0x003023: 15109,
+    0x00307C: 15110,
+    0x00309A: 15111,
+    0x00309F: 15112,
+    0x0030A8: 15113,
+    0x0030D1: 15114,
+    0x081443: 15115,
+    0x00B009: 3598,
+    0x00B0AC: 15116,
+    0x003055: 15117,
+    0x00302F: 15118,
+    0x00300E: 15119,
+    0x0030BB: 15120,
+    0x00302D: 15121,
+    0x0030CB: 15122,
+    0x00306B: 15123,
+    0x0030AD: 15124,
+    0x00D0CF: 15125,
+    0x00D07F: 15126,
+    0x003036: 15127,
+    0x003035: 15128,
+    0x00307F: 15129,
+    0x0030E6: 15130,
+    0x003062: 15131,
+    0x00D085: 15132,
+    0x00D0E9: 15133,
+    0x00D015: 15134,
+    0x00D0A5: 15135,
+    0x00D048: 15136,
+    0x0030BD: 15137,
+    0x0030CF: 15138,
+    0x0030B2: 15139,
+    0x00305D: 15140,
+    0x003087: 15141,
+    0x0030AA: 15142,
+    0x003007: 15143,
+    0x00D022: 15144,
+    0x00D071: 15145,
+    0x00D04F: 15146,
+    0x00D0FB: 15147,
+    0x00D066: 15148,
+    0x00D082: 15149,
+    0x00D09C: 15150,
+    0x00D0F3: 15151,
+    0x00D039: 15152,
+    0x00D067: 15153,
+    0x00D058: 4,
+    0x00D03D: 15154,
+    0x00D032: 15155,
+    0x00D0F1: 15156,
+    0x00D090: 4,
+    0x00D0F5: 15157,
+    0x00D078: 15158,
+    0x00D0C2: 15159,
+    0x00D081: 15160,
+    0x00D002: 15161,
+    0x00D09B: 15162,
+    0x00D041: 15163,
+    0x00D09D: 15164,
+    0x00D094: 15165,
+    0x00D069: 12408,
+    0x00D011: 15166,
+    0x00D0DF: 15167,
+    0x00D062: 15168,
+    0x00D08D: 15169,
+    0x00D04C: 15170,
+    0x00D0D9: 15171,
+    0x00D0E1: 15172,
+    0x00D008: 15173,
+    0x00D00B: 15174,
+    0x00D0A0: 15175,
+    0x00D00A: 15176,
+    0x00D01C: 15177,
+    0x00D0D5: 15178,
+    0x005046: 15179,
+    0x0050B0: 15180,
+    0x005041: 15181,
+    0x0050DD: 15182,
+    0x005067: 15183,
+    0x0050B6: 15184,
+    0x00504B: 15185,
+    0x00D03A: 15186,
+    0x00D001: 15187,
+    0x005020: 15188,
+    0x00D075: 15189,
+    0x0050E7: 15190,
+    0x0050FB: 15191,
+    0x0050A5: 15192,
+    0x005000: 15193,
+    0x0050C8: 15194,
+    0x005089: 15195,
+    0x005066: 15196,
+    0x005059: 15197,
+    0x0050D9: 15198,
+    0x0050F4: 15199,
+    0x005021: 15200,
+    0x00505E: 15201,
+    0x005090: 15202,
+    0x00503B: 15203,
+    0x0050EA: 15204,
+    0x0050E8: 15205,
+    0x0050AE: 15206,
+    0x00D06D: 15207,
+    0x00D02B: 15208,
+    0x00503E: 4,
+    0x0050C6: 15209,
+    0x00509F: 15210,
+    0x005063: 15211,
+    0x00508D: 15212,
+    0x0050A0: 15213,
+    0x005086: 15214,
+    0x00501A: 15215,
+    0x00508F: 15216,
+    0x005015: 15217,
+    0x005057: 15218,
+    0x005088: 15219,
+    0x005031: 15220,
+    0x00907B: 15221,
+    0x009081: 15222,
+    0x00901C: 15223,
+    0x0090DB: 15224,
+    0x009056: 15225,
+    0x009034: 15226,
+    0x009073: 15227,
+    0x00905E: 15228,
+    0x0090AF: 15229,
+    0x0090BB: 15230,
+    0x005003: 15231,
+    0x0050D3: 15232,
+    0x0050AD: 15233,
+    0x0050AF: 15234,
+    0x009068: 15235,
+    0x0090E5: 15236,
+    0x0090F4: 15237,
+    0x009074: 15238,
+    0x00903B: 15239,
+    0x00909F: 15240,
+    0x009019: 15241,
+    0x009005: 15242,
+    0x0090F8: 15243,
+    0x009010: 15244,
+    0x0090C6: 15245,
+    0x00902E: 15246,
+    0x00908F: 15247,
+    0x009059: 15248,
+    0x0090CA: 15249,
+    0x0090E9: 15250,
+    0x009037: 15251,
+    0x009078: 15252,
+    0x0090AA: 15253,
+    0x00905B: 15254,
+    0x0090BC: 15255,
+    0x00900A: 15256,
+    0x009090: 15257,
+    0x00901A: 15258,
+    0x0090B5: 8962,
+    0x0090EB: 15259,
+    0x0090FE: 15260,
+    0x0090D5: 15261,
+    0x00904A: 15262,
+    0x001047: 15263,
+    0x00903F: 256,
+    0x0090B8: 15264,
+    0x0090D8: 15265,
+    0x0010FD: 15266,
+    0x0010C9: 15267,
+    0x000400: 617,
+    0x0010C5: 15268,
+    0x00101A: 15269,
+    0x0010BA: 15270,
+    0x0010C2: 15271,
+    0x001040: 15272,
+    0x00102E: 15273,
+    0x001046: 15274,
+    0x0010B7: 15275,
+    0x001028: 15276,
+    0x00102C: 15277,
+    0x0010A5: 15278,
+    0x0010D7: 15279,
+    0x001092: 15280,
+    0x00101C: 15281,
+    0x001067: 3584,
+    0x001021: 15282,
+    0x001064: 15283,
+    0x00109E: 15284,
+    0x001005: 15285,
+    0x0010B8: 15286,
+    0x00108B: 15287,
+    0x0010C7: 15288,
+    0x001074: 15289,
+    0x001070: 15290,
+    0x001043: 15291,
+    0x00104E: 15292,
+    0x0010B0: 15293,
+    0x0004AC: 2034,
+    0x0010B4: 15294,
+    0x00E08C: 15295,
+    0x00E028: 15296,
+    0x00E0A1: 15297,
+    0x00E088: 15298,
+    0x00E03D: 15299,
+    0x00E046: 15300,
+    0x00E058: 15301,
+    0x00E076: 15302,
+    0x00E07D: 15303,
+    0x00E05D: 15304,
+    0x00E05E: 15305,
+    0x00E09D: 15306,
+    0x00E0F2: 15307,
+    0x00E0E1: 15308,
+    0x00E08D: 15309,
+    0x00E0FF: 15310,
+    0x00E0AB: 15311,
+    0x00E030: 15312,
+    0x00E0AA: 15313,
+    0x00E010: 15314,
+    0x006049: 15315,
+    0x00608D: 15316,
+    0x006099: 3883,
+    0x0060B3: 15317,
+    0x006002: 15318,
+    0x00E033: 15319,
+    0x00E0A2: 15320,
+    0x00E079: 15321,
+    0x00E075: 3947,
+    0x00E02E: 15322,
+    0x00E0D2: 15323,
+    0x00E047: 15324,
+    0x00E0C3: 15325,
+    0x00E092: 15326,
+    0x00E03E: 15327,
+    0x00E09A: 15328,
+    0x00E019: 15329,
+    0x00E07B: 15330,
+    0x00E01D: 15331,
+    0x006089: 15332,
+    0x006021: 15333,
+    0x0060B8: 15334,
+    0x006039: 15335,
+    0x00E0F8: 15336,
+    0x00606D: 15337,
+    0x0060CE: 15338,
+    0x0060B9: 15339,
+    0x006036: 15340,
+    0x00608E: 15341,
+    0x00606A: 15342,
+    0x00601A: 15343,
+    0x0060AD: 15344,
+    0x006055: 15345,
+    0x00609C: 15346,
+    0x0060CF: 15347,
+    0x006075: 15348,
+    0x0060B7: 15349,
+    0x006006: 15350,
+    0x0060BA: 15351,
+    0x006098: 15352,
+    0x0060CA: 15353,
+    0x006024: 15354,
+    0x0060DE: 15355,
+    0x0060D0: 15356,
+    0x0060AF: 15357,
+    0x006038: 1034,
+    0x006015: 15358,
+    0x00604F: 3703,
+    0x0060E8: 15359,
+    0x0060F6: 15360,
+    0x006072: 15361,
+    0x006051: 15362,
+    0x006092: 15363,
+    0x00609E: 15364,
+    0x006010: 15365,
+    0x006044: 15366,
+    0x0060A2: 15367,
+    0x00609D: 15368,
+    0x006084: 15369,
+    0x00602D: 15370,
+    0x0060F8: 15371,
+    0x006078: 15372,
+    0x006004: 15373,
+    0x0060B4: 15374,
+    0x00A01D: 11588,
+    0x00A0B9: 15375,
+    0x00A019: 15376,
+    0x00A0ED: 15377,
+    0x00A0A0: 15378,
+    0x00A013: 15379,
+    0x00A0A6: 15380,
+    0x00A051: 15381,
+    0x00A038: 15382,
+    0x00A077: 15383,
+    0x00A042: 15384,
+    0x00A0C1: 15385,
+    0x00A04F: 15386,
+    0x00A0CF: 15387,
+    0x00A072: 15388,
+    0x00A082: 15389,
+    0x00A0F0: 15390,
+    0x00A0D7: 15391,
+    0x00A0F1: 15392,
+    0x00A0FF: 15393,
+    0x00A0E5: 15394,
+    0x00A036: 15395,
+    0x00A0D2: 15396,
+    0x00A0D3: 15397,
+    0x00A0B4: 15398,
+    0x00A065: 14532,
+    0x00A0A3: 15399,
+    0x00A055: 15400,
+    0x00A05B: 15401,
+    0x00A08C: 15402,
+    0x00A029: 15403,
+    0x00A0AA: 15404,
+    0x00A03B: 15405,
+    0x00A0F3: 15406,
+    0x00A060: 15407,
+    0x00A083: 15408,
+    0x00A004: 15409,
+    0x00A087: 15410,
+    0x00A043: 15411,
+    0x00A0D0: 15412,
+    0x00A0BC: 11991,
+    0x00A074: 15413,
+    0x00A07F: 15414,
+    0x00A09B: 8913,
+    0x00A000: 15415,
+    0x00A08A: 15416,
+    0x00A07B: 15417,
+    0x00A05C: 15418,
+    0x00200F: 15419,
+    0x0020DF: 15420,
+    0x002092: 15421,
+    0x00202B: 15422,
+    0x00206B: 3658,
+    0x002004: 15423,
+    0x0020E5: 15424,
+    0x002043: 15425,
+    0x002071: 15426,
+    0x002087: 11763,
+    0x0020F9: 15427,
+    0x002015: 15428,
+    0x002099: 15429,
+    0x00207C: 15430,
+    0x002057: 15431,
+    0x0020BC: 15432,
+    0x0020C7: 15433,
+    0x0020EE: 15434,
+    0x00204C: 15435,
+    0x002017: 15436,
+    0x002093: 15437,
+    0x002063: 15438,
+    0x002056: 15439,
+    0x002042: 15440,
+    0x002078: 15441,
+    0x00C0F3: 15442,
+    0x00C0C0: 15443,
+    0x00C00C: 15444,
+    0x00C073: 15445,
+    0x00C0D4: 15446,
+    0x002024: 15447,
+    0x0020D1: 15448,
+    0x0020CE: 15449,
+    0x002014: 15450,
+    0x0020C2: 15451,
+    0x0020ED: 15452,
+    0x002085: 15453,
+    0x0020CD: 15454,
+    0x00202E: 15455,
+    0x0020B3: 3703,
+    0x002016: 15456,
+    0x00204D: 15457,
+    0x00205F: 15458,
+    0x00201F: 15459,
+    0x0020B6: 15460,
+    0x002029: 15461,
+    0x002069: 15462,
+    0x00208B: 15463,
+    0x002006: 15464,
+    0x00C0CD: 15465,
+    0x00205D: 15466,
+    0x00C04C: 15467,
+    0x00C07C: 15468,
+    0x00C0B8: 15469,
+    0x00C062: 15470,
+    0x00C0EC: 15471,
+    0x00C016: 15472,
+    0x00C086: 15473,
+    0x00C013: 15474,
+    0x00C058: 15475,
+    0x00C0D0: 15476,
+    0x00C0BF: 15477,
+    0x00C0BA: 15478,
+    0x00C05E: 15479,
+    0x00C0D5: 15480,
+    0x00C063: 15481,
+    0x00C021: 15482,
+    0x00C0C1: 15483,
+    0x00C089: 15484,
+    0x00C067: 15485,
+    0x00C0A3: 15486,
+    0x00C018: 15487,
+    0x00C077: 15488,
+    0x00C0C8: 15489,
+    0x00C069: 3724,
+    0x00C090: 15490,
+    0x00C0DE: 15491,
+    0x00C0DB: 15492,
+    0x00C09B: 15493,
+    0x00C06B: 15494,
+    0x009D8E: 1139,
+    0x00BB01: 15495,
+    0x00C005: 15496,
+    0x00C033: 15497,
+    0x00C0BC: 15498,
+    0x00C00A: 15499,
+    0x00C074: 15500,
+    0x00C06C: 15501,
+    0x0040FF: 15502,
+    0x00401F: 15503,
+    0x0040AF: 15504,
+    0x0040F7: 14977,
+    0x004037: 15505,
+    0x00404E: 15506,
+    0x00408D: 15507,
+    0x00C026: 15508,
+    0x004046: 15509,
+    0x00404A: 15510,
+    0x00403C: 15511,
+    0x004042: 15512,
+    0x0040F2: 15513,
+    0x0040A2: 15514,
+    0x00C06F: 12135,
+    0x00C0A7: 15515,
+    0x00401B: 1041,
+    0x0040A3: 15516,
+    0x0040B3: 15517,
+    0x00C0E3: 15518,
+    0x00C0FE: 15519,
+    0x00407E: 15520,
+    0x00403E: 15521,
+    0x00401D: 15522,
+    0x0040F9: 15523,
+    0x00C0B0: 15524,
+    0x00C0CA: 15525,
+    0x00C04A: 15526,
+    0x0040DC: 15527,
+    0x004054: 15528,
+    0x004004: 15529,
+    0x004018: 15530,
+    0x00401A: 15531,
+    0x004080: 15532,
+    0x004030: 15533,
+    0x004040: 15534,
+    0x008057: 15535,
+    0x0080BB: 15536,
+    0x00C0D7: 15537,
+    0x004060: 15538,
+    0x004056: 15539,
+    0x00403D: 15540,
+    0x0040DA: 15541,
+    0x0040A6: 15542,
+    0x0040D0: 15543,
+    0x0040AB: 15544,
+    0x0040B6: 15545,
+    0x004067: 15546,
+    0x0040C3: 15547,
+    0x0040EC: 15548,
+    0x008072: 15549,
+    0x00802F: 15550,
+    0x008054: 15551,
+    0x008053: 15552,
+    0x008026: 15553,
+    0x0080B0: 15554,
+    0x0080FA: 15555,
+    0x0080FD: 15556,
+    0x0040EE: 15557,
+    0x004051: 15558,
+    0x00407A: 15559,
+    0x0080FE: 15560,
+    0x00803C: 15561,
+    0x008046: 3703,
+    0x004025: 15562,
+    0x0040C7: 15563,
+    0x004052: 15564,
+    0x00402E: 15565,
+    0x00402B: 15566,
+    0x004002: 15567,
+    0x004049: 15568,
+    0x004029: 15569,
+    0x004031: 15570,
+    0x0040D3: 15571,
+    0x008011: 15572,
+    0x0080F1: 15573,
+    0x008029: 15375,
+    0x004001: 15574,
+    0x004071: 15575,
+    0x008034: 15576,
+    0x00802C: 15577,
+    0x0080D6: 15578,
+    0x00800A: 15579,
+    0x008027: 15580,
+    0x0080FC: 15581,
+    0x0080E4: 15582,
+    0x0080EC: 15583,
+    0x0080A2: 15584,
+    0x0080A5: 15585,
+    0x008079: 15586,
+    0x0080AD: 15587,
+    0x00800E: 15588,
+    0x0080AB: 15589,
+    0x00804B: 15590,
+    0x0080C8: 11112,
+    0x008012: 15591,
+    0x0080CC: 15592,
+    0x000075: 1034,
+    0x0000ED: 15593,
+    0x0000A3: 15594,
+    0x000039: 15595,
+    0x00003C: 15596,
+    0x00007E: 15597,
+    0x0000CB: 15598,
+    0x0000A5: 3703,
+    0x000036: 15599,
+    0x0000F8: 4158,
+    0x00807B: 15600,
+    0x000044: 15601,
+    0x00805C: 15602,
+    0x0080C5: 15603,
+    0x008014: 15604,
+    0x00007F: 15605,
+    0x0000CE: 15606,
+    0x00007B: 15607,
+    0x0080F6: 15608,
+    0x008078: 15609,
+    0x000079: 15610,
+    0x000091: 15611,
+    0x00001A: 15612,
+    0x0080B7: 15613,
+    0x000096: 15614,
+    0x00005E: 15615,
+    0x000038: 15616,
+    0x00009E: 15617,
+    0x000042: 15618,
+    0x000013: 15619,
+    0x000095: 15620,
+    0x000057: 15621,
+    0x0000D6: 15622,
+    0x000040: 15623,
+    0x000085: 1131,
+    0x00004A: 4080,
+    0x000012: 15624,
+    0x000060: 12159,
+    0x08006F: 15625,
+    0x00006A: 15626,
+    0x00000F: 15627,
+    0x0000BB: 15628,
+    0x00007D: 2279,
+    0x00008A: 15629,
+    0x000032: 15630,
+    0x00005D: 15631,
+    0x08008F: 15632,
+    0x08007A: 15633,
+    0x080079: 15634,
+    0x080073: 15635,
+    0x080072: 15636,
+    0x08006A: 810,
+    0x080019: 15637,
+    0x027001: 7894,
+    0x08003E: 15638,
+    0x080040: 15639,
+    0x08003A: 15640,
+    0x08003D: 15641,
+    0x080038: 15642,
+    0x08002F: 15643,
+    0x080062: 15644,
+    0x08005C: 15645,
+    0x08005A: 2034,
+    0x08002C: 15646,
+    0x08004D: 15647,
+    0x08001E: 15648,
+    0x080052: 15649,
+    0x080001: 15650,
+    0x080005: 15651,
+    0x00003D: 15652,
+    0x000008: 4167,
+    0x00DD07: 4168,
+    0x00DD0D: 4168,
+    0x080016: 15653,
+    0x000006: 4167,
+    0x080064: 15654,
+    0x080002: 15655,
+    0x08001A: 15656,
+    0x08008B: 15657,
+    0x080012: 15658,
+    0x00000B: 15659,
+    0x00009B: 15660,
+    0x08000E: 15661,
+    0xEC9A34: 53,
+    0x943F0C: 821,
+    0x000002: 4167,
+    0x000003: 4167,
+    0x00DD09: 4168,
+    0x84BB26: 53,
+    0x58BAD3: 15662,
+    0x34B1EB: 49,
+    0xA4F841: 49,
+    0xFCA8E0: 813,
+    0xFC51B5: 15,
+    0xA05272: 49,
+    0x200484: 49,
+    0xF87D3F: 117,
+    0x90A57D: 117,
+    0xD0A0BB: 73,
+    0x909E24: 15663,
+    0x8C9B2D: 830,
+    0x284430: 4179,
+    0x604966: 15664,
+    0x9803CF: 664,
+    0x943251: 234,
+    0x606B5B: 587,
+    0xDCE5D8: 11,
+    0x68944A: 11,
+    0x7433E9: 11,
+    0x78EDBC: 71,
+    0x40C0EE: 15665,
+    0xFCC0CC: 15666,
+    0x48EB65: 15667,
+    0xC8A3E8: 195,
+    0x1C2156: 15668,
+    0x40B70E: 117,
+    0xD8D668: 220,
+    0x004CE5: 135,
+    0xC09120: 135,
+    0x4C50DD: 31,
+    0x407218: 4375,
+    0xA841F4: 43,
+    0xC4CB76: 157,
+    0x409EA4: 28,
+    0xBC4C78: 15,
+    0xD45F7A: 15,
+    0xA80556: 146,
+    0x9CB400: 11,
+    0xB05246: 175,
+    0xF00727: 15669,
+    0x886076: 15670,
+    0xF871A6: 49,
+    0x78A7C7: 49,
+    0x98FEE1: 49,
+    0x340962: 54,
+    0x2834FF: 49,
+    0xD0C050: 49,
+    0x0CD5D3: 4,
+    0x2C81BF: 49,
+    0x100648: 12,
+    0x000D2C: 4194,
+    0x14AE68: 15671,
+    0xC875F4: 29,
+    0x2C532B: 274,
+    0x849437: 49,
+    0x64FD29: 510,
+    0x44E4E6: 1,
+    0x742E4F: 15672,
+    0x5C836C: 272,
+    0x30169D: 12096,
+    0xEC462C: 444,
+    0x8C8881: 20,
+    0xD8B020: 278,
+    0xD4F32D: 25,
+    0x2C7BA0: 25,
+    0x704CA5: 41,
+    0x04D590: 41,
+    0x94F392: 41,
+    0x24D208: 15673,
+    0x1004C1: 15674,
+    0x5C5310: 4362,
+    0x34D262: 4200,
+    0x4C4CD8: 11,
+    0x5422E0: 262,
+    0xC40778: 21,
+    0xFC8AF7: 11,
+    0xC4509C: 11902,
+    0x7891E9: 212,
+    0xE85540: 8519,
+    0x54D60D: 516,
+    0x589671: 57,
+    0x8C1A50: 29,
+    0xD40068: 5,
+    0x38637F: 5,
+    0xC8FE0F: 664,
+    0x308ECF: 15,
+    0xD829F8: 15,
+    0x387605: 15675,
+    0x78392D: 12,
+    0xBCE001: 8117,
+    0xD03E07: 49,
+    0x50B127: 49,
+    0x70F6CF: 15676,
+    0xC81072: 15677,
+    0x249D2A: 15678,
+    0xE4E66C: 15679,
+    0x843E03: 3,
+    0x549A8F: 194,
+    0xA8EF5F: 194,
+    0xF010A5: 53,
+    0xC06380: 53,
+    0xF8FB90: 53,
+    0x446B1F: 53,
+    0x1CCE51: 43,
+    0x6833EE: 258,
+    0x0CA138: 15680,
+    0xC0252F: 4210,
+    0x10634B: 4210,
+    0x044BA5: 4210,
+    0xD48409: 4210,
+    0xE4F3F5: 4210,
+    0xC0A5DD: 4210,
+    0xD8EE42: 135,
+    0x28AF42: 90,
+    0xF4ED37: 15681,
+    0xBC026E: 238,
+    0xB43522: 238,
+    0x90395E: 238,
+    0xE8E07E: 238,
+    0xB0C7DE: 238,
+    0x881A14: 238,
+    0x44E2F8: 238,
+    0xE41226: 4280,
+    0x30FB68: 15682,
+    0x30A30F: 15,
+    0x246830: 15683,
+    0x308DD4: 15,
+    0x3C90E0: 15,
+    0x707362: 15,
+    0xB8DB38: 210,
+    0x74C64A: 15684,
+    0xE461F4: 4557,
+    0x109F47: 107,
+    0xE4379F: 4,
+    0x5464BC: 69,
+    0x0026A4: 15685,
+    0x24587C: 14,
+    0xCC8DA2: 14,
+    0xEC314A: 230,
+    0x04F4D8: 31,
+    0xD4ADFC: 15686,
+    0xE82725: 600,
+    0x9CC8E9: 77,
+    0x3CB43D: 15687,
+    0x547885: 15688,
+    0x606BB3: 11,
+    0xA0DD6C: 14,
+    0x000E2A: 15689,
+    0x74309D: 444,
+    0x54A7A0: 15690,
+    0x14C67D: 1066,
+    0xE8F085: 15,
+    0x3C366A: 15,
+    0x64F0AD: 250,
+    0xE4FAC4: 4220,
+    0x40AE30: 4220,
+    0x2C66AD: 15691,
+    0x44E64A: 73,
+    0x701301: 11902,
+    0xEC5AA3: 117,
+    0x98876C: 117,
+    0x0C8306: 117,
+    0x046ECB: 11,
+    0xF0ED19: 11,
+    0xD0EF76: 14,
+    0xC4D8D5: 14,
+    0xECCD4C: 21,
+    0xD04FAB: 15692,
+    0x0025FC: 15693,
+    0xE81499: 15694,
+    0x684DB6: 40,
+    0x205D0D: 5,
+    0x603457: 15695,
+    0x08DDEB: 238,
+    0xC06F98: 63,
+    0xD8A0E6: 8233,
+    0x7866F3: 4557,
+    0x0C0ADF: 53,
+    0xDCBE04: 53,
+    0xE0B763: 15696,
+    0xC8CD55: 138,
+    0xC4B25B: 138,
+    0x984A6B: 138,
+    0x102FF8: 15697,
+    0xC457CD: 15,
+    0x28221E: 15,
+    0xF0E752: 15698,
+    0x64BAA4: 11,
+    0x3824F1: 13,
+    0x24EFB4: 15699,
+    0x40D160: 49,
+    0xBCBB58: 49,
+    0x303B7C: 49,
+    0x00812A: 49,
+    0xCC6A33: 4,
+    0x1CE209: 49,
+    0x900371: 116,
+    0x949F8B: 11,
+    0x6CC41E: 15700,
+    0xF46ED6: 38,
+    0x80283C: 1128,
+    0x80AE54: 86,
+    0x18EFC0: 15701,
+    0x3C0868: 15702,
+    0x901564: 12,
+    0x20500F: 15703,
+    0x948CD7: 31,
+    0x48E9CA: 15704,
+    0xD47F35: 4,
+    0x408F9A: 15705,
+    0x001CA1: 15706,
+    0x507973: 15707,
+    0x5C3548: 9516,
+    0x88DA18: 29,
+    0x98CB38: 15708,
+    0xD009F5: 605,
+    0x286847: 238,
+    0x44C532: 15,
+    0x30D4E2: 15,
+    0x30C6AB: 11,
+    0x48E663: 12,
+    0xDCECE3: 15709,
+    0xA4403D: 15710,
+    0x4C8125: 15711,
+    0x484982: 117,
+    0x2836F0: 117,
+    0x1C13FA: 117,
+    0xA8B0D1: 15712,
+    0x483584: 117,
+    0x88F6DC: 117,
+    0x70EB74: 15713,
+    0x60D51B: 366,
+    0x00057E: 15714,
+    0xD4955D: 11,
+    0x1C3C78: 49,
+    0x940BCD: 49,
+    0x9C6697: 4,
+    0xD0E581: 49,
+    0xC4B1D9: 15,
+    0x707013: 15,
+    0xA4A459: 54,
+    0xE45BB3: 11,
+    0x24EC4A: 14,
+    0x981DAC: 15715,
+    0xF40343: 4251,
+    0x98F2B3: 4251,
+    0x70106F: 4251,
+    0xC8FFBF: 12,
+    0x001438: 4251,
+    0x001A1E: 4252,
+    0x94B40F: 4252,
+    0xBC9FE4: 4252,
+    0xD015A6: 4252,
+    0x482F6B: 4252,
+    0x0C975F: 4252,
+    0x343A20: 4252,
+    0x749E75: 4252,
+    0xECEBB8: 4251,
+    0x3817C3: 4251,
+    0x040973: 4251,
+    0xB88303: 4251,
+    0x904C81: 4251,
+    0x548028: 4251,
+    0x9C8CD8: 4251,
+    0x08F1EA: 4251,
+    0xD0D3E0: 4252,
+    0x8C85C1: 4252,
+    0xFC7FF1: 4252,
+    0x946424: 4252,
+    0xD4F5EF: 4251,
+    0x54778A: 4251,
+    0x3821C7: 4252,
+    0x00246C: 4252,
+    0x94A6D8: 21,
+    0xA827C8: 26,
+    0x24DD1B: 15716,
+    0xA852D4: 4252,
+    0x50E4E0: 4252,
+    0xF84477: 238,
+    0x6CFD22: 238,
+    0x380B26: 14471,
+    0xCC7E0F: 13443,
+    0xC4474E: 25,
+    0x08B4D2: 25,
+    0x5CB47E: 25,
+    0x28C5C8: 19,
+    0x38AA20: 11,
+    0x706AC9: 11,
+    0x243F75: 31,
+    0x90D3CF: 234,
+    0x483A02: 41,
+    0x90CBA3: 231,
+    0xBC41A0: 11,
+    0xC8711F: 15717,
+    0xD8D261: 167,
+    0x246278: 15718,
+    0x70378E: 4551,
+    0xD43B8A: 15719,
+    0x2CED89: 15,
+    0x800518: 15,
+    0xDCEB4D: 443,
+    0x247C46: 15720,
+    0x146C27: 281,
+    0xC470BD: 270,
+    0xB8E924: 270,
+    0x940D4B: 4,
+    0x04E387: 4,
+    0x442745: 285,
+    0x8C12C2: 15721,
+    0x448763: 4186,
+    0x8C08AA: 49,
+    0xF4A310: 49,
+    0x3C3B77: 49,
+    0xE84A78: 49,
+    0x10DA63: 49,
+    0xA8BA25: 4252,
+    0x3CA80A: 146,
+    0xB0653A: 102,
+    0x00A41C: 4375,
+    0x901506: 14,
+    0x60F549: 49,
+    0xD83BDA: 14,
+    0x40BC68: 5120,
+    0xD0AE05: 40,
+    0x58FCE3: 5120,
+    0x48A170: 4,
+    0x7402E1: 53,
+    0x24F306: 163,
+    0x649CF3: 5,
+    0x789912: 15722,
+    0x941042: 15723,
+    0x1090FC: 15724,
+    0x4C97A1: 238,
+    0xB03B1B: 15725,
+    0xBC34CA: 15726,
+    0xA00E98: 15,
+    0xB41E52: 15727,
+    0x58B4BB: 138,
+    0x60D561: 15728,
+    0x7CD44D: 15729,
+    0x044BB1: 117,
+    0xF0D7EE: 117,
+    0xF45B29: 15,
+    0x349671: 15,
+    0xB8A25D: 78,
+    0xB01921: 4220,
+    0x344663: 12,
+    0x0CCDB4: 33,
+    0x7CA58F: 15730,
+    0x647B1E: 3,
+    0x8C5E4D: 15731,
+    0x7800A8: 4982,
+    0x98FA2E: 141,
+    0x90032E: 278,
+    0xF40A2E: 107,
+    0x406918: 38,
+    0xA85C03: 11953,
+    0x20BEB8: 77,
+    0xC095CF: 77,
+    0x088BC8: 210,
+    0x6C3AFF: 49,
+    0xEC97A2: 49,
+    0x449E8B: 49,
+    0x540A77: 5,
+    0x2CE38E: 4,
+    0xE0C3EA: 49,
+    0x6C1F8A: 49,
+    0x385439: 257,
+    0x60B58D: 427,
+    0xC40FA6: 165,
+    0xE8122D: 4293,
+    0x4C3946: 90,
+    0x78C4FA: 15732,
+    0xF42055: 12,
+    0x443B14: 128,
+    0x446370: 4278,
+    0xC4C6E6: 4278,
+    0x182CA9: 8504,
+    0x54A552: 15733,
+    0x240A3F: 90,
+    0x203B67: 90,
+    0x2460B3: 90,
+    0x8022FA: 163,
+    0x54E1AD: 4278,
+    0x002B67: 4278,
+    0xB08184: 14,
+    0xB4055D: 15734,
+    0x3063EA: 28,
+    0xA09857: 15735,
+    0xA84FA4: 11892,
+    0x5C5DEC: 15736,
+    0x248625: 12,
+    0x58EA1F: 166,
+    0x948B93: 40,
+    0xF820D2: 52,
+    0xC0A39E: 15737,
+    0x8C1D55: 15738,
+    0x7C8D9C: 26,
+    0xD826FA: 15739,
+    0xF4FBF5: 38,
+    0xE862BE: 25,
+    0x103597: 15740,
+    0xAC5C80: 15741,
+    0xC8B4AB: 15742,
+    0xC4D8C8: 238,
+    0x743C24: 15,
+    0xB8D4C3: 15,
+    0x00A91D: 15,
+    0xD0F76E: 574,
+    0x30F947: 107,
+    0xA0FA9C: 755,
+    0x48A964: 15743,
+    0xE4F58E: 15744,
+    0x485F2D: 77,
+    0xE81DEE: 15745,
+    0xC44FD5: 11902,
+    0xD0F8E7: 15746,
+    0x8C4F00: 14,
+    0xE808AF: 11,
+    0x0CC119: 44,
+    0x80489F: 54,
+    0x34A34E: 15747,
+    0xB4A10A: 117,
+    0x306DF9: 69,
+    0xDC3130: 2277,
+    0xF0BDEE: 117,
+    0x94342F: 163,
+    0x2CD8DE: 4254,
+    0x54C8CC: 15748,
+    0x00BB43: 393,
+    0x04CB01: 90,
+    0x706E10: 15,
+    0xC4D8D4: 15,
+    0x8092A5: 15749,
+    0x2C347B: 15750,
+    0xA0AC78: 73,
+    0xE47F3C: 11,
+    0x2C5EAB: 270,
+    0x40B215: 1,
+    0xEC1D53: 15,
+    0xFC626F: 15751,
+    0xC875DD: 15752,
+    0x3034F6: 15753,
+    0xA85008: 15754,
+    0xB8220C: 49,
+    0x9CA9C5: 49,
+    0xF027A0: 49,
+    0x50BA02: 247,
+    0x3839CD: 146,
+    0x40734D: 21,
+    0xE458BC: 389,
+    0x840F4C: 49,
+    0xC85CE2: 12,
+    0xDCEE14: 15755,
+    0x10FFE0: 538,
+    0x1849F8: 1,
+    0xE84A54: 166,
+    0x2CAB46: 272,
+    0xD88466: 1,
+    0x000496: 1,
+    0x00E02B: 1,
+    0x5C0E8B: 1,
+    0x7467F7: 1,
+    0x4C231A: 1,
+    0x5858CD: 1,
+    0xDCDCC3: 1,
+    0xC8BE35: 1,
+    0xF06426: 1,
+    0xF45424: 1,
+    0xF02B7C: 1,
+    0x7C95B1: 1,
+    0x5859C2: 1,
+    0x787D53: 1,
+    0x209EF7: 1,
+    0x809562: 1,
+    0x90A1BA: 15756,
+    0x000AD7: 15757,
+    0xA0D86F: 15758,
+    0xB4D7DB: 21,
+    0x3050CE: 40,
+    0xB405A1: 40,
+    0x2885BB: 15759,
+    0xF8C650: 4,
+    0x3C1060: 5,
+    0xB4565D: 4297,
+    0x4CE136: 13,
+    0x0084ED: 617,
+    0xC05D39: 1290,
+    0x74249F: 15760,
+    0x648505: 11,
+    0xE4604D: 11,
+    0xF4E84F: 11,
+    0xC87867: 179,
+    0xE822B8: 107,
+    0x744DBD: 14,
+    0x00F952: 15,
+    0x2C15D9: 15,
+    0xD4A923: 15,
+    0xB810D4: 24,
+    0xC89F0C: 78,
+    0x28E6A9: 90,
+    0xDC2D04: 146,
+    0xA43CD7: 15761,
+    0x000263: 15762,
+    0x483543: 69,
+    0x4C5F70: 25,
+    0x60B9C0: 4,
+    0x8C9461: 4,
+    0x5807F8: 181,
+    0xDC6555: 4400,
+    0x346F71: 15763,
+    0x5491AF: 12,
+    0x9C3928: 90,
+    0xBC0EAB: 90,
+    0x98FB27: 90,
+    0xA80BFB: 272,
+    0x3CFA30: 95,
+    0xCCECB7: 15764,
+    0xDCDA0C: 14,
+    0xA8B8E0: 15765,
+    0x14CA56: 11,
+    0x48D35D: 13,
+    0x5433C6: 179,
+    0xCC934A: 4325,
+    0x00A0D5: 4325,
+    0x28A331: 4325,
+    0x6C221A: 4254,
+    0xD843AE: 1280,
+    0xA843A4: 242,
+    0xD8094E: 15766,
+    0x00D07C: 15767,
+    0x886C60: 40,
+    0xE0DF13: 54,
+    0xB01886: 42,
+    0xA42249: 3,
+    0x5CE931: 94,
+    0xC8A6EF: 90,
+    0x687909: 4,
+    0xE4A41C: 4,
+    0xB40AD8: 141,
+    0x0480A7: 15768,
+    0x389CB2: 49,
+    0x583653: 49,
+    0x84D328: 49,
+    0x504074: 12536,
+    0x5C7B5C: 170,
+    0x407912: 53,
+    0x58A15F: 53,
+    0x10CABF: 53,
+    0x98524A: 52,
+    0xA0FF70: 52,
+    0x5C7D7D: 52,
+    0x08A7C0: 52,
+    0x8C6A8D: 52,
+    0x1C9ECC: 52,
+    0xCC1AA3: 89,
+    0x3CC03E: 15,
+    0xFC94E3: 52,
+    0x8C04FF: 52,
+    0xCC3540: 52,
+    0xB0C287: 52,
+    0xBC9B68: 52,
+    0x80D04A: 52,
+    0x3CB74B: 52,
+    0xFC9114: 52,
+    0x500959: 52,
+    0x3817E1: 52,
+    0x4075C3: 52,
+    0x10A793: 52,
+    0xB8A535: 52,
+    0x9839C0: 8655,
+    0x8CCB14: 15769,
+    0xBC5C17: 247,
+    0x74B80F: 15770,
+    0x545FA7: 15771,
+    0x08BFB8: 398,
+    0x003044: 15772,
+    0x00E01C: 15772,
+    0x58D237: 135,
+    0xBC0FF3: 19,
+    0x20BBBC: 516,
+    0x64B379: 15773,
+    0x24FDFA: 13,
+    0xD43127: 138,
+    0xECEF17: 16,
+    0x4CC64C: 166,
+    0x90E468: 257,
+    0xEC0C96: 81,
+    0xA0779E: 4297,
+    0x90D092: 132,
+    0x8430CE: 15774,
+    0x70D8C2: 25,
+    0x445925: 15775,
+    0xE021FE: 15776,
+    0xC8A362: 8323,
+    0x34D856: 107,
+    0x1844CF: 15777,
+    0xCC5763: 91,
+    0x882F64: 15778,
+    0xBC87FA: 389,
+    0xB81EA4: 192,
+    0x840F2A: 4250,
+    0x684724: 38,
+    0xAC3B96: 175,
+    0x0C6714: 165,
+    0x485F08: 86,
+    0xF86FB0: 86,
+    0x90F891: 74,
+    0xC8A608: 272,
+    0x9877E7: 74,
+    0x840112: 74,
+    0x1834AF: 74,
+    0x3447D4: 230,
+    0x64FB01: 15779,
+    0x38F6CF: 11,
+    0x782AF8: 15780,
+    0x7449D2: 21,
+    0xDCD26A: 54,
+    0xACD8A7: 15781,
+    0x0C8772: 287,
+    0xDC8D91: 444,
+    0x409A30: 231,
+    0x90F421: 12,
+    0x242361: 146,
+    0xD42787: 487,
+    0x34D4E3: 15782,
+    0x906D62: 204,
+    0x30B29F: 15783,
+    0x24DCC3: 14,
+    0xF824DB: 15784,
+    0xB44D43: 12,
+    0xF8C4AE: 69,
+    0xC4A816: 63,
+    0x34F043: 90,
+    0x4C66A6: 90,
+    0x4845CF: 468,
+    0x8C02CD: 287,
+    0x54F8F0: 15785,
+    0x74546B: 15786,
+    0xD8D45D: 8137,
+    0x0C298F: 8500,
+    0x20B82B: 3,
+    0x141844: 15787,
+    0xA06636: 15788,
+    0x5843AB: 69,
+    0x58569F: 4,
+    0xA82AD6: 15789,
+    0xE48EBB: 120,
+    0x50E538: 54,
+    0xF4AAD0: 373,
+    0xFC48C9: 15790,
+    0x641C10: 53,
+    0x24BF74: 15791,
+    0x0833ED: 234,
+    0xC01754: 49,
+    0xBC3340: 20,
+    0x001227: 15792,
+    0xAC1A3D: 110,
+    0xF49DA7: 13,
+    0xE84C4A: 77,
+    0x748F4D: 15793,
+    0x00C03A: 15793,
+    0x2C64F6: 513,
+    0x88684B: 69,
+    0xC8F225: 38,
+    0x78530D: 107,
+    0x785F36: 107,
+    0x947FD8: 107,
+    0x20898A: 107,
+    0x18AA1E: 107,
+    0xFC7A58: 107,
+    0xE88FC4: 8227,
+    0x00A085: 13,
+    0xFC2CFD: 15794,
+    0x4C9B63: 285,
+    0x648F3E: 4,
+    0xCCB6C8: 4,
+    0x18FB7B: 110,
+    0x1C4024: 110,
+    0x141877: 110,
+    0xE0DB55: 110,
+    0xF04DA2: 110,
+    0x842B2B: 110,
+    0xEC2C49: 15795,
+    0x246E96: 110,
+    0x00065B: 110,
+    0xB8AC6F: 110,
+    0x00219B: 110,
+    0x002170: 110,
+    0x001EC9: 110,
+    0x34E6D7: 110,
+    0x74E6E2: 110,
+    0x24B6FD: 110,
+    0x000F1F: 110,
+    0x149ECF: 110,
+    0x484D7E: 110,
+    0x6CD6E3: 4,
+    0xD4AE52: 110,
+    0xF8B156: 110,
+    0xAC3D94: 89,
+    0xCC96E5: 110,
+    0x3C46A1: 272,
+    0xAC128E: 788,
+    0xECED73: 78,
+    0x78AC44: 110,
+    0xC03EBA: 110,
+    0x747827: 110,
+    0xB07B25: 110,
+    0xB88584: 110,
+    0xE4B97A: 110,
+    0x684F64: 110,
+    0xD8D090: 110,
+    0x1C721D: 110,
+    0x0C29EF: 110,
+    0xA02919: 110,
+    0x588A5A: 110,
+    0xECC018: 4,
+    0x748FC2: 4,
+    0x64E0AB: 4355,
+    0x0019F0: 4355,
+    0xA01C87: 4355,
+    0x40F4FD: 4355,
+    0x1884C1: 257,
+    0xD016F0: 12,
+    0xB0449C: 15796,
+    0x602A1B: 15797,
+    0x68856A: 15798,
+    0xE41289: 15799,
+    0x30E1F1: 1305,
+    0xD824EC: 15800,
+    0x1012D0: 11,
+    0x44A3C7: 11,
+    0x001D9C: 120,
+    0xD019D3: 163,
+    0xCCACFE: 570,
+    0x886EDD: 8395,
+    0x80F3EF: 4359,
+    0xD8B249: 117,
+    0xC49D08: 117,
+    0x4C5ED3: 15801,
+    0xA0FF0C: 54,
+    0x085411: 54,
+    0x743FC2: 54,
+    0xA4D5C2: 54,
+    0xF40046: 8923,
+    0x80433F: 28,
+    0xC42F90: 54,
+    0x54C415: 54,
+    0xB4A382: 54,
+    0x686DBC: 54,
+    0x08A189: 54,
+    0x44A642: 54,
+    0x5C4DBF: 11,
+    0x984744: 8557,
+    0x4838B6: 15802,
+    0xAC89D2: 655,
+    0xE05694: 15803,
+    0x242730: 167,
+    0x541159: 15804,
+    0xBCC427: 15,
+    0x000356: 130,
+    0x00156D: 131,
+    0x002722: 131,
+    0xDC9FDB: 131,
+    0xB0CFCB: 77,
+    0x18E829: 131,
+    0x74ACB9: 131,
+    0xF492BF: 131,
+    0x68D79A: 131,
+    0x003052: 123,
+    0x504594: 15805,
+    0x80711F: 28,
+    0x64B708: 14,
+    0xE8A245: 28,
+    0x840328: 28,
+    0xF4BFA8: 28,
+    0xC8FE6A: 28,
+    0xFC9643: 28,
+    0x0805E2: 28,
+    0x68F38E: 28,
+    0x8828FB: 28,
+    0xE824A6: 28,
+    0xB49882: 15806,
+    0x88E0F3: 28,
+    0xF8C001: 28,
+    0xA8D0E5: 28,
+    0x54E032: 28,
+    0x3C8AB0: 28,
+    0x3C6104: 28,
+    0x88E64B: 28,
+    0xD0DD49: 28,
+    0x1C9C8C: 28,
+    0x9C8ACB: 28,
+    0x1039E9: 28,
+    0x2C6BF5: 28,
+    0xB0C69A: 28,
+    0xEC13DB: 28,
+    0xF4CC55: 28,
+    0xEC94D5: 28,
+    0xA4E11A: 28,
+    0x24FC4E: 28,
+    0xA4515E: 28,
+    0xF4B52F: 28,
+    0x0014F6: 28,
+    0x28A24B: 28,
+    0x001DB5: 28,
+    0x7C273C: 8926,
+    0x1C2AB0: 4197,
+    0x9817F1: 11,
+    0x4CC844: 8248,
+    0x0C9505: 553,
+    0x08E6C9: 15807,
+    0x98C854: 134,
+    0x7017D7: 15808,
+    0xA08E24: 63,
+    0x247823: 15809,
+    0x844693: 166,
+    0xB86AF1: 3,
+    0xCC5830: 3,
+    0x44DF65: 166,
+    0xD8031A: 4449,
+    0x002BF5: 310,
+    0x5C1648: 69,
+    0x202141: 15810,
+    0x28D0CB: 262,
+    0xAC51EE: 262,
+    0xC4FC22: 143,
+    0x082802: 407,
+    0xCC4210: 40,
+    0xA06032: 8202,
+    0xF0D31F: 49,
+    0xB4AEC1: 49,
+    0x5432C7: 49,
+    0x58E488: 77,
+    0xD853BC: 15811,
+    0x98F9CC: 510,
+    0x3868A4: 90,
+    0xAC1E92: 90,
+    0x80ACC8: 84,
+    0xA416C0: 49,
+    0xDC45B8: 49,
+    0x90ECEA: 49,
+    0x10B588: 49,
+    0xBCAD90: 15812,
+    0x3C998C: 15813,
+    0x5C7545: 15814,
+    0x380FAD: 15,
+    0xB4E54C: 15815,
+    0xDCC2C9: 1131,
+    0x4829D6: 69,
+    0xFC6A1C: 270,
+    0xA088C2: 270,
+    0xE462C4: 4,
+    0x20DE1E: 81,
+    0x607771: 53,
+    0xACB181: 15816,
+    0xACE403: 15817,
+    0xA88055: 220,
+    0x508BB9: 220,
+    0x6CACC2: 90,
+    0xBCF730: 90,
+    0xC4DB04: 15,
+    0x947D77: 15,
+    0x9409C9: 159,
+    0x60D039: 49,
+    0xC4C17D: 49,
+    0x44EE14: 53,
+    0xB4AC9D: 53,
+    0xD43F32: 63,
+    0xF83451: 15818,
+    0x686372: 117,
+    0xA0C20D: 117,
+    0x4C889E: 117,
+    0x3C3174: 210,
+    0xBC9307: 90,
+    0x503CCA: 231,
+    0x9C0C35: 4292,
+    0x78D6D6: 63,
+    0xA43F51: 15819,
+    0xA41894: 15820,
+    0x8CCDFE: 295,
+    0xDCFBB8: 15821,
+    0x001B8F: 4,
+    0xD04F58: 272,
+    0x6C2316: 15822,
+    0xC8EDFC: 15823,
+    0xF82229: 0,
+    0x485D35: 427,
+    0x98ACEF: 194,
+    0xE0BDA0: 49,
+    0x5873D8: 49,
+    0xF4E8C7: 49,
+    0x148509: 49,
+    0x443D54: 77,
+    0x5447CC: 3,
+    0xA0A763: 15824,
+    0x24D79C: 4,
+    0x24724A: 15825,
+    0x00841E: 20,
+    0x546503: 116,
+    0xF85B9B: 15826,
+    0x000941: 171,
+    0xD4925E: 1134,
+    0xE8473A: 8102,
+    0xD80E29: 146,
+    0x10BF67: 77,
+    0xFCD5D9: 170,
+    0x80FBF0: 116,
+    0x90BDE6: 116,
+    0x500B26: 15,
+    0x504172: 15,
+    0x90A6BF: 116,
+    0x3C585D: 3,
+    0x389592: 177,
+    0xF0C745: 231,
+    0xB46DC2: 664,
+    0x3CFA06: 157,
+    0x443262: 11,
+    0xF0F69C: 15827,
+    0x58E403: 57,
+    0x98CCD9: 37,
+    0x64D315: 145,
+    0x606D9D: 15828,
+    0xB06BB3: 15829,
+    0x4C82A9: 195,
+    0x0CAF31: 4,
+    0x647C34: 50,
+    0x6C38A1: 50,
+    0xACCF7B: 8,
+    0xC8E306: 63,
+    0xAC3EB1: 210,
+    0xCCB7C4: 15,
+    0x5014C1: 15,
+    0x60A2C6: 15,
+    0xA4E8A3: 15830,
+    0xB8165F: 285,
+    0x1C6349: 53,
+    0xE4521E: 53,
+    0x182C65: 53,
+    0x18FAB7: 49,
+    0x7022FE: 49,
+    0x881E5A: 49,
+    0x00C585: 49,
+    0xA87CF8: 49,
+    0x60567D: 8808,
+    0xD4F0C9: 15831,
+    0x64E833: 14,
+    0x24B7DA: 5,
+    0x0846C7: 5,
+    0x78D840: 40,
+    0xC8965A: 319,
+    0xC8DE41: 319,
+    0x38CA84: 19,
+    0xB8AB62: 31,
+    0x84E657: 141,
+    0x205E97: 81,
+    0x048680: 116,
+    0xFC22F4: 112,
+    0xF0EDB8: 108,
+    0xF87999: 15832,
+    0xCC2AAC: 15833,
+    0x20406A: 295,
+    0x84DBA4: 117,
+    0x245CC5: 117,
+    0xF463FC: 146,
+    0xB83DFB: 47,
+    0x5464DE: 205,
+    0x38BC61: 15834,
+    0xEC7427: 63,
+    0x68E1DC: 310,
+    0x5CAC3D: 90,
+    0xCCE686: 90,
+    0x74190A: 90,
+    0xC0C4F9: 1055,
+    0x10A829: 4,
+    0xE46017: 25,
+    0x30F6EF: 25,
+    0x586D67: 25,
+    0x686CE6: 157,
+    0x003126: 81,
+    0x109826: 81,
+    0xC870D4: 15835,
+    0x5847CA: 12,
+    0x84FB43: 15836,
+    0x68D40C: 351,
+    0x24E3DE: 15837,
+    0x1816E8: 13343,
+    0xCC79D7: 4,
+    0xE4387E: 4,
+    0x90AC3F: 15838,
+    0x68F543: 15,
+    0x8082F5: 4523,
+    0xF4F19E: 15839,
+    0x104C43: 5,
+    0x647CE8: 95,
+    0x282BB9: 15840,
+    0x301ABA: 69,
+    0x448EEC: 29,
+    0xF026F8: 15841,
+    0x140708: 15842,
+    0xF85B6E: 90,
+    0x14D424: 43,
+    0x68275F: 11,
+    0x4441F0: 11,
+    0xA47952: 117,
+    0xB87CD0: 117,
+    0xD07E01: 117,
+    0xF87907: 117,
+    0x7CE87F: 3,
+    0x68871C: 78,
+    0xF8A475: 15843,
+    0x1449D4: 40,
+    0xF87D76: 49,
+    0x00A093: 15844,
+    0x2C7600: 49,
+    0x7042D3: 138,
+    0x18C3F4: 12,
+    0x34DF20: 15845,
+    0x387C76: 61,
+    0xE4A634: 638,
+    0x2C8D37: 15846,
+    0x40FDF3: 295,
+    0x8C6A3B: 90,
+    0x241153: 90,
+    0x889CAD: 4,
+    0xD88332: 15847,
+    0xECE61D: 117,
+    0x4C63AD: 117,
+    0xDCDB27: 117,
+    0xACB687: 48,
+    0x506391: 15,
+    0xE8A34E: 15,
+    0x041892: 15,
+    0x14656A: 15,
+    0x6CB7E2: 15,
+    0xC475EA: 15,
+    0x9025F2: 15,
+    0xF41AB0: 15848,
+    0xB01F47: 15849,
+    0x282947: 4297,
+    0xACBCB5: 49,
+    0x082573: 49,
+    0xAC007A: 49,
+    0xF01FC7: 49,
+    0x88200D: 49,
+    0xBC1541: 81,
+    0x40E171: 1290,
+    0x18C300: 81,
+    0xD44D77: 81,
+    0x946DAE: 270,
+    0xE0F318: 135,
+    0xC464F2: 444,
+    0x6C724A: 3162,
+    0xD8FFC3: 15850,
+    0xB88F27: 194,
+    0x8C255E: 15851,
+    0x58B38F: 21,
+    0xF46D3F: 25,
+    0xDC0539: 4,
+    0x4827E2: 14,
+    0x3886F7: 210,
+    0xF4227A: 11923,
+    0xDC8DB7: 8257,
+    0x543D92: 15852,
+    0x9826AD: 116,
+    0x640E6A: 15853,
+    0x8C5109: 12,
+    0x68E154: 15854,
+    0x6C60D0: 117,
+    0xE8EF05: 15855,
+    0xA475B9: 90,
+    0x80549C: 90,
+    0x1CF8D0: 90,
+    0xF08756: 112,
+    0x94D331: 40,
+    0xD4430E: 510,
+    0xF85E0B: 194,
+    0x90F970: 15,
+    0x04CAED: 15,
+    0x68EE88: 423,
+    0x2C3B70: 43,
+    0x5C8C30: 278,
+    0x34DD04: 15856,
+    0x601E98: 15857,
+    0xA8F7D9: 179,
+    0x448816: 4,
+    0xE8AC23: 15,
+    0x68D927: 15,
+    0x2C9D65: 146,
+    0x4C9D22: 15858,
+    0x88C9E8: 133,
+    0xB8F0B9: 11,
+    0x805B65: 285,
+    0xA0C98B: 181,
+    0x18BB1C: 117,
+    0x70A983: 4,
+    0xBCFAEB: 4,
+    0x848553: 15859,
+    0xB47D76: 15860,
+    0xC0AD97: 231,
+    0x580032: 821,
+    0xBCC7DA: 121,
+    0x1866F0: 15861,
+    0x74604C: 15862,
+    0xB038E2: 417,
+    0x4C5369: 15863,
+    0xE048D8: 15864,
+    0xF8E4A4: 5,
+    0x286F40: 4375,
+    0x0C86C7: 15865,
+    0xD88863: 15,
+    0xC03E50: 15,
+    0x806036: 15,
+    0x74767D: 15866,
+    0x24CF24: 166,
+    0xF06C5D: 40,
+    0x40B02F: 2420,
+    0x0C7BC8: 20,
+    0xC8F09E: 14,
+    0xDC5475: 14,
+    0x001401: 15867,
+    0x006068: 15868,
+    0x1C5974: 12,
+    0x1C0D7D: 49,
+    0x14F287: 49,
+    0x585595: 49,
+    0x14946C: 49,
+    0x90D473: 146,
+    0x607D09: 15869,
+    0xEC6260: 14,
+    0xB06E72: 194,
+    0x5CA4F4: 11,
+    0x246C60: 117,
+    0x64C582: 29,
+    0x88FC5D: 4,
+    0xF4C88A: 25,
+    0x28827C: 15870,
+    0xCC3E79: 258,
+    0x28F5D1: 258,
+    0x10E177: 258,
+    0x303EA7: 25,
+    0x50284A: 25,
+    0x08EBF6: 15,
+    0xB02347: 15871,
+    0x183C98: 15872,
+    0xD81068: 102,
+    0x5C045A: 15873,
+    0x58C356: 38,
+    0xF4E204: 15874,
+    0xF84E58: 90,
+    0xB47064: 90,
+    0x4C2E5E: 90,
+    0x645DF4: 90,
+    0xDCA956: 69,
+    0xCC827F: 3090,
+    0x78AF08: 25,
+    0xCCDD58: 96,
+    0x787104: 135,
+    0x0016A3: 10766,
+    0x883F0C: 15875,
+    0xA0EDFB: 116,
+    0x104D15: 15876,
+    0x50A015: 375,
+    0x7085C4: 138,
+    0xA0092E: 11,
+    0xAC330B: 15877,
+    0x3053C1: 4312,
+    0x5CC563: 332,
+    0xEC6073: 86,
+    0x74DDCB: 15878,
+    0xA8B13B: 19,
+    0xC43875: 506,
+    0x68B691: 77,
+    0xB0AFF7: 375,
+    0x4827C5: 15,
+    0xBCD206: 15,
+    0x14755B: 25,
+    0xC854A4: 444,
+    0x2CF295: 117,
+    0x7CDAC3: 135,
+    0xBC6193: 40,
+    0xF8E57E: 4,
+    0x3C5D29: 250,
+    0x68FCCA: 90,
+    0x6CD719: 5,
+    0x385B44: 238,
+    0x943469: 238,
+    0xE0BB0C: 15879,
+    0x80015C: 1578,
+    0xCCEB18: 15880,
+    0xAC77B9: 15881,
+    0xA85BB7: 49,
+    0x3462B4: 232,
+    0x8C17B6: 117,
+    0xB82B68: 117,
+    0x0010E6: 15882,
+    0x000813: 15883,
+    0x744687: 15884,
+    0x8C477F: 15885,
+    0x482E72: 4,
+    0x30CBC7: 204,
+    0x885046: 4180,
+    0x0826AE: 12,
+    0x244CAB: 14,
+    0xE04102: 11,
+    0xD84008: 15,
+    0x6C047A: 15,
+    0x6C558D: 15,
+    0xA42A95: 329,
+    0x78482C: 15886,
+    0x7C45D0: 15887,
+    0x70041D: 14,
+    0x886F29: 15888,
+    0xBC2247: 21,
+    0x20AF1B: 15889,
+    0x18C293: 4449,
+    0x000AC2: 5252,
+    0x704CB6: 37,
+    0x549B49: 404,
+    0x7C7716: 112,
+    0x943FBB: 15890,
+    0x50E7B7: 146,
+    0xF4F70C: 15891,
+    0x74EF4B: 69,
+    0x448C00: 194,
+    0xF0BE25: 4579,
+    0x149BD7: 15892,
+    0xD0E828: 15893,
+    0x107636: 121,
+    0xF4442C: 37,
+    0xE0FFF1: 53,
+    0x9C0B05: 63,
+    0x40F6BC: 77,
+    0xECDA59: 21,
+    0x98B785: 15894,
+    0x485AEA: 5,
+    0x848102: 5,
+    0x54E005: 5,
+    0xA083B4: 15895,
+    0x3C8B7F: 4,
+    0xC0F87F: 4,
+    0x5C8E8B: 15896,
+    0x10B1DF: 195,
+    0xF4F647: 11,
+    0xE88175: 11,
+    0x1C7125: 49,
+    0x34FE77: 49,
+    0x6CE5C9: 49,
+    0x74B7E6: 641,
+    0x04FF08: 117,
+    0x00A45F: 117,
+    0xFCE26C: 49,
+    0x4C7975: 49,
+    0xDC9758: 33,
+    0x78F238: 90,
+    0x64D0D6: 90,
+    0x78EB46: 15,
+    0xC416C8: 15,
+    0xE4DCCC: 15,
+    0x3CA161: 15,
+    0x000931: 15897,
+    0xB8F255: 638,
+    0xEC656E: 15898,
+    0x10AEA5: 15899,
+    0x94944A: 15900,
+    0x5C49FA: 15901,
+    0x2CA327: 4291,
+    0x9075BC: 0,
+    0x4C53FD: 77,
+    0x587DB6: 15902,
+    0x782184: 14,
+    0x341343: 4301,
+    0x185880: 48,
+    0x3083D2: 78,
+    0xAC50DE: 195,
+    0x00DDB6: 21,
+    0xB89EA6: 15903,
+    0xE07E5F: 232,
+    0x38BEAB: 263,
+    0x047975: 22,
+    0x9C0567: 22,
+    0x1466B7: 15904,
+    0xB08B92: 11,
+    0x08C8C2: 27,
+    0xAC8B6A: 275,
+    0x000056: 15905,
+    0x70FD88: 8591,
+    0x98192C: 87,
+    0x080004: 15906,
+    0xFC777B: 520,
+    0x14172A: 5,
+    0x005FBF: 12086,
+    0xD405DE: 63,
+    0xFC0FE7: 72,
+    0x241281: 29,
+    0x50C0F0: 15907,
+    0xB4AE2B: 1989,
+    0x38A91C: 21,
+    0xF4700C: 12,
+    0x549F06: 0,
+    0x68A878: 15908,
+    0x409B21: 81,
+    0x4873CB: 393,
+    0x789FAA: 117,
+    0xE8A72F: 157,
+    0x94B34F: 272,
+    0xC85CCC: 166,
+    0x38384B: 146,
+    0x140A29: 393,
+    0x301A30: 1858,
+    0xC48BA3: 20,
+    0x24CE33: 77,
+    0x0CDDEF: 882,
+    0x5C9666: 141,
+    0x88231F: 4664,
+    0xA4DE26: 1927,
+    0x307BC9: 664,
+    0x68E478: 780,
+    0xE09D13: 90,
+    0xA00F37: 4,
+    0x4C445B: 25,
+    0xC8CA79: 655,
+    0xBC6EE2: 25,
+    0x7C726E: 228,
+    0xD4EEDE: 135,
+    0xC08B05: 15,
+    0x046865: 49,
+    0xDC5392: 49,
+    0x1CB3C9: 49,
+    0xFCAA81: 49,
+    0x609316: 49,
+    0x646D2F: 49,
+    0xC0F9D2: 15909,
+    0x387A0E: 25,
+    0x042084: 11,
+    0xB45F84: 11,
+    0x00DF1D: 4,
+    0x787264: 12,
+    0x1097BD: 14,
+    0xB01C0C: 407,
+    0x68403C: 5,
+    0x903E7F: 5,
+    0x14C0A1: 15910,
+    0xDC0E96: 95,
+    0x30C6F7: 14,
+    0xC03653: 63,
+    0x940230: 4426,
+    0x701135: 15911,
+    0x643216: 15912,
+    0xC06B55: 78,
+    0xDC84E9: 4646,
+    0x78670E: 57,
+    0x080205: 15,
+    0x9035EA: 238,
+    0xFCA84A: 15913,
+    0x6C3C7C: 1131,
+    0x304F00: 69,
+    0x1C5EE6: 998,
+    0x346F24: 43,
+    0xA41A3A: 86,
+    0x3484E4: 53,
+    0xAC4D16: 53,
+    0xB010A0: 53,
+    0xDC9166: 117,
+    0xAC80D6: 15914,
+    0xDCE55B: 210,
+    0x4CB9EA: 15915,
+    0xB894E7: 40,
+    0x34B98D: 40,
+    0xC4D7FD: 47,
+    0xD876AE: 15,
+    0x0C8408: 15,
+    0xA09F7A: 15916,
+    0xB42046: 63,
+    0xE86E44: 11,
+    0x00E7E3: 11,
+    0xB06A41: 210,
+    0x1CED6F: 427,
+    0xD81F12: 220,
+    0x204B22: 276,
+    0xC81CFE: 6,
+    0xF0704F: 90,
+    0xAC6C90: 90,
+    0x90B622: 90,
+    0x0C02BD: 90,
+    0x2CD1DA: 4794,
+    0xC4FCEF: 15917,
+    0x5C5230: 49,
+    0x645A36: 49,
+    0x6C71D2: 15,
+    0xF800A1: 15,
+    0xB4AC8C: 15918,
+    0xBCCE25: 35,
+    0x2032C6: 49,
+    0xFC1D2A: 146,
+    0x9C54C2: 21,
+    0x78E9CF: 351,
+    0x000D67: 3584,
+    0x24D7EB: 14,
+    0x58BF25: 14,
+    0x80D2E5: 35,
+    0x04D442: 651,
+    0x1C05B7: 15919,
+    0x141973: 15920,
+    0x546F71: 15921,
+    0x54EF33: 664,
+    0x4448B9: 128,
+    0x5C75C6: 29,
+    0x9009D0: 15922,
+    0xA0D05B: 90,
+    0xF8CE72: 4957,
+    0xCC9DA2: 978,
+    0xB437D8: 15923,
+    0x000A02: 15924,
+    0x9CD57D: 4,
+    0xCCE236: 15925,
+    0x000FE5: 15926,
+    0x74765B: 116,
+    0x204181: 15927,
+    0x605375: 15,
+    0x78DD33: 15,
+    0xA031DB: 15,
+    0xDCBB96: 15928,
+    0x941F3A: 15929,
+    0x7066E1: 15930,
+    0x48188D: 755,
+    0x80FBF1: 15931,
+    0x38D57A: 195,
+    0x08E7E5: 117,
+    0x487397: 21,
+    0xA0445C: 15,
+    0x646D4E: 15,
+    0x085C1B: 15,
+    0x509A88: 15,
+    0xB83BCC: 40,
+    0xD09CAE: 146,
+    0x88D199: 6426,
+    0x701F0B: 15932,
+    0xA01842: 829,
+    0x506F0C: 3,
+    0xD48660: 48,
+    0x40406C: 5950,
+    0x043926: 242,
+    0x70CD0D: 25,
+    0x5C0CE6: 35,
+    0x1856C3: 49,
+    0x6881E0: 15,
+    0x4CD629: 15,
+    0xF0C478: 15,
+    0xD86D17: 15,
+    0x7C1AC0: 15,
+    0x7C87CE: 14,
+    0x8C8172: 135,
+    0x1C93C4: 77,
+    0x745D43: 4784,
+    0x000BA5: 15933,
+    0x44E517: 25,
+    0xAC49DB: 49,
+    0x44F09E: 49,
+    0x08FF44: 49,
+    0x547787: 121,
+    0x002704: 15934,
+    0xD0C24E: 90,
+    0x345B98: 38,
+    0xB88D12: 49,
+    0x080037: 1257,
+    0x888E7F: 15935,
+    0x003059: 12159,
+    0x88A0BE: 15,
+    0x949010: 15,
+    0x98F083: 15,
+    0x8C64A2: 71,
+    0xD05475: 15936,
+    0x489EBD: 19,
+    0x00269C: 15937,
+    0x28FA19: 286,
+    0xBCA37F: 15938,
+    0x28DFEB: 25,
+    0x88FCA6: 726,
+    0x5009E5: 15939,
+    0x203CC0: 15940,
+    0x28FBAE: 15,
+    0xD8A011: 199,
+    0xA47806: 4,
+    0xB8D56B: 15941,
+    0xCCB5D1: 166,
+    0x78D6DC: 443,
+    0x0C4314: 238,
+    0xF4C02F: 15942,
+    0xEC8AC4: 77,
+    0x78B84B: 135,
+    0x508A06: 220,
+    0xD40868: 15943,
+    0xE8DA00: 15944,
+    0x7886B6: 574,
+    0xC48025: 117,
+    0xB8145C: 117,
+    0xC89D18: 117,
+    0xDC0398: 285,
+    0x10381F: 33,
+    0x5414F3: 25,
+    0xECB4E8: 15945,
+    0x30A612: 15946,
+    0x18BB41: 117,
+    0x7818A8: 117,
+    0x807264: 117,
+    0xE8F654: 15,
+    0x2087EC: 15,
+    0xD44165: 135,
+    0x7CCC1F: 135,
+    0xFC372B: 135,
+    0x248BE0: 135,
+    0x5C4A1F: 135,
+    0x54E061: 135,
+    0x5CC8E3: 15947,
+    0x086AC5: 25,
+    0x8C367A: 95,
+    0x6CFE54: 25,
+    0x3C195E: 90,
+    0x1CFF59: 135,
+    0xC01B23: 135,
+    0x187532: 135,
+    0x9C9C40: 135,
+    0x4C3B6C: 15948,
+    0x68DDD9: 145,
+    0x6C9466: 25,
+    0x54F6E2: 15,
+    0xA85081: 15,
+    0x3C7AC4: 15949,
+    0x0015E5: 15950,
+    0x8C83FC: 15951,
+    0x001FC8: 15952,
+    0x38AFD0: 15953,
+    0xFC97A8: 15954,
+    0xA0D7A0: 117,
+    0xE0DA90: 15,
+    0xA4A46B: 15,
+    0xC04754: 146,
+    0x8CD9D6: 40,
+    0x60A4B7: 94,
+    0x00A00E: 4555,
+    0xA45802: 15955,
+    0x38F3FB: 15956,
+    0x50AE86: 15957,
+    0x601592: 12,
+    0x143B42: 15958,
+    0x943CC6: 14,
+    0xA4DAD4: 15959,
+    0xF4B1C2: 510,
+    0xBCFAB8: 257,
+    0xA04A5E: 157,
+    0x60C5E6: 473,
+    0x109497: 15960,
+    0xF02F4B: 49,
+    0x40E64B: 49,
+    0xEC2E98: 43,
+    0xD47798: 4,
+    0x10C9CA: 15961,
+    0xB4FA48: 49,
+    0x38B3F7: 117,
+    0x84E986: 117,
+    0xAC1F0F: 53,
+    0x74D285: 53,
+    0x8044FD: 596,
+    0xF46AD7: 157,
+    0x481F2D: 15962,
+    0xA8E81E: 8257,
+    0x1409B4: 11,
+    0x101081: 11,
+    0xF81A2B: 210,
+    0x8C73A0: 5,
+    0xF4A80D: 761,
+    0x3CA8ED: 15963,
+    0xF885F9: 218,
+    0x78CFF9: 117,
+    0x04C29B: 15964,
+    0x1C87E3: 231,
+    0x20B730: 15965,
+    0x509707: 15966,
+    0x3CE36B: 510,
+    0x488899: 37,
+    0xDCB131: 15967,
+    0xF0625A: 194,
+    0x843B10: 322,
+    0x94A4F9: 15,
+    0x6C3491: 15,
+    0xE84D74: 15,
+    0xCC895E: 15,
+    0xEC63D7: 25,
+    0x7C9F07: 4235,
+    0x203B69: 146,
+    0x5C1720: 117,
+    0x605E4F: 117,
+    0x1CE6AD: 117,
+    0x14857F: 25,
+    0x94E23C: 25,
+    0x5856C2: 15,
+    0xA03679: 15,
+    0xB8D6F6: 15,
+    0x2C52AF: 15,
+    0x48684A: 25,
+    0x58FB96: 272,
+    0x285B0C: 425,
+    0x1489CB: 15,
+    0x6C2636: 15,
+    0x40DE17: 15968,
+    0xAC2316: 179,
+    0x2C00AB: 258,
+    0x002470: 15969,
+    0xBCF171: 25,
+    0x84716A: 117,
+    0x488C63: 117,
+    0x70DDEF: 117,
+    0x54A6DB: 117,
+    0x149877: 49,
+    0x88665A: 49,
+    0xB0E5F9: 49,
+    0xB88DF1: 15970,
+    0x6C4A74: 15971,
+    0x14EB08: 15,
+    0xB01656: 15,
+    0x78D4F1: 12,
+    0xDC9020: 15972,
+    0xA842A7: 1290,
+    0x2CD26B: 438,
+    0xA062FB: 349,
+    0x9C6865: 5,
+    0x383D5B: 5,
+    0x24EDFD: 15973,
+    0x6CCDD6: 511,
+    0x540764: 117,
+    0xDCD7A0: 117,
+    0xF01628: 15974,
+    0xF88F07: 90,
+    0x8CEA48: 90,
+    0x005F67: 94,
+    0x503DC6: 40,
+    0xB0BD1B: 281,
+    0xD4ECAB: 146,
+    0xBC3ECB: 146,
+    0x08798C: 15,
+    0x5C9AA1: 117,
+    0xBCF45F: 11,
+    0x6055F9: 14,
+    0x548ABA: 4,
+    0x64A198: 117,
+    0x1418C3: 25,
+    0x54DBA2: 15975,
+    0x44AE25: 4,
+    0xBCE712: 4,
+    0xCCCC81: 15,
+    0x4089A8: 15976,
+    0x3C2093: 167,
+    0xE02967: 145,
+    0x988B69: 15977,
+    0x18146C: 250,
+    0x688975: 15978,
+    0xA899DC: 15979,
+    0x001D1E: 15980,
+    0x50C3A2: 15981,
+    0x1CD1BA: 5,
+    0x804B50: 238,
+    0xC0E3FB: 15,
+    0x30E283: 53,
+    0x34AFB3: 77,
+    0x683F7D: 8,
+    0x945F34: 232,
+    0x603CEE: 514,
+    0x2C4A11: 655,
+    0x20AC9C: 15982,
+    0x28AD18: 31,
+    0x0C354F: 81,
+    0xC4CB54: 15983,
+    0x3024A9: 19,
+    0x9409D3: 15984,
+    0xF8A73A: 4,
+    0xB8114B: 4,
+    0x1C4C48: 163,
+    0x2C0786: 117,
+    0xA86E4E: 117,
+    0x102D31: 15985,
+    0x782E56: 29,
+    0xC40B31: 49,
+    0x8C7A15: 272,
+    0x6420E0: 15986,
+    0x8411C2: 12,
+    0x90DE80: 15987,
+    0x109693: 77,
+    0xE4F1D4: 146,
+    0x5CC0A0: 15,
+    0x04F352: 15,
+    0x488B0A: 4,
+    0x185BB3: 90,
+    0x9C5FB0: 90,
+    0xE87F6B: 90,
+    0xECA1D1: 15,
+    0xA46DA4: 15,
+    0x24A487: 117,
+    0xC45A86: 117,
+    0x786A1F: 258,
+    0x2494CB: 258,
+    0xFCB69D: 510,
+    0x94F2BB: 4332,
+    0xB0ECDD: 15,
+    0x6C1414: 15988,
+    0xAC6784: 210,
+    0xA8B088: 63,
+    0xEC7E91: 163,
+    0xE0E1A9: 636,
+    0x7C4E09: 15989,
+    0x280FC5: 15990,
+    0x1CEC72: 11030,
+    0xE4DC43: 117,
+    0x2430F8: 117,
+    0xC43CEA: 310,
+    0xD4910F: 77,
+    0x80F5B5: 53,
+    0x1C3008: 31,
+    0x98063A: 4739,
+    0x64A200: 40,
+    0x703A2D: 15991,
+    0x1C45C2: 15992,
+    0x84CC63: 117,
+    0xC07831: 117,
+    0xC4FBAA: 15,
+    0xB0A651: 4,
+    0x183672: 15993,
+    0x0017C9: 90,
+    0x5CF9FD: 278,
+    0x3898E9: 117,
+    0x48A516: 117,
+    0xACDCCA: 15,
+    0xB85FB0: 15,
+    0xB4BA12: 12267,
+    0xE0E0C2: 29,
+    0x6C1ED7: 146,
+    0xF0AA0B: 15994,
+    0x945641: 95,
+    0xECC302: 132,
+    0xC4DD57: 14,
+    0x98C97C: 73,
+    0x00C343: 15995,
+    0xA0D0DC: 77,
+    0x143FC3: 9284,
+    0x209A7D: 3,
+    0x50C68E: 15996,
+    0xE475DC: 48,
+    0x58208A: 12,
+    0xBCA5A9: 49,
+    0x102779: 15997,
+    0x80CA4B: 15998,
+    0xC41688: 117,
+    0x64B0E8: 117,
+    0x30A998: 117,
+    0x64F54E: 38,
+    0x04E795: 15,
+    0x20E2A8: 49,
+    0xA0FBC5: 49,
+    0x007D60: 49,
+    0x74427F: 427,
+    0x001C45: 15999,
+    0xC0619A: 12,
+    0x28C21F: 305,
+    0x8C7086: 16000,
+    0x400634: 117,
+    0xC42B44: 117,
+    0xF8A26D: 1131,
+    0x689E0B: 4,
+    0x004238: 25,
+    0x74F9CA: 35,
+    0x7061EE: 16001,
+    0x0019DC: 16002,
+    0xB07D64: 25,
+    0x48902F: 514,
+    0x4C2219: 16003,
+    0xE4246C: 510,
+    0xE8EB1B: 72,
+    0x38BAB0: 1142,
+    0xB0A460: 25,
+    0x000083: 16004,
+    0x28B77C: 12,
+    0x00146A: 4,
+    0x68D6ED: 12029,
+    0x840283: 132,
+    0x941700: 40,
+    0xD8EF42: 117,
+    0x80CC12: 117,
+    0x18AA0F: 117,
+    0x54D9C6: 117,
+    0x308AF7: 117,
+    0x64E7D8: 90,
+    0x00E406: 15,
+    0x44227C: 15,
+    0xCCB182: 15,
+    0x089BB9: 181,
+    0xD89ED4: 5,
+    0x40D25F: 163,
+    0x54F15F: 33,
+    0xE079C4: 16005,
+    0xAC9572: 16006,
+    0x001753: 16007,
+    0x001636: 476,
+    0x884067: 471,
+    0xA8032A: 14,
+    0x083869: 16008,
+    0x2481C7: 117,
+    0xFC862A: 117,
+    0xAC9A96: 475,
+    0x4843DD: 77,
+    0x5894A2: 16009,
+    0x001A57: 16010,
+    0x001CFC: 1927,
+    0xEC753E: 15,
+    0x24A160: 14,
+    0xDCAEEB: 272,
+    0x882949: 232,
+    0xECDB86: 16011,
+    0x3C846A: 86,
+    0x84D81B: 86,
+    0x7C2ADB: 40,
+    0xF864B8: 11,
+    0x145120: 117,
+    0xC0D193: 117,
+    0x7804E3: 117,
+    0xA43B0E: 117,
+    0x909164: 16012,
+    0x1C3D2F: 15,
+    0x001D67: 16013,
+    0x001A62: 16014,
+    0xC06369: 16015,
+    0x1841FE: 16016,
+    0x08B0A7: 16017,
+    0x18AB1D: 90,
+    0xBCE92F: 19,
+    0xE092A7: 11922,
+    0xB0761B: 15,
+    0x8C0E60: 16018,
+    0xDC91BF: 77,
+    0x6CCE44: 4624,
+    0x944444: 285,
+    0x340A33: 329,
+    0x8437D5: 90,
+    0x3482C5: 90,
+    0xF0D7AF: 12,
+    0x7CA96B: 902,
+    0x98063C: 90,
+    0x74A7EA: 77,
+    0x7C6DF8: 49,
+    0x50AD71: 16019,
+    0x5CA5BC: 63,
+    0xD84F37: 16020,
+    0x74AB93: 16021,
+    0xE87F95: 49,
+    0x781100: 16022,
+    0x88C08B: 49,
+    0x4C7CD9: 49,
+    0x84EAED: 58,
+    0x940853: 192,
+    0xB49E80: 854,
+    0xA49340: 16023,
+    0xF8E877: 174,
+    0xA09B12: 275,
+    0x98F621: 40,
+    0x1413FB: 15,
+    0xD0768F: 218,
+    0x00E22C: 29,
+    0xC0395A: 510,
+    0x2064CB: 69,
+    0xF05501: 117,
+    0xEC6CB5: 11,
+    0xC0B101: 11,
+    0xA45006: 16024,
+    0xAC3C8E: 16025,
+    0x406234: 570,
+    0x94FBA7: 12,
+    0xFC3DA5: 48,
+    0xC87125: 13303,
+    0x80CFA2: 117,
+    0x0094EC: 117,
+    0x74452D: 117,
+    0x140152: 90,
+    0xDC1BA1: 25,
+    0xBC33AC: 238,
+    0x001329: 16026,
+    0x7CF2DD: 16027,
+    0x988E79: 16028,
+    0xC80739: 958,
+    0x6C6D09: 16029,
+    0x080342: 95,
+    0xA86ABB: 3,
+    0x2443E2: 16030,
+    0xEC237B: 11,
+    0xD49CF4: 95,
+    0xCCAB2C: 132,
+    0x540E2D: 146,
+    0x708F47: 146,
+    0x90173F: 15,
+    0x607ECD: 15,
+    0x001876: 16031,
+    0xC42456: 95,
+    0x84D412: 95,
+    0xB82FCB: 16032,
+    0x4CFCAA: 8500,
+    0x10CE45: 16033,
+    0x8C59DC: 16034,
+    0x18828C: 48,
+    0xD452EE: 319,
+    0x6C61F4: 4542,
+    0x9CF029: 554,
+    0x2856C1: 174,
+    0xBC4A56: 4,
+    0xF8AF05: 117,
+    0x94E9EE: 117,
+    0x64BC58: 25,
+    0xAC1203: 25,
+    0x28E34E: 15,
+    0x78B8D6: 6,
+    0xF490CB: 12,
+    0x185869: 16035,
+    0xBC2DEF: 194,
+    0x7881CE: 4677,
+    0x445CE9: 90,
+    0xC01692: 29,
+    0xBCFF21: 16036,
+    0x381730: 16037,
+    0x98C8B8: 146,
+    0x402E71: 53,
+    0xF08175: 3,
+    0x1C63BF: 16038,
+    0xAC3651: 16039,
+    0x684A76: 63,
+    0x8C683A: 15,
+    0xB46E08: 15,
+    0x2864B0: 117,
+    0x04F169: 117,
+    0x5021EC: 117,
+    0x0C48C6: 211,
+    0xA42985: 33,
+    0xB48107: 407,
+    0x706655: 43,
+    0xC858C0: 25,
+    0x4CB16C: 15,
+    0xBC0963: 49,
+    0xD84C90: 49,
+    0x24D0DF: 49,
+    0x6C4A85: 49,
+    0x28F033: 49,
+    0x005E0C: 145,
+    0x688FC9: 16040,
+    0xD84732: 86,
+    0xA043B0: 51,
+    0xD8C561: 16041,
+    0x60D89C: 145,
+    0xF41C95: 790,
+    0xA0687E: 258,
+    0xA8705D: 258,
+    0x9C9789: 4624,
+    0xF82E8E: 16042,
+    0xB4C9B9: 33,
+    0xF0463B: 4450,
+    0xC402E1: 16043,
+    0x4C6C13: 16044,
+    0x0009F3: 16045,
+    0xC8FA84: 16046,
+    0x2863BD: 4316,
+    0xF85B3B: 234,
+    0xA885D7: 16047,
+    0x786DEB: 4301,
+    0x9CA513: 90,
+    0x309048: 49,
+    0x444ADB: 49,
+    0x8C5AC1: 117,
+    0xA85AE0: 117,
+    0xA4B61E: 117,
+    0xC4FE5B: 69,
+    0x84F883: 16048,
+    0xB44C3B: 510,
+    0x40A2DB: 77,
+    0xC03937: 543,
+    0xC467D1: 15,
+    0x9424B8: 543,
+    0xCCF411: 210,
+    0x9C2DCF: 16049,
+    0x0433C2: 25,
+    0xD49AA0: 8792,
+    0xC8C465: 15,
+    0x1C4363: 15,
+    0x94292F: 21,
+    0x6CF049: 538,
+    0xFCAA14: 538,
+    0xF80FF9: 210,
+    0x20F375: 258,
+    0x84BB69: 258,
+    0x444687: 531,
+    0xE0F442: 117,
+    0xF0C42F: 117,
+    0xC0B47D: 117,
+    0xF4A59D: 117,
+    0x307ECB: 4542,
+    0xC803F5: 272,
+    0xE81B4B: 16050,
+    0xA4B439: 4,
+    0xA0B439: 4,
+    0x105FD4: 177,
+    0xB4265D: 278,
+    0x48A5E7: 35,
+    0xB81904: 0,
+    0xB4A5AC: 69,
+    0x1C784E: 4677,
+    0xD4B709: 11,
+    0x38144E: 5,
+    0xE0CCF8: 40,
+    0xAC675D: 25,
+    0x84C5A6: 25,
+    0x5C80B6: 25,
+    0xF07807: 49,
+    0x082CB6: 49,
+    0xF84E73: 49,
+    0x3CCD36: 49,
+    0x843E79: 8230,
+    0xF8E4E3: 25,
+    0xD8CF89: 16051,
+    0x04AAE1: 16052,
+    0x44DC4E: 163,
+    0xB4E8C9: 16053,
+    0x6C24A6: 146,
+    0x9C5F5A: 69,
+    0xA01C8D: 15,
+    0xF4DEAF: 15,
+    0x60123C: 15,
+    0xC0D2DD: 90,
+    0x942DDC: 90,
+    0x7CB37B: 247,
+    0x88123D: 16054,
+    0x48210B: 814,
+    0x0068EB: 19,
+    0x7C310E: 4,
+    0x484C86: 117,
+    0x54F294: 117,
+    0x245AB5: 90,
+    0x382A19: 16055,
+    0x74D654: 16056,
+    0x7C210E: 4,
+    0xF4E5F2: 15,
+    0x541310: 15,
+    0x8CE5EF: 15,
+    0xF0EF86: 210,
+    0xE4C0CC: 29,
+    0xA0946A: 16057,
+    0x1C2AA3: 16058,
+    0x388E7A: 16059,
+    0x9C31C3: 319,
+    0x5CB13E: 3,
+    0xE4AAEA: 192,
+    0x4C710D: 4,
+    0x4C710C: 4,
+    0xA4CD23: 16060,
+    0xE01F0A: 16061,
+    0xE447B3: 11,
+    0xFCDB21: 16062,
+    0xE4671E: 16063,
+    0x682719: 72,
+    0x24C17A: 16064,
+    0xA4C939: 69,
+    0x34D772: 16065,
+    0x3C86D1: 146,
+    0x301B97: 16066,
+    0x48794D: 90,
+    0x18F9C4: 16067,
+    0x60ABD2: 389,
+    0xC0DCDA: 90,
+    0x04B429: 90,
+    0x7C8AE1: 384,
+    0xC863FC: 258,
+    0x54E4A9: 16068,
+    0x208058: 655,
+    0x74DA88: 86,
+    0xCC32E5: 86,
+    0x1C3BF3: 86,
+    0x2C00F7: 16069,
+    0x2CD2E3: 16070,
+    0x946269: 258,
+    0xA8C252: 117,
+    0xA04147: 117,
+    0x1459C3: 16071,
+    0x1CCCD6: 40,
+    0xA445CD: 16072,
+    0x7CC926: 16073,
+    0x68070A: 8363,
+    0x4CEBBD: 388,
+    0x70879E: 5122,
+    0x684AAE: 15,
+    0x60D755: 15,
+    0x1CAECB: 15,
+    0x4CF19E: 16074,
+    0x04ED33: 25,
+    0x2036D7: 16075,
+    0x044A6C: 15,
+    0x38FB14: 15,
+    0xF0E4A2: 15,
+    0xB45062: 16076,
+    0x5C75AF: 656,
+    0x94D505: 5,
+    0x7CB27D: 25,
+    0x582059: 40,
+    0x90272B: 16077,
+    0x4CBCB4: 16078,
+    0x1063C8: 192,
+    0x7C5189: 16079,
+    0x082697: 112,
+    0x7869D4: 16080,
+    0x5CD135: 16081,
+    0x74E1B6: 49,
+    0x24A52C: 15,
+    0x482759: 16082,
+    0x64CB9F: 231,
+    0x4CFBFE: 15701,
+    0xC0CBF1: 8428,
+    0xFC7D6C: 16083,
+    0x1CD5E2: 574,
+    0x0024E9: 90,
+    0x683B78: 4,
+    0xF4CE36: 16084,
+    0xAC7713: 16085,
+    0x08849D: 77,
+    0x2440AE: 16086,
+    0xF40E01: 49,
+    0x1495CE: 49,
+    0x50DE06: 49,
+    0xCC660A: 49,
+    0xFC1D43: 49,
+    0x18A4A9: 16087,
+    0x80E82C: 607,
+    0xD4ADBD: 4,
+    0xCCCCCC: 238,
+    0x5CA1E0: 16088,
+    0x1CB796: 15,
+    0x3847BC: 15,
+    0x549209: 15,
+    0x745909: 15,
+    0x7C942A: 15,
+    0xE47E9A: 11,
+    0x2C16BD: 12,
+    0x30A889: 16089,
+    0x00F620: 210,
+    0xF43328: 16090,
+    0x5C5AC7: 4,
+    0xB46077: 854,
+    0xB4A2EB: 12,
+    0x68AB09: 81,
+    0x00EDB8: 338,
+    0xC8D69D: 16091,
+    0x405BD8: 388,
+    0xB891C9: 16092,
+    0xC8A776: 15,
+    0xA400E2: 15,
+    0xC4C603: 4,
+    0x7CB59B: 86,
+    0x2C4F52: 4,
+    0x2823F5: 596,
+    0xF010AB: 596,
+    0xB4DC09: 16093,
+    0x98865D: 0,
+    0x9C99CD: 16094,
+    0xACDB48: 258,
+    0x68A03E: 15,
+    0xB8C385: 15,
+    0x4CE9E4: 21,
+    0xC80D32: 16095,
+    0xC4F7D5: 4,
+    0x1C6499: 829,
+    0xD05794: 3,
+    0x04D9F5: 398,
+    0x54EC2F: 272,
+    0x00257E: 4730,
+    0x2899C7: 16096,
+    0xB4C4FC: 40,
+    0xFCBD67: 89,
+    0x10DC4A: 5,
+    0x487746: 218,
+    0xF8AE27: 16097,
+    0x88EF16: 258,
+    0x8CA96F: 3337,
+    0x98B8BA: 514,
+    0x7CD661: 40,
+    0x7445CE: 4312,
+    0xB0FD0B: 12,
+    0xB4CC04: 16098,
+    0x4CBC48: 4,
+    0x48D875: 16099,
+    0x3050FD: 560,
+    0x0CE99A: 16100,
+    0x4C11AE: 14,
+    0x8C89FA: 16101,
+    0xD4789B: 4,
+    0x483FE9: 15,
+    0x143CC3: 15,
+    0xA8E544: 15,
+    0x50C4DD: 310,
+    0x0040BC: 16102,
+    0x004065: 16103,
+    0x1820D5: 258,
+    0xE002A5: 16104,
+    0xB8D526: 112,
+    0xECADE0: 329,
+    0xF0B968: 163,
+    0x04E56E: 16105,
+    0x1C7F2C: 15,
+    0x88BCC1: 15,
+    0x8C426D: 15,
+    0x38D2CA: 250,
+    0x109E3A: 250,
+    0x78DA07: 250,
+    0x44A61E: 8,
+    0x904DC3: 16106,
+    0x000DF1: 16107,
+    0x00077C: 16108,
+    0xA8BF3C: 16109,
+    0xD4F527: 314,
+    0x1CBFCE: 15987,
+    0xF83002: 53,
+    0xA8A159: 4476,
+    0x202AC5: 16110,
+    0x0836C9: 511,
+    0xCCDC55: 16111,
+    0xA4C3F0: 25,
+    0x906D05: 16112,
+    0xD4BBC8: 146,
+    0x489507: 69,
+    0x745BC5: 12,
+    0x445D5E: 16113,
+    0xA041A7: 16114,
+    0x5462E2: 49,
+    0x149D99: 49,
+    0xB8B2F8: 49,
+    0x98460A: 49,
+    0xB85D0A: 49,
+    0x7C9A1D: 49,
+    0x103025: 49,
+    0x70ACD7: 574,
+    0x147BAC: 81,
+    0xE446DA: 40,
+    0x1C12B0: 77,
+    0x4CBC98: 12,
+    0x58D9C3: 78,
+    0x2CF432: 14,
+    0x28FFB2: 12086,
+    0x1C60D2: 5,
+    0xF4B5AA: 11,
+    0xE8ACAD: 11,
+    0x647366: 16115,
+    0x744D28: 439,
+    0x041EFA: 16116,
+    0x2C73A0: 4,
+    0x443E07: 16117,
+    0x04BA8D: 90,
+    0xD85575: 90,
+    0xD411A3: 90,
+    0x90842B: 4587,
+    0x00267E: 1036,
+    0xE05A9F: 12,
+    0x2C557C: 574,
+    0xF4BCDA: 286,
+    0x000915: 16118,
+    0x8C5AF8: 508,
+    0xD45800: 5,
+    0x0017A0: 16119,
+    0x000AA8: 16120,
+    0x0029C2: 4,
+    0x187C0B: 272,
+    0x485D36: 8749,
+    0x20C047: 8749,
+    0x346B46: 3,
+    0x8485E6: 16121,
+    0x3C8375: 157,
+    0x78A7EB: 4624,
+    0xD47B35: 16122,
+    0x000878: 16123,
+    0x34DAB7: 11,
+    0x109C70: 16124,
+    0x103D0A: 31,
+    0x942790: 274,
+    0xA41791: 16125,
+    0xA41908: 5,
+    0x7C604A: 16126,
+    0x0014A5: 182,
+    0xC0B5D7: 388,
+    0x108EBA: 16127,
+    0x80D336: 4147,
+    0x64255E: 8325,
+    0x90940A: 16128,
+    0x40B076: 398,
+    0xE84C56: 16129,
+    0xD4AD71: 4,
+    0x702B1D: 16130,
+    0xF085C1: 787,
+    0xFC62B9: 159,
+    0x0002C7: 159,
+    0x001E3D: 159,
+    0x28A183: 159,
+    0x48F07B: 159,
+    0x4CDD7D: 16131,
+    0xB8BC5B: 90,
+    0x60380E: 159,
+    0xD43D39: 16132,
+    0x4C218C: 16133,
+    0x94A40C: 16134,
+    0x4C917A: 12,
+    0xF48CEB: 329,
+    0x743A65: 485,
+    0x00255C: 485,
+    0x2C4E7D: 16135,
+    0xA4F465: 163,
+    0xCC70ED: 4,
+    0x907E30: 16136,
+    0x84EB3E: 16137,
+    0x9C8275: 4690,
+    0x5CCBCA: 287,
+    0x18BB26: 438,
+    0x34F8E7: 4,
+    0x28E98E: 1696,
+    0x948FCF: 258,
+    0xA8F5DD: 258,
+    0x18B905: 8536,
+    0xECF0FE: 11,
+    0x70B317: 4,
+    0xB00247: 800,
+    0xBCE796: 16138,
+    0x44D3AD: 423,
+    0x7485C4: 21,
+    0xD8CE3A: 40,
+    0xB0907E: 4,
+    0x2C7360: 121,
+    0xD0BAE4: 447,
+    0xC82E47: 16139,
+    0xC02250: 16140,
+    0x043385: 16141,
+    0xE4CA12: 11,
+    0xD49E05: 11,
+    0x585FF6: 11,
+    0x40B30E: 554,
+    0x04CE7E: 16142,
+    0x508CF5: 29,
+    0x1C549E: 638,
+    0x94B01F: 49,
+    0x98CC4D: 16143,
+    0xB8C74A: 69,
+    0x102C6B: 800,
+    0x2453BF: 16144,
+    0x94F6D6: 49,
+    0xF82D7C: 49,
+    0xC09AD0: 49,
+    0xD092FA: 5,
+    0xE85AD1: 5,
+    0x5076AF: 25,
+    0x6C5C3D: 12,
+    0x84E5D8: 16145,
+    0xA8BC9C: 16146,
+    0xA89042: 16147,
+    0x18BE92: 5020,
+    0xC0132B: 854,
+    0x0CB4A4: 16148,
+    0x90633B: 90,
+    0xFCAAB6: 90,
+    0x782327: 90,
+    0xDCF756: 90,
+    0x2CA02F: 16149,
+    0x90C54A: 146,
+    0xBC7596: 16150,
+    0xA0B549: 48,
+    0x001F5A: 16151,
+    0x985D82: 89,
+    0x1C34DA: 270,
+    0x68A47D: 5759,
+    0x184B0D: 272,
+    0xD41243: 800,
+    0x48A6B8: 506,
+    0xB87826: 35,
+    0xDCCBA8: 16152,
+    0xC07878: 4762,
+    0xCCD4A1: 128,
+    0x08BA5F: 12309,
+    0x10DFFC: 344,
+    0x847F3D: 554,
+    0x944F4C: 16153,
+    0x34DAC1: 16154,
+    0x705DCC: 1530,
+    0xA823FE: 244,
+    0x1C599B: 15,
+    0x806933: 15,
+    0xBC26C7: 4,
+    0xE05D5C: 16155,
+    0xE046E5: 16156,
+    0x688F2E: 520,
+    0xD4BD1E: 16157,
+    0xBC5EA1: 16158,
+    0x283926: 540,
+    0xC4FDE6: 16159,
+    0xCC988B: 16160,
+    0x74B587: 49,
+    0xFCB6D8: 49,
+    0x3C6A2C: 12,
+    0x30E3D6: 16161,
+    0xD80D17: 86,
+    0x7405A5: 86,
+    0x286DCD: 8152,
+    0x541031: 16162,
+    0x44A466: 16163,
+    0x8CFCA0: 16164,
+    0x1C427D: 69,
+    0x9CA525: 16165,
+    0xE0456D: 29,
+    0x18810E: 49,
+    0x608C4A: 49,
+    0x241B7A: 49,
+    0x8CFE57: 49,
+    0xC0A600: 49,
+    0xE0C286: 16166,
+    0xF0B014: 427,
+    0x18C2BF: 310,
+    0x0C2A86: 5,
+    0xFC61E9: 5,
+    0x00A0D1: 713,
+    0x0018CC: 16167,
+    0x001827: 16168,
+    0x009004: 716,
+    0x00068C: 717,
+    0x02608C: 717,
+    0x00D0D8: 717,
+    0x18937F: 800,
+    0xA43523: 16169,
+    0xB4A94F: 426,
+    0x803AF4: 5,
+    0x48A0F8: 5,
+    0x405662: 16170,
+    0xE4DB6D: 508,
+    0x0C5331: 16171,
+    0x0C9A42: 438,
+    0xF85E3C: 16172,
+    0x283E76: 16173,
+    0xDC3979: 4,
+    0x58D56E: 329,
+    0xDC9088: 15,
+    0x54812D: 207,
+    0x4062EA: 29,
+    0x44657F: 218,
+    0x304B07: 78,
+    0x345ABA: 16174,
+    0x502FA8: 4,
+    0xC08359: 12,
+    0x8835C1: 8915,
+    0x3042A1: 16175,
+    0x0026B7: 1092,
+    0x000809: 16176,
+    0x8C41F4: 16177,
+    0x704F08: 16178,
+    0x4C0FC7: 121,
+    0x9CF6DD: 12,
+    0x001E80: 309,
+    0x48881E: 16179,
+    0xCC2119: 90,
+    0x80A796: 16180,
+    0x001EEC: 384,
+    0xF0761C: 384,
+    0x0004AE: 16181,
+    0xFCB10D: 16182,
+    0x20F77C: 146,
+    0x00451D: 4,
+    0x000393: 49,
+    0x0000C3: 2625,
+    0xA0D635: 16183,
+    0x3C71BF: 14,
+    0x902BD2: 15,
+    0x08D59D: 3,
+    0xB46921: 25,
+    0x14942F: 16184,
+    0xEC83D5: 16185,
+    0x3C427E: 12,
+    0x30D659: 16186,
+    0x702AD5: 90,
+    0x889765: 16187,
+    0x000BA3: 344,
+    0x34800D: 16188,
+    0xB44BD6: 12,
+    0xD8912A: 112,
+    0x000C8A: 389,
+    0x243A82: 16189,
+    0x880907: 16190,
+    0x40EEDD: 15,
+    0xAC751D: 15,
+    0x289E97: 15,
+    0x001EB0: 16191,
+    0x001525: 16192,
+    0x58A48E: 16193,
+    0x60058A: 16194,
+    0xBC22FB: 16195,
+    0x74B91E: 16196,
+    0xA019B2: 12,
+    0x4C3FD3: 53,
+    0x8C15C7: 15,
+    0x60FA9D: 15,
+    0x386E88: 11,
+    0x641C67: 16197,
+    0xDC9914: 15,
+    0xB05365: 275,
+    0x308841: 33,
+    0x44EFCF: 16198,
+    0x0080B6: 12638,
+    0x08512E: 16199,
+    0x98A404: 228,
+    0x00CC3F: 638,
+    0x74EB80: 90,
+    0x0CE0DC: 90,
+    0xD868C3: 90,
+    0xC493D9: 90,
+    0xA82BB9: 90,
+    0xACFD93: 755,
+    0x000E8F: 463,
+    0x00B8C2: 15849,
+    0xB4B686: 607,
+    0xF4BF80: 15,
+    0x304596: 15,
+    0xC0F4E6: 15,
+    0x68572D: 220,
+    0xA0E617: 16200,
+    0x7001B5: 4,
+    0x001F49: 16201,
+    0x7C2EBD: 210,
+    0x4CEDFB: 398,
+    0xD0B214: 16202,
+    0x88D652: 16203,
+    0xFC90FA: 16204,
+    0xE4E130: 274,
+    0x6CAF15: 16205,
+    0x40F04E: 554,
+    0x0C2138: 16206,
+    0xE0191D: 15,
+    0x68D1BA: 574,
+    0xE46059: 16207,
+    0x4050B5: 16208,
+    0x1C1AC0: 49,
+    0x3078C2: 16209,
+    0x800588: 138,
+    0x3C15FB: 15,
+    0xDC330D: 4830,
+    0xE0383F: 11,
+    0xD47226: 11,
+    0x0021F2: 16210,
+    0x0015C4: 16211,
+    0x00CFC0: 29,
+    0xAC35EE: 438,
+    0x0C2C54: 15,
+    0x881196: 15,
+    0xE40EEE: 15,
+    0x28D997: 16212,
+    0x0011E6: 2729,
+    0x88AE07: 49,
+    0x40831D: 49,
+    0xDCD3A2: 49,
+    0x5C1DD9: 49,
+    0x68FEF7: 49,
+    0xF00E1D: 4738,
+    0x24F128: 16213,
+    0x70695A: 4,
+    0x00BF77: 4,
+    0xD07714: 78,
+    0x30B7D4: 520,
+    0xB481BF: 16214,
+    0x946AB0: 48,
+    0x4818FA: 16215,
+    0x587A6A: 69,
+    0xE81AAC: 16216,
+    0xA038F8: 16217,
+    0x687924: 16218,
+    0xD4C19E: 272,
+    0x0CAE7D: 53,
+    0x304511: 53,
+    0x301F9A: 12,
+    0x28FD80: 12,
+    0x000758: 16219,
+    0xD49398: 882,
+    0x001937: 16220,
+    0xFC7C02: 722,
+    0xA8610A: 16221,
+    0x6097DD: 16222,
+    0x047970: 15,
+    0xA057E3: 15,
+    0xF8DF15: 412,
+    0xB02680: 4,
+    0xF0FCC8: 258,
+    0xD46D6D: 25,
+    0xB41C30: 11,
+    0x705AAC: 90,
+    0x609813: 16223,
+    0x1CB044: 234,
+    0x2C9569: 258,
+    0x38DEAD: 25,
+    0xF4844C: 53,
+    0x4C82CF: 4679,
+    0x285767: 4679,
+    0x70169F: 16224,
+    0xA039EE: 3,
+    0x689861: 16225,
+    0xB4F2E8: 258,
+    0x3C574F: 29,
+    0x847460: 11,
+    0x506B4B: 270,
+    0x1CA0B8: 589,
+    0x2C61F6: 49,
+    0xD4A33D: 49,
+    0x044F17: 132,
+    0x0CA8A7: 90,
+    0xB0672F: 16226,
+    0x10CD6E: 16227,
+    0xE4CB59: 16228,
+    0xB4E62D: 14,
+    0xF0766F: 49,
+    0x4098AD: 49,
+    0x6C4D73: 49,
+    0xD89C67: 885,
+    0x685ACF: 90,
+    0x64209F: 8728,
+    0xA43E51: 1214,
+    0xD86375: 40,
+    0x68EF43: 49,
+    0xD02B20: 49,
+    0x702605: 16160,
+    0x005013: 818,
+    0x0090F1: 818,
+    0x845A81: 16229,
+    0xCC81DA: 722,
+    0x00806C: 16230,
+    0x1C27DD: 16231,
+    0xB8C8EB: 163,
+    0x80C5F2: 43,
+    0x64F88A: 275,
+    0x68DB54: 722,
+    0xC8DF84: 53,
+    0x240D6C: 16232,
+    0xB45253: 4869,
+    0x0011C6: 4869,
+    0x001D38: 4869,
+    0xE48F34: 104,
+    0xD8E004: 16233,
+    0x2CFDAB: 443,
+    0x30B4B8: 244,
+    0x3873EA: 12,
+    0x4C5262: 13174,
+    0x803BF6: 16234,
+    0x30EB1F: 16235,
+    0x549A4C: 16236,
+    0x0CCEF6: 16237,
+    0x1806FF: 16238,
+    0xEC1D8B: 4,
+    0xEC7097: 258,
+    0x5819F8: 258,
+    0xD07FC4: 16239,
+    0x1479F3: 29,
+    0x48555C: 513,
+    0x18F0E4: 40,
+    0x380E4D: 4,
+    0xC4CD82: 16240,
+    0x30FB94: 16241,
+    0xA4B52E: 554,
+    0x9C8C6E: 90,
+    0xDC4F22: 14,
+    0xF86CE1: 278,
+    0x1C7328: 8314,
+    0x08BA22: 16242,
+    0x28C13C: 589,
+    0x0023A0: 16243,
+    0xF406A5: 16244,
+    0xB0ECE1: 13,
+    0x60E78A: 16245,
+    0x64CBA3: 16246,
+    0x3CA581: 146,
+    0x34E911: 146,
+    0x1046B4: 16247,
+    0x9CE33F: 49,
+    0x7867D7: 49,
+    0xB8C111: 49,
+    0x002424: 16248,
+    0x50C9A0: 16249,
+    0x7483EF: 89,
+    0x00E0F6: 16250,
+    0x001248: 848,
+    0x006048: 848,
+    0x7CC95A: 848,
+    0x00BF61: 90,
+    0xECFABC: 14,
+    0xCC2DE0: 439,
+    0x389D92: 378,
+    0xA07099: 16251,
+    0xDC5583: 69,
+    0xF8F21E: 25,
+    0x282986: 16252,
+    0x707DB9: 4,
+    0x08BEAC: 1111,
+    0x8C0F83: 16253,
+    0xD00401: 78,
+    0x742857: 16254,
+    0x589043: 3,
+    0x24E124: 4382,
+    0xDC68EB: 35,
+    0xE8361D: 16255,
+    0xA407B6: 90,
+    0x40498A: 16256,
+    0x087808: 90,
+    0x887598: 90,
+    0xC0174D: 90,
+    0x7091F3: 638,
+    0x080069: 870,
+    0x002291: 4,
+    0x10FCB6: 16257,
+    0x04D6AA: 305,
+    0xC89F42: 16258,
+    0x50A83A: 16259,
+    0x6405E9: 16260,
+    0xF4F5DB: 40,
+    0xD0666D: 16261,
+    0x08152F: 4788,
+    0x0C5842: 16262,
+    0xBC825D: 155,
+    0xCC2237: 12,
+    0x48D6D5: 210,
+    0x20F19E: 258,
+    0x38D620: 16263,
+    0x104963: 16264,
+    0x8CE38E: 16265,
+    0x186024: 607,
+    0x8CD48E: 163,
+    0x642B8A: 16266,
+    0x00149D: 16267,
+    0xA8E824: 16268,
+    0xBC3D85: 15,
+    0x2054FA: 15,
+    0x38378B: 15,
+    0x745C4B: 27,
+    0x74F91A: 16269,
+    0xA434F1: 53,
+    0xEC0441: 16270,
+    0xB8EE0E: 3,
+    0xC0A53E: 49,
+    0xB0350B: 1069,
+    0x28A6AC: 16271,
+    0xECD09F: 40,
+    0x78E103: 77,
+    0x78A6E1: 1183,
+    0xE4EC10: 882,
+    0x000659: 16272,
+    0xA8BE27: 49,
+    0x002692: 1696,
+    0x00C08F: 7633,
+    0x6C090A: 16273,
+    0x70E1FD: 8655,
+    0x74E60F: 231,
+    0x001AA7: 16274,
+    0x444E6D: 427,
+    0x90B1E0: 16275,
+    0x8014A8: 339,
+    0x586163: 16276,
+    0x002EC7: 15,
+    0x488EEF: 15,
+    0x8CC121: 878,
+    0xACBE75: 16277,
+    0x409BCD: 329,
+    0x0CB459: 16278,
+    0x94D029: 69,
+    0x308454: 69,
+    0x5C0339: 15,
+    0xEC3DFD: 664,
+    0x547595: 86,
+    0xC47154: 86,
+    0xF82819: 192,
+    0x50E971: 16279,
+    0x58C583: 163,
+    0x18204C: 16280,
+    0x18D225: 5,
+    0x0840F3: 901,
+    0x94FBB2: 725,
+    0x00C05D: 16281,
+    0x30F77F: 16259,
+    0xD86C63: 210,
+    0x001E99: 16282,
+    0x58B633: 272,
+    0x543D37: 272,
+    0x2CE6CC: 272,
+    0x5C5181: 90,
+    0x608E08: 90,
+    0x00227F: 272,
+    0x74911A: 272,
+    0xC8DB26: 4426,
+    0xA40E2B: 12545,
+    0xF88A3C: 12,
+    0xA40450: 16007,
+    0xFC5A1D: 520,
+    0x94147A: 146,
+    0x18B430: 8783,
+    0x30B164: 16283,
+    0x9828A6: 384,
+    0x001B17: 95,
+    0x58493B: 95,
+    0x786D94: 95,
+    0xF430B9: 607,
+    0x14612F: 470,
+    0x00309D: 16284,
+    0x8C210A: 86,
+    0x4C189A: 69,
+    0xCC4B73: 800,
+    0x681DEF: 16285,
+    0xAC203E: 733,
+    0xB01F29: 16286,
+    0x54C9DF: 438,
+    0xA47886: 470,
+    0x0403D6: 35,
+    0xAC4E2E: 1143,
+    0x4C910C: 16287,
+    0x0015DC: 16288,
+    0x00187D: 16289,
+    0x880F10: 16290,
+    0x5C1A6F: 820,
+    0x3C4CD0: 8552,
+    0xF40E83: 258,
+    0x98F7D7: 258,
+    0x206BE7: 86,
+    0x182CB4: 16291,
+    0x2C3AE8: 14,
+    0x88BD78: 4228,
+    0x58C5CB: 90,
+    0xB4BFF6: 90,
+    0xEC363F: 16292,
+    0x5804CB: 16293,
+    0xB8FFB3: 128,
+    0x982DBA: 16294,
+    0xE0D55E: 538,
+    0xA040A0: 511,
+    0x00A38E: 4,
+    0xA0C9A0: 102,
+    0x74F61C: 983,
+    0x84C0EF: 90,
+    0x000D2B: 16295,
+    0x004066: 16296,
+    0x48A74E: 11,
+    0xBC8AE8: 4830,
+    0xF4DE0C: 16297,
+    0x28C63F: 25,
+    0x88CC45: 560,
+    0xCC90E8: 574,
+    0x3C5282: 607,
+    0x08ED02: 12,
+    0x84A9C4: 15,
+    0xA0086F: 15,
+    0xD06F82: 15,
+    0xA0F479: 15,
+    0x844765: 15,
+    0xC4FF1F: 15,
+    0x7C4F7D: 16298,
+    0x9CAC6D: 638,
+    0x600837: 16299,
+    0xE8FDE8: 16300,
+    0xC40BCB: 40,
+    0x60D7E3: 12,
+    0x1893D7: 53,
+    0xA8B86E: 514,
+    0x84AFEC: 310,
+    0x7C7B8B: 16301,
+    0xB83765: 69,
+    0x345BBB: 167,
+    0x34CE00: 698,
+    0xD0498B: 16302,
+    0x0827CE: 16303,
+    0x00219E: 133,
+    0xACB57D: 192,
+    0xD4619D: 49,
+    0x98DDEA: 444,
+    0x001D44: 16304,
+    0xA8A198: 274,
+    0x08EA40: 664,
+    0x00D095: 215,
+    0x0020DA: 215,
+    0xA0C4A5: 16305,
+    0x6C5976: 11910,
+    0x14BD61: 49,
+    0x5CC6E9: 4229,
+    0xEC4F82: 218,
+    0x002CC8: 4,
+    0xC0028D: 16306,
+    0xE89FEC: 4540,
+    0x802689: 329,
+    0xF8AB05: 3,
+    0x503A7D: 16307,
+    0xF4C4D6: 16308,
+    0x7C5049: 49,
+    0xE47DEB: 16309,
+    0xD8325A: 574,
+    0x9CDA3E: 25,
+    0x283F69: 133,
+    0xD83214: 901,
+    0x10954B: 16310,
+    0xC4B9CD: 4,
+    0xE0C0D1: 752,
+    0xC0D3C0: 90,
+    0x948BC1: 90,
+    0x14568E: 90,
+    0x6837E9: 77,
+    0x2CA17D: 258,
+    0x001081: 16311,
+    0x40F385: 12,
+    0x887873: 25,
+    0xF87588: 15,
+    0xF44C7F: 15,
+    0x64B473: 40,
+    0x7451BA: 40,
+    0x6CB4A7: 16312,
+    0xF8A5C5: 4,
+    0x7C5A1C: 66,
+    0xB0F1EC: 800,
+    0x542B57: 16313,
+    0x7802F8: 40,
+    0x00238A: 655,
+    0x080027: 4947,
+    0x2C4D54: 398,
+    0x349672: 86,
+    0x702084: 589,
+    0x9C6650: 16314,
+    0xD461FE: 955,
+    0x501E2D: 16315,
+    0xA0A33B: 15,
+    0xEC01EE: 69,
+    0x6049C1: 470,
+    0xE45D51: 4542,
+    0x7C67A2: 25,
+    0x00E05A: 16316,
+    0xF06E32: 16317,
+    0xC43018: 8559,
+    0x6831FE: 16318,
+    0x2816AD: 25,
+    0xD0FF98: 15,
+    0x94652D: 71,
+    0x0060D3: 810,
+    0x848DC7: 1185,
+    0x045D4B: 133,
+    0x78AF58: 16319,
+    0x1CB857: 16320,
+    0x48A380: 5049,
+    0x682737: 90,
+    0x001992: 262,
+    0x3CF862: 25,
+    0xB0E5ED: 15,
+    0xC486E9: 15,
+    0x344B3D: 5,
+    0x8C9351: 16321,
+    0xD838FC: 272,
+    0x2C0BE9: 4,
+    0x90505A: 16322,
+    0x3478D7: 5049,
+    0x5CCCA0: 16323,
+    0x20AB37: 49,
+    0x60F445: 49,
+    0xE0A700: 16324,
+    0x58404E: 49,
+    0xD0C5F3: 49,
+    0xBC9FEF: 49,
+    0x5800E3: 192,
+    0x000AE4: 4957,
+    0xA408F5: 3,
+    0x00B091: 16325,
+    0xACC662: 128,
+    0x886B44: 276,
+    0xFC3CE9: 16326,
+    0xA4580F: 12,
+    0x48F97C: 5,
+    0xC0BFC0: 15,
+    0xA08CF8: 15,
+    0x101331: 1134,
+    0x4CB81C: 16327,
+    0x44D244: 378,
+    0x7CF95C: 16328,
+    0xC8F733: 25,
+    0xA03D6F: 4,
+    0xA0E0AF: 4,
+    0xA4E6B1: 16329,
+    0xC09C04: 16330,
+    0xACD657: 16330,
+    0x3CEF8C: 510,
+    0x8C2FA6: 16331,
+    0x8C192D: 12,
+    0x00ACE0: 258,
+    0x6473E2: 16332,
+    0xE45D52: 470,
+    0x94E979: 192,
+    0xB49691: 25,
+    0x007686: 4,
+    0xD0608C: 11,
+    0x7C03C9: 574,
+    0x003048: 974,
+    0x9CD9CB: 16333,
+    0xB8E937: 506,
+    0xAC233F: 16334,
+    0x3C80AA: 16335,
+    0x88C626: 4971,
+    0x0023F7: 13,
+    0xD4C8B0: 11059,
+    0x0481AE: 16336,
+    0x9C13AB: 16337,
+    0x703D15: 955,
+    0xE49E12: 524,
+    0x18F292: 16338,
+    0x8CEA1B: 87,
+    0x2420C7: 3,
+    0x446AB7: 258,
+    0x701CE7: 25,
+    0x9C2A70: 885,
+    0x58E16C: 16339,
+    0xC82158: 25,
+    0x98E476: 16340,
+    0x14A51A: 15,
+    0x047503: 15,
+    0x50B363: 16341,
+    0xD4E90B: 16342,
+    0xCCB0DA: 192,
+    0xA4D9A4: 16343,
+    0xE02CF3: 16344,
+    0x2C0E3D: 305,
+    0x487A55: 12650,
+    0x001EAE: 356,
+    0x2CBABA: 90,
+    0x40D3AE: 90,
+    0x2CDD95: 278,
+    0x88E87F: 49,
+    0x9CF48E: 49,
+    0x5CF7E6: 49,
+    0xB853AC: 49,
+    0x203CAE: 49,
+    0xA03BE3: 49,
+    0x4C3275: 49,
+    0x9C7DA3: 15,
+    0xA4C64F: 15,
+    0x00D78F: 4,
+    0x107223: 351,
+    0xD03DC3: 16345,
+    0xEC01E2: 16346,
+    0xE0686D: 16347,
+    0xCCFD17: 274,
+    0x502B73: 901,
+    0xB4E782: 16348,
+    0x4409B8: 16349,
+    0x04BA36: 16350,
+    0xB4F81E: 16351,
+    0x001628: 16352,
+    0x702E22: 11,
+    0x3816D1: 90,
+    0xD0176A: 90,
+    0xD48890: 90,
+    0x5492BE: 90,
+    0x1861C7: 16353,
+    0x205D47: 146,
+    0x10C60C: 16354,
+    0x043110: 8495,
+    0x949AA9: 157,
+    0xACAB2E: 16355,
+    0x000678: 3337,
+    0x884CCF: 16356,
+    0xE0286D: 427,
+    0x981888: 20,
+    0x4CC8A1: 20,
+    0xC8B21E: 483,
+    0x600B03: 955,
+    0xA0AB1B: 329,
+    0xD842E2: 16357,
+    0xC8E776: 16358,
+    0x302303: 1006,
+    0xAC17C8: 20,
+    0xE41218: 9633,
+    0x001984: 16359,
+    0x00212F: 16360,
+    0x3859F9: 885,
+    0xEC55F9: 885,
+    0x001A8A: 90,
+    0x3C5A37: 90,
+    0xF49F54: 90,
+    0x34C3AC: 90,
+    0x44F459: 90,
+    0x00265D: 90,
+    0x002567: 90,
+    0xBCB1F3: 90,
+    0x5C0A5B: 1016,
+    0x8056F2: 885,
+    0x000278: 1016,
+    0x002399: 90,
+    0x7CF854: 90,
+    0x7CE9D3: 885,
+    0x1C3E84: 885,
+    0xB8763F: 885,
+    0x60F494: 885,
+    0x906EBB: 885,
+    0x18F46A: 885,
+    0x4C0F6E: 885,
+    0x78E400: 885,
+    0xC4731E: 90,
+    0x001C43: 90,
+    0x0023D6: 90,
+    0x001B98: 90,
+    0x44D6E1: 16361,
+    0x486DBB: 229,
+    0x002A10: 4,
+    0x00A289: 4,
+    0x44E9DD: 3,
+    0x000F5E: 16362,
+    0x001328: 16363,
+    0xB8BF83: 25,
+    0x84E0F4: 12,
+    0xD83062: 49,
+    0x7C79E8: 16364,
+    0xA43111: 498,
+    0x008073: 16365,
+    0x80A1D7: 1043,
+    0xEC1F72: 305,
+    0x8C0D76: 15,
+    0x84BE52: 15,
+    0x849FB5: 15,
+    0xA4CAA0: 15,
+    0x14F42A: 90,
+    0x0808C2: 90,
+    0xCCFE3C: 90,
+    0x28BAB5: 90,
+    0xE440E2: 90,
+    0x103B59: 90,
+    0xD890E8: 90,
+    0xE4121D: 90,
+    0xE8508B: 305,
+    0xF8042E: 305,
+    0x1C62B8: 90,
+    0xCCF9E8: 90,
+    0xD857EF: 90,
+    0x18E2C2: 90,
+    0x9852B1: 90,
+    0xC462EA: 90,
+    0x182666: 90,
+    0x30D6C9: 90,
+    0xCC07AB: 90,
+    0xB43A28: 90,
+    0x78A873: 90,
+    0xBC8AA3: 16366,
+    0x04BBF9: 16367,
+    0x58FB84: 25,
+    0x8C6102: 16368,
+    0x548CA0: 192,
+    0x345760: 128,
+    0xC0D391: 12,
+    0xD49B5C: 16369,
+    0x00C017: 16370,
+    0x5CB066: 258,
+    0x002261: 8892,
+    0xA0C562: 258,
+    0x8496D8: 258,
+    0x0026D9: 258,
+    0xE8EB11: 53,
+    0x00D037: 258,
+    0x84E058: 258,
+    0x707630: 258,
+    0xD0E54D: 258,
+    0x3C6FEA: 16371,
+    0x001988: 16372,
+    0x18DC56: 1030,
+    0x0016F2: 16373,
+    0x44BFE3: 16374,
+    0x34074F: 16375,
+    0xB4A984: 14532,
+    0x00E011: 16376,
+    0x002555: 1027,
+    0x58986F: 16377,
+    0xC81FBE: 15,
+    0x203DB2: 15,
+    0x48D539: 15,
+    0xC88D83: 15,
+    0xB0B28F: 3,
+    0x441441: 16378,
+    0x001F9A: 1034,
+    0x000A0E: 16379,
+    0x000438: 1034,
+    0x000EC0: 1034,
+    0x3C404F: 16380,
+    0xD84FB8: 16381,
+    0x000AEB: 86,
+    0x60EE5C: 989,
+    0x6488FF: 854,
+    0xC4084A: 81,
+    0x000801: 16382,
+    0x000772: 817,
+    0xE03005: 817,
+    0x001E7E: 1034,
+    0x001365: 1034,
+    0x002162: 1034,
+    0x02E6D3: 3970,
+    0x0CA402: 2155,
+    0xA0F3E4: 2155,
+    0x84DBFC: 81,
+    0x0016B9: 1040,
+    0x001660: 1034,
+    0x00AA70: 514,
+    0xF895C7: 514,
+    0x84D931: 955,
+    0x7CFC3C: 114,
+    0x4888CA: 443,
+    0x385610: 16383,
+    0x00A742: 4,
+    0x2C3731: 16384,
+    0x00116E: 4482,
+    0x540955: 11,
+    0xC041F6: 1047,
+    0x001E75: 514,
+    0x001C62: 514,
+    0x505527: 514,
+    0x88C9D0: 514,
+    0x8C3AE3: 514,
+    0xD0052A: 48,
+    0xEC6881: 95,
+    0xE4509A: 16385,
+    0x702900: 16386,
+    0xECAAA0: 814,
+    0x60E3AC: 514,
+    0x90F052: 5046,
+    0x90A46A: 16387,
+    0x14E7C8: 554,
+    0xECCD6D: 1160,
+    0x981E0F: 16388,
+    0x9CA3A9: 16389,
+    0x7CC709: 787,
+    0x18339D: 4,
+    0x146102: 5043,
+    0x54276C: 16390,
+    0x0821EF: 90,
+    0x34145F: 90,
+    0xA03E6B: 12,
+    0x9802D8: 12,
+    0x64FB81: 12,
+    0x2C265F: 12,
+    0x8CFDF0: 1053,
+    0xC4BB4C: 16391,
+    0x98CF53: 5036,
+    0xD4A148: 15,
+    0x4C0BBE: 1989,
+    0x0C2576: 8589,
+    0xD8D43C: 133,
+    0x486B2C: 5036,
+    0x6C25B9: 5036,
+    0x2C282D: 5036,
+    0x4813F3: 5036,
+    0x00409F: 1067,
+    0x00001F: 1067,
+    0x00A012: 1067,
+    0xF0DEF1: 1063,
+    0xF80F41: 1063,
+    0x3C970E: 761,
+    0x30144A: 57,
+    0xD065CA: 15,
+    0x8CEBC6: 15,
+    0xB08900: 15,
+    0x00E0DD: 8917,
+    0x50CE75: 16392,
+    0x001639: 16393,
+    0x001597: 16394,
+    0x002397: 5031,
+    0x00045B: 16395,
+    0x0007BA: 16396,
+    0x90A210: 16397,
+    0x6C0B84: 61,
+    0x78CB68: 833,
+    0x000B0E: 9924,
+    0x000C29: 8914,
+    0x000569: 8914,
+    0xE4029B: 25,
+    0xDC1AC5: 146,
+    0xB456B9: 16398,
+    0x9CDD1F: 16399,
+    0x3C6816: 1081,
+    0xE811CA: 16400,
+    0x00C000: 16401,
+    0x845181: 90,
+    0xA8FCB7: 16402,
+    0xC816BD: 906,
+    0x00EBD5: 4,
+    0x34ED0B: 16403,
+    0x90EF68: 112,
+    0xF45EAB: 53,
+    0xC4A366: 11,
+    0x6073BC: 11,
+    0x18B169: 3316,
+    0x444450: 16404,
+    0x50F5DA: 77,
+    0x101212: 16405,
+    0xF03EBF: 16406,
+    0xC48F07: 16407,
+    0xDC7834: 16408,
+    0xD0577B: 25,
+    0x6C9522: 16409,
+    0xA8BB50: 16410,
+    0x3C92DC: 16411,
+    0x08C021: 15,
+    0x600810: 15,
+    0x48435A: 15,
+    0x78FFCA: 231,
+    0x046565: 16412,
+    0x7C3548: 16413,
+    0x78009E: 90,
+    0xACC33A: 90,
+    0x54F201: 90,
+    0x70288B: 90,
+    0x348A7B: 90,
+    0x1000FD: 16414,
+    0xC47C8D: 12,
+    0x848319: 16415,
+    0x7CB0C2: 25,
+    0xA81559: 16416,
+    0xC4CAD9: 955,
+    0x5866BA: 955,
+    0x70BAEF: 955,
+    0x586AB1: 955,
+    0x009006: 15791,
+    0x001AF4: 16092,
+    0xE00EDA: 4,
+    0x4C0B3A: 274,
+    0xE42D02: 274,
+    0x0CBD51: 274,
+    0x745C9F: 274,
+    0x8C99E6: 274,
+    0x449F7F: 16417,
+    0x001793: 16418,
+    0x000358: 5490,
+    0x8C8EF2: 49,
+    0x90B0ED: 49,
+    0x04D3CF: 49,
+    0x4882F2: 16419,
+    0xE0C79D: 53,
+    0x00177D: 9263,
+    0x00A045: 4303,
+    0x4000E0: 16420,
+    0xFCBC9C: 16421,
+    0xE80959: 16422,
+    0xF0407B: 5,
+    0x94885E: 16423,
+    0x945089: 16424,
+    0x0024F4: 16425,
+    0x001A29: 13303,
+    0x0090AE: 1060,
+    0x042AE2: 4,
+    0xE0B6F5: 12,
+    0xD0A4B1: 16426,
+    0x50DD4F: 16427,
+    0x341FE4: 258,
+    0xF49EEF: 278,
+    0x002378: 5069,
+    0x50C971: 5069,
+    0xC4F081: 15,
+    0x801382: 15,
+    0x94FE22: 15,
+    0x00409C: 16428,
+    0x608334: 15,
+    0xE47E66: 15,
+    0x94DBDA: 15,
+    0xB01BD2: 948,
+    0x54489C: 16429,
+    0x1C3ADE: 90,
+    0x002360: 16430,
+    0x986B3D: 258,
+    0xF462D0: 16431,
+    0x84002D: 814,
+    0x408256: 16432,
+    0xE4A1E6: 817,
+    0x1CABC0: 520,
+    0xC825E1: 16433,
+    0x54D9E4: 16434,
+    0x0090FA: 1102,
+    0x00E0D5: 1102,
+    0x84FEDC: 16435,
+    0x001035: 1101,
+    0x000AE6: 1101,
+    0x7427EA: 1101,
+    0x649968: 5067,
+    0x98DED0: 86,
+    0x005BA1: 16436,
+    0x58D67A: 16437,
+    0x5CC7D7: 16438,
+    0x509EA7: 90,
+    0xA88195: 90,
+    0x88ADD2: 90,
+    0xA4BF01: 25,
+    0x10DA43: 511,
+    0xB805AB: 11,
+    0x789682: 11,
+    0xC4BED4: 470,
+    0xD017C2: 398,
+    0x98072D: 53,
+    0xF0C77F: 53,
+    0xD467E7: 5,
+    0xE42F26: 5,
+    0x04C1B9: 5,
+    0x349971: 12363,
+    0x9C52F8: 15,
+    0x5CF286: 12,
+    0xE8FD72: 16439,
+    0x98BB1E: 569,
+    0x04C103: 9322,
+    0x280C28: 16440,
+    0x00CCFC: 4,
+    0x08BE77: 16441,
+    0xAC5F3E: 305,
+    0x546D52: 16442,
+    0x545AA6: 14,
+    0xFC1A11: 146,
+    0x38FDFE: 12,
+    0x2C09CB: 16443,
+    0x208B37: 560,
+    0x002340: 12687,
+    0xB48B19: 49,
+    0xBCEC5D: 49,
+    0x28A02B: 49,
+    0x0019C5: 141,
+    0x001315: 141,
+    0x001E1E: 16444,
+    0xA0C589: 25,
+    0x1C234F: 5086,
+    0xA444D1: 1162,
+    0x006CFD: 854,
+    0x907282: 3,
+    0x38B8EB: 12,
+    0x9897D1: 128,
+    0xB83241: 733,
+    0x0060DC: 14301,
+    0x0023B4: 889,
+    0x002548: 889,
+    0x0022FC: 889,
+    0x0022FD: 889,
+    0x0021AA: 889,
+    0x001D6E: 889,
+    0x001370: 889,
+    0x9C1874: 889,
+    0x001BAF: 889,
+    0x001C35: 889,
+    0x001C9A: 889,
+    0x001CD6: 889,
+    0x001CD4: 889,
+    0x001D98: 889,
+    0x001DE9: 889,
+    0x001E3A: 889,
+    0xC8D10B: 882,
+    0xA84481: 882,
+    0x8844F6: 882,
+    0xF44D17: 16445,
+    0x0030FF: 16446,
+    0x000FF6: 16447,
+    0xCC6DA0: 1141,
+    0x0016E4: 16448,
+    0x3C8970: 16449,
+    0x78CA83: 12,
+    0x0C1167: 4,
+    0x74EAE8: 258,
+    0x001742: 621,
+    0x001999: 13174,
+    0x005A39: 989,
+    0xA089E4: 560,
+    0x5CC6D0: 560,
+    0x001A9A: 560,
+    0x50F520: 90,
+    0x64B310: 90,
+    0xA4EBD3: 90,
+    0xB8C68E: 90,
+    0x04FE31: 90,
+    0x4CBCA5: 90,
+    0xF88E85: 829,
+    0x02CF1C: 5099,
+    0x0090F5: 352,
+    0x002100: 182,
+    0xD831CF: 90,
+    0xB0D09C: 90,
+    0x50C8E5: 90,
+    0x188331: 90,
+    0x9C65B0: 90,
+    0x8455A5: 90,
+    0xA87C01: 90,
+    0xE01D3B: 820,
+    0xC81073: 16450,
+    0x343759: 11,
+    0xFC2F40: 9306,
+    0xBC620E: 15,
+    0x74A528: 15,
+    0x001D19: 1149,
+    0x0012BF: 1149,
+    0x507E5D: 1149,
+    0x7C4FB5: 1149,
+    0x0020D4: 1136,
+    0x00E03A: 1136,
+    0x70C76F: 16451,
+    0x38192F: 882,
+    0x0010E7: 7361,
+    0x5CF6DC: 90,
+    0x0026E4: 16452,
+    0x000117: 16452,
+    0xF40B93: 1151,
+    0x1C69A5: 1151,
+    0x94EBCD: 1151,
+    0x0026FF: 1151,
+    0xA4E4B8: 1151,
+    0x803773: 511,
+    0xA42B8C: 511,
+    0x28C68E: 511,
+    0x04A151: 511,
+    0xF87394: 511,
+    0x204E7F: 511,
+    0xC03F0E: 511,
+    0x0026F2: 511,
+    0x003067: 13242,
+    0x9492BC: 16453,
+    0x00223F: 511,
+    0x000FB5: 511,
+    0x00095B: 511,
+    0x001A4F: 857,
+    0x001C4A: 857,
+    0x00150C: 857,
+    0x000B06: 258,
+    0x00D088: 258,
+    0x00128A: 258,
+    0x0011AE: 258,
+    0x94CCB9: 258,
+    0x001700: 258,
+    0x0016B5: 258,
+    0x0015A8: 258,
+    0x00159A: 258,
+    0x001180: 258,
+    0x001404: 258,
+    0x001AAD: 258,
+    0xCC7D37: 258,
+    0xA47AA4: 258,
+    0x74E7C6: 258,
+    0x0024C1: 258,
+    0x0025F2: 258,
+    0x0025F1: 258,
+    0x0026BA: 258,
+    0x00230B: 258,
+    0x002375: 258,
+    0x0023A3: 258,
+    0x001ADB: 258,
+    0x001F7E: 258,
+    0x001C12: 258,
+    0x00138F: 5104,
+    0x34C3D2: 438,
+    0x54F6C5: 287,
+    0x409558: 16454,
+    0x182861: 1153,
+    0x446D57: 192,
+    0x9CB70D: 192,
+    0x68A3C4: 192,
+    0x70F1A1: 192,
+    0xEC086B: 86,
+    0x00D9D1: 141,
+    0xB00594: 192,
+    0x28E347: 192,
+    0x94A1A2: 800,
+    0x00014A: 133,
+    0x001EDC: 133,
+    0x001D28: 133,
+    0x8400D2: 133,
+    0x303926: 133,
+    0x00EB2D: 133,
+    0xB4527D: 133,
+    0x5C338E: 1159,
+    0x3C438E: 258,
+    0x983B16: 800,
+    0x001CA2: 1155,
+    0x002233: 1155,
+    0x3039F2: 1155,
+    0x0017C2: 1155,
+    0x001813: 133,
+    0x402BA1: 133,
+    0x9C0E4A: 16455,
+    0xA85840: 820,
+    0xA0D37A: 25,
+    0x8896F2: 16456,
+    0x44D832: 43,
+    0xE0B9A5: 43,
+    0x781881: 43,
+    0x6C71D9: 43,
+    0xD0E782: 43,
+    0x6CADF8: 43,
+    0xA81D16: 43,
+    0xB046FC: 128,
+    0xE04136: 128,
+    0x0015AF: 43,
+    0x74F06D: 43,
+    0xD0D412: 1155,
+    0x0026B8: 659,
+    0x0026FC: 1156,
+    0x689C5E: 1156,
+    0x001073: 16457,
+    0x20934D: 287,
+    0x009027: 1177,
+    0x00A0C9: 1177,
+    0xB80305: 25,
+    0x3407FB: 228,
+    0xA4A1C2: 228,
+    0xE09796: 15,
+    0x000D72: 1166,
+    0x001288: 1166,
+    0x00217C: 1166,
+    0x001FB3: 1166,
+    0x28162E: 1166,
+    0xF81897: 1166,
+    0x94C150: 1166,
+    0x5CF821: 53,
+    0x141FBA: 12,
+    0x807B85: 12,
+    0xCC1BE0: 12,
+    0xF40E11: 12,
+    0xC48508: 25,
+    0x6805CA: 25,
+    0x8CA982: 25,
+    0xBC7737: 25,
+    0x1430C6: 78,
+    0x141AA3: 78,
+    0x247703: 25,
+    0x74E50B: 25,
+    0xD8FC93: 25,
+    0x0057D2: 4,
+    0x3C6716: 16458,
+    0x2C228B: 16459,
+    0x0C6F9C: 16460,
+    0x00D0BD: 16461,
+    0x001F3A: 885,
+    0x647BD4: 53,
+    0xD8952F: 53,
+    0xB8FFFE: 53,
+    0x88074B: 514,
+    0xF4EB38: 3,
+    0x001BBF: 3,
+    0x002569: 3,
+    0xC8A030: 53,
+    0x78C5E5: 53,
+    0x0CFD37: 16462,
+    0x00789E: 3,
+    0xE8BE81: 3,
+    0x681590: 3,
+    0x10F681: 146,
+    0x2CE412: 3,
+    0x04E451: 53,
+    0x505663: 53,
+    0x883314: 53,
+    0x44C15C: 53,
+    0x0022A5: 53,
+    0x0017E4: 53,
+    0x002275: 1006,
+    0x78E3B5: 607,
+    0x78ACC0: 607,
+    0x68B599: 607,
+    0x1CC1DE: 607,
+    0x3C3556: 16463,
+    0x3C9066: 12389,
+    0x000D88: 1167,
+    0x001195: 1167,
+    0xB8A386: 329,
+    0x1C7EE5: 329,
+    0x3CCF5B: 8712,
+    0x2405F5: 554,
+    0x00738D: 423,
+    0xE043DB: 16464,
+    0xF40304: 210,
+    0x546009: 210,
+    0xA47733: 210,
+    0x00E0FC: 15,
+    0x001346: 1167,
+    0x1CBDB9: 329,
+    0x9CDFB1: 8694,
+    0x606944: 49,
+    0x78F882: 514,
+    0xC02C7A: 12330,
+    0x1CCB99: 274,
+    0xA42BB0: 86,
+    0x807ABF: 983,
+    0x34BA75: 16465,
+    0x7C18CD: 16466,
+    0x94ABDE: 16467,
+    0x6416F0: 15,
+    0xACCF85: 15,
+    0x188B45: 4,
+    0xF4CA24: 16468,
+    0x00142F: 16469,
+    0x28BC18: 16470,
+    0x00D0B7: 1177,
+    0x001DCE: 258,
+    0x001DD6: 258,
+    0x3871DE: 49,
+    0x7081EB: 49,
+    0x000E35: 1177,
+    0x0007E9: 1177,
+    0x0013E8: 25,
+    0x0013CE: 25,
+    0xB8B81E: 25,
+    0xB46D83: 25,
+    0x903EAB: 258,
+    0x306023: 258,
+    0x14ABF0: 258,
+    0x901ACA: 258,
+    0xC83FB4: 258,
+    0xE0B70A: 258,
+    0x2C768A: 607,
+    0xC8348E: 25,
+    0x4C3488: 25,
+    0x1002B5: 25,
+    0x001708: 607,
+    0x0017A4: 607,
+    0xBCEAFA: 607,
+    0x004026: 310,
+    0x4CE676: 310,
+    0x000BCD: 607,
+    0x000F20: 607,
+    0x00110A: 607,
+    0xC005C2: 258,
+    0x1C7839: 8999,
+    0x0453D5: 16471,
+    0xEC52DC: 16472,
+    0x94B2CC: 1187,
+    0x08EB74: 132,
+    0x2832C5: 132,
+    0x88C255: 53,
+    0xCC78AB: 53,
+    0x5820B1: 607,
+    0x9457A5: 607,
+    0x000EB3: 607,
+    0x080009: 607,
+    0x0030C1: 607,
+    0x0080A0: 607,
+    0xD48564: 607,
+    0x24BE05: 607,
+    0xFC3FDB: 607,
+    0x00092D: 983,
+    0x00265C: 885,
+    0x002269: 885,
+    0xD87988: 885,
+    0x74A78E: 11,
+    0x7C6193: 983,
+    0x90E7C4: 983,
+    0x90CDB6: 885,
+    0x40490F: 885,
+    0xAC162D: 607,
+    0x80C16E: 607,
+    0xB4B52F: 607,
+    0xD07E28: 607,
+    0xD0BF9C: 607,
+    0x308D99: 607,
+    0x7446A0: 607,
+    0x2C44FD: 607,
+    0x443192: 607,
+    0xA0D3C1: 607,
+    0x38EAA7: 607,
+    0x0452F3: 49,
+    0x002127: 86,
+    0xEC888F: 86,
+    0x6466B3: 86,
+    0xF0F336: 86,
+    0xBC4699: 86,
+    0xF483CD: 86,
+    0xFCD733: 86,
+    0x5C899A: 86,
+    0xA81B5A: 69,
+    0x2C5BB8: 69,
+    0x902106: 319,
+    0x889471: 1183,
+    0x8C7CFF: 1183,
+    0x5C63BF: 86,
+    0xE005C5: 86,
+    0x388345: 86,
+    0x98F537: 11,
+    0x001FE2: 885,
+    0x0016CF: 885,
+    0x2002AF: 102,
+    0x0021E8: 102,
+    0x000E6D: 102,
+    0xD02788: 885,
+    0x904CE5: 885,
+    0x142D27: 885,
+    0x5C4CA9: 15,
+    0xF4C714: 15,
+    0x286ED4: 15,
+    0x001E10: 15,
+    0xD47856: 470,
+    0xA01290: 470,
+    0xD842AC: 1184,
+    0x5439DF: 15,
+    0x74882A: 15,
+    0x88E3AB: 15,
+    0xC40528: 15,
+    0x3CDFBD: 15,
+    0x509F27: 15,
+    0x8C34FD: 15,
+    0x587F66: 15,
+    0x64A651: 15,
+    0xCCF954: 470,
+    0x2CF4C5: 470,
+    0x3C3A73: 470,
+    0xFC8399: 470,
+    0x283CE4: 15,
+    0x086361: 15,
+    0x38BB3C: 470,
+    0xF873A2: 470,
+    0x80717A: 15,
+    0xD4970B: 40,
+    0x8CBEBE: 40,
+    0x14F65A: 40,
+    0x009EC8: 40,
+    0x0C1DAF: 40,
+    0x3480B3: 40,
+    0xF48B32: 40,
+    0xF4B85E: 53,
+    0x68C90B: 53,
+    0xD4F513: 53,
+    0x507224: 53,
+    0xACF7F3: 40,
+    0x0819A6: 15,
+    0x3CF808: 15,
+    0x486276: 15,
+    0xB41513: 15,
+    0xAC4E91: 15,
+    0x283152: 15,
+    0x009021: 4,
+    0x0090B1: 4,
+    0x04BD70: 15,
+    0x001AB6: 53,
+    0x0012D1: 53,
+    0x001237: 53,
+    0x00102F: 4,
+    0x00100D: 4,
+    0x001007: 4,
+    0x001014: 4,
+    0x00400B: 4,
+    0x0090BF: 4,
+    0x0050D1: 4,
+    0x0090D9: 4,
+    0x009092: 4,
+    0xA0E6F8: 53,
+    0x70FF76: 53,
+    0xD03972: 53,
+    0x5C313E: 53,
+    0x006070: 4,
+    0x00E01E: 4,
+    0x1CE6C7: 4,
+    0x00112F: 398,
+    0x18E728: 4,
+    0xD072DC: 4,
+    0x28C7CE: 4,
+    0xF40F1B: 4,
+    0xF8C288: 4,
+    0xBCAEC5: 398,
+    0x10BF48: 398,
+    0x6C9989: 4,
+    0x1C6A7A: 4,
+    0x5067AE: 4,
+    0xF09E63: 4,
+    0x001BFC: 398,
+    0x485B39: 398,
+    0xCCD539: 4,
+    0x500604: 4,
+    0x4C0082: 4,
+    0x7C95F3: 4,
+    0x34DBFD: 4,
+    0x885A92: 4,
+    0x046C9D: 4,
+    0x84B261: 4,
+    0x00101F: 4,
+    0x54A274: 4,
+    0xA0554F: 4,
+    0x204C9E: 4,
+    0x84B802: 4,
+    0xB0AA77: 4,
+    0xBCC493: 4,
+    0xA46C2A: 4,
+    0xD0A5A6: 4,
+    0x3C5EC3: 4,
+    0x64F69D: 4,
+    0x000389: 830,
+    0x484487: 1185,
+    0x38C85C: 1185,
+    0xE448C7: 1185,
+    0x001217: 1068,
+    0x001310: 1068,
+    0x001EE5: 1068,
+    0x001D4F: 49,
+    0x002312: 49,
+    0x80E01D: 4,
+    0x000A27: 49,
+    0x3451C9: 49,
+    0x406C8F: 49,
+    0xD023DB: 49,
+    0x70DEE2: 49,
+    0xF0CBA1: 49,
+    0x182032: 49,
+    0x60FACD: 49,
+    0x003EE1: 49,
+    0xFC253F: 49,
+    0x183451: 49,
+    0x0C771A: 49,
+    0xD8A25E: 49,
+    0x5855CA: 49,
+    0xDC2B61: 49,
+    0x40A6D9: 49,
+    0x286ABA: 49,
+    0x4CB199: 49,
+    0xC09F42: 49,
+    0x705681: 49,
+    0x04F7E4: 49,
+    0x34C059: 49,
+    0xF0D1A9: 49,
+    0x040CCE: 49,
+    0x403CFC: 49,
+    0x4860BC: 49,
+    0xAC3C0B: 49,
+    0x701124: 49,
+    0x60FB42: 49,
+    0x64B9E8: 49,
+    0x14109F: 49,
+    0x042665: 49,
+    0xEC3586: 49,
+    0x54EAA8: 49,
+    0x28E14C: 49,
+    0xE4C63D: 49,
+    0x54E43A: 49,
+    0x04DB56: 49,
+    0xDC9B9C: 49,
+    0x54724F: 49,
+    0x8C7C92: 49,
+    0xB03495: 49,
+    0xF437B7: 49,
+    0x78FD94: 49,
+    0x2CBE08: 49,
+    0xE8802E: 49,
+    0x006171: 49,
+    0x04E536: 49,
+    0xA8BBCF: 49,
+    0xAC7F3E: 49,
+    0x20A2E4: 49,
+    0xBC4CC4: 49,
+    0x280B5C: 49,
+    0xACFDEC: 49,
+    0xD8CF9C: 49,
+    0xDC3714: 49,
+    0x6C4008: 49,
+    0x28F076: 49,
+    0xFCA386: 407,
+    0x40331A: 49,
+    0xCCC760: 49,
+    0x141357: 16473,
+    0xFCCF43: 16474,
+    0xB4EF04: 16475,
+    0xA4DEC9: 16476,
+    0xCCE0C3: 16477,
+    0xD848EE: 16478,
+    0x4C8ECC: 16479,
+    0xB8B2EB: 16480,
+    0x646A74: 16481,
+    0x7C7176: 16482,
+    0x7C0191: 49,
+    0x0C54B9: 81,
+    0x98E848: 16483,
+    0x2C1BC8: 16484,
+    0xA8474A: 885,
+    0xC40049: 16485,
+    0xAC6462: 11,
+    0xA01E0B: 16486,
+    0x68E8EB: 16487,
+    0x4040A7: 133,
+    0xC04A09: 16488,
+    0x84100D: 78,
+    0xD00F6D: 16489,
+    0x48137E: 90,
+    0xC025A2: 404,
+    0x908D78: 329,
+    0xE435C8: 15,
+    0x80D605: 49,
+    0x089B4B: 16490,
+    0xA845CD: 16491,
+    0xD0C193: 16492,
+    0xD48304: 989,
+    0xE80734: 16493,
+    0x30F772: 885,
+    0xDC3CF6: 16494,
+    0x4473D6: 4426,
+    0x10CC1B: 16495,
+    0xA43831: 16496,
+    0x380546: 16497,
+    0xDC2B2A: 49,
+    0x9C8DD3: 16498,
+    0xE41A2C: 16499,
+    0xE8BDD1: 15,
+    0xF41535: 16500,
+    0x380AAB: 16501,
+    0x382DE8: 90,
+    0xC08997: 90,
+    0xA815D6: 16502,
+    0xC07CD1: 814,
+    0x90D8F3: 11,
+    0xD445E8: 16503,
+    0x30A243: 16504,
+    0x342606: 16505,
+    0x38B725: 1063,
+    0x6C7220: 329,
+    0x28B9D9: 16506,
+    0xAC676F: 16507,
+    0xE0553D: 20,
+    0x640DE6: 16508,
+    0xF4C613: 817,
+    0x445F8C: 16509,
+    0xACEC80: 258,
+    0xFC335F: 16510,
+    0x84D4C8: 1046,
+    0xEC21E5: 1064,
+    0x380195: 90,
+    0x44975A: 989,
+    0x5045F7: 16511,
+    0xB88981: 16512,
+    0x949F3E: 506,
+    0x04C23E: 983,
+    0xE01AEA: 1160,
+    0x3089D3: 16513,
+    0x5CB395: 15,
+    0x906CAC: 41,
+    0xDCA3AC: 16514,
+    0xF02624: 16515,
+    0xF8F464: 16516,
+    0xD00492: 5,
+    0x5C5188: 78,
+    0xEC0133: 16517,
+    0x00FC8D: 520,
+    0xA013CB: 5,
+    0x58F102: 12733,
+    0x2CC548: 16518,
+    0x0CE725: 157,
+    0x14DDA9: 398,
+    0x184F32: 885,
+    0xDC15DB: 16519,
+    0x84DF19: 16520,
+    0x30F335: 15,
+    0xB46D35: 16521,
+    0x1816C9: 90,
+    0x842E27: 90,
+    0x1CADD1: 16522,
+    0x082CB0: 16523,
+    0xE0DB10: 90,
+    0x546172: 16524,
+    0xEC60E0: 16525,
+    0x3CDA2A: 11,
+    0x1432D1: 90,
+    0x3CA31A: 16526,
+    0xE8F2E3: 16527,
+    0x343D98: 13496,
+    0xF44713: 16528,
+    0x601970: 16529,
+    0xA408EA: 102,
+    0xA8D409: 16530,
+    0x6C4598: 16531,
+    0x68A378: 524,
+    0x340A22: 16532,
+    0xE866C4: 16533,
+    0xD4D7A9: 16534,
+    0x6C4418: 16535,
+    0x6459F8: 16536,
+    0xD083D4: 16537,
+    0xF02A23: 16538,
+    0x584704: 16539,
+    0x5CA178: 16540,
+    0x9CBEE0: 16541,
+    0x0C413E: 157,
+    0x807459: 16542,
+    0xE4695A: 16543,
+    0x7C7A53: 16544,
+    0x107873: 16545,
+    0x48EE0C: 329,
+    0x70AD54: 16546,
+    0x9000DB: 90,
+    0xB4EF39: 90,
+    0xB87879: 14515,
+    0xD06F4A: 16547,
+    0x0492EE: 16548,
+    0x7C534A: 16549,
+    0xBCB308: 16550,
+    0xBC6E64: 133,
+    0x6C2E72: 16551,
+    0x5CCCFF: 16552,
+    0xFC3288: 16553,
+    0xD87495: 11,
+    0xEC3C88: 16554,
+    0x08D34B: 16555,
+    0x78A351: 16172,
+    0x90C35F: 8591,
+    0xC808E9: 244,
+    0xE4FED9: 16556,
+    0x5CF7C3: 16557,
+    0xECE2FD: 16558,
+    0x183A2D: 90,
+    0xEC74BA: 4192,
+    0x74A063: 15,
+    0x5C3B35: 16559,
+    0x545146: 16560,
+    0x8463D6: 157,
+    0xBC4DFB: 520,
+    0x2C337A: 885,
+    0x7076FF: 16561,
+    0x1436C6: 1506,
+    0xBCE767: 16562,
+    0x344CA4: 16563,
+    0x148F21: 466,
+    0x9C685B: 16564,
+    0x9CE230: 16565,
+    0x5C41E7: 16566,
+    0xA8F038: 16567,
+    0xACC73F: 16568,
+    0x44356F: 16569,
+    0xBC54F9: 16570,
+    0x78FC14: 16571,
+    0x3809A4: 16572,
+    0x74E277: 16573,
+    0x14893E: 16574,
+    0xFCAFAC: 16575,
+    0x382C4A: 398,
+    0x08EFAB: 16576,
+    0x3C1E13: 16577,
+    0x049B9C: 16578,
+    0x842690: 16579,
+    0x84DDB7: 16580,
+    0xCCBDD3: 16581,
+    0x8CE78C: 16582,
+    0xC09879: 16583,
+    0x307350: 16584,
+    0xDCEC06: 16585,
+    0xEC13B2: 16586,
+    0x104E07: 16587,
+    0x5CAAFD: 506,
+    0xF03D29: 16588,
+    0x88708C: 1506,
+    0x08115E: 16589,
+    0x0881BC: 16590,
+    0x5014B5: 16591,
+    0x3428F0: 16592,
+    0xCC10A3: 16593,
+    0x14EDE4: 16594,
+    0xCC3F1D: 16595,
+    0xDCDA4F: 16596,
+    0x801967: 16597,
+    0x2CF7F1: 16598,
+    0x101218: 16599,
+    0xB84FD5: 157,
+    0xD84A87: 8915,
+    0xD01242: 16600,
+    0x603696: 16601,
+    0xF4F26D: 86,
+    0xACB74F: 16602,
+    0xCCF538: 16603,
+    0xC0EEFB: 16604,
+    0x54FFCF: 16605,
+    0xB8BD79: 16606,
+    0x304225: 16607,
+    0xFCDBB3: 102,
+    0x404EEB: 16608,
+    0xC456FE: 16609,
+    0x74F413: 16610,
+    0xA00627: 16611,
+    0x303335: 16612,
+    0xF4D261: 16613,
+    0xB009D3: 16614,
+    0x9CAD97: 885,
+    0xBC9CC5: 16615,
+    0x94D60E: 16616,
+    0x506787: 16617,
+    0x5CB8CB: 16618,
+    0x34F0CA: 16619,
+    0x44746C: 133,
+    0x4C9EFF: 112,
+    0x6C2F2C: 90,
+    0x8CBF9D: 16620,
+    0x70720D: 1506,
+    0x3CCD5A: 16621,
+    0x48D855: 16622,
+    0x08F728: 16623,
+    0x206E9C: 90,
+    0xBC25F0: 16624,
+    0xC03D46: 16625,
+    0x64EAC5: 16626,
+    0x60C1CB: 16627,
+    0x882950: 16628,
+    0x7CE524: 16629,
+    0x74DA38: 1111,
+    0x30F7D7: 16630,
+    0x18227E: 90,
+    0x30C7AE: 90,
+    0xE4F4C6: 511,
+    0x90AE1B: 86,
+    0x60E327: 86,
+    0x44D4E0: 133,
+    0xB025AA: 13,
+    0xD4B43E: 16631,
+    0xCCA0E5: 16632,
+    0x60812B: 16633,
+    0xF86601: 16634,
+    0x145645: 16635,
+    0x1C1CFD: 16636,
+    0x48D18E: 16637,
+    0x6C2C06: 16638,
+    0xC4913A: 16639,
+    0x7062B8: 329,
+    0xACA919: 16640,
+    0xC44E1F: 16641,
+    0xB0869E: 16642,
+    0xD057A1: 16643,
+    0xB4B542: 16644,
+    0x64E892: 16645,
+    0x88E8F8: 16646,
+    0x909864: 16647,
+    0xDCE578: 16648,
+    0x38F098: 16649,
+    0x54CDEE: 16650,
+    0xE8FC60: 16651,
+    0x9451BF: 16652,
+    0xF015A0: 16653,
+    0x1CAB01: 16654,
+    0xB0DA00: 16655,
+    0xD8B6D6: 16656,
+    0x94C014: 16657,
+    0x9CFBF1: 16658,
+    0x1027BE: 16659,
+    0x2087AC: 16660,
+    0x709383: 16661,
+    0x80D433: 16662,
+    0x8C41F2: 16663,
+    0xE036E3: 16664,
+    0x242642: 16665,
+    0x34DE34: 11,
+    0xFC1607: 16666,
+    0xAC02CA: 16667,
+    0x04DB8A: 16668,
+    0x90DFB7: 16669,
+    0x085700: 86,
+    0xF85C45: 16670,
+    0xACE069: 16671,
+    0x30B5C2: 86,
+    0xFC27A2: 16672,
+    0xFCBBA1: 16673,
+    0xF08A28: 16674,
+    0x28BB59: 16675,
+    0xE8EA6A: 16676,
+    0xD86595: 16677,
+    0xC0F79D: 16678,
+    0xC4C919: 16679,
+    0xD8DD5F: 16680,
+    0xE07F53: 16681,
+    0x48FEEA: 16682,
+    0x746F3D: 16683,
+    0x4C0DEE: 8943,
+    0xD0634D: 16684,
+    0xD86194: 16685,
+    0x589CFC: 16686,
+    0x702C1F: 16687,
+    0xDC052F: 16688,
+    0x008B43: 16689,
+    0xC8D429: 16690,
+    0x8C569D: 16691,
+    0x40B6B1: 16692,
+    0xE86183: 16693,
+    0x38C9A9: 16694,
+    0x8CDE99: 16695,
+    0x4CE1BB: 16696,
+    0x24A87D: 16697,
+    0x84FE9E: 16698,
+    0xFC4B1C: 16699,
+    0x403067: 16700,
+    0x600347: 16701,
+    0xF81CE5: 16702,
+    0xEC71DB: 16703,
+    0xA409CB: 16704,
+    0x501AC5: 1989,
+    0xB0989F: 16705,
+    0xC0F1C4: 16706,
+    0x14EDA5: 16707,
+    0xD0BD01: 16708,
+    0x085240: 16709,
+    0xB8C1A2: 16710,
+    0x80F25E: 16711,
+    0x889166: 16712,
+    0x38A53C: 16713,
+    0x5CFFFF: 16714,
+    0x68692E: 16715,
+    0xD46867: 16716,
+    0x9C216A: 86,
+    0xF862AA: 16717,
+    0xA4059E: 16718,
+    0x44EE30: 16719,
+    0xFC1E16: 16720,
+    0x3051F8: 16721,
+    0xE8F226: 16722,
+    0x3C6E63: 16723,
+    0x103378: 16724,
+    0xF0D3A7: 16725,
+    0x2C18AE: 16726,
+    0x50C006: 16727,
+    0xA4E9A3: 16728,
+    0xA0E5E9: 16729,
+    0x04CB1D: 16730,
+    0xC0C687: 1185,
+    0xC49380: 16731,
+    0x007DFA: 16732,
+    0xE0AEB2: 16733,
+    0xF84A7F: 16734,
+    0x0C9B13: 16735,
+    0x107BEF: 112,
+    0xB462AD: 16736,
+    0x2C7155: 16737,
+    0x20180E: 16738,
+    0x80B219: 16739,
+    0x2894AF: 16740,
+    0xB4750E: 1006,
+    0x94103E: 1006,
+    0x7CB733: 234,
+    0x345C40: 16741,
+    0x74A4B5: 16742,
+    0x909F43: 16743,
+    0xAC5036: 16744,
+    0xC4D655: 16745,
+    0x58BDF9: 16746,
+    0x2464EF: 16747,
+    0xD8270C: 16748,
+    0x68193F: 16749,
+    0xB4CCE9: 16750,
+    0xA0BF50: 16751,
+    0xE8D4E0: 16752,
+    0xFC019E: 16753,
+    0x642184: 16754,
+    0x94BF1E: 16755,
+    0xE8516E: 16756,
+    0xAC220B: 398,
+    0xB887A8: 16757,
+    0x8C4B59: 16758,
+    0x5C3327: 16759,
+    0xE0A198: 16760,
+    0x88354C: 16761,
+    0x507691: 16762,
+    0xCC4AE1: 16763,
+    0x28F532: 16764,
+    0x9440A2: 16765,
+    0x384233: 16766,
+    0xC034B4: 16767,
+    0x303EAD: 16768,
+    0xF835DD: 182,
+    0xD8B04C: 16769,
+    0xE8519D: 16770,
+    0x1C86AD: 16771,
+    0x28D93E: 16772,
+    0x640B4A: 16773,
+    0x70F176: 16774,
+    0xCCE8AC: 16775,
+    0xCC04B4: 8834,
+    0x5C15E1: 16776,
+    0xB847C6: 16777,
+    0xB8CD93: 16778,
+    0x3806B4: 16779,
+    0xB8241A: 16780,
+    0xA0B100: 16781,
+    0x201D03: 16782,
+    0xC06C6D: 16783,
+    0xB8C855: 16784,
+    0x78303B: 16785,
+    0x40BC73: 16786,
+    0x4007C0: 16787,
+    0x84E4D9: 16788,
+    0x784B08: 16789,
+    0xB0808C: 16790,
+    0xE880D8: 16791,
+    0xD866C6: 16792,
+    0xD00EA4: 16793,
+    0x188857: 16794,
+    0xE4776B: 16795,
+    0x30F31D: 11,
+    0xA0EC80: 11,
+    0x28DB81: 16796,
+    0x0CC81F: 16797,
+    0xA8FB70: 16798,
+    0xE481B3: 16799,
+    0x1C4AF7: 16800,
+    0xD8DCE9: 16801,
+    0xDCD52A: 16802,
+    0xA4D3B5: 16803,
+    0x44619C: 16804,
+    0x88685C: 16805,
+    0x102831: 16806,
+    0xDC5726: 16807,
+    0xF8DADF: 16808,
+    0x30AE7B: 16809,
+    0x68EC62: 16810,
+    0x1C76CA: 16811,
+    0xF499AC: 16812,
+    0xD43A65: 16813,
+    0x7CD844: 16814,
+    0x70820E: 16815,
+    0x888964: 16816,
+    0x0C1105: 16817,
+    0x5C22C4: 16818,
+    0xF8FEA8: 16819,
+    0x1800DB: 16820,
+    0x78A106: 86,
+    0xD05099: 4476,
+    0xA49EDB: 16821,
+    0x6C8B2F: 11,
+    0xCC1AFA: 11,
+    0x8C5AF0: 16822,
+    0x6C6126: 16823,
+    0xCC047C: 16824,
+    0x50ABBF: 16825,
+    0xB4FE8C: 16826,
+    0x2CF203: 16827,
+    0x185AE8: 16828,
+    0xC47DCC: 1805,
+    0xE0AEED: 16829,
+    0xE492E7: 16830,
+    0x1C37BF: 16831,
+    0xD82916: 16832,
+    0xA073FC: 16833,
+    0x64535D: 16834,
+    0x40E730: 16835,
+    0x68B094: 16836,
+    0x44F849: 16837,
+    0xCC0DEC: 1185,
+    0x2C7B5A: 16838,
+    0x0C722C: 86,
+    0xFC9FAE: 16839,
+    0x681E8B: 16840,
+    0xF8D7BF: 16841,
+    0x48BE2D: 16842,
+    0xF02329: 16843,
+    0x5461EA: 16844,
+    0xD08B7E: 16845,
+    0x04586F: 16846,
+    0xD4BF2D: 16847,
+    0x9CE635: 1265,
+    0x60A44C: 398,
+    0xE0D9A2: 16848,
+    0xFC0647: 16849,
+    0xD052A8: 16850,
+    0xCC3A61: 1016,
+    0x3C6FF7: 16851,
+    0x6CD146: 16852,
+    0x3C57D5: 16853,
+    0xF073AE: 16854,
+    0x48B8DE: 16855,
+    0x10EA59: 1185,
+    0x0C191F: 16856,
+    0x98208E: 16857,
+    0x704AE4: 16858,
+    0x083AB8: 16859,
+    0xA0DD97: 16860,
+    0xE4A7FD: 16861,
+    0x2CE2A8: 16862,
+    0x60C5A8: 16863,
+    0xB4DF3B: 16864,
+    0xA845E9: 16865,
+    0x7C9A9B: 16866,
+    0x645A04: 4261,
+    0xAC1702: 16867,
+    0x984CD3: 16868,
+    0x08606E: 398,
+    0xEC89F5: 1506,
+    0xB49842: 11,
+    0x7054D2: 814,
+    0x7076DD: 16869,
+    0xE89AFF: 8568,
+    0x1065CF: 16870,
+    0x684CA8: 16871,
+    0x0C8CDC: 16872,
+    0xF84897: 505,
+    0xF80BD0: 16873,
+    0x646223: 16874,
+    0x98473C: 5018,
+    0x5481AD: 16875,
+    0xEC473C: 16876,
+    0x3CC12C: 16877,
+    0x949BFD: 16878,
+    0x84E714: 16879,
+    0xB829F7: 16880,
+    0xC8E1A7: 16881,
+    0xA00ABF: 16882,
+    0x8CCDE8: 1265,
+    0x00E666: 1150,
+    0x34BDFA: 1185,
+    0xD4136F: 16883,
+    0x00B56D: 16884,
+    0x2C3557: 16885,
+    0xB80415: 16886,
+    0x4CAB33: 16887,
+    0x485261: 16888,
+    0xF4472A: 16889,
+    0xDC028E: 11,
+    0x18D949: 16890,
+    0xD808F5: 16891,
+    0x049F06: 16892,
+    0x289A4B: 15889,
+    0x7CB232: 31,
+    0x54A04F: 16893,
+    0x14DB85: 16894,
+    0xB8DAF1: 16895,
+    0xD45C70: 9784,
+    0x0CC47E: 16896,
+    0x50724D: 16897,
+    0x783CE3: 16898,
+    0xB898B0: 16899,
+    0x080C0B: 16900,
+    0xDCBF90: 16901,
+    0xC8FB26: 1185,
+    0xACBD0B: 16902,
+    0xB85810: 16903,
+    0xA08C15: 16904,
+    0x90CF6F: 16905,
+    0x24694A: 16906,
+    0xF41E26: 16907,
+    0x702526: 81,
+    0xECD950: 16908,
+    0x645FFF: 16909,
+    0xA4D18F: 16910,
+    0x58343B: 16911,
+    0x109FA9: 659,
+    0xC0A364: 16912,
+    0xAC7A42: 16913,
+    0xF8051C: 16914,
+    0x78D34F: 16915,
+    0xA4466B: 16916,
+    0x7C386C: 16917,
+    0x2067B1: 16918,
+    0x7C02BC: 16919,
+    0xB82410: 16920,
+    0x105F49: 1185,
+    0x1C5C60: 16921,
+    0x700BC0: 16922,
+    0xCC14A6: 16923,
+    0x889676: 16924,
+    0xB8B94E: 16925,
+    0xACC698: 16926,
+    0xAC0A61: 16927,
+    0x241064: 16928,
+    0x7CEBEA: 16929,
+    0x189A67: 16930,
+    0x087D21: 16931,
+    0x34D7B4: 16932,
+    0xF40F9B: 16933,
+    0x901EDD: 16934,
+    0x9C0DAC: 16935,
+    0x1C43EC: 16936,
+    0x785262: 16937,
+    0x20014F: 16938,
+    0xEC0ED6: 16939,
+    0x746A89: 16940,
+    0x702F4B: 16941,
+    0x741489: 16942,
+    0x241B13: 16943,
+    0xB43564: 16944,
+    0x1C5FFF: 16945,
+    0x6045BD: 1989,
+    0x9C54CA: 16946,
+    0x00BF15: 5100,
+    0x241125: 16947,
+    0xB431B8: 16948,
+    0x508C77: 16949,
+    0x5C1737: 16950,
+    0x70B599: 16951,
+    0xEC4C4D: 16952,
+    0x38EE9D: 16953,
+    0x54D1B0: 16954,
+    0x240917: 16955,
+    0x78BEBD: 16956,
+    0xB058C4: 16957,
+    0x84AF1F: 16958,
+    0xA007B6: 16959,
+    0x0CD2B5: 16960,
+    0x4846F1: 16961,
+    0xB827EB: 16962,
+    0x08BE09: 16963,
+    0xB41DEF: 16964,
+    0x809393: 16965,
+    0x6044F5: 16966,
+    0xF47F35: 4,
+    0xBCC168: 16967,
+    0xDC309C: 16968,
+    0xD4DF57: 16969,
+    0x5048EB: 16970,
+    0xB40E96: 16971,
+    0xF89955: 16972,
+    0x4CC94F: 81,
+    0x0CE5D3: 16973,
+    0x40704A: 16974,
+    0x545EBD: 16975,
+    0xCC187B: 16976,
+    0x28F606: 16977,
+    0x0CAF5A: 16978,
+    0x7CEF8A: 16979,
+    0x94FAE8: 16980,
+    0xE840F2: 814,
+    0x50053D: 16981,
+    0xF88C1C: 16982,
+    0x1C0B52: 16983,
+    0x747E2D: 16984,
+    0x4C64D9: 16985,
+    0x9C0111: 16986,
+    0x400E67: 16987,
+    0x008DDA: 16988,
+    0x18193F: 16989,
+    0x885C47: 1402,
+    0x3CC1F6: 16990,
+    0xC49805: 16991,
+    0x90F4C1: 16992,
+    0x3CCE73: 4,
+    0xB0BD6D: 16993,
+    0x745798: 16994,
+    0x2817CE: 16995,
+    0xE425E9: 16996,
+    0x78A183: 16997,
+    0x940149: 16998,
+    0x1CB094: 983,
+    0x14B1C8: 16999,
+    0xB48255: 17000,
+    0x8016B7: 17001,
+    0x48ED80: 17002,
+    0xC80718: 17003,
+    0xB467E9: 4819,
+    0x186751: 17004,
+    0xF0F755: 4,
+    0x1CB243: 17005,
+    0x38BF33: 5908,
+    0x645EBE: 17006,
+    0xCCC50A: 17007,
+    0xD8BF4C: 17008,
+    0x3CB9A6: 17009,
+    0xC0DF77: 17010,
+    0x581D91: 17011,
+    0x1CB17F: 404,
+    0xE42C56: 17012,
+    0xB89674: 17013,
+    0x3055ED: 17014,
+    0x94DF58: 17015,
+    0x48D54C: 17016,
+    0x1CBBA8: 17017,
+    0x70D6B6: 17018,
+    0xC0A0DE: 17019,
+    0x8C0CA3: 17020,
+    0x48E1AF: 17021,
+    0xBCB852: 17022,
+    0xC49300: 17023,
+    0x6CA682: 17024,
+    0x28D576: 17025,
+    0xF0DA7C: 17026,
+    0xAC319D: 1326,
+    0x2486F4: 17027,
+    0xC4237A: 17028,
+    0x903CAE: 17029,
+    0x70704C: 17030,
+    0xD89760: 17031,
+    0x8CDE52: 17032,
+    0x082522: 17033,
+    0x4C2F9D: 17034,
+    0x50FC30: 17035,
+    0xE467BA: 17036,
+    0x9CA134: 17037,
+    0x40BC8B: 17038,
+    0xF47ACC: 17039,
+    0x905682: 17040,
+    0xC09132: 17041,
+    0x90185E: 17042,
+    0xF8FE5C: 17043,
+    0x6C9CED: 4,
+    0x006BA0: 17044,
+    0xA898C6: 17045,
+    0xB4211D: 17046,
+    0xE843B6: 5087,
+    0xE0DADC: 17047,
+    0xB89BC9: 1659,
+    0xD4D249: 17048,
+    0x80427C: 17049,
+    0x409FC7: 17050,
+    0x00FC58: 17051,
+    0x983571: 17052,
+    0xF4E6D7: 17053,
+    0x20107A: 182,
+    0x78DDD6: 17054,
+    0xF82F5B: 17055,
+    0xE4AFA1: 17056,
+    0xA887ED: 17057,
+    0x186D99: 17058,
+    0xA0E201: 17059,
+    0x9CF67D: 17060,
+    0x989080: 17061,
+    0xB87424: 17062,
+    0xB451F9: 17063,
+    0x30168D: 17064,
+    0x4C0289: 17065,
+    0xC0E54E: 17066,
+    0x50F61A: 17067,
+    0x542018: 17068,
+    0x581FEF: 17069,
+    0x58BDA3: 1265,
+    0x187C81: 4332,
+    0xACCC8E: 600,
+    0xBC764E: 17070,
+    0x5404A6: 398,
+    0xF83376: 17071,
+    0x98C845: 17072,
+    0xCCC8D7: 17073,
+    0x84D32A: 17074,
+    0x8C94CF: 17075,
+    0xF8F25A: 17076,
+    0xF0DEB9: 17077,
+    0x7CA61D: 17078,
+    0x3057AC: 17079,
+    0x842B50: 17080,
+    0xB8BB6D: 17081,
+    0x14373B: 17082,
+    0x1897FF: 17083,
+    0x4C5585: 17084,
+    0x8C8E76: 17085,
+    0xA0133B: 17086,
+    0x48F7F1: 81,
+    0x9C5711: 17087,
+    0x88F488: 17088,
+    0x448E12: 17089,
+    0x703187: 17090,
+    0x80971B: 17091,
+    0x30E4DB: 4,
+    0xECEA03: 16447,
+    0x6CA780: 882,
+    0x582EFE: 17092,
+    0x30F9ED: 133,
+    0xECF236: 17093,
+    0x0418B6: 13,
+    0xE4A5EF: 17094,
+    0x705CAD: 17095,
+    0x804731: 17096,
+    0xF08BFE: 17097,
+    0x3071B2: 17098,
+    0x3C6F45: 17099,
+    0xDCCE41: 17100,
+    0xFC6C31: 17101,
+    0xB09BD4: 17102,
+    0x007F28: 659,
+    0xCC60BB: 17103,
+    0x7CDD20: 17104,
+    0xE84E06: 17105,
+    0x00077D: 4,
+    0xE0C922: 17106,
+    0x905F8D: 17107,
+    0x98293F: 17108,
+    0x0C51F7: 17109,
+    0x0CFC83: 17110,
+    0x587675: 17111,
+    0xCCD9E9: 17112,
+    0x34A709: 17113,
+    0x3C26D5: 17114,
+    0xACC935: 17115,
+    0x008D4E: 17116,
+    0x444F5E: 17117,
+    0xD0AFB6: 17118,
+    0x98EC65: 17119,
+    0x4C98EF: 17120,
+    0x00A1DE: 17121,
+    0x908D1D: 17122,
+    0x806CBC: 17123,
+    0x58E808: 17124,
+    0xDC05ED: 17125,
+    0x98F8DB: 17126,
+    0x909060: 17127,
+    0xBC8199: 17128,
+    0xE0F211: 17129,
+    0xB45CA4: 17130,
+    0xDCA7D9: 17131,
+    0x38FEC5: 17132,
+    0xC455A6: 17133,
+    0x5C7757: 17134,
+    0xD4D898: 17135,
+    0xB4AA4D: 17136,
+    0x040A83: 940,
+    0xB83D4E: 17137,
+    0x5087B8: 17138,
+    0xC0EAE4: 3316,
+    0x0838A5: 17139,
+    0xB0A72A: 17140,
+    0x6400F1: 4,
+    0xF86971: 17141,
+    0x44AA27: 17142,
+    0xE8F928: 17143,
+    0xCC1EFF: 17144,
+    0x184E94: 17145,
+    0x60F59C: 17146,
+    0x6C391D: 17147,
+    0x80B32A: 17148,
+    0x405539: 4,
+    0xC45600: 17149,
+    0x58EECE: 17150,
+    0x647FDA: 17151,
+    0xAC0613: 17152,
+    0x747818: 17153,
+    0xB8F4D0: 17154,
+    0x08ACA5: 17155,
+    0x586D8F: 1068,
+    0x10E3C7: 17156,
+    0xFCF1CD: 17157,
+    0x4425BB: 17158,
+    0xE00C7F: 1265,
+    0x1C955D: 17159,
+    0x7465D1: 17160,
+    0xE48AD5: 17161,
+    0x443719: 17162,
+    0x84EA99: 17163,
+    0xBC3E13: 17164,
+    0x041D10: 17165,
+    0x801440: 17166,
+    0x88DD79: 12640,
+    0x64F987: 17167,
+    0x902E87: 17168,
+    0xDC07C1: 17169,
+    0xA81B18: 17170,
+    0xD0A311: 17171,
+    0xA424B3: 17172,
+    0x94CDAC: 17173,
+    0x7CDA84: 17174,
+    0xC0A26D: 17175,
+    0x00BB8E: 17176,
+    0xD82A7E: 882,
+    0x801F02: 1111,
+    0x180B52: 17177,
+    0x144C1A: 17178,
+    0xD85D84: 17179,
+    0xD4E32C: 17180,
+    0x7C6ADB: 17181,
+    0xF05D89: 17182,
+    0x9CF938: 17183,
+    0x8CDB25: 17184,
+    0xBCC61A: 17185,
+    0x0470BC: 17186,
+    0x988E34: 17187,
+    0xC471FE: 4,
+    0x340804: 1167,
+    0xFC3598: 17188,
+    0x90D92C: 17189,
+    0x4022ED: 17190,
+    0x6C2E33: 17191,
+    0x989449: 17192,
+    0x2CA157: 17193,
+    0x942053: 882,
+    0x28852D: 17194,
+    0x486B91: 17195,
+    0x643409: 17196,
+    0x74CD0C: 17197,
+    0xCCCE40: 17198,
+    0xB8EE79: 17199,
+    0x28ED58: 17200,
+    0xB8797E: 17201,
+    0x2005E8: 17202,
+    0x0006F6: 4,
+    0x747DB6: 17203,
+    0xB06563: 17204,
+    0xAC6F4F: 17205,
+    0xE82877: 17206,
+    0xF0C88C: 17207,
+    0xB0B32B: 17208,
+    0x5842E4: 5114,
+    0xCC9E00: 1265,
+    0x58A76F: 17209,
+    0x40987B: 16454,
+    0xBC38D2: 17210,
+    0xB8BA68: 17211,
+    0x4018D7: 3364,
+    0x4C2C80: 17212,
+    0xD49E6D: 17213,
+    0x4037AD: 17214,
+    0xF00248: 17215,
+    0x40C245: 17216,
+    0xCC55AD: 1754,
+    0xE8757F: 17217,
+    0xF0F7B3: 17218,
+    0x6063FD: 17219,
+    0x74BE08: 9772,
+    0x74D675: 17220,
+    0xB40EDC: 17221,
+    0xE0EE1B: 8880,
+    0x60893C: 17222,
+    0xD86BF7: 1265,
+    0x00D38D: 17223,
+    0xC83EA7: 17224,
+    0xD8B6C1: 17225,
+    0x74A4A7: 17226,
+    0x40CD3A: 17227,
+    0x482CEA: 17228,
+    0xF455E0: 17229,
+    0x20FDF1: 716,
+    0xA4218A: 1034,
+    0xEC2368: 17230,
+    0x749050: 17231,
+    0x7CEF18: 17232,
+    0x9088A2: 17233,
+    0x00336C: 17234,
+    0x100C24: 17235,
+    0x58F6BF: 17236,
+    0xAC6123: 17237,
+    0xF866F2: 4,
+    0xAC34CB: 17238,
+    0x700258: 17239,
+    0x8497B8: 17240,
+    0xA0DDE5: 224,
+    0x206AFF: 17241,
+    0xFC75E6: 16092,
+    0x0C15C5: 17242,
+    0xF8FB2F: 17243,
+    0x2CCD43: 17244,
+    0x145412: 17245,
+    0x78EC22: 17246,
+    0x64995D: 5848,
+    0xFC7CE7: 17247,
+    0x3C106F: 17248,
+    0xD87157: 1506,
+    0xC00D7E: 17249,
+    0x84C7A9: 17250,
+    0x609AA4: 17251,
+    0x641084: 17252,
+    0x6C626D: 9612,
+    0x28068D: 17253,
+    0x342109: 17254,
+    0x7C3E9D: 17255,
+    0x244597: 17256,
+    0x78818F: 17257,
+    0x284846: 17258,
+    0x30694B: 1754,
+    0x10CCDB: 17259,
+    0x38C7BA: 17260,
+    0xEC5C69: 17261,
+    0xE4AD7D: 17262,
+    0xF09CBB: 17263,
+    0x80EE73: 4735,
+    0xFCE23F: 17264,
+    0x58570D: 17265,
+    0x44A8C2: 17266,
+    0xBCA9D6: 17267,
+    0xECFE7E: 17268,
+    0xC4823F: 17269,
+    0xE85B5B: 1047,
+    0x7C2CF3: 17270,
+    0x081651: 17271,
+    0x304174: 17272,
+    0x3C39C3: 17273,
+    0x3C05AB: 17274,
+    0x30EFD1: 17275,
+    0xD41F0C: 8393,
+    0x8CD628: 17276,
+    0x243C20: 17277,
+    0x481BD2: 17278,
+    0xF04335: 17279,
+    0xA479E4: 17280,
+    0x8C541D: 5848,
+    0x00A2DA: 17281,
+    0x6C3E9C: 17282,
+    0xA863DF: 17283,
+    0x183BD2: 569,
+    0x4CC602: 17284,
+    0xD0F0DB: 3584,
+    0x7C1476: 17285,
+    0x003CC5: 17286,
+    0xF077D0: 17287,
+    0x884B39: 17288,
+    0xD828C9: 17289,
+    0x44C233: 17290,
+    0xE43593: 17291,
+    0x2C3A28: 17292,
+    0x80B289: 17293,
+    0xE83A97: 17294,
+    0x1056CA: 4482,
+    0xD49C28: 17295,
+    0x80F593: 17296,
+    0xECDE3D: 17297,
+    0x6CFFBE: 17298,
+    0xE497F0: 17299,
+    0xB40832: 17300,
+    0x88FD15: 17301,
+    0x24DBAD: 17302,
+    0x2872C5: 17303,
+    0x486FD2: 17304,
+    0xA03A75: 17305,
+    0xB45861: 17306,
+    0xB0973A: 17307,
+    0x204E6B: 17308,
+    0x9CEBE8: 17309,
+    0xF06281: 1040,
+    0xC09C92: 17310,
+    0x88ED1C: 17311,
+    0x9CCD82: 17312,
+    0x040EC2: 17313,
+    0xC8D1D1: 17314,
+    0x00DB45: 17315,
+    0x74F726: 17316,
+    0xC038F9: 889,
+    0xF46349: 17317,
+    0x003A9C: 4,
+    0x889821: 17318,
+    0xE0E751: 1265,
+    0x74F07D: 17319,
+    0x7C6C8F: 17320,
+    0x9CB206: 7526,
+    0xACE9AA: 17321,
+    0x082AD0: 17322,
+    0xE08FEC: 17323,
+    0xF852DF: 17324,
+    0x003AAF: 17325,
+    0x64168D: 4,
+    0xD8C3FB: 17326,
+    0xA8CB95: 17327,
+    0xF45FF7: 17328,
+    0x7C3BD5: 17329,
+    0x5CE223: 17330,
+    0xF871FE: 17331,
+    0x2C1984: 17332,
+    0x40EF4C: 758,
+    0x00271E: 17333,
+    0x00271D: 17334,
+    0x002720: 17335,
+    0x644F74: 17336,
+    0x787F62: 17337,
+    0x58F67B: 17338,
+    0x401597: 17339,
+    0xC4FCE4: 17340,
+    0xEC6C9F: 17341,
+    0xE80B13: 17342,
+    0x0026F7: 17343,
+    0x0026F6: 17344,
+    0x0026F0: 17345,
+    0x0026EA: 17346,
+    0x0026DD: 17347,
+    0x0026DE: 17348,
+    0x0026DA: 17349,
+    0x0026DB: 17350,
+    0x0026C9: 17351,
+    0x0026BF: 17352,
+    0x0026D5: 17353,
+    0x0026CE: 17354,
+    0x0026CA: 4,
+    0x002708: 17355,
+    0x002702: 8502,
+    0x0026FA: 17356,
+    0x0026F9: 17357,
+    0x0026FD: 17358,
+    0x0026B4: 17359,
+    0x0026AC: 17360,
+    0x0026A6: 17361,
+    0x002711: 17362,
+    0x00268F: 17363,
+    0x002686: 17364,
+    0x002684: 17365,
+    0x002680: 17366,
+    0x002638: 17367,
+    0x00263A: 17368,
+    0x002635: 17369,
+    0x002617: 17370,
+    0x002613: 17371,
+    0x00260F: 17372,
+    0x00260C: 17373,
+    0x002620: 17374,
+    0x00261D: 17375,
+    0x00262B: 17376,
+    0x002694: 17377,
+    0x002690: 17378,
+    0x002679: 17379,
+    0x002676: 17380,
+    0x002666: 1530,
+    0x002657: 17381,
+    0x002652: 4,
+    0x0025F6: 17382,
+    0x0025F5: 17383,
+    0x0025EB: 17384,
+    0x0025EE: 17385,
+    0x0025D6: 17386,
+    0x0025D1: 17387,
+    0x0025CD: 17388,
+    0x00258C: 17389,
+    0x0025A5: 17390,
+    0x0025A4: 17391,
+    0x0025AE: 157,
+    0x0025AF: 17392,
+    0x0025A8: 17393,
+    0x002601: 17394,
+    0x0025BF: 17395,
+    0x0025B9: 17396,
+    0x0025B6: 17397,
+    0x0025D9: 16446,
+    0x0025C1: 17398,
+    0x00257A: 17399,
+    0x002576: 17400,
+    0x002574: 17401,
+    0x002573: 17402,
+    0x00256F: 17403,
+    0x002554: 17404,
+    0x00255A: 17405,
+    0x002559: 17406,
+    0x002530: 17407,
+    0x00252C: 17408,
+    0x00252F: 17409,
+    0x00250F: 17410,
+    0x002505: 17411,
+    0x002540: 17412,
+    0x002533: 17413,
+    0x002587: 17414,
+    0x002523: 17415,
+    0x00251D: 17416,
+    0x00250A: 17417,
+    0x002509: 17418,
+    0x0024D8: 17419,
+    0x0024CD: 17420,
+    0x0024D3: 17421,
+    0x0024CE: 17422,
+    0x0024CF: 17423,
+    0x0024C6: 17424,
+    0x0024B4: 17425,
+    0x0024B1: 17426,
+    0x00249C: 17427,
+    0x002498: 4,
+    0x0024FD: 17428,
+    0x0024F5: 17429,
+    0x0024DA: 17430,
+    0x00246A: 17431,
+    0x002467: 17432,
+    0x00248B: 17433,
+    0x002492: 17434,
+    0x002484: 17435,
+    0x002452: 17436,
+    0x002453: 17437,
+    0x00244C: 17438,
+    0x002448: 17439,
+    0x00244B: 17440,
+    0x00242A: 17441,
+    0x002422: 17442,
+    0x00241B: 17443,
+    0x002428: 17444,
+    0x002417: 1944,
+    0x00247A: 17445,
+    0x002476: 17446,
+    0x00246D: 17447,
+    0x002442: 17448,
+    0x00243C: 17449,
+    0x00245E: 17450,
+    0x00244D: 17451,
+    0x002416: 17452,
+    0x002409: 17453,
+    0x002406: 16246,
+    0x002400: 1034,
+    0x0023E1: 17454,
+    0x0023DC: 17455,
+    0x0023D1: 17456,
+    0x0023D3: 17457,
+    0x0023FB: 17458,
+    0x0023FE: 17459,
+    0x0023F4: 17460,
+    0x0023CA: 17461,
+    0x0023CB: 17462,
+    0x0023D0: 17463,
+    0x0023AD: 17464,
+    0x0023AB: 4,
+    0x0023A4: 17465,
+    0x002385: 17466,
+    0x0023C7: 17467,
+    0x0023C3: 17468,
+    0x0023B0: 17469,
+    0x002303: 17470,
+    0x0022FE: 17471,
+    0x002300: 17472,
+    0x0022F3: 224,
+    0x0022F6: 17473,
+    0x00232C: 17474,
+    0x00232B: 17475,
+    0x00232A: 17476,
+    0x002327: 17477,
+    0x002328: 17478,
+    0x002372: 17479,
+    0x00236D: 17480,
+    0x00236B: 17481,
+    0x00237E: 17482,
+    0x00237C: 17483,
+    0x00237A: 1754,
+    0x00234C: 17484,
+    0x002343: 17485,
+    0x002336: 16602,
+    0x002338: 17486,
+    0x002361: 17487,
+    0x00235F: 17488,
+    0x00233B: 17489,
+    0x00231A: 17490,
+    0x00230D: 1034,
+    0x0022ED: 17491,
+    0x0022E1: 17492,
+    0x0022E0: 17493,
+    0x0022DF: 17494,
+    0x0022D8: 17495,
+    0x0022DC: 17496,
+    0x00228C: 17497,
+    0x00228B: 17498,
+    0x00228D: 17499,
+    0x002289: 17500,
+    0x00226D: 17501,
+    0x00226E: 17502,
+    0x00225D: 17503,
+    0x002256: 4,
+    0x0022D9: 17504,
+    0x0022D3: 17505,
+    0x0022D4: 17506,
+    0x00229F: 17507,
+    0x002299: 13819,
+    0x0022BC: 17508,
+    0x0022AA: 1265,
+    0x0022A8: 17509,
+    0x0022C9: 17510,
+    0x00227D: 17511,
+    0x00227B: 17512,
+    0x002223: 17513,
+    0x00221A: 17514,
+    0x00224B: 17515,
+    0x00223C: 17516,
+    0x002252: 17517,
+    0x00224D: 15543,
+    0x00224C: 1265,
+    0x00224A: 17518,
+    0x0021E3: 17519,
+    0x0021E7: 17520,
+    0x0021DC: 17521,
+    0x0021F8: 17522,
+    0x0021F3: 17523,
+    0x0021F1: 17524,
+    0x002213: 17525,
+    0x00221C: 13,
+    0x002222: 17526,
+    0x002231: 17527,
+    0x002201: 17528,
+    0x00219A: 17529,
+    0x002193: 17530,
+    0x002192: 17531,
+    0x00217B: 17532,
+    0x002176: 17533,
+    0x002171: 17534,
+    0x00215F: 17535,
+    0x002156: 4,
+    0x002151: 17536,
+    0x0021A7: 17537,
+    0x00219C: 17538,
+    0x0021D8: 4,
+    0x0021D7: 4,
+    0x0021D9: 17539,
+    0x0021DA: 17540,
+    0x00216C: 17541,
+    0x002161: 17542,
+    0x002189: 17543,
+    0x0021BD: 1265,
+    0x0021B5: 17544,
+    0x0021C4: 17545,
+    0x002122: 17546,
+    0x002125: 17547,
+    0x002126: 17548,
+    0x00211C: 4,
+    0x001FF9: 17549,
+    0x001FF4: 17550,
+    0x002135: 17551,
+    0x00210E: 17552,
+    0x002118: 17553,
+    0x002113: 17554,
+    0x002112: 17555,
+    0x002147: 1265,
+    0x002149: 17556,
+    0x001FED: 17557,
+    0x001FE5: 17558,
+    0x002138: 17559,
+    0x001F7B: 17560,
+    0x001F7D: 17561,
+    0x001F74: 17562,
+    0x001F75: 17563,
+    0x001FB6: 17564,
+    0x001FAF: 17565,
+    0x001FAA: 17566,
+    0x001FBC: 17567,
+    0x001FBD: 17568,
+    0x001FB9: 17569,
+    0x001FB7: 17570,
+    0x001FB4: 17571,
+    0x001F9E: 4,
+    0x001FA0: 17572,
+    0x001F6E: 17573,
+    0x001F66: 17574,
+    0x001F5F: 17575,
+    0x001F8D: 17576,
+    0x001FC5: 1265,
+    0x001FC0: 17577,
+    0x001F8F: 17578,
+    0x001F84: 17579,
+    0x001EE6: 17580,
+    0x001EF5: 17581,
+    0x001EF7: 4,
+    0x001ED8: 17582,
+    0x001ED6: 17583,
+    0x001F1E: 17584,
+    0x001F14: 17585,
+    0x001F0C: 17586,
+    0x001F08: 17587,
+    0x001EF1: 17588,
+    0x001EF4: 17589,
+    0x001F0E: 17590,
+    0x001F0B: 17591,
+    0x001F57: 17592,
+    0x001F59: 17593,
+    0x001F4E: 17594,
+    0x001F4A: 17595,
+    0x001F43: 17596,
+    0x001F28: 6210,
+    0x001E77: 17597,
+    0x001E7B: 17598,
+    0x001E8B: 17599,
+    0x001E85: 17600,
+    0x001EB5: 17601,
+    0x001EB3: 12300,
+    0x001EB6: 17602,
+    0x001EAC: 17603,
+    0x001EAA: 17604,
+    0x001E3F: 17605,
+    0x001E55: 17606,
+    0x001E56: 17607,
+    0x001E57: 17608,
+    0x001EC4: 17609,
+    0x001EC1: 716,
+    0x001EBB: 17610,
+    0x001E9C: 17611,
+    0x001E97: 17612,
+    0x001E6E: 17613,
+    0x001E6D: 17614,
+    0x001E50: 17615,
+    0x001E41: 17616,
+    0x001DFC: 17617,
+    0x001DF2: 17618,
+    0x001DEF: 17619,
+    0x001DF1: 17620,
+    0x001DC3: 17621,
+    0x001DC1: 17622,
+    0x001DED: 17623,
+    0x001E34: 17624,
+    0x001E2D: 17625,
+    0x001DB2: 17626,
+    0x001DAD: 17627,
+    0x001DD8: 157,
+    0x001DC8: 17628,
+    0x001DCC: 17629,
+    0x001DAB: 17630,
+    0x001DA0: 17631,
+    0x001E11: 17632,
+    0x001D83: 17633,
+    0x001D74: 17634,
+    0x001D6D: 17635,
+    0x001D7C: 17636,
+    0x001D4B: 17637,
+    0x001D4D: 17638,
+    0x001D8A: 17639,
+    0x001D87: 17640,
+    0x001D80: 17641,
+    0x001D58: 17642,
+    0x001D53: 17643,
+    0x001D54: 17644,
+    0x001D1D: 17645,
+    0x001D0E: 17646,
+    0x001D75: 17647,
+    0x001D5F: 17648,
+    0x001D92: 2307,
+    0x001D2F: 17649,
+    0x001CED: 17650,
+    0x001CE5: 17651,
+    0x001CDD: 17652,
+    0x001CC2: 17653,
+    0x001CBD: 17654,
+    0x001CB8: 17655,
+    0x001D0A: 17656,
+    0x001D05: 17657,
+    0x001CFF: 17658,
+    0x001C82: 17659,
+    0x001C84: 17660,
+    0x001C79: 17661,
+    0x001CA5: 17662,
+    0x001C9D: 17663,
+    0x001C96: 17664,
+    0x001CBA: 17665,
+    0x001CB0: 4,
+    0x001CAC: 17666,
+    0x001CDC: 17667,
+    0x001CD1: 17668,
+    0x001C8B: 17669,
+    0x001C57: 4,
+    0x001C5D: 17670,
+    0x001C5E: 17671,
+    0x001C5B: 17672,
+    0x001C55: 17673,
+    0x001C44: 17674,
+    0x001C4C: 17675,
+    0x001C3C: 17676,
+    0x001C29: 17677,
+    0x001C24: 17678,
+    0x001C20: 17679,
+    0x001C1C: 17680,
+    0x001C31: 17681,
+    0x001C34: 17682,
+    0x001C36: 17683,
+    0x001C07: 17684,
+    0x001C00: 17685,
+    0x001BFD: 17686,
+    0x001C6D: 17687,
+    0x001C64: 17688,
+    0x001BE6: 17689,
+    0x001BE2: 17690,
+    0x001BE0: 17691,
+    0x001BDA: 16396,
+    0x001BF5: 17692,
+    0x001C15: 17693,
+    0x001BA3: 17694,
+    0x001B9F: 17695,
+    0x001B99: 17696,
+    0x001B9A: 17697,
+    0x001BBD: 17698,
+    0x001BBE: 17699,
+    0x001BB3: 17700,
+    0x001BB7: 17701,
+    0x001BAC: 17702,
+    0x001B60: 17703,
+    0x001B57: 17704,
+    0x001B55: 17705,
+    0x001B53: 4,
+    0x001BD1: 17706,
+    0x001BD6: 17707,
+    0x001BCF: 17708,
+    0x001B8B: 404,
+    0x001B82: 17709,
+    0x001B85: 17710,
+    0x001B8C: 17711,
+    0x001B91: 17712,
+    0x001B89: 17713,
+    0x001B6A: 17714,
+    0x001B67: 17715,
+    0x001B66: 17716,
+    0x001BCB: 17717,
+    0x001B7B: 17718,
+    0x001B75: 17719,
+    0x001AD9: 17720,
+    0x001B31: 17721,
+    0x001B29: 17722,
+    0x001B28: 17723,
+    0x001B2B: 4,
+    0x001B27: 17724,
+    0x001B0E: 17725,
+    0x001B04: 17726,
+    0x001B06: 17727,
+    0x001B05: 17728,
+    0x001AFF: 17729,
+    0x001B00: 17730,
+    0x001B43: 17731,
+    0x001B3C: 17732,
+    0x001B3D: 17733,
+    0x001B1B: 17734,
+    0x001B1F: 17735,
+    0x001B49: 17736,
+    0x001B4E: 17737,
+    0x001B16: 17738,
+    0x001AE6: 17739,
+    0x001AF2: 17740,
+    0x001A7A: 17741,
+    0x001A78: 17742,
+    0x001A76: 17743,
+    0x001A70: 1068,
+    0x001A60: 17744,
+    0x001A56: 17745,
+    0x001A50: 17746,
+    0x001A53: 17747,
+    0x001A4C: 17748,
+    0x001A7D: 17749,
+    0x001A82: 17750,
+    0x001A7C: 17751,
+    0x001AAB: 17752,
+    0x001AAC: 17753,
+    0x001AAF: 17754,
+    0x001AB0: 17755,
+    0x001AC8: 17756,
+    0x001AC6: 17757,
+    0x001A61: 17758,
+    0x001A65: 17759,
+    0x001A54: 17760,
+    0x001AA1: 4,
+    0x0019F8: 17761,
+    0x0019EF: 17762,
+    0x0019F3: 17763,
+    0x0019F5: 17764,
+    0x0019F7: 17765,
+    0x0019EE: 17766,
+    0x0019EB: 17767,
+    0x0019E7: 4,
+    0x0019E9: 17768,
+    0x0019DA: 17769,
+    0x0019D0: 17770,
+    0x001A14: 17771,
+    0x001A10: 17772,
+    0x001A0C: 17773,
+    0x001A07: 17774,
+    0x001A08: 17775,
+    0x001A04: 17776,
+    0x001A02: 17777,
+    0x001A1A: 17778,
+    0x001A12: 17779,
+    0x0019D6: 17780,
+    0x0019D7: 17781,
+    0x0019C9: 17782,
+    0x001A42: 17783,
+    0x0019AC: 17784,
+    0x0019B0: 17785,
+    0x001995: 17786,
+    0x00199A: 17787,
+    0x001994: 17788,
+    0x0019BF: 17789,
+    0x0019B6: 17790,
+    0x0019B5: 17791,
+    0x00195D: 17792,
+    0x001953: 17793,
+    0x001955: 4,
+    0x001959: 17794,
+    0x00194D: 17795,
+    0x00194E: 17796,
+    0x00197C: 17797,
+    0x00196F: 17798,
+    0x0019A0: 17799,
+    0x001991: 17800,
+    0x00198C: 17801,
+    0x001962: 17802,
+    0x0019B8: 17803,
+    0x0018E4: 17804,
+    0x0018E5: 17805,
+    0x0018DD: 17806,
+    0x0018DF: 17807,
+    0x0018E1: 17808,
+    0x0018DA: 17809,
+    0x0018D5: 17810,
+    0x0018D4: 17811,
+    0x001915: 17812,
+    0x00191B: 17813,
+    0x001909: 17814,
+    0x00190A: 17815,
+    0x001904: 17816,
+    0x001934: 17817,
+    0x001923: 17818,
+    0x00191C: 17819,
+    0x001933: 17820,
+    0x001928: 17821,
+    0x00190D: 17822,
+    0x0018C2: 17823,
+    0x0018E7: 17824,
+    0x001838: 17825,
+    0x001821: 17826,
+    0x001823: 7277,
+    0x001815: 17827,
+    0x001818: 4,
+    0x0018A9: 17828,
+    0x0018A7: 17829,
+    0x0018A8: 17830,
+    0x0018A2: 17831,
+    0x00189C: 17832,
+    0x00189A: 17833,
+    0x00185F: 17834,
+    0x001864: 15453,
+    0x001866: 17835,
+    0x001860: 17836,
+    0x00183E: 17837,
+    0x001842: 889,
+    0x001840: 17838,
+    0x001857: 17839,
+    0x001853: 17840,
+    0x001859: 17841,
+    0x00184F: 17842,
+    0x001873: 4,
+    0x00187A: 17843,
+    0x00186C: 17844,
+    0x001844: 17845,
+    0x00182B: 17846,
+    0x001829: 17847,
+    0x001881: 17848,
+    0x001897: 17849,
+    0x00189E: 17850,
+    0x00181A: 17851,
+    0x001816: 17852,
+    0x0017B5: 17853,
+    0x0017AF: 17854,
+    0x0017AA: 17855,
+    0x0017AE: 17856,
+    0x0017A5: 17857,
+    0x0017A8: 17858,
+    0x0017A9: 17859,
+    0x0017C5: 17860,
+    0x0017BE: 17861,
+    0x0017C0: 17862,
+    0x0017BA: 17863,
+    0x0017D4: 17864,
+    0x0017F1: 17865,
+    0x0017FF: 17866,
+    0x0017F6: 17867,
+    0x001806: 17868,
+    0x0017F0: 17869,
+    0x00178B: 17870,
+    0x001780: 17871,
+    0x0017DF: 4,
+    0x00172F: 17872,
+    0x001728: 17873,
+    0x001746: 17874,
+    0x00174D: 17875,
+    0x001744: 17876,
+    0x001749: 17877,
+    0x001743: 17878,
+    0x00173D: 17879,
+    0x001740: 17880,
+    0x001732: 17881,
+    0x00173A: 17882,
+    0x001770: 17883,
+    0x00176D: 17884,
+    0x001773: 17885,
+    0x001722: 17886,
+    0x001723: 17887,
+    0x00176C: 17888,
+    0x00171F: 17889,
+    0x001757: 17890,
+    0x0016BB: 17891,
+    0x0016B4: 13,
+    0x0016A7: 17892,
+    0x0016BF: 17893,
+    0x0016B7: 17894,
+    0x0016A0: 17895,
+    0x0016E1: 17896,
+    0x0016E2: 17897,
+    0x001713: 17898,
+    0x0016CD: 17899,
+    0x0016EF: 17900,
+    0x0016FD: 17901,
+    0x00168D: 17902,
+    0x00168E: 17903,
+    0x001689: 17904,
+    0x00168A: 17905,
+    0x001686: 17906,
+    0x00167E: 17907,
+    0x00167B: 17908,
+    0x001679: 17909,
+    0x001678: 17910,
+    0x001674: 17911,
+    0x00164A: 17912,
+    0x001645: 17913,
+    0x00163F: 17914,
+    0x00163D: 17915,
+    0x00163A: 17916,
+    0x001638: 17812,
+    0x001627: 17917,
+    0x001622: 17918,
+    0x001613: 17919,
+    0x001633: 17920,
+    0x00162D: 17921,
+    0x00164F: 17922,
+    0x001670: 17923,
+    0x001667: 17924,
+    0x00165D: 17925,
+    0x00165B: 17926,
+    0x0015CD: 17927,
+    0x0015C9: 17928,
+    0x0015BA: 17929,
+    0x0015BB: 17930,
+    0x0015EC: 17931,
+    0x0015EF: 17932,
+    0x0015E4: 17933,
+    0x0015BF: 17934,
+    0x0015BC: 17935,
+    0x0015BD: 17936,
+    0x0015B5: 17937,
+    0x0015FB: 17938,
+    0x0015FE: 17939,
+    0x0015AE: 17940,
+    0x00160F: 17941,
+    0x001604: 17942,
+    0x00159C: 17943,
+    0x001595: 17944,
+    0x0015D9: 17945,
+    0x0015DD: 17946,
+    0x00160D: 17947,
+    0x00151A: 17948,
+    0x001514: 17949,
+    0x001516: 17950,
+    0x001565: 17951,
+    0x001569: 17952,
+    0x001563: 4,
+    0x001564: 17953,
+    0x001582: 17954,
+    0x00157B: 17955,
+    0x001578: 17956,
+    0x001571: 17957,
+    0x001543: 17958,
+    0x001541: 17959,
+    0x001561: 17960,
+    0x001558: 17961,
+    0x001538: 17962,
+    0x00152E: 17963,
+    0x00154F: 17964,
+    0x001545: 17965,
+    0x00151F: 17966,
+    0x001522: 17967,
+    0x001587: 17968,
+    0x0014EF: 17969,
+    0x0014EE: 17970,
+    0x0014A3: 17971,
+    0x001497: 17972,
+    0x001499: 17973,
+    0x001492: 17974,
+    0x001494: 17975,
+    0x0014BC: 17976,
+    0x0014B9: 17977,
+    0x0014BD: 17978,
+    0x0014B7: 17979,
+    0x0014B5: 17980,
+    0x0014CA: 17981,
+    0x0014C8: 17982,
+    0x0014C5: 17983,
+    0x0014D3: 17984,
+    0x0014D8: 17985,
+    0x0014DA: 17986,
+    0x0014D5: 17987,
+    0x001485: 17988,
+    0x001483: 17989,
+    0x00149C: 17990,
+    0x001501: 17991,
+    0x001412: 17992,
+    0x001411: 17993,
+    0x001405: 17994,
+    0x004501: 17995,
+    0x001460: 17568,
+    0x00145C: 17996,
+    0x00145A: 17997,
+    0x00145B: 17998,
+    0x001443: 17999,
+    0x001449: 854,
+    0x001446: 18000,
+    0x001440: 18001,
+    0x00142E: 18002,
+    0x001430: 18003,
+    0x001432: 18004,
+    0x0013F5: 18005,
+    0x0013F1: 18006,
+    0x00141F: 18007,
+    0x00141D: 18008,
+    0x00144C: 18009,
+    0x001471: 17387,
+    0x001403: 18010,
+    0x0013E7: 18011,
+    0x0013EA: 18012,
+    0x0013E1: 18013,
+    0x0013E3: 18014,
+    0x0013E4: 18015,
+    0x0013D9: 18016,
+    0x001394: 18017,
+    0x001389: 18018,
+    0x00138C: 18019,
+    0x00138E: 18020,
+    0x001376: 18021,
+    0x001380: 4,
+    0x001385: 18022,
+    0x0013C1: 18023,
+    0x0013C0: 18024,
+    0x0013A1: 18025,
+    0x00139C: 18026,
+    0x00136C: 18027,
+    0x001364: 18028,
+    0x00136B: 18029,
+    0x0013B3: 18030,
+    0x0013CC: 18031,
+    0x0013B7: 18032,
+    0x00130B: 18033,
+    0x00130D: 18034,
+    0x001308: 18035,
+    0x001307: 18036,
+    0x001355: 18037,
+    0x001357: 18038,
+    0x001360: 4,
+    0x00135D: 18039,
+    0x001352: 18040,
+    0x001345: 15453,
+    0x001347: 11588,
+    0x001343: 18041,
+    0x0012EC: 18042,
+    0x0012EB: 18043,
+    0x0012FC: 18044,
+    0x0012FE: 1506,
+    0x0012F7: 18045,
+    0x00133E: 18046,
+    0x00132E: 18047,
+    0x0012E1: 18048,
+    0x001339: 18049,
+    0x00132B: 18050,
+    0x00131B: 18051,
+    0x001286: 18052,
+    0x0012C2: 18053,
+    0x0012BE: 18054,
+    0x0012DF: 18055,
+    0x0012E2: 304,
+    0x0012D4: 18056,
+    0x0012D9: 4,
+    0x001274: 18057,
+    0x001270: 18058,
+    0x00126E: 18059,
+    0x0012A0: 18060,
+    0x0012AD: 5442,
+    0x0012C5: 18061,
+    0x00122D: 18062,
+    0x00122C: 18063,
+    0x00122B: 18064,
+    0x001232: 18065,
+    0x0011E5: 18066,
+    0x001204: 18067,
+    0x00120A: 18068,
+    0x001208: 18069,
+    0x001201: 4,
+    0x001200: 4,
+    0x001263: 18070,
+    0x00125C: 18071,
+    0x00125F: 18072,
+    0x00121A: 18073,
+    0x00121B: 18074,
+    0x0011EE: 18075,
+    0x00126F: 4862,
+    0x00124C: 18076,
+    0x001244: 4,
+    0x001255: 18077,
+    0x001253: 18078,
+    0x0011B4: 16108,
+    0x0011B8: 18079,
+    0x0011C1: 18080,
+    0x00118C: 18081,
+    0x001193: 4,
+    0x00118E: 18082,
+    0x001186: 18083,
+    0x001178: 18084,
+    0x00116A: 18085,
+    0x00119D: 18086,
+    0x00119A: 18087,
+    0x00119C: 18088,
+    0x001183: 18089,
+    0x00117F: 18090,
+    0x00117D: 18091,
+    0x00117C: 18092,
+    0x0011D7: 18093,
+    0x0011C8: 18094,
+    0x0011B2: 18095,
+    0x0011AF: 18096,
+    0x0011DE: 18097,
+    0x0011DF: 18098,
+    0x00115E: 18099,
+    0x001157: 5116,
+    0x001139: 18100,
+    0x00113E: 18101,
+    0x001138: 18102,
+    0x001136: 18103,
+    0x001132: 15922,
+    0x001129: 18104,
+    0x001130: 18105,
+    0x001118: 18106,
+    0x001107: 18107,
+    0x001108: 18108,
+    0x00110C: 18109,
+    0x00114B: 18110,
+    0x001147: 18111,
+    0x00114A: 18112,
+    0x001142: 18113,
+    0x001120: 4,
+    0x000FEC: 18114,
+    0x000FED: 18115,
+    0x000FDD: 18116,
+    0x00114D: 18117,
+    0x000FF0: 18118,
+    0x001103: 18119,
+    0x000F88: 18120,
+    0x000F7E: 18121,
+    0x000F83: 18122,
+    0x000F84: 18123,
+    0x000FD9: 18124,
+    0x000FD0: 18125,
+    0x000FAE: 18126,
+    0x000FB1: 18127,
+    0x000F9E: 11975,
+    0x000F93: 18128,
+    0x000F94: 14474,
+    0x000FCA: 18129,
+    0x000FC3: 18130,
+    0x000F79: 18131,
+    0x000F6C: 18132,
+    0x000F8F: 4,
+    0x000F7D: 18133,
+    0x000F76: 18134,
+    0x000FA7: 18135,
+    0x000F23: 4,
+    0x000F22: 18136,
+    0x000F24: 4,
+    0x000F17: 936,
+    0x000F1E: 18137,
+    0x000F35: 4,
+    0x000F36: 18138,
+    0x000F2B: 18139,
+    0x000F28: 18140,
+    0x000EFC: 18141,
+    0x000EFE: 18142,
+    0x000EF3: 18143,
+    0x000EF2: 18144,
+    0x000F5C: 18145,
+    0x000EE4: 18146,
+    0x000EDE: 18147,
+    0x000F52: 18148,
+    0x000F4C: 18149,
+    0x000F42: 18150,
+    0x000F39: 18151,
+    0x000F3E: 18152,
+    0x000F3F: 18153,
+    0x000F08: 18154,
+    0x000F04: 18155,
+    0x000F15: 309,
+    0x000F0D: 18156,
+    0x000E83: 4,
+    0x000E81: 18157,
+    0x000E88: 18158,
+    0x000E86: 18159,
+    0x000E69: 18160,
+    0x000E61: 18161,
+    0x000E64: 18162,
+    0x000E5A: 18163,
+    0x000ECE: 18164,
+    0x000ED4: 18165,
+    0x000ED6: 4,
+    0x000ED8: 18166,
+    0x000ED1: 18167,
+    0x000EA5: 18168,
+    0x000EA0: 18169,
+    0x000E9C: 18170,
+    0x000E9A: 18146,
+    0x000E7E: 18171,
+    0x000E77: 18172,
+    0x000E6A: 2510,
+    0x000E90: 18173,
+    0x000E8A: 18174,
+    0x000EB8: 18175,
+    0x000EBB: 18176,
+    0x000EBE: 18177,
+    0x000EB0: 18178,
+    0x000E4C: 18179,
+    0x000E49: 18180,
+    0x000E42: 18181,
+    0x000E3D: 18182,
+    0x000E39: 4,
+    0x000DE1: 18183,
+    0x000DD0: 18184,
+    0x000DD3: 18185,
+    0x000DD8: 18186,
+    0x000E34: 18187,
+    0x000E2D: 18188,
+    0x000E30: 18189,
+    0x000E0D: 18190,
+    0x000DFF: 18191,
+    0x000DF6: 18192,
+    0x000E29: 18193,
+    0x000E19: 18194,
+    0x000E5D: 18195,
+    0x000E52: 18196,
+    0x000E4D: 18197,
+    0x000E1A: 18198,
+    0x000E06: 18199,
+    0x000DAE: 18200,
+    0x000DB2: 18201,
+    0x000DAA: 18202,
+    0x000DA6: 18203,
+    0x000D9C: 5096,
+    0x000D98: 18204,
+    0x000D8C: 18205,
+    0x000D94: 18206,
+    0x000D8D: 18207,
+    0x000D7D: 18208,
+    0x000D73: 18209,
+    0x000D69: 18210,
+    0x000D68: 18211,
+    0x000D64: 18212,
+    0x000D5C: 18213,
+    0x000D60: 2034,
+    0x000D84: 18214,
+    0x000D74: 18215,
+    0x000DA2: 18216,
+    0x000DC7: 18217,
+    0x000DC2: 13,
+    0x000DBF: 18218,
+    0x000DB3: 18219,
+    0x000D38: 18220,
+    0x000D34: 18221,
+    0x000D32: 18222,
+    0x000CFC: 18223,
+    0x000CF6: 5803,
+    0x000CF2: 18224,
+    0x000D5F: 18225,
+    0x000D54: 2510,
+    0x000D4C: 18226,
+    0x000D4D: 18227,
+    0x000D12: 18228,
+    0x000D0A: 18229,
+    0x000CDC: 18230,
+    0x000CDE: 18231,
+    0x000D15: 18232,
+    0x000D0F: 18233,
+    0x000D2E: 18234,
+    0x000D28: 4,
+    0x000D53: 18235,
+    0x000CE1: 18236,
+    0x000C71: 18237,
+    0x000C72: 18238,
+    0x000CC2: 18239,
+    0x000CC1: 15453,
+    0x000CA1: 18240,
+    0x000CA6: 18241,
+    0x000C94: 18242,
+    0x000C9B: 18243,
+    0x000C8B: 18244,
+    0x000C90: 18245,
+    0x000C8C: 18246,
+    0x000C55: 18247,
+    0x000C59: 18248,
+    0x000C5C: 18249,
+    0x000C52: 18250,
+    0x000C78: 18251,
+    0x000C74: 18252,
+    0x000CC5: 18253,
+    0x000C67: 18254,
+    0x000C63: 8917,
+    0x000CBF: 18255,
+    0x000C2E: 18256,
+    0x000C2C: 18257,
+    0x000C28: 18258,
+    0x000C21: 18259,
+    0x000C1B: 18260,
+    0x000C44: 18261,
+    0x000C3B: 18262,
+    0x000C3D: 18263,
+    0x000C14: 18264,
+    0x000C53: 13,
+    0x000C48: 18265,
+    0x000C4D: 18266,
+    0x000C2F: 18267,
+    0x000C31: 4,
+    0x000C17: 18268,
+    0x000C11: 18269,
+    0x000BF7: 18270,
+    0x000C00: 18271,
+    0x000BF3: 18272,
+    0x000BED: 18273,
+    0x000BB5: 18274,
+    0x000BB9: 18275,
+    0x000BBB: 18276,
+    0x000BBC: 18277,
+    0x000BB1: 18278,
+    0x000BBF: 4,
+    0x000BAD: 18279,
+    0x000BA0: 18280,
+    0x000B91: 18281,
+    0x000B97: 18282,
+    0x000B92: 18283,
+    0x000B52: 18284,
+    0x000B49: 18285,
+    0x000B46: 4,
+    0x000BC9: 18286,
+    0x000BC2: 18287,
+    0x000B9A: 18288,
+    0x000B96: 18289,
+    0x000B9D: 18290,
+    0x000B69: 18291,
+    0x000B66: 18292,
+    0x000B56: 18293,
+    0x000B50: 18294,
+    0x000B7A: 18295,
+    0x000B84: 18296,
+    0x000B77: 18297,
+    0x000AF2: 18298,
+    0x000AF5: 18299,
+    0x000AF4: 4,
+    0x000AF0: 18300,
+    0x000AEE: 18301,
+    0x000AE9: 18302,
+    0x000ACD: 18303,
+    0x000ACC: 18304,
+    0x000ACF: 18305,
+    0x000AD1: 18306,
+    0x000AD3: 18307,
+    0x000AC8: 18308,
+    0x000B2C: 18309,
+    0x000B26: 18310,
+    0x000B28: 18311,
+    0x000B30: 18312,
+    0x000B2A: 18313,
+    0x000B13: 18314,
+    0x000B10: 18315,
+    0x000B07: 18316,
+    0x000B04: 18317,
+    0x000AC6: 18318,
+    0x000AAB: 18319,
+    0x000B38: 18320,
+    0x000B32: 18321,
+    0x000AD8: 18322,
+    0x000B2B: 18323,
+    0x000B1F: 18324,
+    0x000AF9: 18325,
+    0x000B02: 18326,
+    0x000A7D: 18327,
+    0x000A7F: 18328,
+    0x000A81: 18329,
+    0x000A87: 18330,
+    0x000A77: 18331,
+    0x000A7A: 18332,
+    0x000A38: 18333,
+    0x000A41: 4,
+    0x000A3E: 18334,
+    0x000A48: 18335,
+    0x000A36: 18336,
+    0x000A32: 18337,
+    0x000A2B: 18338,
+    0x000A9C: 18339,
+    0x000A8C: 18340,
+    0x000A96: 18341,
+    0x000A82: 18342,
+    0x000A54: 18343,
+    0x000A52: 18344,
+    0x000A4F: 18345,
+    0x000A42: 4,
+    0x000A65: 18346,
+    0x000A59: 18347,
+    0x000A22: 18348,
+    0x000A1C: 18349,
+    0x000AB4: 18350,
+    0x000A75: 18351,
+    0x0009D0: 18352,
+    0x0009CC: 18353,
+    0x0009C8: 18354,
+    0x0009B2: 18355,
+    0x0009A8: 18356,
+    0x0009AA: 18357,
+    0x0009A4: 18358,
+    0x0009A6: 18359,
+    0x0009A7: 18360,
+    0x0009A0: 18361,
+    0x00099B: 18362,
+    0x000990: 18363,
+    0x000A12: 18364,
+    0x000A13: 18365,
+    0x000A09: 18366,
+    0x0009C4: 18367,
+    0x0009B7: 4,
+    0x0009EF: 18368,
+    0x0009E4: 18369,
+    0x000A00: 18370,
+    0x0009F0: 18371,
+    0x0009D9: 18372,
+    0x000942: 18373,
+    0x000945: 18374,
+    0x00093E: 18375,
+    0x000940: 18376,
+    0x00093B: 18377,
+    0x00097F: 18378,
+    0x000980: 18379,
+    0x000972: 18380,
+    0x000978: 18381,
+    0x000973: 18382,
+    0x000975: 18383,
+    0x000977: 18384,
+    0x000969: 18385,
+    0x00096E: 18386,
+    0x000920: 18387,
+    0x000922: 18388,
+    0x000916: 18389,
+    0x00096C: 18390,
+    0x00095F: 18391,
+    0x000953: 18392,
+    0x00094C: 18393,
+    0x000930: 18394,
+    0x00091E: 18395,
+    0x000934: 18396,
+    0x00098A: 18397,
+    0x0008A5: 18398,
+    0x0008A2: 18399,
+    0x000898: 18400,
+    0x00089B: 18401,
+    0x00089C: 18402,
+    0x00089D: 18403,
+    0x0008CF: 18404,
+    0x0008CB: 18405,
+    0x0008D3: 18406,
+    0x0008D0: 18407,
+    0x0008F4: 18408,
+    0x0008F7: 18409,
+    0x0008F5: 18410,
+    0x000911: 4,
+    0x000912: 4,
+    0x000908: 18411,
+    0x00090B: 18412,
+    0x0008B5: 18413,
+    0x0008B7: 18414,
+    0x0008A9: 18415,
+    0x0008C8: 18416,
+    0x0008C4: 18417,
+    0x0008BA: 18418,
+    0x00088F: 18419,
+    0x00088B: 18420,
+    0x000886: 18421,
+    0x0008EC: 18422,
+    0x0008E6: 18423,
+    0x0008E2: 4,
+    0x000905: 18424,
+    0x0008F9: 3809,
+    0x0007E1: 18425,
+    0x0007E0: 18426,
+    0x0007D6: 18427,
+    0x0007D7: 18428,
+    0x0007D4: 18429,
+    0x0007CE: 18430,
+    0x0007D3: 18431,
+    0x0007D0: 18432,
+    0x00085D: 18433,
+    0x000855: 18434,
+    0x00085A: 18435,
+    0x000858: 18436,
+    0x000850: 18437,
+    0x00085B: 18438,
+    0x0007ED: 18439,
+    0x0007EA: 18440,
+    0x0007F1: 18441,
+    0x0007F2: 18442,
+    0x0007F0: 18443,
+    0x0007E7: 18444,
+    0x0007E3: 18445,
+    0x000817: 18446,
+    0x000815: 18447,
+    0x000818: 18448,
+    0x00080F: 18449,
+    0x000812: 18450,
+    0x00080B: 18451,
+    0x00080A: 18452,
+    0x0007FA: 18453,
+    0x0007F6: 18454,
+    0x0007FB: 18455,
+    0x00047C: 18456,
+    0x0007BE: 18457,
+    0x00082B: 18458,
+    0x00082E: 18459,
+    0x00082A: 18460,
+    0x00086B: 18461,
+    0x00087F: 18462,
+    0x0007AF: 11588,
+    0x0007B2: 18463,
+    0x0007AD: 18464,
+    0x0007AC: 18465,
+    0x0007AA: 18466,
+    0x0007A4: 18467,
+    0x00079D: 18468,
+    0x00079F: 18469,
+    0x000792: 18470,
+    0x000790: 18471,
+    0x00078D: 18472,
+    0x00078A: 18473,
+    0x00076A: 18474,
+    0x000767: 18475,
+    0x00075B: 18476,
+    0x000762: 18477,
+    0x000784: 4,
+    0x000776: 18478,
+    0x00077A: 18479,
+    0x00070C: 18480,
+    0x00070F: 18481,
+    0x000727: 18482,
+    0x00072E: 18483,
+    0x0006E6: 18484,
+    0x0006D2: 18485,
+    0x0006D8: 18486,
+    0x0006CF: 18487,
+    0x0006B6: 18488,
+    0x0006A3: 18489,
+    0x00069F: 18490,
+    0x0006A2: 18491,
+    0x0006A6: 18492,
+    0x0006AA: 18493,
+    0x000657: 18494,
+    0x0006DC: 18495,
+    0x000697: 18496,
+    0x00069A: 18497,
+    0x000699: 18498,
+    0x00068D: 18499,
+    0x000684: 18500,
+    0x000682: 18501,
+    0x0006BB: 18502,
+    0x0006BD: 18503,
+    0x0006C3: 18504,
+    0x0006B2: 18505,
+    0x0006FE: 18506,
+    0x0006E7: 18507,
+    0x0006ED: 18508,
+    0x000714: 18509,
+    0x0006F3: 18510,
+    0x0006DB: 18511,
+    0x0006B8: 18512,
+    0x00066B: 18513,
+    0x00055A: 18514,
+    0x000653: 4,
+    0x00064F: 18515,
+    0x000651: 18516,
+    0x00065C: 18517,
+    0x000622: 18518,
+    0x000612: 18519,
+    0x000609: 18520,
+    0x000616: 18521,
+    0x00060D: 18522,
+    0x000642: 18523,
+    0x00064A: 18524,
+    0x00063F: 18525,
+    0x00063D: 18526,
+    0x000639: 18527,
+    0x0005EF: 18528,
+    0x0005E9: 18529,
+    0x000600: 18530,
+    0x0005E6: 18531,
+    0x00067D: 18532,
+    0x000671: 18533,
+    0x000672: 18534,
+    0x00062F: 18535,
+    0x000636: 18536,
+    0x00CBBD: 18537,
+    0x0005E3: 18538,
+    0x0005ED: 18539,
+    0x00066A: 18540,
+    0x000661: 18541,
+    0x00061E: 18542,
+    0x0005C6: 18543,
+    0x0005CC: 18544,
+    0x0005CF: 18545,
+    0x0005A0: 18546,
+    0x0005A6: 18547,
+    0x000588: 18548,
+    0x00058D: 18549,
+    0x00058A: 18550,
+    0x000591: 18551,
+    0x000593: 18552,
+    0x00058F: 18553,
+    0x000584: 18554,
+    0x0005D6: 18295,
+    0x0005DA: 18555,
+    0x0005C7: 18556,
+    0x000564: 18557,
+    0x000558: 18558,
+    0x000550: 18559,
+    0x0005A9: 18560,
+    0x0005AF: 18561,
+    0x0005A1: 18562,
+    0x000541: 18563,
+    0x000545: 18564,
+    0x00057A: 18565,
+    0x0005BB: 18566,
+    0x0004F8: 18567,
+    0x0004F5: 18568,
+    0x0004F2: 1233,
+    0x0004F3: 18569,
+    0x0004ED: 18570,
+    0x0004E7: 18571,
+    0x0004E6: 18572,
+    0x0004DE: 4,
+    0x000531: 4,
+    0x000539: 18573,
+    0x00052A: 18574,
+    0x00052D: 18575,
+    0x000517: 18576,
+    0x00051C: 18577,
+    0x000512: 1805,
+    0x000503: 18578,
+    0x0004F9: 18579,
+    0x0004FA: 18580,
+    0x00053A: 18581,
+    0x0004E1: 18582,
+    0x000525: 18583,
+    0x0004A6: 18584,
+    0x0004A8: 18585,
+    0x0004A1: 18586,
+    0x0004A2: 18587,
+    0x00049B: 4,
+    0x00047A: 18588,
+    0x00046A: 18589,
+    0x00046B: 18590,
+    0x000472: 18591,
+    0x000464: 18592,
+    0x000490: 18593,
+    0x000486: 18594,
+    0x00048B: 18595,
+    0x000484: 18596,
+    0x000478: 18597,
+    0x00044E: 4,
+    0x000452: 18598,
+    0x000442: 18599,
+    0x000445: 18600,
+    0x00043D: 18601,
+    0x00043B: 18602,
+    0x000431: 18603,
+    0x000499: 18604,
+    0x00048E: 18605,
+    0x00048D: 18606,
+    0x0004CE: 18607,
+    0x0004C7: 18608,
+    0x000465: 18609,
+    0x00045E: 18610,
+    0x0004C2: 18611,
+    0x0003C9: 17812,
+    0x0003C1: 18612,
+    0x0003C4: 18613,
+    0x0003BF: 18614,
+    0x0003FD: 4,
+    0x0003F9: 18615,
+    0x0003FE: 4,
+    0x0003B9: 18616,
+    0x0003BA: 2279,
+    0x0003AF: 18617,
+    0x000411: 18618,
+    0x000410: 18619,
+    0x000412: 18620,
+    0x0003AC: 18621,
+    0x000399: 18622,
+    0x00030B: 18623,
+    0x000427: 4,
+    0x000420: 18624,
+    0x0003DE: 18625,
+    0x0003F5: 18626,
+    0x000330: 18627,
+    0x000328: 18628,
+    0x00032B: 18629,
+    0x00032C: 18630,
+    0x000323: 18631,
+    0x000313: 18632,
+    0x000310: 18633,
+    0x00030A: 18634,
+    0x000304: 18635,
+    0x000301: 18636,
+    0x0002FD: 4,
+    0x000340: 18637,
+    0x0001EC: 15005,
+    0x000333: 18638,
+    0x000338: 18639,
+    0x000339: 18640,
+    0x000331: 4,
+    0x000381: 18641,
+    0x000380: 18642,
+    0x000382: 18643,
+    0x00037A: 13757,
+    0x000375: 18644,
+    0x000391: 18645,
+    0x00038F: 18646,
+    0x000384: 18647,
+    0x000387: 18648,
+    0x00035A: 18649,
+    0x000353: 18650,
+    0x00031E: 18651,
+    0x000315: 18652,
+    0x000319: 18653,
+    0x00037B: 18654,
+    0x000367: 18655,
+    0x00036A: 18656,
+    0x00036B: 4,
+    0x00036C: 4,
+    0x00034F: 18657,
+    0x00034A: 18658,
+    0x0002B6: 18659,
+    0x0002B1: 18660,
+    0x0002AD: 18661,
+    0x0002AE: 18662,
+    0x0002A2: 18663,
+    0x0002C2: 18664,
+    0x0002BD: 18665,
+    0x0002BE: 18666,
+    0x0002B9: 4,
+    0x0002BA: 4,
+    0x000300: 18667,
+    0x0002F9: 18668,
+    0x0002F3: 18669,
+    0x0002EA: 18670,
+    0x00025A: 18671,
+    0x00026E: 18672,
+    0x0002E7: 18673,
+    0x0002DF: 18674,
+    0x0002DB: 18675,
+    0x000270: 18676,
+    0x00029A: 18677,
+    0x00028F: 18678,
+    0x000287: 18679,
+    0x000281: 4102,
+    0x0002CF: 18680,
+    0x0002D1: 18681,
+    0x000254: 18682,
+    0x00024B: 4,
+    0x00024D: 18683,
+    0x000250: 18684,
+    0x0001D9: 18685,
+    0x0001C5: 18686,
+    0x0001C9: 4,
+    0x0001C4: 18687,
+    0x000200: 18688,
+    0x0001E4: 18689,
+    0x0001F3: 18690,
+    0x0001E3: 344,
+    0x000248: 18691,
+    0x00024C: 18692,
+    0x000240: 18693,
+    0x00023B: 3584,
+    0x0001EB: 18694,
+    0x0001F2: 18695,
+    0x0001D8: 18696,
+    0x000239: 18697,
+    0x000233: 18698,
+    0x00022A: 18699,
+    0x000205: 18700,
+    0x0001F7: 18701,
+    0x000221: 18702,
+    0x000215: 18703,
+    0x00021B: 18704,
+    0x00021E: 18705,
+    0x00018A: 18706,
+    0x000192: 18707,
+    0x000182: 18708,
+    0x000189: 18709,
+    0x000193: 18710,
+    0x0030F5: 18711,
+    0x000145: 18712,
+    0x000137: 18713,
+    0x000133: 18714,
+    0x00013C: 18715,
+    0x00014C: 18716,
+    0x0001A3: 18717,
+    0x00018C: 18718,
+    0x00018F: 18719,
+    0x00017B: 18720,
+    0x000173: 18721,
+    0x00016C: 17961,
+    0x000175: 18722,
+    0x00015C: 18723,
+    0x0001AB: 18724,
+    0x0001AF: 3809,
+    0x000169: 18725,
+    0x00016B: 18726,
+    0x0001A5: 18727,
+    0x000190: 18728,
+    0x0001C1: 18729,
+    0x0001B6: 18730,
+    0x00015D: 4606,
+    0x00B02A: 18731,
+    0x00B069: 18732,
+    0x00B0C2: 4,
+    0x00B03B: 18733,
+    0x00B086: 18734,
+    0x003046: 18735,
+    0x003075: 18736,
+    0x003098: 18737,
+    0x00300D: 18738,
+    0x0030A2: 18739,
+    0x003042: 18740,
+    0x003037: 18741,
+    0x003057: 18742,
+    0x0030FC: 18743,
+    0x000127: 18744,
+    0x000104: 18745,
+    0x00010E: 18746,
+    0x00013D: 18747,
+    0x000143: 4,
+    0x00014B: 18748,
+    0x000120: 18749,
+    0x0030C2: 18750,
+    0x0030F3: 18751,
+    0x0030CC: 18752,
+    0x0030B0: 18753,
+    0x00029C: 717,
+    0x00B019: 3185,
+    0x00B0C7: 18754,
+    0x003086: 18755,
+    0x000106: 18756,
+    0x000109: 18757,
+    0x00305F: 18758,
+    0x0030DC: 18759,
+    0x003025: 18760,
+    0x0030C6: 18761,
+    0x0030E3: 18762,
+    0x0030BF: 18763,
+    0x003034: 18764,
+    0x00304A: 18765,
+    0x00308D: 18766,
+    0x0030F6: 18767,
+    0x0030D6: 18768,
+    0x003041: 18769,
+    0x00308C: 5042,
+    0x003019: 4,
+    0x003076: 18770,
+    0x0030EC: 18771,
+    0x00303C: 18772,
+    0x003024: 4,
+    0x0030D8: 18773,
+    0x003016: 18774,
+    0x00306F: 18775,
+    0x00303D: 18776,
+    0x0030F4: 18777,
+    0x0030EB: 18778,
+    0x0030A1: 18779,
+    0x00306A: 18780,
+    0x003053: 18781,
+    0x0030D2: 18782,
+    0x003097: 18783,
+    0x00D043: 18784,
+    0x00D0C1: 18785,
+    0x00D035: 18786,
+    0x00D0DB: 18787,
+    0x00D070: 18788,
+    0x00D029: 18789,
+    0x00D0B1: 18790,
+    0x00D016: 18791,
+    0x003012: 18792,
+    0x00D00F: 18793,
+    0x003058: 18794,
+    0x0030A6: 18795,
+    0x00D0C3: 18796,
+    0x00D0C8: 18797,
+    0x00D07E: 18798,
+    0x00D0EA: 18799,
+    0x00D020: 18800,
+    0x00D0CB: 5785,
+    0x00D019: 18801,
+    0x00D013: 18802,
+    0x00D0A3: 18803,
+    0x00D0BF: 18804,
+    0x00D02F: 18805,
+    0x00D0AC: 18806,
+    0x00D0BC: 4,
+    0x0050A1: 18807,
+    0x005017: 18808,
+    0x005065: 18809,
+    0x0050B9: 18810,
+    0x00506B: 18811,
+    0x00504A: 18812,
+    0x00D064: 18813,
+    0x00D05E: 18814,
+    0x00D0AA: 18815,
+    0x00D0FA: 18816,
+    0x00D0EB: 18817,
+    0x00D006: 4,
+    0x00D02A: 18818,
+    0x00D08F: 18819,
+    0x00D051: 18820,
+    0x00D0BB: 4,
+    0x00D06E: 18821,
+    0x00D05C: 18822,
+    0x00D05D: 18823,
+    0x00D0A1: 18824,
+    0x00D0C0: 4,
+    0x00D076: 18825,
+    0x0050C1: 18826,
+    0x005075: 18827,
+    0x0050ED: 18828,
+    0x005096: 18829,
+    0x005024: 18830,
+    0x00D068: 18831,
+    0x005012: 18832,
+    0x0050F2: 18833,
+    0x005029: 18834,
+    0x005081: 18835,
+    0x0050AC: 18836,
+    0x005049: 18837,
+    0x00902C: 18838,
+    0x0090BD: 18839,
+    0x0090B4: 18840,
+    0x009003: 18841,
+    0x0050CF: 18842,
+    0x0050A4: 18843,
+    0x0050A3: 18844,
+    0x00505C: 18845,
+    0x0050B3: 18846,
+    0x0050CD: 18847,
+    0x00502D: 18848,
+    0x00503A: 18849,
+    0x005087: 18850,
+    0x00508C: 18851,
+    0x0050E1: 18852,
+    0x0050DE: 18853,
+    0x00507B: 18854,
+    0x00500D: 18855,
+    0x005026: 18856,
+    0x0090CF: 18857,
+    0x00902F: 18858,
+    0x009098: 18859,
+    0x009045: 3955,
+    0x009036: 18860,
+    0x00908B: 18861,
+    0x009044: 18862,
+    0x00907C: 18863,
+    0x009042: 18864,
+    0x009051: 18865,
+    0x009026: 18866,
+    0x0090D3: 18867,
+    0x009067: 18868,
+    0x009025: 18869,
+    0x00904C: 18870,
+    0x009084: 18871,
+    0x00906A: 18872,
+    0x009087: 18873,
+    0x009031: 18874,
+    0x00909D: 18875,
+    0x0090DD: 18876,
+    0x009028: 18877,
+    0x00907D: 18878,
+    0x0090C9: 18879,
+    0x00901D: 18880,
+    0x00907E: 18881,
+    0x009050: 18882,
+    0x00902A: 18883,
+    0x009072: 18884,
+    0x00900D: 18885,
+    0x009033: 18886,
+    0x009002: 18887,
+    0x0090FC: 18888,
+    0x009014: 18889,
+    0x00904D: 18890,
+    0x0090FD: 18891,
+    0x009039: 18892,
+    0x009091: 18893,
+    0x00908D: 18894,
+    0x009097: 7583,
+    0x000629: 2034,
+    0x0010A9: 18895,
+    0x00108A: 18896,
+    0x001024: 18897,
+    0x0010D6: 18898,
+    0x001048: 18899,
+    0x001097: 18900,
+    0x001085: 18901,
+    0x00100C: 18902,
+    0x001006: 18903,
+    0x00106F: 18904,
+    0x001034: 18905,
+    0x001044: 18906,
+    0x00908E: 18907,
+    0x009009: 18908,
+    0x0090D2: 18909,
+    0x0001FE: 4158,
+    0x0010D9: 18910,
+    0x00103C: 18911,
+    0x001019: 18912,
+    0x00107F: 8501,
+    0x0010D4: 18913,
+    0x0010E2: 18914,
+    0x0090DE: 18915,
+    0x00906B: 18916,
+    0x0090BE: 18917,
+    0x009066: 18918,
+    0x0010D2: 18919,
+    0x001094: 18920,
+    0x001050: 18921,
+    0x0010CE: 18922,
+    0x0010B2: 18923,
+    0x0010A1: 18924,
+    0x00105F: 18925,
+    0x00103E: 18926,
+    0x0010CB: 18927,
+    0x0010E0: 4606,
+    0x00107C: 18928,
+    0x0010BD: 18929,
+    0x001038: 18930,
+    0x0010A8: 18931,
+    0x0010D1: 18932,
+    0x00106A: 18933,
+    0x00103B: 18934,
+    0x001089: 18935,
+    0x001008: 18936,
+    0x00106E: 18937,
+    0x00109A: 18938,
+    0x00E0D1: 18939,
+    0x00E0F0: 18940,
+    0x00E002: 18941,
+    0x00E0D6: 18942,
+    0x00E0B7: 18943,
+    0x00E083: 18944,
+    0x00E072: 18945,
+    0x00E0AD: 18946,
+    0x00E094: 18947,
+    0x00E032: 18948,
+    0x00E0C0: 18949,
+    0x00E027: 18950,
+    0x00E044: 18951,
+    0x00E0CA: 18952,
+    0x00E0A7: 18953,
+    0x00E097: 18954,
+    0x00E089: 11697,
+    0x00E070: 18955,
+    0x00E055: 18956,
+    0x00E042: 18957,
+    0x00E0EB: 18958,
+    0x00E04B: 18959,
+    0x00E074: 18960,
+    0x00E0D9: 18961,
+    0x00E093: 18962,
+    0x00E071: 18963,
+    0x00E066: 18964,
+    0x00E0B4: 18965,
+    0x00605B: 18966,
+    0x0060D7: 18967,
+    0x0060F3: 18920,
+    0x00607C: 18968,
+    0x0060C1: 18969,
+    0x00603C: 18970,
+    0x00607D: 18971,
+    0x00606E: 18972,
+    0x0060C7: 18973,
+    0x00E060: 18974,
+    0x00E0BA: 18975,
+    0x00E021: 18976,
+    0x00E05B: 18977,
+    0x00E062: 18978,
+    0x00E001: 18979,
+    0x00E0D8: 18980,
+    0x00E01F: 18981,
+    0x00E0D0: 18982,
+    0x006073: 18983,
+    0x0060FD: 18984,
+    0x0060FB: 18985,
+    0x00E0CE: 18986,
+    0x00E05F: 18987,
+    0x00E0E7: 18988,
+    0x00E073: 18989,
+    0x00E06A: 18990,
+    0x00E03C: 18991,
+    0x00E024: 18992,
+    0x1000E8: 8090,
+    0x006031: 18993,
+    0x0060ED: 18994,
+    0x006012: 18995,
+    0x00604D: 18996,
+    0x0060DD: 18997,
+    0x0060F4: 18998,
+    0x006060: 18999,
+    0x0060F7: 19000,
+    0x006020: 19001,
+    0x0060C0: 19002,
+    0x00600E: 19003,
+    0x0060A0: 19004,
+    0x006017: 19005,
+    0x006026: 19006,
+    0x006019: 19007,
+    0x006059: 19008,
+    0x006003: 19009,
+    0x006095: 19010,
+    0x0060CB: 19011,
+    0x0060C8: 19012,
+    0x006023: 19013,
+    0x006063: 19014,
+    0x006035: 19015,
+    0x006007: 19016,
+    0x006058: 19017,
+    0x00607A: 19018,
+    0x006066: 19019,
+    0x006077: 19020,
+    0x006094: 2034,
+    0x0060AB: 3936,
+    0x00605A: 19021,
+    0x0060A3: 19022,
+    0x00603D: 19023,
+    0x006046: 19024,
+    0x00A0DA: 19025,
+    0x00A02A: 19026,
+    0x00A01C: 19027,
+    0x00A09A: 19028,
+    0x00A078: 3955,
+    0x00A0BF: 19029,
+    0x00A05F: 19030,
+    0x00A0CD: 19031,
+    0x00A02D: 19032,
+    0x00A07C: 19033,
+    0x00A0E6: 19034,
+    0x00A04A: 19035,
+    0x00A035: 19036,
+    0x00A03F: 19037,
+    0x00A03D: 19038,
+    0x00A026: 19039,
+    0x00A023: 19040,
+    0x00A08F: 19041,
+    0x00A0CC: 19042,
+    0x00A0B7: 19043,
+    0x00A056: 19044,
+    0x00A0E1: 19045,
+    0x00608A: 19046,
+    0x006093: 19047,
+    0x00A089: 19048,
+    0x00A007: 19049,
+    0x00A047: 19050,
+    0x00A032: 19051,
+    0x00A0E3: 19052,
+    0x00A014: 19053,
+    0x00A015: 19054,
+    0x00A06A: 3947,
+    0x00A070: 19055,
+    0x002020: 19056,
+    0x00201B: 19057,
+    0x0020C0: 19058,
+    0x00206F: 19059,
+    0x00A018: 19060,
+    0x00A0FE: 19061,
+    0x00A0EB: 19062,
+    0x00A07D: 19063,
+    0x00A0D9: 19064,
+    0x0020DE: 19065,
+    0x00200B: 8497,
+    0x002094: 19066,
+    0x0020F7: 19067,
+    0x0020D7: 19068,
+    0x0020C3: 19069,
+    0x0020FB: 19070,
+    0x002047: 19071,
+    0x0020D5: 19072,
+    0x00201A: 19073,
+    0x0020F2: 4606,
+    0x0020B8: 19074,
+    0x002062: 19075,
+    0x002081: 19076,
+    0x0020D9: 19077,
+    0x00207E: 19078,
+    0x0020AD: 19079,
+    0x00207D: 19080,
+    0x00202F: 19081,
+    0x00209A: 19082,
+    0x002001: 19083,
+    0x0020BF: 19084,
+    0x00204E: 19085,
+    0x0020FF: 19086,
+    0x002044: 19087,
+    0x0020A1: 19088,
+    0x002070: 19089,
+    0x0020BE: 19090,
+    0x00204A: 19091,
+    0x0020F3: 19092,
+    0x002090: 19093,
+    0x002053: 19094,
+    0x0020CA: 19095,
+    0x002095: 19096,
+    0x00203F: 19097,
+    0x0020A9: 19098,
+    0x002096: 19099,
+    0x0020EF: 19100,
+    0x002030: 19101,
+    0x0020AC: 19102,
+    0x0020D8: 1034,
+    0x002066: 19103,
+    0x002036: 19104,
+    0x0020F8: 19105,
+    0x00C02F: 19106,
+    0x00C01E: 19107,
+    0x00C0E1: 19108,
+    0x00C065: 19109,
+    0x00C079: 19110,
+    0x00406F: 19111,
+    0x00404F: 19112,
+    0x00408F: 19113,
+    0x0040D7: 19114,
+    0x004057: 19115,
+    0x004017: 19116,
+    0x00C071: 19117,
+    0x00C0C4: 19118,
+    0x00C012: 19119,
+    0x00C0D9: 19120,
+    0x00C0B1: 19121,
+    0x00C00F: 19122,
+    0x00C087: 19123,
+    0x00C006: 19124,
+    0x00C0D2: 19125,
+    0x00C07E: 19126,
+    0x00C0DD: 1054,
+    0x00C01B: 19127,
+    0x00C03F: 19128,
+    0x00C036: 19129,
+    0x00C040: 19130,
+    0x00C0A4: 19131,
+    0x00C029: 19132,
+    0x00C0FA: 19133,
+    0x00C01C: 19134,
+    0x00C096: 19135,
+    0x00C04E: 19136,
+    0x00C044: 19137,
+    0x00C0E6: 3947,
+    0x00C042: 19138,
+    0x00C0A2: 19139,
+    0x00C053: 19140,
+    0x00C0CC: 19141,
+    0x00C0CE: 19142,
+    0x00C08E: 19143,
+    0x00C0C7: 19144,
+    0x0040F3: 19145,
+    0x00404B: 19146,
+    0x004033: 19147,
+    0x0040AD: 19148,
+    0x00406D: 19149,
+    0x0040CD: 19150,
+    0x0040F5: 19151,
+    0x004039: 19152,
+    0x004079: 19153,
+    0x004059: 19154,
+    0x0040AE: 19155,
+    0x0040F6: 19156,
+    0x00C05F: 19157,
+    0x0080D9: 19158,
+    0x00C020: 19159,
+    0x00C0E7: 19160,
+    0x0040F4: 19161,
+    0x0040B4: 19162,
+    0x0040B0: 19163,
+    0x004086: 19164,
+    0x004092: 19165,
+    0x0040B9: 19166,
+    0x0040BB: 19167,
+    0x0040B1: 19168,
+    0x00407F: 19169,
+    0x004095: 19170,
+    0x004035: 19171,
+    0x00405C: 19172,
+    0x004061: 19173,
+    0x00008C: 19174,
+    0x0040C5: 19175,
+    0x004020: 19176,
+    0x004048: 19177,
+    0x004068: 19178,
+    0x004078: 19179,
+    0x0040F8: 19180,
+    0x004024: 19181,
+    0x0040D2: 19182,
+    0x0040E9: 19183,
+    0x004003: 19184,
+    0x004090: 19185,
+    0x00407C: 19186,
+    0x004044: 19187,
+    0x00402D: 19188,
+    0x008081: 19189,
+    0x00809C: 19190,
+    0x008065: 19191,
+    0x008019: 19192,
+    0x008050: 19193,
+    0x0080D2: 19194,
+    0x008089: 19195,
+    0x00806F: 19196,
+    0x008084: 19197,
+    0x0080A6: 19198,
+    0x0040FC: 19199,
+    0x0040DE: 19200,
+    0x0040C9: 19201,
+    0x0080CF: 19202,
+    0x008090: 3291,
+    0x0080C4: 19203,
+    0x0040A0: 19204,
+    0x0040DF: 19205,
+    0x004009: 19206,
+    0x008032: 19207,
+    0x00805B: 19208,
+    0x008043: 19209,
+    0x0080AF: 19210,
+    0x000055: 19211,
+    0x000041: 19212,
+    0x000086: 19213,
+    0x000092: 19214,
+    0x000058: 19215,
+    0x0080CE: 19216,
+    0x00800C: 19217,
+    0x00807D: 19218,
+    0x008063: 4192,
+    0x008074: 19219,
+    0x008030: 19220,
+    0x0080C9: 19221,
+    0x0080EE: 19222,
+    0x00808E: 19223,
+    0x00801A: 19224,
+    0x008052: 19225,
+    0x00805D: 19226,
+    0x00804F: 19227,
+    0x008005: 19228,
+    0x0080CD: 19229,
+    0x008003: 19230,
+    0x008099: 19231,
+    0x00808D: 19232,
+    0x0080BE: 19233,
+    0x008015: 19234,
+    0x0080A4: 19235,
+    0x0080F3: 19236,
+    0x008096: 19237,
+    0x0080DA: 19238,
+    0x00803E: 19239,
+    0x0080DE: 19240,
+    0x00806D: 19241,
+    0x008094: 19242,
+    0x008002: 19243,
+    0x008064: 19244,
+    0x008048: 19245,
+    0x008085: 19246,
+    0x00804C: 19247,
+    0x00808F: 19248,
+    0x000052: 19249,
+    0x0080FF: 19250,
+    0x000037: 19251,
+    0x0000F7: 19252,
+    0x0000C7: 19253,
+    0x0000D1: 19254,
+    0x000016: 19255,
+    0x0000E2: 19256,
+    0x0000E1: 19257,
+    0x000081: 4129,
+    0x000029: 19258,
+    0x0000FB: 19259,
+    0x00000D: 19260,
+    0x00000A: 19261,
+    0x000024: 19262,
+    0x0000CF: 4106,
+    0x0000EF: 19263,
+    0x000025: 19264,
+    0x000067: 19265,
+    0x0000D2: 19266,
+    0x0000BA: 19267,
+    0x08007B: 19268,
+    0x08007C: 19269,
+    0x08008E: 19270,
+    0x080084: 19271,
+    0x080085: 19272,
+    0x080082: 19273,
+    0x080080: 19274,
+    0x00002A: 19275,
+    0x00002C: 19276,
+    0x00006C: 13,
+    0x0000F3: 19277,
+    0x0000B0: 19278,
+    0x0000A9: 19279,
+    0x0000DF: 19280,
+    0x0000F9: 19281,
+    0x0000AF: 19282,
+    0x000076: 19283,
+    0x080041: 19284,
+    0x080035: 19285,
+    0x080032: 19286,
+    0x080077: 19287,
+    0x080074: 19288,
+    0x08006E: 19289,
+    0x080053: 19290,
+    0x08004C: 19291,
+    0x080047: 19292,
+    0x08004A: 19293,
+    0x080044: 19294,
+    0x080068: 19295,
+    0x080063: 19296,
+    0x080060: 19297,
+    0x080055: 19298,
+    0x08000B: 19299,
+    0x00DD01: 4168,
+    0x08008A: 19300,
+    0x00DD06: 4168,
+    0x02BB01: 15495,
+    0x00003E: 19301,
+    0x080015: 19302,
+    0x080042: 19303,
+    0xAA0003: 4158,
+    0x080066: 19304,
+    0x000000: 4167,
+    0xF82111: 145,
+    0xEC9161: 195,
+    0x08008D: 19305,
+    0x00DD02: 4168,
+    0x00DD04: 4168,
+    0x08003F: 19306,
+    0xC0D60A: 53,
+    0x7C49CF: 63,
+    0x2883C9: 49,
+    0x080021: 19307,
+    0x026086: 3973,
+    0xDCA0D0: 77,
+    0xF02F9E: 77,
+    0x403668: 19308,
+    0x183F70: 49,
+    0xA4F6E8: 49,
+    0x6441E6: 49,
+    0x70BB5B: 49,
+    0xE8519E: 257,
+    0x740EA4: 49,
+    0x6057C8: 49,
+    0xD4413F: 19309,
+    0x44A038: 117,
+    0xF86DCC: 57,
+    0xD0D7BE: 15,
+    0x206BF4: 117,
+    0xE82BC5: 117,
+    0x08276B: 117,
+    0x3CCD73: 19310,
+    0x3C13BB: 15,
+    0xCC36CF: 4,
+    0x58D8A7: 19311,
+    0xECB1E0: 12044,
+    0xB40016: 11885,
+    0xC89CBB: 278,
+    0x345EE7: 19312,
+    0x54B874: 167,
+    0xC45781: 19313,
+    0xF4DD06: 90,
+    0x101EDA: 11885,
+    0x44D47F: 11885,
+    0x185D6F: 19314,
+    0x6451F4: 117,
+    0x4C60BA: 4254,
+    0x486345: 117,
+    0x709041: 179,
+    0x785994: 19315,
+    0x14CB49: 19316,
+    0x94A4B5: 1696,
+    0x30C922: 14,
+    0xC4955F: 19317,
+    0xCC1B5A: 272,
+    0x242D6C: 63,
+    0x3890AF: 11,
+    0x1879FD: 11,
+    0x64A444: 19318,
+    0x7048B5: 19319,
+    0x18314F: 19320,
+    0x681D4C: 4401,
+    0x0C6743: 15,
+    0xF47946: 15,
+    0x30B851: 344,
+    0x780B8C: 13,
+    0x9433D8: 4,
+    0x840A9E: 19321,
+    0xD06B78: 49,
+    0x0C53B7: 49,
+    0x7CF34D: 49,
+    0x000F2C: 4194,
+    0xFCD586: 37,
+    0xD802C0: 1,
+    0x0CDC91: 77,
+    0xE8CBF5: 4449,
+    0x981C42: 19322,
+    0x58350F: 38,
+    0x3067A1: 3,
+    0xD01BF4: 3,
+    0xACA09D: 28,
+    0x78BBC1: 108,
+    0xE4BC96: 19323,
+    0xE023FF: 41,
+    0xE8EDD6: 41,
+    0x70BC48: 4,
+    0xE81CBA: 41,
+    0xD0C730: 11,
+    0x2459E5: 167,
+    0x20C792: 19324,
+    0xA0BC6F: 4,
+    0xB08D57: 4,
+    0x189341: 25,
+    0xDC4546: 25,
+    0x94CE0F: 117,
+    0x883F27: 117,
+    0x24E29D: 117,
+    0x2C2080: 117,
+    0xCCBC2B: 117,
+    0xC02B56: 19325,
+    0xDC97BA: 25,
+    0xA0D365: 25,
+    0xB402F2: 1578,
+    0xA02DDB: 3,
+    0x744DDC: 19326,
+    0xB8A14A: 212,
+    0x3C6D66: 537,
+    0x74D5C6: 11948,
+    0xBC09EB: 231,
+    0x5C640F: 19327,
+    0x84B4D2: 73,
+    0x38A746: 384,
+    0x6CE2D3: 21,
+    0x5C167D: 15,
+    0x50E452: 4297,
+    0xA4A490: 90,
+    0xB8A825: 90,
+    0xCCF9F0: 90,
+    0xF0A882: 4397,
+    0x10322C: 102,
+    0xDCC49C: 90,
+    0xE4C770: 212,
+    0xE067B3: 4206,
+    0x70A56A: 4206,
+    0xDC8E8D: 8117,
+    0xE4BEED: 8117,
+    0x007263: 8117,
+    0xEC64C9: 14,
+    0xF0F5BD: 14,
+    0xF84288: 49,
+    0x88B7EB: 49,
+    0x10A2D3: 49,
+    0xF44250: 47,
+    0xBC62CE: 8117,
+    0x98D7E1: 4,
+    0xF83918: 4,
+    0x84B1E2: 157,
+    0xFC34E2: 574,
+    0x4C97CC: 49,
+    0x34EE16: 49,
+    0x48849D: 53,
+    0x600F6B: 49,
+    0x44F971: 4210,
+    0x386B1C: 4210,
+    0x349677: 11,
+    0x2475FC: 11,
+    0x508965: 4210,
+    0xC03FBB: 19328,
+    0x5C579E: 134,
+    0x441A84: 116,
+    0x705464: 238,
+    0x8C6FB9: 238,
+    0x142D41: 238,
+    0x048727: 238,
+    0x4C5BB3: 238,
+    0x287681: 238,
+    0x30FB10: 238,
+    0x94B216: 238,
+    0x8C65A3: 238,
+    0xB43A31: 238,
+    0x28F8C6: 12,
+    0xC88AD8: 11892,
+    0xD058AB: 19329,
+    0x9440F3: 15,
+    0x406F27: 15,
+    0x18CAA7: 11,
+    0xD487CC: 5010,
+    0x003358: 272,
+    0x644EEB: 19330,
+    0xE04C12: 194,
+    0x24E8CE: 780,
+    0x9C3818: 4,
+    0xB44C90: 4,
+    0xDCEAE7: 1167,
+    0x8CA682: 12,
+    0x4CA919: 220,
+    0xA8EA71: 5,
+    0xBC629C: 11,
+    0xD41761: 40,
+    0x98254A: 4220,
+    0x242FD0: 4220,
+    0xD825DF: 19331,
+    0xD4B5CD: 3,
+    0x684983: 15,
+    0x2CECF7: 170,
+    0x90F721: 19332,
+    0xE8DA3E: 117,
+    0xECB878: 117,
+    0x38F45E: 19333,
+    0x74FECE: 4220,
+    0x78F505: 102,
+    0x588D39: 19334,
+    0xB8E28C: 484,
+    0xE0DAD7: 11,
+    0x94BB43: 43,
+    0x188B0E: 14,
+    0x30A3B5: 19335,
+    0xB8F774: 5,
+    0x2CCF67: 19336,
+    0x444963: 19337,
+    0x6074B1: 4739,
+    0x34C8D6: 12,
+    0x281DFB: 15,
+    0x0C238D: 15,
+    0xDC6180: 15,
+    0xA86F36: 146,
+    0xC0A476: 138,
+    0x20019C: 19338,
+    0x48A3BD: 53,
+    0x042322: 53,
+    0x28DE59: 19339,
+    0xB8D0F0: 4226,
+    0x102F6E: 4493,
+    0x702AD7: 4400,
+    0xECC342: 11,
+    0x94BE50: 454,
+    0x50CF56: 29,
+    0xAC0775: 49,
+    0x842F57: 49,
+    0x1881ED: 4733,
+    0x245A5F: 86,
+    0x00109C: 19340,
+    0xD44D9F: 107,
+    0x9CD4A6: 108,
+    0xA86308: 19341,
+    0x684216: 19342,
+    0x6CF2D8: 1131,
+    0xF0FC65: 19343,
+    0xA427A5: 95,
+    0x002480: 19344,
+    0xC4BD8D: 407,
+    0x944BF8: 316,
+    0x989DB2: 4334,
+    0x683421: 25,
+    0x002218: 15706,
+    0x00019C: 19345,
+    0x68E905: 5,
+    0x34E3FB: 90,
+    0x98348C: 4234,
+    0x30F600: 3,
+    0x985F41: 25,
+    0x303A4A: 63,
+    0xAC3971: 194,
+    0xA044B7: 207,
+    0x601D16: 19346,
+    0x985A98: 15,
+    0xE0AD9B: 15,
+    0xB05A44: 4664,
+    0x38F18F: 15974,
+    0x4099F6: 19347,
+    0x34C6DD: 516,
+    0xCC8C17: 163,
+    0x08A6F7: 14,
+    0x34CFB5: 19348,
+    0x4C8237: 15741,
+    0x849CA4: 4299,
+    0x00D6CB: 116,
+    0xECC9FF: 14,
+    0x2CBCBB: 14,
+    0x883E0D: 19349,
+    0xB83B8F: 19350,
+    0x0003C5: 19351,
+    0x58A8E8: 77,
+    0x00E05C: 19352,
+    0x640C91: 49,
+    0x5893E8: 49,
+    0xF004E1: 49,
+    0x708CF2: 49,
+    0xF873DF: 49,
+    0x141BA0: 49,
+    0x9C4FAC: 11,
+    0xE4B063: 14,
+    0xA8C246: 182,
+    0x8457F7: 4359,
+    0xCC817D: 49,
+    0x1C6920: 14,
+    0x20F094: 210,
+    0x60C22A: 1148,
+    0x700894: 192,
+    0xB0386C: 1530,
+    0xBCF212: 15741,
+    0x8813BF: 14,
+    0x345F45: 14,
+    0x2C0B97: 40,
+    0x74238D: 11,
+    0xD069C1: 15,
+    0x542F2B: 15,
+    0xA41162: 399,
+    0x08BAB7: 19353,
+    0xA067D6: 81,
+    0xE82689: 4252,
+    0xB8D4E7: 4252,
+    0xF860F0: 4252,
+    0x1C28AF: 4252,
+    0x28DE65: 4252,
+    0x88E9A4: 4251,
+    0x9CDC71: 4251,
+    0x303FBB: 4251,
+    0xF42E7F: 4252,
+    0xB83A5A: 4252,
+    0xA8BD27: 4251,
+    0x40B93C: 4251,
+    0xE0071B: 4251,
+    0xD89403: 4251,
+    0x186472: 4252,
+    0x6CF37F: 4252,
+    0x24DEC6: 4252,
+    0x84D47E: 4252,
+    0x943FC2: 4251,
+    0x9440C9: 4251,
+    0x3810F0: 4252,
+    0xCC88C7: 4252,
+    0xEC0273: 4252,
+    0xD04DC6: 4252,
+    0x9460D5: 4252,
+    0x882510: 4252,
+    0xD4E053: 4252,
+    0x441244: 4252,
+    0x54F0B1: 4252,
+    0xB837B2: 4252,
+    0x0CD3A1: 19354,
+    0x001EC6: 19355,
+    0x44A3BB: 25,
+    0x94B609: 25,
+    0x7C1E4A: 19356,
+    0xC0BFBE: 43,
+    0x3CBD69: 0,
+    0x1CEAAC: 166,
+    0x84652B: 19357,
+    0x58DB09: 116,
+    0x783409: 15,
+    0x149AA3: 15,
+    0xA0AD62: 15,
+    0x5C87D8: 12,
+    0x50B140: 19358,
+    0x8CC5D0: 90,
+    0x28B591: 4,
+    0x08023C: 90,
+    0x78B6FE: 90,
+    0x9CCE88: 138,
+    0x9054B7: 12044,
+    0xBC9424: 274,
+    0x849E56: 195,
+    0x249E7D: 8448,
+    0x5C8AAE: 11892,
+    0x909F22: 112,
+    0x2CCA16: 49,
+    0x14147D: 49,
+    0xDC69B5: 63,
+    0x102381: 8253,
+    0xE8B723: 19359,
+    0x1889A0: 5120,
+    0x983F66: 5120,
+    0x8431A8: 5120,
+    0x7C2C67: 14,
+    0x98874C: 108,
+    0xC08A60: 4254,
+    0xC8608F: 4,
+    0xB8C007: 19360,
+    0x10907D: 5120,
+    0xC05D89: 14,
+    0x400326: 175,
+    0x1C6A1B: 131,
+    0x2005B6: 19361,
+    0x68F125: 19362,
+    0x008320: 117,
+    0x7C68B9: 117,
+    0x9028F6: 10296,
+    0x20A200: 15,
+    0x7CA8EC: 4252,
+    0xF4D0A7: 19363,
+    0x20F307: 11,
+    0xB4E3D0: 244,
+    0x3CD1C9: 19364,
+    0xEC554D: 13,
+    0x084F66: 107,
+    0xCCDA20: 166,
+    0x7CF17E: 4220,
+    0xB0F2F6: 90,
+    0x241972: 116,
+    0x503D7F: 0,
+    0x001710: 19365,
+    0x143A9A: 8102,
+    0xC8E07A: 5,
+    0xD069FF: 5,
+    0x84FFC2: 4,
+    0x788517: 4,
+    0x48A4FD: 4254,
+    0x48F1EB: 35,
+    0x501B6A: 4211,
+    0x8C0DD9: 473,
+    0x6C92BF: 15734,
+    0x9CC2C4: 15734,
+    0x4465E0: 19366,
+    0x741EB1: 90,
+    0xA49FE7: 90,
+    0xA41A6E: 11,
+    0xCC3F36: 49,
+    0x102FCA: 49,
+    0x542097: 19367,
+    0x28D244: 4278,
+    0x507B9D: 4278,
+    0x88A4C2: 4278,
+    0x6C2408: 4278,
+    0x9C2DCD: 4278,
+    0xD048A1: 28,
+    0x68F728: 4278,
+    0xC85B76: 4278,
+    0x8C1645: 4278,
+    0x38F3AB: 4278,
+    0x98F1AE: 19368,
+    0xF04B8A: 52,
+    0x2CEADA: 19369,
+    0xC0470E: 110,
+    0xACA613: 19370,
+    0x2496D5: 19371,
+    0xDC6279: 4220,
+    0xCC38D0: 95,
+    0xF49EA4: 19372,
+    0x8006D9: 11,
+    0x94C36B: 19373,
+    0xD48C49: 14,
+    0xBC0435: 167,
+    0xE43022: 19374,
+    0xC096A4: 5,
+    0xEC7359: 19375,
+    0x80C01E: 25,
+    0x4C4929: 162,
+    0x94EC32: 238,
+    0x345A60: 1280,
+    0xBCA13A: 19376,
+    0xC4B691: 19377,
+    0xC88234: 4,
+    0xAC86D1: 12,
+    0x782288: 664,
+    0x84BE8B: 19378,
+    0x98A14A: 116,
+    0xF8B3B7: 14,
+    0xC4EB68: 19376,
+    0xAC3351: 228,
+    0xE4B323: 14,
+    0x30DDAA: 11925,
+    0xB89165: 250,
+    0x709AC4: 117,
+    0xC8DD6A: 373,
+    0xC4FF84: 12,
+    0x1C4D89: 4227,
+    0x344A1B: 11,
+    0xB4BA6A: 231,
+    0x045665: 0,
+    0xB44130: 19379,
+    0xA0334F: 4,
+    0xA0A47F: 4,
+    0x9070BF: 4299,
+    0xACB480: 110,
+    0x28A915: 108,
+    0x44370B: 257,
+    0x24AECC: 22,
+    0xE09D73: 270,
+    0x602D74: 1,
+    0x10A30F: 15,
+    0xC4F7C1: 49,
+    0x386233: 49,
+    0x3C8A1F: 14,
+    0x2043A8: 14,
+    0xD4DD0B: 12349,
+    0x74866F: 11,
+    0x546CAC: 1305,
+    0x540F2C: 89,
+    0x9082C3: 476,
+    0x1CC089: 238,
+    0x007532: 19380,
+}
+
+UUID_FAMILIES: dict[str, dict[int, tuple[int, ...]]] = {  # 128-bit UUIDs by base UUID
+    "characteristic": {
+        0x000000001212EFDE1523785FEABCD123: (0x000015241212EFDE1523785FEABCD123, 0x000015251212EFDE1523785FEABCD123, 0x000015311212EFDE1523785FEABCD123, 0x000015321212EFDE1523785FEABCD123, 0x000015341212EFDE1523785FEABCD123),
+        0x8EC90000F3154F609FB8838830DAEA50: (0x8EC90001F3154F609FB8838830DAEA50, 0x8EC90002F3154F609FB8838830DAEA50, 0x8EC90003F3154F609FB8838830DAEA50, 0x8EC90004F3154F609FB8838830DAEA50),
+        0x8E400000F3154F609FB8838830DAEA50: (0x8E400001F3154F609FB8838830DAEA50,),
+        0xDA2E0000FBCE4E01AE9E261174997C48: (0xDA2E7828FBCE4E01AE9E261174997C48,),
+        0x932C0000000247A2835AA8D455B859DD: (0x932C32BD000247A2835AA8D455B859DD,),
+        0x932C0000000347A2835AA8D455B859DD: (0x932C32BD000347A2835AA8D455B859DD,),
+        0x932C0000000547A2835AA8D455B859DD: (0x932C32BD000547A2835AA8D455B859DD,),
+        0xEF6800009B3549339B1052FFA9740042: (0xEF6801019B3549339B1052FFA9740042, 0xEF6801029B3549339B1052FFA9740042, 0xEF6801049B3549339B1052FFA9740042, 0xEF6801059B3549339B1052FFA9740042, 0xEF6801069B3549339B1052FFA9740042, 0xEF6801079B3549339B1052FFA9740042, 0xEF6801089B3549339B1052FFA9740042, 0xEF6802019B3549339B1052FFA9740042, 0xEF6802029B3549339B1052FFA9740042, 0xEF6802039B3549339B1052FFA9740042, 0xEF6802049B3549339B1052FFA9740042, 0xEF6802059B3549339B1052FFA9740042, 0xEF6802069B3549339B1052FFA9740042, 0xEF6803019B3549339B1052FFA9740042, 0xEF6803029B3549339B1052FFA9740042, 0xEF6803039B3549339B1052FFA9740042, 0xEF6804019B3549339B1052FFA9740042, 0xEF6804029B3549339B1052FFA9740042, 0xEF6804039B3549339B1052FFA9740042, 0xEF6804049B3549339B1052FFA9740042, 0xEF6804059B3549339B1052FFA9740042, 0xEF6804069B3549339B1052FFA9740042, 0xEF6804079B3549339B1052FFA9740042, 0xEF6804089B3549339B1052FFA9740042, 0xEF6804099B3549339B1052FFA9740042, 0xEF68040A9B3549339B1052FFA9740042, 0xEF6805019B3549339B1052FFA9740042, 0xEF6805029B3549339B1052FFA9740042, 0xEF6805039B3549339B1052FFA9740042, 0xEF6805049B3549339B1052FFA9740042),
+        0x6E400000B5A3F393E0A9E50E24DCCA9E: (0x6E400002B5A3F393E0A9E50E24DCCA9E, 0x6E400003B5A3F393E0A9E50E24DCCA9E),
+        0x57A70000935011EDA1EB0242AC120002: (0x57A70001935011EDA1EB0242AC120002,),
+        0xE2A00000EC314EC3A97A1C34D87E9878: (0xE2A00002EC314EC3A97A1C34D87E9878, 0xE2A00003EC314EC3A97A1C34D87E9878),
+        0xA3C800008ED34BDF8A39A01BEBEDE295: (0xA3C875018ED34BDF8A39A01BEBEDE295, 0xA3C875028ED34BDF8A39A01BEBEDE295, 0xA3C875038ED34BDF8A39A01BEBEDE295, 0xA3C875048ED34BDF8A39A01BEBEDE295, 0xA3C875058ED34BDF8A39A01BEBEDE295, 0xA3C875068ED34BDF8A39A01BEBEDE295, 0xA3C875078ED34BDF8A39A01BEBEDE295, 0xA3C875088ED34BDF8A39A01BEBEDE295, 0xA3C875098ED34BDF8A39A01BEBEDE295, 0xA3C8750A8ED34BDF8A39A01BEBEDE295, 0xA3C8750B8ED34BDF8A39A01BEBEDE295, 0xA3C8750C8ED34BDF8A39A01BEBEDE295),
+        0xFE2C0000836648148EB001DE32100BEA: (0xFE2C1233836648148EB001DE32100BEA, 0xFE2C1234836648148EB001DE32100BEA, 0xFE2C1235836648148EB001DE32100BEA, 0xFE2C1236836648148EB001DE32100BEA, 0xFE2C1237836648148EB001DE32100BEA),
+        0x9FBF0000630142D98C5825E699A21DBD: (0x9FBF120D630142D98C5825E699A21DBD,),
+        0x69D1000045E149A898219BBDFDAAD9D9: (0x69D1D8F345E149A898219BBDFDAAD9D9,),
+        0x22EA000024D64BB5BE44B36ACE7C7BFB: (0x22EAC6E924D64BB5BE44B36ACE7C7BFB,),
+        0x9B3C000057B14A8AB8DF0E56F7CA51C2: (0x9B3C81D857B14A8AB8DF0E56F7CA51C2,),
+        0x2F7C0000808D411F9A0CBB92BA96C102: (0x2F7CABCE808D411F9A0CBB92BA96C102,),
+        0xC6B2000023AB46D8A6ABA3A870BBD5D7: (0xC6B2F38C23AB46D8A6ABA3A870BBD5D7,),
+        0x7DFC00007D1C495186AA8D9728F8D66C: (0x7DFC60017D1C495186AA8D9728F8D66C, 0x7DFC60027D1C495186AA8D9728F8D66C, 0x7DFC60037D1C495186AA8D9728F8D66C, 0x7DFC60047D1C495186AA8D9728F8D66C, 0x7DFC60057D1C495186AA8D9728F8D66C, 0x7DFC61017D1C495186AA8D9728F8D66C, 0x7DFC61027D1C495186AA8D9728F8D66C, 0x7DFC61037D1C495186AA8D9728F8D66C, 0x7DFC61047D1C495186AA8D9728F8D66C, 0x7DFC61057D1C495186AA8D9728F8D66C, 0x7DFC61067D1C495186AA8D9728F8D66C, 0x7DFC61077D1C495186AA8D9728F8D66C, 0x7DFC61087D1C495186AA8D9728F8D66C, 0x7DFC62017D1C495186AA8D9728F8D66C, 0x7DFC62027D1C495186AA8D9728F8D66C, 0x7DFC62037D1C495186AA8D9728F8D66C, 0x7DFC80037D1C495186AA8D9728F8D66C, 0x7DFC70047D1C495186AA8D9728F8D66C, 0x7DFC70057D1C495186AA8D9728F8D66C, 0x7DFC70067D1C495186AA8D9728F8D66C, 0x7DFC70077D1C495186AA8D9728F8D66C, 0x7DFC70087D1C495186AA8D9728F8D66C, 0x7DFC70097D1C495186AA8D9728F8D66C, 0x7DFC700A7D1C495186AA8D9728F8D66C, 0x7DFC700B7D1C495186AA8D9728F8D66C, 0x7DFC700C7D1C495186AA8D9728F8D66C, 0x7DFC71037D1C495186AA8D9728F8D66C, 0x7DFC71047D1C495186AA8D9728F8D66C, 0x7DFC71057D1C495186AA8D9728F8D66C, 0x7DFC71067D1C495186AA8D9728F8D66C, 0x7DFC71077D1C495186AA8D9728F8D66C, 0x7DFC71087D1C495186AA8D9728F8D66C, 0x7DFC71097D1C495186AA8D9728F8D66C, 0x7DFC710B7D1C495186AA8D9728F8D66C, 0x7DFC710C7D1C495186AA8D9728F8D66C, 0x7DFC710D7D1C495186AA8D9728F8D66C, 0x7DFC80047D1C495186AA8D9728F8D66C, 0x7DFC90017D1C495186AA8D9728F8D66C),
+        0xE95D0000251D470AA062FA1922DFA9A8: (0xE95DCA4B251D470AA062FA1922DFA9A8, 0xE95DFB24251D470AA062FA1922DFA9A8, 0xE95DFB11251D470AA062FA1922DFA9A8, 0xE95D386C251D470AA062FA1922DFA9A8, 0xE95D9715251D470AA062FA1922DFA9A8, 0xE95DDA90251D470AA062FA1922DFA9A8, 0xE95DDA91251D470AA062FA1922DFA9A8, 0xE95D8D00251D470AA062FA1922DFA9A8, 0xE95D5899251D470AA062FA1922DFA9A8, 0xE95DB9FE251D470AA062FA1922DFA9A8, 0xE95DD822251D470AA062FA1922DFA9A8, 0xE95D7B77251D470AA062FA1922DFA9A8, 0xE95D93EE251D470AA062FA1922DFA9A8, 0xE95D0D2D251D470AA062FA1922DFA9A8, 0xE95DB84C251D470AA062FA1922DFA9A8, 0xE95D9775251D470AA062FA1922DFA9A8, 0xE95D23C4251D470AA062FA1922DFA9A8, 0xE95D5404251D470AA062FA1922DFA9A8, 0xE95D93B1251D470AA062FA1922DFA9A8, 0xE95D9250251D470AA062FA1922DFA9A8, 0xE95D1B25251D470AA062FA1922DFA9A8),
+        0x000000001212EFDE1623785FEABCD123: (0x000016241212EFDE1623785FEABCD123, 0x000016261212EFDE1623785FEABCD123),
+        0xADAF0000C33242A893BD25E905756CB8: (0xADAF0001C33242A893BD25E905756CB8, 0xADAF0002C33242A893BD25E905756CB8, 0xADAF0101C33242A893BD25E905756CB8, 0xADAF0201C33242A893BD25E905756CB8, 0xADAF0301C33242A893BD25E905756CB8, 0xADAF0401C33242A893BD25E905756CB8, 0xADAF0501C33242A893BD25E905756CB8, 0xADAF0601C33242A893BD25E905756CB8, 0xADAF0701C33242A893BD25E905756CB8, 0xADAF0801C33242A893BD25E905756CB8, 0xADAF0901C33242A893BD25E905756CB8, 0xADAF0902C33242A893BD25E905756CB8, 0xADAF0903C33242A893BD25E905756CB8, 0xADAF0904C33242A893BD25E905756CB8, 0xADAF0A01C33242A893BD25E905756CB8, 0xADAF0B01C33242A893BD25E905756CB8, 0xADAF0B02C33242A893BD25E905756CB8, 0xADAF0C01C33242A893BD25E905756CB8, 0xADAF0D01C33242A893BD25E905756CB8, 0xADAF0D02C33242A893BD25E905756CB8, 0xADAF0D03C33242A893BD25E905756CB8, 0xADAF0E01C33242A893BD25E905756CB8),
+        0xADAF000046696C655472616E73666572: (0xADAF010046696C655472616E73666572, 0xADAF020046696C655472616E73666572),
+        0xF000000004514000B000000000000000: (0xF000FFC104514000B000000000000000, 0xF000FFC204514000B000000000000000, 0xF000FFC504514000B000000000000000),
+        0xD0830000BE164600B39761512CA2F5AD: (0xD083B2BDBE164600B39761512CA2F5AD,),
+        0x0A85000050D34492BFD322FE58A24F01: (0x0A852C5950D34492BFD322FE58A24F01,),
+        0xD75100007E7B45BE803FC8737B171A29: (0xD75150337E7B45BE803FC8737B171A29,),
+        0xB8330000D871422CBF9E8E6EC117D57E: (0xB833D34FD871422CBF9E8E6EC117D57E,),
+        0x9C4300008A0C45FDA58DD4A7E64C3A57: (0x9C4314F28A0C45FDA58DD4A7E64C3A57,),
+        0x180E000075794B4AB2DF72733B7FA2FE: (0x180EFDEF75794B4AB2DF72733B7FA2FE,),
+        0x77310000BC6A41008AB189B2356B038B: (0x7731DE63BC6A41008AB189B2356B038B,),
+        0xD435000001A44E7D84BADFD347F60275: (0xD435F5DE01A44E7D84BADFD347F60275,),
+        0xDF3B0000C9854DA2A6D29B9B9ABDB858: (0xDF3B16CAC9854DA2A6D29B9B9ABDB858,),
+        0x3981000001114EC0B1FA171671270608: (0x398168AA01114EC0B1FA171671270608,),
+        0xE58600000288447698CAEF7DA6B4D289: (0xE5866BD60288447698CAEF7DA6B4D289,),
+        0x8CC6000098C540CCB1D8692940E6994B: (0x8CC6E0B398C540CCB1D8692940E6994B,),
+        0xE12500006FB811EABC550242AC130003: (0xE125BDA46FB811EABC550242AC130003,),
+        0x54220000F6A54007A371722F4EBD8436: (0x54220001F6A54007A371722F4EBD8436, 0x54220002F6A54007A371722F4EBD8436, 0x54220003F6A54007A371722F4EBD8436, 0x54220004F6A54007A371722F4EBD8436, 0x54220005F6A54007A371722F4EBD8436),
+    },
+    "descriptor": {
+    },
+    "service": {
+        0x932C0000000047A2835AA8D455B859DD: (0x932C32BD000047A2835AA8D455B859DD,),
+        0xB884000000004AA18794C3F462030BDA: (0xB8843ADD00004AA18794C3F462030BDA,),
+        0x79050000B5CE4E99A40F4B1E122D00D0: (0x7905F431B5CE4E99A40F4B1E122D00D0,),
+        0x89D300000F36433A8EF4C502AD55F8DC: (0x89D3502B0F36433A8EF4C502AD55F8DC,),
+        0x7DFC00007D1C495186AA8D9728F8D66C: (0x7DFC60007D1C495186AA8D9728F8D66C, 0x7DFC70007D1C495186AA8D9728F8D66C, 0x7DFC80007D1C495186AA8D9728F8D66C, 0x7DFC90007D1C495186AA8D9728F8D66C),
+        0xE95D0000251D470AA062FA1922DFA9A8: (0xE95D0753251D470AA062FA1922DFA9A8, 0xE95DF2D8251D470AA062FA1922DFA9A8, 0xE95D9882251D470AA062FA1922DFA9A8, 0xE95D127B251D470AA062FA1922DFA9A8, 0xE95DD91D251D470AA062FA1922DFA9A8, 0xE95D93AF251D470AA062FA1922DFA9A8, 0xE95D93B0251D470AA062FA1922DFA9A8, 0xE95D6100251D470AA062FA1922DFA9A8),
+        0xEF6800009B3549339B1052FFA9740042: (0xEF6801009B3549339B1052FFA9740042, 0xEF6802009B3549339B1052FFA9740042, 0xEF6803009B3549339B1052FFA9740042, 0xEF6804009B3549339B1052FFA9740042, 0xEF6805009B3549339B1052FFA9740042),
+        0x000000001212EFDE1523785FEABCD123: (0x000015231212EFDE1523785FEABCD123, 0x000015301212EFDE1523785FEABCD123),
+        0x6E400000B5A3F393E0A9E50E24DCCA9E: (0x6E400001B5A3F393E0A9E50E24DCCA9E,),
+        0x57A70000935011EDA1EB0242AC120002: (0x57A70000935011EDA1EB0242AC120002,),
+        0xA3C800008ED34BDF8A39A01BEBEDE295: (0xA3C875008ED34BDF8A39A01BEBEDE295,),
+        0x8E400000F3154F609FB8838830DAEA50: (0x8E400001F3154F609FB8838830DAEA50,),
+        0xE2A00000EC314EC3A97A1C34D87E9878: (0xE2A00001EC314EC3A97A1C34D87E9878,),
+        0x8D5300001DB74CD3868B8A527460AA84: (0x8D53DC1D1DB74CD3868B8A527460AA84,),
+        0x000000001212EFDE1623785FEABCD123: (0x000016231212EFDE1623785FEABCD123, 0x000016251212EFDE1623785FEABCD123),
+        0xADAF0000C33242A893BD25E905756CB8: (0xADAF0100C33242A893BD25E905756CB8, 0xADAF0200C33242A893BD25E905756CB8, 0xADAF0300C33242A893BD25E905756CB8, 0xADAF0400C33242A893BD25E905756CB8, 0xADAF0500C33242A893BD25E905756CB8, 0xADAF0600C33242A893BD25E905756CB8, 0xADAF0700C33242A893BD25E905756CB8, 0xADAF0800C33242A893BD25E905756CB8, 0xADAF0900C33242A893BD25E905756CB8, 0xADAF0A00C33242A893BD25E905756CB8, 0xADAF0B00C33242A893BD25E905756CB8, 0xADAF0C00C33242A893BD25E905756CB8, 0xADAF0D00C33242A893BD25E905756CB8, 0xADAF0E00C33242A893BD25E905756CB8),
+        0xF000000004514000B000000000000000: (0xF000FFC004514000B000000000000000,),
+        0x0FDA000044A24AF284F5FA682BAA2B8D: (0x0FDA92B244A24AF284F5FA682BAA2B8D,),
+        0x54220000F6A54007A371722F4EBD8436: (0x54220000F6A54007A371722F4EBD8436,),
+    },
+}
+
+CONTENT_HASHES: dict[str, str] = {  # Content hash of every table
+    "characteristic": "9fe44ee77d8b46aab4c123374a6fb95f",
+    "company": "5b3fdb6ea452152865012b967793b792",
+    "descriptor": "99ad1341fd7ffd658e50d3178db02481",
+    "oui": "47717008ab5d007fb54b280685507abb",
+    "service": "a3761b32cae84d8eb0edb05a50743e39",
+}
@@ -9,8 +9,6 @@ Usage:
 >>> service[UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")]
 'Nordic UART Service'
 """
-from uuid import UUID
-
 from bluetooth_numbers.dicts import UUIDDict
 
 service = UUIDDict(
@@ -751,69 +749,53 @@ service = UUIDDict(
         0x65520: "Public Key Open Credential (PKOC)",
         0x65519: "Wi-Fi Direct Specification",
         0x64716: "Wi-Fi Easy Connect Specification",
-        UUID(
-            "932C32BD-0000-47A2-835A-A8D455B859DD",
-        ): "Philips Hue Light Control Service",
-        UUID(
-            "B8843ADD-0000-4AA1-8794-C3F462030BDA",
-        ): "Philips Hue Light Update Service",
-        UUID(
-            "7905F431-B5CE-4E99-A40F-4B1E122D00D0",
-        ): "Apple Notification Center Service",
-        UUID("89D3502B-0F36-433A-8EF4-C502AD55F8DC"): "Apple Media Service",
-        UUID("7DFC6000-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Service",
-        UUID("7DFC7000-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Service",
-        UUID("7DFC8000-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Service",
-        UUID("7DFC9000-7D1C-4951-86AA-8D9728F8D66C"): "Apple Reserved Service",
-        UUID("E95D0753-251D-470A-A062-FA1922DFA9A8"): "micro:bit Accelerometer Service",
-        UUID("E95DF2D8-251D-470A-A062-FA1922DFA9A8"): "micro:bit Magnetometer Service",
-        UUID("E95D9882-251D-470A-A062-FA1922DFA9A8"): "micro:bit Button Service",
-        UUID("E95D127B-251D-470A-A062-FA1922DFA9A8"): "micro:bit IO Pin Service",
-        UUID("E95DD91D-251D-470A-A062-FA1922DFA9A8"): "micro:bit LED Service",
-        UUID("E95D93AF-251D-470A-A062-FA1922DFA9A8"): "micro:bit Event Service",
-        UUID("E95D93B0-251D-470A-A062-FA1922DFA9A8"): "micro:bit DFU Control Service",
-        UUID("E95D6100-251D-470A-A062-FA1922DFA9A8"): "micro:bit Temperature Service",
-        UUID("EF680100-9B35-4933-9B10-52FFA9740042"): "Thingy Configuration Service",
-        UUID("EF680200-9B35-4933-9B10-52FFA9740042"): "Thingy Weather Station Service",
-        UUID("EF680300-9B35-4933-9B10-52FFA9740042"): "Thingy UI Service",
-        UUID("EF680400-9B35-4933-9B10-52FFA9740042"): "Thingy Motion Service",
-        UUID("EF680500-9B35-4933-9B10-52FFA9740042"): "Thingy Sound Service",
-        UUID("00001523-1212-EFDE-1523-785FEABCD123"): "Nordic LED and Button Service",
-        UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"): "Nordic UART Service",
-        UUID("57A70000-9350-11ED-A1EB-0242AC120002"): "Nordic Status Message Service",
-        UUID("A3C87500-8ED3-4BDF-8A39-A01BEBEDE295"): "Eddystone Configuration Service",
-        UUID("00001530-1212-EFDE-1523-785FEABCD123"): "Legacy DFU Service",
-        UUID(
-            "8E400001-F315-4F60-9FB8-838830DAEA50",
-        ): "Experimental Buttonless DFU Service",
-        UUID(
-            "E2A00001-EC31-4EC3-A97A-1C34D87E9878",
-        ): "Edge Impulse Remote Management Service",
-        UUID("8D53DC1D-1DB7-4CD3-868B-8A527460AA84"): "SMP Service",
-        UUID(
-            "00001623-1212-EFDE-1623-785FEABCD123",
-        ): "LEGO® Wireless Protocol v3 Hub Service",
-        UUID(
-            "00001625-1212-EFDE-1623-785FEABCD123",
-        ): "LEGO® Wireless Protocol v3 Bootloader Service",
-        UUID("ADAF0100-C332-42A8-93BD-25E905756CB8"): "Adafruit Temperature Service",
-        UUID("ADAF0200-C332-42A8-93BD-25E905756CB8"): "Adafruit Accelerometer Service",
-        UUID("ADAF0300-C332-42A8-93BD-25E905756CB8"): "Adafruit Light Service",
-        UUID("ADAF0400-C332-42A8-93BD-25E905756CB8"): "Adafruit Gyroscope Service",
-        UUID("ADAF0500-C332-42A8-93BD-25E905756CB8"): "Adafruit Magnetometer Service",
-        UUID("ADAF0600-C332-42A8-93BD-25E905756CB8"): "Adafruit Button Service",
-        UUID("ADAF0700-C332-42A8-93BD-25E905756CB8"): "Adafruit Humidity Service",
-        UUID("ADAF0800-C332-42A8-93BD-25E905756CB8"): "Adafruit Barometric Service",
-        UUID("ADAF0900-C332-42A8-93BD-25E905756CB8"): "Adafruit Addressable Service",
-        UUID("ADAF0A00-C332-42A8-93BD-25E905756CB8"): "Adafruit Color Service",
-        UUID("ADAF0B00-C332-42A8-93BD-25E905756CB8"): "Adafruit Sound Service",
-        UUID("ADAF0C00-C332-42A8-93BD-25E905756CB8"): "Adafruit Tone Service",
-        UUID("ADAF0D00-C332-42A8-93BD-25E905756CB8"): "Adafruit Quaternion Service",
-        UUID("ADAF0E00-C332-42A8-93BD-25E905756CB8"): "Adafruit Proximity Service",
-        UUID(
-            "F000FFC0-0451-4000-B000-000000000000",
-        ): "Texas Instruments Over-the-Air Download (OAD) Service",
-        UUID("0FDA92B2-44A2-4AF2-84F5-FA682BAA2B8D"): "Helium Hotspot Custom Service",
-        UUID("54220000-F6A5-4007-A371-722F4EBD8436"): "Memfault Diagnostic Service",
+        0x932C32BD_0000_47A2_835A_A8D455B859DD: "Philips Hue Light Control Service",
+        0xB8843ADD_0000_4AA1_8794_C3F462030BDA: "Philips Hue Light Update Service",
+        0x7905F431_B5CE_4E99_A40F_4B1E122D00D0: "Apple Notification Center Service",
+        0x89D3502B_0F36_433A_8EF4_C502AD55F8DC: "Apple Media Service",
+        0x7DFC6000_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Service",
+        0x7DFC7000_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Service",
+        0x7DFC8000_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Service",
+        0x7DFC9000_7D1C_4951_86AA_8D9728F8D66C: "Apple Reserved Service",
+        0xE95D0753_251D_470A_A062_FA1922DFA9A8: "micro:bit Accelerometer Service",
+        0xE95DF2D8_251D_470A_A062_FA1922DFA9A8: "micro:bit Magnetometer Service",
+        0xE95D9882_251D_470A_A062_FA1922DFA9A8: "micro:bit Button Service",
+        0xE95D127B_251D_470A_A062_FA1922DFA9A8: "micro:bit IO Pin Service",
+        0xE95DD91D_251D_470A_A062_FA1922DFA9A8: "micro:bit LED Service",
+        0xE95D93AF_251D_470A_A062_FA1922DFA9A8: "micro:bit Event Service",
+        0xE95D93B0_251D_470A_A062_FA1922DFA9A8: "micro:bit DFU Control Service",
+        0xE95D6100_251D_470A_A062_FA1922DFA9A8: "micro:bit Temperature Service",
+        0xEF680100_9B35_4933_9B10_52FFA9740042: "Thingy Configuration Service",
+        0xEF680200_9B35_4933_9B10_52FFA9740042: "Thingy Weather Station Service",
+        0xEF680300_9B35_4933_9B10_52FFA9740042: "Thingy UI Service",
+        0xEF680400_9B35_4933_9B10_52FFA9740042: "Thingy Motion Service",
+        0xEF680500_9B35_4933_9B10_52FFA9740042: "Thingy Sound Service",
+        0x00001523_1212_EFDE_1523_785FEABCD123: "Nordic LED and Button Service",
+        0x6E400001_B5A3_F393_E0A9_E50E24DCCA9E: "Nordic UART Service",
+        0x57A70000_9350_11ED_A1EB_0242AC120002: "Nordic Status Message Service",
+        0xA3C87500_8ED3_4BDF_8A39_A01BEBEDE295: "Eddystone Configuration Service",
+        0x00001530_1212_EFDE_1523_785FEABCD123: "Legacy DFU Service",
+        0x8E400001_F315_4F60_9FB8_838830DAEA50: "Experimental Buttonless DFU Service",
+        0xE2A00001_EC31_4EC3_A97A_1C34D87E9878: "Edge Impulse Remote Management Service",
+        0x8D53DC1D_1DB7_4CD3_868B_8A527460AA84: "SMP Service",
+        0x00001623_1212_EFDE_1623_785FEABCD123: "LEGO® Wireless Protocol v3 Hub Service",
+        0x00001625_1212_EFDE_1623_785FEABCD123: "LEGO® Wireless Protocol v3 Bootloader Service",
+        0xADAF0100_C332_42A8_93BD_25E905756CB8: "Adafruit Temperature Service",
+        0xADAF0200_C332_42A8_93BD_25E905756CB8: "Adafruit Accelerometer Service",
+        0xADAF0300_C332_42A8_93BD_25E905756CB8: "Adafruit Light Service",
+        0xADAF0400_C332_42A8_93BD_25E905756CB8: "Adafruit Gyroscope Service",
+        0xADAF0500_C332_42A8_93BD_25E905756CB8: "Adafruit Magnetometer Service",
+        0xADAF0600_C332_42A8_93BD_25E905756CB8: "Adafruit Button Service",
+        0xADAF0700_C332_42A8_93BD_25E905756CB8: "Adafruit Humidity Service",
+        0xADAF0800_C332_42A8_93BD_25E905756CB8: "Adafruit Barometric Service",
+        0xADAF0900_C332_42A8_93BD_25E905756CB8: "Adafruit Addressable Service",
+        0xADAF0A00_C332_42A8_93BD_25E905756CB8: "Adafruit Color Service",
+        0xADAF0B00_C332_42A8_93BD_25E905756CB8: "Adafruit Sound Service",
+        0xADAF0C00_C332_42A8_93BD_25E905756CB8: "Adafruit Tone Service",
+        0xADAF0D00_C332_42A8_93BD_25E905756CB8: "Adafruit Quaternion Service",
+        0xADAF0E00_C332_42A8_93BD_25E905756CB8: "Adafruit Proximity Service",
+        0xF000FFC0_0451_4000_B000_000000000000: "Texas Instruments Over-the-Air Download (OAD) Service",
+        0x0FDA92B2_44A2_4AF2_84F5_FA682BAA2B8D: "Helium Hotspot Custom Service",
+        0x54220000_F6A5_4007_A371_722F4EBD8436: "Memfault Diagnostic Service",
     },
 )
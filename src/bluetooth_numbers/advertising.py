@@ -0,0 +1,248 @@
+r"""Module to parse Bluetooth Low Energy advertising data.
+
+Advertising data consists of AD structures, each with a length, an AD type and a
+value. :func:`parse_advertising_data` walks these structures and resolves the
+numbers in them with the dictionaries of this package:
+
+>>> from bluetooth_numbers.advertising import parse_advertising_data
+>>> payload = bytes.fromhex("020106 03031A18 0AFF9904050FE1FFFF0000")
+>>> for record in parse_advertising_data(payload):
+...     print(hex(record.ad_type), record.key, record.name, bytes(record.data))
+0x1 None None b'\x06'
+0x3 6170 Environmental Sensing b'\x1a\x18'
+0xff 1177 Ruuvi Innovations Ltd. b'\x05\x0f\xe1\xff\xff\x00\x00'
+
+The data of each record is a :class:`memoryview` into the payload, so no bytes are
+copied while parsing.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Mapping, NamedTuple, Union
+
+from bluetooth_numbers import company, oui, service
+from bluetooth_numbers.dicts import _uuid_key as _stored_uuid_key
+from bluetooth_numbers.exceptions import (
+    BluetoothNumbersError,
+    MalformedAdvertisingDataError,
+    No16BitIntegerError,
+)
+
+if TYPE_CHECKING:
+    from bluetooth_numbers.dicts import CICDict, OUIDict, UUIDDict
+
+AD_FLAGS = 0x01
+AD_INCOMPLETE_UUIDS16 = 0x02
+AD_COMPLETE_UUIDS16 = 0x03
+AD_INCOMPLETE_UUIDS32 = 0x04
+AD_COMPLETE_UUIDS32 = 0x05
+AD_INCOMPLETE_UUIDS128 = 0x06
+AD_COMPLETE_UUIDS128 = 0x07
+AD_SOLICITATION_UUIDS16 = 0x14
+AD_SOLICITATION_UUIDS128 = 0x15
+AD_SERVICE_DATA16 = 0x16
+AD_DEVICE_ADDRESS = 0x1B
+AD_SOLICITATION_UUIDS32 = 0x1F
+AD_SERVICE_DATA32 = 0x20
+AD_SERVICE_DATA128 = 0x21
+AD_MANUFACTURER_DATA = 0xFF
+
+# Size of the UUIDs in lists of service UUIDs and in service data, by AD type
+_UUID_LIST_SIZES = {
+    AD_INCOMPLETE_UUIDS16: 2,
+    AD_COMPLETE_UUIDS16: 2,
+    AD_SOLICITATION_UUIDS16: 2,
+    AD_INCOMPLETE_UUIDS32: 4,
+    AD_COMPLETE_UUIDS32: 4,
+    AD_SOLICITATION_UUIDS32: 4,
+    AD_INCOMPLETE_UUIDS128: 16,
+    AD_COMPLETE_UUIDS128: 16,
+    AD_SOLICITATION_UUIDS128: 16,
+}
+_SERVICE_DATA_SIZES = {
+    AD_SERVICE_DATA16: 2,
+    AD_SERVICE_DATA32: 4,
+    AD_SERVICE_DATA128: 16,
+}
+_DEVICE_ADDRESS_LENGTH = 7
+_RANDOM_ADDRESS = 0x01
+_UUID16_SIZE = 2
+
+_Buffer = Union[bytes, bytearray, memoryview]
+
+
+class ADRecord(NamedTuple):
+    """Named tuple to hold a record found in advertising data.
+
+    Every UUID in a list of service UUIDs gets its own record.
+
+    Attributes:
+        ad_type (int): The AD type of the AD structure the record was found in.
+        key (int | None): The UUID of a service UUID or service data, the company ID
+            of manufacturer-specific data or the OUI of a public device address, as
+            an integer key for the dictionaries of this package. A 16-bit UUID is a
+            16-bit integer, also if it's advertised as a 32-bit or 128-bit UUID,
+            other UUIDs are 128-bit integers. This is ``None`` for a 128-bit UUID
+            below 2**32, which can't be a key, and for other AD types.
+        name (str | None): The description of `key`, or ``None`` if it's unknown.
+        data (memoryview): The UUID for a service UUID, the data after the UUID or
+            company ID for service data and manufacturer-specific data, or else the
+            whole value of the AD structure.
+    """
+
+    ad_type: int
+    key: int | None
+    name: str | None
+    data: memoryview
+
+
+def _resolve(
+    table: Mapping[Any, str],
+    key: Any,  # noqa: ANN401
+    parse: Callable[[str], Any] | None = None,
+) -> str | None:
+    """Look up a key in a dictionary, without raising an exception if it's unknown.
+
+    Args:
+        table (Mapping[Any, str]): The dictionary.
+        key (Any): The key to look up.
+        parse (Callable[[str], Any] | None): The function to convert a string key
+            to a key of `table`, or ``None`` to look up string keys as they are.
+
+    Returns:
+        str | None: The description of `key`, or ``None`` if it's unknown or
+        invalid.
+    """
+    try:
+        return table[parse(key) if parse and isinstance(key, str) else key]
+    except (BluetoothNumbersError, ValueError, TypeError):
+        return None
+
+
+def _uuid_key(view: memoryview, offset: int, size: int) -> int | None:
+    """Decode a little-endian UUID to an integer key for a UUIDDict.
+
+    Args:
+        view (memoryview): The advertising data.
+        offset (int): The position of the UUID in `view`.
+        size (int): The size of the UUID in bytes: 2, 4 or 16.
+
+    Returns:
+        int | None: The UUID as a 16-bit integer for a 16-bit UUID, also if it's
+        advertised as a 32-bit or 128-bit UUID, otherwise as a 128-bit integer, or
+        ``None`` for a 128-bit UUID below 2**32, which can't be a key.
+    """
+    if size == _UUID16_SIZE:
+        return view[offset] | view[offset + 1] << 8
+    try:
+        return _stored_uuid_key(view[offset : offset + size])
+    except No16BitIntegerError:
+        return None
+
+
+def _check_structure(ad_type: int, start: int, end: int) -> None:
+    """Check whether the length of an AD structure's value fits its AD type.
+
+    Args:
+        ad_type (int): The AD type of the AD structure.
+        start (int): The position of the AD structure's value in the data.
+        end (int): The position after the AD structure's value in the data.
+
+    Raises:
+        MalformedAdvertisingDataError: If the value doesn't fit the AD type.
+    """
+    length = end - start
+    if ad_type in _UUID_LIST_SIZES:
+        size = _UUID_LIST_SIZES[ad_type]
+        if length % size:
+            msg = f"Length of list of {size}-byte UUIDs at {start - 2}: {length}"
+            raise MalformedAdvertisingDataError(msg)
+    elif ad_type in _SERVICE_DATA_SIZES:
+        if length < _SERVICE_DATA_SIZES[ad_type]:
+            msg = f"Length of service data at {start - 2}: {length}"
+            raise MalformedAdvertisingDataError(msg)
+    elif ad_type == AD_MANUFACTURER_DATA and length < _UUID16_SIZE:
+        msg = f"Length of manufacturer-specific data at {start - 2}: {length}"
+        raise MalformedAdvertisingDataError(msg)
+
+
+def parse_advertising_data(
+    data: _Buffer,
+    services: UUIDDict = service,
+    companies: CICDict = company,
+    ouis: OUIDict = oui,
+) -> Iterator[ADRecord]:
+    """Parse advertising data and resolve the numbers in it.
+
+    Parsing stops at the first AD structure with length 0, because the rest of the
+    data is padding then.
+
+    Args:
+        data (bytes | bytearray | memoryview): The advertising data or scan response
+            data.
+        services (UUIDDict): The dictionary to resolve service UUIDs with.
+        companies (CICDict): The dictionary to resolve company IDs with.
+        ouis (OUIDict): The dictionary to resolve OUIs of device addresses with.
+
+    Raises:
+        MalformedAdvertisingDataError: If an AD structure is longer than the data or
+            its value doesn't fit its AD type.
+
+    Yields:
+        ADRecord: A record for each UUID in a list of service UUIDs and for each
+        other AD structure.
+    """
+    view = memoryview(data)
+    if view.format != "B" or view.ndim != 1:
+        view = view.cast("B")
+
+    offset = 0
+    end = len(view)
+    while offset < end:
+        length = view[offset]
+        if not length:
+            return
+        start = offset + 2
+        offset += length + 1
+        if offset > end:
+            msg = f"Length of AD structure at {start - 2} exceeds data: {length}"
+            raise MalformedAdvertisingDataError(msg)
+
+        ad_type = view[start - 1]
+        _check_structure(ad_type, start, offset)
+        if ad_type in _UUID_LIST_SIZES:
+            size = _UUID_LIST_SIZES[ad_type]
+            for position in range(start, offset, size):
+                key = _uuid_key(view, position, size)
+                yield ADRecord(
+                    ad_type,
+                    key,
+                    _resolve(services, key),
+                    view[position : position + size],
+                )
+        elif ad_type in _SERVICE_DATA_SIZES:
+            size = _SERVICE_DATA_SIZES[ad_type]
+            key = _uuid_key(view, start, size)
+            yield ADRecord(
+                ad_type,
+                key,
+                _resolve(services, key),
+                view[start + size : offset],
+            )
+        elif ad_type == AD_MANUFACTURER_DATA:
+            key = view[start] | view[start + 1] << 8
+            yield ADRecord(
+                ad_type,
+                key,
+                companies.get(key),
+                view[start + _UUID16_SIZE : offset],
+            )
+        elif (
+            ad_type == AD_DEVICE_ADDRESS
+            and offset - start == _DEVICE_ADDRESS_LENGTH
+            and not view[offset - 1] & _RANDOM_ADDRESS
+        ):
+            # The address is little-endian, so the OUI is in its last three bytes
+            key = view[start + 5] << 16 | view[start + 4] << 8 | view[start + 3]
+            yield ADRecord(ad_type, key, _resolve(ouis, key), view[start:offset])
+        else:
+            yield ADRecord(ad_type, None, None, view[start:offset])
@@ -0,0 +1,563 @@
+"""Module to annotate the advertising reports in btsnoop files.
+
+A btsnoop file is a capture of HCI packets, as written by ``btmon`` on Linux or by
+the Bluetooth HCI snoop log on Android. :class:`BtsnoopReader` reads its records one
+by one, :func:`advertising_reports` extracts the LE advertising reports from the
+records and :func:`annotate` resolves the OUI of each address and the company IDs
+and service UUIDs in the advertising data.
+
+Run this module to write the annotated advertising reports of a btsnoop file as
+JSON Lines or CSV::
+
+    python -m bluetooth_numbers.btsnoop capture.log --format csv --output reports.csv
+
+Regular files are memory-mapped, other files are read with buffered I/O, so the
+memory use doesn't depend on the size of the file.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import mmap
+import sys
+from contextlib import suppress
+from pathlib import Path
+from struct import Struct
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    BinaryIO,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    TextIO,
+    TypeVar,
+)
+from uuid import UUID
+
+from bluetooth_numbers import oui
+from bluetooth_numbers.advertising import (
+    AD_COMPLETE_UUIDS16,
+    AD_COMPLETE_UUIDS32,
+    AD_COMPLETE_UUIDS128,
+    AD_INCOMPLETE_UUIDS16,
+    AD_INCOMPLETE_UUIDS32,
+    AD_INCOMPLETE_UUIDS128,
+    AD_MANUFACTURER_DATA,
+    AD_SERVICE_DATA16,
+    AD_SERVICE_DATA32,
+    AD_SERVICE_DATA128,
+    parse_advertising_data,
+)
+from bluetooth_numbers.exceptions import (
+    BluetoothNumbersError,
+    MalformedAdvertisingDataError,
+    MalformedBtsnoopError,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+BTSNOOP_MAGIC = b"btsnoop\0"
+DATALINK_H1 = 1001
+DATALINK_H4 = 1002
+DATALINK_MONITOR = 2001
+
+# Microseconds between 0000-01-01 AD, the epoch of btsnoop timestamps, and
+# 1970-01-01, the Unix epoch
+BTSNOOP_EPOCH_DELTA = 0x00DCDDB30F2F8000
+
+CSV_FIELDS = (
+    "timestamp",
+    "address",
+    "address_type",
+    "vendor",
+    "rssi",
+    "company_ids",
+    "companies",
+    "service_uuids",
+    "services",
+)
+
+_R = TypeVar("_R", bound="BtsnoopReader")
+
+_FILE_HEADER = Struct(">8sII")
+_RECORD_HEADER = Struct(">IIIIq")
+_H4_EVENT = 0x04
+_H1_RECEIVED_EVENT = 0x03
+_MONITOR_EVENT = 0x0003
+_LE_META_EVENT = 0x3E
+_LE_ADVERTISING_REPORT = 0x02
+_LE_EXTENDED_ADVERTISING_REPORT = 0x0D
+_ADDRESS_TYPES = ("public", "random", "public identity", "random identity")
+_PUBLIC_ADDRESS_TYPES = (0x00, 0x02)
+# AD types with the UUIDs of services the advertiser offers (not solicits)
+_SERVICE_AD_TYPES = frozenset(
+    (
+        AD_INCOMPLETE_UUIDS16,
+        AD_COMPLETE_UUIDS16,
+        AD_INCOMPLETE_UUIDS32,
+        AD_COMPLETE_UUIDS32,
+        AD_INCOMPLETE_UUIDS128,
+        AD_COMPLETE_UUIDS128,
+        AD_SERVICE_DATA16,
+        AD_SERVICE_DATA32,
+        AD_SERVICE_DATA128,
+    ),
+)
+
+
+class BtsnoopRecord(NamedTuple):
+    """Named tuple to hold a record of a btsnoop file.
+
+    Attributes:
+        timestamp (int): The time of the packet in microseconds since the Unix epoch.
+        flags (int): The packet flags, whose meaning depends on the datalink type.
+        drops (int): The cumulative number of dropped packets.
+        data (bytes): The packet.
+    """
+
+    timestamp: int
+    flags: int
+    drops: int
+    data: bytes
+
+
+class AdvertisingReport(NamedTuple):
+    """Named tuple to hold an LE advertising report.
+
+    Attributes:
+        timestamp (int): The time of the report in microseconds since the Unix epoch.
+        address (str): The address of the advertiser, as "XX:XX:XX:XX:XX:XX".
+        address_type (int): The type of the address, as defined in the Core
+            Specification: 0 for public, 1 for random.
+        rssi (int): The received signal strength in dBm.
+        data (bytes): The advertising data.
+    """
+
+    timestamp: int
+    address: str
+    address_type: int
+    rssi: int
+    data: bytes
+
+
+class BtsnoopReader:
+    """Reader of the records in a btsnoop file.
+
+    Example:
+        >>> from bluetooth_numbers.btsnoop import BtsnoopReader
+        >>> with open("capture.log", "rb") as capture:  # doctest: +SKIP
+        ...     with BtsnoopReader(capture) as reader:
+        ...         for record in reader:
+        ...             print(record.timestamp, record.data.hex())
+    """
+
+    def __init__(self, file: BinaryIO) -> None:
+        """Initialize the reader and read the file header.
+
+        Args:
+            file (BinaryIO): The btsnoop file, opened in binary mode. A regular file
+                is memory-mapped, other files are read sequentially.
+
+        Raises:
+            MalformedBtsnoopError: If the file doesn't start with a btsnoop header.
+        """
+        self._file = file
+        self._mmap: mmap.mmap | None = None
+        try:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError):
+            # Not a regular file, for instance a pipe or an in-memory stream
+            header = file.read(_FILE_HEADER.size)
+        else:
+            header = self._mmap[: _FILE_HEADER.size]
+
+        try:
+            self.version, self.datalink = self._parse_header(header)
+        except MalformedBtsnoopError:
+            self.close()
+            raise
+
+    @staticmethod
+    def _parse_header(header: bytes) -> tuple[int, int]:
+        """Parse the file header.
+
+        Args:
+            header (bytes): The file header.
+
+        Raises:
+            MalformedBtsnoopError: If `header` isn't a btsnoop header.
+
+        Returns:
+            tuple[int, int]: The version and the datalink type of the file.
+        """
+        if len(header) < _FILE_HEADER.size:
+            msg = "File too short for a btsnoop header"
+            raise MalformedBtsnoopError(msg)
+        magic, version, datalink = _FILE_HEADER.unpack(header)
+        if magic != BTSNOOP_MAGIC:
+            msg = f"No btsnoop file: {magic!r}"
+            raise MalformedBtsnoopError(msg)
+        return version, datalink
+
+    def __iter__(self) -> Iterator[BtsnoopRecord]:
+        """Read the records.
+
+        Raises:
+            MalformedBtsnoopError: If the last record is truncated.
+
+        Yields:
+            BtsnoopRecord: The next record.
+        """
+        if self._mmap is not None:
+            yield from self._read_mmap(self._mmap)
+            return
+
+        read = self._file.read
+        while True:
+            header = read(_RECORD_HEADER.size)
+            if not header:
+                return
+            if len(header) < _RECORD_HEADER.size:
+                msg = "Truncated btsnoop record header"
+                raise MalformedBtsnoopError(msg)
+            _, length, flags, drops, timestamp = _RECORD_HEADER.unpack(header)
+            data = read(length)
+            if len(data) < length:
+                msg = "Truncated btsnoop record"
+                raise MalformedBtsnoopError(msg)
+            yield BtsnoopRecord(timestamp - BTSNOOP_EPOCH_DELTA, flags, drops, data)
+
+    @staticmethod
+    def _read_mmap(buffer: mmap.mmap) -> Iterator[BtsnoopRecord]:
+        """Read the records from a memory-mapped file.
+
+        Args:
+            buffer (mmap.mmap): The memory-mapped btsnoop file.
+
+        Raises:
+            MalformedBtsnoopError: If the last record is truncated.
+
+        Yields:
+            BtsnoopRecord: The next record.
+        """
+        unpack_from = _RECORD_HEADER.unpack_from
+        offset = _FILE_HEADER.size
+        end = len(buffer)
+        while offset < end:
+            if offset + _RECORD_HEADER.size > end:
+                msg = "Truncated btsnoop record header"
+                raise MalformedBtsnoopError(msg)
+            _, length, flags, drops, timestamp = unpack_from(buffer, offset)
+            offset += _RECORD_HEADER.size
+            if offset + length > end:
+                msg = "Truncated btsnoop record"
+                raise MalformedBtsnoopError(msg)
+            yield BtsnoopRecord(
+                timestamp - BTSNOOP_EPOCH_DELTA,
+                flags,
+                drops,
+                buffer[offset : offset + length],
+            )
+            offset += length
+
+    def close(self) -> None:
+        """Release the memory map of the file, but don't close the file itself."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self: _R) -> _R:  # noqa: PYI019
+        """Return the reader itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Release the memory map of the file."""
+        self.close()
+
+
+def _hci_event(record: BtsnoopRecord, datalink: int) -> bytes | None:
+    """Return the HCI event in a record.
+
+    Args:
+        record (BtsnoopRecord): The record.
+        datalink (int): The datalink type of the btsnoop file.
+
+    Raises:
+        MalformedBtsnoopError: If the datalink type isn't supported.
+
+    Returns:
+        bytes | None: The HCI event, starting with its event code, or ``None`` if
+        the record doesn't contain an HCI event.
+    """
+    if datalink == DATALINK_H4:
+        is_event = record.data and record.data[0] == _H4_EVENT
+        return record.data[1:] if is_event else None
+    if datalink == DATALINK_H1:
+        is_event = record.flags & _H1_RECEIVED_EVENT == _H1_RECEIVED_EVENT
+        return record.data if is_event else None
+    if datalink == DATALINK_MONITOR:
+        return record.data if record.flags & 0xFFFF == _MONITOR_EVENT else None
+
+    msg = f"Unsupported datalink type: {datalink}"
+    raise MalformedBtsnoopError(msg)
+
+
+def _format_address(event: bytes, offset: int) -> str:
+    """Format a little-endian Bluetooth address.
+
+    Args:
+        event (bytes): The HCI event with the address.
+        offset (int): The position of the address in `event`.
+
+    Returns:
+        str: The address as "XX:XX:XX:XX:XX:XX".
+    """
+    return event[offset : offset + 6][::-1].hex(":").upper()
+
+
+def _reports(event: bytes, timestamp: int) -> Iterator[AdvertisingReport]:
+    """Extract the advertising reports from an HCI event.
+
+    Reports that are truncated are ignored.
+
+    Args:
+        event (bytes): The HCI event, starting with its event code.
+        timestamp (int): The time of the event in microseconds since the Unix epoch.
+
+    Yields:
+        AdvertisingReport: The advertising reports in the event.
+    """
+    if len(event) < 4 or event[0] != _LE_META_EVENT:  # noqa: PLR2004
+        return
+    subevent = event[2]
+    end = min(len(event), event[1] + 2)
+    if subevent == _LE_ADVERTISING_REPORT:
+        # Event type, address type, address, data length, data, RSSI
+        address_offset, length_offset, header_size = 2, 8, 9
+    elif subevent == _LE_EXTENDED_ADVERTISING_REPORT:
+        # Event type (2 bytes), address type, address, primary PHY, secondary PHY,
+        # advertising SID, TX power, RSSI, periodic advertising interval (2 bytes),
+        # direct address type, direct address, data length, data
+        address_offset, length_offset, header_size = 3, 23, 24
+    else:
+        return
+
+    offset = 4
+    for _ in range(event[3]):
+        if offset + header_size > end:
+            return
+        start = offset + header_size
+        stop = start + event[offset + length_offset]
+        if subevent == _LE_ADVERTISING_REPORT:
+            rssi_offset = stop
+            next_offset = stop + 1
+        else:
+            rssi_offset = offset + 13
+            next_offset = stop
+        if next_offset > end:
+            return
+        yield AdvertisingReport(
+            timestamp,
+            _format_address(event, offset + address_offset),
+            event[offset + address_offset - 1],
+            # The RSSI is a signed byte
+            (event[rssi_offset] ^ 0x80) - 0x80,
+            event[start:stop],
+        )
+        offset = next_offset
+
+
+def advertising_reports(
+    records: Iterable[BtsnoopRecord],
+    datalink: int,
+) -> Iterator[AdvertisingReport]:
+    """Extract the LE advertising reports from btsnoop records.
+
+    Both legacy and extended advertising reports are extracted.
+
+    Args:
+        records (Iterable[BtsnoopRecord]): The records of a btsnoop file.
+        datalink (int): The datalink type of the btsnoop file.
+
+    Raises:
+        MalformedBtsnoopError: If the datalink type isn't supported.
+
+    Yields:
+        AdvertisingReport: The advertising reports in the records.
+    """
+    for record in records:
+        event = _hci_event(record, datalink)
+        if event is not None:
+            yield from _reports(event, record.timestamp)
+
+
+def _format_uuid(uuid: int) -> str:
+    """Format a UUID key found in advertising data.
+
+    Args:
+        uuid (int): A 16-bit or 128-bit UUID as an integer.
+
+    Returns:
+        str: A 16-bit UUID in hexadecimal notation, or else the 128-bit UUID.
+    """
+    return f"0x{uuid:04X}" if uuid <= 0xFFFF else str(UUID(int=uuid))  # noqa: PLR2004
+
+
+def annotate(report: AdvertisingReport) -> dict[str, Any]:
+    """Annotate an advertising report with the names of its numbers.
+
+    Args:
+        report (AdvertisingReport): The advertising report.
+
+    Returns:
+        dict[str, Any]: The report with its timestamp in seconds since the Unix
+        epoch, the vendor of a public address, and the company IDs and service UUIDs
+        in its advertising data with their names. If the advertising data is
+        malformed, only its AD structures before the malformed one are annotated.
+    """
+    vendor = None
+    if report.address_type in _PUBLIC_ADDRESS_TYPES:
+        with suppress(BluetoothNumbersError):
+            vendor = oui[report.address[:8]]
+
+    companies: list[dict[str, Any]] = []
+    services: list[dict[str, Any]] = []
+    with suppress(MalformedAdvertisingDataError):
+        for record in parse_advertising_data(report.data):
+            if record.key is None:
+                continue
+            if record.ad_type == AD_MANUFACTURER_DATA:
+                companies.append(
+                    {"id": f"0x{record.key:04X}", "name": record.name},
+                )
+            elif record.ad_type in _SERVICE_AD_TYPES:
+                uuid = _format_uuid(record.key)
+                if not any(service["uuid"] == uuid for service in services):
+                    services.append({"uuid": uuid, "name": record.name})
+
+    return {
+        "timestamp": report.timestamp / 1e6,
+        "address": report.address,
+        "address_type": _ADDRESS_TYPES[report.address_type]
+        if report.address_type < len(_ADDRESS_TYPES)
+        else report.address_type,
+        "vendor": vendor,
+        "rssi": report.rssi,
+        "companies": companies,
+        "services": services,
+    }
+
+
+def write_jsonl(annotations: Iterable[dict[str, Any]], output: TextIO) -> None:
+    """Write annotated advertising reports as JSON Lines.
+
+    Args:
+        annotations (Iterable[dict[str, Any]]): The annotated advertising reports.
+        output (TextIO): The file to write to.
+    """
+    dumps = json.JSONEncoder(ensure_ascii=False).encode
+    for annotation in annotations:
+        output.write(dumps(annotation))
+        output.write("\n")
+
+
+def write_csv(annotations: Iterable[dict[str, Any]], output: TextIO) -> None:
+    """Write annotated advertising reports as CSV.
+
+    Company IDs, service UUIDs and their names are joined with semicolons. An
+    unknown name is an empty string.
+
+    Args:
+        annotations (Iterable[dict[str, Any]]): The annotated advertising reports.
+        output (TextIO): The file to write to.
+    """
+    writer = csv.writer(output)
+    writer.writerow(CSV_FIELDS)
+    for annotation in annotations:
+        companies = annotation["companies"]
+        services = annotation["services"]
+        writer.writerow(
+            (
+                annotation["timestamp"],
+                annotation["address"],
+                annotation["address_type"],
+                annotation["vendor"] or "",
+                annotation["rssi"],
+                ";".join(company["id"] for company in companies),
+                ";".join(company["name"] or "" for company in companies),
+                ";".join(service["uuid"] for service in services),
+                ";".join(service["name"] or "" for service in services),
+            ),
+        )
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Annotate the advertising reports in a btsnoop file.",
+    )
+    parser.add_argument(
+        "file",
+        type=Path,
+        help="btsnoop file, or - to read from standard input",
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=("jsonl", "csv"),
+        default="jsonl",
+        help="output format (default: jsonl)",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="output file (default: standard output)",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> None:
+    """Write the annotated advertising reports of a btsnoop file.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+    """
+    parsed_args = parse_args(args)
+    write = write_csv if parsed_args.format == "csv" else write_jsonl
+
+    capture: BinaryIO = sys.stdin.buffer
+    if str(parsed_args.file) != "-":
+        capture = parsed_args.file.open("rb")
+    output: TextIO = sys.stdout
+    if parsed_args.output:
+        output = parsed_args.output.open("w", encoding="utf-8", newline="")
+
+    try:
+        with BtsnoopReader(capture) as reader:
+            reports = advertising_reports(reader, reader.datalink)
+            write((annotate(report) for report in reports), output)
+    finally:
+        if capture is not sys.stdin.buffer:
+            capture.close()
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,291 @@
+"""Command-line tool to look up Bluetooth numbers.
+
+The ``bluetooth-numbers`` command has a subcommand for each dictionary of this
+package and one to search the descriptions::
+
+    $ bluetooth-numbers company 0x0499
+    0x0499	Ruuvi Innovations Ltd.
+    $ bluetooth-numbers service 180F 6E400001-B5A3-F393-E0A9-E50E24DCCA9E
+    180F	Battery Service
+    6E400001-B5A3-F393-E0A9-E50E24DCCA9E	Nordic UART Service
+    $ bluetooth-numbers search --type characteristic cycling power feature
+    cycling power feature	characteristic	0x2A65	Cycling Power Feature
+
+Each output line is tab-separated and starts with the key or query it's the result
+of. An unknown or invalid key gets an empty description. Without keys or with
+``-`` as the only key, the keys are read line by line from standard input and the
+results are written as they come, so a pipeline can resolve millions of keys with a
+single process::
+
+    $ cut -f2 companies.tsv | bluetooth-numbers company > names.tsv
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Mapping
+from uuid import UUID
+
+from bluetooth_numbers import characteristic, company, descriptor, oui, service
+from bluetooth_numbers.dicts import _uuid_object
+from bluetooth_numbers.exceptions import BluetoothNumbersError
+from bluetooth_numbers.reverse_lookup import UUID_TYPE_DEFAULT, ReverseLookup
+from bluetooth_numbers.utils import _parse_uuid_cached
+
+if TYPE_CHECKING:
+    from bluetooth_numbers.reverse_lookup import LOGIC
+
+_UUID16_LENGTH = 4
+_UUID32_LENGTH = 8
+_UINT32_LIMIT = 1 << 32
+
+
+def parse_cic(key: str) -> int:
+    """Parse a company ID.
+
+    Args:
+        key (str): The company ID in hexadecimal notation, with or without ``0x``
+            prefix.
+
+    Raises:
+        ValueError: If `key` isn't a hexadecimal number.
+
+    Returns:
+        int: The company ID.
+
+    Example:
+        >>> from bluetooth_numbers.cli import parse_cic
+        >>> parse_cic("0x0499"), parse_cic("4C")
+        (1177, 76)
+    """
+    return int(key, 16)
+
+
+def parse_uuid(key: str) -> UUID | int:
+    """Parse a UUID.
+
+    The UUID is parsed like a string key of a
+    :class:`~bluetooth_numbers.dicts.UUIDDict`, so standard Bluetooth UUIDs are
+    parsed as their 16-bit UUID.
+
+    Args:
+        key (str): A 16-bit or 32-bit UUID of 4 or 8 hexadecimal digits with or
+            without ``0x`` prefix, or a 128-bit UUID in one of the formats
+            :class:`uuid.UUID` accepts.
+
+    Raises:
+        ValueError: If `key` doesn't have one of these formats.
+
+    Returns:
+        UUID | int: A 16-bit UUID as an integer, otherwise a 128-bit UUID.
+
+    Example:
+        >>> from bluetooth_numbers.cli import parse_uuid
+        >>> parse_uuid("0x180F"), parse_uuid("0000FEAA")
+        (6159, 65194)
+        >>> parse_uuid("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")
+        UUID('6e400001-b5a3-f393-e0a9-e50e24dcca9e')
+    """
+    digits = key[2:] if key[:2] in ("0x", "0X") else key
+    if len(digits) not in (_UUID16_LENGTH, _UUID32_LENGTH):
+        digits = key
+    number = _parse_uuid_cached(digits)
+    if number is None:
+        msg = f"Invalid UUID: {key!r}"
+        raise ValueError(msg)
+    return _uuid_object(number)
+
+
+# Tables and key parsers of the lookup subcommands
+LOOKUPS: dict[str, tuple[Mapping[Any, str], Callable[[str], Any]]] = {
+    "company": (company, parse_cic),
+    "oui": (oui, str),
+    "service": (service, parse_uuid),
+    "characteristic": (characteristic, parse_uuid),
+    "descriptor": (descriptor, parse_uuid),
+}
+
+
+def lookup_lines(
+    keys: Iterable[str],
+    table: Mapping[Any, str],
+    parse: Callable[[str], Any],
+) -> Iterator[str]:
+    """Look up keys and format the results as output lines.
+
+    Args:
+        keys (Iterable[str]): The keys to look up, with or without line ending.
+        table (Mapping[Any, str]): The dictionary to look the keys up in.
+        parse (Callable[[str], Any]): The function to convert a key to a key of
+            `table`.
+
+    Yields:
+        str: The key and its description, or an empty description if the key is
+        unknown or invalid, separated by a tab and with a line ending.
+    """
+    for line in keys:
+        key = line.strip()
+        try:
+            description = table[parse(key)]
+        except (BluetoothNumbersError, ValueError):
+            description = ""
+        yield f"{key}\t{description}\n"
+
+
+def _format_uuid(uuid: str | UUID | int) -> str:
+    """Format the UUID of a match.
+
+    Args:
+        uuid (str | UUID | int): The UUID, company ID or OUI.
+
+    Returns:
+        str: 128-bit UUIDs in the usual string format, other integers in hexadecimal
+        notation and other UUIDs as a string.
+    """
+    if isinstance(uuid, int):
+        if uuid >= _UINT32_LIMIT:
+            return str(UUID(int=uuid)).upper()
+        return f"0x{uuid:04X}"
+    return str(uuid).upper()
+
+
+def search_lines(
+    queries: Iterable[str],
+    reverse_lookup: ReverseLookup,
+    uuid_types: Iterable[str] = UUID_TYPE_DEFAULT,
+    logic: LOGIC = "AND",
+) -> Iterator[str]:
+    """Search descriptions and format the matches as output lines.
+
+    Args:
+        queries (Iterable[str]): The queries, with or without line ending.
+        reverse_lookup (ReverseLookup): The reverse lookup to search with.
+        uuid_types (Iterable[str]): The types of UUIDs to search in.
+        logic (LOGIC): The search logic: "OR", "AND" or "SUBSTR".
+
+    Yields:
+        str: The query, the type, UUID and description of a match, separated by
+        tabs and with a line ending. The matches of a query are sorted by type and
+        description.
+    """
+    uuid_types = tuple(uuid_types)
+    for line in queries:
+        query = line.strip()
+        if not query:
+            continue
+        matches = reverse_lookup.lookup(query, uuid_types, logic)
+        for match in sorted(
+            matches,
+            key=lambda match: (match.uuid_type, match.description),
+        ):
+            yield (
+                f"{query}\t{match.uuid_type}\t{_format_uuid(match.uuid)}"
+                f"\t{match.description}\n"
+            )
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(
+        prog="bluetooth-numbers",
+        description="Look up Bluetooth numbers and search their descriptions.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    for command in LOOKUPS:
+        subparser = subparsers.add_parser(
+            command,
+            help=f"look up the description of {command} keys",
+        )
+        subparser.add_argument(
+            "keys",
+            nargs="*",
+            metavar="KEY",
+            help="key to look up (default: read keys from standard input)",
+        )
+
+    subparser = subparsers.add_parser(
+        "search",
+        help="search the descriptions for terms",
+    )
+    subparser.add_argument(
+        "keys",
+        nargs="*",
+        metavar="TERM",
+        help="term to search for (default: read queries from standard input)",
+    )
+    subparser.add_argument(
+        "-t",
+        "--type",
+        action="append",
+        choices=UUID_TYPE_DEFAULT,
+        dest="uuid_types",
+        help="type of UUIDs to search in, can be repeated (default: all types)",
+    )
+    subparser.add_argument(
+        "-l",
+        "--logic",
+        choices=("AND", "OR", "SUBSTR"),
+        default="AND",
+        help="search logic (default: AND)",
+    )
+    return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> int:
+    """Look up the keys or search the queries on the command line or stdin.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        int: The exit code: 1 if a key wasn't found or no query had a match,
+        otherwise 0.
+    """
+    parsed_args = parse_args(args)
+    keys: Iterable[str] = sys.stdin
+    if parsed_args.keys and parsed_args.keys != ["-"]:
+        keys = (
+            [" ".join(parsed_args.keys)]
+            if parsed_args.command == "search"
+            else parsed_args.keys
+        )
+
+    if parsed_args.command == "search":
+        lines = search_lines(
+            keys,
+            ReverseLookup(),
+            parsed_args.uuid_types or UUID_TYPE_DEFAULT,
+            parsed_args.logic,
+        )
+    else:
+        lines = lookup_lines(keys, *LOOKUPS[parsed_args.command])
+
+    write = sys.stdout.write
+    found = parsed_args.command != "search"
+    try:
+        for line in lines:
+            if parsed_args.command == "search":
+                found = True
+            elif line.endswith("\t\n"):
+                found = False
+            write(line)
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # The reader of the output has stopped, e.g. head, so stop quietly and
+        # prevent another BrokenPipeError when Python flushes stdout at exit
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+    return 0 if found else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
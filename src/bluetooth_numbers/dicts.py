@@ -1,25 +1,454 @@
 """Module with specialized dictionary classes for UUIDs, CICs and OUIs."""
 from __future__ import annotations
 
-from typing import Dict, Union
+import hashlib
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    ItemsView,
+    Iterable,
+    Iterator,
+    KeysView,
+    NoReturn,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 from uuid import UUID
 
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
 from bluetooth_numbers.exceptions import (
+    BluetoothNumbersError,
     No16BitIntegerError,
-    NonStandardUUIDError,
     UnknownCICError,
     UnknownOUIError,
     UnknownUUIDError,
+    WrongOUIFormatError,
 )
 from bluetooth_numbers.utils import (
-    is_normalized_oui,
+    BASE_UUID,
+    _parse_oui,
+    _parse_oui_cached,
+    _parse_uuid_cached,
     is_uint16,
-    normalize_oui,
-    uuid128_to_uuid16,
 )
 
+_K = TypeVar("_K")
+_T = TypeVar("_T")
+_D = TypeVar("_D", bound="_NumberDict[Any]")
+
+_UINT16_MAX = 0xFFFF
+_UINT24_MAX = 0xFFFFFF
+_UINT32_LIMIT = 1 << 32
+_UINT128_LIMIT = 1 << 128
+_UUID16_SHIFT = 96
+_UUID16_MASK = 0xFFFF << _UUID16_SHIFT
+_UUID16_SIZE = 2
+_UUID32_SIZE = 4
+_UUID128_SIZE = 16
+
+DEFAULT_CHUNK_SIZE = 10_000
+
+
+def _content_hash(items: Iterable[tuple[Any, str]]) -> str:
+    """Hash the keys and names of a dictionary, independent of their order.
+
+    Args:
+        items (Iterable[tuple[Any, str]]): The keys and names of the dictionary.
+
+    Returns:
+        str: The hash as 32 hexadecimal digits.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for line in sorted(f"{key!r}\t{name}\n" for key, name in items):
+        digest.update(line.encode())
+    return digest.hexdigest()
+
+
+class _NumberDict(Dict[_K, str]):
+    """Base class for the dictionaries with Bluetooth numbers.
+
+    Indexes derived from the contents of a dictionary are cached on the instance and
+    dropped as soon as the dictionary is changed.
+    """
+
+    _changes = 0
+    # The read-only variant of the class, see freeze()
+    _frozen_type: ClassVar[type[_NumberDict[Any]]]
+
+    def _index(self, name: str, build: Callable[[], _T]) -> _T:
+        """Return a cached index, building it first if needed.
+
+        Args:
+            name (str): The name of the index.
+            build (Callable[[], T]): Function that builds the index.
+
+        Returns:
+            T: The index.
+        """
+        indexes = self.__dict__.setdefault("_indexes", {})
+        if name not in indexes:
+            indexes[name] = build()
+        return cast(_T, indexes[name])
+
+    def _changed(self) -> None:
+        """Register a change to the contents of the dictionary."""
+        self._changes += 1
+        self.__dict__.pop("_indexes", None)
+
+    def build_indexes(self) -> None:
+        """Build all indexes of the dictionary now instead of at their first use.
+
+        This is useful before forking worker processes, which then share the
+        indexes instead of each building their own, see
+        :func:`bluetooth_numbers.prefork.warmup`.
+        """
+        _ = self.content_hash
+        self.by_name("")
+        self.by_name("", ignore_case=True)
+
+    @property
+    def content_hash(self) -> str:
+        """A hash of the contents of the dictionary.
+
+        The hash only depends on the keys and names, not on the order in which they
+        were added, and it's the same in every process and Python version. This
+        makes it usable as a key for caches of data derived from the dictionary,
+        also across processes.
+
+        Example:
+            >>> from bluetooth_numbers.dicts import CICDict
+            >>> CICDict({0x004C: "Apple, Inc."}).content_hash
+            '5daa58726b99dd9599672e3d9ceab6f0'
+        """
+
+        def build() -> str:
+            name = _builtin_name(self)
+            if name is not None:
+                from bluetooth_numbers._indexes import CONTENT_HASHES
+
+                return CONTENT_HASHES[name]
+            return _content_hash(dict.items(self))
+
+        return self._index("content_hash", build)
+
+    def __copy__(self: _D) -> _D:  # noqa: PYI019
+        """Return a copy of the dictionary, which shares the indexes built so far."""
+        table = type(self)(dict.items(self))
+        table.__dict__["_indexes"] = dict(self.__dict__.get("_indexes", {}))
+        return table
+
+    def __deepcopy__(self: _D, memo: dict[int, Any]) -> _D:  # noqa: PYI019
+        """Return a copy of the dictionary, as its keys and names are immutable."""
+        return self.__copy__()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle a built-in table as a reference, and others with their items.
+
+        An unchanged built-in table is pickled as its name and content hash, and
+        unpickled as the same table of the package, which must have the same
+        contents.
+        """
+        name = _builtin_name(self)
+        if name is not None:
+            return _builtin_table, (
+                name,
+                self.content_hash,
+                isinstance(self, _FrozenNumberDict),
+            )
+        return type(self), (dict(dict.items(self)),)
+
+    def freeze(self: _D) -> _D:  # noqa: PYI019
+        """Return a read-only copy of the dictionary.
+
+        The copy is an instance of a subclass of the dictionary's class, so lookups
+        work the same. All methods that would change it raise a :class:`TypeError`,
+        and it's hashable, with a hash derived from :attr:`content_hash`. The
+        indexes the dictionary has already built are shared with the copy.
+
+        Returns:
+            _NumberDict: The read-only copy.
+
+        Example:
+            >>> from bluetooth_numbers import company
+            >>> frozen_company = company.freeze()
+            >>> frozen_company[0x0499]
+            'Ruuvi Innovations Ltd.'
+            >>> frozen_company[0x0499] = "Ruuvi"
+            Traceback (most recent call last):
+            TypeError: FrozenCICDict is read-only
+        """
+        frozen = cast(_D, self._frozen_type(self))
+        frozen.__dict__["_builtin"] = _builtin_name(self)
+        frozen.__dict__["_indexes"] = dict(self.__dict__.get("_indexes", {}))
+        return frozen
+
+    def by_name(self, name: str, *, ignore_case: bool = False) -> tuple[_K, ...]:
+        """Return the keys with a name.
+
+        The first call builds an index from names to keys, so this is a single
+        hash lookup instead of a scan of the dictionary. A name can have several
+        keys, for instance a vendor with many OUIs.
+
+        Args:
+            name (str): The exact name.
+            ignore_case (bool): Whether to compare the names case-insensitively,
+              with a separate index of casefolded names.
+
+        Returns:
+            tuple: The keys with `name`, in the order of the dictionary, or an empty
+            tuple if there aren't any.
+
+        Example:
+            >>> from bluetooth_numbers import company, service
+            >>> service.by_name("Battery Service")
+            (6159,)
+            >>> company.by_name("ruuvi innovations ltd.", ignore_case=True)
+            (1177,)
+        """
+        if ignore_case:
+            casefolded = self._name_index("names_casefold", str.casefold)
+            return casefolded.get(name.casefold(), ())
+        return self._name_index("names", None).get(name, ())
+
+    def _name_index(
+        self,
+        index_name: str,
+        normalize: Callable[[str], str] | None,
+    ) -> dict[str, tuple[_K, ...]]:
+        """Return an index from names to their keys.
+
+        Args:
+            index_name (str): The name of the index.
+            normalize (Callable[[str], str] | None): Function that normalizes the
+              names, or ``None`` to use them as they are.
+
+        Returns:
+            dict[str, tuple]: The keys of every name.
+        """
+
+        def build() -> dict[str, tuple[_K, ...]]:
+            names: dict[str, list[_K]] = {}
+            for key, name in self.items():
+                index_key = normalize(name) if normalize else name
+                names.setdefault(index_key, []).append(key)
+            return {name: tuple(keys) for name, keys in names.items()}
+
+        return self._index(index_name, build)
+
+    def lookup_many(
+        self,
+        keys: Iterable[Any],
+        default: str | None = None,
+    ) -> list[str | None]:
+        """Look up many keys at once.
+
+        Every key is looked up as with ``self[key]``, so it can have any format this
+        dictionary supports.
+
+        Args:
+            keys (Iterable[Any]): The keys to look up.
+            default (str | None): The result for unknown or invalid keys.
+
+        Returns:
+            list[str | None]: The name of each key, or `default` if the key is
+            unknown or invalid.
+
+        Example:
+            >>> from bluetooth_numbers import company
+            >>> company.lookup_many([0x004C, 0xFFFE, -1, 0x0499])
+            ['Apple, Inc.', None, None, 'Ruuvi Innovations Ltd.']
+        """
+        results: list[str | None] = []
+        append = results.append
+        remaining = iter(keys)
+        # Resume the loop after a failed lookup, so known keys don't pay for
+        # setting up an exception handler
+        while True:
+            try:
+                for key in remaining:
+                    append(self[key])
+            except BluetoothNumbersError:  # noqa: PERF203
+                append(default)
+            else:
+                return results
+
+    async def lookup_many_async(
+        self,
+        keys: Iterable[Any],
+        default: str | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        executor: Executor | None = None,
+    ) -> list[str | None]:
+        """Look up many keys at once without blocking the event loop.
+
+        The keys are looked up with :meth:`lookup_many` in chunks, each in an
+        executor, so the event loop keeps running other tasks in between and
+        cancelling the task stops the lookups after the current chunk.
+
+        Args:
+            keys (Iterable[Any]): The keys to look up.
+            default (str | None): The result for unknown or invalid keys.
+            chunk_size (int): The maximum number of keys to look up in one chunk.
+            executor (Executor | None): The executor to look up the chunks in, or
+                ``None`` for the default executor of the event loop.
+
+        Returns:
+            list[str | None]: The name of each key, or `default` if the key is
+            unknown or invalid.
+        """
+        # Only import asyncio when it's needed, because it's slow to import
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        keys = list(keys)
+        results: list[str | None] = []
+        for start in range(0, len(keys), chunk_size):
+            results.extend(
+                await loop.run_in_executor(
+                    executor,
+                    self.lookup_many,
+                    keys[start : start + chunk_size],
+                    default,
+                ),
+            )
+        return results
+
+    def __setitem__(self, key: _K, value: str) -> None:
+        super().__setitem__(key, value)
+        self._changed()
+
+    def __delitem__(self, key: _K) -> None:
+        super().__delitem__(key)
+        self._changed()
+
+    def __ior__(self, other: Any) -> Any:  # type: ignore[misc]  # noqa: ANN401, PYI034
+        self.update(other)
+        return self
+
+    def clear(self) -> None:
+        super().clear()
+        self._changed()
+
+    def pop(self, *args: Any) -> Any:  # noqa: ANN401
+        value = super().pop(*args)
+        self._changed()
+        return value
+
+    def popitem(self) -> tuple[_K, str]:
+        item = super().popitem()
+        self._changed()
+        return item
+
+    def setdefault(self, *args: Any) -> Any:  # noqa: ANN401
+        size = len(self)
+        value = super().setdefault(*args)
+        if len(self) != size:
+            self._changed()
+        return value
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        super().update(*args, **kwargs)
+        self._changed()
+
+
+def _builtin_name(table: _NumberDict[Any]) -> str | None:
+    """Return the name of a built-in table if its contents haven't been changed.
+
+    Precomputed indexes of a built-in table can only be used as long as this returns
+    the table's name.
+
+    Args:
+        table (_NumberDict): The table to check.
+
+    Returns:
+        str | None: The name of `table` in the package if it's a built-in table whose
+        contents haven't been changed, ``None`` otherwise.
+    """
+    if isinstance(table, _FrozenNumberDict):
+        return table._builtin  # noqa: SLF001
+    if table._changes:  # noqa: SLF001
+        return None
+
+    import bluetooth_numbers
+
+    for name in bluetooth_numbers.__all__:
+        if getattr(bluetooth_numbers, name) is table:
+            return name
+
+    return None
+
+
+def _builtin_table(name: str, content_hash: str, frozen: bool) -> _NumberDict[Any]:
+    """Return the built-in table of a pickled reference.
+
+    Args:
+        name (str): The name of the table in the package.
+        content_hash (str): The content hash of the pickled table.
+        frozen (bool): Whether the pickled table was a read-only copy.
+
+    Raises:
+        ValueError: If the table in this process doesn't have the same contents.
+
+    Returns:
+        _NumberDict: The table, or a read-only copy of it if `frozen` is true.
+    """
+    import bluetooth_numbers
 
-class CICDict(Dict[int, str]):
+    table: _NumberDict[Any] = getattr(bluetooth_numbers, name)
+    if _builtin_name(table) != name or table.content_hash != content_hash:
+        msg = f"The built-in table {name} differs from the pickled one"
+        raise ValueError(msg)
+    return table.freeze() if frozen else table
+
+
+class _FrozenNumberDict(_NumberDict[_K]):
+    """Base class for the read-only dictionaries with Bluetooth numbers.
+
+    Create them with :meth:`_NumberDict.freeze`.
+    """
+
+    # The name of the built-in table this is a copy of, if any
+    _builtin: str | None = None
+
+    def _read_only(self, *_args: Any, **_kwargs: Any) -> NoReturn:  # noqa: ANN401
+        """Raise an exception for a method that would change the dictionary.
+
+        Raises:
+            TypeError: Always.
+        """
+        msg = f"{type(self).__name__} is read-only"
+        raise TypeError(msg)
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(self.content_hash)
+
+    def __copy__(self: _D) -> _D:  # noqa: PYI019
+        return self
+
+    def __deepcopy__(self: _D, memo: dict[int, Any]) -> _D:  # noqa: PYI019
+        return self
+
+    def freeze(self: _D) -> _D:  # noqa: PYI019
+        """Return the dictionary itself, because it's already read-only.
+
+        Returns:
+            _NumberDict: This dictionary.
+        """
+        return self
+
+
+class CICDict(_NumberDict[int]):
     """Dictionary class to hold 16-bit company codes and their names.
 
     You can use this class as a dict with the following differences:
@@ -57,17 +486,20 @@ class CICDict(Dict[int, str]):
         raise No16BitIntegerError(key)
 
 
-class OUIDict(Dict[str, str]):
+class OUIDict(_NumberDict[str]):
     """Dictionary class to hold OUIs and their names.
 
     You can use this class as a dict with the following differences:
 
     - You can check for an OUI in the formats "xx:yy:zz", "xx-yy-zz" or "xxyyzz".
       Both lowercase and uppercase letters are supported.
+    - You can also check for an OUI as a 24-bit unsigned integer.
     - If you check for a key that doesn't exist, this raises an
       :class:`~bluetooth_numbers.exceptions.UnknownOUIError`.
     - If you check for a key that doesn't have one of the supported formats, this
       raises a :class:`~bluetooth_numbers.exceptions.WrongOUIFormatError`.
+    - Every distinct vendor name has a vendor ID, and you can get all OUIs of a
+      vendor.
 
     Examples:
         >>> from bluetooth_numbers import oui
@@ -77,19 +509,108 @@ class OUIDict(Dict[str, str]):
         'Signify B.V.'
         >>> oui["A44519"]
         'Xiaomi Communications Co Ltd'
+        >>> oui[0x582D34]
+        'Qingping Electronics (Suzhou) Co., Ltd'
         >>> oui["FOOBAR"]
         Traceback (most recent call last):
         bluetooth_numbers.exceptions.WrongOUIFormatError: 'FOOBAR'
         >>> oui["AB:CD:EF"]
         Traceback (most recent call last):
         bluetooth_numbers.exceptions.UnknownOUIError: AB:CD:EF
+        >>> oui.prefixes("Qingping Electronics (Suzhou) Co., Ltd")
+        ('58:2D:34',)
     """
 
-    def __missing__(self, key: str) -> str:
+    @classmethod
+    def from_vendors(
+        cls: type[OUIDict],
+        vendors: Sequence[str],
+        prefixes: Iterable[str],
+        vendor_ids: Iterable[int],
+    ) -> OUIDict:
+        """Create an OUIDict from vendor names and the vendor IDs of OUIs.
+
+        Every vendor name is only stored once, however many OUIs it has.
+
+        Args:
+            vendors (Sequence[str]): The vendor names, with their position as vendor
+              ID.
+            prefixes (Iterable[str]): The OUIs in the format "XX:YY:ZZ".
+            vendor_ids (Iterable[int]): The vendor ID of each OUI in `prefixes`.
+
+        Returns:
+            OUIDict: An OUIDict with the OUIs and their vendor names.
+
+        Example:
+            >>> from bluetooth_numbers.dicts import OUIDict
+            >>> ouis = OUIDict.from_vendors(["Apple, Inc."], ["24:5B:A7"], [0])
+            >>> ouis["24:5B:A7"]
+            'Apple, Inc.'
+        """
+        ouis = cls(zip(prefixes, map(vendors.__getitem__, vendor_ids)))
+        ouis._index("vendors", lambda: tuple(vendors))  # noqa: SLF001
+        return ouis
+
+    @property
+    def vendors(self) -> tuple[str, ...]:
+        """The distinct vendor names, with their position as vendor ID."""
+        return self._index("vendors", lambda: tuple(dict.fromkeys(self.values())))
+
+    def vendor_id(self, key: str | int) -> int:
+        """Return the vendor ID of an OUI.
+
+        Args:
+            key (str | int): The OUI, in one of the supported formats.
+
+        Raises:
+            UnknownOUIError: If ``key`` isn't in this OUIDict instance.
+            WrongOUIFormatError: If ``key`` doesn't have one of the supported
+              formats.
+
+        Returns:
+            int: The position of the OUI's vendor name in :attr:`vendors`.
+        """
+        return self._vendor_ids()[self[key]]
+
+    def _vendor_ids(self) -> dict[str, int]:
+        """Return an index of the vendor IDs.
+
+        Returns:
+            dict[str, int]: A dict with the vendor names and their vendor ID.
+        """
+        return self._index(
+            "vendor_ids",
+            lambda: {vendor: i for i, vendor in enumerate(self.vendors)},
+        )
+
+    def build_indexes(self) -> None:
+        """Build all indexes, including those of vendor IDs and integer OUIs."""
+        super().build_indexes()
+        self._vendor_ids()
+        self._int_index()
+
+    def prefixes(self, vendor: str) -> tuple[str, ...]:
+        """Return all OUIs of a vendor.
+
+        Args:
+            vendor (str): The vendor name.
+
+        Returns:
+            tuple[str, ...]: The OUIs with `vendor` as their name, or an empty tuple
+            if there aren't any.
+        """
+        return self.by_name(vendor)
+
+    if TYPE_CHECKING:
+
+        def __getitem__(self, key: str | int) -> str:  # noqa: D105
+            ...
+
+    def __missing__(self, key: str | int) -> str:
         """Try the key and raise exception when it's invalid.
 
         Args:
-            key (str): The key to check.
+            key (str | int): The key to check.
 
         Raises:
             UnknownOUIError: If ``key`` isn't in this OUIDict instance.
@@ -99,20 +620,198 @@ class OUIDict(Dict[str, str]):
         Returns:
             str: The name corresponding to ``key``.
         """
-        if is_normalized_oui(key):
-            raise UnknownOUIError(key)
+        if isinstance(key, int):
+            if 0 <= key <= _UINT24_MAX:
+                try:
+                    return self.vendors[self._int_index()[key]]
+                except KeyError:
+                    raise UnknownOUIError(key) from None
+            raise WrongOUIFormatError(key)
+
+        normalized = _parse_oui_cached(key)
+        if normalized is None:
+            raise WrongOUIFormatError(key)
+        # Not self[normalized], so lookup statistics count the lookup once
+        name = dict.get(self, normalized)
+        if name is None:
+            raise UnknownOUIError(normalized)
+        return name
+
+    def _int_index(self) -> dict[int, int]:
+        """Return an index of the OUIs as 24-bit unsigned integers.
+
+        Keys that aren't OUIs in one of the supported formats aren't in the index.
+
+        Returns:
+            dict[int, int]: A dict with the OUIs as integers and their vendor ID.
+        """
+
+        def build() -> dict[int, int]:
+            if _builtin_name(self) == "oui":
+                from bluetooth_numbers._indexes import OUIS
+
+                return OUIS
+            vendor_ids = self._vendor_ids()
+            index = {}
+            for key, name in dict.items(self):
+                normalized = _parse_oui(key) if isinstance(key, str) else None
+                if normalized is not None:
+                    index[int(normalized.replace(":", ""), 16)] = vendor_ids[name]
+            return index
+
+        return self._index("int", build)
+
+
+def _int_key(key: Any) -> Any:  # noqa: ANN401
+    """Convert a UUID key to the integer it's stored as in a UUIDDict.
+
+    Args:
+        key (Any): The key.
+
+    Raises:
+        No16BitIntegerError: If `key` is a UUID below 2**32, whose integer would be
+          the same as a 16-bit or 32-bit UUID.
+
+    Returns:
+        Any: The UUID as an integer if `key` is a UUID, otherwise `key` itself.
+    """
+    if not isinstance(key, UUID):
+        return key
+    if key.int < _UINT32_LIMIT:
+        raise No16BitIntegerError(key)
+    return key.int
+
+
+def _uuid_object(key: int) -> UUID | int:
+    """Convert an integer stored in a UUIDDict to the key it's exposed as.
+
+    Args:
+        key (int): The stored key.
+
+    Returns:
+        UUID | int: A UUID for a 128-bit UUID, otherwise `key` itself.
+    """
+    return UUID(int=key) if key >= _UINT32_LIMIT else key
+
+
+def _stored_items(table: UUIDDict) -> Iterable[tuple[int, str]]:
+    """Return the items of a UUIDDict with the keys as they're stored.
+
+    Args:
+        table (UUIDDict): The dictionary.
+
+    Returns:
+        Iterable[tuple[int, str]]: The UUIDs as integers and their names.
+    """
+    return cast(Iterable[Tuple[int, str]], dict.items(table))
+
+
+class _UUIDItemsView(ItemsView[Union[UUID, int], str]):
+    """Items of a UUIDDict, with 128-bit UUIDs as UUID objects."""
+
+    _mapping: UUIDDict
+
+    def __iter__(self) -> Iterator[tuple[UUID | int, str]]:
+        """Iterate over the items without looking up every key again."""
+        for key, name in _stored_items(self._mapping):
+            yield _uuid_object(key), name
+
+
+def _little_endian_uuid(key: bytes | memoryview) -> int:
+    """Convert a UUID in little-endian byte order to an integer.
+
+    Args:
+        key (bytes | memoryview): The 16-bit, 32-bit or 128-bit UUID as 2, 4 or 16
+          bytes in the byte order of Bluetooth packets.
+
+    Raises:
+        No16BitIntegerError: If ``key`` doesn't have 2, 4 or 16 bytes, or is a
+          128-bit UUID below 2**32.
+
+    Returns:
+        int: The 16-bit UUID if ``key`` is a 16-bit UUID or a 32-bit UUID with a
+        16-bit value, otherwise the 128-bit UUID.
+    """
+    size = key.nbytes if isinstance(key, memoryview) else len(key)
+    uuid = int.from_bytes(key, "little")
+    if size in (_UUID16_SIZE, _UUID32_SIZE) and uuid <= _UINT16_MAX:
+        return uuid
+    if size == _UUID32_SIZE:
+        return BASE_UUID.int | uuid << _UUID16_SHIFT
+    if size != _UUID128_SIZE or uuid < _UINT32_LIMIT:
+        raise No16BitIntegerError(key)
+    return uuid
+
+
+def _uuid_key(key: Any) -> int:  # noqa: ANN401
+    """Convert a UUID in any supported format to the integer it's stored as.
+
+    Standard Bluetooth UUIDs are stored as their 16-bit UUID, other UUIDs as their
+    128-bit UUID.
+
+    Args:
+        key (Any): The 16-bit or 128-bit UUID, as a UUID, an integer, a string or
+          bytes in little-endian byte order.
+
+    Raises:
+        No16BitIntegerError: If ``key`` isn't a 16-bit unsigned integer or a
+          128-bit UUID, or a UUID of a supported format, or if it's a 128-bit UUID
+          below 2**32 that isn't a standard Bluetooth UUID.
+
+    Returns:
+        int: The UUID as an integer.
+    """
+    if isinstance(key, UUID):
+        uuid = cast(int, _int_key(key))
+    elif isinstance(key, str):
+        parsed = _parse_uuid_cached(key)
+        if parsed is None:
+            raise No16BitIntegerError(key)
+        return parsed
+    elif isinstance(key, (bytes, memoryview)):
+        uuid = _little_endian_uuid(key)
+    elif is_uint16(key):
+        return cast(int, key)
+    elif isinstance(key, int) and _UINT32_LIMIT <= key < _UINT128_LIMIT:
+        uuid = key
+    else:
+        raise No16BitIntegerError(key)
 
-        return self[normalize_oui(key)]
+    if uuid & ~_UUID16_MASK == BASE_UUID.int:
+        return uuid >> _UUID16_SHIFT
+    return uuid
 
 
-class UUIDDict(Dict[Union[UUID, int], str]):
+class UUIDDict(_NumberDict[Union[UUID, int]]):
     """Dictionary class to hold 16-bit and 128-bit standard UUID keys and descriptions.
 
     You can use this class as a dict for Bluetooth UUIDs, with the following
     differences:
 
+    - 128-bit UUIDs are stored as 128-bit integers, which take less memory than
+      :class:`~uuid.UUID` objects and are faster to hash. You can still use a UUID
+      as a key to add, change, check or delete a 128-bit UUID, and to look it up.
+      Iterating over the dictionary, its keys or its items gives 128-bit UUIDs as
+      UUID objects, as they were added. A 128-bit UUID below 2**32 can't be a
+      key, because its integer would be the same as a 16-bit or 32-bit UUID, so
+      adding or checking for one raises a
+      :class:`~bluetooth_numbers.exceptions.No16BitIntegerError`.
     - If you check for a 128-bit standard UUID and this UUID doesn't exist in the
       dictionary, it will check for the corresponding 16-bit UUID.
+    - A 32-bit UUID is stored as its 128-bit UUID. You can check for it as this
+      UUID, as a 128-bit integer or as 4 bytes (see below); a 32-bit UUID that is
+      also a 16-bit UUID is found by its 16-bit UUID.
+    - You can also check for a UUID as a string: a 16-bit or 32-bit UUID of 4 or 8
+      hexadecimal digits, or a 128-bit UUID in one of the formats
+      :class:`~uuid.UUID` accepts, such as "0000180f-0000-1000-8000-00805f9b34fb".
+      The most recently parsed strings are remembered, so looking up the same
+      strings again doesn't parse them again.
+    - You can also check for a 16-bit, 32-bit or 128-bit UUID as 2, 4 or 16 bytes in
+      little-endian byte order, as found in Bluetooth packets. A memoryview can only
+      be used as a key if it's a view of a bytes object, because other buffers
+      aren't hashable.
+    - You can get the 128-bit UUIDs with the same base UUID as a UUID, to find the
+      vendor family of a UUID that isn't in the dictionary.
     - If you check for a UUID that doesn't exist, this raises an
       :class:`~bluetooth_numbers.exceptions.UnknownUUIDError`.
     - If you check for a key that isn't a 16-bit unsigned integer, this raises a
@@ -125,33 +824,247 @@ class UUIDDict(Dict[Union[UUID, int], str]):
         'Battery Service'
         >>> service[0x180F]
         'Battery Service'
+        >>> service[0x6E400001B5A3F393E0A9E50E24DCCA9E]
+        'Nordic UART Service'
+        >>> service["6e400001-b5a3-f393-e0a9-e50e24dcca9e"]
+        'Nordic UART Service'
+        >>> service["180f"]
+        'Battery Service'
+        >>> service[bytes.fromhex("0F18")]
+        'Battery Service'
         >>> service[0]
         Traceback (most recent call last):
         bluetooth_numbers.exceptions.UnknownUUIDError: 0
         >>> service[6.5]
         Traceback (most recent call last):
         bluetooth_numbers.exceptions.No16BitIntegerError: 6.5
+        >>> service.family(UUID("6E400004-B5A3-F393-E0A9-E50E24DCCA9E"))
+        {UUID('6e400001-b5a3-f393-e0a9-e50e24dcca9e'): 'Nordic UART Service'}
     """
 
-    def __missing__(self, key: UUID | int) -> str:
-        """Try the key converted to 16-bit UUID.
+    def __init__(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Initialize the dictionary like a dict, with UUID keys as integers.
 
         Args:
-            key (UUID | int): The 128-bit or 16-bit UUID to check.
+            *args (Any): A mapping or iterable of key and name pairs.
+            **kwargs (Any): More keys and names.
+        """
+        super().__init__(
+            {_int_key(key): name for key, name in dict(*args, **kwargs).items()},
+        )
+
+    def __setitem__(self, key: UUID | int, value: str) -> None:
+        """Add or change a UUID, with a UUID key as an integer."""
+        super().__setitem__(_int_key(key), value)
+
+    def __delitem__(self, key: UUID | int) -> None:
+        """Delete a UUID, with a UUID key as an integer."""
+        super().__delitem__(_int_key(key))
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a UUID in any format that a lookup supports."""
+        if super().__contains__(key):
+            return True
+        try:
+            return self._lookup(key) is not None
+        except No16BitIntegerError:
+            return False
+
+    def get(self, key: Any, default: Any = None) -> Any:  # noqa: ANN401
+        """Get the name of a UUID in any format that a lookup supports."""
+        name = dict.get(self, key)
+        if name is not None:
+            return name
+        try:
+            name = self._lookup(key)
+        except No16BitIntegerError:
+            return default
+        return default if name is None else name
+
+    def pop(self, *args: Any) -> Any:  # noqa: ANN401
+        """Remove a UUID like a dict, with a UUID key as an integer."""
+        return super().pop(_int_key(args[0]), *args[1:])
+
+    def __eq__(self, other: object) -> bool:
+        """Compare with a dict like a dict, with UUID keys as integers."""
+        if isinstance(other, dict) and not isinstance(other, UUIDDict):
+            try:
+                other = {_int_key(key): name for key, name in other.items()}
+            except No16BitIntegerError:
+                return False
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        """Compare with a dict like a dict, with UUID keys as integers."""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __iter__(self) -> Iterator[UUID | int]:
+        """Iterate over the UUIDs, with 128-bit UUIDs as UUID objects."""
+        return (_uuid_object(key) for key, _ in _stored_items(self))
+
+    def keys(self) -> KeysView[UUID | int]:  # type: ignore[override]
+        """Return the UUIDs, with 128-bit UUIDs as UUID objects."""
+        return KeysView(self)
+
+    def items(self) -> ItemsView[UUID | int, str]:  # type: ignore[override]
+        """Return the UUIDs and names, with 128-bit UUIDs as UUID objects."""
+        return _UUIDItemsView(self)
+
+    def popitem(self) -> tuple[UUID | int, str]:
+        """Remove the last UUID like a dict, with a 128-bit UUID as a UUID object."""
+        key, name = super().popitem()
+        return _uuid_object(cast(int, key)), name
+
+    def setdefault(self, *args: Any) -> Any:  # noqa: ANN401
+        """Set the default name of a UUID like a dict, with a UUID key as an integer."""
+        return super().setdefault(_int_key(args[0]), *args[1:])
+
+    def update(self, *args: Any, **kwargs: Any) -> None:  # noqa: ANN401
+        """Update the dictionary like a dict, with UUID keys as integers."""
+        super().update(
+            {_int_key(key): name for key, name in dict(*args, **kwargs).items()},
+        )
+
+    def build_indexes(self) -> None:
+        """Build all indexes, including the one of UUID families."""
+        super().build_indexes()
+        self._family_index()
+
+    def family(self, key: UUID | int | bytes | memoryview) -> dict[UUID, str]:
+        """Return the 128-bit UUIDs with the same base UUID as a UUID.
+
+        Vendors often derive the UUIDs of their services and characteristics from
+        one base UUID, by only changing bytes 2 and 3, which hold the 16-bit UUID
+        in standard Bluetooth UUIDs. For instance, the UUIDs of the Nordic UART
+        Service all have the form 6E40xxxx-B5A3-F393-E0A9-E50E24DCCA9E. The UUIDs
+        with the same base UUID form a family, which is found with one lookup in a
+        precomputed index, whether or not the UUID itself is in the dictionary.
+
+        Args:
+            key (UUID | int | bytes | memoryview): The UUID, as a UUID, an integer or
+              bytes in little-endian byte order.
 
         Raises:
-            No16BitIntegerError: If ``key`` isn't a 16-bit unsigned integer.
-            UnknownUUIDError: If ``key`` isn't in this UUIDDict instance.
+            No16BitIntegerError: If ``key`` isn't a 16-bit or 128-bit UUID.
 
         Returns:
-            str: The name corresponding to ``key``.
+            dict[UUID, str]: The 128-bit UUIDs in this UUIDDict instance that
+            differ from ``key`` at most in bytes 2 and 3, with their names. This is
+            empty if there aren't any, or if ``key`` is a standard Bluetooth UUID.
         """
         if isinstance(key, UUID):
-            try:
-                return self[uuid128_to_uuid16(key)]
-            except NonStandardUUIDError as error:
-                raise UnknownUUIDError(key) from error
+            uuid = key.int
+        elif isinstance(key, (bytes, memoryview)):
+            size = key.nbytes if isinstance(key, memoryview) else len(key)
+            if size in (_UUID16_SIZE, _UUID32_SIZE):
+                return {}
+            if size != _UUID128_SIZE:
+                raise No16BitIntegerError(key)
+            uuid = int.from_bytes(key, "little")
         elif is_uint16(key):
+            return {}
+        elif isinstance(key, int) and 0 <= key < _UINT128_LIMIT:
+            uuid = key
+        else:
+            raise No16BitIntegerError(key)
+
+        base = uuid & ~_UUID16_MASK
+        if base == BASE_UUID.int:
+            return {}
+        return {
+            UUID(int=member): dict.__getitem__(self, member)
+            for member in self._family_index().get(base, ())
+        }
+
+    if TYPE_CHECKING:
+
+        def __getitem__(  # noqa: D105
+            self,
+            key: UUID | int | str | bytes | memoryview,
+        ) -> str:
+            ...
+
+    def __missing__(self, key: UUID | int | str | bytes | memoryview) -> str:
+        """Try the key converted to a 128-bit or 16-bit UUID as an integer.
+
+        Args:
+            key (UUID | int | str | bytes | memoryview): The 128-bit or 16-bit UUID
+              to check.
+
+        Raises:
+            No16BitIntegerError: If ``key`` isn't a 16-bit unsigned integer or a
+              128-bit UUID.
+            UnknownUUIDError: If ``key`` isn't in this UUIDDict instance.
+
+        Returns:
+            str: The name corresponding to ``key``.
+        """
+        name = self._lookup(key)
+        if name is None:
             raise UnknownUUIDError(key)
+        return name
 
-        raise No16BitIntegerError(key)
+    def _lookup(self, key: Any) -> str | None:  # noqa: ANN401
+        """Return the name of a UUID in any supported format.
+
+        A UUID is first looked up as it's stored, then converted with
+        :func:`_uuid_key`.
+
+        Args:
+            key (Any): The UUID.
+
+        Raises:
+            No16BitIntegerError: If ``key`` isn't a 16-bit unsigned integer or a
+              128-bit UUID.
+
+        Returns:
+            str | None: The name of ``key``, or ``None`` if it isn't in this UUIDDict
+            instance.
+        """
+        name: str | None
+        if isinstance(key, UUID):
+            name = dict.get(self, _int_key(key))
+            if name is not None:
+                return name
+        return dict.get(self, _uuid_key(key))
+
+    def _family_index(self) -> dict[int, tuple[int, ...]]:
+        """Return an index of the 128-bit UUIDs by their base UUID.
+
+        Returns:
+            dict[int, tuple[int, ...]]: A dict with the base UUIDs as integers, with
+            bytes 2 and 3 set to zero, and the 128-bit UUIDs as integers with this
+            base UUID.
+        """
+
+        def build() -> dict[int, tuple[int, ...]]:
+            name = _builtin_name(self)
+            if name is not None:
+                from bluetooth_numbers._indexes import UUID_FAMILIES
+
+                return UUID_FAMILIES[name]
+            families: dict[int, list[int]] = {}
+            for uuid, _ in _stored_items(self):
+                if uuid >= _UINT32_LIMIT:
+                    families.setdefault(uuid & ~_UUID16_MASK, []).append(uuid)
+            return {base: tuple(uuids) for base, uuids in families.items()}
+
+        return self._index("families", build)
+
+
+class FrozenCICDict(_FrozenNumberDict[int], CICDict):
+    """Read-only :class:`CICDict`, created with :meth:`CICDict.freeze`."""
+
+
+class FrozenOUIDict(_FrozenNumberDict[str], OUIDict):
+    """Read-only :class:`OUIDict`, created with :meth:`OUIDict.freeze`."""
+
+
+class FrozenUUIDDict(_FrozenNumberDict[Union[UUID, int]], UUIDDict):  # type: ignore[misc]
+    """Read-only :class:`UUIDDict`, created with :meth:`UUIDDict.freeze`."""
+
+
+CICDict._frozen_type = FrozenCICDict  # noqa: SLF001
+OUIDict._frozen_type = FrozenOUIDict  # noqa: SLF001
+UUIDDict._frozen_type = FrozenUUIDDict  # noqa: SLF001
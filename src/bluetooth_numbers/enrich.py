@@ -0,0 +1,491 @@
+r"""Module to enrich DataFrame columns with the names of Bluetooth numbers.
+
+The functions in this module take a column of OUIs or MAC addresses, company IDs or
+UUIDs as a pyarrow ``Array`` or ``ChunkedArray``, a pandas ``Series``, a Polars
+``Series`` or a NumPy array, and return a column of the same library with their
+names, dictionary-encoded (categorical). Unknown or invalid keys and nulls get a
+null name:
+
+>>> import numpy as np
+>>> from bluetooth_numbers.enrich import company_names, oui_names, uuid_names
+>>> names = oui_names(np.array(["58:2D:34:12:34:56", "58-2d-34", "FOOBAR"]))
+>>> print(*names, sep="\n")
+Qingping Electronics (Suzhou) Co., Ltd
+Qingping Electronics (Suzhou) Co., Ltd
+None
+>>> company_names(np.array([0x004C, 0x0499, 0xFFFE])).tolist()
+['Apple, Inc.', 'Ruuvi Innovations Ltd.', None]
+>>> uuid_names(np.array(["180F", "6E400001-B5A3-F393-E0A9-E50E24DCCA9E"])).tolist()
+['Battery Service', 'Nordic UART Service']
+
+The keys are converted to integers or bytes with NumPy and joined with the sorted
+keys of the dictionary with :func:`numpy.searchsorted`, so no Python code runs per
+row. The sorted keys are cached on the dictionary until it's changed.
+
+The dictionary of the result always holds every name in the dictionary of this
+package, so results of different columns have the same categories.
+
+This module needs NumPy, which you can install with::
+
+    pip install bluetooth-numbers[enrich]
+
+A Polars result needs Polars and a pyarrow result needs pyarrow, but these are
+already installed if you pass a Polars or pyarrow column.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable, NamedTuple, cast
+from uuid import UUID
+
+import numpy as np
+
+from bluetooth_numbers import company, oui, service
+from bluetooth_numbers.utils import BASE_UUID
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from bluetooth_numbers.dicts import CICDict, OUIDict, UUIDDict, _NumberDict
+
+_UINT16_MAX = 0xFFFF
+_UINT24_MAX = 0xFFFFFF
+_UINT32_LIMIT = 1 << 32
+_UUID16_SHIFT = 96
+_UUID_SIZE = 16
+_UUID_NIBBLES = 32
+_OUI_NIBBLES = 6
+
+# Hexadecimal value of each ASCII character, or -1 if it isn't a hexadecimal digit
+_HEX_VALUES = np.full(128, -1, dtype=np.int8)
+for _digit in "0123456789abcdefABCDEF":
+    _HEX_VALUES[ord(_digit)] = int(_digit, 16)
+
+# Layouts of OUIs and MAC addresses, by length of the string: "x" is a hexadecimal
+# digit, "-" is a dash or colon and "." is a dot
+_OUI_LAYOUTS = {
+    6: "xxxxxx",  # 582D34
+    8: "xx-xx-xx",  # 58:2D:34 or 58-2D-34
+    12: "xxxxxxxxxxxx",  # 582D34123456
+    14: "xxxx.xxxx.xxxx",  # 582D.3412.3456
+    17: "xx-xx-xx-xx-xx-xx",  # 58:2D:34:12:34:56 or 58-2D-34-12-34-56
+}
+_MAC_LENGTH = max(_OUI_LAYOUTS)
+# Positions of the hexadecimal digits of the OUI, by length of the string
+_OUI_POSITIONS = {
+    length: tuple(i for i, char in enumerate(layout) if char == "x")[:_OUI_NIBBLES]
+    for length, layout in _OUI_LAYOUTS.items()
+}
+# Class of each ASCII character in the layouts: a hexadecimal digit, a dot, a dash or
+# colon, or the zero that pads a shorter string. Other characters have class -1.
+_CHAR_CLASSES = np.full(128, -1, dtype=np.int8)
+_CHAR_CLASSES[_HEX_VALUES >= 0] = 0
+_CHAR_CLASSES[ord(".")] = 1
+_CHAR_CLASSES[[ord("-"), ord(":")]] = 2
+_CHAR_CLASSES[0] = 3
+# Classes of the characters of each layout, padded to the length of a MAC address
+_OUI_LAYOUT_CLASSES = {
+    length: ["x.-".index(char) for char in layout] + [3] * (_MAC_LENGTH - length)
+    for length, layout in _OUI_LAYOUTS.items()
+}
+# Positions of the hexadecimal digits of a UUID and the nibbles of the 128-bit UUID
+# they're copied to, by length of the string without 0x prefix
+_UUID_POSITIONS = {
+    4: (tuple(range(4)), tuple(range(4, 8))),  # 180F
+    8: (tuple(range(8)), tuple(range(8))),  # 0000180F
+    32: (tuple(range(32)), tuple(range(32))),  # 6E400001B5A3F393E0A9E50E24DCCA9E
+    36: (  # 6E400001-B5A3-F393-E0A9-E50E24DCCA9E
+        (*range(8), *range(9, 13), *range(14, 18), *range(19, 23), *range(24, 36)),
+        tuple(range(32)),
+    ),
+}
+_UUID_PREFIXED_LENGTHS = (6, 10)
+_BASE_UUID_NIBBLES = np.array(
+    [int(digit, 16) for digit in BASE_UUID.hex],
+    dtype=np.int8,
+)
+
+
+class _SortedKeys(NamedTuple):
+    """Named tuple to hold the sorted keys of a dictionary and their names.
+
+    Attributes:
+        keys (NDArray): The sorted keys, converted like the keys of a column.
+        ids (NDArray): The position in `names` of the name of each key.
+        names (list[str]): The distinct names in the dictionary.
+    """
+
+    keys: NDArray[Any]
+    ids: NDArray[np.int32]
+    names: list[str]
+
+
+def _sort_keys(keys: NDArray[Any], names: Iterable[str]) -> _SortedKeys:
+    """Sort the converted keys of a dictionary.
+
+    Args:
+        keys (NDArray): The converted keys of the dictionary.
+        names (Iterable[str]): The name of each key.
+
+    Returns:
+        _SortedKeys: The sorted keys and their names.
+    """
+    names = list(names)
+    distinct_names = list(dict.fromkeys(names))
+    name_ids = {name: position for position, name in enumerate(distinct_names)}
+    ids = np.array([name_ids[name] for name in names], dtype=np.int32)
+    order = np.argsort(keys, kind="stable")
+    return _SortedKeys(keys[order], ids[order], distinct_names)
+
+
+def _sorted_keys(
+    table: _NumberDict[Any],
+    convert: Callable[[Any], Any],
+    dtype: str,
+) -> _SortedKeys:
+    """Return the sorted keys of a dictionary, sorting them first if needed.
+
+    Args:
+        table (_NumberDict): The dictionary.
+        convert (Callable[[Any], Any]): Function that converts a key of the
+            dictionary like the keys of a column.
+        dtype (str): The NumPy data type of the converted keys.
+
+    Returns:
+        _SortedKeys: The sorted keys and their names.
+    """
+    return table._index(  # noqa: SLF001
+        f"sorted_keys_{dtype}",
+        lambda: _sort_keys(
+            np.array([convert(key) for key in table], dtype=dtype),
+            table.values(),
+        ),
+    )
+
+
+def _join(
+    sorted_keys: _SortedKeys,
+    keys: NDArray[Any],
+    valid: NDArray[Any],
+) -> NDArray[np.int32]:
+    """Join keys with the sorted keys of a dictionary.
+
+    Args:
+        sorted_keys (_SortedKeys): The sorted keys of the dictionary.
+        keys (NDArray): The keys to join.
+        valid (NDArray[Any]): Whether each key is valid.
+
+    Returns:
+        NDArray[np.int32]: The position of the name of each key in the names of the
+        dictionary, or -1 if the key isn't valid or isn't in the dictionary.
+    """
+    if not len(sorted_keys.keys):
+        return np.full(len(keys), -1, dtype=np.int32)
+    positions = np.searchsorted(sorted_keys.keys, keys)
+    positions[positions == len(sorted_keys.keys)] = 0
+    found = valid & (sorted_keys.keys[positions] == keys)
+    return np.where(found, sorted_keys.ids[positions], -1).astype(np.int32)
+
+
+def _to_numpy(column: Any) -> tuple[NDArray[Any], NDArray[Any]]:  # noqa: ANN401
+    """Convert a column to a NumPy array.
+
+    Args:
+        column (Any): A pyarrow ``Array`` or ``ChunkedArray``, a pandas ``Series``, a
+            Polars ``Series`` or a NumPy array, in which ``None`` is null.
+
+    Raises:
+        TypeError: If the column isn't of one of these types.
+
+    Returns:
+        tuple[NDArray, NDArray[Any]]: The values as integers, or as strings if
+        the column holds strings, and whether each value is null.
+    """
+    if isinstance(column, np.ndarray):
+        values = column
+        null = (
+            column == None  # noqa: E711
+            if column.dtype.kind == "O"
+            else np.zeros(len(column), dtype=np.bool_)
+        )
+    elif _library(column) == "pyarrow":
+        values = column.to_numpy(zero_copy_only=False)
+        null = column.is_null().to_numpy(zero_copy_only=False)
+    elif _library(column) == "pandas":
+        values, null = column.to_numpy(), column.isna().to_numpy()
+    elif _library(column) == "polars":
+        values, null = column.to_numpy(), column.is_null().to_numpy()
+    else:
+        msg = f"Unsupported column type: {type(column).__name__}"
+        raise TypeError(msg)
+
+    null = np.asarray(null, dtype=np.bool_)
+    if values.dtype.kind == "O":
+        first = next((value for value, empty in zip(values, null) if not empty), "")
+        values = np.where(null, 0 if isinstance(first, int) else "", values)
+        values = values.astype(np.int64 if isinstance(first, int) else np.str_)
+    elif values.dtype.kind == "f":
+        null = null | ~np.isfinite(values)
+        values = np.where(null, 0, values)
+        null = null | (values != np.floor(values))
+    if values.dtype.kind in "iuf":
+        values = values.astype(np.int64)
+    elif values.dtype.kind == "S":
+        values = values.astype(np.str_)
+    return values, null
+
+
+def _library(column: Any) -> str:  # noqa: ANN401
+    """Return the name of the library of a column.
+
+    Args:
+        column (Any): The column.
+
+    Returns:
+        str: The name of the top-level package that defines the type of `column`.
+    """
+    return type(column).__module__.split(".")[0]
+
+
+def _from_codes(column: Any, codes: NDArray[np.int32], names: list[str]) -> Any:  # noqa: ANN401
+    """Create a dictionary-encoded column of names.
+
+    Args:
+        column (Any): The column with the keys of the names.
+        codes (NDArray[np.int32]): The position of each name in `names`, or -1 for
+            null.
+        names (list[str]): The names.
+
+    Returns:
+        Any: A pyarrow ``DictionaryArray``, a pandas ``Series`` with a
+        ``Categorical``, a Polars ``Series`` of type ``Categorical`` or a NumPy
+        array of objects, depending on the type of `column`.
+    """
+    null = codes < 0
+    library = "numpy" if isinstance(column, np.ndarray) else _library(column)
+    if library == "pyarrow":
+        pa = importlib.import_module("pyarrow")
+        return pa.DictionaryArray.from_arrays(
+            pa.array(codes, mask=null, type=pa.int32()),
+            pa.array(names, type=pa.string()),
+        )
+    if library == "pandas":
+        pd = importlib.import_module("pandas")
+        return pd.Series(
+            pd.Categorical.from_codes(codes, categories=names),
+            index=column.index,
+            name=column.name,
+        )
+    if library == "polars":
+        pl = importlib.import_module("polars")
+        return pl.Series(column.name, names, dtype=pl.Categorical).gather(
+            pl.Series(codes).set(pl.Series(null), None),
+        )
+    return np.array([*names, None], dtype=object)[codes]
+
+
+def _hex_digits(
+    chars: NDArray[np.uint32],
+    positions: NDArray[np.intp],
+) -> tuple[NDArray[np.int8], NDArray[Any]]:
+    """Decode hexadecimal digits in strings.
+
+    Args:
+        chars (NDArray[np.uint32]): The code points of each string.
+        positions (NDArray[np.intp]): The positions of the digits in each string.
+
+    Returns:
+        tuple[NDArray[np.int8], NDArray[Any]]: The value of each digit, and
+        whether all digits of each string are valid.
+    """
+    code_points = np.take_along_axis(chars, positions, axis=1)
+    digits = _HEX_VALUES[np.minimum(code_points, len(_HEX_VALUES) - 1)]
+    digits[code_points >= len(_HEX_VALUES)] = -1
+    return digits, np.asarray((digits >= 0).all(axis=1))
+
+
+def _code_points(values: NDArray[np.str_], width: int) -> NDArray[np.uint32]:
+    """Return the code points of strings.
+
+    Args:
+        values (NDArray[np.str_]): The strings.
+        width (int): The minimum number of code points to return for each string.
+
+    Returns:
+        NDArray[np.uint32]: The code points of each string, padded with zeros.
+    """
+    width = max(width, values.dtype.itemsize // 4)
+    return values.astype(f"U{width}").view(np.uint32).reshape(len(values), width)
+
+
+def _oui_keys(values: NDArray[Any]) -> tuple[NDArray[np.int64], NDArray[Any]]:
+    """Convert OUIs or MAC addresses to 24-bit integers.
+
+    Args:
+        values (NDArray): The OUIs or MAC addresses as strings in the formats of
+            :func:`bluetooth_numbers.enrich.oui_names`, or the OUIs as integers.
+
+    Returns:
+        tuple[NDArray[np.int64], NDArray[Any]]: The OUIs as integers, and
+        whether each value is a valid OUI or MAC address.
+    """
+    if values.dtype.kind == "i":
+        return values, (values >= 0) & (values <= _UINT24_MAX)
+
+    lengths = np.char.str_len(values)
+    chars = _code_points(values, _MAC_LENGTH)
+    positions = np.zeros((len(values), _OUI_NIBBLES), dtype=np.intp)
+    # Strings of other lengths match no layout
+    layouts = np.full((len(values), _MAC_LENGTH), -2, dtype=np.int8)
+    for length, digit_positions in _OUI_POSITIONS.items():
+        rows = lengths == length
+        positions[rows] = digit_positions
+        layouts[rows] = _OUI_LAYOUT_CLASSES[length]
+    digits, _ = _hex_digits(chars, positions)
+    # Non-ASCII characters are clipped to DEL, which has class -1
+    classes = _CHAR_CLASSES[np.minimum(chars[:, :_MAC_LENGTH], len(_CHAR_CLASSES) - 1)]
+    valid = np.asarray((classes == layouts).all(axis=1))
+    shifts = np.arange(4 * (_OUI_NIBBLES - 1), -1, -4)
+    keys = (np.where(valid[:, None], digits, 0).astype(np.int64) << shifts).sum(axis=1)
+    return keys, valid
+
+
+def _uuid_keys(values: NDArray[Any]) -> tuple[NDArray[np.bytes_], NDArray[Any]]:
+    """Convert UUIDs to the 16 bytes of 128-bit UUIDs.
+
+    Args:
+        values (NDArray): The UUIDs as strings in the formats of
+            :func:`bluetooth_numbers.enrich.uuid_names`, or 16-bit UUIDs as
+            integers.
+
+    Returns:
+        tuple[NDArray[np.bytes_], NDArray[Any]]: The big-endian bytes of each
+        128-bit UUID, and whether each value is a valid UUID.
+    """
+    nibbles = np.tile(_BASE_UUID_NIBBLES, (len(values), 1))
+    if values.dtype.kind == "i":
+        valid = (values >= 0) & (values <= _UINT16_MAX)
+        for nibble in range(4):
+            nibbles[:, 4 + nibble] = values >> (4 * (3 - nibble)) & 0xF
+    else:
+        lengths = np.char.str_len(values)
+        chars = _code_points(values, max(_UUID_POSITIONS) + 2)
+        prefixed = (
+            (chars[:, 0] == ord("0"))
+            & ((chars[:, 1] == ord("x")) | (chars[:, 1] == ord("X")))
+            & np.isin(lengths, _UUID_PREFIXED_LENGTHS)
+        )
+        lengths = lengths - 2 * prefixed
+        valid = np.zeros(len(values), dtype=np.bool_)
+        for length, (digit_positions, nibble_positions) in _UUID_POSITIONS.items():
+            selected = lengths == length
+            if selected.all():
+                # Avoid copying the rows when all UUIDs have the same format
+                rows: Any = slice(None)
+            elif selected.any():
+                rows = np.flatnonzero(selected)
+            else:
+                continue
+            positions = np.array(digit_positions) + 2 * prefixed[rows, None]
+            digits, valid[rows] = _hex_digits(chars[rows], positions)
+            nibbles[rows, nibble_positions[0] : nibble_positions[-1] + 1] = digits
+
+    nibbles[~valid] = 0
+    nibbles = nibbles.astype(np.uint8)
+    uuid_bytes = nibbles[:, 0::2] << 4 | nibbles[:, 1::2]
+    return np.ascontiguousarray(uuid_bytes).view(f"S{_UUID_SIZE}").ravel(), valid
+
+
+def _oui_key(key: Hashable) -> int:
+    """Convert a key of an OUIDict to a 24-bit integer.
+
+    Args:
+        key (Hashable): The OUI.
+
+    Returns:
+        int: The OUI as an integer.
+    """
+    return int(str(key).replace(":", ""), 16)
+
+
+def _uuid_key(key: Hashable) -> bytes:
+    """Convert a key of a UUIDDict to the bytes of a 128-bit UUID.
+
+    Args:
+        key (Hashable): The UUID.
+
+    Returns:
+        bytes: The big-endian bytes of the 128-bit UUID.
+    """
+    if isinstance(key, UUID):
+        return key.bytes
+    uuid = cast(int, key)
+    if uuid < _UINT32_LIMIT:
+        uuid = BASE_UUID.int | uuid << _UUID16_SHIFT
+    return uuid.to_bytes(_UUID_SIZE, "big")
+
+
+def oui_names(column: Any, table: OUIDict = oui) -> Any:  # noqa: ANN401
+    """Return the vendor names of a column of OUIs or MAC addresses.
+
+    Args:
+        column (Any): The OUIs or MAC addresses as strings with 6 or 12 hexadecimal
+            digits, with or without ``:`` or ``-`` between the bytes or ``.``
+            between groups of 4 digits, or the OUIs as 24-bit integers.
+        table (OUIDict): The dictionary to look up the OUIs in.
+
+    Returns:
+        Any: The dictionary-encoded names, of the same library as `column`.
+    """
+    values, null = _to_numpy(column)
+    keys, valid = _oui_keys(values)
+    sorted_keys = _sorted_keys(table, _oui_key, "int64")
+    return _from_codes(
+        column,
+        _join(sorted_keys, keys, valid & ~null),
+        sorted_keys.names,
+    )
+
+
+def company_names(column: Any, table: CICDict = company) -> Any:  # noqa: ANN401
+    """Return the company names of a column of company IDs.
+
+    Args:
+        column (Any): The company IDs as integers.
+        table (CICDict): The dictionary to look up the company IDs in.
+
+    Returns:
+        Any: The dictionary-encoded names, of the same library as `column`.
+    """
+    values, null = _to_numpy(column)
+    valid = ~null
+    if values.dtype.kind != "i":
+        valid[:] = False
+        values = np.zeros(len(values), dtype=np.int64)
+    sorted_keys = _sorted_keys(table, int, "int64")
+    return _from_codes(column, _join(sorted_keys, values, valid), sorted_keys.names)
+
+
+def uuid_names(column: Any, table: UUIDDict = service) -> Any:  # noqa: ANN401
+    """Return the names of a column of UUIDs.
+
+    Args:
+        column (Any): The UUIDs as strings with 4 or 8 hexadecimal digits for 16-bit
+            or 32-bit UUIDs, with or without ``0x`` prefix, or with 32 hexadecimal
+            digits, with or without hyphens, for 128-bit UUIDs. 16-bit UUIDs can
+            also be integers.
+        table (UUIDDict): The dictionary to look up the UUIDs in, e.g.
+            :data:`~bluetooth_numbers.service` or
+            :data:`~bluetooth_numbers.characteristic`.
+
+    Returns:
+        Any: The dictionary-encoded names, of the same library as `column`.
+    """
+    values, null = _to_numpy(column)
+    keys, valid = _uuid_keys(values)
+    sorted_keys = _sorted_keys(table, _uuid_key, f"S{_UUID_SIZE}")
+    return _from_codes(
+        column,
+        _join(sorted_keys, keys, valid & ~null),
+        sorted_keys.names,
+    )
@@ -5,10 +5,22 @@ class BluetoothNumbersError(Exception):
     """Base class for all exceptions raised by this library."""
 
 
+class MalformedAdvertisingDataError(BluetoothNumbersError):
+    """Exception raised when advertising data doesn't consist of valid AD structures."""
+
+
+class MalformedBtsnoopError(BluetoothNumbersError):
+    """Exception raised when a file isn't a supported btsnoop file."""
+
+
 class No16BitIntegerError(BluetoothNumbersError):
     """Exception raised when an integer is not a 16-bit number."""
 
 
+class No32BitIntegerError(BluetoothNumbersError):
+    """Exception raised when an integer is not a 32-bit number."""
+
+
 class NonStandardUUIDError(BluetoothNumbersError):
     """Exception raised when a 128-bit UUID is not a standard Bluetooth UUID."""
 
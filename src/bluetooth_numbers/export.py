@@ -0,0 +1,268 @@
+"""Module to export the dictionaries to an SQLite database or Parquet files.
+
+The SQLite database has a table for each dictionary, with the same name:
+
+- ``company`` with the columns ``id`` (the company ID as an integer) and ``name``.
+- ``oui`` with the columns ``prefix`` (the OUI as a 24-bit integer), ``oui`` (the
+  OUI as a string like ``58:2D:34``) and ``name``.
+- ``service``, ``characteristic`` and ``descriptor`` with the columns ``uuid`` (the
+  128-bit UUID as a lowercase string with hyphens), ``uuid16`` (the 16-bit UUID as
+  an integer for standard Bluetooth UUIDs, otherwise null) and ``name``.
+
+The keys of each table are indexed, and so are the names. The FTS5 table
+``description`` indexes the words in all names for full-text search, like
+:class:`~bluetooth_numbers.reverse_lookup.ReverseLookup`. Its columns are ``name``,
+``uuid_type`` (the name of the table) and ``key`` (the key in that table):
+
+.. code-block:: sql
+
+    SELECT uuid_type, key, name FROM description WHERE description MATCH 'heart rate';
+
+The Parquet files have the same tables, without the ``description`` table, because
+DuckDB and other query engines have their own full-text search. Parquet files need
+pyarrow.
+
+Export the tables with::
+
+    python -m bluetooth_numbers.export --sqlite bluetooth_numbers.sqlite
+    python -m bluetooth_numbers.export --parquet bluetooth_numbers/
+"""
+from __future__ import annotations
+
+import argparse
+import importlib
+import sqlite3
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Tuple
+from uuid import UUID
+
+from bluetooth_numbers import characteristic, company, descriptor, oui, service
+from bluetooth_numbers.utils import BASE_UUID, is_uint16
+
+if TYPE_CHECKING:
+    from bluetooth_numbers.dicts import _NumberDict
+
+_UINT32_LIMIT = 1 << 32
+_UUID16_SHIFT = 96
+_UUID16_MASK = 0xFFFF << _UUID16_SHIFT
+
+_Row = Tuple[Any, ...]
+
+
+def company_rows(table: _NumberDict[Any] = company) -> Iterator[_Row]:
+    """Return the rows of the company table.
+
+    Args:
+        table (_NumberDict): The dictionary with company IDs.
+
+    Yields:
+        tuple[int, str]: The company ID and name, sorted by company ID.
+    """
+    yield from sorted(table.items())
+
+
+def oui_rows(table: _NumberDict[Any] = oui) -> Iterator[_Row]:
+    """Return the rows of the OUI table.
+
+    Args:
+        table (_NumberDict): The dictionary with OUIs.
+
+    Yields:
+        tuple[int, str, str]: The OUI as an integer and as a string, and the vendor
+        name, sorted by OUI.
+    """
+    yield from sorted(
+        (int(prefix.replace(":", ""), 16), prefix, name)
+        for prefix, name in table.items()
+    )
+
+
+def uuid_rows(table: _NumberDict[Any] = service) -> Iterator[_Row]:
+    """Return the rows of a UUID table.
+
+    Integer keys that aren't 16-bit UUIDs are skipped. If a UUID is in the
+    dictionary both as a 16-bit and a 128-bit key, only the first one is used.
+
+    Args:
+        table (_NumberDict): The dictionary with UUIDs.
+
+    Yields:
+        tuple[str, int | None, str]: The 128-bit UUID, the 16-bit UUID or ``None``
+        and the name, sorted by UUID.
+    """
+    rows: dict[str, _Row] = {}
+    for key, name in table.items():
+        if isinstance(key, UUID):
+            uuid = key
+        elif key >= _UINT32_LIMIT:
+            uuid = UUID(int=key)
+        elif is_uint16(key):
+            uuid = UUID(int=BASE_UUID.int | key << _UUID16_SHIFT)
+        else:
+            continue
+        uuid16 = None
+        if uuid.int & ~_UUID16_MASK == BASE_UUID.int:
+            uuid16 = uuid.int >> _UUID16_SHIFT
+        rows.setdefault(str(uuid), (str(uuid), uuid16, name))
+    yield from sorted(rows.values())
+
+
+# Rows, columns with their SQLite types, and indexed columns of each table
+TABLES: dict[
+    str,
+    tuple[Callable[[], Iterator[_Row]], dict[str, str], tuple[str, ...]],
+] = {
+    "company": (
+        company_rows,
+        {"id": "INTEGER PRIMARY KEY", "name": "TEXT NOT NULL"},
+        ("name",),
+    ),
+    "oui": (
+        oui_rows,
+        {
+            "prefix": "INTEGER PRIMARY KEY",
+            "oui": "TEXT NOT NULL",
+            "name": "TEXT NOT NULL",
+        },
+        ("name",),
+    ),
+    "service": (
+        lambda: uuid_rows(service),
+        {"uuid": "TEXT PRIMARY KEY", "uuid16": "INTEGER", "name": "TEXT NOT NULL"},
+        ("uuid16", "name"),
+    ),
+    "characteristic": (
+        lambda: uuid_rows(characteristic),
+        {"uuid": "TEXT PRIMARY KEY", "uuid16": "INTEGER", "name": "TEXT NOT NULL"},
+        ("uuid16", "name"),
+    ),
+    "descriptor": (
+        lambda: uuid_rows(descriptor),
+        {"uuid": "TEXT PRIMARY KEY", "uuid16": "INTEGER", "name": "TEXT NOT NULL"},
+        ("uuid16", "name"),
+    ),
+}
+
+
+def export_sqlite(path: str | Path) -> None:
+    """Export the dictionaries to an SQLite database.
+
+    The database is written to a temporary file first, which replaces the file at
+    `path` when it's complete.
+
+    Args:
+        path (str | Path): The file of the database.
+    """
+    path = Path(path)
+    temporary_path = path.with_name(f".{path.name}.tmp")
+    temporary_path.unlink(missing_ok=True)
+
+    connection = sqlite3.connect(temporary_path)
+    try:
+        # The database is only used if it's complete, so it doesn't need a journal
+        connection.execute("PRAGMA journal_mode = OFF")
+        connection.execute("PRAGMA synchronous = OFF")
+        with connection:
+            connection.execute(
+                "CREATE VIRTUAL TABLE description "
+                "USING fts5(name, uuid_type UNINDEXED, key UNINDEXED)",
+            )
+            for table_name, (rows, columns, indexed) in TABLES.items():
+                definitions = ", ".join(
+                    f"{column} {sql_type}" for column, sql_type in columns.items()
+                )
+                connection.execute(f"CREATE TABLE {table_name} ({definitions})")
+                table_rows = list(rows())
+                placeholders = ", ".join("?" * len(columns))
+                connection.executemany(
+                    f"INSERT INTO {table_name} VALUES ({placeholders})",  # noqa: S608
+                    table_rows,
+                )
+                for column in indexed:
+                    connection.execute(
+                        f"CREATE INDEX {table_name}_{column} "
+                        f"ON {table_name} ({column})",
+                    )
+                connection.executemany(
+                    "INSERT INTO description VALUES (?, ?, ?)",
+                    ((row[-1], table_name, row[0]) for row in table_rows),
+                )
+        connection.execute("VACUUM")
+    finally:
+        connection.close()
+    temporary_path.replace(path)
+
+
+def export_parquet(directory: str | Path) -> None:
+    """Export the dictionaries to Parquet files.
+
+    Every table is written to a file with the name of the table and the extension
+    ``.parquet`` in `directory`, which is created if needed.
+
+    Args:
+        directory (str | Path): The directory of the Parquet files.
+    """
+    pa = importlib.import_module("pyarrow")
+    pq = importlib.import_module("pyarrow.parquet")
+    types = {
+        "id": pa.uint16(),
+        "prefix": pa.uint32(),
+        "uuid16": pa.uint16(),
+    }
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    for table_name, (rows, columns, _) in TABLES.items():
+        columns_values = list(zip(*rows())) or [()] * len(columns)
+        arrow_table = pa.table(
+            {
+                column: pa.array(values, type=types.get(column, pa.string()))
+                for column, values in zip(columns, columns_values)
+            },
+        )
+        pq.write_table(arrow_table, directory / f"{table_name}.parquet")
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Export the tables to an SQLite database or Parquet files.",
+    )
+    parser.add_argument(
+        "--sqlite",
+        type=Path,
+        help="file of the SQLite database to write",
+    )
+    parser.add_argument(
+        "--parquet",
+        type=Path,
+        help="directory to write the Parquet files to",
+    )
+    parsed_args = parser.parse_args(args)
+    if not parsed_args.sqlite and not parsed_args.parquet:
+        parser.error("at least one of --sqlite and --parquet is required")
+    return parsed_args
+
+
+def main(args: list[str] | None = None) -> None:
+    """Export the tables.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+    """
+    parsed_args = parse_args(args)
+    if parsed_args.sqlite:
+        export_sqlite(parsed_args.sqlite)
+    if parsed_args.parquet:
+        export_parquet(parsed_args.parquet)
+
+
+if __name__ == "__main__":
+    main()
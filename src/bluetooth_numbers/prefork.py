@@ -0,0 +1,80 @@
+"""Module to prepare the package for preforking servers.
+
+Servers such as gunicorn and uWSGI load an application once in a master process and
+then fork the worker processes. The workers share the memory of the master until
+they write to it, after which the kernel copies the written pages for every worker.
+Anything the package builds lazily, like the indexes of the dictionaries and the
+index of :class:`~bluetooth_numbers.reverse_lookup.ReverseLookup`, is built again in
+every worker if it's first used after the fork.
+
+Call :func:`warmup` in the master before the fork, for instance at module level in
+the application, with ``preload_app = True`` for gunicorn or without ``lazy-apps``
+for uWSGI:
+
+.. code-block:: python
+
+    from bluetooth_numbers.prefork import warmup
+
+    reverse_lookup = warmup()
+
+This builds all indexes of the built-in dictionaries, loads the precomputed index
+of the reverse lookup and returns a
+:class:`~bluetooth_numbers.reverse_lookup.ReverseLookup` for the workers to share.
+Then it calls :func:`gc.freeze`, which moves all objects of the process into the
+permanent generation of the garbage collector. The collectors of the workers then
+don't visit these objects, because visiting them writes to their headers and so
+copies their pages. Python recommends to also call :func:`gc.disable` early in the
+master and :func:`gc.enable` in the workers, so the master doesn't free objects
+between the pages that are shared. Pass ``freeze=False`` to :func:`warmup` to call
+:func:`gc.freeze` yourself, right before the fork.
+
+Reference counting still writes to the objects the workers use, so the pages with
+the tables and indexes that workers look up are still copied over time. The caches
+of unnormalized OUIs and UUID strings aren't filled either, because they fill with
+the keys each worker sees, and are bounded by
+:data:`~bluetooth_numbers.utils.OUI_CACHE_SIZE` and
+:data:`~bluetooth_numbers.utils.UUID_CACHE_SIZE`.
+"""
+from __future__ import annotations
+
+import gc
+from typing import TYPE_CHECKING, Any
+
+from bluetooth_numbers import characteristic, company, descriptor, oui, service
+from bluetooth_numbers.reverse_lookup import ReverseLookup
+
+if TYPE_CHECKING:
+    from bluetooth_numbers.dicts import _NumberDict
+
+
+def warmup(*, freeze: bool = True) -> ReverseLookup:
+    """Build everything the package builds lazily, to share it with forked workers.
+
+    Args:
+        freeze (bool): Whether to call :func:`gc.freeze` afterwards, so the garbage
+            collectors of the workers don't visit the shared objects.
+
+    Returns:
+        ReverseLookup: A reverse lookup with its index loaded, to use in the
+        workers instead of creating one in each worker.
+
+    Example:
+        >>> from bluetooth_numbers.prefork import warmup
+        >>> reverse_lookup = warmup(freeze=False)
+        >>> len(reverse_lookup.lookup("Battery Service", logic="AND"))
+        1
+    """
+    tables: tuple[_NumberDict[Any], ...] = (
+        characteristic,
+        company,
+        descriptor,
+        oui,
+        service,
+    )
+    for table in tables:
+        table.build_indexes()
+    reverse_lookup = ReverseLookup()
+
+    if freeze:
+        gc.freeze()
+    return reverse_lookup
@@ -0,0 +1,229 @@
+"""Module with lookup functions specialized for the format of the keys.
+
+Looking up a key with ``table[key]`` handles every supported format of the key,
+and raises an exception for an unknown key, which is slow in a loop that sees many
+unknown keys. The factories in this module return a function that looks up a key
+in a table, with the table's storage and the parsing of the keys bound as local
+variables. It takes the shortest path for the formats of the keys you declare, and
+returns a default instead of raising an exception for unknown or invalid keys, like
+:meth:`~bluetooth_numbers.dicts._NumberDict.lookup_many`:
+
+.. code-block:: python
+
+    from bluetooth_numbers.resolvers import make_oui_resolver
+
+    vendor = make_oui_resolver(formats=["str"])
+    vendors = [vendor(address[:8]) for address in addresses]
+
+Keys in other formats than the declared ones are still resolved, only more slowly.
+A resolver binds the indexes of its table when it's created, so create it again
+after changing the table.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Collection, Optional
+from uuid import UUID
+
+from bluetooth_numbers import company, oui, service
+from bluetooth_numbers.dicts import CICDict, OUIDict, UUIDDict, _uuid_key
+from bluetooth_numbers.exceptions import No16BitIntegerError
+from bluetooth_numbers.utils import BASE_UUID, _parse_oui_cached, _parse_uuid_cached
+
+Resolver = Callable[[Any], Optional[str]]
+"""Function that returns the name of a key, or a default if it isn't found."""
+
+_UUID16_SHIFT = 96
+_UUID16_MASK = 0xFFFF << _UUID16_SHIFT
+_UINT32_LIMIT = 1 << 32
+
+
+def _specialized(
+    formats: Collection[str] | None,
+    resolvers: dict[str, Resolver],
+    resolve: Resolver,
+) -> Resolver:
+    """Return the resolver for the declared formats of the keys.
+
+    Args:
+        formats (Collection[str] | None): The declared formats.
+        resolvers (dict[str, Resolver]): The resolver specialized for each format.
+        resolve (Resolver): The resolver for keys in any format.
+
+    Raises:
+        ValueError: If a format isn't supported.
+
+    Returns:
+        Resolver: The specialized resolver if there's a single format, otherwise
+        `resolve`.
+    """
+    formats = set(formats or ())
+    unsupported = formats - set(resolvers)
+    if unsupported:
+        msg = f"Unsupported formats {sorted(unsupported)}, use one of {list(resolvers)}"
+        raise ValueError(msg)
+    if len(formats) == 1:
+        return resolvers[formats.pop()]
+    return resolve
+
+
+def make_company_resolver(
+    table: CICDict = company,
+    default: str | None = None,
+) -> Resolver:
+    """Return a function that looks up company IDs.
+
+    Args:
+        table (CICDict): The dictionary with company IDs.
+        default (str | None): The result for unknown or invalid company IDs.
+
+    Returns:
+        Resolver: A function that returns the name of a company ID, or `default`.
+
+    Example:
+        >>> from bluetooth_numbers.resolvers import make_company_resolver
+        >>> resolve = make_company_resolver()
+        >>> resolve(0x0499), resolve(-1)
+        ('Ruuvi Innovations Ltd.', None)
+    """
+    # The dict method itself is the shortest path, because company IDs are stored
+    # as they're looked up
+    get = table.get
+    if default is None:
+        return get
+
+    def resolve(key: Any) -> str | None:  # noqa: ANN401
+        return get(key, default)
+
+    return resolve
+
+
+def make_oui_resolver(
+    table: OUIDict = oui,
+    formats: Collection[str] | None = None,
+    default: str | None = None,
+) -> Resolver:
+    """Return a function that looks up OUIs.
+
+    Args:
+        table (OUIDict): The dictionary with OUIs.
+        formats (Collection[str] | None): The formats of the OUIs to look up:
+            "normalized" for strings like "58:2D:34", "str" for strings in any
+            supported format and "int" for 24-bit integers. If it's a single
+            format, the function is specialized for it.
+        default (str | None): The result for unknown or invalid OUIs.
+
+    Raises:
+        ValueError: If a format isn't supported.
+
+    Returns:
+        Resolver: A function that returns the vendor name of an OUI, or `default`.
+
+    Example:
+        >>> from bluetooth_numbers.resolvers import make_oui_resolver
+        >>> resolve = make_oui_resolver(formats=["str"])
+        >>> resolve("58-2d-34"), resolve("FOOBAR")
+        ('Qingping Electronics (Suzhou) Co., Ltd', None)
+    """
+    get = table.get
+    parse = _parse_oui_cached
+    get_vendor_id = table._int_index().get  # noqa: SLF001
+    vendors = table.vendors
+
+    def resolve(key: Any) -> str | None:  # noqa: ANN401
+        name = get(key)
+        if name is not None:
+            return name
+        if isinstance(key, str):
+            return get(parse(key), default)  # type: ignore[arg-type]
+        if isinstance(key, int):
+            vendor_id = get_vendor_id(key)
+            if vendor_id is not None:
+                return vendors[vendor_id]
+        return default
+
+    def resolve_str(key: Any) -> str | None:  # noqa: ANN401
+        if isinstance(key, str):
+            return get(parse(key), default)  # type: ignore[arg-type]
+        return resolve(key)
+
+    def resolve_int(key: Any) -> str | None:  # noqa: ANN401
+        vendor_id = get_vendor_id(key)
+        if vendor_id is not None:
+            return vendors[vendor_id]
+        return default if isinstance(key, int) else resolve(key)
+
+    return _specialized(
+        formats,
+        # Normalized OUIs are stored as they're looked up, which resolve() tries first
+        {"normalized": resolve, "str": resolve_str, "int": resolve_int},
+        resolve,
+    )
+
+
+def make_uuid_resolver(
+    table: UUIDDict = service,
+    formats: Collection[str] | None = None,
+    default: str | None = None,
+) -> Resolver:
+    """Return a function that looks up UUIDs.
+
+    Args:
+        table (UUIDDict): The dictionary with UUIDs, such as ``service``,
+            ``characteristic`` or ``descriptor``.
+        formats (Collection[str] | None): The formats of the UUIDs to look up:
+            "int" for integers, "uuid" for :class:`~uuid.UUID` objects and "str"
+            for strings. If it's a single format, the function is specialized for
+            it.
+        default (str | None): The result for unknown or invalid UUIDs.
+
+    Raises:
+        ValueError: If a format isn't supported.
+
+    Returns:
+        Resolver: A function that returns the name of a UUID, or `default`.
+
+    Example:
+        >>> from uuid import UUID
+        >>> from bluetooth_numbers.resolvers import make_uuid_resolver
+        >>> resolve = make_uuid_resolver(formats=["uuid"])
+        >>> resolve(UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"))
+        'Nordic UART Service'
+    """
+    # The UUIDDict methods convert UUID objects first, so bind the dict method
+    get: Callable[..., str | None] = dict.get.__get__(table)
+    parse = _parse_uuid_cached
+    base = BASE_UUID.int
+    mask = ~_UUID16_MASK
+
+    def resolve(key: Any) -> str | None:  # noqa: ANN401
+        try:
+            return get(_uuid_key(key), default)
+        except No16BitIntegerError:
+            return default
+
+    def resolve_int(key: Any) -> str | None:  # noqa: ANN401
+        name = get(key)
+        return resolve(key) if name is None else name
+
+    def resolve_uuid(key: Any) -> str | None:  # noqa: ANN401
+        if not isinstance(key, UUID):
+            return resolve(key)
+        number = key.int
+        if number & mask == base:
+            number >>= _UUID16_SHIFT
+        elif number < _UINT32_LIMIT:
+            # Not a key, its integer would be the same as a 16-bit or 32-bit UUID
+            return default
+        return get(number, default)
+
+    def resolve_str(key: Any) -> str | None:  # noqa: ANN401
+        if not isinstance(key, str):
+            return resolve(key)
+        number = parse(key)
+        return default if number is None else get(number, default)
+
+    return _specialized(
+        formats,
+        {"int": resolve_int, "uuid": resolve_uuid, "str": resolve_str},
+        resolve,
+    )
@@ -1,12 +1,29 @@
 """Reverse lookup class to find UUIDs by their description."""
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Literal, NamedTuple, Sequence
+from array import array
+from bisect import bisect_left
+from typing import (
+    TYPE_CHECKING,
+    AbstractSet,
+    Any,
+    Iterable,
+    Iterator,
+    Literal,
+    Mapping,
+    NamedTuple,
+    Sequence,
+)
 
 if TYPE_CHECKING:
+    from concurrent.futures import Executor
     from uuid import UUID
 
+    from bluetooth_numbers.dicts import _NumberDict
+
 from bluetooth_numbers import characteristic, company, descriptor, oui, service
+from bluetooth_numbers.dicts import _builtin_name, _uuid_key
+from bluetooth_numbers.exceptions import No16BitIntegerError
 
 LOGIC = Literal["OR", "AND", "SUBSTR"]
 UUID_TYPE_DEFAULT: Sequence[str] = (
@@ -16,6 +33,8 @@ UUID_TYPE_DEFAULT: Sequence[str] = (
     "oui",
     "service",
 )
+# The UUID types of the UUIDDicts, whose UUIDs have several formats
+_UUID_DICT_TYPES = ("characteristic", "descriptor", "service")
 
 
 class Match(NamedTuple):
@@ -26,6 +45,125 @@ class Match(NamedTuple):
     uuid_type: str
 
 
+def index_terms(descriptions: Iterable[str]) -> dict[str, list[int]]:
+    """Build an index of the terms in descriptions.
+
+    Args:
+        descriptions (Iterable[str]): The descriptions to index.
+
+    Returns:
+        dict[str, list[int]]: A dict with the lowercase terms as keys and the positions
+        of the descriptions they appear in as values.
+
+    Example:
+        >>> from bluetooth_numbers.reverse_lookup import index_terms
+        >>> index_terms(["Cycling Power", "Cycling Power Feature"])
+        {'cycling': [0, 1], 'power': [0, 1], 'feature': [1]}
+    """
+    index: dict[str, list[int]] = {}
+    for position, description in enumerate(descriptions):
+        for term in dict.fromkeys(description.lower().split(" ")):
+            if term not in index:
+                index[term] = []
+            index[term].append(position)
+    return index
+
+
+def _comparable_uuid(uuid: object, uuid_type: object) -> object:
+    """Convert the UUID of a match to the integer it's stored as, if it's a UUID.
+
+    Args:
+        uuid (object): The UUID, company ID or OUI of the match.
+        uuid_type (object): The UUID type of the match.
+
+    Raises:
+        No16BitIntegerError: If `uuid` isn't a UUID in a supported format.
+
+    Returns:
+        object: The UUID as an integer for the UUID types of UUIDDicts, otherwise
+        `uuid` itself.
+    """
+    if uuid_type in _UUID_DICT_TYPES:
+        return _uuid_key(uuid)
+    return uuid
+
+
+class Matches(AbstractSet[Match]):
+    """Set of the matches of a reverse lookup, stored as positions in its index.
+
+    The matches are only created as :class:`Match` named tuples when they're
+    iterated over, so a large result takes 4 bytes per match until then. It's a
+    read-only set: operators like ``&`` and ``|`` return a regular set.
+    """
+
+    __slots__ = ("_lookup", "_positions")
+
+    def __init__(self, lookup: ReverseLookup, positions: Iterable[int]) -> None:
+        """Initialize the set.
+
+        Args:
+            lookup (ReverseLookup): The reverse lookup that found the matches.
+            positions (Iterable[int]): The positions of the matches in its index.
+        """
+        self._lookup = lookup
+        self._positions = array("I", sorted(positions))
+
+    @classmethod
+    def _from_iterable(cls: type[Matches], iterable: Iterable[Match]) -> set[Match]:
+        return set(iterable)
+
+    def __len__(self) -> int:
+        """Return the number of matches."""
+        return len(self._positions)
+
+    def __iter__(self) -> Iterator[Match]:
+        """Iterate over the matches, in the order of the index."""
+        match = self._lookup._match  # noqa: SLF001
+        for position in self._positions:
+            yield match(position)
+
+    def __contains__(self, match: object) -> bool:
+        """Check for a match, by looking up the first term of its description.
+
+        The UUID of a service, characteristic or descriptor matches in any format
+        of :class:`~bluetooth_numbers.dicts.UUIDDict` keys, such as a
+        :class:`~uuid.UUID` or an integer.
+        """
+        if not isinstance(match, tuple) or len(match) != len(Match._fields):
+            return False
+        uuid, description, uuid_type = match
+        if not isinstance(description, str):
+            return False
+        try:
+            uuid = _comparable_uuid(uuid, uuid_type)
+        except No16BitIntegerError:
+            return False
+        lookup = self._lookup
+        positions = self._positions
+        for position in lookup.index.get(description.lower().split(" ")[0], ()):
+            found = bisect_left(positions, position)
+            if found == len(positions) or positions[found] != position:
+                continue
+            candidate = lookup._match(position)  # noqa: SLF001
+            if (
+                candidate.description == description
+                and candidate.uuid_type == uuid_type
+                and _comparable_uuid(candidate.uuid, uuid_type) == uuid
+            ):
+                return True
+        return False
+
+    def __eq__(self, other: object) -> bool:
+        """Check whether another set has the same matches."""
+        return super().__eq__(other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return the matches like a set."""
+        return repr(set(self))
+
+
 class ReverseLookup:
     """Reverse lookup class to find UUIDs by their description.
 
@@ -46,17 +184,12 @@ class ReverseLookup:
     """
 
     def __init__(self) -> None:
-        """Initialize the ReverseLookup class, build index."""
-        self.index = self._build_index()
-
-    def _build_index(self) -> dict[str, set[Match]]:
-        """Build dictionary (index) of terms to UUIDs.
-
-        Returns:
-            dict: dict[str, set[Match]] .
-        """
-        reverse_lookup: dict[str, set[Match]] = {}
-        uuid_dicts = (
+        """Initialize the ReverseLookup class, load or build index."""
+        self._uuids: list[str | UUID | int] = []
+        self._descriptions: list[str] = []
+        # The position of each UUID type in UUID_TYPE_DEFAULT
+        self._uuid_types = array("B")
+        uuid_dicts: tuple[tuple[_NumberDict[Any], str], ...] = (
             (characteristic, "characteristic"),
             (company, "company"),
             (descriptor, "descriptor"),
@@ -64,19 +197,93 @@ class ReverseLookup:
             (service, "service"),
         )
         for uuid_dict, uuid_type in uuid_dicts:
-            for uuid, description in uuid_dict.items():  # type: ignore[attr-defined]
-                for term in description.lower().split(" "):
-                    if term not in reverse_lookup:
-                        reverse_lookup[term] = set()
-                    reverse_lookup[term].add(Match(uuid, description, uuid_type))
-        return reverse_lookup
+            self._uuids.extend(uuid_dict)
+            self._descriptions.extend(uuid_dict.values())
+            self._uuid_types.extend(
+                [UUID_TYPE_DEFAULT.index(uuid_type)] * len(uuid_dict),
+            )
+
+        if all(
+            _builtin_name(uuid_dict) == uuid_type for uuid_dict, uuid_type in uuid_dicts
+        ):
+            from bluetooth_numbers._terms import TERMS
+
+            self.index: Mapping[str, Sequence[int]] = TERMS
+        else:
+            self.index = self._build_index()
+
+    @classmethod
+    async def create(
+        cls: type[ReverseLookup],
+        executor: Executor | None = None,
+    ) -> ReverseLookup:
+        """Create a ReverseLookup object without blocking the event loop.
+
+        Loading or building the index takes a while, so this is done in an executor.
+
+        Args:
+            executor (Executor | None): The executor to create the object in, or
+                ``None`` for the default executor of the event loop.
+
+        Returns:
+            ReverseLookup: The new ReverseLookup object.
+        """
+        # Only import asyncio when it's needed, because it's slow to import
+        import asyncio
+
+        return await asyncio.get_running_loop().run_in_executor(executor, cls)
+
+    def _build_index(self) -> Mapping[str, Sequence[int]]:
+        """Build dictionary (index) of terms to positions of descriptions.
+
+        This is only needed if the built-in dictionaries have been changed, otherwise
+        the precomputed index is used.
+
+        Returns:
+            Mapping: Mapping[str, Sequence[int]] .
+        """
+        return index_terms(self._descriptions)
+
+    def _match(self, position: int) -> Match:
+        """Return the match of a description.
+
+        Args:
+            position (int): The position of the description in the index.
+
+        Returns:
+            Match: The UUID, description and UUID type of the description.
+        """
+        return Match(
+            self._uuids[position],
+            self._descriptions[position],
+            UUID_TYPE_DEFAULT[self._uuid_types[position]],
+        )
+
+    def _positions(self, term: str, type_codes: set[int]) -> Iterable[int]:
+        """Return the positions of the descriptions with a term.
+
+        Args:
+            term: The lowercase term to search for.
+            type_codes: The positions in UUID_TYPE_DEFAULT of the UUID types to
+                search in.
+
+        Returns:
+            Iterable[int]: The positions of the descriptions with the term.
+        """
+        positions = self.index.get(term, ())
+        if len(type_codes) == len(UUID_TYPE_DEFAULT):
+            return positions
+        uuid_types = self._uuid_types
+        return [
+            position for position in positions if uuid_types[position] in type_codes
+        ]
 
     def lookup(
         self,
         terms: str,
         uuid_types: Sequence[str] = UUID_TYPE_DEFAULT,
         logic: LOGIC = "OR",
-    ) -> set[Match]:
+    ) -> Matches:
         """Return the UUIDs for a given term(s).
 
         Args:
@@ -85,37 +292,39 @@ class ReverseLookup:
             logic: Search logic to use. Can be "OR", "AND" or "SUBSTR".
 
         Returns:
-            set: set[Match]: Set of Match named tuples.
+            Matches: Set of Match named tuples.
         """
         terms_set: set[str] = set(terms.lower().split(" "))
-        results: set[Match] = set()
+        type_codes = {
+            code
+            for code, uuid_type in enumerate(UUID_TYPE_DEFAULT)
+            if uuid_type in uuid_types
+        }
+        descriptions = self._descriptions
+        positions: set[int] = set()
         if logic == "OR":
             """For every term in the string add the UUIDs to the results set."""
             for term in terms_set:
-                results.update(
-                    m for m in self.index.get(term, set()) if m.uuid_type in uuid_types
-                )
+                positions.update(self._positions(term, type_codes))
         elif logic == "AND":
             """Every term in the terms string must be in the description."""
             for term in terms_set:
-                term_matches = {
-                    m
-                    for m in self.index.get(term, set())
-                    if terms_set.issubset(m for m in m.description.lower().split(" "))
-                    and m.uuid_type in uuid_types
+                term_positions = {
+                    position
+                    for position in self._positions(term, type_codes)
+                    if terms_set.issubset(descriptions[position].lower().split(" "))
                 }
-                if not results:
-                    results.update(term_matches)
+                if not positions:
+                    positions.update(term_positions)
                 else:
-                    results.intersection_update(term_matches)
+                    positions.intersection_update(term_positions)
         elif logic == "SUBSTR":
             """The description must match the a substring of the description."""
             lower_term_str = terms.lower()
             for term in terms_set:
-                results.update(
-                    m
-                    for m in self.index.get(term, set())
-                    if lower_term_str in m.description.lower()
-                    and m.uuid_type in uuid_types
+                positions.update(
+                    position
+                    for position in self._positions(term, type_codes)
+                    if lower_term_str in descriptions[position].lower()
                 )
-        return results
+        return Matches(self, positions)
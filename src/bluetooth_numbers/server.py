@@ -0,0 +1,439 @@
+r"""Lookup server that answers batched requests over a Unix socket or HTTP.
+
+The server loads the dictionaries and the index of
+:class:`~bluetooth_numbers.reverse_lookup.ReverseLookup` once, so other processes,
+in any language, can look up numbers without loading them. Start it with::
+
+    $ python -m bluetooth_numbers.server --unix /run/bluetooth-numbers.sock
+    $ python -m bluetooth_numbers.server --http 127.0.0.1:8080
+
+Both use a JSON lines protocol: every request is a JSON object on its own line, and
+the server answers every request with a JSON object on its own line, in the same
+order. A request looks up a batch of keys in one table, with the keys in the formats
+of the ``bluetooth-numbers`` command:
+
+>>> from bluetooth_numbers.server import LookupServer
+>>> server = LookupServer()
+>>> server.handle_line(b'{"id": 1, "table": "company", "keys": ["0x0499", "FFFE"]}')
+b'{"id":1,"results":["Ruuvi Innovations Ltd.",null]}\n'
+
+The table ``search`` searches the descriptions for each key, with the optional
+``types`` and ``logic`` of the search, and returns the type, UUID and description
+of each match:
+
+>>> server.handle_line(b'{"table": "search", "keys": ["heart rate"], '
+...     b'"types": ["service"]}')
+b'{"results":[[["service","0x180D","Heart Rate"]]]}\n'
+
+A request that the server can't handle, or with more than ``MAX_BATCH_SIZE`` keys,
+gets a response with an ``error`` message instead of ``results``.
+
+Over a Unix socket, a client writes its requests to the socket and reads the
+responses from it. Over HTTP, a client posts one or more request lines to any path
+and gets the response lines in the body of the response. Connections are kept
+alive, and the server handles all connections concurrently with asyncio. The
+requests are answered in an executor, so a large batch doesn't block the event loop.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from contextlib import suppress
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from bluetooth_numbers.advertising import _resolve
+from bluetooth_numbers.cli import LOOKUPS, _format_uuid
+from bluetooth_numbers.reverse_lookup import UUID_TYPE_DEFAULT, ReverseLookup
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+# Maximum size of a request line, or of the body of an HTTP request
+MAX_REQUEST_SIZE = 1024 * 1024
+# Maximum number of keys in a request
+MAX_BATCH_SIZE = 10_000
+SEARCH = "search"
+LOGICS = ("AND", "OR", "SUBSTR")
+
+_HTTP_STATUS = {
+    200: "OK",
+    400: "Bad Request",
+    405: "Method Not Allowed",
+    413: "Payload Too Large",
+}
+_HTTP_REQUEST_LINE_PARTS = 3
+
+_logger = logging.getLogger(__name__)
+
+
+def _keys(request: dict[str, Any]) -> list[Any]:
+    """Return the keys of a request.
+
+    Args:
+        request (dict[str, Any]): The request.
+
+    Raises:
+        TypeError: If the keys aren't a list.
+        ValueError: If there are more than ``MAX_BATCH_SIZE`` keys.
+
+    Returns:
+        list[Any]: The keys.
+    """
+    keys = request["keys"]
+    if not isinstance(keys, list):
+        msg = f"keys should be a list: {keys!r}"
+        raise TypeError(msg)
+    if len(keys) > MAX_BATCH_SIZE:
+        msg = f"Too many keys: {len(keys)}, the maximum is {MAX_BATCH_SIZE}"
+        raise ValueError(msg)
+    return keys
+
+
+class LookupServer:
+    """Server that answers batched lookup requests.
+
+    Attributes:
+        reverse_lookup (ReverseLookup): The reverse lookup that answers searches.
+        executor (Executor | None): The executor that answers the requests of the
+            connections, or ``None`` for the default executor of the event loop.
+    """
+
+    def __init__(
+        self,
+        reverse_lookup: ReverseLookup | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        """Initialize the server and load the index of the reverse lookup.
+
+        Args:
+            reverse_lookup (ReverseLookup | None): The reverse lookup to answer
+                searches with, for instance the one of
+                :func:`bluetooth_numbers.prefork.warmup`, or ``None`` to create one.
+            executor (Executor | None): The executor to answer the requests of the
+                connections in, or ``None`` for the default executor of the event
+                loop.
+        """
+        self.reverse_lookup = reverse_lookup or ReverseLookup()
+        self.executor = executor
+
+    def _search(
+        self,
+        request: dict[str, Any],
+        queries: list[Any],
+    ) -> list[list[list[str]]]:
+        """Answer a search request.
+
+        Args:
+            request (dict[str, Any]): The request.
+            queries (list[Any]): The keys of the request.
+
+        Raises:
+            ValueError: If the types or logic of the search are invalid.
+
+        Returns:
+            list[list[list[str]]]: The type, UUID and description of the matches of
+            each key, sorted by type and description.
+        """
+        uuid_types = tuple(request.get("types", UUID_TYPE_DEFAULT))
+        logic = request.get("logic", "AND")
+        if logic not in LOGICS or not set(uuid_types) <= set(UUID_TYPE_DEFAULT):
+            msg = f"Invalid search types or logic: {uuid_types}, {logic}"
+            raise ValueError(msg)
+
+        results = []
+        for query in queries:
+            matches = self.reverse_lookup.lookup(str(query), uuid_types, logic)
+            results.append(
+                [
+                    [match.uuid_type, _format_uuid(match.uuid), match.description]
+                    for match in sorted(
+                        matches,
+                        key=lambda match: (match.uuid_type, match.description),
+                    )
+                ],
+            )
+        return results
+
+    def handle(self, request: Any) -> dict[str, Any]:  # noqa: ANN401
+        """Answer a request.
+
+        Args:
+            request (Any): The decoded JSON request.
+
+        Returns:
+            dict[str, Any]: The response, with the ``id`` of the request if it has
+            one.
+        """
+        response: dict[str, Any] = {}
+        try:
+            if "id" in request:
+                response["id"] = request["id"]
+            table_name, keys = request["table"], _keys(request)
+            if table_name == SEARCH:
+                response["results"] = self._search(request, keys)
+            else:
+                table, parse = LOOKUPS[table_name]
+                response["results"] = [_resolve(table, key, parse) for key in keys]
+        except (KeyError, TypeError, ValueError) as error:
+            response["error"] = f"Invalid request: {error!r}"
+        return response
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Answer a request line.
+
+        Args:
+            line (bytes): The JSON request, with or without line ending.
+
+        Returns:
+            bytes: The JSON response with a line ending.
+        """
+        try:
+            response = self.handle(json.loads(line))
+        except ValueError as error:
+            response = {"error": f"Invalid JSON: {error}"}
+        return json.dumps(response, separators=(",", ":")).encode() + b"\n"
+
+    async def handle_line_async(self, line: bytes) -> bytes:
+        """Answer a request line in the executor, without blocking the event loop.
+
+        Args:
+            line (bytes): The JSON request, with or without line ending.
+
+        Returns:
+            bytes: The JSON response with a line ending.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.handle_line, line)
+
+    async def serve_lines(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer the request lines of a connection.
+
+        Args:
+            reader (asyncio.StreamReader): The reader of the connection.
+            writer (asyncio.StreamWriter): The writer of the connection.
+        """
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                if line.strip():
+                    writer.write(await self.handle_line_async(line))
+                    await writer.drain()
+        except (ConnectionError, ValueError):
+            # ValueError means that a line is longer than MAX_REQUEST_SIZE
+            pass
+        finally:
+            writer.close()
+
+    async def serve_http(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> None:
+        """Answer the HTTP requests of a connection.
+
+        Args:
+            reader (asyncio.StreamReader): The reader of the connection.
+            writer (asyncio.StreamWriter): The writer of the connection.
+        """
+        try:
+            while await self._serve_http_request(reader, writer):
+                pass
+        except (ConnectionError, ValueError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _serve_http_request(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ) -> bool:
+        """Answer an HTTP request.
+
+        Args:
+            reader (asyncio.StreamReader): The reader of the connection.
+            writer (asyncio.StreamWriter): The writer of the connection.
+
+        Returns:
+            bool: True if the connection is kept alive for another request.
+        """
+        request_line = (await reader.readline()).decode("latin-1").split()
+        if not request_line:
+            return False
+
+        headers = {}
+        while True:
+            header = (await reader.readline()).decode("latin-1")
+            if not header.strip():
+                break
+            name, _, value = header.partition(":")
+            headers[name.strip().lower()] = value.strip().lower()
+
+        content_length = headers.get("content-length", "0")
+        # int() also accepts signs, underscores, whitespace and non-ASCII digits
+        length = (
+            int(content_length)
+            if content_length.isascii() and content_length.isdigit()
+            else -1
+        )
+        if len(request_line) != _HTTP_REQUEST_LINE_PARTS or length < 0:
+            status = 400
+        elif length > MAX_REQUEST_SIZE:
+            status = 413
+        elif request_line[0] != "POST":
+            status = 405
+        else:
+            status = 200
+
+        keep_alive = status in (200, 405) and (
+            headers.get("connection") == "keep-alive"
+            if request_line[-1] == "HTTP/1.0"
+            else headers.get("connection") != "close"
+        )
+        body = b""
+        if status == 200:  # noqa: PLR2004
+            body = b"".join(
+                [
+                    await self.handle_line_async(line)
+                    for line in (await reader.readexactly(length)).splitlines()
+                    if line.strip()
+                ],
+            )
+        elif status == 405:  # noqa: PLR2004
+            await reader.readexactly(length)
+
+        writer.write(
+            f"HTTP/1.1 {status} {_HTTP_STATUS[status]}\r\n"
+            "Content-Type: application/x-ndjson\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n"
+            "\r\n".encode("latin-1")
+            + body,
+        )
+        await writer.drain()
+        return keep_alive
+
+    async def start_unix(self, path: str | Path) -> asyncio.AbstractServer:
+        """Start serving request lines on a Unix domain socket.
+
+        Args:
+            path (str | Path): The path of the socket.
+
+        Returns:
+            asyncio.AbstractServer: The server, which is serving.
+        """
+        return await asyncio.start_unix_server(
+            self.serve_lines,
+            path,
+            limit=MAX_REQUEST_SIZE,
+        )
+
+    async def start_http(self, host: str, port: int) -> asyncio.AbstractServer:
+        """Start serving HTTP requests on a TCP port.
+
+        Args:
+            host (str): The host to listen on.
+            port (int): The port to listen on, or 0 for a free port.
+
+        Returns:
+            asyncio.AbstractServer: The server, which is serving.
+        """
+        return await asyncio.start_server(
+            self.serve_http,
+            host,
+            port,
+            limit=MAX_REQUEST_SIZE,
+        )
+
+
+def _parse_address(address: str) -> tuple[str, int]:
+    """Parse an HTTP address.
+
+    Args:
+        address (str): The address as ``HOST:PORT`` or ``PORT``.
+
+    Returns:
+        tuple[str, int]: The host, by default 127.0.0.1, and the port.
+    """
+    host, _, port = address.rpartition(":")
+    return host or "127.0.0.1", int(port)
+
+
+def parse_args(args: list[str] | None) -> argparse.Namespace:
+    """Parse command line parameters.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+
+    Returns:
+        argparse.Namespace: Command line parameters namespace.
+    """
+    parser = argparse.ArgumentParser(
+        description="Answer batched lookup requests over a Unix socket or HTTP.",
+    )
+    parser.add_argument(
+        "-u",
+        "--unix",
+        type=Path,
+        help="path of the Unix domain socket to listen on",
+    )
+    parser.add_argument(
+        "--http",
+        type=_parse_address,
+        metavar="[HOST:]PORT",
+        help="address to listen on for HTTP requests (default host: 127.0.0.1)",
+    )
+    parsed_args = parser.parse_args(args)
+    if not parsed_args.unix and not parsed_args.http:
+        parser.error("at least one of --unix and --http is required")
+    return parsed_args
+
+
+async def serve(unix: Path | None, http: tuple[str, int] | None) -> None:
+    """Serve lookup requests until cancelled.
+
+    Args:
+        unix (Path | None): The path of the Unix domain socket to listen on.
+        http (tuple[str, int] | None): The host and port to listen on for HTTP.
+    """
+    lookup_server = LookupServer()
+    servers = []
+    if unix:
+        servers.append(await lookup_server.start_unix(unix))
+        _logger.info("Listening on %s", unix)
+    if http:
+        servers.append(await lookup_server.start_http(*http))
+        _logger.info("Listening on http://%s:%d", *http)
+    try:
+        await asyncio.gather(*(server.serve_forever() for server in servers))
+    finally:
+        for server in servers:
+            server.close()
+        if unix:
+            with suppress(FileNotFoundError):
+                unix.unlink()
+
+
+def main(args: list[str] | None = None) -> None:
+    """Run the lookup server.
+
+    Args:
+        args (list[str] | None): Command line parameters as list of strings.
+    """
+    parsed_args = parse_args(args)
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    with suppress(KeyboardInterrupt):
+        asyncio.run(serve(parsed_args.unix, parsed_args.http))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,666 @@
+"""Module to share dictionaries between processes in shared memory.
+
+Passing a dictionary to the workers of a :class:`multiprocessing.pool.Pool` pickles
+it and unpickles it in every worker, which is slow for a dictionary like ``oui``
+with tens of thousands of entries. Instead, :func:`share` writes a dictionary once
+to :mod:`multiprocessing.shared_memory` in a compact binary format, and the workers
+:func:`attach` to it by its name. Attaching doesn't read the dictionary: the
+workers look keys up in the shared memory itself, with the same keys and exceptions
+as :class:`~bluetooth_numbers.dicts.CICDict`,
+:class:`~bluetooth_numbers.dicts.OUIDict` or
+:class:`~bluetooth_numbers.dicts.UUIDDict`:
+
+.. code-block:: python
+
+    from multiprocessing import Pool
+
+    from bluetooth_numbers import oui
+    from bluetooth_numbers.shared import attach, share
+
+    def init_worker(name):
+        global shared_oui
+        shared_oui = attach(name)
+
+    def vendor(address):
+        return shared_oui.get(address[:8])
+
+    with share(oui) as shared_oui, Pool(
+        initializer=init_worker,
+        initargs=(shared_oui.name,),
+    ) as pool:
+        vendors = pool.map(vendor, addresses)
+
+A shared dictionary is also pickled as the name of its shared memory, so it can be
+passed to the workers directly too, at the cost of attaching for every task.
+
+The process that shares a dictionary owns the shared memory: leaving the ``with``
+block, or calling :meth:`~_SharedNumberDict.close` and
+:meth:`~_SharedNumberDict.unlink`, frees it. Before Python 3.13, the resource
+tracker of a process that attaches to shared memory of an unrelated process frees it
+when that process exits, so only attach from processes started by the owner, such
+as the workers of its pool.
+
+The binary format has a header with the number of entries, followed by the sorted
+keys below 2**32 as unsigned 32-bit integers, the sorted 128-bit UUIDs as two
+arrays of unsigned 64-bit integers, the name ID of every key, and the distinct
+names as UTF-8. A lookup is a binary search in these arrays, and only decodes the
+name it finds. All integers are in the native byte order, because shared memory
+doesn't leave the machine.
+"""
+from __future__ import annotations
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from multiprocessing import shared_memory
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Mapping,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from types import TracebackType
+    from uuid import UUID
+
+from bluetooth_numbers.dicts import (
+    CICDict,
+    OUIDict,
+    UUIDDict,
+    _int_key,
+    _NumberDict,
+    _stored_items,
+    _uuid_key,
+    _uuid_object,
+)
+from bluetooth_numbers.exceptions import (
+    BluetoothNumbersError,
+    No16BitIntegerError,
+    UnknownCICError,
+    UnknownOUIError,
+    UnknownUUIDError,
+    WrongOUIFormatError,
+)
+from bluetooth_numbers.utils import _parse_oui, _parse_oui_cached, is_uint16
+
+_K = TypeVar("_K")
+_S = TypeVar("_S", bound="_SharedNumberDict[Any]")
+
+# Magic bytes, kind of dictionary, number of keys below 2**32, number of 128-bit
+# keys, number of names and size of the names in bytes
+_HEADER = struct.Struct("=4sIIIII")
+_MAGIC = b"BTN\x01"
+_CIC, _OUI, _UUID = range(3)
+_UINT32 = "I"
+_UINT64 = "Q"
+_UINT24_MAX = 0xFFFFFF
+_UINT32_LIMIT = 1 << 32
+_UINT64_MASK = (1 << 64) - 1
+# The bytes of OUIs as hexadecimal digits
+_HEX_BYTES = tuple(f"{byte:02X}" for byte in range(256))
+_ALIGNMENT = 8
+
+
+def _sections(
+    small: int,
+    large: int,
+    names: int,
+    names_size: int,
+) -> list[tuple[int, int]]:
+    """Return the offset and size of each section of a shared dictionary.
+
+    Every section starts at a multiple of 8 bytes, so it can be cast to an array.
+
+    Args:
+        small (int): The number of keys below 2**32.
+        large (int): The number of 128-bit keys.
+        names (int): The number of distinct names.
+        names_size (int): The size of the names in bytes.
+
+    Returns:
+        list[tuple[int, int]]: The offset and size in bytes of the small keys and
+        their name IDs, the high and low halves of the large keys and their name
+        IDs, the offsets of the names and the names.
+    """
+    uint32_size = struct.calcsize(_UINT32)
+    uint64_size = struct.calcsize(_UINT64)
+    sizes = (
+        small * uint32_size,
+        small * uint32_size,
+        large * uint64_size,
+        large * uint64_size,
+        large * uint32_size,
+        (names + 1) * uint32_size,
+        names_size,
+    )
+    sections = []
+    offset = _HEADER.size
+    for size in sizes:
+        offset = -(-offset // _ALIGNMENT) * _ALIGNMENT
+        sections.append((offset, size))
+        offset += size
+    return sections
+
+
+def _oui_key(prefix: str | int) -> int:
+    """Convert a key of an OUIDict to the 24-bit integer it's stored as.
+
+    Args:
+        prefix (str | int): The OUI in one of the formats an OUIDict supports.
+
+    Raises:
+        WrongOUIFormatError: If `prefix` doesn't have one of these formats.
+
+    Returns:
+        int: The OUI as an integer.
+    """
+    if isinstance(prefix, int):
+        if 0 <= prefix <= _UINT24_MAX:
+            return prefix
+        raise WrongOUIFormatError(prefix)
+    normalized = _parse_oui(prefix)
+    if normalized is None:
+        raise WrongOUIFormatError(prefix)
+    return int(normalized.replace(":", ""), 16)
+
+
+def pack(table: _NumberDict[Any]) -> bytes:
+    """Convert a dictionary to the binary format of a shared dictionary.
+
+    Args:
+        table (_NumberDict): The CICDict, OUIDict or UUIDDict to convert.
+
+    Raises:
+        TypeError: If `table` isn't a CICDict, OUIDict or UUIDDict.
+        WrongOUIFormatError: If a key of an OUIDict isn't an OUI in one of the
+          formats an OUIDict supports.
+
+    Returns:
+        bytes: The dictionary in the binary format.
+    """
+    if isinstance(table, UUIDDict):
+        kind = _UUID
+        items = sorted(_stored_items(table))
+    elif isinstance(table, OUIDict):
+        kind = _OUI
+        items = sorted(
+            {_oui_key(prefix): name for prefix, name in table.items()}.items(),
+        )
+    elif isinstance(table, CICDict):
+        kind = _CIC
+        items = sorted(table.items())
+    else:
+        msg = f"Can't share a {type(table).__name__}"
+        raise TypeError(msg)
+
+    name_ids: dict[str, int] = {}
+    for _, name in items:
+        name_ids.setdefault(name, len(name_ids))
+    encoded_names = [name.encode() for name in name_ids]
+    name_offsets = [0]
+    for encoded_name in encoded_names:
+        name_offsets.append(name_offsets[-1] + len(encoded_name))
+    small = [(key, name_ids[name]) for key, name in items if key < _UINT32_LIMIT]
+    large = [(key, name_ids[name]) for key, name in items if key >= _UINT32_LIMIT]
+
+    sections = _sections(len(small), len(large), len(name_ids), name_offsets[-1])
+    data = bytearray(sections[-1][0] + sections[-1][1])
+    _HEADER.pack_into(
+        data,
+        0,
+        _MAGIC,
+        kind,
+        len(small),
+        len(large),
+        len(name_ids),
+        name_offsets[-1],
+    )
+    contents = (
+        array(_UINT32, [key for key, _ in small]).tobytes(),
+        array(_UINT32, [name_id for _, name_id in small]).tobytes(),
+        array(_UINT64, [key >> 64 for key, _ in large]).tobytes(),
+        array(_UINT64, [key & _UINT64_MASK for key, _ in large]).tobytes(),
+        array(_UINT32, [name_id for _, name_id in large]).tobytes(),
+        array(_UINT32, name_offsets).tobytes(),
+        b"".join(encoded_names),
+    )
+    for (offset, size), content in zip(sections, contents):
+        data[offset : offset + size] = content
+    return bytes(data)
+
+
+def unpack(data: bytes | bytearray | memoryview) -> _NumberDict[Any]:
+    """Convert the binary format of a shared dictionary to a regular dictionary.
+
+    Args:
+        data (bytes | bytearray | memoryview): The dictionary in the binary format,
+            as created by :func:`pack`.
+
+    Raises:
+        ValueError: If `data` doesn't hold a shared dictionary.
+
+    Returns:
+        _NumberDict: A CICDict, OUIDict or UUIDDict with the same contents, with
+        its keys in sorted order.
+    """
+    magic, kind = _HEADER.unpack_from(data)[:2]
+    if magic != _MAGIC or kind not in _TYPES:
+        msg = "The data doesn't hold a shared dictionary"
+        raise ValueError(msg)
+    shared = _TYPES[kind](data)
+    try:
+        return shared.to_dict()
+    finally:
+        shared.close()
+
+
+class _SharedNumberDict(Mapping[_K, str]):
+    """Base class for the read-only dictionaries in a buffer of the binary format.
+
+    A shared dictionary has the lookups of its regular counterpart, and the
+    read-only methods of a dict. Its keys are iterated in sorted order.
+    """
+
+    _kind: ClassVar[int]
+    # The class of the regular dictionary
+    _dict_type: ClassVar[type[_NumberDict[Any]]]
+    _memory: shared_memory.SharedMemory | None = None
+    _owner = False
+
+    def __init__(self, buffer: bytes | bytearray | memoryview) -> None:
+        """Initialize the dictionary on a buffer, without copying it.
+
+        Args:
+            buffer (bytes | bytearray | memoryview): The dictionary in the binary
+                format, as created by :func:`pack`.
+
+        Raises:
+            ValueError: If `buffer` doesn't hold a dictionary of this class.
+        """
+        self._view = memoryview(buffer)
+        magic, kind, small, large, names, names_size = _HEADER.unpack_from(
+            self._view,
+        )
+        if magic != _MAGIC or kind != self._kind:
+            msg = f"The buffer doesn't hold a {type(self).__name__}"
+            raise ValueError(msg)
+        sections = [
+            self._view[offset : offset + size]
+            for offset, size in _sections(small, large, names, names_size)
+        ]
+        self._small_keys = sections[0].cast(_UINT32)
+        self._small_names = sections[1].cast(_UINT32)
+        self._large_high = sections[2].cast(_UINT64)
+        self._large_low = sections[3].cast(_UINT64)
+        self._large_names = sections[4].cast(_UINT32)
+        self._name_offsets = sections[5].cast(_UINT32)
+        self._names = sections[6]
+
+    @property
+    def name(self) -> str | None:
+        """The name of the shared memory, or ``None`` if it's not in shared memory."""
+        return None if self._memory is None else self._memory.name
+
+    def _find(self, key: int) -> str | None:
+        """Return the name of a key as it's stored.
+
+        Args:
+            key (int): The key as an integer.
+
+        Returns:
+            str | None: The name of `key`, or ``None`` if it isn't in the dictionary.
+        """
+        if key < _UINT32_LIMIT:
+            keys = self._small_keys
+            position = bisect_left(keys, key)
+            if position == len(keys) or keys[position] != key:
+                return None
+            name_id = self._small_names[position]
+        else:
+            # 128-bit keys are sorted by their high half, and then by their low half
+            high = key >> 64
+            start = bisect_left(self._large_high, high)
+            end = bisect_right(self._large_high, high, start)
+            low = key & _UINT64_MASK
+            position = bisect_left(self._large_low, low, start, end)
+            if position == end or self._large_low[position] != low:
+                return None
+            name_id = self._large_names[position]
+
+        offsets = self._name_offsets
+        return str(self._names[offsets[name_id] : offsets[name_id + 1]], "utf-8")
+
+    def _stored_key(self, key: object) -> int | None:
+        """Convert a key to an integer if the regular dictionary would store it.
+
+        Args:
+            key (object): The key.
+
+        Returns:
+            int | None: The key as an integer, or ``None`` if it's not in the format
+            of the keys of the regular dictionary.
+        """
+        return key if isinstance(key, int) and key >= 0 else None
+
+    def _key(self, key: int) -> Any:  # noqa: ANN401
+        """Convert an integer to a key as the regular dictionary iterates over it.
+
+        Args:
+            key (int): The key as an integer.
+
+        Returns:
+            Any: The key.
+        """
+        return key
+
+    def __len__(self) -> int:
+        """Return the number of keys."""
+        return len(self._small_keys) + len(self._large_high)
+
+    def __iter__(self) -> Iterator[_K]:
+        """Iterate over the keys in sorted order."""
+        for key in self._small_keys:
+            yield self._key(key)
+        for high, low in zip(self._large_high, self._large_low):
+            yield self._key(high << 64 | low)
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a key in the format of the keys of the regular dictionary."""
+        stored_key = self._stored_key(key)
+        return stored_key is not None and self._find(stored_key) is not None
+
+    def get(self, key: Any, default: Any = None) -> Any:  # noqa: ANN401
+        """Get the name of a key like a dict, without converting its format."""
+        stored_key = self._stored_key(key)
+        name = None if stored_key is None else self._find(stored_key)
+        return default if name is None else name
+
+    def lookup_many(
+        self,
+        keys: Iterable[Any],
+        default: str | None = None,
+    ) -> list[str | None]:
+        """Look up many keys at once, like the regular dictionary.
+
+        Args:
+            keys (Iterable[Any]): The keys to look up.
+            default (str | None): The result for unknown or invalid keys.
+
+        Returns:
+            list[str | None]: The name of each key, or `default` if the key is
+            unknown or invalid.
+        """
+        results: list[str | None] = []
+        for key in keys:
+            try:
+                results.append(self[key])
+            except BluetoothNumbersError:  # noqa: PERF203
+                results.append(default)
+        return results
+
+    def to_dict(self) -> _NumberDict[Any]:
+        """Copy the dictionary to a regular dictionary.
+
+        Returns:
+            _NumberDict: A CICDict, OUIDict or UUIDDict with the same contents,
+            with its keys in sorted order.
+        """
+        keys, name_ids, names = self._columns()
+        return self._dict_type(zip(keys, map(names.__getitem__, name_ids)))
+
+    def _columns(self) -> tuple[list[Any], list[int], list[str]]:
+        """Return the contents of the dictionary as lists.
+
+        Returns:
+            tuple[list, list[int], list[str]]: The keys as the regular dictionary
+            stores them, the name ID of every key and the names.
+        """
+        names_data = self._names.tobytes()
+        offsets = self._name_offsets.tolist()
+        names = [
+            names_data[start:end].decode() for start, end in zip(offsets, offsets[1:])
+        ]
+        keys = self._small_keys.tolist()
+        keys += [
+            high << 64 | low
+            for high, low in zip(self._large_high.tolist(), self._large_low.tolist())
+        ]
+        return keys, self._small_names.tolist() + self._large_names.tolist(), names
+
+    def close(self) -> None:
+        """Stop using the buffer, and close the shared memory if it's attached."""
+        for view in (
+            self._small_keys,
+            self._small_names,
+            self._large_high,
+            self._large_low,
+            self._large_names,
+            self._name_offsets,
+            self._names,
+            self._view,
+        ):
+            view.release()
+        if self._memory is not None:
+            self._memory.close()
+
+    def unlink(self) -> None:
+        """Free the shared memory, after all processes have closed it."""
+        if self._memory is not None:
+            self._memory.unlink()
+
+    def __enter__(self: _S) -> _S:  # noqa: PYI019
+        """Return the dictionary itself."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the dictionary, and free the shared memory if it was shared here."""
+        self.close()
+        if self._owner:
+            self.unlink()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the dictionary as the name of its shared memory, or as its data."""
+        if self._memory is not None:
+            return attach, (self._memory.name,)
+        return type(self), (self._view.tobytes(),)
+
+
+class SharedCICDict(_SharedNumberDict[int]):
+    """Read-only :class:`~bluetooth_numbers.dicts.CICDict` in a shared buffer.
+
+    Example:
+        >>> from bluetooth_numbers import company
+        >>> from bluetooth_numbers.shared import SharedCICDict, pack
+        >>> shared_company = SharedCICDict(pack(company))
+        >>> shared_company[0x0499]
+        'Ruuvi Innovations Ltd.'
+    """
+
+    _kind = _CIC
+    _dict_type = CICDict
+
+    def __getitem__(self, key: int) -> str:
+        """Return the name of a company ID, like a CICDict."""
+        if not is_uint16(key):
+            raise No16BitIntegerError(key)
+        name = self._find(key)
+        if name is None:
+            raise UnknownCICError(key)
+        return name
+
+
+class SharedOUIDict(_SharedNumberDict[str]):
+    """Read-only :class:`~bluetooth_numbers.dicts.OUIDict` in a shared buffer.
+
+    Example:
+        >>> from bluetooth_numbers import oui
+        >>> from bluetooth_numbers.shared import SharedOUIDict, pack
+        >>> shared_oui = SharedOUIDict(pack(oui))
+        >>> shared_oui["58-2d-34"]
+        'Qingping Electronics (Suzhou) Co., Ltd'
+    """
+
+    _kind = _OUI
+    _dict_type = OUIDict
+
+    def to_dict(self) -> OUIDict:
+        """Copy the dictionary to a regular OUIDict.
+
+        Returns:
+            OUIDict: An OUIDict with the same contents, with its OUIs in sorted
+            order.
+        """
+        keys, name_ids, names = self._columns()
+        return OUIDict.from_vendors(names, map(self._key, keys), name_ids)
+
+    def __getitem__(self, key: str | int) -> str:
+        """Return the name of an OUI in one of the formats an OUIDict supports."""
+        if isinstance(key, int):
+            if not 0 <= key <= _UINT24_MAX:
+                raise WrongOUIFormatError(key)
+            prefix = key
+        else:
+            normalized = _parse_oui_cached(key)
+            if normalized is None:
+                raise WrongOUIFormatError(key)
+            prefix = int(normalized.replace(":", ""), 16)
+            # Raise the exception with the normalized OUI, as an OUIDict does
+            key = normalized
+        name = self._find(prefix)
+        if name is None:
+            raise UnknownOUIError(key)
+        return name
+
+    def _stored_key(self, key: object) -> int | None:
+        if isinstance(key, str) and _parse_oui_cached(key) == key:
+            return int(key.replace(":", ""), 16)
+        return None
+
+    def _key(self, key: int) -> str:
+        return (
+            f"{_HEX_BYTES[key >> 16]}:{_HEX_BYTES[key >> 8 & 0xFF]}"
+            f":{_HEX_BYTES[key & 0xFF]}"
+        )
+
+
+class SharedUUIDDict(_SharedNumberDict[int]):
+    """Read-only :class:`~bluetooth_numbers.dicts.UUIDDict` in a shared buffer.
+
+    Example:
+        >>> from bluetooth_numbers import service
+        >>> from bluetooth_numbers.shared import SharedUUIDDict, pack
+        >>> shared_service = SharedUUIDDict(pack(service))
+        >>> shared_service["6e400001-b5a3-f393-e0a9-e50e24dcca9e"]
+        'Nordic UART Service'
+    """
+
+    _kind = _UUID
+    _dict_type = UUIDDict
+
+    def __getitem__(self, key: UUID | int | str | bytes | memoryview) -> str:
+        """Return the name of a UUID in one of the formats a UUIDDict supports."""
+        name = self._lookup(key)
+        if name is None:
+            raise UnknownUUIDError(key)
+        return name
+
+    def __contains__(self, key: object) -> bool:
+        """Check for a UUID in one of the formats a UUIDDict supports."""
+        try:
+            return self._lookup(key) is not None
+        except No16BitIntegerError:
+            return False
+
+    def get(self, key: Any, default: Any = None) -> Any:  # noqa: ANN401
+        """Get the name of a UUID in one of the formats a UUIDDict supports."""
+        try:
+            name = self._lookup(key)
+        except No16BitIntegerError:
+            return default
+        return default if name is None else name
+
+    def _lookup(self, key: Any) -> str | None:  # noqa: ANN401
+        """Return the name of a UUID, first as it's stored, then converted.
+
+        Args:
+            key (Any): The UUID in one of the formats a UUIDDict supports.
+
+        Raises:
+            No16BitIntegerError: If ``key`` isn't a 16-bit unsigned integer or a
+              128-bit UUID.
+
+        Returns:
+            str | None: The name of ``key``, or ``None`` if it's unknown.
+        """
+        stored_key = self._stored_key(_int_key(key))
+        if stored_key is not None:
+            name = self._find(stored_key)
+            if name is not None:
+                return name
+        return self._find(_uuid_key(key))
+
+    def _key(self, key: int) -> UUID | int:
+        return _uuid_object(key)
+
+
+SharedDict = Union[SharedCICDict, SharedOUIDict, SharedUUIDDict]
+_TYPES: dict[int, type[SharedDict]] = {
+    _CIC: SharedCICDict,
+    _OUI: SharedOUIDict,
+    _UUID: SharedUUIDDict,
+}
+
+
+def share(table: _NumberDict[Any], name: str | None = None) -> SharedDict:
+    """Write a dictionary to new shared memory.
+
+    Args:
+        table (_NumberDict): The CICDict, OUIDict or UUIDDict to share.
+        name (str | None): The name of the shared memory, or ``None`` for a random
+            name.
+
+    Returns:
+        SharedDict: The shared dictionary, which owns the shared memory.
+    """
+    data = pack(table)
+    memory = shared_memory.SharedMemory(name, create=True, size=len(data))
+    memory.buf[: len(data)] = data
+    shared = _TYPES[_HEADER.unpack_from(data)[1]](memory.buf)
+    shared._memory = memory  # noqa: SLF001
+    shared._owner = True  # noqa: SLF001
+    return shared
+
+
+def attach(name: str) -> SharedDict:
+    """Attach to a dictionary in shared memory.
+
+    Args:
+        name (str): The name of the shared memory.
+
+    Raises:
+        ValueError: If the shared memory doesn't hold a shared dictionary.
+
+    Returns:
+        SharedDict: The shared dictionary.
+    """
+    options = {"track": False} if sys.version_info >= (3, 13) else {}
+    memory = shared_memory.SharedMemory(name, **options)
+    magic, kind = _HEADER.unpack_from(memory.buf)[:2]
+    if magic != _MAGIC or kind not in _TYPES:
+        memory.close()
+        msg = f"The shared memory {name} doesn't hold a shared dictionary"
+        raise ValueError(msg)
+    shared = _TYPES[kind](memory.buf)
+    shared._memory = memory  # noqa: SLF001
+    return shared
@@ -0,0 +1,461 @@
+"""Module to collect statistics about lookups in the dictionaries.
+
+Statistics are disabled by default. Enabling them for a dictionary or a
+:class:`~bluetooth_numbers.reverse_lookup.ReverseLookup` object counts its hits and
+misses, tracks its most frequent unknown keys and records the latency of its lookups.
+The statistics can be exported as a plain dict for a metrics system:
+
+>>> from bluetooth_numbers import company
+>>> from bluetooth_numbers.stats import disable_stats, enable_stats
+>>> stats = enable_stats(company)
+>>> company[0x0499]
+'Ruuvi Innovations Ltd.'
+>>> 0xFFFE in company, company.get(0xFFFE)
+(False, None)
+>>> company[0xFFFE]
+Traceback (most recent call last):
+bluetooth_numbers.exceptions.UnknownCICError: 65534
+>>> stats.hits, stats.misses, stats.unknown.top()
+(1, 1, [(65534, 1)])
+>>> stats.as_dict()["unknown"]
+[{'key': '0xFFFE', 'count': 1, 'error': 0}]
+>>> disable_stats(company)
+
+Only lookups with ``table[key]`` and calls of
+:meth:`~bluetooth_numbers.reverse_lookup.ReverseLookup.lookup` are counted. When
+statistics are disabled, the object has its original class again, so lookups don't
+have any overhead.
+"""
+from __future__ import annotations
+
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Hashable, TypeVar, Union, cast
+
+from bluetooth_numbers.dicts import (
+    OUIDict,
+    UUIDDict,
+    _NumberDict,
+    _uuid_key,
+    _uuid_object,
+)
+from bluetooth_numbers.exceptions import BluetoothNumbersError
+from bluetooth_numbers.reverse_lookup import ReverseLookup
+from bluetooth_numbers.utils import _parse_oui_cached
+
+if TYPE_CHECKING:
+    from bluetooth_numbers.reverse_lookup import Matches
+
+DEFAULT_CAPACITY = 100
+LATENCY_BUCKETS = 32
+
+_Instrumentable = Union[_NumberDict[Any], ReverseLookup]
+_D = TypeVar("_D", bound=_NumberDict[Any])
+
+# Instrumented subclasses by original class
+_instrumented_classes: dict[type, type] = {}
+
+
+class SpaceSaving:
+    """Top-N counter for a stream of keys with the Space-Saving algorithm.
+
+    At most `capacity` keys are counted. If a new key arrives when all counters are
+    in use, the key with the lowest count is replaced by the new key, which takes
+    over its count. That count is then the maximum overestimation (error) of the
+    new key's count. Keys that appear more often than the total count divided by
+    the capacity are guaranteed to be counted.
+
+    The keys are kept in buckets by their count (a stream summary), so counting a
+    key takes constant time, also when a key is replaced.
+
+    Example:
+        >>> from bluetooth_numbers.stats import SpaceSaving
+        >>> unknown = SpaceSaving(capacity=2)
+        >>> for key in (1, 1, 2, 3, 1):
+        ...     unknown.add(key)
+        >>> unknown.top(1)
+        [(1, 3)]
+        >>> unknown.top()
+        [(1, 3), (3, 2)]
+        >>> unknown.error(3)
+        1
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize the counter.
+
+        Args:
+            capacity (int): The maximum number of keys to count.
+
+        Raises:
+            ValueError: If `capacity` isn't a positive number.
+        """
+        if capacity < 1:
+            msg = f"capacity should be positive: {capacity}"
+            raise ValueError(msg)
+
+        self.capacity = capacity
+        self._counts: dict[Hashable, int] = {}
+        self._errors: dict[Hashable, int] = {}
+        # The keys with each count, as dicts to keep them in insertion order
+        self._buckets: dict[int, dict[Hashable, None]] = {}
+        self._min_count = 0
+
+    def add(self, key: Hashable) -> None:
+        """Count a key.
+
+        Args:
+            key (Hashable): The key to count.
+        """
+        counts = self._counts
+        buckets = self._buckets
+        count = counts.get(key)
+        if count is None:
+            if len(counts) < self.capacity:
+                counts[key] = 1
+                self._errors[key] = 0
+                buckets.setdefault(1, {})[key] = None
+                self._min_count = 1
+                return
+            # Replace the most recently counted key with the lowest count
+            count = self._min_count
+            evicted, _ = buckets[count].popitem()
+            del counts[evicted]
+            del self._errors[evicted]
+            self._errors[key] = count
+        else:
+            del buckets[count][key]
+
+        if not buckets[count]:
+            del buckets[count]
+            if count == self._min_count:
+                self._min_count = count + 1
+        counts[key] = count + 1
+        buckets.setdefault(count + 1, {})[key] = None
+
+    def top(self, n: int | None = None) -> list[tuple[Hashable, int]]:
+        """Return the most frequent keys.
+
+        Args:
+            n (int | None): The number of keys to return, or None to return all
+                counted keys.
+
+        Returns:
+            list[tuple[Hashable, int]]: The keys and their estimated counts, from the
+            highest to the lowest count.
+        """
+        items = sorted(self._counts.items(), key=lambda item: item[1], reverse=True)
+        return items[:n]
+
+    def error(self, key: Hashable) -> int:
+        """Return the maximum overestimation of the count of a key.
+
+        Args:
+            key (Hashable): A counted key.
+
+        Returns:
+            int: The maximum overestimation of the count of `key`.
+        """
+        return self._errors[key]
+
+    def clear(self) -> None:
+        """Forget all counted keys."""
+        self._counts.clear()
+        self._errors.clear()
+        self._buckets.clear()
+        self._min_count = 0
+
+
+class LatencyHistogram:
+    """Histogram of latencies with buckets of powers of two nanoseconds.
+
+    Bucket ``i`` counts latencies ``t`` with ``2**(i - 1) <= t < 2**i`` ns, bucket 0
+    counts latencies below 1 ns and the last bucket counts all latencies that don't
+    fit in the other buckets.
+
+    Example:
+        >>> from bluetooth_numbers.stats import LatencyHistogram
+        >>> latency = LatencyHistogram()
+        >>> for ns in (90, 100, 3000):
+        ...     latency.add(ns)
+        >>> latency.as_dict()
+        {'count': 3, 'sum_ns': 3190, 'buckets': {'128': 2, '4096': 1}}
+    """
+
+    def __init__(self, buckets: int = LATENCY_BUCKETS) -> None:
+        """Initialize the histogram.
+
+        Args:
+            buckets (int): The number of buckets.
+        """
+        self.counts = [0] * buckets
+        self.sum_ns = 0
+
+    def add(self, ns: int) -> None:
+        """Record a latency.
+
+        Args:
+            ns (int): The latency in nanoseconds.
+        """
+        self.counts[min(ns.bit_length(), len(self.counts) - 1)] += 1
+        self.sum_ns += ns
+
+    @property
+    def count(self) -> int:
+        """int: The number of recorded latencies."""
+        return sum(self.counts)
+
+    def clear(self) -> None:
+        """Forget all recorded latencies."""
+        self.counts = [0] * len(self.counts)
+        self.sum_ns = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Export the histogram.
+
+        Returns:
+            dict[str, Any]: The number and sum of the latencies, and the count of
+            each non-empty bucket by its exclusive upper bound in nanoseconds. The
+            upper bound of the last bucket is "+Inf".
+        """
+        last = len(self.counts) - 1
+        return {
+            "count": self.count,
+            "sum_ns": self.sum_ns,
+            "buckets": {
+                "+Inf" if bucket == last else str(1 << bucket): count
+                for bucket, count in enumerate(self.counts)
+                if count
+            },
+        }
+
+
+class LookupStats:
+    """Statistics about the lookups in a dictionary or reverse lookup.
+
+    Attributes:
+        hits (int): The number of successful lookups.
+        misses (int): The number of failed lookups.
+        unknown (SpaceSaving): The most frequent keys of failed lookups.
+        latency (LatencyHistogram): The latency of all lookups.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY) -> None:
+        """Initialize the statistics.
+
+        Args:
+            capacity (int): The maximum number of unknown keys to count.
+        """
+        self.hits = 0
+        self.misses = 0
+        self.unknown = SpaceSaving(capacity)
+        self.latency = LatencyHistogram()
+
+    def clear(self) -> None:
+        """Reset the statistics."""
+        self.hits = 0
+        self.misses = 0
+        self.unknown.clear()
+        self.latency.clear()
+
+    def as_dict(self, top: int | None = None) -> dict[str, Any]:
+        """Export the statistics.
+
+        Args:
+            top (int | None): The number of unknown keys to export, or None to
+                export all counted keys.
+
+        Returns:
+            dict[str, Any]: The statistics, with only strings, numbers, lists and
+            dicts, so they can be serialized as JSON.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "unknown": [
+                {
+                    "key": _format_key(key),
+                    "count": count,
+                    "error": self.unknown.error(key),
+                }
+                for key, count in self.unknown.top(top)
+            ],
+            "latency": self.latency.as_dict(),
+        }
+
+
+def _format_key(key: Hashable) -> str:
+    """Format a key for export.
+
+    Args:
+        key (Hashable): The key.
+
+    Returns:
+        str: Integers in hexadecimal notation, other keys as a string.
+    """
+    if isinstance(key, int):
+        return f"0x{key:04X}" if key >= 0 else str(key)
+    return str(key)
+
+
+def _unknown_key(table: _NumberDict[Any], key: Any) -> Hashable:  # noqa: ANN401
+    """Normalize an unknown key, so all its formats are counted as one key.
+
+    Args:
+        table (_NumberDict): The dictionary the key was looked up in.
+        key (Any): The unknown key.
+
+    Returns:
+        Hashable: A UUID as its 16-bit integer or 128-bit UUID, an OUI as a
+        normalized OUI and a memoryview as bytes, so the counter doesn't keep
+        its buffer alive. Other keys and invalid UUIDs and OUIs are returned
+        unchanged.
+    """
+    if isinstance(table, UUIDDict):
+        try:
+            return _uuid_object(_uuid_key(key))
+        except BluetoothNumbersError:
+            pass
+    elif isinstance(table, OUIDict) and isinstance(key, str):
+        return _parse_oui_cached(key) or key
+    if isinstance(key, memoryview):
+        return bytes(key)
+    return cast(Hashable, key)
+
+
+def _original_class(obj: _Instrumentable) -> type:
+    """Return the class an instrumented object had before enabling statistics.
+
+    Args:
+        obj (_NumberDict | ReverseLookup): The instrumented object.
+
+    Returns:
+        type: The original class of `obj`.
+    """
+    return type(obj).__bases__[1]
+
+
+class _InstrumentedDict(_NumberDict[Any]):
+    """Mixin that records the statistics of lookups in a dictionary.
+
+    Copies and pickles of the dictionary have its original class, without
+    statistics, because the instrumented class can't be imported.
+    """
+
+    _stats: LookupStats
+
+    def __copy__(self: _D) -> _D:  # noqa: PYI019
+        table = super().__copy__()
+        # A read-only dictionary is its own copy, and keeps its statistics
+        if table is not self:
+            table.__class__ = _original_class(self)
+        return table
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        reduced = super().__reduce__()
+        if reduced[0] is type(self):
+            return (_original_class(self), *reduced[1:])
+        return reduced
+
+    def __getitem__(self, key: Any) -> str:  # noqa: ANN401
+        stats = self._stats
+        start = perf_counter_ns()
+        try:
+            value = super().__getitem__(key)
+        except BluetoothNumbersError:
+            stats.latency.add(perf_counter_ns() - start)
+            stats.misses += 1
+            stats.unknown.add(_unknown_key(self, key))
+            raise
+        stats.latency.add(perf_counter_ns() - start)
+        stats.hits += 1
+        return value
+
+
+class _InstrumentedReverseLookup(ReverseLookup):
+    """Mixin that records the statistics of reverse lookups.
+
+    Copies and pickles of the reverse lookup have its original class, without
+    statistics, because the instrumented class can't be imported.
+    """
+
+    _stats: LookupStats
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        state = {
+            name: value for name, value in self.__dict__.items() if name != "_stats"
+        }
+        return object.__new__, (_original_class(self),), state
+
+    def lookup(self, terms: str, *args: Any, **kwargs: Any) -> Matches:  # noqa: ANN401
+        stats = self._stats
+        start = perf_counter_ns()
+        results = super().lookup(terms, *args, **kwargs)
+        stats.latency.add(perf_counter_ns() - start)
+        if results:
+            stats.hits += 1
+        else:
+            stats.misses += 1
+            stats.unknown.add(terms)
+        return results
+
+
+def _instrumented_class(cls: type) -> type:
+    """Return the instrumented subclass of a class, creating it first if needed.
+
+    Args:
+        cls (type): A subclass of :class:`~bluetooth_numbers.dicts._NumberDict` or
+            :class:`~bluetooth_numbers.reverse_lookup.ReverseLookup`.
+
+    Returns:
+        type: The instrumented subclass of `cls`.
+    """
+    if cls not in _instrumented_classes:
+        mixin = (
+            _InstrumentedDict if issubclass(cls, dict) else _InstrumentedReverseLookup
+        )
+        _instrumented_classes[cls] = type(cls.__name__, (mixin, cls), {})
+    return _instrumented_classes[cls]
+
+
+def enable_stats(obj: _Instrumentable, capacity: int = DEFAULT_CAPACITY) -> LookupStats:
+    """Enable statistics for a dictionary or reverse lookup.
+
+    If statistics are already enabled for `obj`, its statistics are kept.
+
+    Args:
+        obj (_NumberDict | ReverseLookup): The object to collect statistics for.
+        capacity (int): The maximum number of unknown keys to count.
+
+    Returns:
+        LookupStats: The statistics of `obj`, which are updated by its lookups.
+    """
+    stats = get_stats(obj)
+    if stats is None:
+        stats = LookupStats(capacity)
+        obj.__dict__["_stats"] = stats
+        obj.__class__ = _instrumented_class(type(obj))
+    return stats
+
+
+def disable_stats(obj: _Instrumentable) -> None:
+    """Disable statistics for a dictionary or reverse lookup.
+
+    Args:
+        obj (_NumberDict | ReverseLookup): The object to stop collecting statistics
+            for.
+    """
+    if get_stats(obj) is not None:
+        obj.__class__ = _original_class(obj)
+        del obj.__dict__["_stats"]
+
+
+def get_stats(obj: _Instrumentable) -> LookupStats | None:
+    """Return the statistics of a dictionary or reverse lookup.
+
+    Args:
+        obj (_NumberDict | ReverseLookup): The object to return the statistics for.
+
+    Returns:
+        LookupStats | None: The statistics of `obj`, or None if they aren't enabled.
+    """
+    return cast(Union[LookupStats, None], obj.__dict__.get("_stats"))
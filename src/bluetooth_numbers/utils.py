@@ -1,9 +1,14 @@
 """Module with utility functions for Bluetooth numbers."""
+from __future__ import annotations
+
 import re
+from functools import lru_cache
+from typing import Iterable
 from uuid import UUID
 
 from bluetooth_numbers.exceptions import (
     No16BitIntegerError,
+    No32BitIntegerError,
     NonStandardUUIDError,
     WrongOUIFormatError,
 )
@@ -11,8 +16,27 @@ from bluetooth_numbers.exceptions import (
 BASE_UUID: UUID = UUID("00000000-0000-1000-8000-00805F9B34FB")
 """Base UUID defined by the Bluetooth SIG."""
 
-_OUI_RE = re.compile(r"^([0-9A-F]{2})[-:]*([0-9A-F]{2})[-:]*([0-9A-F]{2})$")
-_NORMALIZED_OUI_RE = re.compile(r"^[0-9A-F]{2}:[0-9A-F]{2}:[0-9A-F]{2}$")
+_NORMALIZED_OUI_RE = re.compile(r"[0-9A-F]{2}:[0-9A-F]{2}:[0-9A-F]{2}")
+_OUI_SEPARATORS = "-:"
+# Every pair of hexadecimal digits in any case, with the pair in uppercase
+_HEX_PAIRS = {
+    first + second: (first + second).upper()
+    for first in "0123456789ABCDEFabcdef"
+    for second in "0123456789ABCDEFabcdef"
+}
+OUI_CACHE_SIZE = 4096
+"""Number of unnormalized OUIs for which the normalized OUI is remembered."""
+UUID_CACHE_SIZE = 4096
+"""Number of UUID strings for which the parsed UUID is remembered."""
+_HEX_DIGITS = "0123456789ABCDEFabcdef"
+_UINT16_MAX = 0xFFFF
+_UUID16_LENGTH = 4
+_UUID32_LENGTH = 8
+_UUID128_LENGTH = 36
+_UINT32_MAX = 0xFFFFFFFF
+_UUID32_SHIFT = 96
+_UUID32_MASK = _UINT32_MAX << _UUID32_SHIFT
+_UUID16_MASK = 0xFFFF << _UUID32_SHIFT
 
 
 def is_normalized_oui(oui: str) -> bool:
@@ -36,7 +60,32 @@ def is_normalized_oui(oui: str) -> bool:
         >>> is_normalized_oui("FOOBAR")
         False
     """
-    return bool(_NORMALIZED_OUI_RE.match(oui))
+    return bool(_NORMALIZED_OUI_RE.fullmatch(oui))
+
+
+def _parse_oui(oui: str) -> str | None:
+    """Normalize an OUI without raising an exception.
+
+    The OUI consists of three pairs of hexadecimal digits, with any number of
+    dashes and colons between the pairs.
+
+    Args:
+        oui (str): The OUI to normalize.
+
+    Returns:
+        str | None: `oui` as a normalized OUI, or ``None`` if it doesn't have the
+        right format.
+    """
+    first = _HEX_PAIRS.get(oui[:2])
+    second = _HEX_PAIRS.get(oui[2:-2].strip(_OUI_SEPARATORS))
+    third = _HEX_PAIRS.get(oui[-2:])
+    if first and second and third:
+        return f"{first}:{second}:{third}"
+    return None
+
+
+# Scanners see the same OUIs over and over in the same unnormalized format
+_parse_oui_cached = lru_cache(maxsize=OUI_CACHE_SIZE)(_parse_oui)
 
 
 def normalize_oui(oui: str) -> str:
@@ -64,10 +113,59 @@ def normalize_oui(oui: str) -> str:
         Traceback (most recent call last):
         bluetooth_numbers.exceptions.WrongOUIFormatError: 'FOOBAR'
     """
-    oui_parts = _OUI_RE.match(oui.upper())
-    if oui_parts:
-        return oui_parts.group(1) + ":" + oui_parts.group(2) + ":" + oui_parts.group(3)
-    raise WrongOUIFormatError(oui)
+    normalized = _parse_oui(oui)
+    if normalized is None:
+        raise WrongOUIFormatError(oui)
+    return normalized
+
+
+def _parse_uuid(uuid: str) -> int | None:
+    """Parse a UUID string into the integer it's stored as in a UUIDDict.
+
+    The formats with 4, 8 and 36 characters are parsed without creating a
+    :class:`~uuid.UUID` object. Other formats are parsed by :class:`~uuid.UUID`.
+
+    Args:
+        uuid (str): A 16-bit or 32-bit UUID of 4 or 8 hexadecimal digits, or a
+            128-bit UUID in one of the formats :class:`~uuid.UUID` accepts, such as
+            "0000180f-0000-1000-8000-00805f9b34fb".
+
+    Returns:
+        int | None: The UUID as a 16-bit integer if it's a 16-bit UUID or a standard
+        Bluetooth UUID with a 16-bit UUID, otherwise as a 128-bit integer, or
+        ``None`` if `uuid` doesn't have one of the supported formats or is a
+        128-bit UUID below 2**32 that isn't a standard Bluetooth UUID.
+    """
+    length = len(uuid)
+    digits = ""
+    if length in (_UUID16_LENGTH, _UUID32_LENGTH):
+        digits = uuid
+    elif (
+        length == _UUID128_LENGTH and uuid[8] == uuid[13] == uuid[18] == uuid[23] == "-"
+    ):
+        # Any other hyphens are left and rejected as digits below
+        digits = uuid.replace("-", "", 4)
+
+    if digits and not digits.strip(_HEX_DIGITS):
+        number = int(digits, 16)
+        if length == _UUID32_LENGTH and number > _UINT16_MAX:
+            number = BASE_UUID.int | number << _UUID32_SHIFT
+    else:
+        try:
+            number = UUID(uuid).int
+        except ValueError:
+            return None
+
+    if number & ~_UUID16_MASK == BASE_UUID.int:
+        return number >> _UUID32_SHIFT
+    if number <= _UINT32_MAX and length not in (_UUID16_LENGTH, _UUID32_LENGTH):
+        # A 128-bit UUID with the integer of a 16-bit or 32-bit UUID
+        return None
+    return number
+
+
+# String-typed Bluetooth stacks hand over the same UUIDs over and over
+_parse_uuid_cached = lru_cache(maxsize=UUID_CACHE_SIZE)(_parse_uuid)
 
 
 def uuid128_to_uuid16(uuid128: UUID) -> int:
@@ -150,6 +248,119 @@ def uuid16_to_uuid128(uuid16: int) -> UUID:
     return UUID(bytes=bytes(uuid128))
 
 
+def uuid128_to_uuid32(uuid128: UUID) -> int:
+    """Convert a 128-bit standard Bluetooth UUID to a 32-bit UUID.
+
+    Every 16-bit UUID is also a 32-bit UUID, with the same value.
+
+    Args:
+        uuid128 (~uuid.UUID): A 128-bit Bluetooth UUID.
+
+    Raises:
+        NonStandardUUIDError: If `uuid128` is not a 128-bit UUID with the Bluetooth
+            base UUID.
+
+    Returns:
+        int: A 32-bit UUID that is the short UUID of `uuid128`.
+
+    Example:
+        >>> from bluetooth_numbers.utils import uuid128_to_uuid32
+        >>> from uuid import UUID
+        >>> hex(uuid128_to_uuid32(UUID('12345678-0000-1000-8000-00805f9b34fb')))
+        '0x12345678'
+    """
+    uuid = uuid128.int
+    if uuid & ~_UUID32_MASK == BASE_UUID.int:
+        return uuid >> _UUID32_SHIFT
+
+    raise NonStandardUUIDError(uuid128)
+
+
+def uuid32_to_uuid128(uuid32: int) -> UUID:
+    """Convert a 32-bit UUID to a 128-bit UUID with the Bluetooth base UUID.
+
+    Args:
+        uuid32 (int): A 32-bit UUID.
+
+    Raises:
+        No32BitIntegerError: If `uuid32` is not an integer from 0 to 4294967295.
+
+    Returns:
+        ~uuid.UUID: A 128-bit UUID that is the full UUID of `uuid32`.
+
+    Example:
+        >>> from bluetooth_numbers.utils import uuid32_to_uuid128
+        >>> uuid32_to_uuid128(0x12345678)
+        UUID('12345678-0000-1000-8000-00805f9b34fb')
+    """
+    if not is_uint32(uuid32):
+        raise No32BitIntegerError(uuid32)
+
+    return UUID(int=BASE_UUID.int | uuid32 << _UUID32_SHIFT)
+
+
+def uuids128_to_uuids32(uuids128: Iterable[UUID]) -> list[int]:
+    """Convert 128-bit standard Bluetooth UUIDs to 32-bit UUIDs.
+
+    This is the same as calling :func:`uuid128_to_uuid32` for every UUID, but
+    faster for many UUIDs, for instance from a stream of advertisements.
+
+    Args:
+        uuids128 (Iterable[~uuid.UUID]): The 128-bit Bluetooth UUIDs.
+
+    Raises:
+        NonStandardUUIDError: If one of the UUIDs is not a 128-bit UUID with the
+            Bluetooth base UUID.
+
+    Returns:
+        list[int]: The 32-bit UUIDs, in the same order.
+
+    Example:
+        >>> from bluetooth_numbers.utils import uuids128_to_uuids32
+        >>> from uuid import UUID
+        >>> uuids128_to_uuids32([UUID('0000180f-0000-1000-8000-00805f9b34fb'),
+        ...                      UUID('12345678-0000-1000-8000-00805f9b34fb')])
+        [6159, 305419896]
+    """
+    base = BASE_UUID.int
+    uuids = [uuid128.int for uuid128 in uuids128]
+    for position, uuid in enumerate(uuids):
+        if uuid & ~_UUID32_MASK != base:
+            raise NonStandardUUIDError(UUID(int=uuid))
+        uuids[position] = uuid >> _UUID32_SHIFT
+    return uuids
+
+
+def uuids32_to_uuids128(uuids32: Iterable[int]) -> list[UUID]:
+    """Convert 32-bit UUIDs to 128-bit UUIDs with the Bluetooth base UUID.
+
+    This is the same as calling :func:`uuid32_to_uuid128` for every UUID, but
+    faster for many UUIDs, for instance from a stream of advertisements.
+
+    Args:
+        uuids32 (Iterable[int]): The 32-bit UUIDs.
+
+    Raises:
+        No32BitIntegerError: If one of the UUIDs is not an integer from 0 to
+            4294967295.
+
+    Returns:
+        list[~uuid.UUID]: The 128-bit UUIDs, in the same order.
+
+    Example:
+        >>> from bluetooth_numbers.utils import uuids32_to_uuids128
+        >>> uuids32_to_uuids128([0x180F])
+        [UUID('0000180f-0000-1000-8000-00805f9b34fb')]
+    """
+    base = BASE_UUID.int
+    uuids: list[UUID] = []
+    for uuid32 in uuids32:
+        if not is_uint32(uuid32):
+            raise No32BitIntegerError(uuid32)
+        uuids.append(UUID(int=base | uuid32 << _UUID32_SHIFT))
+    return uuids
+
+
 def uint16_to_hex(number: int) -> str:
     """Convert a 16-bit UUID or Company ID to a hexadecimal string.
 
@@ -190,3 +401,22 @@ def is_uint16(number: int) -> bool:
         False
     """
     return isinstance(number, int) and 0 <= number <= 0xFFFF  # noqa: PLR2004
+
+
+def is_uint32(number: int) -> bool:
+    """Check whether a number is a 32-bit unsigned integer.
+
+    Args:
+        number (int): The number to check.
+
+    Returns:
+        bool: ``True`` if `number` is a 32-bit unsigned integer, ``False`` otherwise.
+
+    Examples:
+        >>> from bluetooth_numbers.utils import is_uint32
+        >>> is_uint32(0x12345678)
+        True
+        >>> is_uint32(0x100000000)
+        False
+    """
+    return isinstance(number, int) and 0 <= number <= _UINT32_MAX
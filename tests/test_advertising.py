@@ -0,0 +1,149 @@
+"""Test the bluetooth_numbers.advertising module."""
+from __future__ import annotations
+
+import pytest
+
+from bluetooth_numbers.advertising import ADRecord, parse_advertising_data
+from bluetooth_numbers.exceptions import MalformedAdvertisingDataError
+from bluetooth_numbers.utils import BASE_UUID
+
+
+def records(payload: str) -> list[tuple[int, int | None, str | None, bytes]]:
+    """Parse hexadecimal advertising data and convert the records to tuples."""
+    return [
+        (record.ad_type, record.key, record.name, bytes(record.data))
+        for record in parse_advertising_data(bytes.fromhex(payload))
+    ]
+
+
+@pytest.mark.parametrize(
+    ("payload", "expected"),
+    [
+        (
+            "0703 0F18 0A18 FEFF",
+            [
+                (0x03, 0x180F, "Battery Service", b"\x0f\x18"),
+                (0x03, 0x180A, "Device Information", b"\x0a\x18"),
+                (0x03, 0xFFFE, None, b"\xfe\xff"),
+            ],
+        ),
+        (
+            "0505 0F180000",
+            [(0x05, 0x180F, "Battery Service", b"\x0f\x18\x00\x00")],
+        ),
+        (
+            "0620 0F180000 64 0505 78563412",
+            [
+                (0x20, 0x180F, "Battery Service", b"\x64"),
+                (0x05, BASE_UUID.int | 0x12345678 << 96, None, b"\x78\x56\x34\x12"),
+            ],
+        ),
+        (
+            "1107 FB349B5F80000080001000000F180000",
+            [
+                (
+                    0x07,
+                    0x180F,
+                    "Battery Service",
+                    bytes.fromhex("FB349B5F80000080001000000F180000"),
+                ),
+            ],
+        ),
+        (
+            "1107 9ECADC240EE5A9E093F3A3B50100406E",
+            [
+                (
+                    0x07,
+                    0x6E400001B5A3F393E0A9E50E24DCCA9E,
+                    "Nordic UART Service",
+                    bytes.fromhex("9ECADC240EE5A9E093F3A3B50100406E"),
+                ),
+            ],
+        ),
+        (
+            "1107 0F180000000000000000000000000000",
+            [
+                (
+                    0x07,
+                    None,
+                    None,
+                    bytes.fromhex("0F180000000000000000000000000000"),
+                ),
+            ],
+        ),
+        (
+            "0516 AAFE 1000",
+            [(0x16, 0xFEAA, "Eddystone", b"\x10\x00")],
+        ),
+        (
+            "0AFF 9904 050FE1FFFF0000 03FF FEFF",
+            [
+                (
+                    0xFF,
+                    0x0499,
+                    "Ruuvi Innovations Ltd.",
+                    b"\x05\x0f\xe1\xff\xff\x00\x00",
+                ),
+                (0xFF, 0xFFFE, None, b""),
+            ],
+        ),
+        (
+            "081B 563412342D58 00 081B 563412342D58 01",
+            [
+                (
+                    0x1B,
+                    0x582D34,
+                    "Qingping Electronics (Suzhou) Co., Ltd",
+                    bytes.fromhex("563412342D5800"),
+                ),
+                (0x1B, None, None, bytes.fromhex("563412342D5801")),
+            ],
+        ),
+        (
+            "020106 0409 4D6F6F 00 0303 0F18",
+            [(0x01, None, None, b"\x06"), (0x09, None, None, b"Moo")],
+        ),
+    ],
+)
+def test_parse_advertising_data(
+    payload: str,
+    expected: list[tuple[int, int | None, str | None, bytes]],
+) -> None:
+    """Test the records found in advertising data."""
+    assert records(payload.replace(" ", "")) == expected
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "0503 0F18",
+        "0403 0F180A",
+        "0605 0F180000 00",
+        "0216 AA",
+        "02FF 99",
+        "1207 9ECADC240EE5A9E093F3A3B50100406E",
+    ],
+)
+def test_malformed_advertising_data(payload: str) -> None:
+    """Test advertising data with AD structures that are too long or too short."""
+    with pytest.raises(MalformedAdvertisingDataError):
+        records(payload.replace(" ", ""))
+
+
+def test_parse_advertising_data_zero_copy() -> None:
+    """Test whether the records refer to the advertising data instead of copies."""
+    payload = bytearray.fromhex("0AFF9904050FE1FFFF0000")
+    (record,) = parse_advertising_data(payload)
+    assert isinstance(record, ADRecord)
+    assert record.data.obj is payload
+
+    payload[4] = 0x03
+    assert record.data[0] == 0x03  # noqa: PLR2004
+
+
+def test_parse_advertising_data_memoryview() -> None:
+    """Test advertising data in a memoryview with another format than bytes."""
+    payload = memoryview(bytes.fromhex("03030F18")).cast("H")
+    assert [record.name for record in parse_advertising_data(payload)] == [
+        "Battery Service",
+    ]
@@ -0,0 +1,222 @@
+"""Test the bluetooth_numbers.btsnoop module."""
+from __future__ import annotations
+
+import csv
+import io
+import json
+from struct import pack
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bluetooth_numbers.btsnoop import (
+    BTSNOOP_EPOCH_DELTA,
+    DATALINK_H1,
+    DATALINK_H4,
+    DATALINK_MONITOR,
+    AdvertisingReport,
+    BtsnoopReader,
+    advertising_reports,
+    annotate,
+    main,
+)
+from bluetooth_numbers.exceptions import MalformedBtsnoopError
+
+if TYPE_CHECKING:
+    from pathlib import Path
+    from typing import BinaryIO
+
+TIMESTAMP = 1_700_000_000_000_000
+# Public address 58:2D:34:12:34:56 and random address C0:11:22:33:44:55
+PUBLIC_ADDRESS = bytes.fromhex("563412342D58")
+RANDOM_ADDRESS = bytes.fromhex("5544332211C0")
+# Flags, complete list of 16-bit service UUIDs and manufacturer data of Apple
+AD_DATA = bytes.fromhex("020106 0503 0F18 0A18 05FF 4C00 0215".replace(" ", ""))
+# LE Meta event with an advertising report and one with an extended report
+ADVERTISING_REPORT = (
+    bytes.fromhex("3E") + bytes([11 + len(AD_DATA) + 1])
+    + bytes.fromhex("02 01 00 00".replace(" ", ""))
+    + PUBLIC_ADDRESS
+    + bytes([len(AD_DATA)])
+    + AD_DATA
+    + bytes.fromhex("C4")
+)  # fmt: skip
+EXTENDED_REPORT = (
+    bytes.fromhex("3E") + bytes([2 + 24 + len(AD_DATA)])
+    + bytes.fromhex("0D 01 1300 01".replace(" ", ""))
+    + RANDOM_ADDRESS
+    + bytes.fromhex("01 00 FF 7F BA 0000 00 000000000000".replace(" ", ""))
+    + bytes([len(AD_DATA)])
+    + AD_DATA
+)  # fmt: skip
+OTHER_EVENT = bytes.fromhex("0E0401030C00")
+
+
+def btsnoop(datalink: int, packets: list[tuple[int, bytes]]) -> bytes:
+    """Create a btsnoop file with packets and their flags."""
+    data = b"btsnoop\0" + pack(">II", 1, datalink)
+    for flags, packet in packets:
+        header = (len(packet), len(packet), flags, 0, TIMESTAMP + BTSNOOP_EPOCH_DELTA)
+        data += pack(">IIIIq", *header) + packet
+    return data
+
+
+CAPTURES = {
+    DATALINK_H4: btsnoop(
+        DATALINK_H4,
+        [
+            (0x02, b"\x01\x03\x0c\x00"),
+            (0x03, b"\x04" + OTHER_EVENT),
+            (0x03, b"\x04" + ADVERTISING_REPORT),
+            (0x03, b"\x04" + EXTENDED_REPORT),
+        ],
+    ),
+    DATALINK_H1: btsnoop(
+        DATALINK_H1,
+        [
+            (0x02, b"\x03\x0c\x00"),
+            (0x03, ADVERTISING_REPORT),
+            (0x01, b"\x02\x00\x00\x00"),
+            (0x03, EXTENDED_REPORT),
+        ],
+    ),
+    DATALINK_MONITOR: btsnoop(
+        DATALINK_MONITOR,
+        [
+            (0x0002, b"\x03\x0c\x00"),
+            (0x0003, ADVERTISING_REPORT),
+            (0x0005, b"\x02\x00\x00\x00"),
+            (0x10003, EXTENDED_REPORT),
+        ],
+    ),
+}
+EXPECTED_REPORTS = [
+    AdvertisingReport(TIMESTAMP, "58:2D:34:12:34:56", 0, -60, AD_DATA),
+    AdvertisingReport(TIMESTAMP, "C0:11:22:33:44:55", 1, -70, AD_DATA),
+]
+
+
+@pytest.mark.parametrize("datalink", CAPTURES)
+def test_advertising_reports_file(datalink: int, tmp_path: Path) -> None:
+    """Test the advertising reports in a memory-mapped btsnoop file."""
+    path = tmp_path / "capture.log"
+    path.write_bytes(CAPTURES[datalink])
+    with path.open("rb") as capture, BtsnoopReader(capture) as reader:
+        assert reader.datalink == datalink
+        assert list(advertising_reports(reader, reader.datalink)) == EXPECTED_REPORTS
+    assert reader._mmap is None  # noqa: SLF001
+
+
+@pytest.mark.parametrize("datalink", CAPTURES)
+def test_advertising_reports_stream(datalink: int) -> None:
+    """Test the advertising reports in a btsnoop stream that can't be mapped."""
+    reader = BtsnoopReader(io.BytesIO(CAPTURES[datalink]))
+    assert list(advertising_reports(reader, reader.datalink)) == EXPECTED_REPORTS
+
+
+def test_annotate() -> None:
+    """Test the annotations of advertising reports."""
+    public, random = (annotate(report) for report in EXPECTED_REPORTS)
+    assert public == {
+        "timestamp": TIMESTAMP / 1e6,
+        "address": "58:2D:34:12:34:56",
+        "address_type": "public",
+        "vendor": "Qingping Electronics (Suzhou) Co., Ltd",
+        "rssi": -60,
+        "companies": [{"id": "0x004C", "name": "Apple, Inc."}],
+        "services": [
+            {"uuid": "0x180F", "name": "Battery Service"},
+            {"uuid": "0x180A", "name": "Device Information"},
+        ],
+    }
+    assert random["address_type"] == "random"
+    assert random["vendor"] is None
+
+
+def test_annotate_uuid_sizes() -> None:
+    """Test whether a 16-bit UUID is annotated once when advertised in any size."""
+    ad_data = bytes.fromhex(
+        "0303 0F18 0505 0F180000 1107 FB349B5F80000080001000000F180000".replace(
+            " ",
+            "",
+        ),
+    )
+    report = AdvertisingReport(0, "C0:11:22:33:44:55", 1, -70, ad_data)
+    assert annotate(report)["services"] == [
+        {"uuid": "0x180F", "name": "Battery Service"},
+    ]
+
+
+def test_annotate_malformed() -> None:
+    """Test whether advertising data is annotated up to a malformed AD structure."""
+    report = AdvertisingReport(0, "C0:11:22:33:44:55", 1, -70, AD_DATA + b"\x05\xff")
+    assert annotate(report)["companies"] == [{"id": "0x004C", "name": "Apple, Inc."}]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"btsnoop",
+        b"snoopbt\0\x00\x00\x00\x01\x00\x00\x03\xea",
+        CAPTURES[DATALINK_H4][:-1],
+        CAPTURES[DATALINK_H4][:30],
+    ],
+)
+def test_malformed_btsnoop(data: bytes, tmp_path: Path) -> None:
+    """Test files that aren't btsnoop files or are truncated."""
+    path = tmp_path / "capture.log"
+    path.write_bytes(data)
+    for capture in (io.BytesIO(data), path.open("rb")):
+        with capture, pytest.raises(MalformedBtsnoopError):
+            list(BtsnoopReader(capture))
+
+
+def test_unsupported_datalink() -> None:
+    """Test a btsnoop file with a datalink type that isn't supported."""
+    reader = BtsnoopReader(io.BytesIO(btsnoop(1003, [(0, b"\x00")])))
+    with pytest.raises(MalformedBtsnoopError):
+        list(advertising_reports(reader, reader.datalink))
+
+
+@pytest.mark.parametrize("output_format", ["jsonl", "csv"])
+def test_main(output_format: str, tmp_path: Path) -> None:
+    """Test writing the annotated advertising reports of a btsnoop file."""
+    capture = tmp_path / "capture.log"
+    capture.write_bytes(CAPTURES[DATALINK_MONITOR])
+    output = tmp_path / f"reports.{output_format}"
+    main([str(capture), "--format", output_format, "--output", str(output)])
+
+    with output.open(encoding="utf-8", newline="") as output_file:
+        if output_format == "jsonl":
+            rows = [json.loads(line) for line in output_file]
+        else:
+            rows = list(csv.DictReader(output_file))
+
+    assert [row["address"] for row in rows] == [
+        "58:2D:34:12:34:56",
+        "C0:11:22:33:44:55",
+    ]
+    if output_format == "csv":
+        assert rows[0]["service_uuids"] == "0x180F;0x180A"
+        assert rows[0]["companies"] == "Apple, Inc."
+        assert rows[1]["vendor"] == ""
+
+
+def test_main_malformed(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether the memory map is released when a btsnoop file is truncated."""
+    readers: list[BtsnoopReader] = []
+    original_init = BtsnoopReader.__init__
+
+    def init(self: BtsnoopReader, file: BinaryIO) -> None:
+        original_init(self, file)
+        readers.append(self)
+
+    monkeypatch.setattr(BtsnoopReader, "__init__", init)
+    capture = tmp_path / "capture.log"
+    capture.write_bytes(CAPTURES[DATALINK_H4][:-1])
+    with pytest.raises(MalformedBtsnoopError):
+        main([str(capture), "--output", str(tmp_path / "reports.jsonl")])
+
+    (reader,) = readers
+    assert reader._mmap is None  # noqa: SLF001
@@ -0,0 +1,127 @@
+"""Test the bluetooth_numbers.cli module."""
+from __future__ import annotations
+
+import io
+from uuid import UUID
+
+import pytest
+
+from bluetooth_numbers.cli import main, parse_uuid
+
+
+@pytest.mark.parametrize(
+    ("key", "uuid"),
+    [
+        ("180F", 0x180F),
+        ("0x2a37", 0x2A37),
+        ("0000FEAA", 0xFEAA),
+        ("0x12345678", UUID("12345678-0000-1000-8000-00805F9B34FB")),
+        ("0000180F-0000-1000-8000-00805F9B34FB", 0x180F),
+        (
+            "6E400001-B5A3-F393-E0A9-E50E24DCCA9E",
+            UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"),
+        ),
+        (
+            "6E400001B5A3F393E0A9E50E24DCCA9E",
+            UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"),
+        ),
+    ],
+)
+def test_parse_uuid(key: str, uuid: UUID | int) -> None:
+    """Test parsing UUIDs of all sizes."""
+    assert parse_uuid(key) == uuid
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        "",
+        "180",
+        "XYZW",
+        "+18F",
+        "18_F",
+        " 18F",
+        "0x6E400001-B5A3-F393-E0A9-E50E24DCCA9E",
+        "00000000-0000-0000-0000-00000000180F",
+        "6E400001-B5A3",
+    ],
+)
+def test_parse_invalid_uuid(key: str) -> None:
+    """Test that parsing an invalid UUID raises ValueError."""
+    with pytest.raises(ValueError):  # noqa: PT011
+        parse_uuid(key)
+
+
+@pytest.mark.parametrize(
+    ("args", "output"),
+    [
+        (
+            ["company", "0x0499", "4C"],
+            "0x0499\tRuuvi Innovations Ltd.\n4C\tApple, Inc.\n",
+        ),
+        (["oui", "58:2D:34"], "58:2D:34\tQingping Electronics (Suzhou) Co., Ltd\n"),
+        (["service", "180F"], "180F\tBattery Service\n"),
+        (
+            ["characteristic", "6E400002-B5A3-F393-E0A9-E50E24DCCA9E"],
+            "6E400002-B5A3-F393-E0A9-E50E24DCCA9E\tUART RX Characteristic\n",
+        ),
+        (["descriptor", "0x2901"], "0x2901\tCharacteristic User Descriptor\n"),
+        (
+            ["search", "-t", "characteristic", "Cycling", "Power", "Feature"],
+            "Cycling Power Feature\tcharacteristic\t0x2A65\tCycling Power Feature\n",
+        ),
+        (
+            ["search", "-t", "service", "Nordic UART"],
+            "Nordic UART\tservice\t6E400001-B5A3-F393-E0A9-E50E24DCCA9E\t"
+            "Nordic UART Service\n",
+        ),
+    ],
+)
+def test_lookup(
+    capsys: pytest.CaptureFixture[str],
+    args: list[str],
+    output: str,
+) -> None:
+    """Test looking up keys and searching terms on the command line."""
+    assert main(args) == 0
+    assert capsys.readouterr().out == output
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["company", "0xFFFE"],
+        ["company", "Apple"],
+        ["oui", "FOOBAR"],
+        ["service", "0xFFFF", "0x1"],
+        ["search", "FOOBAR"],
+    ],
+)
+def test_not_found(capsys: pytest.CaptureFixture[str], args: list[str]) -> None:
+    """Test that unknown or invalid keys give an exit code of 1."""
+    assert main(args) == 1
+    assert all(line.endswith("\t") for line in capsys.readouterr().out.splitlines())
+
+
+@pytest.mark.parametrize("args", [["service"], ["service", "-"]])
+def test_stdin(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+    args: list[str],
+) -> None:
+    """Test reading keys line by line from standard input."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("180F\n\nFFFF\n0x180D\n"))
+    assert main(args) == 1
+    assert capsys.readouterr().out == (
+        "180F\tBattery Service\n\t\nFFFF\t\n0x180D\tHeart Rate\n"
+    )
+
+
+def test_search_stdin(
+    capsys: pytest.CaptureFixture[str],
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test reading search queries line by line from standard input."""
+    monkeypatch.setattr("sys.stdin", io.StringIO("heart rate\n\nfoobar\n"))
+    assert main(["search", "-t", "service"]) == 0
+    assert capsys.readouterr().out == "heart rate\tservice\t0x180D\tHeart Rate\n"
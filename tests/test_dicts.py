@@ -0,0 +1,507 @@
+"""Test the bluetooth_numbers.dicts module."""
+from __future__ import annotations
+
+import asyncio
+import copy
+import os
+import pickle
+import subprocess
+import sys
+from time import perf_counter
+from typing import Any, Callable
+from uuid import UUID
+
+import pytest
+
+from bluetooth_numbers import characteristic, company, descriptor, oui, service
+from bluetooth_numbers._indexes import CONTENT_HASHES
+from bluetooth_numbers.dicts import (
+    CICDict,
+    FrozenCICDict,
+    FrozenOUIDict,
+    FrozenUUIDDict,
+    OUIDict,
+    UUIDDict,
+    _builtin_name,
+    _content_hash,
+    _NumberDict,
+)
+from bluetooth_numbers.exceptions import (
+    No16BitIntegerError,
+    UnknownOUIError,
+    UnknownUUIDError,
+    WrongOUIFormatError,
+)
+from bluetooth_numbers.utils import (
+    _parse_oui_cached,
+    _parse_uuid_cached,
+    uuid32_to_uuid128,
+)
+
+
+def test_oui_dict_changes() -> None:
+    """Test whether changes to an OUIDict are picked up by lookups of integers."""
+    ouis = OUIDict({"58:2D:34": "Qingping"})
+    assert ouis[0x582D34] == "Qingping"
+
+    ouis["58:2D:34"] = "Qingping Electronics"
+    ouis.update({"AC:67:06": "Ruckus"})
+    ouis |= {"24:5B:A7": "Apple"}
+    assert ouis[0x582D34] == "Qingping Electronics"
+    assert ouis[0xAC6706] == "Ruckus"
+    assert ouis[0x245BA7] == "Apple"
+
+
+def test_oui_dict_int_index_unnormalized() -> None:
+    """Test looking up integers in an OUIDict with keys in any format."""
+    ouis = OUIDict({"58-2d-34": "Qingping", "ac6706": "Ruckus", "foobar": "Foo"})
+    assert ouis[0x582D34] == "Qingping"
+    assert ouis[0xAC6706] == "Ruckus"
+    with pytest.raises(UnknownOUIError):
+        _ = ouis[0xABCDEF]
+
+
+def test_oui_dict_unnormalized() -> None:
+    """Test that unnormalized OUIs are normalized once and then remembered."""
+    _parse_oui_cached.cache_clear()
+    for _ in range(3):
+        assert oui["58-2d-34"] == "Qingping Electronics (Suzhou) Co., Ltd"
+        with pytest.raises(UnknownOUIError):
+            _ = oui["ab-cd-ef"]
+        with pytest.raises(WrongOUIFormatError):
+            _ = oui["foobar"]
+    # Only the first lookup of each key parses it: "58-2d-34", "ab-cd-ef" and
+    # "foobar"
+    assert _parse_oui_cached.cache_info().misses == 3  # noqa: PLR2004
+
+
+def test_uuid_dict_str() -> None:
+    """Test that UUID strings are parsed once and then remembered."""
+    _parse_uuid_cached.cache_clear()
+    for _ in range(3):
+        assert service["180f"] == "Battery Service"
+        assert service["6e400001-b5a3-f393-e0a9-e50e24dcca9e"] == "Nordic UART Service"
+        with pytest.raises(No16BitIntegerError):
+            _ = service["foobar"]
+    assert _parse_uuid_cached.cache_info().misses == 3  # noqa: PLR2004
+
+
+def test_uuid_dict_changes() -> None:
+    """Test whether changes to a UUIDDict are picked up by lookups of integers."""
+    uuids = UUIDDict({UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"): "UART"})
+    assert uuids[0x6E400001B5A3F393E0A9E50E24DCCA9E] == "UART"
+
+    del uuids[UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")]
+    uuids.setdefault(UUID("6E400002-B5A3-F393-E0A9-E50E24DCCA9E"), "RX")
+    assert UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E") not in uuids
+    assert uuids[0x6E400002B5A3F393E0A9E50E24DCCA9E] == "RX"
+
+
+def test_uuid_dict_family() -> None:
+    """Test that the families of a changed UUIDDict are the same as precomputed."""
+    uuids = UUIDDict(service)
+    assert uuids._family_index() == service._family_index()  # noqa: SLF001
+
+    uuids[UUID("6E400005-B5A3-F393-E0A9-E50E24DCCA9E")] = "UART extension"
+    assert uuids.family(UUID("6E400004-B5A3-F393-E0A9-E50E24DCCA9E")) == {
+        UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"): "Nordic UART Service",
+        UUID("6E400005-B5A3-F393-E0A9-E50E24DCCA9E"): "UART extension",
+    }
+
+
+def test_uuid_dict_uuid_keys() -> None:
+    """Test that UUID keys are stored as integers and can still be used."""
+    uart = UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")
+    rx = UUID("6E400002-B5A3-F393-E0A9-E50E24DCCA9E")
+    uuids = UUIDDict({uart: "UART", 0x180F: "Battery Service"})
+    assert dict.get(uuids, uart.int) == "UART"
+    assert list(uuids) == list(uuids.keys()) == [uart, 0x180F]
+    assert list(uuids.items()) == [(uart, "UART"), (0x180F, "Battery Service")]
+    assert (uart, "UART") in uuids.items()
+    assert uart in uuids.keys()  # noqa: SIM118
+    assert uuids == {uart: "UART", 0x180F: "Battery Service"}
+    assert uuids == {uart.int: "UART", 0x180F: "Battery Service"}
+    assert uuids != {uart: "Nordic UART", 0x180F: "Battery Service"}
+    assert uuids.popitem() == (0x180F, "Battery Service")
+    assert uuids.popitem() == (uart, "UART")
+    uuids[uart] = "UART"
+    assert uart in uuids
+    assert uuids.get(uart) == "UART"
+    assert uuids[str(uart)] == "UART"
+
+    uuids.update({rx: "RX"})
+    uuids[uart] = "Nordic UART"
+    assert uuids == {uart: "Nordic UART", rx: "RX"}
+    assert uuids.pop(rx) == "RX"
+    assert uuids.setdefault(rx, "RX") == "RX"
+    del uuids[rx]
+    assert rx not in uuids
+    assert uuids.get(rx) is None
+
+
+@pytest.mark.parametrize(
+    "key",
+    [
+        UUID(int=0x180F),
+        (0x180F).to_bytes(16, "little"),
+        "00000000-0000-0000-0000-00000000180f",
+        "{00000000-0000-0000-0000-00000000180f}",
+    ],
+)
+def test_uuid_dict_uuid128_below_uint32(key: Any) -> None:  # noqa: ANN401
+    """Test that a 128-bit UUID below 2**32 isn't taken for a 16-bit UUID."""
+    assert service[0x180F] == "Battery Service"
+    with pytest.raises(No16BitIntegerError):
+        _ = service[key]
+    assert service.get(key) is None
+    assert key not in service
+    assert service.lookup_many([key]) == [None]
+
+
+def test_uuid_dict_uuid128_below_uint32_keys() -> None:
+    """Test that a 128-bit UUID below 2**32 can't be added as a key."""
+    with pytest.raises(No16BitIntegerError):
+        UUIDDict({UUID(int=5): "Foo"})
+    uuids = UUIDDict({5: "Foo", UUID(int=1 << 32): "Bar"})
+    with pytest.raises(No16BitIntegerError):
+        uuids[UUID(int=5)] = "Foo"
+    assert list(uuids) == [5, UUID(int=1 << 32)]
+    assert uuids != {UUID(int=5): "Foo", UUID(int=1 << 32): "Bar"}
+
+
+@pytest.mark.parametrize(
+    ("key", "name"),
+    [
+        (0x180F, "Battery Service"),
+        (UUID("0000180F-0000-1000-8000-00805F9B34FB"), "Battery Service"),
+        ("180F", "Battery Service"),
+        ("0000180f-0000-1000-8000-00805f9b34fb", "Battery Service"),
+        (b"\x0f\x18", "Battery Service"),
+        (b"\x0f\x18\x00\x00", "Battery Service"),
+        (memoryview(b"\x0f\x18"), "Battery Service"),
+        (bytes.fromhex("9ECADC240EE5A9E093F3A3B50100406E"), "Nordic UART Service"),
+        ("6e400001-b5a3-f393-e0a9-e50e24dcca9e", "Nordic UART Service"),
+        (0xFFFE, None),
+        ("FFFE", None),
+        (b"\xfe\xff", None),
+        ("foobar", None),
+        (b"\x0f", None),
+        (6.5, None),
+    ],
+)
+def test_uuid_dict_get_contains(key: Any, name: str | None) -> None:  # noqa: ANN401
+    """Test that get and in accept the same formats as a lookup."""
+    assert service.get(key) == name
+    assert service.get(key, "?") == (name or "?")
+    assert (key in service) is (name is not None)
+    if name is not None:
+        assert service[key] == name
+
+
+def test_uuid_dict_standard_uuid128() -> None:
+    """Test that a standard UUID added as a 128-bit UUID is found as one."""
+    battery = UUID("0000180F-0000-1000-8000-00805F9B34FB")
+    uuids = UUIDDict({battery: "Battery"})
+    assert uuids[battery] == "Battery"
+    assert list(uuids) == [battery]
+    with pytest.raises(UnknownUUIDError):
+        _ = uuids[0x180F]
+
+
+def test_uuid_dict_uuid32() -> None:
+    """Test whether a 32-bit UUID can be found in each of its formats."""
+    uuids = UUIDDict({UUID("12345678-0000-1000-8000-00805F9B34FB"): "Frobnicator"})
+    assert uuids[uuid32_to_uuid128(0x12345678)] == "Frobnicator"
+    assert uuids[uuid32_to_uuid128(0x12345678).int] == "Frobnicator"
+    assert uuids[bytes.fromhex("78563412")] == "Frobnicator"
+    with pytest.raises(UnknownUUIDError):
+        _ = uuids[bytes.fromhex("79563412")]
+
+
+def test_lookup_many() -> None:
+    """Test looking up many keys in each of their formats at once."""
+    assert (
+        oui.lookup_many(["58:2D:34", "58-2d-34", 0x582D34, "FOOBAR", 0xFFFFFF])
+        == [
+            "Qingping Electronics (Suzhou) Co., Ltd",
+        ]
+        * 3
+        + [None] * 2
+    )
+    assert (
+        service.lookup_many(
+            iter([0x180F, UUID("0000180F-0000-1000-8000-00805F9B34FB"), 0xFFFF, -1]),
+            default="",
+        )
+        == ["Battery Service"] * 2 + [""] * 2
+    )
+    assert company.lookup_many([]) == []
+
+
+def test_lookup_many_async() -> None:
+    """Test that looking up many keys keeps the event loop responsive."""
+    keys = [f"{number:06X}" for number in range(0, 0x1000000, 0xBF)]
+    expected = oui.lookup_many(keys)
+
+    async def lookup_and_tick() -> tuple[list[str | None], float, float]:
+        ticks = [perf_counter()]
+        done = asyncio.Event()
+
+        async def tick() -> None:
+            while not done.is_set():
+                await asyncio.sleep(0.001)
+                ticks.append(perf_counter())
+
+        ticker = asyncio.create_task(tick())
+        start = perf_counter()
+        results = await oui.lookup_many_async(keys, chunk_size=1000)
+        duration = perf_counter() - start
+        done.set()
+        await ticker
+        gaps = [end - start for start, end in zip(ticks, ticks[1:])]
+        return results, duration, max(gaps)
+
+    results, duration, max_gap = asyncio.run(lookup_and_tick())
+    assert results == expected
+    # The event loop keeps running other tasks while the keys are looked up
+    assert max_gap < duration / 4
+
+
+@pytest.mark.parametrize(
+    ("table", "name", "ignore_case", "keys"),
+    [
+        (company, "Ruuvi Innovations Ltd.", False, (0x0499,)),
+        (company, "RUUVI innovations ltd.", True, (0x0499,)),
+        (company, "RUUVI innovations ltd.", False, ()),
+        (company, "Airoha Technology Corp.", False, (0x0094, 0x07E3)),
+        (service, "Battery Service", False, (0x180F,)),
+        (
+            service,
+            "Nordic UART Service",
+            False,
+            (UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"),),
+        ),
+        (characteristic, "heart rate measurement", True, (0x2A37,)),
+        (oui, "Frobnicator Inc.", True, ()),
+    ],
+)
+def test_by_name(
+    table: Any,  # noqa: ANN401
+    name: str,
+    ignore_case: bool,
+    keys: tuple[Any, ...],
+) -> None:
+    """Test finding the keys with a name."""
+    assert table.by_name(name, ignore_case=ignore_case) == keys
+
+
+def test_by_name_all() -> None:
+    """Test that the keys of every name are found, for a name with many keys too."""
+    tables: tuple[_NumberDict[Any], ...] = (company, oui, service)
+    for table in tables:
+        for key, name in table.items():
+            assert key in table.by_name(name)
+            assert key in table.by_name(name.upper(), ignore_case=True)
+    apple = oui.by_name("Apple, Inc.")
+    assert len(apple) > 1000  # noqa: PLR2004
+    assert apple == tuple(
+        prefix for prefix, name in oui.items() if name == "Apple, Inc."
+    )
+
+
+def test_by_name_changes() -> None:
+    """Test that changes to a dictionary are picked up by lookups of names."""
+    companies = CICDict({0x0001: "Foo"})
+    assert companies.by_name("foo", ignore_case=True) == (0x0001,)
+    companies[0x0002] = "FOO"
+    assert companies.by_name("foo", ignore_case=True) == (0x0001, 0x0002)
+    assert companies.by_name("FOO") == (0x0002,)
+    del companies[0x0001]
+    assert companies.by_name("Foo") == ()
+
+
+@pytest.mark.parametrize(
+    ("table", "indexes"),
+    [
+        (CICDict({0x004C: "Apple, Inc."}), {"content_hash", "names", "names_casefold"}),
+        (OUIDict({"24:5B:A7": "Apple, Inc."}), {"vendors", "vendor_ids", "int"}),
+        (UUIDDict({0x6E400001_B5A3_F393_E0A9_E50E24DCCA9E: "Nordic"}), {"families"}),
+    ],
+)
+def test_build_indexes(table: _NumberDict[Any], indexes: set[str]) -> None:
+    """Test building all indexes at once."""
+    table.build_indexes()
+    assert indexes <= set(table.__dict__["_indexes"])
+
+
+def test_content_hash() -> None:
+    """Test that the content hash only depends on the contents."""
+    companies = CICDict({0x004C: "Apple, Inc.", 0x0499: "Ruuvi Innovations Ltd."})
+    content_hash = companies.content_hash
+    assert CICDict(reversed(companies.items())).content_hash == content_hash
+
+    companies[0x0499] = "Ruuvi"
+    assert companies.content_hash != content_hash
+    companies[0x0499] = "Ruuvi Innovations Ltd."
+    assert companies.content_hash == content_hash
+
+
+@pytest.mark.parametrize(
+    "table",
+    [characteristic, company, descriptor, oui, service],
+)
+def test_content_hash_builtin(table: _NumberDict[Any]) -> None:
+    """Test that the precomputed content hashes match the built-in dictionaries."""
+    name = _builtin_name(table)
+    assert name is not None
+    assert CONTENT_HASHES[name] == _content_hash(dict.items(table))
+    assert table.content_hash == type(table)(table).content_hash
+
+
+@pytest.mark.parametrize(
+    ("table", "key"),
+    [
+        (company, 0x0499),
+        (oui, "58:2D:34"),
+        (service, 0x180F),
+        (service, UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")),
+    ],
+)
+def test_setdefault_existing(table: _NumberDict[Any], key: Any) -> None:  # noqa: ANN401
+    """Test that setting the default of an existing key keeps the indexes."""
+    name = _builtin_name(table)
+    table.build_indexes()
+    indexes = table.__dict__["_indexes"]
+    assert table.setdefault(key, "Foo") == table[key]
+    assert _builtin_name(table) == name
+    assert table.__dict__["_indexes"] is indexes
+
+
+def test_content_hash_processes() -> None:
+    """Test that the content hash is the same in another process."""
+    output = subprocess.run(
+        [  # noqa: S603
+            sys.executable,
+            "-c",
+            "import bluetooth_numbers; print(bluetooth_numbers.service.content_hash)",
+        ],
+        capture_output=True,
+        check=True,
+        env={**os.environ, "PYTHONHASHSEED": "1"},
+        text=True,
+    ).stdout
+    assert output.strip() == service.content_hash
+
+
+@pytest.mark.parametrize(
+    ("table", "frozen_type", "key"),
+    [
+        (company, FrozenCICDict, 0x0499),
+        (oui, FrozenOUIDict, 0x582D34),
+        (service, FrozenUUIDDict, bytes.fromhex("0F18")),
+    ],
+)
+def test_freeze(table: Any, frozen_type: type[Any], key: Any) -> None:  # noqa: ANN401
+    """Test that frozen built-in tables work the same but can't be changed."""
+    frozen = table.freeze()
+    assert isinstance(frozen, frozen_type)
+    assert isinstance(frozen, type(table))
+    assert frozen == table
+    assert frozen[key] == table[key]
+    assert frozen.freeze() is frozen
+    assert frozen.content_hash == table.content_hash
+    # Precomputed indexes of the built-in tables are still used
+    assert _builtin_name(frozen) == _builtin_name(table)
+
+    for method in (frozen.__setitem__, frozen.setdefault):
+        with pytest.raises(TypeError):
+            method(key, "Foo")
+    with pytest.raises(TypeError):
+        del frozen[key]
+    with pytest.raises(TypeError):
+        frozen |= {}
+    for method in (frozen.clear, frozen.popitem):
+        with pytest.raises(TypeError):
+            method()
+    with pytest.raises(TypeError):
+        frozen.update({})
+    assert frozen == table
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [copy.copy, copy.deepcopy, lambda frozen: pickle.loads(pickle.dumps(frozen))],  # noqa: S301
+)
+def test_freeze_copy(copier: Callable[[Any], Any]) -> None:
+    """Test copying and pickling frozen dictionaries."""
+    frozen = oui.freeze()
+    frozen_copy = copier(frozen)
+    assert type(frozen_copy) is FrozenOUIDict
+    assert frozen_copy == frozen
+    assert hash(frozen_copy) == hash(frozen)
+    assert frozen_copy[0x582D34] == "Qingping Electronics (Suzhou) Co., Ltd"
+
+
+@pytest.mark.parametrize("table", [characteristic, company, oui, service])
+def test_pickle_builtin(table: _NumberDict[Any]) -> None:
+    """Test that built-in dictionaries are pickled as a reference."""
+    data = pickle.dumps(table)
+    assert len(data) < 200  # noqa: PLR2004
+    assert pickle.loads(data) is table  # noqa: S301
+    frozen = pickle.loads(pickle.dumps(table.freeze()))  # noqa: S301
+    assert frozen == table
+    assert _builtin_name(frozen) == _builtin_name(table)
+
+
+def test_pickle_builtin_different(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a built-in dictionary with other contents can't be unpickled."""
+    data = pickle.dumps(company)
+    monkeypatch.setitem(company.__dict__, "_indexes", {"content_hash": "0" * 32})
+    with pytest.raises(ValueError, match="company"):
+        pickle.loads(data)  # noqa: S301
+
+
+@pytest.mark.parametrize(
+    "table",
+    [
+        CICDict({0x0001: "Foo", 0x0002: "Bar"}),
+        OUIDict({"58:2D:34": "Foo", "00:00:01": "Foo"}),
+        UUIDDict({0x180F: "Foo", 0x6E400001B5A3F393E0A9E50E24DCCA9E: "Bar"}),
+        FrozenCICDict({0x0001: "Foo"}),
+        CICDict(),
+        # Keys that the binary format of bluetooth_numbers.shared doesn't support
+        CICDict({-1: "Foo"}),
+        UUIDDict({0x10000: "Foo"}),
+        OUIDict({"58-2d-34": "Foo"}),
+    ],
+)
+def test_pickle_custom(table: _NumberDict[Any]) -> None:
+    """Test pickling dictionaries that aren't built in."""
+    table_copy = pickle.loads(pickle.dumps(table))  # noqa: S301
+    assert type(table_copy) is type(table)
+    assert table_copy == table
+
+
+@pytest.mark.parametrize("copier", [copy.copy, copy.deepcopy])
+def test_copy(copier: Callable[[Any], Any]) -> None:
+    """Test that copies share the indexes, but not the changes."""
+    table = CICDict({0x0001: "Foo"})
+    assert table.by_name("Foo") == (0x0001,)
+    table_copy = copier(table)
+    assert type(table_copy) is CICDict
+    assert table_copy.__dict__["_indexes"] == table.__dict__["_indexes"]
+    table_copy[0x0002] = "Foo"
+    assert table_copy.by_name("Foo") == (0x0001, 0x0002)
+    assert table.by_name("Foo") == (0x0001,)
+    assert table == {0x0001: "Foo"}
+
+
+def test_freeze_changed() -> None:
+    """Test that a frozen copy doesn't follow changes to the original."""
+    uuids = UUIDDict({UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"): "UART"})
+    assert uuids[0x6E400001B5A3F393E0A9E50E24DCCA9E] == "UART"
+    frozen = uuids.freeze()
+    uuids[UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")] = "Nordic UART"
+    assert frozen[0x6E400001B5A3F393E0A9E50E24DCCA9E] == "UART"
+    assert {frozen: 1}[UUIDDict(frozen).freeze()] == 1
+    assert _builtin_name(frozen) is None
@@ -0,0 +1,154 @@
+"""Test the bluetooth_numbers.enrich module."""
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+
+from bluetooth_numbers import characteristic, company, oui
+from bluetooth_numbers.dicts import CICDict
+
+np = pytest.importorskip("numpy")
+enrich = pytest.importorskip("bluetooth_numbers.enrich")
+
+QINGPING = "Qingping Electronics (Suzhou) Co., Ltd"
+
+
+def _numpy(values: list[Any]) -> Any:  # noqa: ANN401
+    return np.array(values, dtype=object)
+
+
+def _pyarrow(values: list[Any]) -> Any:  # noqa: ANN401
+    pa = pytest.importorskip("pyarrow")
+    return pa.chunked_array([values[:1], values[1:]])
+
+
+def _pandas(values: list[Any]) -> Any:  # noqa: ANN401
+    pd = pytest.importorskip("pandas")
+    if all(isinstance(value, int) for value in values if value is not None):
+        return pd.Series(values, dtype="Int64", name="keys")
+    return pd.Series(values, name="keys")
+
+
+def _polars(values: list[Any]) -> Any:  # noqa: ANN401
+    pl = pytest.importorskip("polars")
+    return pl.Series("keys", values)
+
+
+def _to_list(names: Any) -> list[str | None]:  # noqa: ANN401
+    if hasattr(names, "isna"):
+        return [None if empty else name for name, empty in zip(names, names.isna())]
+    if hasattr(names, "to_pylist"):
+        return list(names.to_pylist())
+    return list(names.to_list()) if hasattr(names, "to_list") else list(names)
+
+
+LIBRARIES = [_numpy, _pyarrow, _pandas, _polars]
+
+
+@pytest.mark.parametrize("library", LIBRARIES)
+@pytest.mark.parametrize(
+    ("function", "keys", "names"),
+    [
+        (
+            enrich.oui_names,
+            [
+                "58:2D:34:12:34:56",
+                None,
+                "58-2d-34",
+                "582D34",
+                "582D.3412.3456",
+                "582d34123456",
+                "FOOBAR",
+                "58:2D:3",
+                "",
+                "58x2Dy34",
+                "58:2D:34:12:34:5Z",
+                "582D34XXXXXX",
+                "582D-3412-3456",
+            ],
+            [QINGPING, None, QINGPING, QINGPING, QINGPING, QINGPING] + [None] * 7,
+        ),
+        (enrich.oui_names, [0x582D34, None, 0x1000000], [QINGPING, None, None]),
+        (
+            enrich.company_names,
+            [0x004C, None, 0x0499, 0xFFFE, -1],
+            ["Apple, Inc.", None, "Ruuvi Innovations Ltd.", None, None],
+        ),
+        (
+            enrich.uuid_names,
+            [
+                "180F",
+                "0x180f",
+                None,
+                "0000180F",
+                "0000180f-0000-1000-8000-00805f9b34fb",
+                "6E400001B5A3F393E0A9E50E24DCCA9E",
+                "0x0000FEAA",
+                "180G",
+                "0x18",
+            ],
+            ["Battery Service"] * 2
+            + [None]
+            + ["Battery Service"] * 2
+            + ["Nordic UART Service", "Eddystone", None, None],
+        ),
+        (
+            enrich.uuid_names,
+            [0x180F, None, 0x10000],
+            ["Battery Service", None, None],
+        ),
+    ],
+)
+def test_names(
+    library: Callable[[list[Any]], Any],
+    function: Callable[[Any], Any],
+    keys: list[Any],
+    names: list[str | None],
+) -> None:
+    """Test enriching columns of each library."""
+    assert _to_list(function(library(keys))) == names
+
+
+def test_result_types() -> None:
+    """Test that the names are dictionary-encoded in the library of the column."""
+    pa = pytest.importorskip("pyarrow")
+    pd = pytest.importorskip("pandas")
+    pl = pytest.importorskip("polars")
+
+    names = enrich.company_names(pa.array([0x004C, 0x0499]))
+    assert pa.types.is_dictionary(names.type)
+    names = enrich.company_names(pd.Series([0x004C], index=[7], name="company"))
+    assert names.dtype == "category"
+    assert names.name == "company"
+    assert list(names.index) == [7]
+    assert enrich.company_names(pl.Series("company", [0x004C])).dtype == pl.Categorical
+
+
+def test_other_tables() -> None:
+    """Test enriching with other and changed dictionaries."""
+    assert list(enrich.uuid_names(np.array(["2A37"]), characteristic)) == [
+        "Heart Rate Measurement",
+    ]
+    companies = CICDict({0x0001: "Foo"})
+    assert list(enrich.company_names(np.array([1, 2]), companies)) == ["Foo", None]
+    companies[0x0002] = "Bar"
+    assert list(enrich.company_names(np.array([1, 2]), companies)) == ["Foo", "Bar"]
+    assert list(enrich.company_names(np.array([1]), CICDict())) == [None]
+
+
+def test_same_as_lookups() -> None:
+    """Test that enriching gives the same names as looking up every key."""
+    ouis = [f"{number:06X}" for number in range(0, 0x1000000, 0x1FF)] + list(oui)
+    ouis += ["58-2d:34", "58x2Dy34", "58-2D-3G"]
+    assert list(enrich.oui_names(np.array(ouis))) == oui.lookup_many(ouis)
+    companies = list(range(0x10000))
+    assert list(enrich.company_names(np.array(companies))) == company.lookup_many(
+        companies,
+    )
+
+
+def test_unsupported_column() -> None:
+    """Test that an unsupported type of column raises TypeError."""
+    with pytest.raises(TypeError):
+        enrich.company_names([0x004C])
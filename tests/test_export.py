@@ -0,0 +1,108 @@
+"""Test the bluetooth_numbers.export module."""
+from __future__ import annotations
+
+import sqlite3
+from typing import TYPE_CHECKING
+
+import pytest
+
+from bluetooth_numbers import company, oui
+from bluetooth_numbers.export import export_sqlite, main, uuid_rows
+from bluetooth_numbers.utils import is_uint16
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory: pytest.TempPathFactory) -> sqlite3.Connection:
+    """Return a connection to an exported SQLite database."""
+    path = tmp_path_factory.mktemp("export") / "bluetooth_numbers.sqlite"
+    export_sqlite(path)
+    return sqlite3.connect(path)
+
+
+@pytest.mark.parametrize(
+    ("query", "result"),
+    [
+        ("SELECT count(*) FROM company", len(company)),
+        ("SELECT count(*) FROM oui", len(oui)),
+        ("SELECT name FROM company WHERE id = 0x0499", "Ruuvi Innovations Ltd."),
+        (
+            "SELECT name FROM oui WHERE prefix = 0x582D34",
+            "Qingping Electronics (Suzhou) Co., Ltd",
+        ),
+        ("SELECT oui FROM oui WHERE prefix = 0x582D34", "58:2D:34"),
+        ("SELECT name FROM service WHERE uuid16 = 0x180F", "Battery Service"),
+        (
+            "SELECT uuid FROM service WHERE name = 'Battery Service'",
+            "0000180f-0000-1000-8000-00805f9b34fb",
+        ),
+        (
+            "SELECT uuid16 FROM service "
+            "WHERE uuid = '6e400001-b5a3-f393-e0a9-e50e24dcca9e'",
+            None,
+        ),
+        (
+            "SELECT name FROM characteristic WHERE uuid16 = 0x2A37",
+            "Heart Rate Measurement",
+        ),
+        (
+            "SELECT name FROM descriptor WHERE uuid16 = 0x2901",
+            "Characteristic User Descriptor",
+        ),
+        (
+            "SELECT key FROM description "
+            "WHERE description MATCH 'heart rate' AND uuid_type = 'service'",
+            "0000180d-0000-1000-8000-00805f9b34fb",
+        ),
+        (
+            "SELECT key FROM description "
+            "WHERE description MATCH 'qingping' AND uuid_type = 'oui'",
+            0x582D34,
+        ),
+    ],
+)
+def test_sqlite(database: sqlite3.Connection, query: str, result: object) -> None:
+    """Test querying the exported SQLite database."""
+    assert database.execute(query).fetchone()[0] == result
+
+
+def test_sqlite_indexes(database: sqlite3.Connection) -> None:
+    """Test that the keys and names are indexed."""
+    indexes = {
+        name
+        for (name,) in database.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'",
+        )
+    }
+    assert {"company_name", "oui_name", "service_uuid16", "service_name"} <= indexes
+    plan = database.execute(
+        "EXPLAIN QUERY PLAN SELECT uuid FROM characteristic WHERE name = 'x'",
+    ).fetchall()
+    assert "characteristic_name" in str(plan)
+
+
+def test_uuid_rows() -> None:
+    """Test that UUID rows have valid 16-bit UUIDs and no duplicate UUIDs."""
+    rows = list(uuid_rows())
+    assert len({uuid for uuid, _, _ in rows}) == len(rows)
+    assert all(uuid16 is None or is_uint16(uuid16) for _, uuid16, _ in rows)
+
+
+def test_parquet(tmp_path: Path) -> None:
+    """Test exporting the tables to Parquet files."""
+    pq = pytest.importorskip("pyarrow.parquet")
+    main(["--parquet", str(tmp_path / "parquet")])
+    table = pq.read_table(tmp_path / "parquet" / "company.parquet")
+    assert table.num_rows == len(company)
+    assert str(table.schema.field("id").type) == "uint16"
+    table = pq.read_table(tmp_path / "parquet" / "service.parquet").to_pydict()
+    index = table["uuid16"].index(0x180F)
+    assert table["name"][index] == "Battery Service"
+
+
+def test_no_arguments() -> None:
+    """Test that the command requires an output."""
+    with pytest.raises(SystemExit):
+        main([])
@@ -52,3 +52,74 @@ def test_unknown_oui(prefix: str) -> None:
     """
     with pytest.raises(UnknownOUIError):
         _ = oui[prefix]
+
+
+@pytest.mark.parametrize(
+    ("prefix", "name"),
+    [
+        (0x582D34, "Qingping Electronics (Suzhou) Co., Ltd"),
+        (0xAC6706, "Ruckus Wireless"),
+        (0x245BA7, "Apple, Inc."),
+    ],
+)
+def test_oui_int(prefix: int, name: str) -> None:
+    """Test the oui dict with known values as 24-bit unsigned integers."""
+    assert oui[prefix] == name
+
+
+def test_oui_int_all() -> None:
+    """Test whether all OUIs can be found as 24-bit unsigned integers."""
+    for prefix, name in oui.items():
+        assert oui[int(prefix.replace(":", ""), 16)] == name
+
+
+@pytest.mark.parametrize(
+    "prefix",
+    [
+        -1,
+        0x1000000,
+    ],
+)
+def test_invalid_oui_int(prefix: int) -> None:
+    """Test the oui dict with integers that aren't 24-bit unsigned integers.
+
+    This should raise a WrongOUIFormatError exception.
+    """
+    with pytest.raises(WrongOUIFormatError):
+        _ = oui[prefix]
+
+
+def test_unknown_oui_int() -> None:
+    """Test the oui dict with an unknown prefix as a 24-bit unsigned integer.
+
+    This should raise an UnknownOUIError exception.
+    """
+    with pytest.raises(UnknownOUIError):
+        _ = oui[0xABCDEF]
+
+
+def test_oui_vendors() -> None:
+    """Test whether every vendor name is stored once with its vendor ID."""
+    assert len(oui.vendors) == len(set(oui.vendors))
+    assert set(oui.vendors) == set(oui.values())
+    for prefix, name in oui.items():
+        assert oui.vendors[oui.vendor_id(prefix)] == name
+
+
+@pytest.mark.parametrize(
+    ("name", "prefix"),
+    [
+        ("Qingping Electronics (Suzhou) Co., Ltd", "58:2D:34"),
+        ("Apple, Inc.", "24:5B:A7"),
+        ("Signify B.V.", "C4:29:96"),
+    ],
+)
+def test_oui_prefixes(name: str, prefix: str) -> None:
+    """Test whether the OUIs of a vendor can be found by its name."""
+    assert prefix in oui.prefixes(name)
+    assert all(oui[other] == name for other in oui.prefixes(name))
+
+
+def test_oui_prefixes_unknown() -> None:
+    """Test whether an unknown vendor name has no OUIs."""
+    assert oui.prefixes("Frobnicator Inc.") == ()
@@ -0,0 +1,33 @@
+"""Test the bluetooth_numbers.prefork module."""
+from __future__ import annotations
+
+import gc
+
+from bluetooth_numbers import characteristic, company, descriptor, oui, service
+from bluetooth_numbers.prefork import warmup
+from bluetooth_numbers.reverse_lookup import Match
+
+
+def test_warmup() -> None:
+    """Test that warming up builds the indexes and freezes the objects."""
+    for table in (characteristic, company, descriptor, oui, service):
+        table.__dict__.pop("_indexes", None)
+    try:
+        reverse_lookup = warmup()
+        assert gc.get_freeze_count() > 0
+    finally:
+        gc.unfreeze()
+
+    indexes = {"names", "names_casefold", "content_hash"}
+    assert indexes <= set(company.__dict__["_indexes"])
+    assert {"vendor_ids", "int"} <= set(oui.__dict__["_indexes"])
+    assert "families" in service.__dict__["_indexes"]
+    assert Match(0x180F, "Battery Service", "service") in reverse_lookup.lookup(
+        "battery",
+    )
+
+
+def test_warmup_without_freeze() -> None:
+    """Test warming up without freezing the objects."""
+    warmup(freeze=False)
+    assert gc.get_freeze_count() == 0
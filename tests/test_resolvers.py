@@ -0,0 +1,135 @@
+"""Test the bluetooth_numbers.resolvers module."""
+from __future__ import annotations
+
+from typing import Any, Callable
+from uuid import UUID
+
+import pytest
+
+from bluetooth_numbers import characteristic, company, oui, service
+from bluetooth_numbers.dicts import CICDict, OUIDict, UUIDDict, _NumberDict
+from bluetooth_numbers.resolvers import (
+    Resolver,
+    make_company_resolver,
+    make_oui_resolver,
+    make_uuid_resolver,
+)
+
+NORDIC_UART = 0x6E400001_B5A3_F393_E0A9_E50E24DCCA9E
+
+COMPANY_KEYS: list[Any] = [0x004C, 0x0499, 0xFFFE, -1, 0x10000, "0x004C", None]
+OUI_KEYS: list[Any] = [
+    "58:2D:34",
+    "58-2d-34",
+    "582D34",
+    "AB:CD:EF",
+    "FOOBAR",
+    "",
+    0x582D34,
+    0xABCDEF,
+    0x1000000,
+    -1,
+]
+UUID_KEYS: list[Any] = [
+    0x180F,
+    0xFFFE,
+    NORDIC_UART,
+    0x0000180F_0000_1000_8000_00805F9B34FB,
+    0x10000,
+    -1,
+    UUID(int=NORDIC_UART),
+    UUID("0000180f-0000-1000-8000-00805f9b34fb"),
+    UUID(int=1),
+    UUID(int=0x180F),
+    (0x180F).to_bytes(16, "little"),
+    "00000000-0000-0000-0000-00000000180f",
+    "180F",
+    "0000180f-0000-1000-8000-00805f9b34fb",
+    "6e400001-b5a3-f393-e0a9-e50e24dcca9e",
+    "180G",
+    b"\x0f\x18",
+    b"\x0f",
+    None,
+]
+
+
+@pytest.mark.parametrize(
+    ("make_resolver", "table", "keys"),
+    [
+        (make_company_resolver, company, COMPANY_KEYS),
+        (lambda table, default: make_oui_resolver(table, None, default), oui, OUI_KEYS),
+        *(
+            (
+                lambda table, default, key_format=key_format: make_oui_resolver(
+                    table,
+                    [key_format],
+                    default,
+                ),
+                oui,
+                OUI_KEYS,
+            )
+            for key_format in ("normalized", "str", "int")
+        ),
+        (
+            lambda table, default: make_oui_resolver(table, ["str", "int"], default),
+            oui,
+            OUI_KEYS,
+        ),
+        (
+            lambda table, default: make_uuid_resolver(table, None, default),
+            service,
+            UUID_KEYS,
+        ),
+        *(
+            (
+                lambda table, default, key_format=key_format: make_uuid_resolver(
+                    table,
+                    [key_format],
+                    default,
+                ),
+                service,
+                UUID_KEYS,
+            )
+            for key_format in ("int", "uuid", "str")
+        ),
+        (
+            lambda table, default: make_uuid_resolver(table, ["int", "uuid"], default),
+            characteristic,
+            [0x2A37, UUID("6E400002-B5A3-F393-E0A9-E50E24DCCA9E"), *UUID_KEYS],
+        ),
+    ],
+)
+@pytest.mark.parametrize("default", [None, "Unknown"])
+def test_same_as_lookups(
+    make_resolver: Callable[[Any, str | None], Resolver],
+    table: _NumberDict[Any],
+    keys: list[Any],
+    default: str | None,
+) -> None:
+    """Test that a resolver gives the same names as a lookup, in every format."""
+    resolve = make_resolver(table, default)
+    assert [resolve(key) for key in keys] == table.lookup_many(keys, default)
+
+
+def test_custom_tables() -> None:
+    """Test resolvers for dictionaries that aren't built in."""
+    assert make_company_resolver(CICDict({0x0001: "Foo"}))(0x0001) == "Foo"
+    ouis = OUIDict({"00:00:01": "Foo"})
+    assert make_oui_resolver(ouis, ["int"])(0x000001) == "Foo"
+    assert make_oui_resolver(ouis, ["str"])("000001") == "Foo"
+    uuids = UUIDDict({UUID(int=NORDIC_UART): "UART"})
+    assert make_uuid_resolver(uuids, ["uuid"])(UUID(int=NORDIC_UART)) == "UART"
+    assert make_uuid_resolver(uuids, ["int"])(0x180F) is None
+
+
+@pytest.mark.parametrize(
+    ("make_resolver", "formats"),
+    [(make_oui_resolver, ["uuid"]), (make_uuid_resolver, ["normalized", "int"])],
+)
+def test_unsupported_formats(
+    make_resolver: Callable[..., Resolver],
+    formats: list[str],
+) -> None:
+    """Test that formats that a table doesn't support raise ValueError."""
+    with pytest.raises(ValueError, match="Unsupported formats"):
+        make_resolver(formats=formats)
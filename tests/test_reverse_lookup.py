@@ -1,7 +1,13 @@
 """Test the bluetooth_numbers.reverse_lookup module."""
+from __future__ import annotations
+
+import asyncio
+from uuid import UUID
+
 import pytest
 
-from bluetooth_numbers.reverse_lookup import Match, ReverseLookup
+from bluetooth_numbers import oui, service
+from bluetooth_numbers.reverse_lookup import Match, ReverseLookup, index_terms
 
 
 @pytest.fixture()
@@ -65,3 +71,94 @@ def test_bad_valid_terms_reverse_lookup(reverse_lookup: ReverseLookup) -> None:
         "Power FooBar",
         logic="SUBSTR",
     )
+
+
+def test_index_terms() -> None:
+    """Test whether index_terms indexes every term of a description once."""
+    assert index_terms(["Cycling Power", "power power"]) == {
+        "cycling": [0],
+        "power": [0, 1],
+    }
+
+
+def test_precomputed_index(reverse_lookup: ReverseLookup) -> None:
+    """Test whether the precomputed index is up to date with the dictionaries."""
+    built_index = reverse_lookup._build_index()  # noqa: SLF001
+    assert {term: tuple(positions) for term, positions in built_index.items()} == {
+        term: tuple(positions) for term, positions in reverse_lookup.index.items()
+    }
+
+
+def test_changed_dict_reverse_lookup(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test whether a reverse lookup finds the entries of a changed dictionary."""
+    monkeypatch.setitem(service, 0xFFF0, "Frobnicator Service")
+    assert ReverseLookup().lookup("frobnicator") == {
+        Match(0xFFF0, "Frobnicator Service", "service"),
+    }
+
+
+def test_create_reverse_lookup() -> None:
+    """Test creating a ReverseLookup instance in an executor."""
+
+    async def create() -> ReverseLookup:
+        return await ReverseLookup.create()
+
+    reverse_lookup = asyncio.run(create())
+    assert Match(0x180D, "Heart Rate", "service") in reverse_lookup.lookup(
+        "heart rate",
+        uuid_types=["service"],
+        logic="AND",
+    )
+
+
+def test_matches(reverse_lookup: ReverseLookup) -> None:
+    """Test that the matches of a lookup behave like a set of Match tuples."""
+    matches = reverse_lookup.lookup("battery", uuid_types=["service"])
+    battery = Match(0x180F, "Battery Service", "service")
+    assert matches == set(matches)
+    assert len(matches) == len(list(matches))
+    assert battery in matches
+    assert (0x180F, "Battery Service", "service") in matches
+    others: list[object] = [
+        Match(0x180F, "Battery Service", "characteristic"),
+        Match(0x180F, "Battery", "service"),
+        (0x180F, None, "service"),
+        "Battery Service",
+    ]
+    assert all(other not in matches for other in others)
+    assert matches & {battery} == {battery}
+    assert isinstance(matches | set(), set)
+    assert repr(reverse_lookup.lookup("foobar")) == "set()"
+
+
+def test_matches_uuid(reverse_lookup: ReverseLookup) -> None:
+    """Test that 128-bit UUIDs are matched as UUID objects and in other formats."""
+    uart = UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")
+    matches = reverse_lookup.lookup("nordic", uuid_types=["service"])
+    assert Match(uart, "Nordic UART Service", "service") in set(matches)
+    for uuid in (uart, uart.int, str(uart), uart.bytes[::-1]):
+        assert (uuid, "Nordic UART Service", "service") in matches
+    battery = reverse_lookup.lookup("battery", uuid_types=["service"])
+    assert (
+        Match(
+            UUID("0000180F-0000-1000-8000-00805F9B34FB"),
+            "Battery Service",
+            "service",
+        )
+        in battery
+    )
+    assert Match(UUID(int=1), "Battery Service", "service") not in battery
+    assert Match(-1, "Battery Service", "service") not in battery
+    assert Match(uart, "Nordic UART Service", "characteristic") not in matches
+
+
+def test_matches_all_oui(reverse_lookup: ReverseLookup) -> None:
+    """Test that a large result has the same matches as a scan of the descriptions."""
+    matches = reverse_lookup.lookup("inc.", uuid_types=["oui"])
+    expected = {
+        Match(prefix, name, "oui")
+        for prefix, name in oui.items()
+        if "inc." in name.lower().split(" ")
+    }
+    assert matches == expected
+    assert all(match in matches for match in expected)
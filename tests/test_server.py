@@ -0,0 +1,217 @@
+"""Test the bluetooth_numbers.server module."""
+from __future__ import annotations
+
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from bluetooth_numbers.reverse_lookup import ReverseLookup
+from bluetooth_numbers.server import MAX_BATCH_SIZE, MAX_REQUEST_SIZE, LookupServer
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def server() -> LookupServer:
+    """Return a lookup server."""
+    return LookupServer()
+
+
+@pytest.mark.parametrize(
+    ("request_", "response"),
+    [
+        (
+            {"id": "a", "table": "company", "keys": ["0x0499", "FFFE", 76, "x"]},
+            {
+                "id": "a",
+                "results": ["Ruuvi Innovations Ltd.", None, "Apple, Inc.", None],
+            },
+        ),
+        (
+            {"table": "oui", "keys": ["58-2d-34", "FOOBAR"]},
+            {"results": ["Qingping Electronics (Suzhou) Co., Ltd", None]},
+        ),
+        (
+            {
+                "table": "service",
+                "keys": ["180F", "6E400001-B5A3-F393-E0A9-E50E24DCCA9E", [1]],
+            },
+            {"results": ["Battery Service", "Nordic UART Service", None]},
+        ),
+        (
+            {"table": "characteristic", "keys": ["2A37"]},
+            {"results": ["Heart Rate Measurement"]},
+        ),
+        (
+            {"table": "descriptor", "keys": ["0x2901"]},
+            {"results": ["Characteristic User Descriptor"]},
+        ),
+        (
+            {
+                "table": "search",
+                "keys": ["heart rate", "foobar"],
+                "types": ["service"],
+            },
+            {"results": [[["service", "0x180D", "Heart Rate"]], []]},
+        ),
+        (
+            {
+                "table": "search",
+                "keys": ["Power Feature"],
+                "types": ["characteristic"],
+                "logic": "SUBSTR",
+            },
+            {"results": [[["characteristic", "0x2A65", "Cycling Power Feature"]]]},
+        ),
+    ],
+)
+def test_handle(
+    server: LookupServer,
+    request_: dict[str, Any],
+    response: dict[str, Any],
+) -> None:
+    """Test answering valid requests."""
+    assert server.handle(request_) == response
+
+
+@pytest.mark.parametrize(
+    "request_",
+    [
+        [],
+        42,
+        {"keys": ["0x0499"]},
+        {"table": "company"},
+        {"table": "company", "keys": "0x0499"},
+        {"table": "foobar", "keys": []},
+        {"table": "search", "keys": ["power"], "logic": "XOR"},
+        {"table": "search", "keys": ["power"], "types": ["foobar"]},
+        {"table": "company", "keys": [76] * (MAX_BATCH_SIZE + 1)},
+        {"table": "search", "keys": ["power"] * (MAX_BATCH_SIZE + 1)},
+    ],
+)
+def test_handle_invalid(server: LookupServer, request_: Any) -> None:  # noqa: ANN401
+    """Test answering invalid requests."""
+    assert "error" in server.handle(request_)
+
+
+def test_shared_reverse_lookup() -> None:
+    """Test answering searches with a reverse lookup that is passed in."""
+    reverse_lookup = ReverseLookup()
+    server = LookupServer(reverse_lookup)
+    assert server.reverse_lookup is reverse_lookup
+
+
+def test_handle_line(server: LookupServer) -> None:
+    """Test answering request lines."""
+    assert server.handle_line(b'{"table": "company", "keys": [1177]}\n') == (
+        b'{"results":["Ruuvi Innovations Ltd."]}\n'
+    )
+    assert json.loads(server.handle_line(b"{foobar\n"))["error"].startswith(
+        "Invalid JSON",
+    )
+
+
+def test_handle_line_async() -> None:
+    """Test answering a request line in an executor that is passed in."""
+    line = b'{"table": "company", "keys": [1177]}\n'
+    with ThreadPoolExecutor(1, thread_name_prefix="lookup") as executor:
+        server = LookupServer(executor=executor)
+        assert server.executor is executor
+        assert asyncio.run(server.handle_line_async(line)) == server.handle_line(line)
+
+
+REQUESTS = (
+    b'{"id": 1, "table": "company", "keys": ["0x0499"]}\n'
+    b"\n"
+    b'{"id": 2, "table": "service", "keys": ["180F"]}\n'
+)
+RESPONSES = (
+    b'{"id":1,"results":["Ruuvi Innovations Ltd."]}\n'
+    b'{"id":2,"results":["Battery Service"]}\n'
+)
+
+
+def test_unix(server: LookupServer, tmp_path: Path) -> None:
+    """Test answering request lines over a Unix domain socket."""
+
+    async def exchange() -> bytes:
+        socket_server = await server.start_unix(tmp_path / "socket")
+        async with socket_server:
+            reader, writer = await asyncio.open_unix_connection(tmp_path / "socket")
+            writer.write(REQUESTS)
+            writer.write_eof()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    assert asyncio.run(exchange()) == RESPONSES
+
+
+def test_http(server: LookupServer) -> None:
+    """Test answering HTTP requests on a kept-alive connection."""
+
+    async def exchange() -> list[bytes]:
+        http_server = await server.start_http("127.0.0.1", 0)
+        async with http_server:
+            port = http_server.sockets[0].getsockname()[1]  # type: ignore[attr-defined]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                b"POST / HTTP/1.1\r\n"
+                b"Content-Length: %d\r\n\r\n%s"
+                b"GET / HTTP/1.1\r\n\r\n"
+                b"POST /lookup HTTP/1.1\r\n"
+                b"Connection: close\r\n"
+                b"Content-Length: %d\r\n\r\n%s"
+                % (len(REQUESTS), REQUESTS, len(REQUESTS), REQUESTS),
+            )
+            responses = (await reader.read()).split(b"HTTP/1.1 ")[1:]
+            writer.close()
+        return responses
+
+    first, second, third = asyncio.run(exchange())
+    assert first.startswith(b"200 OK\r\n")
+    assert b"Connection: keep-alive\r\n" in first
+    assert first.endswith(b"\r\n\r\n" + RESPONSES)
+    assert second.startswith(b"405 Method Not Allowed\r\n")
+    assert third.startswith(b"200 OK\r\n")
+    assert b"Connection: close\r\n" in third
+    assert third.endswith(b"\r\n\r\n" + RESPONSES)
+
+
+@pytest.mark.parametrize(
+    ("content_length", "status"),
+    [
+        (b"foobar", b"400 Bad Request"),
+        (b"-1", b"400 Bad Request"),
+        (b"+1", b"400 Bad Request"),
+        (b"1_0", b"400 Bad Request"),
+        (b"\xb2", b"400 Bad Request"),
+        (b"%d" % (MAX_REQUEST_SIZE + 1), b"413 Payload Too Large"),
+    ],
+)
+def test_http_content_length(
+    server: LookupServer,
+    content_length: bytes,
+    status: bytes,
+) -> None:
+    """Test whether an invalid or too large Content-Length is rejected."""
+
+    async def exchange() -> bytes:
+        http_server = await server.start_http("127.0.0.1", 0)
+        async with http_server:
+            port = http_server.sockets[0].getsockname()[1]  # type: ignore[attr-defined]
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                b"POST / HTTP/1.1\r\nContent-Length: %s\r\n\r\n" % content_length,
+            )
+            response = await reader.read()
+            writer.close()
+        return response
+
+    response = asyncio.run(exchange())
+    assert response.startswith(b"HTTP/1.1 " + status + b"\r\n")
+    assert b"Connection: close\r\n" in response
@@ -1,10 +1,13 @@
 """Test the bluetooth_numbers._services module."""
+from __future__ import annotations
+
 from uuid import UUID
 
 import pytest
 
 from bluetooth_numbers import service
 from bluetooth_numbers.exceptions import No16BitIntegerError, UnknownUUIDError
+from bluetooth_numbers.utils import is_standard_uuid128, is_uint16
 
 
 @pytest.mark.parametrize(
@@ -100,3 +103,187 @@ def test_unknown_uuid128(uuid: UUID) -> None:
     """
     with pytest.raises(UnknownUUIDError):
         _ = service[uuid]
+
+
+@pytest.mark.parametrize(
+    ("uuid", "name"),
+    [
+        (0x7905F431B5CE4E99A40F4B1E122D00D0, "Apple Notification Center Service"),
+        (0x6E400001B5A3F393E0A9E50E24DCCA9E, "Nordic UART Service"),
+        (0x0000180F00001000800000805F9B34FB, "Battery Service"),
+    ],
+)
+def test_uuid128_int(uuid: int, name: str) -> None:
+    """Test the service dict with 128-bit UUIDs as integers."""
+    assert service[uuid] == name
+
+
+def test_uuid128_all() -> None:
+    """Test whether all 128-bit UUIDs can be found as UUIDs and strings."""
+    for uuid, name in service.items():
+        if isinstance(uuid, UUID):
+            assert service[uuid] == name
+            assert service[uuid.int] == name
+            assert service[str(uuid)] == name
+            assert uuid in service
+
+
+@pytest.mark.parametrize(
+    ("uuid", "name"),
+    [
+        ("180F", "Battery Service"),
+        ("180f", "Battery Service"),
+        ("0000180F", "Battery Service"),
+        ("0000180f-0000-1000-8000-00805f9b34fb", "Battery Service"),
+        ("0000FEAA", "Eddystone"),
+        ("6e400001-b5a3-f393-e0a9-e50e24dcca9e", "Nordic UART Service"),
+        ("6E400001B5A3F393E0A9E50E24DCCA9E", "Nordic UART Service"),
+        ("{6e400001-b5a3-f393-e0a9-e50e24dcca9e}", "Nordic UART Service"),
+        ("urn:uuid:0000180f-0000-1000-8000-00805f9b34fb", "Battery Service"),
+    ],
+)
+def test_uuid_str(uuid: str, name: str) -> None:
+    """Test the service dict with UUIDs as strings."""
+    assert service[uuid] == name
+
+
+@pytest.mark.parametrize(
+    "uuid",
+    [
+        "",
+        "180G",
+        "+18F",
+        "0x180F",
+        " 180F",
+        "6e400001_b5a3_f393_e0a9_e50e24dcca9e",
+        "6e400001ab5a3af393ae0a9ae50e24dcca9e",
+        "6e400001-b5a3-f393-e0a9-e50e24dcca9-",
+    ],
+)
+def test_invalid_uuid_str(uuid: str) -> None:
+    """Test the service dict with strings that aren't UUIDs.
+
+    This should raise a No16BitIntegerError exception.
+    """
+    with pytest.raises(No16BitIntegerError):
+        _ = service[uuid]
+
+
+@pytest.mark.parametrize(
+    "uuid",
+    ["FFFE", "0001FFFE", "e85e7f31-69a0-4784-ae25-fd3f452bf563"],
+)
+def test_unknown_uuid_str(uuid: str) -> None:
+    """Test the service dict with unknown UUIDs as strings.
+
+    This should raise an UnknownUUIDError exception.
+    """
+    with pytest.raises(UnknownUUIDError):
+        _ = service[uuid]
+
+
+@pytest.mark.parametrize(
+    "uuid",
+    [
+        0xE85E7F3169A04784AE25FD3F452BF563,
+        0x0000179900001000800000805F9B34FB,
+    ],
+)
+def test_unknown_uuid128_int(uuid: int) -> None:
+    """Test the service dict with unknown 128-bit UUIDs as integers.
+
+    This should raise an UnknownUUIDError exception.
+    """
+    with pytest.raises(UnknownUUIDError):
+        _ = service[uuid]
+
+
+@pytest.mark.parametrize(
+    ("uuid", "name"),
+    [
+        (bytes.fromhex("0F18"), "Battery Service"),
+        (bytes.fromhex("0F180000"), "Battery Service"),
+        (bytes.fromhex("FB349B5F80000080001000000F180000"), "Battery Service"),
+        (bytes.fromhex("9ECADC240EE5A9E093F3A3B50100406E"), "Nordic UART Service"),
+        (memoryview(bytes.fromhex("AAFE")), "Eddystone"),
+    ],
+)
+def test_uuid_little_endian(uuid: bytes | memoryview, name: str) -> None:
+    """Test the service dict with UUIDs as bytes in little-endian byte order."""
+    assert service[uuid] == name
+
+
+def test_uuid_little_endian_all() -> None:
+    """Test whether all UUIDs can be found as bytes in little-endian byte order."""
+    for uuid, name in service.items():
+        if isinstance(uuid, UUID):
+            assert service[uuid.bytes[::-1]] == name
+        elif is_uint16(uuid):
+            assert service[uuid.to_bytes(2, "little")] == name
+            assert service[uuid.to_bytes(4, "little")] == name
+
+
+@pytest.mark.parametrize(
+    "uuid",
+    [
+        bytes.fromhex("FEFF"),
+        bytes.fromhex("FEFF0000"),
+        bytes.fromhex("0F180100"),
+        bytes.fromhex("63F52B453FFD25AE8447A06931F75EE8"),
+    ],
+)
+def test_unknown_uuid_little_endian(uuid: bytes) -> None:
+    """Test the service dict with unknown UUIDs in little-endian byte order.
+
+    This should raise an UnknownUUIDError exception.
+    """
+    with pytest.raises(UnknownUUIDError):
+        _ = service[uuid]
+
+
+@pytest.mark.parametrize("uuid", [b"", b"\x0f", b"\x0f\x18\x00", bytes(8)])
+def test_invalid_uuid_little_endian(uuid: bytes) -> None:
+    """Test the service dict with bytes that don't have the size of a UUID.
+
+    This should raise a No16BitIntegerError exception.
+    """
+    with pytest.raises(No16BitIntegerError):
+        _ = service[uuid]
+
+
+NORDIC_UART = {UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"): "Nordic UART Service"}
+
+
+@pytest.mark.parametrize(
+    ("uuid", "family"),
+    [
+        (UUID("6E400004-B5A3-F393-E0A9-E50E24DCCA9E"), NORDIC_UART),
+        (UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E"), NORDIC_UART),
+        (0x6E40FFFFB5A3F393E0A9E50E24DCCA9E, NORDIC_UART),
+        (bytes.fromhex("9ECADC240EE5A9E093F3A3B5FFFF406E"), NORDIC_UART),
+        (UUID("6E410001-B5A3-F393-E0A9-E50E24DCCA9E"), {}),
+        (UUID("0000180F-0000-1000-8000-00805F9B34FB"), {}),
+        (0x180F, {}),
+        (bytes.fromhex("0F18"), {}),
+    ],
+)
+def test_family(uuid: UUID | int | bytes, family: dict[UUID, str]) -> None:
+    """Test finding the 128-bit UUIDs with the same base UUID as a UUID."""
+    assert service.family(uuid) == family
+
+
+@pytest.mark.parametrize("uuid", [-1, 1 << 128, 6.5, bytes(8)])
+def test_invalid_family(uuid: int | bytes) -> None:
+    """Test finding the family of invalid keys.
+
+    This should raise a No16BitIntegerError exception.
+    """
+    with pytest.raises(No16BitIntegerError):
+        service.family(uuid)
+
+
+def test_family_all() -> None:
+    """Test that every 128-bit UUID is in its own family."""
+    for uuid, name in service.items():
+        if isinstance(uuid, UUID) and not is_standard_uuid128(uuid):
+            assert service.family(uuid)[uuid] == name
@@ -0,0 +1,194 @@
+"""Test the bluetooth_numbers.shared module."""
+from __future__ import annotations
+
+import multiprocessing
+import pickle
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from bluetooth_numbers import company, oui, service
+from bluetooth_numbers.dicts import CICDict, OUIDict, UUIDDict, _NumberDict
+from bluetooth_numbers.exceptions import (
+    No16BitIntegerError,
+    UnknownCICError,
+    UnknownOUIError,
+    UnknownUUIDError,
+    WrongOUIFormatError,
+)
+from bluetooth_numbers.shared import (
+    SharedCICDict,
+    SharedOUIDict,
+    SharedUUIDDict,
+    attach,
+    pack,
+    share,
+    unpack,
+)
+
+NORDIC_UART = 0x6E400001_B5A3_F393_E0A9_E50E24DCCA9E
+
+
+def _sort_key(key: Any) -> Any:  # noqa: ANN401
+    """Sort 128-bit UUIDs as the integers they're stored as."""
+    return key.int if isinstance(key, UUID) else key
+
+
+@pytest.mark.parametrize(
+    ("table", "shared_type"),
+    [
+        (company, SharedCICDict),
+        (oui, SharedOUIDict),
+        (service, SharedUUIDDict),
+        (CICDict(), SharedCICDict),
+        (UUIDDict({NORDIC_UART: "Nordic UART Service"}), SharedUUIDDict),
+    ],
+)
+def test_same_contents(table: _NumberDict[Any], shared_type: type[Any]) -> None:
+    """Test that a shared dictionary has the same keys and names."""
+    shared = shared_type(pack(table))
+    assert len(shared) == len(table)
+    assert list(shared) == sorted(table, key=_sort_key)
+    assert dict(shared.items()) == table
+    assert all(shared[key] == name for key, name in table.items())
+    assert all(key in shared for key in table)
+
+
+@pytest.mark.parametrize(
+    ("table", "shared_type", "key", "name"),
+    [
+        (company, SharedCICDict, 0x0499, "Ruuvi Innovations Ltd."),
+        (oui, SharedOUIDict, "58-2d-34", "Qingping Electronics (Suzhou) Co., Ltd"),
+        (oui, SharedOUIDict, 0x582D34, "Qingping Electronics (Suzhou) Co., Ltd"),
+        (service, SharedUUIDDict, UUID(int=NORDIC_UART), "Nordic UART Service"),
+        (service, SharedUUIDDict, "0000180f", "Battery Service"),
+        (service, SharedUUIDDict, b"\x0f\x18", "Battery Service"),
+        (
+            service,
+            SharedUUIDDict,
+            UUID("0000180f-0000-1000-8000-00805f9b34fb"),
+            "Battery Service",
+        ),
+    ],
+)
+def test_lookup(
+    table: _NumberDict[Any],
+    shared_type: type[Any],
+    key: Any,  # noqa: ANN401
+    name: str,
+) -> None:
+    """Test looking up keys in the formats of the regular dictionaries."""
+    assert shared_type(pack(table))[key] == table[key] == name
+
+
+@pytest.mark.parametrize(
+    ("table", "shared_type", "key", "exception"),
+    [
+        (company, SharedCICDict, 0xFFFE, UnknownCICError),
+        (company, SharedCICDict, -1, No16BitIntegerError),
+        (oui, SharedOUIDict, "AB:CD:EF", UnknownOUIError),
+        (oui, SharedOUIDict, "ab-cd-ef", UnknownOUIError),
+        (oui, SharedOUIDict, 0xABCDEF, UnknownOUIError),
+        (oui, SharedOUIDict, "foobar", WrongOUIFormatError),
+        (oui, SharedOUIDict, 0x1000000, WrongOUIFormatError),
+        (service, SharedUUIDDict, 0xFFFE, UnknownUUIDError),
+        (service, SharedUUIDDict, NORDIC_UART + 0x10000, UnknownUUIDError),
+        (service, SharedUUIDDict, b"\x0f", No16BitIntegerError),
+    ],
+)
+def test_lookup_exceptions(
+    table: _NumberDict[Any],
+    shared_type: type[Any],
+    key: Any,  # noqa: ANN401
+    exception: type[Exception],
+) -> None:
+    """Test that invalid and unknown keys raise the same exceptions."""
+    shared = shared_type(pack(table))
+    with pytest.raises(exception) as shared_error:
+        _ = shared[key]
+    with pytest.raises(exception) as error:
+        _ = table[key]
+    assert shared_error.value.args == error.value.args
+
+
+def test_dict_methods() -> None:
+    """Test that get and in accept the same formats as in the regular dictionary."""
+    shared_oui = SharedOUIDict(pack(oui))
+    assert "58:2D:34" in shared_oui
+    assert "58-2d-34" not in shared_oui
+    assert shared_oui.get("58-2d-34", "?") == oui.get("58-2d-34", "?") == "?"
+    shared_service = SharedUUIDDict(pack(service))
+    assert UUID(int=NORDIC_UART) in shared_service
+    assert shared_service.get(UUID(int=NORDIC_UART)) == "Nordic UART Service"
+    for key in ("180F", b"\x0f\x18", "FFFE", "foobar", UUID(int=0x180F)):
+        assert (key in shared_service) is (key in service)
+        assert shared_service.get(key, "?") == service.get(key, "?")
+    assert shared_service.lookup_many([0x180F, "foobar"]) == ["Battery Service", None]
+
+
+@pytest.mark.parametrize(
+    "table",
+    [company, oui, service, CICDict(), OUIDict({"58:2D:34": "Foo", "00:00:01": "Foo"})],
+)
+def test_unpack(table: _NumberDict[Any]) -> None:
+    """Test converting the binary format back to a regular dictionary."""
+    table_copy = unpack(pack(table))
+    assert type(table_copy) is type(table)
+    assert table_copy == table
+    assert list(table_copy) == sorted(table, key=_sort_key)
+    if isinstance(table, OUIDict):
+        assert isinstance(table_copy, OUIDict)
+        assert set(table_copy.vendors) == set(table.vendors)
+
+
+def test_pack_unnormalized() -> None:
+    """Test packing an OUIDict with OUIs that aren't normalized."""
+    prefixes: list[Any] = ["58-2d-34", 0x000001, "ab:cd:ef"]
+    ouis = OUIDict(zip(prefixes, ["Qingping", "Foo", "Bar"]))
+    shared = SharedOUIDict(pack(ouis))
+    assert shared.to_dict() == {
+        "00:00:01": "Foo",
+        "58:2D:34": "Qingping",
+        "AB:CD:EF": "Bar",
+    }
+    assert shared["58-2d-34"] == shared[0x582D34] == ouis[0x582D34]
+
+    invalid: list[Any] = ["foobar", 0x1000000, -1]
+    for prefix in invalid:
+        with pytest.raises(WrongOUIFormatError):
+            pack(OUIDict({prefix: "Foo"}))
+
+
+def test_wrong_buffer() -> None:
+    """Test that a buffer with another kind of dictionary is refused."""
+    with pytest.raises(ValueError, match="SharedOUIDict"):
+        SharedOUIDict(pack(company))
+    with pytest.raises(ValueError, match="shared dictionary"):
+        unpack(bytes(64))
+    with pytest.raises(TypeError):
+        pack({})  # type: ignore[arg-type]
+
+
+def test_pickle() -> None:
+    """Test that a dictionary in a buffer is pickled with its data."""
+    shared = SharedCICDict(pack(CICDict({0x0001: "Foo"})))
+    assert pickle.loads(pickle.dumps(shared))[0x0001] == "Foo"  # noqa: S301
+
+
+def test_share_and_attach() -> None:
+    """Test attaching to a shared dictionary, in this and in spawned processes."""
+    with share(oui) as shared_oui:
+        assert isinstance(shared_oui, SharedOUIDict)
+        assert shared_oui.name is not None
+        attached = attach(shared_oui.name)
+        assert isinstance(attached, SharedOUIDict)
+        assert attached["58:2D:34"] == "Qingping Electronics (Suzhou) Co., Ltd"
+        attached.close()
+
+        # The dictionary is pickled as the name of the shared memory
+        assert len(pickle.dumps(shared_oui)) < 100  # noqa: PLR2004
+        keys = ["58:2D:34", "24:5B:A7"]
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            assert pool.map(shared_oui.__getitem__, keys) == [oui[key] for key in keys]
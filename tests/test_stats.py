@@ -0,0 +1,219 @@
+"""Test the bluetooth_numbers.stats module."""
+from __future__ import annotations
+
+import copy
+import pickle
+import random
+from collections import Counter
+from typing import Any, Callable, Hashable
+from uuid import UUID
+
+import pytest
+
+from bluetooth_numbers import company, oui, service
+from bluetooth_numbers.dicts import CICDict, OUIDict, UUIDDict
+from bluetooth_numbers.exceptions import (
+    No16BitIntegerError,
+    UnknownOUIError,
+    UnknownUUIDError,
+)
+from bluetooth_numbers.reverse_lookup import ReverseLookup
+from bluetooth_numbers.stats import (
+    LatencyHistogram,
+    SpaceSaving,
+    disable_stats,
+    enable_stats,
+    get_stats,
+)
+
+
+def test_stats_disabled() -> None:
+    """Test whether the dictionaries have their original class without statistics."""
+    assert get_stats(company) is None
+    stats = enable_stats(company)
+    assert enable_stats(company) is stats
+    assert get_stats(company) is stats
+    assert isinstance(company, CICDict)
+    assert type(company) is not CICDict
+
+    disable_stats(company)
+    assert get_stats(company) is None
+    assert type(company) is CICDict
+    disable_stats(company)
+
+
+def test_stats_dict() -> None:
+    """Test the statistics of lookups in a dictionary."""
+    stats = enable_stats(service)
+    try:
+        assert service[0x180F] == "Battery Service"
+        assert service[UUID("6E400001-B5A3-F393-E0A9-E50E24DCCA9E")]
+        for _ in range(3):
+            with pytest.raises(UnknownUUIDError):
+                _ = service[0xFFFE]
+        with pytest.raises(UnknownUUIDError):
+            _ = service[0xFFFD]
+    finally:
+        disable_stats(service)
+
+    assert (stats.hits, stats.misses) == (2, 4)
+    assert stats.unknown.top(1) == [(0xFFFE, 3)]
+
+    exported = stats.as_dict()
+    assert exported["unknown"][0] == {"key": "0xFFFE", "count": 3, "error": 0}
+    assert exported["latency"]["count"] == sum(exported["latency"]["buckets"].values())
+    assert exported["latency"]["count"] == stats.hits + stats.misses
+
+    stats.clear()
+    assert stats.as_dict() == {
+        "hits": 0,
+        "misses": 0,
+        "unknown": [],
+        "latency": {"count": 0, "sum_ns": 0, "buckets": {}},
+    }
+
+
+def test_stats_unknown_keys() -> None:
+    """Test whether each format of an unknown key is counted as the same key."""
+    uuids = UUIDDict({0x180F: "Battery Service"})
+    ouis = OUIDict({"58:2D:34": "Qingping"})
+    stats = enable_stats(uuids)
+    oui_stats = enable_stats(ouis)
+
+    uuid128 = UUID("0000FFFE-0000-1000-8000-00805F9B34FB")
+    keys: tuple[int | str | UUID | bytes | memoryview, ...] = (
+        0xFFFE,
+        "FFFE",
+        uuid128,
+        uuid128.int,
+        b"\xfe\xff",
+        memoryview(b"\xfe\xff"),
+    )
+    for key in keys:
+        with pytest.raises(UnknownUUIDError):
+            _ = uuids[key]
+    with pytest.raises(No16BitIntegerError):
+        _ = uuids[memoryview(b"\xfe\xff\x00")]
+    for prefix in ("ab-cd-ef", "AB:CD:EF", "abcdef"):
+        with pytest.raises(UnknownOUIError):
+            _ = ouis[prefix]
+    assert ouis["58-2d-34"] == "Qingping"
+
+    assert uuids[UUID("0000180F-0000-1000-8000-00805F9B34FB")] == "Battery Service"
+
+    assert (stats.hits, stats.misses) == (1, 7)
+    assert stats.unknown.top() == [(0xFFFE, 6), (b"\xfe\xff\x00", 1)]
+    assert (oui_stats.hits, oui_stats.misses) == (1, 3)
+    assert oui_stats.unknown.top() == [("AB:CD:EF", 3)]
+
+
+def test_stats_custom_dicts() -> None:
+    """Test whether statistics work for custom dictionaries of each class."""
+    ouis = OUIDict({"58:2D:34": "Qingping"})
+    uuids = UUIDDict({0x180F: "Battery Service"})
+    stats = enable_stats(ouis, capacity=1)
+    enable_stats(uuids)
+
+    assert ouis[0x582D34] == "Qingping"
+    with pytest.raises(UnknownOUIError):
+        _ = ouis["AB:CD:EF"]
+    with pytest.raises(UnknownOUIError):
+        _ = ouis["AB:CD:EE"]
+    assert uuids[0x180F] == "Battery Service"
+
+    assert stats.unknown.top() == [("AB:CD:EE", 2)]
+    assert stats.unknown.error("AB:CD:EE") == 1
+    assert get_stats(uuids) is not stats
+    assert get_stats(oui) is None
+
+
+def test_stats_reverse_lookup() -> None:
+    """Test the statistics of a reverse lookup."""
+    reverse_lookup = ReverseLookup()
+    stats = enable_stats(reverse_lookup)
+    assert reverse_lookup.lookup("Cycling Power", logic="AND")
+    assert not reverse_lookup.lookup("foobar")
+
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.unknown.top() == [("foobar", 1)]
+
+    disable_stats(reverse_lookup)
+    assert type(reverse_lookup) is ReverseLookup
+
+
+@pytest.mark.parametrize(
+    "copier",
+    [copy.copy, copy.deepcopy, lambda obj: pickle.loads(pickle.dumps(obj))],  # noqa: S301
+)
+def test_stats_copy(copier: Callable[[Any], Any]) -> None:
+    """Test that copies of instrumented objects have their original class."""
+    companies = CICDict({0x0001: "Foo"})
+    stats = enable_stats(companies)
+    companies_copy = copier(companies)
+    assert type(companies_copy) is CICDict
+    assert get_stats(companies_copy) is None
+    assert companies_copy[0x0001] == "Foo"
+    assert companies[0x0001] == "Foo"
+    assert stats.hits == 1
+
+    enable_stats(company)
+    try:
+        companies_copy = copier(company)
+        assert companies_copy == company
+        # Built-in tables are pickled by reference
+        assert companies_copy is company or type(companies_copy) is CICDict
+        frozen = company.freeze()
+        assert copier(frozen) == frozen
+    finally:
+        disable_stats(company)
+
+    reverse_lookup = ReverseLookup()
+    enable_stats(reverse_lookup)
+    reverse_lookup_copy = copier(reverse_lookup)
+    assert type(reverse_lookup_copy) is ReverseLookup
+    assert get_stats(reverse_lookup_copy) is None
+    assert reverse_lookup_copy.lookup("Battery") == reverse_lookup.lookup("Battery")
+
+
+def test_space_saving() -> None:
+    """Test whether frequent keys are kept by the Space-Saving algorithm."""
+    unknown = SpaceSaving(capacity=3)
+    for key in [1] * 50 + list(range(100, 120)) + [2] * 30:
+        unknown.add(key)
+    assert [key for key, _ in unknown.top(2)] == [1, 2]
+
+    with pytest.raises(ValueError, match="capacity"):
+        SpaceSaving(capacity=0)
+
+
+def test_space_saving_bounds() -> None:
+    """Test the bounds of the estimated counts of the Space-Saving algorithm."""
+    rng = random.Random(0)
+    keys = [rng.randrange(50) ** 2 % 97 for _ in range(5000)]
+    unknown = SpaceSaving(capacity=10)
+    for number in keys:
+        unknown.add(number)
+    counts = unknown.top()
+    assert len(counts) == 10  # noqa: PLR2004
+    assert len(set(keys)) > 10  # noqa: PLR2004
+    # Every replaced key passes its count on, so the counts add up to the stream
+    assert sum(count for _, count in counts) == len(keys)
+    frequencies: Counter[Hashable] = Counter(keys)
+    for key, count in counts:
+        assert count - unknown.error(key) <= frequencies[key] <= count
+
+    unknown.clear()
+    unknown.add(1)
+    assert unknown.top() == [(1, 1)]
+
+
+def test_latency_histogram() -> None:
+    """Test the buckets of the latency histogram."""
+    latency = LatencyHistogram(buckets=4)
+    for ns in (0, 1, 3, 4, 1000):
+        latency.add(ns)
+    assert latency.as_dict() == {
+        "count": 5,
+        "sum_ns": 1008,
+        "buckets": {"1": 1, "2": 1, "4": 1, "+Inf": 2},
+    }
@@ -5,6 +5,7 @@ import pytest
 
 from bluetooth_numbers.exceptions import (
     No16BitIntegerError,
+    No32BitIntegerError,
     NonStandardUUIDError,
     WrongOUIFormatError,
 )
@@ -12,10 +13,15 @@ from bluetooth_numbers.utils import (
     is_normalized_oui,
     is_standard_uuid128,
     is_uint16,
+    is_uint32,
     normalize_oui,
     uint16_to_hex,
     uuid16_to_uuid128,
+    uuid32_to_uuid128,
     uuid128_to_uuid16,
+    uuid128_to_uuid32,
+    uuids32_to_uuids128,
+    uuids128_to_uuids32,
 )
 
 
@@ -28,6 +34,10 @@ from bluetooth_numbers.utils import (
         ("6C2B59", False),
         ("a41194", False),
         ("FOOBAR", False),
+        ("70:BC:10\n", False),
+        ("70:BC:1G", False),
+        ("70:BC-10", False),
+        ("", False),
     ],
 )
 def test_is_normalized_oui(oui: str, result: bool) -> None:
@@ -48,6 +58,8 @@ def test_is_normalized_oui(oui: str, result: bool) -> None:
         ("10-94-bb", "10:94:BB"),
         ("7C6456", "7C:64:56"),
         ("ac6706", "AC:67:06"),
+        ("ac::67-:06", "AC:67:06"),
+        ("AC67:06", "AC:67:06"),
     ],
 )
 def test_normalize_oui(oui: str, normalized: str) -> None:
@@ -61,6 +73,14 @@ def test_normalize_oui(oui: str, normalized: str) -> None:
         "AB:CD:EF:GH:IJ:KL",
         "gg-hh-ii",
         "FOOBAR",
+        "A:BC:DEF",
+        ":AB:CD:EF",
+        "AB:CD:EF:",
+        "AB:C-D:EF",
+        "AB:CD:EF\n",
+        "AB:CD:E\uFB00",
+        "ABCD",
+        "",
     ],
 )
 def test_normalize_oui_exceptions(oui: str) -> None:
@@ -206,3 +226,57 @@ def test_invalid_uuid128_to_uuid16(uuid128: UUID) -> None:
     """
     with pytest.raises(NonStandardUUIDError):
         uuid128_to_uuid16(uuid128)
+
+
+UUIDS32 = [
+    (UUID("00001800-0000-1000-8000-00805F9B34FB"), 0x1800),
+    (UUID("0000FD6F-0000-1000-8000-00805F9B34FB"), 0xFD6F),
+    (UUID("12345678-0000-1000-8000-00805F9B34FB"), 0x12345678),
+    (UUID("FFFFFFFF-0000-1000-8000-00805F9B34FB"), 0xFFFFFFFF),
+]
+NON_STANDARD_UUIDS128 = [
+    UUID("bfc46884-ea75-416b-8154-29c5d0b0a087"),
+    UUID("12345678-0000-1000-8000-00805F9B34FC"),
+]
+NO_UINT32 = [-1, 0x100000000, 1.5]
+
+
+@pytest.mark.parametrize(("uuid128", "uuid32"), UUIDS32)
+def test_uuid128_to_uuid32(uuid128: UUID, uuid32: int) -> None:
+    """Test the conversion between 128-bit standard UUIDs and 32-bit UUIDs."""
+    assert uuid128_to_uuid32(uuid128) == uuid32
+    assert uuid32_to_uuid128(uuid32) == uuid128
+
+
+def test_uuids128_to_uuids32() -> None:
+    """Test the batch conversion between 128-bit standard UUIDs and 32-bit UUIDs."""
+    uuids128, uuids32 = zip(*UUIDS32)
+    assert uuids128_to_uuids32(iter(uuids128)) == list(uuids32)
+    assert uuids32_to_uuids128(iter(uuids32)) == list(uuids128)
+    assert uuids128_to_uuids32([]) == []
+    assert uuids32_to_uuids128([]) == []
+
+
+@pytest.mark.parametrize("uuid128", NON_STANDARD_UUIDS128)
+def test_invalid_uuid128_to_uuid32(uuid128: UUID) -> None:
+    """Test the conversion to 32-bit UUIDs with non-standard UUIDs.
+
+    It should raise a NonStandardUUIDError for an invalid argument.
+    """
+    with pytest.raises(NonStandardUUIDError):
+        uuid128_to_uuid32(uuid128)
+    with pytest.raises(NonStandardUUIDError):
+        uuids128_to_uuids32([UUIDS32[0][0], uuid128])
+
+
+@pytest.mark.parametrize("uuid32", NO_UINT32)
+def test_invalid_uuid32_to_uuid128(uuid32: int) -> None:
+    """Test the conversion to 128-bit UUIDs with numbers that aren't 32-bit UUIDs.
+
+    It should raise a No32BitIntegerError for an invalid argument.
+    """
+    assert not is_uint32(uuid32)
+    with pytest.raises(No32BitIntegerError):
+        uuid32_to_uuid128(uuid32)
+    with pytest.raises(No32BitIntegerError):
+        uuids32_to_uuids128([0x1800, uuid32])